@@ -182,6 +182,7 @@ typedef struct PyConfig {
     int int_max_str_digits;
     int thread_inherit_context;
     int context_aware_warnings;
+    wchar_t *warmup_profile;
 #ifdef __APPLE__
     int use_system_logger;
 #endif
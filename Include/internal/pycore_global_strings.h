@@ -100,7 +100,9 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(__complex__)
         STRUCT_FOR_ID(__conditional_annotations__)
         STRUCT_FOR_ID(__contains__)
+        STRUCT_FOR_ID(__copy__)
         STRUCT_FOR_ID(__ctypes_from_outparam__)
+        STRUCT_FOR_ID(__deepcopy__)
         STRUCT_FOR_ID(__del__)
         STRUCT_FOR_ID(__delattr__)
         STRUCT_FOR_ID(__delete__)
@@ -493,6 +495,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(imag)
         STRUCT_FOR_ID(importlib)
         STRUCT_FOR_ID(in_fd)
+        STRUCT_FOR_ID(inclusive)
         STRUCT_FOR_ID(incoming)
         STRUCT_FOR_ID(index)
         STRUCT_FOR_ID(indexgroup)
@@ -564,21 +567,25 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(manual_reset)
         STRUCT_FOR_ID(mapping)
         STRUCT_FOR_ID(match)
+        STRUCT_FOR_ID(match_all)
         STRUCT_FOR_ID(max_length)
         STRUCT_FOR_ID(maxdigits)
         STRUCT_FOR_ID(maxevents)
+        STRUCT_FOR_ID(maximum)
         STRUCT_FOR_ID(maxlen)
         STRUCT_FOR_ID(maxmem)
         STRUCT_FOR_ID(maxsplit)
         STRUCT_FOR_ID(maxvalue)
         STRUCT_FOR_ID(memLevel)
         STRUCT_FOR_ID(memlimit)
+        STRUCT_FOR_ID(memo)
         STRUCT_FOR_ID(message)
         STRUCT_FOR_ID(metaclass)
         STRUCT_FOR_ID(metadata)
         STRUCT_FOR_ID(method)
         STRUCT_FOR_ID(microsecond)
         STRUCT_FOR_ID(milliseconds)
+        STRUCT_FOR_ID(minimum)
         STRUCT_FOR_ID(minute)
         STRUCT_FOR_ID(mod)
         STRUCT_FOR_ID(mode)
@@ -690,6 +697,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(sched_priority)
         STRUCT_FOR_ID(scheduler)
         STRUCT_FOR_ID(script)
+        STRUCT_FOR_ID(search)
         STRUCT_FOR_ID(second)
         STRUCT_FOR_ID(security_attributes)
         STRUCT_FOR_ID(seek)
@@ -777,6 +785,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(uid)
         STRUCT_FOR_ID(unlink)
         STRUCT_FOR_ID(unraisablehook)
+        STRUCT_FOR_ID(update)
         STRUCT_FOR_ID(uri)
         STRUCT_FOR_ID(usedforsecurity)
         STRUCT_FOR_ID(value)
@@ -793,6 +802,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(which)
         STRUCT_FOR_ID(who)
         STRUCT_FOR_ID(withdata)
+        STRUCT_FOR_ID(workers)
         STRUCT_FOR_ID(writable)
         STRUCT_FOR_ID(write)
         STRUCT_FOR_ID(write_through)
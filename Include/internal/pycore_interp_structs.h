@@ -918,6 +918,10 @@ struct _is {
     bool jit;
     struct _PyExecutorObject *executor_list_head;
     size_t trace_run_counter;
+    /* Maps (co_filename, co_qualname, co_firstlineno) to the set of byte
+       offsets of loops that the tier 2 optimizer found hot.
+       See _Py_WarmupProfile_Apply(). */
+    PyObject *warmup_profile;
     _rare_events rare_events;
     PyDict_WatchCallback builtins_dict_watcher;
 
@@ -102,13 +102,24 @@ PyAPI_FUNC(void) _Py_Executors_InvalidateDependency(PyInterpreterState *interp,
 PyAPI_FUNC(void) _Py_Executors_InvalidateAll(PyInterpreterState *interp, int is_invalidation);
 PyAPI_FUNC(void) _Py_Executors_InvalidateCold(PyInterpreterState *interp);
 
+extern void _Py_WarmupProfile_Apply(PyInterpreterState *interp, PyCodeObject *code);
+extern void _Py_WarmupProfile_Load(PyInterpreterState *interp);
+extern void _Py_WarmupProfile_Save(PyInterpreterState *interp);
+
 #else
 #  define _Py_Executors_InvalidateDependency(A, B, C) ((void)0)
 #  define _Py_Executors_InvalidateAll(A, B) ((void)0)
 #  define _Py_Executors_InvalidateCold(A) ((void)0)
 
+#  define _Py_WarmupProfile_Apply(A, B) ((void)0)
+#  define _Py_WarmupProfile_Load(A) ((void)0)
+#  define _Py_WarmupProfile_Save(A) ((void)0)
+
 #endif
 
+extern PyObject* _Py_WarmupProfile_Get(PyInterpreterState *interp);
+extern int _Py_WarmupProfile_Set(PyInterpreterState *interp, PyObject *entries);
+
 // Used as the threshold to trigger executor invalidation when
 // trace_run_counter is greater than this value.
 #define JIT_CLEANUP_THRESHOLD 100000
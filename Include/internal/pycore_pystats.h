@@ -15,6 +15,10 @@ extern void _Py_StatsClear(void);
 extern int _Py_PrintSpecializationStats(int to_file);
 #endif
 
+// Always-on subset of the statistics, see pycore_stats.h
+extern PyObject* _Py_GetRuntimeStats(void);
+extern void _Py_ClearRuntimeStats(void);
+
 #ifdef __cplusplus
 }
 #endif
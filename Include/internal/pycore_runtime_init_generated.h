@@ -607,7 +607,9 @@ extern "C" {
     INIT_ID(__complex__), \
     INIT_ID(__conditional_annotations__), \
     INIT_ID(__contains__), \
+    INIT_ID(__copy__), \
     INIT_ID(__ctypes_from_outparam__), \
+    INIT_ID(__deepcopy__), \
     INIT_ID(__del__), \
     INIT_ID(__delattr__), \
     INIT_ID(__delete__), \
@@ -1000,6 +1002,7 @@ extern "C" {
     INIT_ID(imag), \
     INIT_ID(importlib), \
     INIT_ID(in_fd), \
+    INIT_ID(inclusive), \
     INIT_ID(incoming), \
     INIT_ID(index), \
     INIT_ID(indexgroup), \
@@ -1071,21 +1074,25 @@ extern "C" {
     INIT_ID(manual_reset), \
     INIT_ID(mapping), \
     INIT_ID(match), \
+    INIT_ID(match_all), \
     INIT_ID(max_length), \
     INIT_ID(maxdigits), \
     INIT_ID(maxevents), \
+    INIT_ID(maximum), \
     INIT_ID(maxlen), \
     INIT_ID(maxmem), \
     INIT_ID(maxsplit), \
     INIT_ID(maxvalue), \
     INIT_ID(memLevel), \
     INIT_ID(memlimit), \
+    INIT_ID(memo), \
     INIT_ID(message), \
     INIT_ID(metaclass), \
     INIT_ID(metadata), \
     INIT_ID(method), \
     INIT_ID(microsecond), \
     INIT_ID(milliseconds), \
+    INIT_ID(minimum), \
     INIT_ID(minute), \
     INIT_ID(mod), \
     INIT_ID(mode), \
@@ -1197,6 +1204,7 @@ extern "C" {
     INIT_ID(sched_priority), \
     INIT_ID(scheduler), \
     INIT_ID(script), \
+    INIT_ID(search), \
     INIT_ID(second), \
     INIT_ID(security_attributes), \
     INIT_ID(seek), \
@@ -1284,6 +1292,7 @@ extern "C" {
     INIT_ID(uid), \
     INIT_ID(unlink), \
     INIT_ID(unraisablehook), \
+    INIT_ID(update), \
     INIT_ID(uri), \
     INIT_ID(usedforsecurity), \
     INIT_ID(value), \
@@ -1300,6 +1309,7 @@ extern "C" {
     INIT_ID(which), \
     INIT_ID(who), \
     INIT_ID(withdata), \
+    INIT_ID(workers), \
     INIT_ID(writable), \
     INIT_ID(write), \
     INIT_ID(write_through), \
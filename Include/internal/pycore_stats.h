@@ -9,6 +9,7 @@ extern "C" {
 #endif
 
 #include "pycore_structs.h"     //
+#include "pycore_pyatomic_ft_wrappers.h"
 
 
 #ifdef Py_STATS
@@ -74,6 +75,53 @@ PyAPI_FUNC(PyObject*) _Py_GetSpecializationStats(void);
 #endif  // !Py_STATS
 
 
+/* A small subset of the statistics above that is always compiled in, so
+ * that the behaviour of the specializer and the tier 2 optimizer can be
+ * inspected in production builds.  Counters are only updated on slow paths
+ * (specialization attempts, executor creation and invalidation, JIT
+ * compilation), never when executing specialized instructions.
+ *
+ * The counters are process-wide and updated without synchronization, so
+ * they are approximate in the free-threaded build.
+ *
+ * See sys._get_runtime_stats() and sys._clear_runtime_stats().
+ */
+
+#define _Py_RUNTIME_STATS_FAILURE_KINDS 50
+
+typedef struct _runtime_specialization_stats {
+    uint64_t success;
+    uint64_t failure;
+    uint64_t failure_kinds[_Py_RUNTIME_STATS_FAILURE_KINDS];
+} _PyRuntimeSpecializationStats;
+
+typedef struct _runtime_stats {
+    /* Indexed by the generic ("family") opcode */
+    _PyRuntimeSpecializationStats specialization[256];
+    uint64_t optimizer_attempts;
+    uint64_t executors_created;
+    uint64_t executors_invalidated;
+    uint64_t jit_compilations;
+    uint64_t jit_total_memory_size;
+    uint64_t jit_code_size;
+    uint64_t jit_freed_memory_size;
+} _PyRuntimeStats;
+
+extern _PyRuntimeStats _Py_runtime_stats;
+
+/* The counters are shared by all threads and interpreters, so they are
+ * updated atomically in the free-threaded build. */
+#define RUNTIME_SPEC_INC(opname, name) \
+    FT_ATOMIC_ADD_UINT64(_Py_runtime_stats.specialization[opname].name, 1)
+#define RUNTIME_SPEC_FAIL(opname, kind) \
+    FT_ATOMIC_ADD_UINT64( \
+        _Py_runtime_stats.specialization[opname].failure_kinds[kind], 1)
+#define RUNTIME_OPT_STAT_INC(name) \
+    FT_ATOMIC_ADD_UINT64(_Py_runtime_stats.name, 1)
+#define RUNTIME_OPT_STAT_ADD(name, n) \
+    FT_ATOMIC_ADD_UINT64(_Py_runtime_stats.name, (n))
+
+
 #define RARE_EVENT_INTERP_INC(interp, name) \
     do { \
         /* saturating add */ \
@@ -82,6 +82,14 @@ extern int _PyUnicode_FormatAdvancedWriter(
     Py_ssize_t start,
     Py_ssize_t end);
 
+/* Write format.format(*args, **kwargs) (kwargs can be NULL).
+   On error, the writer is left unchanged. */
+extern int _PyUnicodeWriter_WriteFormat(
+    _PyUnicodeWriter *writer,
+    PyObject *format,
+    PyObject *args,
+    PyObject *kwargs);
+
 /* --- UTF-7 Codecs ------------------------------------------------------- */
 
 extern PyObject* _PyUnicode_EncodeUTF7(
@@ -1,7 +1,7 @@
 """Pure Python implementation of the datetime module."""
 
 __all__ = ("date", "datetime", "time", "timedelta", "timezone", "tzinfo",
-           "MINYEAR", "MAXYEAR", "UTC")
+           "MINYEAR", "MAXYEAR", "UTC", "compile_format")
 
 __name__ = "datetime"
 
@@ -2533,6 +2533,66 @@ def _name_from_offset(delta):
 timezone.max = timezone._create(timedelta(hours=23, minutes=59))
 _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
+
+class CompiledFormat:
+    """A strptime() format string compiled by compile_format()."""
+    __slots__ = '_format',
+
+    def __init__(self, format):
+        if not isinstance(format, str):
+            raise TypeError('compile_format() argument must be str, not %s'
+                            % type(format).__name__)
+        self._format = format
+
+    @property
+    def format(self):
+        """The format string."""
+        return self._format
+
+    def parse_datetime(self, string, /):
+        """Return a datetime parsed from string.
+
+        Equivalent to datetime.strptime(string, self.format).
+        """
+        import _strptime
+        return _strptime._strptime_datetime_datetime(datetime, string,
+                                                     self._format)
+
+    def parse_date(self, string, /):
+        """Return a date parsed from string.
+
+        Equivalent to date.strptime(string, self.format).
+        """
+        import _strptime
+        return _strptime._strptime_datetime_date(date, string, self._format)
+
+    def parse_time(self, string, /):
+        """Return a time parsed from string.
+
+        Equivalent to time.strptime(string, self.format).
+        """
+        import _strptime
+        return _strptime._strptime_datetime_time(time, string, self._format)
+
+    def __reduce__(self):
+        return (compile_format, (self._format,))
+
+    def __repr__(self):
+        return f'datetime.compile_format({self._format!r})'
+
+
+_CompiledFormat = CompiledFormat
+del CompiledFormat
+
+def compile_format(format, /):
+    """Compile a strptime() format string for repeated parsing.
+
+    The returned object has parse_datetime(), parse_date() and parse_time()
+    methods, equivalent to datetime.strptime(), date.strptime() and
+    time.strptime() with this format.
+    """
+    return _CompiledFormat(format)
+
 # Some time zone algebra.  For a datetime x, let
 #     x.n = x stripped of its timezone -- its naive time.
 #     x.o = x.utcoffset(), and assuming that doesn't raise an exception or
@@ -2740,3 +2740,70 @@ def encoding(self):
     def detach(self):
         # This doesn't make sense on StringIO.
         self._unsupported("detach")
+
+
+class StringBuilder:
+    """Build a str by appending strings to it.
+
+    This is faster than joining a list of strings or writing to a StringIO.
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._length = 0
+
+    def write(self, s, /):
+        """Append a string."""
+        if not isinstance(s, str):
+            raise TypeError(f"write() argument must be str, "
+                            f"not {type(s).__name__}")
+        self._parts.append(s)
+        self._length += len(s)
+
+    def write_format(self, format, /, *args, **kwargs):
+        """Append format.format(*args, **kwargs)."""
+        if not isinstance(format, str):
+            raise TypeError(f"write_format() argument 'format' must be str, "
+                            f"not {type(format).__name__}")
+        self.write(format.format(*args, **kwargs))
+
+    def build(self):
+        """Return the built string and empty the builder."""
+        s = "".join(self._parts)
+        self._parts = []
+        self._length = 0
+        return s
+
+    def __len__(self):
+        return self._length
+
+    def __reduce__(self):
+        raise TypeError(f"cannot pickle {type(self).__name__!r} object")
+
+
+class BytesBuilder:
+    """Build a bytes object by appending bytes-like objects to it.
+
+    This is faster than joining a list of bytes or writing to a BytesIO.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def write(self, b, /):
+        """Append a bytes-like object."""
+        if isinstance(b, str):
+            raise TypeError("can't write str to binary stream")
+        self._buffer += b
+
+    def build(self):
+        """Return the built bytes object and empty the builder."""
+        b = bytes(self._buffer)
+        self._buffer = bytearray()
+        return b
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def __reduce__(self):
+        raise TypeError(f"cannot pickle {type(self).__name__!r} object")
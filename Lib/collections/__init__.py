@@ -8,6 +8,9 @@
 * Counter      dict subclass for counting hashable objects
 * OrderedDict  dict subclass that remembers the order entries were added
 * defaultdict  dict subclass that calls a factory function to supply missing values
+* SortedList   list-like container which keeps its items sorted
+* SortedDict   dict subclass that iterates over its keys in sorted order
+* SortedSet    set-like container which keeps its elements sorted
 * UserDict     wrapper around dictionary objects for easier dict subclassing
 * UserList     wrapper around list objects for easier list subclassing
 * UserString   wrapper around string objects for easier string subclassing
@@ -18,6 +21,9 @@
     'ChainMap',
     'Counter',
     'OrderedDict',
+    'SortedDict',
+    'SortedList',
+    'SortedSet',
     'UserDict',
     'UserList',
     'UserString',
@@ -39,6 +45,7 @@
 from operator import eq as _eq
 from operator import itemgetter as _itemgetter
 from reprlib import recursive_repr as _recursive_repr
+from types import FunctionType as _FunctionType
 from _weakref import proxy as _proxy
 
 try:
@@ -358,6 +365,23 @@ def __ror__(self, other):
 except ImportError:
     _tuplegetter = lambda index, doc: property(_itemgetter(index), doc=doc)
 
+# The code of __new__() only depends on the number of fields, apart from the
+# names of its parameters.  Compile it once for each number of fields and
+# rename the parameters, rather than compiling new source for every class.
+_nt_new_code_cache = {}
+
+def _namedtuple_new_code(field_names):
+    num_fields = len(field_names)
+    code = _nt_new_code_cache.get(num_fields)
+    if code is None:
+        arg_list = ', '.join(f'_{index}' for index in range(num_fields))
+        if num_fields == 1:
+            arg_list += ','
+        code = compile(f'lambda _cls, {arg_list}: _tuple_new(_cls, ({arg_list}))',
+                       '<string>', 'eval').co_consts[0]
+        _nt_new_code_cache[num_fields] = code
+    return code.replace(co_varnames=('_cls', *field_names))
+
 def namedtuple(typename, field_names, *, rename=False, defaults=None, module=None):
     """Returns a new subclass of tuple with named fields.
 
@@ -443,8 +467,7 @@ def namedtuple(typename, field_names, *, rename=False, defaults=None, module=Non
         '__builtins__': {},
         '__name__': f'namedtuple_{typename}',
     }
-    code = f'lambda _cls, {arg_list}: _tuple_new(_cls, ({arg_list}))'
-    __new__ = eval(code, namespace)
+    __new__ = _FunctionType(_namedtuple_new_code(field_names), namespace)
     __new__.__name__ = '__new__'
     __new__.__doc__ = f'Create new instance of {typename}({arg_list})'
     if defaults is not None:
@@ -1123,6 +1146,425 @@ def __ror__(self, other):
         return self.__class__(m)
 
 
+################################################################################
+### SortedDict and SortedSet
+################################################################################
+
+# SortedDict and SortedSet are built on SortedList, so it is not optional.
+from _collections import SortedList
+_collections_abc.Sequence.register(SortedList)
+
+class _SortedDictKeysView(_collections_abc.KeysView):
+
+    def __iter__(self):
+        return iter(self._mapping._list)
+
+    def __reversed__(self):
+        return reversed(self._mapping._list)
+
+    def __getitem__(self, index):
+        return self._mapping._list[index]
+
+class _SortedDictItemsView(_collections_abc.ItemsView):
+
+    def __iter__(self):
+        mapping = self._mapping
+        for key in mapping._list:
+            yield (key, mapping[key])
+
+    def __reversed__(self):
+        mapping = self._mapping
+        for key in reversed(mapping._list):
+            yield (key, mapping[key])
+
+    def __getitem__(self, index):
+        mapping = self._mapping
+        if isinstance(index, slice):
+            return [(key, mapping[key]) for key in mapping._list[index]]
+        key = mapping._list[index]
+        return (key, mapping[key])
+
+class _SortedDictValuesView(_collections_abc.ValuesView):
+
+    def __iter__(self):
+        mapping = self._mapping
+        for key in mapping._list:
+            yield mapping[key]
+
+    def __reversed__(self):
+        mapping = self._mapping
+        for key in reversed(mapping._list):
+            yield mapping[key]
+
+    def __getitem__(self, index):
+        mapping = self._mapping
+        if isinstance(index, slice):
+            return [mapping[key] for key in mapping._list[index]]
+        return mapping[mapping._list[index]]
+
+class SortedDict(dict):
+    'Dictionary that iterates over its keys in sorted order.'
+
+    # The keys are kept in a SortedList next to the dict, which provides
+    # the fast lookups.  Every method which adds or removes a key updates
+    # both.
+
+    def __init__(self, other=(), /, key=None, **kwds):
+        '''Initialize a sorted dictionary.  The keys are sorted by key(k), or
+        by themselves if key is None.  The other arguments are the same as
+        for dict().
+
+        '''
+        self._list = SortedList(dict.keys(self), key)
+        self.update(other, **kwds)
+
+    @property
+    def key(self):
+        'The key function used to sort the keys, or None.'
+        return self._list.key
+
+    def __setitem__(self, key, value):
+        'sd.__setitem__(i, y) <==> sd[i]=y'
+        if key not in self:
+            self._list.add(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        'sd.__delitem__(y) <==> del sd[y]'
+        dict.__delitem__(self, key)
+        self._list.remove(key)
+
+    def __iter__(self):
+        'sd.__iter__() <==> iter(sd)'
+        return iter(self._list)
+
+    def __reversed__(self):
+        'sd.__reversed__() <==> reversed(sd)'
+        return reversed(self._list)
+
+    def clear(self):
+        'Remove all items from sd.'
+        dict.clear(self)
+        self._list.clear()
+
+    def update(self, other=(), /, **kwds):
+        '''Update sd from dict/iterable other and kwds.'''
+        items = dict(other, **kwds)
+        if not self:
+            # Sort all the keys at once
+            dict.update(self, items)
+            try:
+                self._list.update(items)
+            except BaseException:
+                dict.clear(self)
+                raise
+        else:
+            for key, value in items.items():
+                self[key] = value
+
+    __marker = object()
+
+    def pop(self, key, default=__marker):
+        '''sd.pop(k[,d]) -> v, remove specified key and return the corresponding
+        value.  If key is not found, d is returned if given, otherwise KeyError
+        is raised.
+
+        '''
+        if key in self:
+            value = dict.pop(self, key)
+            self._list.remove(key)
+            return value
+        if default is self.__marker:
+            raise KeyError(key)
+        return default
+
+    def popitem(self, index=-1):
+        '''Remove and return the (key, value) pair at index in the sorted
+        order of the keys (by default the one with the greatest key).
+        Raise KeyError if the dictionary is empty.
+
+        '''
+        if not self:
+            raise KeyError('dictionary is empty')
+        key = self._list.pop(index)
+        return key, dict.pop(self, key)
+
+    def peekitem(self, index=-1):
+        '''Return the (key, value) pair at index in the sorted order of the
+        keys (by default the one with the greatest key).
+
+        '''
+        key = self._list[index]
+        return key, self[key]
+
+    def setdefault(self, key, default=None):
+        '''Insert key with a value of default if key is not in the dictionary.
+
+        Return the value for key if key is in the dictionary, else default.
+        '''
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def index(self, key, start=0, stop=_sys.maxsize):
+        'Return the index of key in the sorted order of the keys.'
+        return self._list.index(key, start, stop)
+
+    def bisect_left(self, key):
+        'Return the index where key would be inserted in the sorted keys.'
+        return self._list.bisect_left(key)
+
+    def bisect_right(self, key):
+        'Return the index where key would be inserted in the sorted keys.'
+        return self._list.bisect_right(key)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        'Return an iterator over the keys between minimum and maximum.'
+        return self._list.irange(minimum, maximum, inclusive, reverse)
+
+    def keys(self):
+        "sd.keys() -> a set-like object providing a view on sd's sorted keys"
+        return _SortedDictKeysView(self)
+
+    def items(self):
+        "sd.items() -> a set-like object providing a view on sd's items"
+        return _SortedDictItemsView(self)
+
+    def values(self):
+        "sd.values() -> an object providing a view on sd's values"
+        return _SortedDictValuesView(self)
+
+    def copy(self):
+        'sd.copy() -> a shallow copy of sd'
+        return self.__class__(self, self.key)
+
+    __copy__ = copy
+
+    @_recursive_repr()
+    def __repr__(self):
+        'sd.__repr__() <==> repr(sd)'
+        items = dict(self.items())
+        if self.key is None:
+            return '%s(%r)' % (self.__class__.__name__, items)
+        return '%s(%r, key=%r)' % (self.__class__.__name__, items, self.key)
+
+    def __reduce__(self):
+        'Return state information for pickling'
+        state = getattr(self, '__dict__', {}).copy()
+        state.pop('_list', None)
+        return self.__class__, (dict(self), self.key), state or None
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.__class__(other, self.key)
+        new.update(self)
+        return new
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+class SortedSet(_collections_abc.MutableSet, _collections_abc.Sequence):
+    'Set which keeps its elements sorted and supports indexing.'
+
+    def __init__(self, iterable=(), /, key=None):
+        '''Initialize a sorted set.  The elements are sorted by key(x), or by
+        themselves if key is None.
+
+        '''
+        self._set = set(iterable)
+        self._list = SortedList(self._set, key)
+
+    @property
+    def key(self):
+        'The key function used to sort the elements, or None.'
+        return self._list.key
+
+    def _from_iterable(self, iterable):
+        return self.__class__(iterable, self.key)
+
+    def __contains__(self, value):
+        return value in self._set
+
+    def __len__(self):
+        return len(self._set)
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def __reversed__(self):
+        return reversed(self._list)
+
+    def __getitem__(self, index):
+        return self._list[index]
+
+    def __delitem__(self, index):
+        values = self._list[index]
+        del self._list[index]
+        if isinstance(index, slice):
+            self._set.difference_update(values)
+        else:
+            self._set.remove(values)
+
+    def __eq__(self, other):
+        if isinstance(other, SortedSet):
+            return self._set == other._set
+        if isinstance(other, _collections_abc.Set):
+            return self._set == set(other)
+        return NotImplemented
+
+    def add(self, value):
+        'Add an element.'
+        if value not in self._set:
+            self._list.add(value)
+            self._set.add(value)
+
+    def discard(self, value):
+        'Remove an element if it is a member.'
+        if value in self._set:
+            self._list.remove(value)
+            self._set.remove(value)
+
+    def pop(self, index=-1):
+        '''Remove and return the element at index (by default the greatest).
+        Raise IndexError if the set is empty or index is out of range.
+
+        '''
+        value = self._list.pop(index)
+        self._set.remove(value)
+        return value
+
+    def clear(self):
+        'Remove all elements.'
+        self._set.clear()
+        self._list.clear()
+
+    def copy(self):
+        'Return a shallow copy.'
+        new = self.__class__.__new__(self.__class__)
+        new._set = self._set.copy()
+        new._list = self._list.copy()
+        return new
+
+    __copy__ = copy
+
+    def index(self, value, start=0, stop=_sys.maxsize):
+        'Return the index of value.  Raise ValueError if it is not present.'
+        return self._list.index(value, start, stop)
+
+    def count(self, value):
+        'Return the number of occurrences of value (0 or 1).'
+        return int(value in self._set)
+
+    def bisect_left(self, value):
+        'Return the index where value would be inserted.'
+        return self._list.bisect_left(value)
+
+    def bisect_right(self, value):
+        'Return the index where value would be inserted.'
+        return self._list.bisect_right(value)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        'Return an iterator over the elements between minimum and maximum.'
+        return self._list.irange(minimum, maximum, inclusive, reverse)
+
+    def update(self, *iterables):
+        'Add the elements of all the iterables.'
+        values = set().union(*iterables)
+        values.difference_update(self._set)
+        self._list.update(values)
+        self._set.update(values)
+
+    def _remove_all(self, values):
+        if len(values) * 4 >= len(self._set):
+            self._set.difference_update(values)
+            self._list = SortedList(self._set, self.key)
+        else:
+            for value in values:
+                self._list.remove(value)
+            self._set.difference_update(values)
+
+    def difference_update(self, *iterables):
+        'Remove the elements of all the iterables.'
+        self._remove_all(self._set.intersection(set().union(*iterables)))
+
+    def intersection_update(self, *iterables):
+        'Keep only the elements found in all the iterables.'
+        self._remove_all(self._set.difference(self._set.intersection(*iterables)))
+
+    def symmetric_difference_update(self, iterable):
+        'Keep the elements found in either the set or iterable, but not both.'
+        other = set(iterable)
+        new = other - self._set
+        self._remove_all(self._set & other)
+        self.update(new)
+
+    def union(self, *iterables):
+        'Return the union of the set and the iterables as a new SortedSet.'
+        return self._from_iterable(self._set.union(*iterables))
+
+    def intersection(self, *iterables):
+        'Return the elements found in the set and all the iterables.'
+        return self._from_iterable(self._set.intersection(*iterables))
+
+    def difference(self, *iterables):
+        'Return the elements of the set which are not in the iterables.'
+        return self._from_iterable(self._set.difference(*iterables))
+
+    def symmetric_difference(self, iterable):
+        'Return the elements found in either the set or iterable, but not both.'
+        return self._from_iterable(self._set.symmetric_difference(iterable))
+
+    def issubset(self, iterable):
+        'Report whether every element of the set is in iterable.'
+        return self._set.issubset(iterable)
+
+    def issuperset(self, iterable):
+        'Report whether every element of iterable is in the set.'
+        return self._set.issuperset(iterable)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+    @_recursive_repr()
+    def __repr__(self):
+        if self.key is None:
+            return '%s(%r)' % (self.__class__.__name__, list(self))
+        return '%s(%r, key=%r)' % (self.__class__.__name__, list(self),
+                                   self.key)
+
+    def __reduce__(self):
+        state = getattr(self, '__dict__', {}).copy()
+        state.pop('_set', None)
+        state.pop('_list', None)
+        return self.__class__, (list(self), self.key), state or None
+
+
 ################################################################################
 ### UserDict
 ################################################################################
@@ -1557,6 +1999,13 @@ def replace(self, old, new, maxsplit=-1):
             new = new.data
         return self.__class__(self.data.replace(old, new, maxsplit))
 
+    def replace_many(self, mapping, /):
+        if isinstance(mapping, _collections_abc.Mapping):
+            mapping = {(old.data if isinstance(old, UserString) else old):
+                       (new.data if isinstance(new, UserString) else new)
+                       for old, new in mapping.items()}
+        return self.__class__(self.data.replace_many(mapping))
+
     def rfind(self, sub, start=0, end=_sys.maxsize):
         if isinstance(sub, UserString):
             sub = sub.data
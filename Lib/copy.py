@@ -272,6 +272,11 @@ def _reconstruct(x, memo, func, args,
 
 del types, weakref
 
+try:
+    from _copy import copy, deepcopy
+except ImportError:
+    pass
+
 
 def replace(obj, /, **changes):
     """Return a new object replacing specified fields with new values.
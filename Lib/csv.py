@@ -63,6 +63,7 @@ class excel:
         written as two quotes
 """
 
+import functools
 import types
 from _csv import Error, writer, reader, register_dialect, \
                  unregister_dialect, get_dialect, list_dialects, \
@@ -71,7 +72,7 @@ class excel:
                  QUOTE_STRINGS, QUOTE_NOTNULL
 from _csv import Dialect as _Dialect
 
-from io import StringIO
+from io import BytesIO, StringIO
 
 __all__ = ["QUOTE_MINIMAL", "QUOTE_ALL", "QUOTE_NONNUMERIC", "QUOTE_NONE",
            "QUOTE_STRINGS", "QUOTE_NOTNULL",
@@ -79,7 +80,7 @@ class excel:
            "field_size_limit", "reader", "writer",
            "register_dialect", "get_dialect", "list_dialects", "Sniffer",
            "unregister_dialect", "DictReader", "DictWriter",
-           "unix_dialect"]
+           "unix_dialect", "split_records", "map_chunks"]
 
 __version__ = "1.0"
 
@@ -143,7 +144,7 @@ class unix_dialect(Dialect):
 
 class DictReader:
     def __init__(self, f, fieldnames=None, restkey=None, restval=None,
-                 dialect="excel", *args, **kwds):
+                 dialect="excel", *args, converters=None, **kwds):
         if fieldnames is not None and iter(fieldnames) is fieldnames:
             fieldnames = list(fieldnames)
         self._fieldnames = fieldnames   # list of keys for the dict
@@ -152,6 +153,8 @@ def __init__(self, f, fieldnames=None, restkey=None, restval=None,
         self.reader = reader(f, dialect, *args, **kwds)
         self.dialect = dialect
         self.line_num = 0
+        # converters are set on the reader once the header has been read
+        self._converters = converters
 
     def __iter__(self):
         return self
@@ -170,26 +173,32 @@ def fieldnames(self):
     def fieldnames(self, value):
         self._fieldnames = value
 
+    def _set_converters(self):
+        converters = self._converters
+        self._converters = None
+        if isinstance(converters, dict):
+            fieldnames = self.fieldnames
+            wrong_fields = converters.keys() - set(fieldnames)
+            if wrong_fields:
+                raise ValueError("converters contain fields not in fieldnames: "
+                                 + ", ".join([repr(x) for x in wrong_fields]))
+            converters = {i: converters[name]
+                          for i, name in enumerate(fieldnames)
+                          if name in converters}
+        self.reader.converters = converters
+
     def __next__(self):
         if self.line_num == 0:
             # Used only for its side effect.
             self.fieldnames
-        row = next(self.reader)
-        self.line_num = self.reader.line_num
+        if self._converters is not None:
+            self._set_converters()
 
         # unlike the basic reader, we prefer not to return blanks,
         # because we will typically wind up with a dict full of None
         # values
-        while row == []:
-            row = next(self.reader)
-        d = dict(zip(self.fieldnames, row))
-        lf = len(self.fieldnames)
-        lr = len(row)
-        if lf < lr:
-            d[self.restkey] = row[lf:]
-        elif lf > lr:
-            for key in self.fieldnames[lr:]:
-                d[key] = self.restval
+        d = self.reader._next_dict(self.fieldnames, self.restkey, self.restval)
+        self.line_num = self.reader.line_num
         return d
 
     __class_getitem__ = classmethod(types.GenericAlias)
@@ -230,6 +239,107 @@ def writerows(self, rowdicts):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
+def _record_boundary(data, quotechar, start, odd):
+    # Return the position just after the last newline of data[start:] which
+    # is not inside a quoted field, or 0.  odd is the parity of the number
+    # of quotechars in data[:start].  Fields are assumed to be quoted as the
+    # writer does it, so every quotechar outside of a quoted field starts
+    # one, and a newline is in a quoted field if it follows an odd number
+    # of quotechars.
+    pos = data.rfind(b"\n", start) + 1
+    if quotechar is None or not pos:
+        return pos
+    odd ^= data.count(quotechar, start, pos) & 1
+    while odd:
+        newline = data.rfind(b"\n", start, pos - 1)
+        if newline < 0:
+            return 0
+        odd ^= data.count(quotechar, newline + 1, pos) & 1
+        pos = newline + 1
+    return pos
+
+
+def split_records(f, chunksize=2**22, *, quotechar='"'):
+    """Split a binary file into chunks of whole records.
+
+    Read f by blocks of chunksize bytes and yield bytes objects which end
+    at a newline outside of a quoted field (or at the end of the file).
+    If quotechar is None, the chunks end at any newline.
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+    if quotechar is not None:
+        quotechar = quotechar.encode("ascii")
+        if len(quotechar) != 1:
+            raise ValueError("quotechar must be a single ASCII character")
+    # buf holds the start of a record which spans several blocks.  It has
+    # no record boundary, so only the new data is scanned, and odd is the
+    # parity of the number of quotechars in it.
+    buf = bytearray()
+    odd = 0
+    while data := f.read(chunksize):
+        start = len(buf)
+        if start:
+            buf += data
+            data = buf
+        pos = _record_boundary(data, quotechar, start, odd)
+        if pos:
+            yield bytes(data[:pos])
+        if data is buf:
+            del buf[:pos]
+        else:
+            buf += memoryview(data)[pos:]
+        if quotechar is not None:
+            if pos:
+                odd = buf.count(quotechar) & 1
+            else:
+                odd ^= buf.count(quotechar, start) & 1
+    if buf:
+        yield bytes(buf)
+
+
+def _read_chunk(func, fmtparams, chunk):
+    return func(list(reader(BytesIO(chunk), **fmtparams)))
+
+
+def map_chunks(func, f, dialect="excel", *, executor=None,
+               chunksize=2**22, buffersize=None, **fmtparams):
+    """Parse a binary CSV file in parallel.
+
+    Split f with split_records() and call func with the list of rows of
+    each chunk in the executor (a new ProcessPoolExecutor by default).
+    Return an iterator over the results of func, in the order of the
+    chunks.  At most buffersize chunks are read ahead of the results
+    which have not been consumed yet.  The remaining keyword arguments
+    are passed to reader(); encoding defaults to 'utf-8'.
+    """
+    reader_params = {"encoding": fmtparams.pop("encoding", "utf-8"),
+                     "converters": fmtparams.pop("converters", None)}
+    d = _Dialect(dialect, **fmtparams)
+    if d.escapechar is not None:
+        raise ValueError("map_chunks() does not support escapechar")
+    # Pass the dialect as parameters, since the workers may not know about
+    # registered dialects.
+    for name in ("delimiter", "doublequote", "quotechar", "quoting",
+                 "skipinitialspace", "strict"):
+        reader_params[name] = getattr(d, name)
+    quotechar = None if d.quoting == QUOTE_NONE else d.quotechar
+    if buffersize is None:
+        import os
+        buffersize = 2 * (os.process_cpu_count() or 1)
+    chunks = split_records(f, chunksize, quotechar=quotechar)
+    fn = functools.partial(_read_chunk, func, reader_params)
+    if executor is not None:
+        return executor.map(fn, chunks, buffersize=buffersize)
+    return _map_in_new_executor(fn, chunks, buffersize)
+
+
+def _map_in_new_executor(fn, chunks, buffersize):
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(fn, chunks, buffersize=buffersize)
+
+
 class Sniffer:
     '''
     "Sniffs" the format of a CSV file (i.e. delimiter, quotechar)
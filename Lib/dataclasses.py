@@ -7,6 +7,7 @@
 import itertools
 import annotationlib
 import abc
+import functools
 from reprlib import recursive_repr
 
 
@@ -429,14 +430,78 @@ def _tuple_str(obj_name, fields):
     return f'({",".join([f"{obj_name}.{f.name}" for f in fields])},)'
 
 
+# The source of the generated methods does not contain the field names.
+# Instead, it is generated from _FieldPlaceholder objects standing in for the
+# fields, named __dataclass_field_0__, __dataclass_field_1__ and so on.  The
+# source then only depends on the layout of the class, so its compiled code
+# is cached and shared by all classes with that layout.  The placeholders in
+# a copy of the code are then replaced with the field names, which is much
+# faster than compiling new source for every class.
+
+_PLACEHOLDER_RE = re.compile(r'__dataclass_field_(\d+)__')
+
+
+class _FieldPlaceholder:
+    __slots__ = ('name', 'field')
+
+    def __init__(self, field, index):
+        self.name = f'__dataclass_field_{index}__'
+        self.field = field
+
+    def __getattr__(self, name):
+        # Everything but the name comes from the field.
+        return getattr(self.field, name)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_create_fn(txt):
+    code = compile(txt, '<string>', 'exec')
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            return const
+    raise AssertionError('__create_fn__ not found')
+
+
+def _replace_placeholders(code, field_names):
+    def sub(s):
+        if '__dataclass_field_' not in s:
+            return s
+        return _PLACEHOLDER_RE.sub(lambda m: field_names[int(m[1])], s)
+
+    def sub_const(const):
+        if isinstance(const, str):
+            return sub(const)
+        if isinstance(const, types.CodeType):
+            return _replace_placeholders(const, field_names)
+        if isinstance(const, (tuple, frozenset)):
+            return type(const)(map(sub_const, const))
+        return const
+
+    return code.replace(co_consts=tuple(map(sub_const, code.co_consts)),
+                        co_names=tuple(map(sub, code.co_names)),
+                        co_varnames=tuple(map(sub, code.co_varnames)),
+                        co_freevars=tuple(map(sub, code.co_freevars)),
+                        co_cellvars=tuple(map(sub, code.co_cellvars)))
+
+
 class _FuncBuilder:
-    def __init__(self, globals):
+    def __init__(self, globals, fields=()):
         self.names = []
         self.src = []
         self.globals = globals
         self.locals = {}
         self.overwrite_errors = {}
         self.unconditional_adds = {}
+        self.field_names = []
+        self._placeholders = {}
+        for f in fields:
+            self._placeholders[f.name] = _FieldPlaceholder(f, len(self.field_names))
+            self.field_names.append(f.name)
+
+    def placeholders(self, fields):
+        # Return the placeholders to use instead of fields when generating
+        # source.
+        return [self._placeholders[f.name] for f in fields]
 
     def add_fn(self, name, args, body, *, locals=None, return_type=MISSING,
                overwrite_error=False, unconditional_add=False, decorator=None):
@@ -498,9 +563,12 @@ def add_fns_to_class(self, cls):
         # return __init__,__repr__
 
         txt = f"def __create_fn__({local_vars}):\n{fns_src}\n return {return_names}"
-        ns = {}
-        exec(txt, self.globals, ns)
-        fns = ns['__create_fn__'](**self.locals)
+        code = _compile_create_fn(txt)
+        if self.field_names:
+            code = _replace_placeholders(code, self.field_names)
+        # The locals are passed positionally, since their names may contain
+        # placeholders.
+        fns = types.FunctionType(code, self.globals)(*self.locals.values())
 
         # Now that we've generated the functions, assign them into cls.
         for name, fn in zip(self.names, fns):
@@ -611,10 +679,7 @@ def _init_param(f):
     return f'{f.name}:__dataclass_type_{f.name}__{default}'
 
 
-def _init_fn(fields, std_fields, kw_only_fields, frozen, has_post_init,
-             self_name, func_builder, slots):
-    # fields contains both real fields and InitVar pseudo-fields.
-
+def _check_init_defaults(std_fields):
     # Make sure we don't have fields without defaults following fields
     # with defaults.  This actually would be caught when exec-ing the
     # function source code, but catching it here gives a better error
@@ -631,6 +696,13 @@ def _init_fn(fields, std_fields, kw_only_fields, frozen, has_post_init,
                 raise TypeError(f'non-default argument {f.name!r} '
                                 f'follows default argument {seen_default.name!r}')
 
+
+def _init_fn(fields, std_fields, kw_only_fields, frozen, has_post_init,
+             self_name, func_builder, slots):
+    # fields contains both real fields and InitVar pseudo-fields, or rather
+    # their placeholders.  The caller has checked them with
+    # _check_init_defaults().
+
     locals = {**{f'__dataclass_type_{f.name}__': f.type for f in fields},
               **{'__dataclass_HAS_DEFAULT_FACTORY__': _HAS_DEFAULT_FACTORY,
                  '__dataclass_builtins_object__': object,
@@ -1071,15 +1143,19 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen,
     (std_init_fields,
      kw_only_init_fields) = _fields_in_init_order(all_init_fields)
 
-    func_builder = _FuncBuilder(globals)
+    # The methods are generated from placeholders for the fields, see
+    # _FuncBuilder.
+    func_builder = _FuncBuilder(globals, fields.values())
+    placeholders = func_builder.placeholders
 
     if init:
         # Does this class have a post-init function?
         has_post_init = hasattr(cls, _POST_INIT_NAME)
 
-        _init_fn(all_init_fields,
-                 std_init_fields,
-                 kw_only_init_fields,
+        _check_init_defaults(std_init_fields)
+        _init_fn(placeholders(all_init_fields),
+                 placeholders(std_init_fields),
+                 placeholders(kw_only_init_fields),
                  frozen,
                  has_post_init,
                  # The name to use for the "self"
@@ -1098,7 +1174,7 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen,
     field_list = [f for f in fields.values() if f._field_type is _FIELD]
 
     if repr:
-        flds = [f for f in field_list if f.repr]
+        flds = [f for f in placeholders(field_list) if f.repr]
         func_builder.add_fn('__repr__',
                             ('self',),
                             ['  return f"{self.__class__.__qualname__}(' +
@@ -1110,7 +1186,8 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen,
     if eq:
         # Create __eq__ method.  There's no need for a __ne__ method,
         # since python will call __eq__ and negate it.
-        cmp_fields = (field for field in field_list if field.compare)
+        cmp_fields = (field for field in placeholders(field_list)
+                      if field.compare)
         terms = [f'self.{field.name}==other.{field.name}' for field in cmp_fields]
         field_comparisons = ' and '.join(terms) or 'True'
         func_builder.add_fn('__eq__',
@@ -1123,7 +1200,7 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen,
 
     if order:
         # Create and set the ordering methods.
-        flds = [f for f in field_list if f.compare]
+        flds = [f for f in placeholders(field_list) if f.compare]
         self_tuple = _tuple_str('self', flds)
         other_tuple = _tuple_str('other', flds)
         for name, op in [('__lt__', '<'),
@@ -1143,7 +1220,7 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen,
                             overwrite_error='Consider using functools.total_ordering')
 
     if frozen:
-        _frozen_get_del_attr(cls, field_list, func_builder)
+        _frozen_get_del_attr(cls, placeholders(field_list), func_builder)
 
     # Decide if/how we're going to create a hash function.
     hash_action = _hash_action[bool(unsafe_hash),
@@ -1151,7 +1228,8 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen,
                                bool(frozen),
                                has_explicit_hash]
     if hash_action:
-        cls.__hash__ = hash_action(cls, field_list, func_builder)
+        cls.__hash__ = hash_action(cls, placeholders(field_list),
+                                   func_builder)
 
     # Generate the methods and add them to the class.  This needs to be done
     # before the __doc__ logic below, since inspect will look at the __init__
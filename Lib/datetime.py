@@ -10,4 +10,4 @@
     from _pydatetime import *
 
 __all__ = ("date", "datetime", "time", "timedelta", "timezone", "tzinfo",
-           "MINYEAR", "MAXYEAR", "UTC")
+           "MINYEAR", "MAXYEAR", "UTC", "compile_format")
@@ -17,10 +17,11 @@
 from abc import get_cache_token
 from collections import namedtuple
 # import weakref  # Deferred to single_dispatch()
-from operator import itemgetter
+from operator import index, itemgetter
 from reprlib import recursive_repr
 from types import GenericAlias, MethodType, MappingProxyType, UnionType
 from _thread import RLock
+from time import monotonic
 
 ################################################################################
 ### update_wrapper() and wraps() decorator
@@ -516,6 +517,23 @@ def _unwrap_partialmethod(func):
 
 _CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
+_UnraisableHookArgs = namedtuple("UnraisableHookArgs", [
+    "exc_type", "exc_value", "exc_traceback", "err_msg", "object"])
+
+def _report_unraisable(err_msg):
+    """Report the exception being handled like PyErr_FormatUnraisable()."""
+    import sys
+    exc = sys.exception()
+    if sys.unraisablehook is not sys.__unraisablehook__:
+        sys.unraisablehook(_UnraisableHookArgs(
+            type(exc), exc, exc.__traceback__, err_msg, None))
+    elif sys.stderr is not None:
+        # The default hook only accepts the arguments built by the
+        # interpreter, so write the same report here.
+        import traceback
+        print(f"{err_msg}:", file=sys.stderr)
+        traceback.print_exception(exc, file=sys.stderr)
+
 def _make_key(args, kwds, typed,
              kwd_mark = (object(),),
              fasttypes = {int, str},
@@ -547,7 +565,8 @@ def _make_key(args, kwds, typed,
         return key[0]
     return key
 
-def lru_cache(maxsize=128, typed=False):
+def lru_cache(maxsize=128, typed=False, *, ttl=None, weight=None,
+              on_evict=None, shards=1):
     """Least-recently-used cache decorator.
 
     If *maxsize* is set to None, the LRU features are disabled and the cache
@@ -558,10 +577,24 @@ def lru_cache(maxsize=128, typed=False):
     distinct calls with distinct results. Some types such as str and int may
     be cached separately even when typed is false.
 
+    If *ttl* is set, results expire *ttl* seconds after they were computed.
+
+    If *weight* is set, it is called with each result and *maxsize* bounds
+    the total weight of the cached results instead of their number.
+
+    If *on_evict* is set, it is called with each result that is discarded
+    to make room for another one or because it expired.
+
+    If *shards* is greater than 1, the cache is split into that many parts
+    which are locked separately, which reduces lock contention in the
+    free-threaded build.  Each part evicts its own least recently used
+    results.
+
     Arguments to the cached function must be hashable.
 
     View the cache statistics named tuple (hits, misses, maxsize, currsize)
     with f.cache_info().  Clear the cache and statistics with f.cache_clear().
+    Remove a single result with f.cache_invalidate(*args, **kwargs).
     Access the underlying function with f.__wrapped__.
 
     See:  https://en.wikipedia.org/wiki/Cache_replacement_policies#Least_recently_used_(LRU)
@@ -569,10 +602,21 @@ def lru_cache(maxsize=128, typed=False):
     """
 
     # Users should only access the lru_cache through its public API:
-    #       cache_info, cache_clear, and f.__wrapped__
+    #       cache_info, cache_clear, cache_invalidate, and f.__wrapped__
     # The internals of the lru_cache are encapsulated for thread safety and
     # to allow the implementation to change (including a possible C version).
 
+    # Only the options that are set are reported by cache_parameters().
+    options = {}
+    if ttl is not None:
+        options['ttl'] = ttl
+    if weight is not None:
+        options['weight'] = weight
+    if on_evict is not None:
+        options['on_evict'] = on_evict
+    if shards != 1:
+        options['shards'] = shards
+
     if isinstance(maxsize, int):
         # Negative maxsize is treated as 0
         if maxsize < 0:
@@ -580,29 +624,55 @@ def lru_cache(maxsize=128, typed=False):
     elif callable(maxsize) and isinstance(typed, bool):
         # The user_function was passed in directly via the maxsize argument
         user_function, maxsize = maxsize, 128
-        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
-        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
+        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo,
+                                     **options)
+        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed,
+                                             **options}
         return update_wrapper(wrapper, user_function)
     elif maxsize is not None:
         raise TypeError(
             'Expected first argument to be an integer, a callable, or None')
 
     def decorating_function(user_function):
-        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
-        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
+        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo,
+                                     **options)
+        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed,
+                                             **options}
         return update_wrapper(wrapper, user_function)
 
     return decorating_function
 
-def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo):
+def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo, *,
+                       ttl=None, weight=None, on_evict=None, shards=1):
+    if ttl is not None and not ttl > 0:
+        raise ValueError('ttl must be positive')
+    if weight is not None and not callable(weight):
+        raise TypeError('weight must be callable or None')
+    if on_evict is not None and not callable(on_evict):
+        raise TypeError('on_evict must be callable or None')
+    shards = index(shards)
+    if shards < 1:
+        raise ValueError('shards must be at least 1')
+    if maxsize is not None and maxsize < 0:
+        maxsize = 0
+    if maxsize:
+        shards = min(shards, maxsize)
+    if shards > 1 and maxsize != 0:
+        return _sharded_lru_cache_wrapper(user_function, maxsize, typed,
+                                          _CacheInfo, shards, ttl=ttl,
+                                          weight=weight, on_evict=on_evict)
+    extended = ttl is not None or weight is not None or on_evict is not None
+
     # Constants shared by all lru cache instances:
     sentinel = object()          # unique object used to signal cache misses
     make_key = _make_key         # build a key from the function arguments
     PREV, NEXT, KEY, RESULT = 0, 1, 2, 3   # names for the link fields
+    EXPIRES, WEIGHT = 4, 5       # extra link fields of the extended wrapper
 
     cache = {}
     hits = misses = 0
     full = False
+    currsize = 0             # total weight of the links of the extended wrapper
     cache_get = cache.get    # bound method to lookup a key or return None
     cache_len = cache.__len__  # get cache size without calling len()
     lock = RLock()           # because linkedlist updates aren't threadsafe
@@ -618,6 +688,90 @@ def wrapper(*args, **kwds):
             result = user_function(*args, **kwds)
             return result
 
+    elif extended:
+
+        def unlink(link):
+            # Remove a link from the cache; called with the lock held.
+            # Return false if the key comparisons already removed it.
+            nonlocal currsize
+            if cache.pop(link[KEY], sentinel) is sentinel:
+                return False
+            link_prev, link_next = link[PREV], link[NEXT]
+            link_prev[NEXT] = link_next
+            link_next[PREV] = link_prev
+            currsize -= link[WEIGHT]
+            return True
+
+        def notify(evicted):
+            # Report evicted results, once the lock is released.  Errors
+            # are reported as unraisable, so that the result of the call
+            # is still returned and cached.
+            if on_evict is not None:
+                for result in evicted:
+                    try:
+                        on_evict(result)
+                    except Exception:
+                        _report_unraisable(f"Exception ignored in on_evict "
+                                           f"callback of {user_function!r}")
+
+        def wrapper(*args, **kwds):
+            # Caching with expiring or weighted results, or with an eviction
+            # callback.  Every result has its own link, and maxsize bounds
+            # the total weight of the links.
+            nonlocal hits, misses, currsize
+            key = make_key(args, kwds, typed)
+            evicted = []
+            with lock:
+                link = cache_get(key)
+                if link is not None:
+                    if ttl is None or monotonic() < link[EXPIRES]:
+                        # Move the link to the front of the circular queue
+                        link_prev, link_next, _key, result = link[:4]
+                        link_prev[NEXT] = link_next
+                        link_next[PREV] = link_prev
+                        last = root[PREV]
+                        last[NEXT] = root[PREV] = link
+                        link[PREV] = last
+                        link[NEXT] = root
+                        hits += 1
+                        return result
+                    if unlink(link):
+                        evicted.append(link[RESULT])
+                misses += 1
+            notify(evicted)
+            evicted.clear()
+            result = user_function(*args, **kwds)
+            size = 1 if weight is None else index(weight(result))
+            if size < 0:
+                raise ValueError('weight function returned a negative value')
+            with lock:
+                if key in cache:
+                    # The same key was added to the cache while the lock
+                    # was released.  Keep that entry.
+                    return result
+                if maxsize is not None and size > maxsize:
+                    # The result does not fit in the cache at all.  Rather
+                    # than evicting everything, do not cache it.
+                    return result
+                now = monotonic() if ttl is not None else 0
+                # Make room for the new link, removing expired links on
+                # the way.
+                while root[NEXT] is not root:
+                    oldest = root[NEXT]
+                    if not ((maxsize is not None
+                             and currsize + size > maxsize)
+                            or (ttl is not None and oldest[EXPIRES] <= now)):
+                        break
+                    if unlink(oldest):
+                        evicted.append(oldest[RESULT])
+                expires = now + ttl if ttl is not None else 0
+                last = root[PREV]
+                link = [last, root, key, result, expires, size]
+                last[NEXT] = root[PREV] = cache[key] = link
+                currsize += size
+            notify(evicted)
+            return result
+
     elif maxsize is None:
 
         def wrapper(*args, **kwds):
@@ -695,19 +849,88 @@ def wrapper(*args, **kwds):
     def cache_info():
         """Report cache statistics"""
         with lock:
-            return _CacheInfo(hits, misses, maxsize, cache_len())
+            return _CacheInfo(hits, misses, maxsize,
+                              currsize if extended else cache_len())
 
     def cache_clear():
         """Clear the cache and cache statistics"""
-        nonlocal hits, misses, full
+        nonlocal hits, misses, full, currsize
         with lock:
             cache.clear()
             root[:] = [root, root, None, None]
             hits = misses = 0
             full = False
+            currsize = 0
+
+    def cache_invalidate(*args, **kwds):
+        """Remove the cached result for the given arguments.
+
+        Return True if there was a cached result, else False.
+        """
+        nonlocal full, currsize
+        key = make_key(args, kwds, typed)
+        with lock:
+            link = cache.pop(key, sentinel)
+            if link is sentinel:
+                return False
+            if maxsize is not None and maxsize > 0 or extended:
+                link_prev, link_next = link[PREV], link[NEXT]
+                link_prev[NEXT] = link_next
+                link_next[PREV] = link_prev
+                if extended:
+                    currsize -= link[WEIGHT]
+                full = False
+            return True
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_invalidate = cache_invalidate
+    return wrapper
+
+def _sharded_lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo,
+                               shards, **options):
+    # Independent caches with their own locks, each holding the results
+    # for the keys that hash to it.
+    if maxsize is None:
+        sizes = [None] * shards
+    else:
+        sizes = [maxsize // shards + (i < maxsize % shards)
+                 for i in range(shards)]
+    wrappers = [_lru_cache_wrapper(user_function, size, typed, _CacheInfo,
+                                   **options)
+                for size in sizes]
+    make_key = _make_key
+
+    def wrapper(*args, **kwds):
+        key = make_key(args, kwds, typed)
+        return wrappers[hash(key) % shards](*args, **kwds)
+
+    def cache_info():
+        """Report cache statistics"""
+        hits = misses = currsize = 0
+        for shard in wrappers:
+            info = shard.cache_info()
+            hits += info.hits
+            misses += info.misses
+            currsize += info.currsize
+        return _CacheInfo(hits, misses, maxsize, currsize)
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        for shard in wrappers:
+            shard.cache_clear()
+
+    def cache_invalidate(*args, **kwds):
+        """Remove the cached result for the given arguments.
+
+        Return True if there was a cached result, else False.
+        """
+        key = make_key(args, kwds, typed)
+        return wrappers[hash(key) % shards].cache_invalidate(*args, **kwds)
 
     wrapper.cache_info = cache_info
     wrapper.cache_clear = cache_clear
+    wrapper.cache_invalidate = cache_invalidate
     return wrapper
 
 try:
@@ -127,7 +127,7 @@
 """
 
 __all__ = ['heappush', 'heappop', 'heapify', 'heapreplace', 'merge',
-           'nlargest', 'nsmallest', 'heappushpop']
+           'nlargest', 'nsmallest', 'heappushpop', 'IndexedHeap']
 
 def heappush(heap, item):
     """Push item onto heap, maintaining the heap invariant."""
@@ -578,6 +578,168 @@ def nlargest(n, iterable, key=None):
     result.sort(reverse=True)
     return [elem for (k, order, elem) in result]
 
+class _IndexedHeapHandle:
+    """Handle of an entry of an IndexedHeap."""
+
+    __slots__ = ('_priority', '_value', '_order', '_pos')
+
+    def __init__(self, priority, value, order, pos):
+        self._priority = priority
+        self._value = value
+        self._order = order     # breaks ties between equal priorities
+        self._pos = pos         # index in the heap, or -1 once removed
+
+    @property
+    def priority(self):
+        "Current priority of the entry."
+        return self._priority
+
+    @property
+    def value(self):
+        "Value of the entry."
+        return self._value
+
+    def __lt__(self, other):
+        if self._priority < other._priority:
+            return True
+        if other._priority < self._priority:
+            return False
+        return self._order < other._order
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} object at {id(self):#x}, '
+                f'priority={self._priority!r}>')
+
+class IndexedHeap:
+    """Priority queue whose entries can be updated and removed.
+
+    push() returns a handle to the new entry, which can be passed to update(),
+    decrease_key() and remove().  Entries with equal priorities are popped in
+    the order they were pushed.
+    """
+
+    # Every handle records its index in self._heap, so that an entry can be
+    # moved, updated or removed in O(log n) time without searching for it.
+
+    def __init__(self):
+        self._heap = []
+        self._count = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, handle):
+        if not isinstance(handle, _IndexedHeapHandle):
+            return False
+        pos = handle._pos
+        return 0 <= pos < len(self._heap) and self._heap[pos] is handle
+
+    def _check_handle(self, handle):
+        if handle not in self:
+            raise ValueError('handle not in heap')
+
+    def _siftdown(self, pos):
+        # Move the entry at pos towards the root.
+        heap = self._heap
+        handle = heap[pos]
+        while pos > 0:
+            parentpos = (pos - 1) >> 1
+            parent = heap[parentpos]
+            if not handle < parent:
+                break
+            heap[pos] = parent
+            parent._pos = pos
+            pos = parentpos
+        heap[pos] = handle
+        handle._pos = pos
+
+    def _siftup(self, pos):
+        # Move the entry at pos towards the leaves.
+        heap = self._heap
+        endpos = len(heap)
+        handle = heap[pos]
+        childpos = 2*pos + 1
+        while childpos < endpos:
+            rightpos = childpos + 1
+            if rightpos < endpos and heap[rightpos] < heap[childpos]:
+                childpos = rightpos
+            child = heap[childpos]
+            if not child < handle:
+                break
+            heap[pos] = child
+            child._pos = pos
+            pos = childpos
+            childpos = 2*pos + 1
+        heap[pos] = handle
+        handle._pos = pos
+
+    def _fix(self, pos):
+        if pos > 0 and self._heap[pos] < self._heap[(pos - 1) >> 1]:
+            self._siftdown(pos)
+        else:
+            self._siftup(pos)
+
+    def _delete(self, pos):
+        heap = self._heap
+        handle = heap[pos]
+        handle._pos = -1
+        last = heap.pop()
+        if pos < len(heap):
+            heap[pos] = last
+            last._pos = pos
+            self._fix(pos)
+        return handle._priority, handle._value
+
+    def push(self, priority, value=None, /):
+        "Add an entry and return its handle."
+        handle = _IndexedHeapHandle(priority, value, self._count,
+                                    len(self._heap))
+        self._count += 1
+        self._heap.append(handle)
+        self._siftdown(handle._pos)
+        return handle
+
+    def pop(self):
+        "Remove and return the (priority, value) pair with the lowest priority."
+        if not self._heap:
+            raise IndexError('pop from an empty heap')
+        return self._delete(0)
+
+    def peek(self):
+        "Return the (priority, value) pair with the lowest priority."
+        if not self._heap:
+            raise IndexError('peek from an empty heap')
+        handle = self._heap[0]
+        return handle._priority, handle._value
+
+    def update(self, handle, priority, /):
+        "Change the priority of the entry of handle."
+        self._check_handle(handle)
+        handle._priority = priority
+        self._fix(handle._pos)
+
+    def decrease_key(self, handle, priority, /):
+        """Lower the priority of the entry of handle.
+
+        Raise ValueError if priority is greater than the current priority.
+        """
+        self._check_handle(handle)
+        if handle._priority < priority:
+            raise ValueError('new priority is greater than the current '
+                             'priority')
+        self.update(handle, priority)
+
+    def remove(self, handle, /):
+        "Remove the entry of handle and return its (priority, value) pair."
+        self._check_handle(handle)
+        return self._delete(handle._pos)
+
+    def clear(self):
+        "Remove all entries."
+        for handle in self._heap:
+            handle._pos = -1
+        self._heap.clear()
+
 # If available, use C implementation
 try:
     from _heapq import *
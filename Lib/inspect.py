@@ -2033,7 +2033,9 @@ def _signature_bound_method(sig):
         # It's a var-positional parameter.
         # Do nothing. '(*args[, ...])' -> '(*args[, ...])'
 
-    return sig.replace(parameters=params)
+    # Dropping the first parameter of a valid signature leaves a valid one.
+    return type(sig)(params, return_annotation=sig.return_annotation,
+                     __validate_parameters__=False)
 
 
 def _signature_is_builtin(obj):
@@ -2407,6 +2409,14 @@ def _signature_from_callable(obj, *,
     callable objects.
     """
 
+    if type(obj) is types.FunctionType and not obj.__dict__:
+        # A plain Python function, without the attributes which can
+        # override its signature.
+        return _signature_from_function(sigcls, obj,
+                                        skip_bound_arg=skip_bound_arg,
+                                        globals=globals, locals=locals, eval_str=eval_str,
+                                        annotation_format=annotation_format)
+
     _get_signature_of = functools.partial(_signature_from_callable,
                                 follow_wrapper_chains=follow_wrapper_chains,
                                 skip_bound_arg=skip_bound_arg,
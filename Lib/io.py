@@ -47,7 +47,7 @@
            "BufferedRandom", "TextIOBase", "TextIOWrapper",
            "UnsupportedOperation", "SEEK_SET", "SEEK_CUR", "SEEK_END",
            "DEFAULT_BUFFER_SIZE", "text_encoding", "IncrementalNewlineDecoder",
-           "Reader", "Writer"]
+           "Reader", "Writer", "StringBuilder", "BytesBuilder"]
 
 
 import _io
@@ -57,7 +57,8 @@
 from _io import (DEFAULT_BUFFER_SIZE, BlockingIOError, UnsupportedOperation,
                  open, open_code, FileIO, BytesIO, StringIO, BufferedReader,
                  BufferedWriter, BufferedRWPair, BufferedRandom,
-                 IncrementalNewlineDecoder, text_encoding, TextIOWrapper)
+                 IncrementalNewlineDecoder, text_encoding, TextIOWrapper,
+                 StringBuilder, BytesBuilder)
 
 
 # Pretend this exception was created here.
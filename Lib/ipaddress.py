@@ -2406,3 +2406,218 @@ class _IPv6Constants:
 
 IPv6Address._constants = _IPv6Constants
 IPv6Network._constants = _IPv6Constants
+
+
+class IPNetworkSet:
+
+    """A set of IPv4 and IPv6 networks.
+
+    The networks are kept as integers, grouped by version and prefix
+    length, so a set of many networks takes much less memory than a list
+    of IPv4Network and IPv6Network objects.  Finding the networks which
+    contain an address or a network takes one lookup per distinct prefix
+    length in the set.
+
+    Example:
+        nets = IPNetworkSet([IPv4Network('192.0.2.0/24'),
+                             IPv4Network('192.0.2.128/25')])
+        IPv4Address('192.0.2.130') in nets -> True
+        nets.longest_match(IPv4Address('192.0.2.130')) ->
+          IPv4Network('192.0.2.128/25')
+
+    """
+
+    __slots__ = ('_tables', '_prefixlens', '_len')
+
+    _network_classes = {4: IPv4Network, 6: IPv6Network}
+
+    def __init__(self, networks=()):
+        """Instantiate a new set of networks.
+
+        Args:
+            networks: An iterable of IPv4Network or IPv6Network objects,
+              for example the result of collapse_addresses().
+
+        Raises:
+            TypeError: If networks contains an object which is not a
+              network.
+
+        """
+        # {version: {prefixlen: {int(network_address) >> host bits}}}
+        self._tables = {4: {}, 6: {}}
+        # {version: prefix lengths in the table, longest first}
+        self._prefixlens = {4: [], 6: []}
+        self._len = 0
+        self.update(networks)
+
+    @staticmethod
+    def _network_key(network):
+        if not isinstance(network, _BaseNetwork):
+            raise TypeError('%r is not an IPv4 or IPv6 network' % (network,))
+        prefixlen = network._prefixlen
+        return (network.version, prefixlen,
+                network.network_address._ip >> (network.max_prefixlen -
+                                                prefixlen))
+
+    def add(self, network):
+        """Add a network to the set."""
+        version, prefixlen, key = self._network_key(network)
+        table = self._tables[version]
+        keys = table.get(prefixlen)
+        if keys is None:
+            keys = table[prefixlen] = set()
+            self._prefixlens[version] = sorted(table, reverse=True)
+        if key not in keys:
+            keys.add(key)
+            self._len += 1
+
+    def update(self, networks):
+        """Add the networks of an iterable to the set."""
+        for network in networks:
+            self.add(network)
+
+    def discard(self, network):
+        """Remove a network from the set if it is present."""
+        version, prefixlen, key = self._network_key(network)
+        table = self._tables[version]
+        keys = table.get(prefixlen)
+        if keys is not None and key in keys:
+            keys.remove(key)
+            self._len -= 1
+            if not keys:
+                del table[prefixlen]
+                self._prefixlens[version].remove(prefixlen)
+
+    def remove(self, network):
+        """Remove a network from the set.
+
+        Raises:
+            KeyError: If the network is not in the set.
+
+        """
+        version, prefixlen, key = self._network_key(network)
+        if key not in self._tables[version].get(prefixlen, ()):
+            raise KeyError(network)
+        self.discard(network)
+
+    def _matches(self, obj):
+        # Generate the networks which contain obj, longest prefix first.
+        if isinstance(obj, _BaseNetwork):
+            ip = obj.network_address._ip
+            longest = obj._prefixlen
+        elif isinstance(obj, _BaseAddress):
+            ip = obj._ip
+            longest = obj.max_prefixlen
+        else:
+            raise TypeError('%r is not an IPv4 or IPv6 address or network'
+                            % (obj,))
+        bits = obj.max_prefixlen
+        cls = self._network_classes[obj.version]
+        table = self._tables[obj.version]
+        for prefixlen in self._prefixlens[obj.version]:
+            if prefixlen <= longest:
+                hostbits = bits - prefixlen
+                key = ip >> hostbits
+                if key in table[prefixlen]:
+                    yield cls((key << hostbits, prefixlen))
+
+    def longest_match(self, obj):
+        """Return the most specific network of the set containing obj.
+
+        Args:
+            obj: An IPv4 or IPv6 address, interface or network.  A network
+              is contained in the networks which are equal to it or are
+              its supernets.
+
+        Returns:
+            An IPv4Network or IPv6Network object, or None if no network
+            of the set contains obj.
+
+        Raises:
+            TypeError: If obj is not an address, interface or network.
+
+        """
+        for network in self._matches(obj):
+            return network
+        return None
+
+    def matches(self, obj):
+        """Return an iterator of the networks of the set containing obj.
+
+        The networks are generated from the most specific to the least
+        specific one.  obj is as for longest_match().
+
+        """
+        return self._matches(obj)
+
+    def __contains__(self, obj):
+        """Tell if a network of the set contains obj.
+
+        obj can be an address, interface or network.  Use
+        longest_match() to know which network contains it.
+
+        """
+        if not isinstance(obj, (_BaseAddress, _BaseNetwork)):
+            return False
+        for _ in self._matches(obj):
+            return True
+        return False
+
+    def __len__(self):
+        return self._len
+
+    def _iter_version(self, cls):
+        # Generate the networks of a version sorted by address and prefix.
+        bits = cls.max_prefixlen
+        table = self._tables[cls.version]
+        entries = sorted((key << (bits - prefixlen), prefixlen)
+                         for prefixlen, keys in table.items()
+                         for key in keys)
+        for entry in entries:
+            yield cls(entry)
+
+    def __iter__(self):
+        """Generate the IPv4 networks, then the IPv6 networks.
+
+        The networks of a version are sorted by address, then by prefix
+        length.
+
+        """
+        yield from self._iter_version(IPv4Network)
+        yield from self._iter_version(IPv6Network)
+
+    def __eq__(self, other):
+        if not isinstance(other, IPNetworkSet):
+            return NotImplemented
+        return self._tables == other._tables
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self))
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def copy(self):
+        """Return a shallow copy of the set."""
+        new = self.__class__()
+        for version, table in self._tables.items():
+            new._tables[version] = {prefixlen: set(keys)
+                                    for prefixlen, keys in table.items()}
+            new._prefixlens[version] = list(self._prefixlens[version])
+        new._len = self._len
+        return new
+
+    def collapse(self):
+        """Return a new set with the networks collapsed.
+
+        The new set contains the same addresses in the fewest networks, as
+        computed by collapse_addresses().  It is the best choice when only
+        containment matters.
+
+        """
+        new = self.__class__()
+        for cls in (IPv4Network, IPv6Network):
+            new.update(collapse_addresses(self._iter_version(cls)))
+        return new
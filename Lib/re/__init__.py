@@ -94,6 +94,7 @@
     findall   Find all occurrences of a pattern in a string.
     finditer  Return an iterator yielding a Match object for each match.
     compile   Compile a pattern into a Pattern object.
+    compile_set Compile several patterns into a PatternSet object.
     purge     Clear the regular expression cache.
     escape    Backslash all non-alphanumerics in a string.
 
@@ -116,6 +117,10 @@
     X  VERBOSE     Ignore whitespace and comments for nicer looking RE's.
     U  UNICODE     For compatibility only. Ignored for string patterns (it
                    is the default), and forbidden for bytes patterns.
+       LINEAR      Match in time linear in the length of the string.
+                   Backreferences, lookaround assertions, conditional
+                   patterns, atomic groups and possessive quantifiers
+                   are not allowed.
 
 This module also defines exception 'PatternError', aliased to 'error' for
 backward compatibility.
@@ -131,10 +136,10 @@
 # public symbols
 __all__ = [
     "match", "fullmatch", "search", "sub", "subn", "split",
-    "findall", "finditer", "compile", "purge", "escape",
-    "error", "Pattern", "Match", "A", "I", "L", "M", "S", "X", "U",
+    "findall", "finditer", "compile", "compile_set", "purge", "escape",
+    "error", "Pattern", "Match", "PatternSet", "A", "I", "L", "M", "S", "X", "U",
     "ASCII", "IGNORECASE", "LOCALE", "MULTILINE", "DOTALL", "VERBOSE",
-    "UNICODE", "NOFLAG", "RegexFlag", "PatternError"
+    "UNICODE", "LINEAR", "NOFLAG", "RegexFlag", "PatternError"
 ]
 
 __version__ = "2.2.1"
@@ -150,6 +155,7 @@ class RegexFlag:
     MULTILINE = M = _compiler.SRE_FLAG_MULTILINE # make anchors look for newline
     DOTALL = S = _compiler.SRE_FLAG_DOTALL # make dot match newline
     VERBOSE = X = _compiler.SRE_FLAG_VERBOSE # ignore whitespace and comments
+    LINEAR = _compiler.SRE_FLAG_LINEAR # guarantee linear-time matching
     # sre extensions (experimental, don't rely on these)
     DEBUG = _compiler.SRE_FLAG_DEBUG # dump pattern after compilation
     __str__ = object.__str__
@@ -288,6 +294,11 @@ def compile(pattern, flags=0):
     "Compile a regular expression pattern, returning a Pattern object."
     return _compile(pattern, flags)
 
+def compile_set(patterns, flags=0):
+    """Compile an iterable of regular expression patterns into a
+    PatternSet object, which matches all of them in a single pass."""
+    return PatternSet(patterns, flags)
+
 def purge():
     "Clear the regular expression caches"
     _cache.clear()
@@ -315,6 +326,52 @@ def escape(pattern):
 Pattern = type(_compiler.compile('', 0))
 Match = type(_compiler.compile('', 0).match(''))
 
+class PatternSet:
+    """A set of patterns matched together by the linear-time engine.
+
+    The search(), match() and fullmatch() methods scan the string only
+    once, and return a dict which maps the index of each pattern which
+    matched to the span of its leftmost match (the match which the
+    corresponding method of the pattern compiled with the LINEAR flag
+    would return).  Groups are not captured.
+    """
+
+    def __init__(self, patterns, flags=0):
+        if isinstance(flags, RegexFlag):
+            flags = flags.value
+        patterns = tuple(patterns)
+        if not (all(isinstance(p, str) for p in patterns) or
+                all(isinstance(p, bytes) for p in patterns)):
+            raise TypeError("patterns must be all str or all bytes objects")
+        self.patterns = patterns
+        self.flags = RegexFlag(flags)
+        # Only keep the entry point of the engine: the methods of the
+        # compiled pattern cannot run a pattern set.
+        self._match_set = _compiler.compile_set(patterns, flags)._match_set
+
+    def __repr__(self):
+        if self.flags:
+            return f"re.compile_set({self.patterns!r}, {self.flags!r})"
+        return f"re.compile_set({self.patterns!r})"
+
+    def _match(self, string, pos, endpos, search, match_all):
+        if endpos is None:
+            return self._match_set(string, pos, search=search,
+                                   match_all=match_all)
+        return self._match_set(string, pos, endpos, search, match_all)
+
+    def search(self, string, pos=0, endpos=None):
+        """Scan through string looking for a match of each pattern."""
+        return self._match(string, pos, endpos, True, False)
+
+    def match(self, string, pos=0, endpos=None):
+        """Match each pattern at the beginning of string."""
+        return self._match(string, pos, endpos, False, False)
+
+    def fullmatch(self, string, pos=0, endpos=None):
+        """Match each pattern against all of string."""
+        return self._match(string, pos, endpos, False, True)
+
 # --------------------------------------------------------------------
 # internals
 
@@ -175,16 +175,16 @@ def _compile(code, pattern, flags):
             emit(op)
             tail = []
             tailappend = tail.append
-            for av in av[1]:
+            for item in av[1]:
                 skip = _len(code); emit(0)
-                # _compile_info(code, av, flags)
-                _compile(code, av, flags)
+                # _compile_info(code, item, flags)
+                _compile(code, item, flags)
                 emit(JUMP)
                 tailappend(_len(code)); emit(0)
                 code[skip] = _len(code) - skip
             emit(FAILURE) # end of branch
-            for tail in tail:
-                code[tail] = _len(code) - tail
+            for jump in tail:
+                code[jump] = _len(code) - jump
         elif op is CATEGORY:
             emit(op)
             if flags & SRE_FLAG_LOCALE:
@@ -218,6 +218,117 @@ def _compile(code, pattern, flags):
         else:
             raise PatternError(f"internal: unsupported operand type {op!r}")
 
+# Upper limit on the size of programs for the linear-time engine.  Counted
+# repeats are unrolled, so this bounds the work done per character.
+_LINEAR_MAXCODE = 1 << 17
+
+_LINEAR_UNSUPPORTED = {
+    GROUPREF: "backreferences",
+    GROUPREF_EXISTS: "conditional patterns",
+    ASSERT: "lookaround assertions",
+    ASSERT_NOT: "lookaround assertions",
+    ATOMIC_GROUP: "atomic groups",
+    POSSESSIVE_REPEAT: "possessive quantifiers",
+}
+
+def _compile_linear(code, pattern, flags, depth=0, captures=True):
+    # internal: compile a (sub)pattern for the linear-time engine.
+    # Single character items use the same encoding as for the
+    # backtracking engine; control flow is expressed with SPLIT and
+    # GOTO to absolute addresses.  depth is the number of enclosing
+    # optional iterations; it is also the register which saves the
+    # start of a new iteration.  If captures is false, no MARK is
+    # emitted for groups.
+    emit = code.append
+    _len = len
+    for op, av in pattern:
+        if op in _UNIT_CODES or op is AT:
+            _compile(code, [(op, av)], flags)
+        elif op is SUBPATTERN:
+            group, add_flags, del_flags, p = av
+            if group and captures:
+                emit(MARK)
+                emit((group-1)*2)
+            _compile_linear(code, p, _combine_flags(flags, add_flags, del_flags),
+                            depth, captures)
+            if group and captures:
+                emit(MARK)
+                emit((group-1)*2+1)
+        elif op is BRANCH:
+            tail = []
+            *items, last = av[1]
+            for item in items:
+                emit(SPLIT)
+                emit(_len(code) + 3)
+                skip = _len(code); emit(0)
+                emit(depth)
+                _compile_linear(code, item, flags, depth, captures)
+                emit(GOTO)
+                tail.append(_len(code)); emit(0)
+                code[skip] = _len(code)
+            _compile_linear(code, last, flags, depth, captures)
+            for goto in tail:
+                code[goto] = _len(code)
+        elif op is MAX_REPEAT or op is MIN_REPEAT:
+            lo, hi, item = av
+            for i in range(lo):
+                _compile_linear(code, item, flags, depth, captures)
+                if _len(code) > _LINEAR_MAXCODE:
+                    raise PatternError("pattern too large for the "
+                                       "linear-time engine")
+            if hi > lo:
+                # each optional iteration is
+                #   <SPLIT> body next depth
+                #   body: <LOOP_BEGIN> depth item <LOOP_END> depth empty
+                # and is followed by <GOTO> loop if the repeat is
+                # unbounded.  Like the backtracking engine, stop
+                # repeating after an iteration which matched the empty
+                # string: continue with the tail of a greedy repeat, and
+                # fail for a lazy one (the tail was tried first).
+                loop = _len(code)
+                splits = []
+                ends = []
+                for i in range(1 if hi == MAXREPEAT else hi - lo):
+                    splits.append(_len(code))
+                    emit(SPLIT)
+                    emit(0)
+                    emit(0)
+                    emit(depth)
+                    emit(LOOP_BEGIN)
+                    emit(depth)
+                    _compile_linear(code, item, flags, depth + 1, captures)
+                    emit(LOOP_END)
+                    emit(depth)
+                    ends.append(_len(code)); emit(0)
+                    if _len(code) > _LINEAR_MAXCODE:
+                        raise PatternError("pattern too large for the "
+                                           "linear-time engine")
+                if hi == MAXREPEAT:
+                    emit(GOTO)
+                    emit(loop)
+                if op is MIN_REPEAT:
+                    if hi != MAXREPEAT:
+                        emit(GOTO)
+                        skip = _len(code); emit(0)
+                    empty = _len(code)
+                    emit(FAILURE)
+                    if hi != MAXREPEAT:
+                        code[skip] = _len(code)
+                    tail = _len(code)
+                    for split in splits:
+                        code[split+1: split+3] = [tail, split + 4]
+                else:
+                    tail = empty = _len(code)
+                    for split in splits:
+                        code[split+1: split+3] = [split + 4, tail]
+                for end in ends:
+                    code[end] = empty
+        elif op in _LINEAR_UNSUPPORTED:
+            raise PatternError("%s are not supported by the linear-time "
+                               "engine" % _LINEAR_UNSUPPORTED[op])
+        else:
+            raise PatternError(f"internal: unsupported operand type {op!r}")
+
 def _compile_charset(charset, flags, code):
     # compile charset subprogram
     emit = code.append
@@ -522,6 +633,94 @@ def _get_charset_prefix(pattern, flags):
         return charset
     return None
 
+# the longest required literal which is looked for before matching
+# (must match SRE_REQUIRED_MAX in sre.h)
+_MAXREQUIRED = 64
+
+def _get_chars(charset, pattern):
+    # internal: add the items of a charset which contains all characters
+    # which can be consumed by pattern to charset; return False if unknown
+    for op, av in pattern:
+        if op is LITERAL:
+            charset.append((op, av))
+        elif op is IN:
+            if av and av[0][0] is NEGATE:
+                return False
+            charset.extend(av)
+        elif op in _REPEATING_CODES:
+            if not _get_chars(charset, av[2]):
+                return False
+        elif op is SUBPATTERN:
+            group, add_flags, del_flags, p = av
+            if add_flags or del_flags:
+                return False
+            if not _get_chars(charset, p):
+                return False
+        elif op is ATOMIC_GROUP:
+            if not _get_chars(charset, av):
+                return False
+        elif op is BRANCH:
+            for p in av[1]:
+                if not _get_chars(charset, p):
+                    return False
+        elif op is GROUPREF_EXISTS:
+            group, item_yes, item_no = av
+            if not _get_chars(charset, item_yes):
+                return False
+            if item_no and not _get_chars(charset, item_no):
+                return False
+        elif op is AT or op is ASSERT or op is ASSERT_NOT:
+            pass # zero-width
+        else:
+            return False
+    return True
+
+def _get_required_literal(pattern, flags):
+    # internal: look for a literal string which occurs in every match,
+    # not necessarily at the start of it.  Return the literal, the
+    # minimal and maximal offset of the literal from the start of the
+    # match, and a charset which contains all characters which can
+    # occur before the literal (or None), or None if nothing was found
+    items = []
+    def flatten(p):
+        for op, av in p:
+            if op is SUBPATTERN and not av[1] and not av[2]:
+                flatten(av[3])
+            else:
+                items.append((op, av))
+    flatten(pattern.data)
+
+    iscased = _get_iscased(flags)
+    best = None
+    charset = [] if not flags & SRE_FLAG_IGNORECASE else None
+    lo = hi = 0
+    i = 0
+    while i < len(items):
+        j = i
+        while (j < len(items) and items[j][0] is LITERAL and
+               not (iscased and iscased(items[j][1]))):
+            j += 1
+        if j > i:
+            literal = [av for op, av in items[i:j]][:_MAXREQUIRED]
+            if best is None or len(literal) > len(best[0]):
+                best = literal, lo, hi, None if charset is None else charset[:]
+            if charset is not None:
+                charset.extend(items[i:j])
+            lo += j - i
+            hi += j - i
+            i = j
+            continue
+        l, h = _parser.SubPattern(pattern.state, [items[i]]).getwidth()
+        lo += l
+        hi += h
+        if charset is not None and not _get_chars(charset, [items[i]]):
+            charset = None
+        i += 1
+    if best is None or best[1] >= MAXCODE:
+        return None
+    literal, lo, hi, charset = best
+    return literal, lo, min(hi, MAXCODE), charset
+
 def _compile_info(code, pattern, flags):
     # internal: compile an info block.  in the current version,
     # this contains min/max pattern width, and an optional literal
@@ -536,6 +735,7 @@ def _compile_info(code, pattern, flags):
     prefix = []
     prefix_skip = 0
     charset = None # not used
+    required = None
     if not (flags & SRE_FLAG_IGNORECASE and flags & SRE_FLAG_LOCALE):
         # look for literal prefix
         prefix, prefix_skip, got_all = _get_literal_prefix(pattern, flags)
@@ -547,6 +747,8 @@ def _compile_info(code, pattern, flags):
                 assert not hascased
                 if charset == _CHARSET_ALL:
                     charset = None
+            # and for a literal further in the pattern
+            required = _get_required_literal(pattern, flags)
 ##     if prefix:
 ##         print("*** PREFIX", prefix, prefix_skip)
 ##     if charset:
@@ -563,6 +765,8 @@ def _compile_info(code, pattern, flags):
             mask = mask | SRE_INFO_LITERAL
     elif charset:
         mask = mask | SRE_INFO_CHARSET
+    if required:
+        mask = mask | SRE_INFO_REQUIRED
     emit(mask)
     # pattern length
     if lo < MAXCODE:
@@ -582,6 +786,25 @@ def _compile_info(code, pattern, flags):
         code.extend(_generate_overlap_table(prefix))
     elif charset:
         _compile_charset(charset, flags, code)
+    # add required literal
+    if required:
+        literal, lo, hi, charset = required
+        start = len(code)
+        emit(len(literal))
+        emit(lo)
+        emit(hi)
+        code.extend(literal)
+        if charset is not None:
+            charset, hascased = _optimize_charset(charset)
+            assert not hascased
+            if charset == _CHARSET_ALL:
+                charset = None
+        if charset is not None:
+            emit(1)
+            _compile_charset(charset, flags, code)
+        else:
+            emit(0)
+        emit(len(code) - start + 1) # size
     code[skip] = len(code) - skip
 
 def isstring(obj):
@@ -602,6 +825,56 @@ def _code(p, flags):
 
     return code
 
+def _finish_linear(code):
+    # internal: fill in the header of a program for the linear-time
+    # engine; "threads" is the number of instructions which can hold
+    # a thread between two steps of the matcher
+    if len(code) > _LINEAR_MAXCODE:
+        raise PatternError("pattern too large for the linear-time engine")
+
+    registers = threads = 0
+    i = 5
+    while i < len(code):
+        op = code[i]
+        if op == LOOP_BEGIN:
+            registers = max(registers, code[i+1] + 1)
+            i += 2
+        elif op in (MARK, AT, GOTO):
+            i += 2
+        elif op is SPLIT:
+            i += 4
+        elif op is LOOP_END:
+            i += 3
+        elif op is SET:
+            i += 2 + code[i+1]
+        elif op == FAILURE:
+            i += 1
+        else:
+            threads += 1
+            if op in (IN, IN_IGNORE, IN_UNI_IGNORE, IN_LOC_IGNORE):
+                i += 1 + code[i+1]
+            elif op in (SUCCESS, ANY, ANY_ALL):
+                i += 1
+            else:
+                i += 2
+    code[1] = len(code)
+    code[3] = registers
+    code[4] = threads
+
+def _code_linear(p, flags):
+    # <LINEAR> <1=codesize> <2=groups> <3=registers> <4=threads> ...
+    # <SUCCESS>
+
+    flags = p.state.flags | flags
+    code = [LINEAR, 0, p.state.groups - 1, 0, 0]
+
+    _compile_linear(code, p.data, flags)
+
+    code.append(SUCCESS)
+    _finish_linear(code)
+
+    return code
+
 def _hex_code(code):
     return '[%s]' % ', '.join('%#0*x' % (_sre.CODESIZE*2+2, x) for x in code)
 
@@ -723,6 +996,30 @@ def print_2(*args):
                 print_(op, skip, to=i+skip)
                 dis_(i+1, i+skip)
                 i += skip
+            elif op is LINEAR:
+                print_(op, *code[i: i+4])
+                i += 4
+            elif op is SPLIT:
+                first, second, depth = code[i: i+3]
+                labels.update((first, second))
+                print_(op, first, second, depth)
+                i += 3
+            elif op is GOTO:
+                print_(op, to=code[i])
+                i += 1
+            elif op is LOOP_BEGIN:
+                print_(op, code[i])
+                i += 1
+            elif op is LOOP_END:
+                arg, target = code[i: i+2]
+                print_(op, arg, to=target)
+                i += 2
+            elif op is SET:
+                count = code[i]
+                starts = code[i+1: i+1+count]
+                labels.update(starts)
+                print_(op, count, *starts)
+                i += 1 + count
             elif op is INFO:
                 skip, flags, min, max = code[i: i+4]
                 if max == MAXREPEAT:
@@ -740,11 +1037,27 @@ def print_2(*args):
                     start += prefix_len
                     print_2('  overlap', code[start: start+prefix_len])
                     start += prefix_len
+                info_end = i+skip
+                if flags & SRE_INFO_REQUIRED:
+                    info_end -= code[info_end-1]
                 if flags & SRE_INFO_CHARSET:
                     level += 1
                     print_2('in')
-                    dis_(start, i+skip)
+                    dis_(start, info_end)
                     level -= 1
+                if flags & SRE_INFO_REQUIRED:
+                    length, lo, hi = code[info_end: info_end+3]
+                    if hi == MAXREPEAT:
+                        hi = 'MAXREPEAT'
+                    literal = code[info_end+3: info_end+3+length]
+                    print_2('  required', lo, hi,
+                            '[%s]' % ', '.join('%#02x' % x for x in literal),
+                            '(%r)' % ''.join(map(chr, literal)))
+                    if code[info_end+3+length]:
+                        level += 1
+                        print_2('in')
+                        dis_(info_end+4+length, i+skip-1)
+                        level -= 1
                 i += skip
             else:
                 raise ValueError(op)
@@ -763,7 +1076,10 @@ def compile(p, flags=0):
     else:
         pattern = None
 
-    code = _code(p, flags)
+    if flags & SRE_FLAG_LINEAR:
+        code = _code_linear(p, flags)
+    else:
+        code = _code(p, flags)
 
     if flags & SRE_FLAG_DEBUG:
         print()
@@ -780,3 +1096,31 @@ def compile(p, flags=0):
         p.state.groups-1,
         groupindex, tuple(indexgroup)
         )
+
+def compile_set(patterns, flags=0):
+    # internal: compile several patterns into a single program for the
+    # linear-time engine, see re.PatternSet.  The program is
+    # <LINEAR> ... <SET> <count> <start>... followed by the patterns,
+    # each one ending with <SUCCESS>; groups are not captured
+
+    flags |= SRE_FLAG_LINEAR
+    code = [LINEAR, 0, 0, 0, 0, SET, len(patterns)]
+    code.extend([0] * len(patterns))
+    for i, pattern in enumerate(patterns):
+        p = _parser.parse(pattern, flags)
+        code[7 + i] = len(code)
+        _compile_linear(code, p.data, p.state.flags | flags, captures=False)
+        code.append(SUCCESS)
+        if len(code) > _LINEAR_MAXCODE:
+            raise PatternError("pattern too large for the linear-time engine")
+    if not patterns:
+        code.append(SUCCESS)
+    _finish_linear(code)
+
+    if flags & SRE_FLAG_DEBUG:
+        print()
+        dis(code)
+
+    return _sre.compile(
+        patterns[0][:0] if patterns else None, flags, code, 0, {}, ()
+        )
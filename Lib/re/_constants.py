@@ -13,7 +13,7 @@
 
 # update when constants are added or removed
 
-MAGIC = 20230612
+MAGIC = 20261021
 
 from _sre import MAXREPEAT, MAXGROUPS  # noqa: F401
 
@@ -120,6 +120,15 @@ def _makecodes(*names):
     'NOT_LITERAL_UNI_IGNORE',
     'RANGE_UNI_IGNORE',
 
+    # The following opcodes are only used by the linear-time engine
+    # (see the LINEAR flag).
+    'LINEAR',
+    'SPLIT',
+    'GOTO',
+    'LOOP_BEGIN',
+    'LOOP_END',
+    'SET',
+
     # The following opcodes are only occurred in the parser output,
     # but not in the compiled code.
     'MIN_REPEAT', 'MAX_REPEAT',
@@ -217,8 +226,10 @@ def _makecodes(*names):
 SRE_FLAG_VERBOSE = 64 # ignore whitespace and comments
 SRE_FLAG_DEBUG = 128 # debugging
 SRE_FLAG_ASCII = 256 # use ascii "locale"
+SRE_FLAG_LINEAR = 512 # use the linear-time matching engine
 
 # flags for INFO primitive
 SRE_INFO_PREFIX = 1 # has prefix
 SRE_INFO_LITERAL = 2 # entire pattern is literal (given by prefix)
 SRE_INFO_CHARSET = 4 # pattern starts with character from given set
+SRE_INFO_REQUIRED = 8 # pattern contains a literal (given at the end)
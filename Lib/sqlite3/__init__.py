@@ -55,3 +55,4 @@
 """
 
 from sqlite3.dbapi2 import *
+from sqlite3.pool import ConnectionPool
@@ -0,0 +1,128 @@
+"""A pool of connections to an SQLite database shared by threads."""
+
+import threading
+from contextlib import contextmanager
+from sqlite3.dbapi2 import connect, Error, ProgrammingError
+
+
+def _pragma_value(value):
+    if isinstance(value, str):
+        return "'{0}'".format(value.replace("'", "''"))
+    if isinstance(value, bool):
+        return str(int(value))
+    return str(value)
+
+
+class ConnectionPool:
+    """A pool of connections to a database shared by threads.
+
+    Connections are opened with check_same_thread=False and handed to one
+    thread at a time by connection().  They are kept open when they are
+    released, so their prepared statements are reused by the next
+    checkouts.
+    """
+
+    def __init__(self, database, *, max_connections=None, pragmas=None,
+                 **kwargs):
+        if max_connections is not None and max_connections < 1:
+            raise ValueError("max_connections must be None or positive")
+        if "check_same_thread" in kwargs:
+            raise TypeError("ConnectionPool() got an unexpected keyword "
+                            "argument 'check_same_thread'")
+        self.database = database
+        self.max_connections = max_connections
+        self._pragmas = dict(pragmas) if pragmas else {}
+        self._kwargs = kwargs
+        self._idle = []
+        self._size = 0      # number of open connections
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _open(self):
+        cx = connect(self.database, check_same_thread=False, **self._kwargs)
+        try:
+            for name, value in self._pragmas.items():
+                cx.execute(f"PRAGMA {name} = {_pragma_value(value)}").close()
+        except BaseException:
+            cx.close()
+            raise
+        return cx
+
+    def _acquire(self):
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise ProgrammingError("Cannot operate on a closed pool.")
+                if self._idle:
+                    return self._idle.pop()
+                if (self.max_connections is None
+                        or self._size < self.max_connections):
+                    self._size += 1
+                    break
+                self._cond.wait()
+        try:
+            return self._open()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, cx):
+        # Do not leak an open transaction to the next thread.
+        try:
+            if cx.in_transaction:
+                cx.rollback()
+            reuse = True
+        except Error:
+            # The connection was closed or is broken.
+            reuse = False
+        with self._cond:
+            reuse = reuse and not self._closed
+            if reuse:
+                self._idle.append(cx)
+            else:
+                self._size -= 1
+            self._cond.notify()
+        if not reuse:
+            cx.close()
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the current thread.
+
+        Block if max_connections connections are already checked out.
+        Nested checkouts in the same thread return the same connection.
+        A transaction left open is rolled back when the connection is
+        returned to the pool.
+        """
+        local = self._local
+        cx = getattr(local, "connection", None)
+        if cx is not None:
+            yield cx
+            return
+        cx = self._acquire()
+        local.connection = cx
+        try:
+            yield cx
+        finally:
+            local.connection = None
+            self._release(cx)
+
+    def close(self):
+        """Close the idle connections and the connections checked out
+        when they are returned."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for cx in idle:
+            cx.close()
@@ -106,6 +106,9 @@
 
 __all__ = [
     'NormalDist',
+    'QuantileSketch',
+    'RunningCovariance',
+    'RunningStats',
     'StatisticsError',
     'correlation',
     'covariance',
@@ -141,7 +144,7 @@
 from math import hypot, sqrt, fabs, exp, erf, tau, log, fsum, sumprod
 from math import isfinite, isinf, pi, cos, sin, tan, cosh, asin, atan, acos
 from functools import reduce
-from operator import itemgetter
+from operator import index, itemgetter
 from collections import Counter, namedtuple, defaultdict
 
 _SQRT2 = sqrt(2.0)
@@ -1438,6 +1441,449 @@ def __setstate__(self, state):
         self._mu, self._sigma = state
 
 
+## Streaming statistics ####################################################
+
+# These accumulate summary statistics of a stream of data in constant
+# memory, using float arithmetic.  Accumulators fed from separate parts of
+# the data, possibly in other threads or processes, can be combined with
+# merge().  They support pickling for this purpose.
+
+class RunningStats:
+    """Count, mean, variance, minimum and maximum of a stream of numbers.
+
+    The data points are not stored.  The mean and variance are updated with
+    Welford's algorithm, which is numerically stable.
+
+    >>> stats = RunningStats([2.5, 3.25, 5.5])
+    >>> stats.add(11.25)
+    >>> stats.add(11.75)
+    >>> stats.count, stats.mean, stats.max
+    (5, 6.85, 11.75)
+    >>> round(stats.stdev, 10)
+    4.3896184345
+
+    """
+    # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
+
+    __slots__ = ('_n', '_mean', '_m2', '_min', '_max')
+
+    def __init__(self, data=(), /):
+        self._n = 0
+        self._mean = self._m2 = self._min = self._max = 0.0
+        self.update(data)
+
+    def add(self, x, /):
+        "Add the data point *x*."
+        x = float(x)
+        n = self._n + 1
+        delta = x - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (x - self._mean)
+        self._n = n
+        if n == 1:
+            self._min = self._max = x
+        else:
+            if x < self._min:
+                self._min = x
+            if x > self._max:
+                self._max = x
+
+    def update(self, data, /):
+        "Add the data points from the iterable *data*."
+        for x in data:
+            self.add(x)
+
+    def merge(self, other, /):
+        "Add the data points accumulated by another RunningStats."
+        if not isinstance(other, RunningStats):
+            raise TypeError(f'merge() argument must be RunningStats, '
+                            f'not {type(other).__name__}')
+        na = self._n
+        nb = other._n
+        if not nb:
+            return
+        if not na:
+            self._set(other)
+            return
+        n = na + nb
+        delta = other._mean - self._mean
+        self._mean += delta * nb / n
+        self._m2 += other._m2 + delta * delta * na * nb / n
+        self._n = n
+        if other._min < self._min:
+            self._min = other._min
+        if other._max > self._max:
+            self._max = other._max
+
+    def _set(self, other):
+        self._n = other._n
+        self._mean = other._mean
+        self._m2 = other._m2
+        self._min = other._min
+        self._max = other._max
+
+    @property
+    def count(self):
+        "Number of data points."
+        return self._n
+
+    @property
+    def mean(self):
+        "Arithmetic mean of the data points."
+        if not self._n:
+            raise StatisticsError('mean requires at least one data point')
+        return self._mean
+
+    @property
+    def variance(self):
+        "Sample variance of the data points."
+        if self._n < 2:
+            raise StatisticsError('variance requires at least two data points')
+        return self._m2 / (self._n - 1)
+
+    @property
+    def pvariance(self):
+        "Population variance of the data points."
+        if not self._n:
+            raise StatisticsError('pvariance requires at least one data point')
+        return self._m2 / self._n
+
+    @property
+    def stdev(self):
+        "Sample standard deviation of the data points."
+        return sqrt(self.variance)
+
+    @property
+    def pstdev(self):
+        "Population standard deviation of the data points."
+        return sqrt(self.pvariance)
+
+    @property
+    def min(self):
+        "Smallest data point."
+        if not self._n:
+            raise StatisticsError('min requires at least one data point')
+        return self._min
+
+    @property
+    def max(self):
+        "Largest data point."
+        if not self._n:
+            raise StatisticsError('max requires at least one data point')
+        return self._max
+
+    def __repr__(self):
+        return f'<{type(self).__name__} count={self._n}>'
+
+    def __getstate__(self):
+        return self._n, self._mean, self._m2, self._min, self._max
+
+    def __setstate__(self, state):
+        self._n, self._mean, self._m2, self._min, self._max = state
+
+
+class RunningCovariance:
+    """Covariance and correlation of a stream of pairs of numbers.
+
+    The data points are not stored.
+
+    >>> acc = RunningCovariance([1, 2, 3, 4, 5, 6, 7, 8, 9],
+    ...                         [1, 2, 3, 1, 2, 3, 1, 2, 3])
+    >>> acc.covariance
+    0.75
+    >>> round(acc.correlation, 10)
+    0.316227766
+
+    """
+
+    __slots__ = ('_n', '_mean_x', '_mean_y', '_m2x', '_m2y', '_cxy')
+
+    def __init__(self, x=(), y=(), /):
+        self._n = 0
+        self._mean_x = self._mean_y = 0.0
+        self._m2x = self._m2y = self._cxy = 0.0
+        self.update(x, y)
+
+    def add(self, x, y, /):
+        "Add the pair of data points *x* and *y*."
+        x = float(x)
+        y = float(y)
+        n = self._n + 1
+        dx = x - self._mean_x
+        dy = y - self._mean_y
+        self._mean_x += dx / n
+        self._mean_y += dy / n
+        self._m2x += dx * (x - self._mean_x)
+        self._m2y += dy * (y - self._mean_y)
+        self._cxy += dx * (y - self._mean_y)
+        self._n = n
+
+    def update(self, x, y, /):
+        "Add the pairs of data points from the iterables *x* and *y*."
+        for xi, yi in zip(x, y, strict=True):
+            self.add(xi, yi)
+
+    def merge(self, other, /):
+        "Add the data points accumulated by another RunningCovariance."
+        if not isinstance(other, RunningCovariance):
+            raise TypeError(f'merge() argument must be RunningCovariance, '
+                            f'not {type(other).__name__}')
+        na = self._n
+        nb = other._n
+        if not nb:
+            return
+        if not na:
+            self.__setstate__(other.__getstate__())
+            return
+        n = na + nb
+        dx = other._mean_x - self._mean_x
+        dy = other._mean_y - self._mean_y
+        self._mean_x += dx * nb / n
+        self._mean_y += dy * nb / n
+        self._m2x += other._m2x + dx * dx * na * nb / n
+        self._m2y += other._m2y + dy * dy * na * nb / n
+        self._cxy += other._cxy + dx * dy * na * nb / n
+        self._n = n
+
+    @property
+    def count(self):
+        "Number of pairs of data points."
+        return self._n
+
+    @property
+    def covariance(self):
+        "Sample covariance of the two inputs."
+        if self._n < 2:
+            raise StatisticsError('covariance requires at least two data points')
+        return self._cxy / (self._n - 1)
+
+    @property
+    def correlation(self):
+        "Pearson's correlation coefficient of the two inputs."
+        if self._n < 2:
+            raise StatisticsError('correlation requires at least two data points')
+        if not self._m2x or not self._m2y:
+            raise StatisticsError('at least one of the inputs is constant')
+        return self._cxy / (sqrt(self._m2x) * sqrt(self._m2y))
+
+    def __repr__(self):
+        return f'<{type(self).__name__} count={self._n}>'
+
+    def __getstate__(self):
+        return (self._n, self._mean_x, self._mean_y,
+                self._m2x, self._m2y, self._cxy)
+
+    def __setstate__(self, state):
+        (self._n, self._mean_x, self._mean_y,
+         self._m2x, self._m2y, self._cxy) = state
+
+
+class QuantileSketch:
+    """Approximate quantiles of a stream of numbers.
+
+    This is a merging t-digest: the data points are summarized by a bounded
+    number of weighted centroids, which are smaller near both ends of the
+    distribution, so that extreme quantiles are estimated accurately.
+    Larger values of *compression* use more memory and give more accurate
+    results.  For small amounts of data, where each data point gets its own
+    centroid, the estimates agree with quantiles(data, method='inclusive').
+
+    >>> sketch = QuantileSketch(range(1, 10001))
+    >>> sketch.quantile(0.5)
+    5000.5
+    >>> [round(q) for q in sketch.quantiles(n=4)]
+    [2501, 5000, 7500]
+
+    """
+    # Dunning, T. (2019).  The t-digest: Efficient estimates of
+    # distributions.  https://arxiv.org/abs/1902.04023
+
+    __slots__ = ('_compression', '_capacity', '_means', '_weights',
+                 '_unmerged', '_total', '_min', '_max')
+
+    def __init__(self, data=(), /, *, compression=100):
+        compression = index(compression)
+        if compression < 1:
+            raise ValueError('compression must be at least 1')
+        self._compression = compression
+        self._capacity = 6 * compression + 10
+        self._means = []
+        self._weights = []
+        self._unmerged = []
+        self._total = 0
+        self._min = self._max = 0.0
+        self.update(data)
+
+    def _add_centroid(self, mean, weight):
+        self._unmerged.append((mean, weight))
+        if len(self._means) + len(self._unmerged) >= self._capacity:
+            self._compress()
+
+    def _compress(self):
+        if not self._unmerged:
+            return
+        items = sorted(self._unmerged + list(zip(self._means, self._weights)))
+        self._unmerged = []
+        total = float(self._total)
+        # Scale function k1 of the paper: k(q) = compression/(2*pi) *
+        # asin(2*q - 1).  A centroid may cover at most 1 unit of k.
+        scale = self._compression / tau
+        means = []
+        weights = []
+        mean, weight = items[0]
+        before = 0.0
+        limit = _tdigest_limit(before / total, scale)
+        for x, w in items[1:]:
+            if (before + weight + w) / total <= limit:
+                weight += w
+                mean += (x - mean) * w / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                before += weight
+                limit = _tdigest_limit(before / total, scale)
+                mean = x
+                weight = w
+        means.append(mean)
+        weights.append(weight)
+        self._means = means
+        self._weights = weights
+
+    def add(self, x, /):
+        "Add the data point *x*."
+        x = float(x)
+        if not isfinite(x):
+            raise ValueError('data points must be finite')
+        if not self._total:
+            self._min = self._max = x
+        else:
+            if x < self._min:
+                self._min = x
+            if x > self._max:
+                self._max = x
+        self._total += 1
+        self._add_centroid(x, 1.0)
+
+    def update(self, data, /):
+        "Add the data points from the iterable *data*."
+        for x in data:
+            self.add(x)
+
+    def merge(self, other, /):
+        "Add the data points summarized by another QuantileSketch."
+        if not isinstance(other, QuantileSketch):
+            raise TypeError(f'merge() argument must be QuantileSketch, '
+                            f'not {type(other).__name__}')
+        if not other._total:
+            return
+        other._compress()
+        if not self._total:
+            self._min = other._min
+            self._max = other._max
+        else:
+            if other._min < self._min:
+                self._min = other._min
+            if other._max > self._max:
+                self._max = other._max
+        self._total += other._total
+        for centroid in list(zip(other._means, other._weights)):
+            self._add_centroid(*centroid)
+
+    @property
+    def compression(self):
+        "The compression parameter."
+        return self._compression
+
+    @property
+    def count(self):
+        "Number of data points."
+        return self._total
+
+    @property
+    def min(self):
+        "Smallest data point."
+        if not self._total:
+            raise StatisticsError('min requires at least one data point')
+        return self._min
+
+    @property
+    def max(self):
+        "Largest data point."
+        if not self._total:
+            raise StatisticsError('max requires at least one data point')
+        return self._max
+
+    def quantile(self, p, /):
+        """Estimate the value below which a fraction *p* of the data falls.
+
+        The estimate is linearly interpolated between the centroids, with
+        0.0 giving the minimum and 1.0 the maximum.
+        """
+        p = float(p)
+        if not 0.0 <= p <= 1.0:
+            raise ValueError('p must be in the range 0.0 <= p <= 1.0')
+        if not self._total:
+            raise StatisticsError('quantile requires at least one data point')
+        self._compress()
+        # The centroid of weight w starting after the first k data points
+        # stands for the data point of (fractional) rank k + (w - 1) / 2.
+        t = p * (self._total - 1)
+        before = 0.0
+        prev_rank = 0.0
+        prev_value = self._min
+        for mean, weight in zip(self._means, self._weights):
+            rank = before + (weight - 1.0) / 2.0
+            if t <= rank:
+                if rank == prev_rank:
+                    return mean
+                return (prev_value + (mean - prev_value)
+                        * (t - prev_rank) / (rank - prev_rank))
+            before += weight
+            prev_rank = rank
+            prev_value = mean
+        rank = self._total - 1.0
+        if rank == prev_rank:
+            return prev_value
+        return (prev_value + (self._max - prev_value)
+                * (t - prev_rank) / (rank - prev_rank))
+
+    def quantiles(self, n=4):
+        """Divide into *n* continuous intervals with equal probability.
+
+        Returns a list of (n - 1) estimated cut points separating the
+        intervals, like quantiles(data, n=n, method='inclusive').
+        """
+        if n < 1:
+            raise StatisticsError('n must be at least 1')
+        return [self.quantile(i / n) for i in range(1, n)]
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} count={self._total} '
+                f'compression={self._compression}>')
+
+    def __getstate__(self):
+        self._compress()
+        return (self._compression, self._means, self._weights,
+                self._total, self._min, self._max)
+
+    def __setstate__(self, state):
+        (compression, means, weights,
+         self._total, self._min, self._max) = state
+        self._compression = compression
+        self._capacity = 6 * compression + 10
+        self._means = list(means)
+        self._weights = list(weights)
+        self._unmerged = []
+
+
+def _tdigest_limit(q, scale):
+    # Largest cumulative fraction q2 such that k(q2) - k(q) <= 1
+    x = (scale * asin(2.0 * q - 1.0) + 1.0) / scale
+    if x >= pi / 2.0:
+        return 1.0
+    return (sin(x) + 1.0) / 2.0
+
+
 ## Private utilities #######################################################
 
 def _sum(data):
@@ -1867,3 +2313,9 @@ def _normal_dist_inv_cdf(p, mu, sigma):
     from _statistics import _normal_dist_inv_cdf
 except ImportError:
     pass
+
+try:
+    from _statistics import (
+        QuantileSketch, RunningCovariance, RunningStats, StatisticsError)
+except ImportError:
+    pass
@@ -31,6 +31,7 @@
 from datetime import timezone
 from datetime import UTC
 from datetime import date, datetime
+from datetime import compile_format
 import time as _time
 
 try:
@@ -95,7 +96,7 @@ def test_name_cleanup(self):
                     if not name.startswith('__') and not name.endswith('__'))
         allowed = set(['MAXYEAR', 'MINYEAR', 'date', 'datetime',
                        'datetime_CAPI', 'time', 'timedelta', 'timezone',
-                       'tzinfo', 'UTC', 'sys'])
+                       'tzinfo', 'UTC', 'sys', 'compile_format'])
         self.assertEqual(names - allowed, set([]))
 
     def test_divide_and_round(self):
@@ -1208,6 +1209,95 @@ def test_strptime_leap_year(self):
             date.strptime('20-03-14', '%y-%m-%d')
             date.strptime('02-29,2024', '%m-%d,%Y')
 
+class TestCompileFormat(unittest.TestCase):
+
+    def test_parse(self):
+        f = compile_format('%Y-%m-%dT%H:%M:%S.%f%z')
+        self.assertEqual(f.format, '%Y-%m-%dT%H:%M:%S.%f%z')
+        s = '2024-01-02T03:04:05.25+05:30'
+        tz = timezone(timedelta(hours=5, minutes=30))
+        self.assertEqual(f.parse_datetime(s),
+                         datetime(2024, 1, 2, 3, 4, 5, 250000, tz))
+        self.assertIs(type(f.parse_datetime(s)), datetime)
+        self.assertEqual(f.parse_date(s), date(2024, 1, 2))
+        self.assertIs(type(f.parse_date(s)), date)
+        self.assertEqual(f.parse_time(s), time(3, 4, 5, 250000, tz))
+        self.assertIs(type(f.parse_time(s)), time)
+        self.assertIs(f.parse_datetime('2024-01-02T03:04:05.0Z').tzinfo,
+                      timezone.utc)
+
+        f = compile_format('%H:%M')
+        self.assertEqual(f.parse_datetime('12:30'),
+                         datetime(1900, 1, 1, 12, 30))
+        self.assertEqual(f.parse_time('1:2'), time(1, 2))
+
+    def test_same_as_strptime(self):
+        # Every result and error must be the same as with _strptime.
+        formats = ['%Y-%m-%d', '%m%d%Y', '%Y%m%d%H%M%S%f', '%y%j',
+                   '%Y %j %H', '%d/%m/%y %H:%M', '%H:%M:%S', '%z',
+                   '%Y %z', '%Y-%m-%d %H', '%Y%%%m', 'T%YZ%m', '%M%S',
+                   '%Y-%m-%d %H:%M:%S.%f%z', '%b %Y', '%Y-%m-%dé']
+        strings = ['2024-02-29', '2023-02-29', '110', '1102024', '0000-01-01',
+                   '2024 366 1', '2023 366 1', '9999 366 1', '24001',
+                   '20240102030405123', '01/02/03 04:05', ' 5/1/20 1:1',
+                   '23:59:60', '1:2:3', '5959', '+05:30:15.5', '+0530',
+                   '+05:3015', '+0530:15', '+2400', 'Z', 'z', '2024 +99:00',
+                   '2024-01-01 \t 1', '2024%12', 't2024z01', 'Jan 2024',
+                   '2024-01-02 03:04:05.1-05:30', '2024-01-02 03:04:05+0530',
+                   '2024-01-02 03:04:05.1234567+05:30', '2024-01-02é',
+                   '２024-01-01', '2024-01-01x', '']
+
+        def run(func, *args):
+            try:
+                result = func(*args)
+            except ValueError as exc:
+                return ValueError, str(exc)
+            return type(result), result, repr(result)
+
+        for fmt in formats:
+            f = compile_format(fmt)
+            for s in strings:
+                for cls, parse in [(datetime, f.parse_datetime),
+                                   (date, f.parse_date),
+                                   (time, f.parse_time)]:
+                    with self.subTest(fmt=fmt, s=s, cls=cls.__name__):
+                        func = getattr(_strptime,
+                                       '_strptime_datetime_' + cls.__name__)
+                        expected = run(func, cls, s, fmt)
+                        self.assertEqual(run(parse, s), expected)
+                        self.assertEqual(run(cls.strptime, s, fmt), expected)
+
+    def test_day_without_year(self):
+        f = compile_format('%m-%d')
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(f.parse_date('02-03'), date(1900, 2, 3))
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            compile_format(b'%Y')
+        f = compile_format('%Y')
+        with self.assertRaises(TypeError):
+            f.parse_datetime(b'2024')
+        with self.assertRaisesRegex(ValueError, 'does not match format'):
+            f.parse_datetime('x')
+        with self.assertRaisesRegex(ValueError, 'unconverted data remains'):
+            f.parse_datetime('20245')
+        with self.assertRaisesRegex(ValueError, 'bad directive'):
+            compile_format('%Y%Q').parse_datetime('2024')
+        with self.assertRaisesRegex(ValueError, 'Inconsistent use of :'):
+            compile_format('%z').parse_time('+05:3000')
+
+    def test_repr_and_pickle(self):
+        f = compile_format('%Y-%m-%d')
+        self.assertEqual(repr(f), "datetime.compile_format('%Y-%m-%d')")
+        for pickler, unpickler, proto in pickle_choices:
+            g = unpickler.loads(pickler.dumps(f, proto))
+            self.assertEqual(g.format, f.format)
+            self.assertEqual(g.parse_date('2024-01-02'), date(2024, 1, 2))
+        with self.assertRaises(AttributeError):
+            f.format = '%Y'
+
+
 class SubclassDate(date):
     sub_var = 1
 
@@ -788,6 +788,40 @@ def test_replace_overflow(self):
         self.checkraises(OverflowError, A2_16, "replace", "A", A2_16)
         self.checkraises(OverflowError, A2_16, "replace", "AA", A2_16+A2_16)
 
+    def test_replace_many(self):
+        EQ = self.checkequal
+
+        EQ('', '', 'replace_many', {'a': 'b'})
+        EQ('abc', 'abc', 'replace_many', {})
+        EQ('abc', 'abc', 'replace_many', {'x': 'y'})
+        EQ('xbc', 'abc', 'replace_many', {'a': 'x'})
+        EQ('xbx', 'aba', 'replace_many', {'a': 'x'})
+        EQ('dog and cat', 'cat and dog', 'replace_many',
+           {'cat': 'dog', 'dog': 'cat'})
+        EQ('bbbb', 'aa', 'replace_many', {'a': 'bb', 'b': 'a'})
+        EQ('', 'aaa', 'replace_many', {'a': ''})
+
+        # the leftmost match wins, then the longest one
+        EQ('X', 'abcd', 'replace_many', {'abcd': 'X', 'bc': 'Y'})
+        EQ('aYd', 'abcd', 'replace_many', {'abcde': 'X', 'bc': 'Y'})
+        EQ('XYd', 'abcd', 'replace_many', {'ab': 'X', 'bc': 'Z', 'c': 'Y'})
+        EQ('1c', 'abc', 'replace_many', {'a': '2', 'ab': '1', 'b': '3'})
+        EQ('a1', 'aab', 'replace_many', {'ab': '1', 'aabx': '2'})
+        EQ('he said HELLO, hi', 'he said hello, hi', 'replace_many',
+           {'hello': 'HELLO', 'hell': 'HELL', 'ell': 'ELL'})
+        EQ('xxx', 'aaaaaa', 'replace_many', {'aa': 'x', 'a': '-'})
+        EQ('xx-', 'aaaaa', 'replace_many', {'aa': 'x', 'a': '-'})
+        EQ('[a] <b> c', 'a b c', 'replace_many',
+           {'a': '[a]', 'b': '<b>', '<': 'lt'})
+        EQ('x' * 200, 'ab' * 100, 'replace_many', {'ab': 'xx', 'ba': 'y'})
+
+        self.checkraises(ValueError, 'abc', 'replace_many', {'': 'x'})
+        self.checkraises(ValueError, 'abc', 'replace_many', {'a': 'x', '': ''})
+        self.checkraises(TypeError, 'abc', 'replace_many', [('a', 'x')])
+        self.checkraises(TypeError, 'abc', 'replace_many', {42: 'x'})
+        self.checkraises(TypeError, 'abc', 'replace_many', {'a': 42})
+        self.checkraises(TypeError, 'abc', 'replace_many')
+
     def test_removeprefix(self):
         self.checkequal('am', 'spam', 'removeprefix', 'sp')
         self.checkequal('spamspam', 'spamspamspam', 'removeprefix', 'spam')
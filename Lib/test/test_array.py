@@ -3,6 +3,7 @@
 """
 
 import collections.abc
+import math
 import unittest
 from test import support
 from test.support import import_helper
@@ -1203,6 +1204,42 @@ def test_free_after_iterating(self):
         support.check_free_after_iterating(self, reversed, array.array,
                                            (self.typecode,))
 
+    def test_take(self):
+        a = array.array(self.typecode, self.example)
+        n = len(a)
+        self.assertEqual(a.take([]), array.array(self.typecode))
+        self.assertEqual(a.take([0, n - 1, -1, 1]),
+                         array.array(self.typecode,
+                                     [a[0], a[n - 1], a[-1], a[1]]))
+        self.assertEqual(a.take(range(n)), a)
+        self.assertEqual(a.take(array.array('B', [1, 0])),
+                         array.array(self.typecode, [a[1], a[0]]))
+        self.assertEqual(a.take(array.array('q', [-1])),
+                         array.array(self.typecode, [a[-1]]))
+        self.assertRaises(IndexError, a.take, [n])
+        self.assertRaises(IndexError, a.take, [-n - 1])
+        self.assertRaises(IndexError, a.take, array.array('Q', [2**64 - 1]))
+        self.assertRaises(IndexError, a.take, [2**100])
+        self.assertRaises(TypeError, a.take, [0.0])
+        self.assertRaises(TypeError, a.take, array.array('d', [0]))
+        self.assertRaises(TypeError, a.take, 0)
+
+    def test_compress(self):
+        a = array.array(self.typecode, self.example)
+        n = len(a)
+        self.assertEqual(a.compress([1] * n), a)
+        self.assertEqual(a.compress([0] * n), array.array(self.typecode))
+        mask = [i % 2 for i in range(n)]
+        expected = array.array(self.typecode, a[1::2])
+        self.assertEqual(a.compress(mask), expected)
+        self.assertEqual(a.compress(array.array('B', mask)), expected)
+        self.assertEqual(a.compress(array.array('d', mask)), expected)
+        self.assertEqual(a.compress(iter(map(bool, mask))), expected)
+        self.assertRaises(ValueError, a.compress, [1] * (n + 1))
+        self.assertRaises(ValueError, a.compress, array.array('B'))
+        self.assertRaises(TypeError, a.compress, 1)
+
+
 class StringTest(BaseTest):
 
     def test_setitem(self):
@@ -1210,6 +1247,14 @@ def test_setitem(self):
         a = array.array(self.typecode, self.example)
         self.assertRaises(TypeError, a.__setitem__, 0, self.example[:2])
 
+    def test_numeric_methods(self):
+        a = array.array(self.typecode, self.example)
+        for name in 'sum', 'min', 'max':
+            self.assertRaises(TypeError, getattr(a, name))
+        for name in 'add', 'sub', 'mul', 'iadd', 'isub', 'imul', 'dot':
+            self.assertRaises(TypeError, getattr(a, name), a)
+        self.assertRaises(TypeError, a.compare, '==', a)
+
 class UnicodeTest(StringTest, unittest.TestCase):
     typecode = 'u'
     example = '\x01\u263a\x00\ufeff'
@@ -1359,6 +1404,105 @@ def test_frombytearray(self):
         b = array.array(self.typecode, a)
         self.assertEqual(a, b)
 
+    def test_arithmetic(self):
+        a = array.array(self.typecode, [3, 4, 5, 6])
+        b = array.array(self.typecode, [1, 2, 3, 4])
+        self.assertEqual(a.add(b), array.array(self.typecode, [4, 6, 8, 10]))
+        self.assertEqual(a.sub(b), array.array(self.typecode, [2, 2, 2, 2]))
+        self.assertEqual(a.mul(b), array.array(self.typecode, [3, 8, 15, 24]))
+        self.assertEqual(a.add(1), array.array(self.typecode, [4, 5, 6, 7]))
+        self.assertEqual(a.sub(3), array.array(self.typecode, [0, 1, 2, 3]))
+        self.assertEqual(a.mul(2), array.array(self.typecode, [6, 8, 10, 12]))
+        self.assertEqual(a.add(a), a.mul(2))
+        self.assertEqual(a, array.array(self.typecode, [3, 4, 5, 6]))
+        empty = array.array(self.typecode)
+        self.assertEqual(empty.add(empty), empty)
+        self.assertEqual(empty.mul(2), empty)
+
+        class Sub(array.array):
+            pass
+        c = Sub(self.typecode, [1, 2])
+        self.assertIs(type(c.add(c)), array.array)
+
+    def test_inplace_arithmetic(self):
+        a = array.array(self.typecode, [3, 4, 5, 6])
+        b = array.array(self.typecode, [1, 2, 3, 4])
+        self.assertIsNone(a.iadd(b))
+        self.assertEqual(a, array.array(self.typecode, [4, 6, 8, 10]))
+        self.assertIsNone(a.isub(b))
+        self.assertEqual(a, array.array(self.typecode, [3, 4, 5, 6]))
+        self.assertIsNone(a.imul(2))
+        self.assertEqual(a, array.array(self.typecode, [6, 8, 10, 12]))
+        a.isub(a)
+        self.assertEqual(a, array.array(self.typecode, [0, 0, 0, 0]))
+        # Works while a buffer is exported, since the size does not change
+        a = array.array(self.typecode, [1, 2])
+        with memoryview(a):
+            a.iadd(1)
+        self.assertEqual(a, array.array(self.typecode, [2, 3]))
+
+    def othertypecode(self):
+        # Return another numeric typecode
+        return 'd' if self.typecode != 'd' else 'b'
+
+    def test_arithmetic_errors(self):
+        a = array.array(self.typecode, [1, 2, 3])
+        for name in 'add', 'sub', 'mul', 'iadd', 'isub', 'imul':
+            method = getattr(a, name)
+            self.assertRaises(ValueError, method,
+                              array.array(self.typecode, [1, 2]))
+            self.assertRaises(TypeError, method,
+                              array.array(self.othertypecode(), [1, 2, 3]))
+            self.assertRaises(TypeError, method, [1, 2, 3])
+            self.assertRaises(TypeError, method, 'x')
+            self.assertRaises(TypeError, method)
+        self.assertEqual(a, array.array(self.typecode, [1, 2, 3]))
+
+    def test_compare(self):
+        a = array.array(self.typecode, [1, 2, 3])
+        b = array.array(self.typecode, [3, 2, 1])
+        def mask(*values):
+            return array.array('B', values)
+        self.assertEqual(a.compare('<', b), mask(1, 0, 0))
+        self.assertEqual(a.compare('<=', b), mask(1, 1, 0))
+        self.assertEqual(a.compare('==', b), mask(0, 1, 0))
+        self.assertEqual(a.compare('!=', b), mask(1, 0, 1))
+        self.assertEqual(a.compare('>', b), mask(0, 0, 1))
+        self.assertEqual(a.compare('>=', b), mask(0, 1, 1))
+        self.assertEqual(a.compare('>=', 2), mask(0, 1, 1))
+        self.assertEqual(a.compress(a.compare('!=', 2)),
+                         array.array(self.typecode, [1, 3]))
+        self.assertEqual(array.array(self.typecode).compare('<', 1),
+                         array.array('B'))
+        self.assertRaises(ValueError, a.compare, '<>', b)
+        self.assertRaises(ValueError, a.compare, '<', b[:2])
+        self.assertRaises(TypeError, a.compare, '<', 'x')
+        self.assertRaises(TypeError, a.compare, b'<', b)
+
+    def test_sum_min_max(self):
+        a = array.array(self.typecode, [3, 1, 4, 1, 5, 9, 2, 6])
+        self.assertEqual(a.sum(), 31)
+        self.assertEqual(a.min(), 1)
+        self.assertEqual(a.max(), 9)
+        self.assertEqual(type(a.sum()), type(a[0]))
+        self.assertEqual(type(a.max()), type(a[0]))
+        self.assertEqual(array.array(self.typecode).sum(), 0)
+        self.assertRaises(ValueError, array.array(self.typecode).min)
+        self.assertRaises(ValueError, array.array(self.typecode).max)
+
+    def test_dot(self):
+        a = array.array(self.typecode, [1, 2, 3])
+        b = array.array(self.typecode, [4, 5, 6])
+        self.assertEqual(a.dot(b), 32)
+        self.assertEqual(a.dot(a), 14)
+        self.assertEqual(array.array(self.typecode).dot(
+                         array.array(self.typecode)), 0)
+        self.assertRaises(ValueError, a.dot, b[:2])
+        self.assertRaises(TypeError, a.dot, [4, 5, 6])
+        self.assertRaises(TypeError, a.dot, 2)
+        self.assertRaises(TypeError, a.dot,
+                          array.array(self.othertypecode(), [4, 5, 6]))
+
 class IntegerNumberTest(NumberTest):
     def test_type_error(self):
         a = array.array(self.typecode)
@@ -1393,6 +1537,35 @@ def test_overflow(self):
         self.check_overflow(lower, upper)
         self.check_overflow(Intable(lower), Intable(upper))
 
+    def test_arithmetic_overflow(self):
+        a = array.array(self.typecode)
+        lower = -1 * int(pow(2, a.itemsize * 8 - 1))
+        upper = int(pow(2, a.itemsize * 8 - 1)) - 1
+        a = array.array(self.typecode, [0, upper])
+        self.assertRaises(OverflowError, a.add, 1)
+        self.assertRaises(OverflowError, a.mul, 2)
+        self.assertRaises(OverflowError, a.mul, -2)
+        self.assertEqual(a.mul(-1), array.array(self.typecode, [0, -upper]))
+        self.assertRaises(OverflowError, a.iadd, 1)
+        self.assertEqual(a, array.array(self.typecode, [0, upper]))
+        a = array.array(self.typecode, [lower, -1])
+        self.assertRaises(OverflowError, a.sub, 1)
+        self.assertRaises(OverflowError, a.mul, -1)
+        self.assertRaises(OverflowError, a.isub, array.array(self.typecode, [1, 0]))
+        self.assertEqual(a, array.array(self.typecode, [lower, -1]))
+        self.assertRaises(OverflowError, a.add, upper + 1)
+
+    def test_sum_exact(self):
+        a = array.array(self.typecode)
+        lower = -1 * int(pow(2, a.itemsize * 8 - 1))
+        upper = int(pow(2, a.itemsize * 8 - 1)) - 1
+        values = [upper] * 5 + [lower] * 3 + [upper] * 4
+        a = array.array(self.typecode, values)
+        self.assertEqual(a.sum(), sum(values))
+        self.assertEqual(a.dot(a), sum(x * x for x in values))
+        self.assertEqual(a.min(), lower)
+        self.assertEqual(a.max(), upper)
+
 class UnsignedNumberTest(IntegerNumberTest):
     example = [0, 1, 17, 23, 42, 0xff]
     smallerexample = [0, 1, 17, 23, 42, 0xfe]
@@ -1406,6 +1579,28 @@ def test_overflow(self):
         self.check_overflow(lower, upper)
         self.check_overflow(Intable(lower), Intable(upper))
 
+    def test_arithmetic_overflow(self):
+        a = array.array(self.typecode)
+        upper = int(pow(2, a.itemsize * 8)) - 1
+        a = array.array(self.typecode, [1, upper])
+        self.assertRaises(OverflowError, a.add, 1)
+        self.assertRaises(OverflowError, a.mul, 2)
+        self.assertRaises(OverflowError, a.sub, 2)
+        self.assertRaises(OverflowError, a.mul, -1)
+        self.assertRaises(OverflowError, a.imul, 2)
+        self.assertEqual(a, array.array(self.typecode, [1, upper]))
+        self.assertEqual(a.sub(1), array.array(self.typecode, [0, upper - 1]))
+
+    def test_sum_exact(self):
+        a = array.array(self.typecode)
+        upper = int(pow(2, a.itemsize * 8)) - 1
+        values = [upper] * 7 + [0, 1]
+        a = array.array(self.typecode, values)
+        self.assertEqual(a.sum(), sum(values))
+        self.assertEqual(a.dot(a), sum(x * x for x in values))
+        self.assertEqual(a.min(), 0)
+        self.assertEqual(a.max(), upper)
+
     def test_bytes_extend(self):
         s = bytes(self.example)
 
@@ -1483,6 +1678,33 @@ def test_nan(self):
         self.assertIs(a < b, False)
         self.assertIs(a <= b, False)
 
+    def test_sum_accuracy(self):
+        a = array.array(self.typecode, [0.5, 2.0**53, -2.0**53, 0.25] * 3)
+        self.assertEqual(a.sum(), 2.25)
+        self.assertEqual(a.sum(), sum(a))
+        self.assertEqual(array.array(self.typecode).sum(), 0.0)
+        self.assertIsInstance(array.array(self.typecode).sum(), float)
+        a = array.array(self.typecode, [0.5, 2.0])
+        self.assertEqual(a.dot(a), 4.25)
+
+    def test_nan_min_max(self):
+        nan = float('nan')
+        a = array.array(self.typecode, [nan, 1.0, -1.0])
+        self.assertTrue(math.isnan(a.min()))
+        self.assertTrue(math.isnan(a.max()))
+        a = array.array(self.typecode, [1.0, nan, -1.0])
+        self.assertEqual(a.min(), min(a))
+        self.assertEqual(a.max(), max(a))
+        self.assertEqual(a.compare('==', a), array.array('B', [1, 0, 1]))
+        self.assertEqual(a.compare('!=', a), array.array('B', [0, 1, 0]))
+
+    def test_float_arithmetic(self):
+        a = array.array(self.typecode, [0.5, -1.5, 2.0])
+        self.assertEqual(a.mul(0.5), array.array(self.typecode, [0.25, -0.75, 1.0]))
+        self.assertEqual(a.add(1), array.array(self.typecode, [1.5, -0.5, 3.0]))
+        a.isub(a)
+        self.assertEqual(a, array.array(self.typecode, [0.0, 0.0, 0.0]))
+
     def test_byteswap(self):
         a = array.array(self.typecode, self.example)
         self.assertRaises(TypeError, a.byteswap, 42)
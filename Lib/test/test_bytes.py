@@ -2093,6 +2093,11 @@ class FixedStringTest(test.string_tests.BaseTest):
     def fixtype(self, obj):
         if isinstance(obj, str):
             return self.type2test(obj.encode("utf-8"))
+        if isinstance(obj, dict):
+            # bytearray is not hashable
+            return {key.encode("utf-8") if isinstance(key, str) else key:
+                    self.fixtype(value)
+                    for key, value in obj.items()}
         return super().fixtype(obj)
 
     contains_bytes = True
@@ -1,12 +1,14 @@
 """
 Tests PyConfig_Get() and PyConfig_Set() C API (PEP 741).
 """
+import os
 import sys
 import sysconfig
 import types
 import unittest
 from test import support
-from test.support import import_helper
+from test.support import import_helper, os_helper
+from test.support.script_helper import assert_python_ok
 
 _testcapi = import_helper.import_module('_testcapi')
 
@@ -93,6 +95,7 @@ def test_config_get(self):
             ("user_site_directory", bool, None),
             ("utf8_mode", bool, None),
             ("verbose", int, None),
+            ("warmup_profile", str | None, None),
             ("warn_default_encoding", bool, None),
             ("warnoptions", list[str], "warnoptions"),
             ("write_bytecode", bool, None),
@@ -203,6 +206,19 @@ def test_config_get_non_existent(self):
         with self.assertRaisesRegex(ValueError, err_msg):
             config_get(nonexistent_key)
 
+    def test_config_get_warmup_profile(self):
+        # PYTHON_WARMUP_PROFILE sets warmup_profile, unless -E is used
+        filename = os.path.abspath(os_helper.TESTFN)
+        self.addCleanup(os_helper.unlink, filename)
+        code = ("import _testcapi; "
+                "print(_testcapi.config_get('warmup_profile'))")
+        rc, out, err = assert_python_ok('-c', code,
+                                        PYTHON_WARMUP_PROFILE=filename)
+        self.assertEqual(os.fsdecode(out.rstrip()), filename)
+        rc, out, err = assert_python_ok('-E', '-c', code,
+                                        PYTHON_WARMUP_PROFILE=filename)
+        self.assertEqual(out.rstrip(), b'None')
+
     def test_config_get_write_bytecode(self):
         # PyConfig_Get("write_bytecode") gets sys.dont_write_bytecode
         # as an integer
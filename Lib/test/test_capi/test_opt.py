@@ -1,5 +1,7 @@
 import contextlib
+import dis
 import itertools
+import marshal
 import sys
 import textwrap
 import unittest
@@ -10,7 +12,7 @@
 
 from test.support import (script_helper, requires_specialization,
                           import_helper, Py_GIL_DISABLED, requires_jit_enabled,
-                          reset_code)
+                          reset_code, os_helper)
 
 _testinternalcapi = import_helper.import_module("_testinternalcapi")
 
@@ -116,6 +118,114 @@ def f():
         self.assertIsNone(exe)
 
 
+@requires_specialization
+@unittest.skipIf(Py_GIL_DISABLED, "optimizer not yet supported in free-threaded builds")
+@requires_jit_enabled
+class TestWarmupProfile(unittest.TestCase):
+
+    LOOP_SRC = textwrap.dedent("""
+        def loop(n):
+            for _ in range(n):
+                pass
+    """)
+
+    def setUp(self):
+        self.addCleanup(sys._set_warmup_profile, sys._get_warmup_profile())
+
+    def make_loop(self, filename):
+        ns = {}
+        exec(compile(self.LOOP_SRC, filename, "exec"), ns, ns)
+        return ns["loop"]
+
+    def get_entry(self, func):
+        code = func.__code__
+        offset = next(instr.offset for instr in dis.get_instructions(code)
+                      if instr.opname == "JUMP_BACKWARD")
+        return (code.co_filename, code.co_qualname, code.co_firstlineno, offset)
+
+    def test_record(self):
+        sys._set_warmup_profile([])
+        f = self.make_loop("<warmup-record>")
+        f(TIER2_THRESHOLD)
+        self.assertIsNotNone(get_first_executor(f))
+        self.assertEqual(sys._get_warmup_profile(), [self.get_entry(f)])
+
+    def test_disabled(self):
+        sys._set_warmup_profile(None)
+        f = self.make_loop("<warmup-disabled>")
+        f(TIER2_THRESHOLD)
+        self.assertIsNotNone(get_first_executor(f))
+        self.assertIsNone(sys._get_warmup_profile())
+        g = self.make_loop("<warmup-disabled>")
+        g(50)
+        self.assertIsNone(get_first_executor(g))
+
+    def test_apply(self):
+        f = self.make_loop("<warmup-apply>")
+        sys._set_warmup_profile([self.get_entry(f)])
+        self.assertEqual(sys._get_warmup_profile(), [self.get_entry(f)])
+        # Code objects created after the profile was set are primed
+        g = self.make_loop("<warmup-apply>")
+        g(50)
+        self.assertIsNotNone(get_first_executor(g))
+        f(50)
+        self.assertIsNone(get_first_executor(f))
+        # Entries for other code are ignored
+        h = self.make_loop("<warmup-other>")
+        h(50)
+        self.assertIsNone(get_first_executor(h))
+
+    def test_set_invalid(self):
+        with self.assertRaises(TypeError):
+            sys._set_warmup_profile(42)
+        with self.assertRaises(TypeError):
+            sys._set_warmup_profile([("file", "qualname", 1)])
+        with self.assertRaises(TypeError):
+            sys._set_warmup_profile([("file", "qualname", "1", 2)])
+        # Stale or bogus offsets are ignored
+        f = self.make_loop("<warmup-invalid>")
+        sys._set_warmup_profile([(*self.get_entry(f)[:3], offset)
+                                 for offset in (-2, 1, 0, 10**6)])
+        g = self.make_loop("<warmup-invalid>")
+        g(50)
+        self.assertIsNone(get_first_executor(g))
+
+    def test_environment_variable(self):
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        code = self.LOOP_SRC + textwrap.dedent("""
+            import _opcode
+            loop({n})
+            def has_executor(code):
+                for i in range(0, len(code.co_code), 2):
+                    try:
+                        _opcode.get_executor(code, i)
+                    except ValueError:
+                        pass
+                    else:
+                        return True
+                return False
+            print(has_executor(loop.__code__))
+        """)
+        # Loops that got hot are saved to the profile at exit
+        res = script_helper.assert_python_ok(
+            "-c", code.format(n=TIER2_THRESHOLD),
+            PYTHON_WARMUP_PROFILE=filename)
+        self.assertEqual(res.out.strip(), b"True")
+        with open(filename, "rb") as f:
+            profile = marshal.load(f)
+        self.assertTrue(any(entry[:2] == ("<string>", "loop")
+                            for entry in profile))
+        # ... and primed in the next run
+        res = script_helper.assert_python_ok(
+            "-c", code.format(n=50),
+            PYTHON_WARMUP_PROFILE=filename)
+        self.assertEqual(res.out.strip(), b"True")
+        res = script_helper.assert_python_ok(
+            "-c", code.format(n=50))
+        self.assertEqual(res.out.strip(), b"False")
+
+
 @requires_specialization
 @unittest.skipIf(Py_GIL_DISABLED, "optimizer not yet supported in free-threaded builds")
 @requires_jit_enabled
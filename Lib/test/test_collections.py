@@ -18,6 +18,7 @@
 from collections import namedtuple, Counter, OrderedDict, _count_elements
 from collections import UserDict, UserString, UserList
 from collections import ChainMap
+from collections import SortedList, SortedDict, SortedSet
 from collections import deque
 from collections.abc import Awaitable, Coroutine
 from collections.abc import AsyncIterator, AsyncIterable, AsyncGenerator
@@ -699,6 +700,20 @@ def test_new_builtins_issue_43102(self):
         self.assertEqual(new_func.__globals__['__builtins__'], {})
         self.assertEqual(new_func.__builtins__, {})
 
+    def test_new_signature(self):
+        # Named tuples with the same number of fields share the code of
+        # __new__, make sure each one gets its own argument names.
+        Point = namedtuple('Point', 'x y', defaults=[0])
+        Pair = namedtuple('Pair', 'first second')
+        self.assertEqual(str(inspect.signature(Point)), '(x, y=0)')
+        self.assertEqual(str(inspect.signature(Pair)), '(first, second)')
+        self.assertEqual(Point(y=2, x=1), (1, 2))
+        self.assertEqual(Pair(second=2, first=1), (1, 2))
+        with self.assertRaisesRegex(TypeError, "'second'"):
+            Pair(1)
+        with self.assertRaisesRegex(TypeError, "'z'"):
+            Point(1, z=2)
+
     def test_match_args(self):
         Point = namedtuple('Point', 'x y')
         self.assertEqual(Point.__match_args__, ('x', 'y'))
@@ -2377,6 +2392,345 @@ def test_gt(self):
         self.assertFalse(Counter(a=2, b=1, c=0) > Counter('aab'))
 
 
+class TestSortedList(unittest.TestCase):
+
+    def check(self, sl, expected):
+        self.assertEqual(list(sl), expected)
+        self.assertEqual(len(sl), len(expected))
+        self.assertEqual(list(reversed(sl)), expected[::-1])
+
+    def test_basics(self):
+        sl = SortedList([5, 1, 4, 1, 3])
+        self.check(sl, [1, 1, 3, 4, 5])
+        sl.add(2)
+        self.check(sl, [1, 1, 2, 3, 4, 5])
+        self.assertIn(4, sl)
+        self.assertNotIn(6, sl)
+        self.assertEqual(sl[0], 1)
+        self.assertEqual(sl[-1], 5)
+        self.assertEqual(sl[1:4], [1, 2, 3])
+        self.assertEqual(sl[::-2], [5, 3, 1])
+        self.assertRaises(IndexError, sl.__getitem__, 6)
+        self.assertRaises(TypeError, sl.__getitem__, 'a')
+        self.assertEqual(sl.count(1), 2)
+        self.assertEqual(sl.count(7), 0)
+        self.assertEqual(sl.index(3), 3)
+        self.assertEqual(sl.index(1, 1), 1)
+        self.assertRaises(ValueError, sl.index, 1, 2)
+        self.assertRaises(ValueError, sl.index, 1, 0, -6)
+        self.assertRaises(ValueError, sl.index, 6)
+        self.assertEqual(sl.bisect_left(3), 3)
+        self.assertEqual(sl.bisect_right(3), 4)
+        self.assertEqual(sl.bisect_left(0), 0)
+        self.assertEqual(sl.bisect_right(9), 6)
+        sl.remove(1)
+        sl.discard(3)
+        sl.discard(3)
+        self.check(sl, [1, 2, 4, 5])
+        self.assertRaises(ValueError, sl.remove, 3)
+        self.assertEqual(sl.pop(), 5)
+        self.assertEqual(sl.pop(0), 1)
+        self.check(sl, [2, 4])
+        del sl[0]
+        self.check(sl, [4])
+        sl.clear()
+        self.check(sl, [])
+        self.assertRaises(IndexError, sl.pop)
+        self.assertRaises(TypeError, sl.__setitem__, 0, 1)
+        self.assertRaises(TypeError, hash, sl)
+        self.assertIsInstance(sl, Sequence)
+        self.assertNotIsInstance(sl, MutableSequence)
+
+    def test_key(self):
+        sl = SortedList(['bb', 'a', 'ccc', 'd', 'ee'], key=len)
+        self.assertIs(sl.key, len)
+        self.assertIsNone(SortedList().key)
+        self.check(sl, ['a', 'd', 'bb', 'ee', 'ccc'])
+        sl.add('ff')
+        self.check(sl, ['a', 'd', 'bb', 'ee', 'ff', 'ccc'])
+        self.assertIn('ee', sl)
+        self.assertNotIn('xx', sl)
+        self.assertEqual(sl.index('ff'), 4)
+        self.assertEqual(sl.count('ee'), 1)
+        self.assertEqual(sl.bisect_left('xx'), 2)
+        self.assertEqual(sl.bisect_right('xx'), 5)
+        sl.remove('ee')
+        self.check(sl, ['a', 'd', 'bb', 'ff', 'ccc'])
+        self.assertRaises(ValueError, sl.remove, 'xx')
+        self.assertRaises(TypeError, SortedList, [], key=1)
+
+    def test_irange(self):
+        sl = SortedList(range(10))
+        self.assertEqual(list(sl.irange()), list(range(10)))
+        self.assertEqual(list(sl.irange(3, 6)), [3, 4, 5, 6])
+        self.assertEqual(list(sl.irange(3, 6, inclusive=(False, False))),
+                         [4, 5])
+        self.assertEqual(list(sl.irange(3, 6, reverse=True)), [6, 5, 4, 3])
+        self.assertEqual(list(sl.irange(minimum=7)), [7, 8, 9])
+        self.assertEqual(list(sl.irange(maximum=2)), [0, 1, 2])
+        self.assertEqual(list(sl.irange(6, 3)), [])
+        self.assertEqual(list(sl.irange(2.5, 3.5)), [3])
+        self.assertRaises(TypeError, sl.irange, 1, 2, True)
+        sl = SortedList(['bb', 'a', 'ccc', 'd'], key=len)
+        self.assertEqual(list(sl.irange('x', 'xx')), ['a', 'd', 'bb'])
+
+    def test_large(self):
+        # Exercise the splitting and merging of the sublists
+        values = [randrange(1000) for i in range(20000)]
+        sl = SortedList()
+        ref = []
+        for i, value in enumerate(values):
+            sl.add(value)
+            ref.append(value)
+        ref.sort()
+        self.check(sl, ref)
+        for i in range(0, len(ref), 997):
+            self.assertEqual(sl[i], ref[i])
+            self.assertEqual(sl.bisect_left(ref[i]), ref.index(ref[i]))
+        self.assertEqual(sl[5000:15000:7], ref[5000:15000:7])
+        self.assertEqual(list(sl.irange(100, 200)),
+                         [x for x in ref if 100 <= x <= 200])
+        del sl[100:18000:3]
+        del ref[100:18000:3]
+        self.check(sl, ref)
+        for value in ref[::2]:
+            sl.remove(value)
+            ref.remove(value)
+        self.check(sl, ref)
+        while sl:
+            self.assertEqual(sl.pop(len(sl) // 2), ref.pop(len(ref) // 2))
+        self.check(sl, [])
+
+    def test_update(self):
+        sl = SortedList([3, 1])
+        sl.update([2, 5, 4])
+        self.check(sl, [1, 2, 3, 4, 5])
+        sl.update(range(100, 200))
+        sl.update([0])
+        sl.update(sl)
+        self.assertEqual(len(sl), 212)
+        self.assertEqual(sl[:6], [0, 0, 1, 1, 2, 2])
+        sl = SortedList('cab', key=str.upper)
+        sl.update('DbE')
+        self.check(sl, ['a', 'b', 'b', 'c', 'D', 'E'])
+
+    def test_copy_and_pickle(self):
+        sl = SortedList([3, 1, 2])
+        for copied in (sl.copy(), copy.copy(sl), copy.deepcopy(sl)):
+            self.assertIsNot(copied, sl)
+            self.assertEqual(copied, sl)
+            copied.add(0)
+            self.check(sl, [1, 2, 3])
+        sl = SortedList(['bb', 'a'], key=len)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                loaded = pickle.loads(pickle.dumps(sl, proto))
+                self.assertEqual(loaded, sl)
+                self.assertIs(loaded.key, len)
+        self.assertEqual(repr(sl), "SortedList(['a', 'bb'], key=<built-in function len>)")
+        self.assertEqual(repr(SortedList([2, 1])), 'SortedList([1, 2])')
+
+    def test_comparison(self):
+        self.assertEqual(SortedList([2, 1]), SortedList([1, 2]))
+        self.assertLess(SortedList([1, 2]), SortedList([1, 3]))
+        self.assertNotEqual(SortedList([1, 2]), [1, 2])
+
+    def test_mutation_during_iteration(self):
+        sl = SortedList(range(5))
+        it = iter(sl)
+        next(it)
+        sl.add(10)
+        self.assertRaises(RuntimeError, next, it)
+
+    def test_mutation_during_comparison(self):
+        sl = SortedList()
+        class Evil:
+            def __init__(self, value):
+                self.value = value
+            def __lt__(self, other):
+                sl.clear()
+                return self.value < other.value
+        sl.add(Evil(1))
+        self.assertRaises(RuntimeError, sl.add, Evil(2))
+        sl = SortedList(range(100), key=lambda x: sl.clear() or x)
+        self.assertRaises(RuntimeError, sl.add, 1)
+
+    def test_incomparable(self):
+        sl = SortedList([1, 2, 3])
+        self.assertRaises(TypeError, sl.add, 'a')
+        self.assertRaises(TypeError, sl.update, ['a', 'b'])
+        self.check(sl, [1, 2, 3])
+
+
+class TestSortedDict(unittest.TestCase):
+
+    def test_basics(self):
+        d = SortedDict({'c': 3, 'a': 1}, b=2)
+        self.assertIsInstance(d, dict)
+        self.assertEqual(list(d), ['a', 'b', 'c'])
+        self.assertEqual(list(reversed(d)), ['c', 'b', 'a'])
+        self.assertEqual(list(d.values()), [1, 2, 3])
+        self.assertEqual(list(d.items()), [('a', 1), ('b', 2), ('c', 3)])
+        self.assertEqual(list(reversed(d.items())),
+                         [('c', 3), ('b', 2), ('a', 1)])
+        self.assertEqual(d.keys()[1], 'b')
+        self.assertEqual(d.values()[-1], 3)
+        self.assertEqual(d.items()[:2], [('a', 1), ('b', 2)])
+        self.assertEqual(d, {'a': 1, 'b': 2, 'c': 3})
+        d['aa'] = 0
+        self.assertEqual(list(d), ['a', 'aa', 'b', 'c'])
+        d['aa'] = 5
+        self.assertEqual(d['aa'], 5)
+        self.assertEqual(len(d), 4)
+        del d['a']
+        self.assertEqual(list(d), ['aa', 'b', 'c'])
+        self.assertRaises(KeyError, d.__delitem__, 'a')
+        self.assertEqual(d.pop('b'), 2)
+        self.assertEqual(d.pop('b', None), None)
+        self.assertRaises(KeyError, d.pop, 'b')
+        self.assertEqual(d.setdefault('b', 7), 7)
+        self.assertEqual(d.setdefault('b', 8), 7)
+        self.assertEqual(d.peekitem(), ('c', 3))
+        self.assertEqual(d.peekitem(0), ('aa', 5))
+        self.assertEqual(d.popitem(), ('c', 3))
+        self.assertEqual(d.popitem(0), ('aa', 5))
+        self.assertEqual(list(d), ['b'])
+        d.update({'x': 1, 'a': 2})
+        self.assertEqual(list(d), ['a', 'b', 'x'])
+        self.assertEqual(d.index('x'), 2)
+        self.assertEqual(d.bisect_left('c'), 2)
+        self.assertEqual(list(d.irange('a', 'c')), ['a', 'b'])
+        d.clear()
+        self.assertEqual(list(d), [])
+        self.assertRaises(KeyError, d.popitem)
+
+    def test_key(self):
+        d = SortedDict({3: 'c', 1: 'a', 2: 'b'}, key=operator.neg)
+        self.assertIs(d.key, operator.neg)
+        self.assertEqual(list(d), [3, 2, 1])
+        d2 = d.copy()
+        d2[4] = 'd'
+        self.assertEqual(list(d2), [4, 3, 2, 1])
+        self.assertEqual(list(d), [3, 2, 1])
+        self.assertEqual(list(d | {0: 'z'}), [3, 2, 1, 0])
+        self.assertEqual(list({0: 'z'} | d), [3, 2, 1, 0])
+        d |= {5: 'e'}
+        self.assertEqual(list(d), [5, 3, 2, 1])
+        self.assertEqual(repr(d),
+                         "SortedDict({5: 'e', 3: 'c', 2: 'b', 1: 'a'}, "
+                         "key=<built-in function neg>)")
+
+    def test_copy_and_pickle(self):
+        d = SortedDict({'b': 2, 'a': 1})
+        self.assertEqual(repr(d), "SortedDict({'a': 1, 'b': 2})")
+        for copied in [d.copy(), copy.copy(d), copy.deepcopy(d)]:
+            copied['c'] = 3
+            self.assertEqual(list(copied), ['a', 'b', 'c'])
+            self.assertEqual(list(d), ['a', 'b'])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                loaded = pickle.loads(pickle.dumps(d, proto))
+                self.assertIs(type(loaded), SortedDict)
+                self.assertEqual(list(loaded.items()), [('a', 1), ('b', 2)])
+        d = SortedDict.fromkeys('cab', 0)
+        self.assertIs(type(d), SortedDict)
+        self.assertEqual(list(d), ['a', 'b', 'c'])
+
+    def test_mutation_during_iteration(self):
+        d = SortedDict.fromkeys('abc')
+        with self.assertRaises(RuntimeError):
+            for k in d:
+                d['d'] = None
+
+
+class TestSortedSet(unittest.TestCase):
+
+    def test_basics(self):
+        s = SortedSet('abracadabra')
+        self.assertIsInstance(s, MutableSet)
+        self.assertIsInstance(s, Sequence)
+        self.assertEqual(list(s), ['a', 'b', 'c', 'd', 'r'])
+        self.assertEqual(list(reversed(s)), ['r', 'd', 'c', 'b', 'a'])
+        self.assertEqual(len(s), 5)
+        self.assertIn('c', s)
+        self.assertEqual(s[1], 'b')
+        self.assertEqual(s[1:3], ['b', 'c'])
+        self.assertEqual(s.index('d'), 3)
+        self.assertEqual(s.count('d'), 1)
+        self.assertEqual(s.count('z'), 0)
+        s.add('e')
+        s.add('e')
+        s.discard('b')
+        s.discard('b')
+        self.assertEqual(list(s), ['a', 'c', 'd', 'e', 'r'])
+        self.assertRaises(KeyError, s.remove, 'b')
+        self.assertEqual(s.pop(), 'r')
+        self.assertEqual(s.pop(0), 'a')
+        del s[0]
+        self.assertEqual(list(s), ['d', 'e'])
+        self.assertNotIn('c', s)
+        s.update('xy', 'az')
+        self.assertEqual(list(s), ['a', 'd', 'e', 'x', 'y', 'z'])
+        del s[::2]
+        self.assertEqual(list(s), ['d', 'x', 'z'])
+        self.assertEqual(list(s.irange('b', 'y')), ['d', 'x'])
+        self.assertEqual(s.bisect_right('x'), 2)
+        s.clear()
+        self.assertEqual(list(s), [])
+        self.assertRaises(TypeError, hash, s)
+
+    def test_set_operations(self):
+        s = SortedSet('cab')
+        self.assertEqual(s, {'a', 'b', 'c'})
+        self.assertEqual(s, SortedSet('abc'))
+        self.assertNotEqual(s, ['a', 'b', 'c'])
+        self.assertLessEqual(s, {'a', 'b', 'c', 'd'})
+        for result, expected in [
+            (s | 'dc', 'abcd'), (s & 'dcx', 'c'), (s - 'ax', 'bc'),
+            (s ^ 'cd', 'abd'),
+            (s.union('d', 'e'), 'abcde'),
+            (s.intersection('abx', 'bcy'), 'b'),
+            (s.difference('a', 'c'), 'b'),
+            (s.symmetric_difference('cd'), 'abd'),
+        ]:
+            self.assertIs(type(result), SortedSet)
+            self.assertEqual(list(result), list(expected))
+        self.assertTrue(s.issubset('abcd'))
+        self.assertTrue(s.issuperset('ab'))
+        self.assertTrue(s.isdisjoint('xyz'))
+        s |= 'ed'
+        self.assertEqual(list(s), list('abcde'))
+        s -= 'ab'
+        self.assertEqual(list(s), list('cde'))
+        s &= 'cdx'
+        self.assertEqual(list(s), list('cd'))
+        s ^= 'dz'
+        self.assertEqual(list(s), list('cz'))
+        s = SortedSet(range(100))
+        s.difference_update(range(10, 100))
+        self.assertEqual(list(s), list(range(10)))
+        s.intersection_update(range(5, 20))
+        self.assertEqual(list(s), list(range(5, 10)))
+        s.symmetric_difference_update(range(8, 12))
+        self.assertEqual(list(s), [5, 6, 7, 10, 11])
+
+    def test_key(self):
+        s = SortedSet([3, 1, 2], key=operator.neg)
+        self.assertEqual(list(s), [3, 2, 1])
+        self.assertEqual(list(s | {4}), [4, 3, 2, 1])
+        self.assertEqual(repr(s), 'SortedSet([3, 2, 1], key=<built-in function neg>)')
+        copied = s.copy()
+        copied.add(5)
+        self.assertEqual(list(copied), [5, 3, 2, 1])
+        self.assertEqual(list(s), [3, 2, 1])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                loaded = pickle.loads(pickle.dumps(s, proto))
+                self.assertEqual(list(loaded), [3, 2, 1])
+                self.assertIs(loaded.key, operator.neg)
+        self.assertEqual(list(copy.deepcopy(s)), [3, 2, 1])
+
+
 def load_tests(loader, tests, pattern):
     tests.addTest(doctest.DocTestSuite(collections))
     return tests
@@ -8,6 +8,10 @@
 
 import unittest
 from test import support
+from test.support import import_helper
+
+py_copy = import_helper.import_fresh_module('copy', blocked=['_copy'])
+c_copy = import_helper.import_fresh_module('copy', fresh=['_copy'])
 
 order_comparisons = le, lt, ge, gt
 equality_comparisons = eq, ne
@@ -436,6 +440,53 @@ def test_deepcopy_keepalive(self):
         y = copy.deepcopy(x, memo)
         self.assertIs(memo[id(memo)][0], x)
 
+    def test_deepcopy_memo_seen_by_deepcopy(self):
+        seen = []
+        class C:
+            def __deepcopy__(self, memo):
+                seen.append(memo.get(id(x)))
+                return C()
+        x = [C()]
+        y = copy.deepcopy(x)
+        self.assertIs(seen[0], y)
+
+    def test_deepcopy_dispatch(self):
+        class C:
+            pass
+        def deepcopy_C(x, memo):
+            self.assertIsInstance(memo, dict)
+            return 42
+        with support.swap_item(copy._deepcopy_dispatch, C, deepcopy_C):
+            self.assertEqual(copy.deepcopy([C()]), [42])
+
+    def test_deepcopy_set(self):
+        class C:
+            def __init__(self, foo):
+                self.foo = foo
+        for cls in set, frozenset:
+            with self.subTest(cls=cls):
+                a = C([1])
+                x = cls([a, 2])
+                y = copy.deepcopy(x)
+                self.assertIs(type(y), cls)
+                self.assertIsNot(y, x)
+                self.assertEqual(len(y), 2)
+                self.assertIn(2, y)
+                b, = (item for item in y if item != 2)
+                self.assertIsNot(b, a)
+                self.assertEqual(b.foo, a.foo)
+                self.assertIsNot(b.foo, a.foo)
+                z = copy.deepcopy([x, x])
+                self.assertIs(z[0], z[1])
+
+    def test_deepcopy_dict_changed_size(self):
+        class C:
+            def __deepcopy__(self, memo):
+                x['new'] = 1
+                return C()
+        x = {'a': C(), 'b': 2}
+        self.assertRaises(RuntimeError, copy.deepcopy, x)
+
     def test_deepcopy_dont_memo_immutable(self):
         memo = {}
         x = [1, 2, 3, 4]
@@ -975,9 +1026,19 @@ class C:
             copy.replace(c, x=1, error=2)
 
 
+@unittest.skipIf(c_copy is None, 'requires _copy')
+class TestCopyPy(TestCopy):
+    # TestCopy tests the C implementation if it is available, run the same
+    # tests with the Python implementation.
+
+    def setUp(self):
+        self.enterContext(support.swap_item(globals(), 'copy', py_copy))
+
+
 class MiscTestCase(unittest.TestCase):
     def test__all__(self):
-        support.check__all__(self, copy, not_exported={"dispatch_table", "error"})
+        support.check__all__(self, py_copy,
+                             not_exported={"dispatch_table", "error"})
 
 def global_foo(x, y): return x+y
 
@@ -4,7 +4,7 @@
 import copy
 import sys
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO
 from tempfile import TemporaryFile
 import csv
 import gc
@@ -1042,6 +1042,192 @@ def test_read_semi_sep(self):
         self.assertEqual(next(reader), {"1": '1', "2": '2', "3": 'abc',
                                          "4": '4', "5": '5', "6": '6'})
 
+    def test_read_converters(self):
+        reader = csv.DictReader(["id,price,name\r\n", "1,2.5,abc\r\n",
+                                 "\r\n", "2,,\r\n"],
+                                converters={"id": int, "name": None})
+        self.assertEqual(next(reader), {"id": 1, "price": "2.5", "name": "abc"})
+        self.assertEqual(next(reader), {"id": 2, "price": "", "name": None})
+        self.assertEqual(reader.line_num, 4)
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_read_converters_sequence(self):
+        reader = csv.DictReader(["1,2.5,abc\r\n"], fieldnames=["a", "b", "c"],
+                                converters=[int, float])
+        self.assertEqual(next(reader), {"a": 1, "b": 2.5, "c": "abc"})
+
+    def test_read_converters_unknown_field(self):
+        reader = csv.DictReader(["a,b\r\n", "1,2\r\n"],
+                                converters={"a": int, "c": int})
+        with self.assertRaisesRegex(ValueError, "'c'"):
+            next(reader)
+
+class TestTypedReading(unittest.TestCase):
+    def test_converters(self):
+        reader = csv.reader(["1,2.5,abc,,x", "-3,1e3,,def,y"],
+                            converters=[int, float, str, None])
+        self.assertEqual(reader.converters, [int, float, str, None])
+        self.assertEqual(list(reader), [[1, 2.5, "abc", None, "x"],
+                                        [-3, 1000.0, "", "def", "y"]])
+
+    def test_converters_dict(self):
+        reader = csv.reader(["1,2,3,"], converters={2: int, 3: None})
+        self.assertEqual(next(reader), ["1", "2", 3, None])
+
+    def test_converters_set_later(self):
+        reader = csv.reader(["a,b", "1,2"])
+        self.assertIsNone(reader.converters)
+        self.assertEqual(next(reader), ["a", "b"])
+        reader.converters = (float, str.upper)
+        self.assertEqual(next(reader), [1.0, "2"])
+        reader.converters = None
+        self.assertIsNone(reader.converters)
+
+    def test_converters_match_builtins(self):
+        fields = ["0", "-12", "+7", "007", " 12 ", "1_000", "\u0661\u0662",
+                  "123456789012345678901234567890", "1.5", "", "x", "1e5",
+                  "-.5", "5.", "nan", "-inf", "1e999", "1.5e", "e5", "1__0"]
+        for field in fields:
+            for converter in int, float:
+                with self.subTest(field=field, converter=converter):
+                    reader = csv.reader([field + ","], converters=[converter],
+                                        quoting=csv.QUOTE_NONE)
+                    try:
+                        expected = converter(field)
+                    except ValueError as e:
+                        with self.assertRaises(ValueError) as cm:
+                            next(reader)
+                        self.assertEqual(str(cm.exception), str(e))
+                    else:
+                        self.assertEqual(repr(next(reader)),
+                                         repr([expected, ""]))
+
+    def test_converters_override_quoting(self):
+        reader = csv.reader(['1,"2",3'], quoting=csv.QUOTE_NONNUMERIC,
+                            converters=[int, str])
+        self.assertEqual(next(reader), [1, "2", 3.0])
+
+    def test_converter_error(self):
+        def converter(field):
+            raise ZeroDivisionError
+        reader = csv.reader(["1,2"], converters=[str, converter])
+        self.assertRaises(ZeroDivisionError, next, reader)
+
+    def test_bad_converters(self):
+        self.assertRaises(TypeError, csv.reader, [], converters=1)
+        self.assertRaises(TypeError, csv.reader, [], converters=[int, 1])
+        self.assertRaises(TypeError, csv.reader, [], converters={"a": int})
+        self.assertRaises(ValueError, csv.reader, [], converters={-1: int})
+
+    def test_bytes(self):
+        lines = ["a,\"b,\u00e9\"\r\n".encode(), b"1,\xe2\x82\xac\r\n"]
+        for encoding in "utf-8", "UTF8":
+            reader = csv.reader(lines, encoding=encoding)
+            self.assertEqual(list(reader), [["a", "b,\u00e9"], ["1", "\u20ac"]])
+        reader = csv.reader(lines, encoding="latin-1")
+        self.assertEqual(list(reader), [["a", "b,\xc3\xa9"],
+                                        ["1", "\xe2\x82\xac"]])
+        reader = csv.reader(lines, encoding="ascii")
+        self.assertRaises(UnicodeDecodeError, list, reader)
+
+    def test_bytes_converters(self):
+        reader = csv.reader([b"1,2.5,\xc3\xa9,"], encoding="utf-8",
+                            converters=[int, float, str, None])
+        self.assertEqual(next(reader), [1, 2.5, "\u00e9", None])
+
+    def test_bytes_errors(self):
+        with self.assertRaisesRegex(csv.Error, "binary mode"):
+            list(csv.reader(["a,b"], encoding="utf-8"))
+        with self.assertRaisesRegex(csv.Error, "text mode"):
+            list(csv.reader([b"a,b"]))
+        self.assertRaises(ValueError, csv.reader, [], encoding="utf-16")
+        self.assertRaises(LookupError, csv.reader, [], encoding="spam")
+        self.assertRaises(TypeError, csv.reader, [], encoding=b"utf-8")
+        self.assertRaises(ValueError, csv.reader, [], encoding="utf-8",
+                          delimiter="\u00a7")
+
+    def test_readcolumns(self):
+        reader = csv.reader(["a,b", "1,2", "", "3,4", "5,6"])
+        self.assertEqual(reader.readcolumns(1), [["a"], ["b"]])
+        reader.converters = {1: int}
+        self.assertEqual(reader.readcolumns(1), [["1"], [2]])
+        self.assertEqual(reader.readcolumns(), [["3", "5"], [4, 6]])
+        self.assertEqual(reader.readcolumns(), [])
+        self.assertEqual(reader.line_num, 5)
+
+    def test_readcolumns_ragged(self):
+        reader = csv.reader(["a,b", "c"])
+        with self.assertRaisesRegex(csv.Error, "expected 2 fields, saw 1"):
+            reader.readcolumns()
+
+class TestChunkedReading(unittest.TestCase):
+    data = b'a,b\r\n"x\ny",2\n3,"q""\n"\n4,\n' * 3
+
+    def test_split_records(self):
+        expected = list(csv.reader(BytesIO(self.data), encoding='utf-8'))
+        for chunksize in range(1, len(self.data) + 2):
+            with self.subTest(chunksize=chunksize):
+                chunks = list(csv.split_records(BytesIO(self.data), chunksize))
+                self.assertEqual(b''.join(chunks), self.data)
+                rows = [row for chunk in chunks
+                        for row in csv.reader(BytesIO(chunk), encoding='utf-8')]
+                self.assertEqual(rows, expected)
+
+    def test_split_records_boundaries(self):
+        chunks = list(csv.split_records(BytesIO(self.data), 1))
+        self.assertEqual(chunks[:3], [b'a,b\r\n', b'"x\ny",2\n', b'3,"q""\n"\n'])
+        chunks = list(csv.split_records(BytesIO(self.data), 1, quotechar=None))
+        self.assertEqual(chunks[:3], [b'a,b\r\n', b'"x\n', b'y",2\n'])
+        self.assertEqual(list(csv.split_records(BytesIO(b'a\nb'), 100)),
+                         [b'a\n', b'b'])
+        self.assertEqual(list(csv.split_records(BytesIO(b''))), [])
+        self.assertRaises(ValueError, next,
+                          csv.split_records(BytesIO(self.data), 0))
+        self.assertRaises(ValueError, next,
+                          csv.split_records(BytesIO(self.data), quotechar='\xe9'))
+
+    def test_split_records_long_record(self):
+        # A record spanning many blocks is yielded whole.
+        record = b'"' + b'x\n' * 5000 + b'",1\n'
+        data = b'a,b\n' + record + b'c,"d"\ne'
+        for chunksize in 7, 8, 4096:
+            with self.subTest(chunksize=chunksize):
+                chunks = list(csv.split_records(BytesIO(data), chunksize))
+                self.assertEqual(b''.join(chunks), data)
+                self.assertEqual(chunks[0], b'a,b\n')
+                self.assertTrue(chunks[1].startswith(record))
+                self.assertEqual(chunks[-1], b'e')
+
+    def test_map_chunks(self):
+        from concurrent.futures import ThreadPoolExecutor
+        data = self.data * 100
+        with ThreadPoolExecutor(2) as executor:
+            results = list(csv.map_chunks(list, BytesIO(data), executor=executor,
+                                          chunksize=50, buffersize=2))
+        self.assertGreater(len(results), 1)
+        self.assertEqual([row for rows in results for row in rows],
+                         list(csv.reader(BytesIO(data), encoding='utf-8')))
+
+    def test_map_chunks_params(self):
+        from concurrent.futures import ThreadPoolExecutor
+        data = b'1;"2;3"\n4;\n' * 10
+        with ThreadPoolExecutor(2) as executor:
+            results = csv.map_chunks(list, BytesIO(data), delimiter=';',
+                                     converters=[int, None], encoding='ascii',
+                                     executor=executor, chunksize=5)
+            rows = [row for rows in results for row in rows]
+        self.assertEqual(rows, [[1, '2;3'], [4, None]] * 10)
+        self.assertRaises(ValueError, csv.map_chunks, len, BytesIO(data),
+                          escapechar='\\', executor=executor)
+
+    @support.requires_subprocess()
+    def test_map_chunks_processes(self):
+        support.skip_if_broken_multiprocessing_synchronize()
+        data = self.data * 100
+        self.assertEqual(sum(csv.map_chunks(len, BytesIO(data), chunksize=100)),
+                         400 * 3)
+
+
 class TestArrayWrites(unittest.TestCase):
     def test_int_write(self):
         import array
@@ -324,6 +324,47 @@ def test_field_named_like_builtin(self):
         for name in builtins_names:
             self.assertEqual(getattr(c, name), name)
 
+    def test_same_layout_different_names(self):
+        # Classes with the same layout share the code of their generated
+        # methods, make sure each class gets its own field names.
+        @dataclass(order=True, frozen=True)
+        class A:
+            x: int
+            y: str = 'a'
+
+        @dataclass(order=True, frozen=True)
+        class B:
+            p: float
+            q: bytes = b'b'
+
+        self.assertEndsWith(repr(A(1)), ".A(x=1, y='a')")
+        self.assertEndsWith(repr(B(2.0)), ".B(p=2.0, q=b'b')")
+        self.assertEqual(str(inspect.signature(A)),
+                         "(x: int, y: str = 'a') -> None")
+        self.assertEqual(str(inspect.signature(B)),
+                         "(p: float, q: bytes = b'b') -> None")
+        self.assertEqual(A.__init__.__annotations__,
+                         {'x': int, 'y': str, 'return': None})
+        self.assertLess(A(1), A(2))
+        self.assertEqual(hash(B(2.0)), hash((2.0, b'b')))
+        with self.assertRaisesRegex(FrozenInstanceError, "'p'"):
+            B(2.0).p = 3.0
+        with self.assertRaisesRegex(FrozenInstanceError, "'x'"):
+            del A(1).x
+
+    def test_field_named_like_placeholder(self):
+        @dataclass
+        class C:
+            __dataclass_field_1__: int
+            __dataclass_field_0__: int = 0
+
+        c = C(1, 2)
+        self.assertEqual(c.__dataclass_field_1__, 1)
+        self.assertEqual(c.__dataclass_field_0__, 2)
+        self.assertEqual(repr(c),
+            "TestCase.test_field_named_like_placeholder.<locals>.C("
+            "__dataclass_field_1__=1, __dataclass_field_0__=2)")
+
     def test_field_named_like_builtin_frozen(self):
         # Attribute names can shadow built-in names
         # since code generation is used.
@@ -588,6 +588,7 @@ class InitConfigTests(EmbeddingTestsMixin, unittest.TestCase):
         'import_time': False,
         'thread_inherit_context': DEFAULT_THREAD_INHERIT_CONTEXT,
         'context_aware_warnings': DEFAULT_CONTEXT_AWARE_WARNINGS,
+        'warmup_profile': None,
         'code_debug_ranges': True,
         'show_ref_count': False,
         'dump_refs': False,
@@ -2038,6 +2038,273 @@ def f():
             return 1
         self.assertEqual(f.cache_parameters(), {'maxsize': 1000, "typed": True})
 
+    def test_lru_cache_parameters_options(self):
+        @self.module.lru_cache(maxsize=10, ttl=5.0, weight=len, shards=2)
+        def f(x):
+            return x
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': 10, 'typed': False, 'ttl': 5.0,
+                          'weight': len, 'shards': 2})
+
+    def test_lru_cache_options_errors(self):
+        lru_cache = self.module.lru_cache
+        for ttl in (0, -1.0, float('nan')):
+            with self.subTest(ttl=ttl):
+                with self.assertRaises(ValueError):
+                    lru_cache(ttl=ttl)(len)
+        with self.assertRaises(TypeError):
+            lru_cache(ttl='1')(len)
+        with self.assertRaises(TypeError):
+            lru_cache(weight=1)(len)
+        with self.assertRaises(TypeError):
+            lru_cache(on_evict=1)(len)
+        with self.assertRaises(ValueError):
+            lru_cache(shards=0)(len)
+        with self.assertRaises(TypeError):
+            lru_cache(shards=2.0)(len)
+
+    def test_lru_cache_ttl(self):
+        evicted = []
+        calls = []
+        @self.module.lru_cache(ttl=3600, on_evict=evicted.append)
+        def f(x):
+            calls.append(x)
+            return [x]
+        self.assertEqual(f(1), [1])
+        self.assertIs(f(1), f(1))
+        self.assertEqual(calls, [1])
+        self.assertEqual(f.cache_info(), self.module._CacheInfo(2, 1, 128, 1))
+
+        @self.module.lru_cache(ttl=0.01, on_evict=evicted.append)
+        def g(x):
+            calls.append(x)
+            return [x]
+        calls.clear()
+        first = g(1)
+        g(2)
+        time.sleep(0.05)
+        # The expired result is recomputed.
+        second = g(1)
+        self.assertEqual(second, [1])
+        self.assertIsNot(second, first)
+        self.assertEqual(calls, [1, 2, 1])
+        self.assertEqual(g.cache_info().misses, 3)
+        self.assertEqual(g.cache_info().hits, 0)
+        # Both g(1) and the least recently used g(2) were evicted.
+        self.assertEqual(sorted(evicted), [[1], [2]])
+        self.assertEqual(g.cache_info().currsize, 1)
+        self.assertEqual(evicted.count([1]), 1)
+
+    def test_lru_cache_weight(self):
+        evicted = []
+        @self.module.lru_cache(maxsize=10, weight=len,
+                               on_evict=evicted.append)
+        def f(n):
+            return 'x' * n
+        f(3)
+        f(4)
+        self.assertEqual(f.cache_info().currsize, 7)
+        self.assertEqual(evicted, [])
+        f(3)   # make f(4) the least recently used
+        f(5)
+        self.assertEqual(evicted, ['xxxx'])
+        self.assertEqual(f.cache_info().currsize, 8)
+        f(10)
+        self.assertEqual(evicted, ['xxxx', 'xxx', 'xxxxx'])
+        self.assertEqual(f.cache_info().currsize, 10)
+        # A result heavier than maxsize is not cached.
+        f(11)
+        f(11)
+        self.assertEqual(f.cache_info().misses, 6)
+        self.assertEqual(f.cache_info().currsize, 10)
+        f(0)
+        self.assertEqual(f.cache_info().currsize, 10)
+        self.assertEqual(len(evicted), 3)
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), self.module._CacheInfo(0, 0, 10, 0))
+
+        @self.module.lru_cache(maxsize=None, weight=len)
+        def g(n):
+            return 'x' * n
+        for n in range(10):
+            g(n)
+        self.assertEqual(g.cache_info().currsize, 45)
+
+        @self.module.lru_cache(weight=lambda result: result)
+        def h(n):
+            return n
+        with self.assertRaises(ValueError):
+            h(-1)
+        with self.assertRaises(TypeError):
+            h(1.5)
+        self.assertEqual(h.cache_info().currsize, 0)
+
+    def test_lru_cache_on_evict(self):
+        evicted = []
+        @self.module.lru_cache(maxsize=2, on_evict=evicted.append)
+        def f(x):
+            return x * 10
+        for x in (1, 2, 1, 3, 4):
+            f(x)
+        self.assertEqual(evicted, [20, 10])
+        self.assertEqual(f.cache_info(), self.module._CacheInfo(1, 4, 2, 2))
+        # Explicit removals are not evictions.
+        f.cache_invalidate(3)
+        f.cache_clear()
+        self.assertEqual(evicted, [20, 10])
+
+    def test_lru_cache_on_evict_error(self):
+        def on_evict(result):
+            raise ZeroDivisionError(result)
+        @self.module.lru_cache(maxsize=1, on_evict=on_evict)
+        def g(x):
+            return x
+        g(1)
+        with support.catch_unraisable_exception() as cm:
+            # The error is reported, and the new result is still returned
+            # and cached.
+            self.assertEqual(g(2), 2)
+            self.assertEqual(cm.unraisable.exc_type, ZeroDivisionError)
+            self.assertEqual(cm.unraisable.exc_value.args, (1,))
+            self.assertEqual(cm.unraisable.err_msg,
+                             f"Exception ignored in on_evict callback of "
+                             f"{g.__wrapped__!r}")
+        self.assertEqual(g(2), 2)
+        self.assertEqual(g.cache_info(), self.module._CacheInfo(1, 2, 1, 1))
+
+        # Same for a result which expired.
+        @self.module.lru_cache(ttl=0.01, on_evict=on_evict)
+        def h(x):
+            return [x]
+        h(1)
+        time.sleep(0.05)
+        with support.catch_unraisable_exception() as cm:
+            self.assertEqual(h(1), [1])
+            self.assertEqual(cm.unraisable.exc_value.args, ([1],))
+        self.assertEqual(h.cache_info().currsize, 1)
+
+    def test_lru_cache_on_evict_reentrant(self):
+        @self.module.lru_cache(maxsize=2, on_evict=lambda result: f(result))
+        def f(x):
+            return x + 1 if x < 10 else x
+        self.assertEqual(f(1), 2)
+        for x in range(2, 12):
+            f(x)
+        self.assertLessEqual(f.cache_info().currsize, 2)
+
+    def test_lru_cache_evict_reentrant_eq(self):
+        # The key comparisons made when evicting a link remove it first.
+        class Key:
+            armed = None
+            def __init__(self, name):
+                self.name = name
+            def __hash__(self):
+                return 0
+            def __eq__(self, other):
+                if Key.armed is not None and other is Key.armed[0]:
+                    action, Key.armed = Key.armed[1], None
+                    action()
+                return self is other
+        for remove in 'cache_clear', 'cache_invalidate':
+            with self.subTest(remove):
+                evicted = []
+                @self.module.lru_cache(maxsize=2, on_evict=evicted.append)
+                def f(x):
+                    return x.name
+                k1, k2, k3 = Key(1), Key(2), Key(3)
+                f(k1)
+                f(k2)
+                f(k1)
+                if remove == 'cache_clear':
+                    Key.armed = (k2, f.cache_clear)
+                else:
+                    Key.armed = (k2, lambda: f.cache_invalidate(k2))
+                # Evicts k2, whose lookup compares k1 with it.
+                self.assertEqual(f(k3), 3)
+                self.assertIsNone(Key.armed)
+                self.assertEqual(evicted, [])
+                self.assertEqual(f.cache_info().currsize,
+                                 1 if remove == 'cache_clear' else 2)
+                self.assertEqual(f(k1), 1)
+                self.assertEqual(f(k3), 3)
+
+    def test_lru_cache_invalidate(self):
+        for kwargs in [dict(maxsize=0), dict(maxsize=None), dict(maxsize=2),
+                       dict(maxsize=2, on_evict=id), dict(shards=4),
+                       dict(maxsize=None, shards=4), dict(typed=True)]:
+            with self.subTest(**kwargs):
+                calls = []
+                @self.module.lru_cache(**kwargs)
+                def f(x, y=0):
+                    calls.append((x, y))
+                    return x + y
+                f(1)
+                f(2, y=3)
+                self.assertFalse(f.cache_invalidate(3))
+                self.assertFalse(f.cache_invalidate(2, 3))
+                cached = kwargs.get('maxsize', 128) != 0
+                self.assertIs(f.cache_invalidate(2, y=3), cached)
+                self.assertFalse(f.cache_invalidate(2, y=3))
+                self.assertIs(f.cache_invalidate(1), cached)
+                self.assertEqual(f.cache_info().currsize, 0)
+                f(1)
+                f(2, y=3)
+                self.assertEqual(f(1), 1)
+                self.assertEqual(len(calls), 4 if cached else 5)
+        with self.assertRaises(TypeError):
+            f.cache_invalidate([])
+
+    def test_lru_cache_shards(self):
+        @self.module.lru_cache(maxsize=40, shards=8)
+        def f(x):
+            return x * 2
+        for x in range(100):
+            self.assertEqual(f(x), x * 2)
+        info = f.cache_info()
+        self.assertEqual(info.maxsize, 40)
+        self.assertEqual(info.misses, 100)
+        self.assertLessEqual(info.currsize, 40)
+        for x in range(100):
+            f(x)
+        info = f.cache_info()
+        self.assertEqual(info.hits + info.misses, 200)
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), self.module._CacheInfo(0, 0, 40, 0))
+
+        # There are not more shards than results.
+        @self.module.lru_cache(maxsize=2, shards=8)
+        def g(x):
+            return x
+        for x in range(4):
+            g(x)
+        self.assertEqual(g.cache_info().currsize, 2)
+
+        @self.module.lru_cache(maxsize=0, shards=8)
+        def h(x):
+            return x
+        h(1)
+        h(1)
+        self.assertEqual(h.cache_info(), self.module._CacheInfo(0, 2, 0, 0))
+
+    @threading_helper.requires_working_threading()
+    def test_lru_cache_shards_threaded(self):
+        @self.module.lru_cache(maxsize=64, shards=4, ttl=3600)
+        def f(x):
+            return x * 3
+        def worker(start):
+            for i in range(500):
+                x = (start + i) % 100
+                self.assertEqual(f(x), x * 3)
+                if i % 50 == 0:
+                    f.cache_invalidate(x)
+        threads = [threading.Thread(target=worker, args=(k * 10,))
+                   for k in range(8)]
+        with threading_helper.start_threads(threads):
+            pass
+        info = f.cache_info()
+        self.assertEqual(info.hits + info.misses, 4000)
+        self.assertLessEqual(info.currsize, 64)
+
     def test_lru_cache_weakrefable(self):
         @self.module.lru_cache
         def test_function(x):
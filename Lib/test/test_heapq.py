@@ -11,10 +11,9 @@
 py_heapq = import_helper.import_fresh_module('heapq', blocked=['_heapq'])
 c_heapq = import_helper.import_fresh_module('heapq', fresh=['_heapq'])
 
-# _heapq.nlargest/nsmallest are saved in heapq._nlargest/_smallest when
-# _heapq is imported, so check them there
 func_names = ['heapify', 'heappop', 'heappush', 'heappushpop', 'heapreplace',
-              '_heappop_max', '_heapreplace_max', '_heapify_max']
+              '_heappop_max', '_heapreplace_max', '_heapify_max',
+              'merge', 'nlargest', 'nsmallest', 'IndexedHeap']
 
 class TestModules(TestCase):
     def test_py_functions(self):
@@ -223,6 +222,30 @@ class Int(int):
         result = [i.pair for i in self.module.merge(*inputs)]
         self.assertEqual(result, sorted(result))
 
+    def test_merge_is_lazy(self):
+        consumed = []
+        def iterable(name, values):
+            for x in values:
+                consumed.append((name, x))
+                yield x
+        it = self.module.merge(iterable('a', [1, 4]), iterable('b', [2, 3]))
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(it), 1)
+        self.assertEqual(consumed, [('a', 1), ('b', 2)])
+        self.assertEqual(next(it), 2)
+        self.assertEqual(consumed, [('a', 1), ('b', 2), ('a', 4)])
+        self.assertEqual(list(it), [3, 4])
+
+    def test_merge_reentrant_call(self):
+        def iterable():
+            yield 1
+            next(it)
+            yield 2
+        it = self.module.merge(iterable())
+        self.assertEqual(next(it), 1)
+        self.assertRaises(ValueError, next, it)
+        self.assertEqual(list(it), [])
+
     def test_nsmallest(self):
         data = [(random.randrange(2000), i) for i in range(1000)]
         for f in (None, lambda x:  x[0] * 547 % 2000):
@@ -241,6 +264,80 @@ def test_nlargest(self):
                 self.assertEqual(list(self.module.nlargest(n, data, key=f)),
                                  sorted(data, key=f, reverse=True)[:n])
 
+    def test_nbest_stability(self):
+        data = [(random.randrange(20), i) for i in range(1000)]
+        key = itemgetter(0)
+        for n in (1, 2, 10, 100, 999, 1000, 1100):
+            self.assertEqual(self.module.nsmallest(n, data, key=key),
+                             sorted(data, key=key)[:n])
+            self.assertEqual(self.module.nlargest(n, data, key=key),
+                             sorted(data, key=key, reverse=True)[:n])
+
+    def test_indexed_heap(self):
+        heap = self.module.IndexedHeap()
+        self.assertEqual(len(heap), 0)
+        self.assertRaises(IndexError, heap.pop)
+        self.assertRaises(IndexError, heap.peek)
+        data = [random.randrange(100) for i in range(500)]
+        handles = [heap.push(x, i) for i, x in enumerate(data)]
+        self.assertEqual(len(heap), len(data))
+        self.assertEqual(handles[7].priority, data[7])
+        self.assertEqual(handles[7].value, 7)
+        self.assertIn(handles[7], heap)
+        self.assertEqual(heap.peek(), min(zip(data, range(len(data)))))
+        # Equal priorities are popped in insertion order.
+        result = [heap.pop() for i in range(len(heap))]
+        self.assertEqual(result, sorted(zip(data, range(len(data)))))
+        self.assertEqual(len(heap), 0)
+        self.assertNotIn(handles[7], heap)
+        self.assertEqual(heap.push(5).value, None)
+
+    def test_indexed_heap_update(self):
+        heap = self.module.IndexedHeap()
+        expected = {}
+        handles = []
+        for i in range(500):
+            x = random.randrange(1000)
+            handles.append(heap.push(x, i))
+            expected[i] = x
+        random.shuffle(handles)
+        for handle in handles[:100]:
+            self.assertEqual(heap.remove(handle),
+                             (expected.pop(handle.value), handle.value))
+            self.assertNotIn(handle, heap)
+        for handle in handles[100:200]:
+            x = handle.priority - random.randrange(1000)
+            heap.decrease_key(handle, x)
+            expected[handle.value] = x
+            self.assertEqual(handle.priority, x)
+        for handle in handles[200:300]:
+            x = random.randrange(-1000, 2000)
+            heap.update(handle, x)
+            expected[handle.value] = x
+        result = [heap.pop() for i in range(len(heap))]
+        self.assertEqual([x for x, i in result], sorted(expected.values()))
+        self.assertEqual({i: x for x, i in result}, expected)
+
+    def test_indexed_heap_errors(self):
+        heap = self.module.IndexedHeap()
+        other = self.module.IndexedHeap()
+        handle = heap.push(1, 'a')
+        foreign = other.push(1, 'b')
+        for h in (foreign, 1, None):
+            self.assertNotIn(h, heap)
+            self.assertRaises(ValueError, heap.update, h, 0)
+            self.assertRaises(ValueError, heap.decrease_key, h, 0)
+            self.assertRaises(ValueError, heap.remove, h)
+        self.assertRaises(ValueError, heap.decrease_key, handle, 2)
+        self.assertRaises(AttributeError, setattr, handle, 'priority', 0)
+        self.assertRaises(AttributeError, setattr, handle, 'value', 0)
+        heap.clear()
+        self.assertEqual(len(heap), 0)
+        self.assertNotIn(handle, heap)
+        self.assertRaises(ValueError, heap.remove, handle)
+        self.assertEqual(other.pop(), (1, 'b'))
+        self.assertRaises(ValueError, other.remove, foreign)
+
     def test_comparison_operator(self):
         # Issue 3051: Make sure heapq works with both __lt__
         # For python 3.0, __le__ alone is not enough
@@ -464,6 +561,13 @@ def __lt__(self, o):
         self.assertRaises((IndexError, RuntimeError), self.module.heappush, list1, g(1))
         self.assertRaises((IndexError, RuntimeError), self.module.heappush, list2, h(1))
 
+    def test_indexed_heap_cmp_err(self):
+        heap = self.module.IndexedHeap()
+        handle = heap.push(1)
+        self.assertRaises(ZeroDivisionError, heap.push, CmpErr())
+        self.assertRaises(ZeroDivisionError, heap.decrease_key, handle,
+                          CmpErr())
+
 class TestErrorHandlingPython(TestErrorHandling, TestCase):
     module = py_heapq
 
@@ -471,6 +575,24 @@ class TestErrorHandlingPython(TestErrorHandling, TestCase):
 class TestErrorHandlingC(TestErrorHandling, TestCase):
     module = c_heapq
 
+    def test_indexed_heap_mutating_heap(self):
+        class EvilPriority(int):
+            def __lt__(self, other):
+                if evil:
+                    heap.clear()
+                return int(self) < int(other)
+        heap = self.module.IndexedHeap()
+        evil = False
+        for i in range(10):
+            heap.push(EvilPriority(i))
+        evil = True
+        self.assertRaises(RuntimeError, heap.push, EvilPriority(-1))
+        evil = False
+        for i in range(10):
+            heap.push(EvilPriority(i))
+        evil = True
+        self.assertRaises(RuntimeError, heap.pop)
+
 
 if __name__ == "__main__":
     unittest.main()
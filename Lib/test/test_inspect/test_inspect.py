@@ -4771,6 +4771,26 @@ def foo(a, *, b:1): pass
         foo_sig = MySignature.from_callable(foo)
         self.assertIsInstance(foo_sig, MySignature)
 
+    def test_signature_from_callable_python_obj_fast_path(self):
+        def foo(a, b=1, *, c=2, d: int = 3) -> str: pass
+        sig = inspect.signature(foo)
+        self.assertEqual(str(sig), '(a, b=1, *, c=2, d: int = 3) -> str')
+        self.assertEqual(vars(foo), {})
+        self.assertEqual(
+            str(inspect.signature(foo, annotation_format=Format.STRING)),
+            "(a, b=1, *, c=2, d: 'int' = 3) -> 'str'")
+
+        foo.__defaults__ = (10,)
+        foo.__kwdefaults__['c'] = 20
+        foo.__annotations__['a'] = float
+        self.assertEqual(str(inspect.signature(foo)),
+                         '(a: float, b=10, *, c=20, d: int = 3) -> str')
+        self.assertEqual(vars(foo), {})
+        self.assertEqual(vars(functools.wraps(foo)(lambda: None)),
+                         {'__wrapped__': foo})
+        foo.__signature__ = sig
+        self.assertIs(inspect.signature(foo), sig)
+
     @unittest.skipIf(MISSING_C_DOCSTRINGS,
                      "Signature information for builtins requires docstrings")
     def test_signature_from_callable_class(self):
@@ -2763,5 +2763,109 @@ def testV6HashIsNotConstant(self):
         self.assertNotEqual(ipv6_address1.__hash__(), ipv6_address2.__hash__())
 
 
+class IPNetworkSetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.nets = [ipaddress.ip_network(n) for n in (
+            '10.0.0.0/8', '10.1.0.0/16', '10.1.2.0/24', '192.0.2.0/24',
+            '0.0.0.0/0', '2001:db8::/32', '2001:db8:1::/48', '::1/128')]
+        self.netset = ipaddress.IPNetworkSet(self.nets)
+
+    def test_len_iter(self):
+        self.assertEqual(len(self.netset), len(self.nets))
+        self.assertEqual(list(self.netset), sorted(
+            self.nets, key=ipaddress.get_mixed_type_key))
+        self.netset.add(ipaddress.ip_network('10.0.0.0/8'))
+        self.assertEqual(len(self.netset), len(self.nets))
+        self.assertEqual(len(ipaddress.IPNetworkSet()), 0)
+        self.assertEqual(list(ipaddress.IPNetworkSet()), [])
+
+    def test_longest_match(self):
+        ip = ipaddress.ip_address
+        net = ipaddress.ip_network
+        match = self.netset.longest_match
+        self.assertEqual(match(ip('10.1.2.3')), net('10.1.2.0/24'))
+        self.assertEqual(match(ip('10.1.3.3')), net('10.1.0.0/16'))
+        self.assertEqual(match(ip('10.2.3.4')), net('10.0.0.0/8'))
+        self.assertEqual(match(ip('11.0.0.1')), net('0.0.0.0/0'))
+        self.assertEqual(match(ip('2001:db8:1::5')), net('2001:db8:1::/48'))
+        self.assertEqual(match(ip('2001:db8:2::5')), net('2001:db8::/32'))
+        self.assertEqual(match(ip('::1')), net('::1/128'))
+        self.assertIsNone(match(ip('::2')))
+        self.assertEqual(match(ipaddress.ip_interface('10.1.2.3/8')),
+                         net('10.1.2.0/24'))
+        self.assertEqual(match(net('10.1.2.128/25')), net('10.1.2.0/24'))
+        self.assertEqual(match(net('10.1.2.0/24')), net('10.1.2.0/24'))
+        self.assertEqual(match(net('10.0.0.0/15')), net('10.0.0.0/8'))
+        self.assertIsNone(match(net('2001:db8::/31')))
+        self.assertEqual(list(self.netset.matches(ip('10.1.2.3'))),
+                         [net('10.1.2.0/24'), net('10.1.0.0/16'),
+                          net('10.0.0.0/8'), net('0.0.0.0/0')])
+        self.assertRaises(TypeError, match, '10.1.2.3')
+        self.assertRaises(TypeError, match, 167838211)
+
+    def test_contains(self):
+        self.assertIn(ipaddress.ip_address('172.16.0.1'), self.netset)
+        self.assertIn(ipaddress.ip_network('2001:db8:5::/64'), self.netset)
+        self.assertNotIn(ipaddress.ip_address('2001:db9::'), self.netset)
+        self.assertNotIn(ipaddress.ip_network('2001:db8::/31'), self.netset)
+        self.assertNotIn('10.0.0.1', self.netset)
+        netset = ipaddress.IPNetworkSet([ipaddress.ip_network('10.0.0.0/8')])
+        self.assertNotIn(ipaddress.ip_address('11.0.0.0'), netset)
+        self.assertNotIn(ipaddress.ip_address('::a00:1'), netset)
+
+    def test_add_remove(self):
+        net = ipaddress.ip_network('10.1.2.0/24')
+        self.netset.remove(net)
+        self.assertEqual(len(self.netset), len(self.nets) - 1)
+        self.assertEqual(self.netset.longest_match(net),
+                         ipaddress.ip_network('10.1.0.0/16'))
+        self.assertRaises(KeyError, self.netset.remove, net)
+        self.netset.discard(net)
+        self.netset.discard(ipaddress.ip_network('10.1.0.0/16'))
+        self.assertEqual(self.netset.longest_match(net),
+                         ipaddress.ip_network('10.0.0.0/8'))
+        self.netset.add(net)
+        self.assertEqual(self.netset.longest_match(net), net)
+        self.assertEqual(len(self.netset), len(self.nets) - 1)
+        self.assertRaises(TypeError, self.netset.add,
+                          ipaddress.ip_address('10.0.0.1'))
+        self.assertRaises(TypeError, self.netset.add, '10.0.0.0/8')
+        self.assertRaises(TypeError, ipaddress.IPNetworkSet, ['10.0.0.0/8'])
+
+    def test_equality_copy_pickle(self):
+        self.assertEqual(self.netset, ipaddress.IPNetworkSet(self.nets[::-1]))
+        self.assertNotEqual(self.netset, ipaddress.IPNetworkSet(self.nets[1:]))
+        self.assertNotEqual(self.netset, set(self.nets))
+        self.assertRaises(TypeError, hash, self.netset)
+        copied = self.netset.copy()
+        self.assertEqual(copied, self.netset)
+        copied.discard(self.nets[0])
+        self.assertNotEqual(copied, self.netset)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                self.assertEqual(
+                    pickle.loads(pickle.dumps(self.netset, proto)),
+                    self.netset)
+        self.assertEqual(copy.deepcopy(self.netset), self.netset)
+        self.assertEqual(
+            repr(ipaddress.IPNetworkSet([ipaddress.ip_network('::/0')])),
+            "IPNetworkSet([IPv6Network('::/0')])")
+
+    def test_collapse(self):
+        nets = [ipaddress.ip_network(n) for n in (
+            '192.0.2.0/25', '192.0.2.128/25', '192.0.2.5/32',
+            '2001:db8::/33', '2001:db8:8000::/33')]
+        netset = ipaddress.IPNetworkSet(nets)
+        self.assertEqual(list(netset.collapse()),
+                         [ipaddress.ip_network('192.0.2.0/24'),
+                          ipaddress.ip_network('2001:db8::/32')])
+        self.assertEqual(len(netset), len(nets))
+        v4 = nets[:3]
+        self.assertEqual(
+            ipaddress.IPNetworkSet(ipaddress.collapse_addresses(v4)),
+            ipaddress.IPNetworkSet([ipaddress.ip_network('192.0.2.0/24')]))
+
+
 if __name__ == '__main__':
     unittest.main()
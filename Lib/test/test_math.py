@@ -755,6 +755,29 @@ def bad_iter():
 
         self.assertRaises(ZeroDivisionError, math.fsum, bad_iter())
 
+    @requires_IEEE_754
+    @unittest.skipIf(HAVE_DOUBLE_ROUNDING,
+                         "fsum is not exact on machines with double rounding")
+    def testFsumBuffer(self):
+        from array import array
+        # Buffers of floats and doubles are read directly
+        vals = [1e100, 1.0, -1e100, 1e-100, 1e50, -1.0, -1e50]
+        self.assertEqual(math.fsum(array('d', vals)), 1e-100)
+        self.assertEqual(math.fsum(memoryview(array('d', vals))), 1e-100)
+        self.assertEqual(math.fsum(array('d', [0.1] * 10)), 1.0)
+        self.assertEqual(math.fsum(array('f', [0.5, 0.25])), 0.75)
+        self.assertEqual(math.fsum(array('d')), 0.0)
+        self.assertEqual(math.fsum(array('d', [1.0, math.inf])), math.inf)
+        self.assertTrue(math.isnan(math.fsum(array('d', [math.nan, 1.0]))))
+        self.assertRaises(OverflowError, math.fsum, array('d', [1e308, 1e308]))
+        self.assertRaises(ValueError, math.fsum,
+                          array('d', [math.inf, -math.inf]))
+        # Other buffers are iterated over
+        self.assertEqual(math.fsum(array('i', [1, 2, 3])), 6.0)
+        self.assertEqual(math.fsum(b'\x01\x02'), 3.0)
+        m = memoryview(array('d', [1.0, 2.0, 4.0, 8.0]))
+        self.assertEqual(math.fsum(m[::2]), 5.0)
+
     def testGcd(self):
         gcd = math.gcd
         self.assertEqual(gcd(0, 0), 0)
@@ -1393,6 +1416,35 @@ def test_sumprod_accuracy(self):
         self.assertEqual(sumprod([True, False] * 10, [0.1] * 20), 1.0)
         self.assertEqual(sumprod([1.0, 10E100, 1.0, -10E100], [1.0]*4), 2.0)
 
+    @requires_IEEE_754
+    @unittest.skipIf(HAVE_DOUBLE_ROUNDING,
+                         "sumprod() accuracy not guaranteed on machines with double rounding")
+    @support.cpython_only
+    def test_sumprod_buffer(self):
+        from array import array
+        sumprod = math.sumprod
+        p = array('d', [0.1] * 10)
+        self.assertEqual(sumprod(p, array('d', [1.0] * 10)), 1.0)
+        self.assertEqual(sumprod(p, array('f', [1.0] * 10)), 1.0)
+        self.assertEqual(sumprod(memoryview(p), p), sumprod(list(p), list(p)))
+        self.assertEqual(sumprod(array('d', [1.0, 10E100, 1.0, -10E100]),
+                                 array('d', [1.0] * 4)), 2.0)
+        self.assertEqual(sumprod(array('d'), array('d')), 0)
+        self.assertIsInstance(sumprod(array('d'), array('d')), int)
+        self.assertEqual(sumprod(array('d', [math.inf, 1.0]),
+                                 array('d', [1.0, 1.0])), math.inf)
+        self.assertTrue(math.isnan(sumprod(array('d', [math.inf, 1.0]),
+                                           array('d', [0.0, 1.0]))))
+        # Intermediate overflow gives the same result as the generic code
+        self.assertTrue(math.isnan(sumprod([1e308, 1e308], [10.0, -10.0])))
+        self.assertTrue(math.isnan(sumprod(array('d', [1e308, 1e308]),
+                                           array('d', [10.0, -10.0]))))
+        with self.assertRaisesRegex(ValueError, 'not the same length'):
+            sumprod(array('d', [1.0, 2.0]), array('d', [1.0]))
+        # Mixed and non-float buffers use the generic code
+        self.assertEqual(sumprod(array('d', [0.5, 2.0]), [2, 3]), 7.0)
+        self.assertEqual(sumprod(array('i', [1, 2]), array('i', [3, 4])), 11)
+
     @support.requires_resource('cpu')
     def test_sumprod_stress(self):
         sumprod = math.sumprod
@@ -1,11 +1,13 @@
 """Unit tests for memory-based file-like objects.
 StringIO -- for unicode strings
 BytesIO -- for bytes
+StringBuilder, BytesBuilder -- for building strings and bytes
 """
 
 import unittest
 from test import support
 
+import array
 import gc
 import io
 import _pyio as pyio
@@ -900,5 +902,133 @@ def __init__(self, *args, **kwargs):
             pass
 
 
+class PyStringBuilderTest(unittest.TestCase):
+    builderclass = pyio.StringBuilder
+
+    def test_build(self):
+        builder = self.builderclass()
+        self.assertEqual(len(builder), 0)
+        self.assertEqual(builder.build(), '')
+        self.assertIsNone(builder.write('abc'))
+        builder.write('')
+        builder.write('\xe9\u20ac\U0001f600')
+        builder.write('\ud800')
+        self.assertEqual(len(builder), 7)
+        self.assertEqual(builder.build(), 'abc\xe9\u20ac\U0001f600\ud800')
+        # build() empties the builder
+        self.assertEqual(len(builder), 0)
+        self.assertEqual(builder.build(), '')
+        builder.write('x')
+        self.assertEqual(builder.build(), 'x')
+
+    def test_many_writes(self):
+        builder = self.builderclass()
+        parts = [str(i) * (i % 7) for i in range(10000)]
+        for part in parts:
+            builder.write(part)
+        self.assertEqual(builder.build(), ''.join(parts))
+
+    def test_write_format(self):
+        builder = self.builderclass()
+        builder.write('[')
+        self.assertIsNone(builder.write_format('{0}-{x:>4}-{0!r}', 1, x='\xe9'))
+        builder.write_format('')
+        builder.write_format('{{}}')
+        builder.write_format('{format}', format='f')
+        self.assertEqual(builder.build(), '[1-   \xe9-1{}f')
+
+    def test_write_format_error(self):
+        # nothing is written when formatting fails
+        builder = self.builderclass()
+        builder.write('ab')
+        self.assertRaises(IndexError, builder.write_format, 'x{}{}', 1)
+        self.assertRaises(KeyError, builder.write_format, '\u20ac{}{z}', 1)
+        self.assertRaises(ValueError, builder.write_format, '{:d}', 'x')
+        self.assertEqual(len(builder), 2)
+        builder.write('c')
+        result = builder.build()
+        self.assertEqual(result, 'abc')
+        self.assertTrue(result.isascii())
+
+    def test_write_format_error_widened(self):
+        # the partial output widened the ASCII buffer to Latin-1
+        builder = self.builderclass()
+        builder.write('abc')
+        self.assertRaises(KeyError, builder.write_format, '\xe9{x}')
+        result = builder.build()
+        self.assertEqual(result, 'abc')
+        self.assertTrue(result.isascii())
+        builder.write('\xe9')
+        self.assertRaises(KeyError, builder.write_format, '\u20ac{x}')
+        builder.write('d')
+        self.assertEqual(builder.build(), '\xe9d')
+
+    def test_write_subclass(self):
+        class S(str):
+            def __str__(self):
+                return 'X'
+        builder = self.builderclass()
+        builder.write(S('abc'))
+        builder.write(S('d'))
+        result = builder.build()
+        self.assertIs(type(result), str)
+        self.assertEqual(result, 'abcd')
+
+    def test_types(self):
+        builder = self.builderclass()
+        self.assertRaises(TypeError, builder.write, b'abc')
+        self.assertRaises(TypeError, builder.write, None)
+        self.assertRaises(TypeError, builder.write_format, b'{}', 1)
+        self.assertRaises(TypeError, builder.write_format)
+        self.assertRaises(TypeError, self.builderclass, 'abc')
+        self.assertRaises(TypeError, pickle.dumps, builder)
+
+
+class CStringBuilderTest(PyStringBuilderTest):
+    builderclass = io.StringBuilder
+
+
+class PyBytesBuilderTest(unittest.TestCase):
+    builderclass = pyio.BytesBuilder
+
+    def test_build(self):
+        builder = self.builderclass()
+        self.assertEqual(len(builder), 0)
+        self.assertEqual(builder.build(), b'')
+        self.assertIsNone(builder.write(b'abc'))
+        builder.write(b'')
+        builder.write(bytearray(b'de'))
+        builder.write(memoryview(b'xfgx')[1:3])
+        builder.write(array.array('b', [104]))
+        self.assertEqual(len(builder), 8)
+        result = builder.build()
+        self.assertIs(type(result), bytes)
+        self.assertEqual(result, b'abcdefgh')
+        # build() empties the builder
+        self.assertEqual(len(builder), 0)
+        self.assertEqual(builder.build(), b'')
+        builder.write(b'x')
+        self.assertEqual(builder.build(), b'x')
+
+    def test_many_writes(self):
+        builder = self.builderclass()
+        parts = [str(i).encode() * (i % 7) for i in range(10000)]
+        for part in parts:
+            builder.write(part)
+        self.assertEqual(len(builder), sum(map(len, parts)))
+        self.assertEqual(builder.build(), b''.join(parts))
+
+    def test_types(self):
+        builder = self.builderclass()
+        self.assertRaises(TypeError, builder.write, 'abc')
+        self.assertRaises(TypeError, builder.write, None)
+        self.assertRaises(TypeError, self.builderclass, b'abc')
+        self.assertRaises(TypeError, pickle.dumps, builder)
+
+
+class CBytesBuilderTest(PyBytesBuilderTest):
+    builderclass = io.BytesBuilder
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1349,6 +1349,36 @@ def test_search_coverage(self):
         self.assertEqual(re.search(r"\s(b)", " b").group(1), "b")
         self.assertEqual(re.search(r"a\s", "a ").group(0), "a ")
 
+    def test_search_required_literal(self):
+        # Patterns which contain a literal string which is not a prefix
+        # only try the positions from which the literal can be reached.
+        text = 'spam ' * 1000 + 'user@example.com spam'
+        p = re.compile(r'\w+@example\.com')
+        self.assertEqual(p.search(text).span(), (5000, 5016))
+        self.assertIsNone(p.search(text, 0, 5015))
+        self.assertEqual(p.search(text, 0, 5016).span(), (5000, 5016))
+        self.assertEqual(re.search(rb'\w+@example\.com',
+                                   memoryview(text[:5016].encode())).span(),
+                         (5000, 5016))
+        self.assertEqual(p.search(text, 5002).span(), (5002, 5016))
+        self.assertIsNone(re.search(r'\w+@example\.org', text))
+        self.assertEqual(re.search(rb'\w+@example\.com', text.encode()).span(),
+                         (5000, 5016))
+        # bounded offset
+        self.assertEqual(re.search(r'\d{2,3}-ab', '1234-ab 5-ab').span(),
+                         (1, 7))
+        self.assertIsNone(re.search(r'\d{2,3}-ab', '1 2-ab 3-ab'))
+        # the literal is required, but can occur after other characters
+        self.assertEqual(re.search(r'[a-z]*.ab', 'xyz1ab').span(), (0, 6))
+        self.assertEqual(re.search(r'(?:x|\d)+ab', 'yx1abab').span(), (1, 5))
+        self.assertEqual(re.search(r'x+ab', 'xxxaxab').span(), (4, 7))
+        self.assertEqual(re.search(r'\bab\b', 'cab ab').span(), (4, 6))
+        self.assertEqual(re.search(r'(?i)\w+-ab', 'xAB-AB').span(), (0, 6))
+        self.assertEqual(re.search(r'(?<=x)\d+ab', 'y1abx2ab').span(), (5, 8))
+        # the literal does not fit in the character width of the string
+        self.assertIsNone(re.search(r'\w+\u20ac', 'abc\xe9'))
+        self.assertEqual(re.search(r'\w+\u20ac', 'ab\u20ac').span(), (0, 3))
+
     def assertMatch(self, pattern, text, match=None, span=None,
                     matcher=re.fullmatch):
         if match is None and span is None:
@@ -2702,6 +2732,243 @@ def test_memory_leaks(self):
         self.check_interrupt(r'([^:]){2,4}+:', 'abc:', 100)
 
 
+class LinearTests(unittest.TestCase):
+
+    def check_same(self, pattern, string, flags=0):
+        # The linear-time engine must give the same results as the
+        # backtracking engine.
+        p1 = re.compile(pattern, flags)
+        p2 = re.compile(pattern, flags | re.LINEAR)
+        for meth in 'match', 'fullmatch', 'search':
+            with self.subTest(pattern=pattern, string=string, method=meth):
+                m1 = getattr(p1, meth)(string)
+                m2 = getattr(p2, meth)(string)
+                if m1 is None:
+                    self.assertIsNone(m2)
+                    continue
+                self.assertIsNotNone(m2)
+                self.assertEqual(m2.regs, m1.regs)
+                self.assertEqual(m2.lastindex, m1.lastindex)
+                self.assertEqual(m2.lastgroup, m1.lastgroup)
+        with self.subTest(pattern=pattern, string=string):
+            self.assertEqual(p2.findall(string), p1.findall(string))
+            self.assertEqual(p2.split(string), p1.split(string))
+            repl = string[:0]
+            self.assertEqual(p2.sub(repl, string), p1.sub(repl, string))
+            self.assertEqual([m.regs for m in p2.finditer(string)],
+                             [m.regs for m in p1.finditer(string)])
+
+    def test_basic(self):
+        p = re.compile(r'(\w+)@(\w+)\.com', re.LINEAR)
+        self.assertEqual(p.flags, re.LINEAR | re.UNICODE)
+        m = p.search('mail: user@example.com!')
+        self.assertEqual(m.span(), (6, 22))
+        self.assertEqual(m.groups(), ('user', 'example'))
+        self.assertEqual(m.lastindex, 2)
+        self.assertIsNone(p.match('mail: user@example.com'))
+        self.assertEqual(p.findall('a@b.com, c@d.com'),
+                         [('a', 'b'), ('c', 'd')])
+        self.assertEqual(re.sub('a|b', 'x', 'abc', flags=re.LINEAR), 'xxc')
+        self.assertEqual(re.split(',', 'a,b,,c', flags=re.LINEAR),
+                         ['a', 'b', '', 'c'])
+        self.assertEqual(re.fullmatch(b'[0-9]+', b'123', re.LINEAR).span(),
+                         (0, 3))
+
+    def test_same_results(self):
+        strings = ['', 'a', 'ab', 'aab', 'abab', 'b a\nab', 'xaaay']
+        for pattern in [
+            r'a', r'a|b', r'ab|a', r'a*', r'a*?', r'a+', r'a+?', r'a?',
+            r'a??', r'a{2}', r'a{1,2}', r'a{1,2}?', r'a{2,}', r'(a)(b)?',
+            r'(a|ab)(b*)', r'((a)|b)+', r'(a|(b))*?', r'(?:(a)|b)*',
+            r'(a*)*', r'(a*)+', r'(a*?)*', r'(a|)+', r'(a?)*?b',
+            r'((a*)*)*', r'(?:(a*)|b)*', r'(a*|b)*', r'(?:a?){2,3}',
+            r'(?:(a)?){1,3}?', r'^a', r'a$', r'\ba', r'\Ba', r'\Aa',
+            r'b\Z', r'(?m)^a', r'(?m)b$', r'.', r'(?s).+', r'[^a]+',
+            r'\w+', r'\s', r'(?i)A+B', r'(?P<x>a)(?P<y>b)?',
+            ]:
+            for string in strings:
+                self.check_same(pattern, string)
+
+    def test_search_position(self):
+        p = re.compile(r'a+', re.LINEAR)
+        self.assertEqual(p.search('xaay', 2).span(), (2, 3))
+        self.assertIsNone(p.search('xaay', 0, 1))
+        self.assertEqual(p.match('xaay', 1).span(), (1, 3))
+        self.assertIsNone(p.fullmatch('xaay', 1))
+        self.assertEqual(p.fullmatch('xaay', 1, 3).span(), (1, 3))
+        self.assertEqual(re.search(r'\Bb', 'ab', re.LINEAR).span(), (1, 2))
+        self.assertIsNone(re.search(r'^b', 'ab', re.LINEAR))
+        self.assertEqual(p.scanner('aaxa').search().span(), (0, 2))
+
+    def test_ignorecase(self):
+        self.check_same('(?i)ſ', 's')
+        self.check_same('(?i)[a-z]+', 'İıſK')
+        self.check_same('(?i)K', '\u212a')
+        self.check_same(b'(?i)a[B-C]', b'Ab aC')
+        self.check_same('(?ia)K', '\u212a')
+
+    def test_unicode(self):
+        for charsize in '\xe0', '\u0100', '\U00010000':
+            s = charsize + 'a' + charsize * 2
+            self.check_same(charsize + '+', s)
+            self.check_same(r'(\w)(\w)?', s)
+
+    def test_no_catastrophic_backtracking(self):
+        # These take exponential time with the backtracking engine.
+        s = 'a' * 10000 + 'b'
+        self.assertIsNone(re.match(r'(a+)+$', s, re.LINEAR))
+        self.assertIsNone(re.match(r'(a|aa)*$', s, re.LINEAR))
+        self.assertIsNone(re.search(r'(a*)*c', s, re.LINEAR))
+        self.assertIsNone(re.fullmatch(r'(?:a|a?)+', s, re.LINEAR))
+        self.assertEqual(re.match(r'(a+)+b', s, re.LINEAR).span(1),
+                         (0, 10000))
+
+    def test_deeply_nested(self):
+        # The work stack grows with the nesting depth, not only with the
+        # size of the program.
+        self.assertEqual(re.compile('(' * 16 + 'a?' + ')*' * 16,
+                                    re.LINEAR).search('a').span(), (0, 1))
+        for depth in 20, 30, 40, 60, 100:
+            pattern = '(' * depth + 'a?' + ')*' * depth
+            for string in 'a', 'aaa', 'baab':
+                self.check_same(pattern, string)
+
+    def test_unsupported(self):
+        for pattern in [r'(a)\1', r'(?P<a>a)(?P=a)', r'a(?=b)', r'a(?!b)',
+                        r'(?<=a)b', r'(?<!a)b', r'(a)?(?(1)b|c)',
+                        r'(?>a)', r'a*+', r'a?+', r'(?:ab){1,2}+']:
+            with self.subTest(pattern=pattern):
+                self.assertIsNotNone(re.compile(pattern))
+                with self.assertRaisesRegex(re.PatternError,
+                                            'not supported by the '
+                                            'linear-time engine'):
+                    re.compile(pattern, re.LINEAR)
+
+    def test_too_large(self):
+        re.compile(r'a{1000}', re.LINEAR)
+        with self.assertRaisesRegex(re.PatternError, 'pattern too large'):
+            re.compile(r'(?:a{1000}){1000}', re.LINEAR)
+        with self.assertRaisesRegex(re.PatternError, 'pattern too large'):
+            re.compile(r'(?:a{,1000}){1000}', re.LINEAR)
+
+    def test_copy_pickle(self):
+        import copy, pickle
+        p = re.compile(r'(a)+', re.LINEAR)
+        self.assertIs(copy.copy(p), p)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            q = pickle.loads(pickle.dumps(p, proto))
+            self.assertEqual(q, p)
+            self.assertEqual(q.flags, p.flags)
+            self.assertEqual(q.match('aa').span(1), (1, 2))
+
+
+class PatternSetTests(unittest.TestCase):
+
+    def check_same(self, patterns, string, flags=0):
+        # The result must agree with matching each pattern separately.
+        ps = re.compile_set(patterns, flags)
+        for meth in 'match', 'fullmatch', 'search':
+            expected = {}
+            for i, pattern in enumerate(patterns):
+                m = getattr(re.compile(pattern, flags), meth)(string)
+                if m is not None:
+                    expected[i] = m.span()
+            with self.subTest(patterns=patterns, string=string, method=meth):
+                self.assertEqual(getattr(ps, meth)(string), expected)
+
+    def test_basic(self):
+        ps = re.compile_set([r'\d+', r'[a-z]+', r'!', r'(x|y)z'])
+        self.assertEqual(ps.patterns, (r'\d+', r'[a-z]+', r'!', r'(x|y)z'))
+        self.assertEqual(ps.flags, re.NOFLAG)
+        self.assertEqual(ps.search('ABC abc 123'), {0: (8, 11), 1: (4, 7)})
+        self.assertEqual(ps.match('abc 123'), {1: (0, 3)})
+        self.assertEqual(ps.fullmatch('yz'), {1: (0, 2), 3: (0, 2)})
+        self.assertEqual(ps.search('ABC'), {})
+        self.assertEqual(ps.search('abc 123', 2), {0: (4, 7), 1: (2, 3)})
+        self.assertEqual(ps.search('abc 123', 0, 5), {0: (4, 5), 1: (0, 3)})
+        self.assertEqual(ps.fullmatch('abc 123', 4), {0: (4, 7)})
+        self.assertEqual(re.compile_set(iter(['a'])).search('ba'), {0: (1, 2)})
+
+    def test_bytes(self):
+        ps = re.compile_set([rb'\d+', rb'[a-z]+'])
+        self.assertEqual(ps.search(b'ABC 123'), {0: (4, 7)})
+        self.assertEqual(ps.search(bytearray(b'x')), {1: (0, 1)})
+        self.assertRaises(TypeError, ps.search, 'ABC 123')
+        self.assertRaises(TypeError, re.compile_set([r'\d+']).search, b'1')
+        self.assertRaisesRegex(TypeError, 'all str or all bytes',
+                               re.compile_set, ['a', b'b'])
+        self.assertRaises(TypeError, re.compile_set, [bytearray(b'a')])
+
+    def test_empty(self):
+        ps = re.compile_set([])
+        self.assertEqual(ps.search('abc'), {})
+        self.assertEqual(ps.search(b'abc'), {})
+        self.assertEqual(re.compile_set(['']).search('abc'), {0: (0, 0)})
+        self.assertEqual(re.compile_set(['']).fullmatch('abc'), {})
+
+    def test_flags(self):
+        ps = re.compile_set(['abc', '(?-i:d)'], re.IGNORECASE)
+        self.assertEqual(ps.flags, re.IGNORECASE)
+        self.assertEqual(ps.search('ABCD'), {0: (0, 3)})
+        self.assertEqual(ps.search('ABCd'), {0: (0, 3), 1: (3, 4)})
+        ps = re.compile_set(['^b', 'c$'], re.M)
+        self.assertEqual(ps.search('a\nb\nc\n'), {0: (2, 3), 1: (4, 5)})
+
+    def test_same_results(self):
+        patterns = [r'a+', r'a+?', r'(a|ab)(c|bcd)', r'\bb\w*', r'^$',
+                    r'(?:a|b)*?c', r'x?', r'[^ab]+', r'(a*)+$', r'b{2,3}']
+        for string in ['', 'a', 'ab', 'abcd', 'abbbc', 'bb a bbb', 'c\n']:
+            self.check_same(patterns, string)
+            self.check_same(patterns[::-1], string)
+            self.check_same(patterns, string, re.IGNORECASE)
+
+    def test_many_patterns(self):
+        words = ['word%d' % i for i in range(500)]
+        ps = re.compile_set([r'\b%s\b' % w for w in words])
+        text = ' '.join(words[::7]) + ' word4999'
+        result = ps.search(text)
+        self.assertEqual(sorted(result), list(range(0, 500, 7)))
+        for i, (start, end) in result.items():
+            self.assertEqual(text[start:end], words[i])
+
+    def test_no_catastrophic_backtracking(self):
+        ps = re.compile_set([r'(a+)+$', r'(a|aa)+b'])
+        self.assertEqual(ps.search('a' * 10000 + 'c'), {})
+
+    def test_deeply_nested(self):
+        # The backtracking engine takes exponential time on some of these.
+        for depth in 16, 30, 60:
+            ps = re.compile_set(['b', '(' * depth + 'a?' + ')*' * depth,
+                                 '(?:' * depth + 'a' + ')*' * depth + 'b'])
+            with self.subTest(depth=depth):
+                self.assertEqual(ps.search('aaa'), {1: (0, 3)})
+                self.assertEqual(ps.fullmatch('aaa'), {1: (0, 3)})
+                self.assertEqual(ps.search('baab'),
+                                 {0: (0, 1), 1: (0, 0), 2: (0, 1)})
+                self.assertEqual(ps.search('aab', 1),
+                                 {0: (2, 3), 1: (1, 2), 2: (1, 3)})
+
+    def test_unsupported(self):
+        with self.assertRaisesRegex(re.PatternError, 'not supported'):
+            re.compile_set(['a', r'(a)\1'])
+        with self.assertRaises(re.PatternError):
+            re.compile_set(['a', '('])
+
+    def test_no_pattern_methods(self):
+        # The compiled program cannot be run by the Pattern methods.
+        ps = re.compile_set(['a'])
+        for value in vars(ps).values():
+            self.assertNotIsInstance(value, re.Pattern)
+        self.assertEqual(ps.search('ba', 0, None), {0: (1, 2)})
+        self.assertEqual(ps.search('ba', endpos=1), {})
+
+    def test_repr(self):
+        self.assertEqual(repr(re.compile_set(['a', 'b'])),
+                         "re.compile_set(('a', 'b'))")
+        self.assertEqual(repr(re.compile_set([b'a'], re.I)),
+                         "re.compile_set((b'a',), re.IGNORECASE)")
+
+
 def get_debug_out(pat):
     with captured_stdout() as out:
         re.compile(pat, re.DEBUG)
@@ -2803,6 +3070,65 @@ def test_possesive_repeat(self):
 14. SUCCESS
 ''')
 
+    def test_required_literal(self):
+        self.assertEqual(get_debug_out(r'\d+-x{1,2}ab'), '''\
+MAX_REPEAT 1 MAXREPEAT
+  IN
+    CATEGORY CATEGORY_DIGIT
+LITERAL 45
+MAX_REPEAT 1 2
+  LITERAL 120
+LITERAL 97
+LITERAL 98
+
+ 0. INFO 18 0b1000 5 MAXREPEAT (to 19)
+      required 3 MAXREPEAT [0x61, 0x62] ('ab')
+      in
+11.     CATEGORY UNI_DIGIT
+13.     LITERAL 0x2d ('-')
+15.     LITERAL 0x78 ('x')
+17.     FAILURE
+19: REPEAT_ONE 9 1 MAXREPEAT (to 29)
+23.   IN 4 (to 28)
+25.     CATEGORY UNI_DIGIT
+27.     FAILURE
+28:   SUCCESS
+29: LITERAL 0x2d ('-')
+31. REPEAT_ONE 6 1 2 (to 38)
+35.   LITERAL 0x78 ('x')
+37.   SUCCESS
+38: LITERAL 0x61 ('a')
+40. LITERAL 0x62 ('b')
+42. SUCCESS
+''')
+
+
+    def test_linear(self):
+        with captured_stdout() as out:
+            re.compile(r'(a|b)*?c', re.DEBUG | re.LINEAR)
+        self.assertEqual(out.getvalue(), '''\
+MIN_REPEAT 0 MAXREPEAT
+  SUBPATTERN 1 0 0
+    IN
+      LITERAL 97
+      LITERAL 98
+LITERAL 99
+
+ 0. LINEAR 30 1 1 3
+ 5. SPLIT 27 9 0
+ 9: LOOP_BEGIN 0
+11. MARK 0
+13. IN 5 (to 19)
+15.   RANGE 0x61 0x62 ('a'-'b')
+18.   FAILURE
+19: MARK 1
+21. LOOP_END 0 (to 26)
+24. GOTO (to 5)
+26: FAILURE
+27: LITERAL 0x63 ('c')
+29. SUCCESS
+''')
+
 
 class PatternReprTests(unittest.TestCase):
     def check(self, pattern, expected):
@@ -2877,11 +3203,11 @@ def test_flags_repr(self):
                          "re.IGNORECASE|re.DOTALL|re.VERBOSE|0x100000")
         self.assertEqual(
                 repr(~re.I),
-                "re.ASCII|re.LOCALE|re.UNICODE|re.MULTILINE|re.DOTALL|re.VERBOSE|re.DEBUG|0x1")
+                "re.ASCII|re.LOCALE|re.UNICODE|re.MULTILINE|re.DOTALL|re.VERBOSE|re.LINEAR|re.DEBUG|0x1")
         self.assertEqual(repr(~(re.I|re.S|re.X)),
-                         "re.ASCII|re.LOCALE|re.UNICODE|re.MULTILINE|re.DEBUG|0x1")
+                         "re.ASCII|re.LOCALE|re.UNICODE|re.MULTILINE|re.LINEAR|re.DEBUG|0x1")
         self.assertEqual(repr(~(re.I|re.S|re.X|(1<<20))),
-                         "re.ASCII|re.LOCALE|re.UNICODE|re.MULTILINE|re.DEBUG|0xffe01")
+                         "re.ASCII|re.LOCALE|re.UNICODE|re.MULTILINE|re.LINEAR|re.DEBUG|0xffc01")
 
 
 class ImplementationTest(unittest.TestCase):
@@ -3133,6 +3459,27 @@ def test_re_tests(self):
                     obj = re.compile(pattern, re.UNICODE)
                     self.assertTrue(obj.search(s))
 
+    def test_re_tests_linear(self):
+        're_tests test suite with the linear-time engine'
+        from test.re_tests import tests, SYNTAX_ERROR
+        for t in tests:
+            pattern, s, outcome = t[:3]
+            if outcome == SYNTAX_ERROR:
+                continue
+            with self.subTest(pattern=pattern, string=s):
+                try:
+                    obj = re.compile(pattern, re.LINEAR)
+                except re.PatternError as e:
+                    self.assertIn('linear-time engine', str(e))
+                    continue
+                expected = re.compile(pattern).search(s)
+                result = obj.search(s)
+                if expected is None:
+                    self.assertIsNone(result)
+                else:
+                    self.assertEqual(result.regs, expected.regs)
+                    self.assertEqual(result.lastindex, expected.lastindex)
+
 
 if __name__ == "__main__":
     unittest.main()
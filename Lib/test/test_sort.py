@@ -407,5 +407,65 @@ def test_none_in_tuples(self):
 
 #==============================================================================
 
+class TestParallelSort(unittest.TestCase):
+    # Too small to be cut into slices, so these only check that the workers
+    # argument does not change the result; TestParallelSortLarge sorts in
+    # parallel.
+    n = 3000
+
+    def check(self, data, **kwargs):
+        expected = sorted(data, **kwargs)
+        for workers in (2, 3, 8):
+            with self.subTest(workers=workers):
+                result = sorted(data, workers=workers, **kwargs)
+                self.assertEqual(result, expected)
+                for x, y in zip(result, expected):
+                    self.assertIs(x, y)
+
+    def test_ints(self):
+        data = [random.randrange(1000) for i in range(self.n)]
+        self.check(data)
+        self.check(data, reverse=True)
+
+    def test_floats(self):
+        data = [random.random() for i in range(self.n)]
+        self.check(data)
+        self.check(sorted(data))
+        self.check(sorted(data, reverse=True))
+
+    def test_strings(self):
+        data = [str(random.randrange(10_000)) for i in range(self.n)]
+        self.check(data)
+
+    def test_stability(self):
+        data = [(random.randrange(100), i) for i in range(self.n)]
+        self.check(data, key=lambda x: x[0])
+        self.check(data, key=lambda x: x[0], reverse=True)
+
+    def test_unsupported_keys(self):
+        # Serial sort for keys which need Python comparisons.
+        data = [(random.randrange(100),) for i in range(self.n)]
+        self.check(data)
+        data = [random.randrange(1 << 70) for i in range(self.n)]
+        self.check(data)
+
+    def test_small(self):
+        for n in range(5):
+            data = [random.random() for i in range(n)]
+            self.assertEqual(sorted(data, workers=4), sorted(data))
+
+    def test_invalid_workers(self):
+        self.assertRaises(ValueError, [].sort, workers=0)
+        self.assertRaises(ValueError, sorted, [2, 1], workers=-1)
+        self.assertRaises(TypeError, [].sort, workers=2.0)
+        self.assertRaises(TypeError, [].sort, 2)
+
+@support.requires_resource('cpu')
+class TestParallelSortLarge(TestParallelSort):
+    # Large enough to be cut into several slices.
+    n = 300_000
+
+#==============================================================================
+
 if __name__ == "__main__":
     unittest.main()
@@ -444,6 +444,30 @@ def test_connection_limits(self):
         finally:  # restore saved limit
             self.cx.setlimit(category, saved_limit)
 
+    def test_statement_cache_info(self):
+        with memory_database() as cx:
+            info = cx.statement_cache_info()
+            self.assertEqual(info, (0, 0, 0, 128, 0))
+            self.assertEqual(info.maxsize, 128)
+        with memory_database(cached_statements=2) as cx:
+            for sql in "select 1", "select 2", "select 1", "select 1":
+                cx.execute(sql)
+            info = cx.statement_cache_info()
+            self.assertEqual((info.hits, info.misses, info.evictions,
+                              info.maxsize, info.currsize), (2, 2, 0, 2, 2))
+            cx.execute("select 3")
+            self.assertEqual(cx.statement_cache_info(), (2, 3, 1, 2, 2))
+            # Errors are counted as misses but are not cached.
+            self.assertRaises(sqlite.OperationalError, cx.execute, "selec")
+            self.assertEqual(cx.statement_cache_info(), (2, 4, 1, 2, 2))
+            # Statements prepared directly do not use the cache.
+            cx("select 4")
+            self.assertEqual(cx.statement_cache_info(), (2, 4, 1, 2, 2))
+        with memory_database(cached_statements=0) as cx:
+            cx.execute("select 1")
+            cx.execute("select 1")
+            self.assertEqual(cx.statement_cache_info(), (0, 2, 0, 0, 0))
+
     def test_connection_bad_limit_category(self):
         msg = "'category' is out of bounds"
         cat = 1111
@@ -1027,6 +1051,79 @@ def test_execute_many_not_iterable(self):
         with self.assertRaises(TypeError):
             self.cu.executemany("insert into test(income) values (?)", 42)
 
+    def test_execute_many_columns(self):
+        self.cu.execute("delete from test")
+        self.cu.executemany("insert into test(id, name, income) values (?, ?, ?)",
+                            columns=[(1, 2, 3), ["a", None, "c"], [0.5, 1, 2.5]])
+        self.assertEqual(self.cu.rowcount, 3)
+        self.cu.execute("select id, name, income from test order by id")
+        self.assertEqual(self.cu.fetchall(),
+                         [(1, "a", 0.5), (2, None, 1), (3, "c", 2.5)])
+
+        self.cx.executemany("insert into test(id) values (?)",
+                            columns=[range(10, 13)])
+        self.cu.execute("select id from test where id >= 10 order by id")
+        self.assertEqual(self.cu.fetchall(), [(10,), (11,), (12,)])
+
+    def test_execute_many_columns_buffers(self):
+        import array
+        self.cu.execute("delete from test")
+        for typecode in "bBhHiIlLqQfd":
+            with self.subTest(typecode=typecode):
+                values = array.array(typecode, [0, 1, 2])
+                ids = array.array("q", [1, 2, 3])
+                self.cu.executemany("insert into test(id, income) values (?, ?)",
+                                    columns=[ids, memoryview(values)])
+                self.cu.execute("select income from test order by id")
+                self.assertEqual(self.cu.fetchall(), [(0,), (1,), (2,)])
+                self.cu.execute("delete from test")
+        # Strided buffers.
+        values = memoryview(array.array("d", [0.5, -1, 1.5, -1]))[::2]
+        self.cu.executemany("insert into test(income) values (?)",
+                            columns=[values])
+        self.cu.execute("select income from test order by id")
+        self.assertEqual(self.cu.fetchall(), [(0.5,), (1.5,)])
+
+    def test_execute_many_columns_errors(self):
+        import array
+        sql = "insert into test(id, name) values (?, ?)"
+        with self.assertRaises(TypeError):
+            self.cu.executemany(sql, [(1, 2)], columns=[[1], [2]])
+        with self.assertRaises(TypeError):
+            self.cu.executemany(sql)
+        with self.assertRaises(TypeError):
+            self.cu.executemany(sql, columns=42)
+        with self.assertRaises(TypeError):
+            self.cu.executemany(sql, columns=[[1], 2])
+        for column in "ab", b"ab", bytearray(b"ab"):
+            with self.assertRaises(TypeError):
+                self.cu.executemany(sql, columns=[[1, 2], column])
+        with self.assertRaises(TypeError):
+            self.cu.executemany(sql, columns=[[1], memoryview(b"ab").cast("c")])
+        with self.assertRaises(TypeError):
+            self.cu.executemany(sql, columns=[[1, 2], memoryview(b"ab").cast("B", (1, 2))])
+        with self.assertRaisesRegex(sqlite.ProgrammingError, "different lengths"):
+            self.cu.executemany(sql, columns=[[1, 2], ["a"]])
+        with self.assertRaisesRegex(sqlite.ProgrammingError,
+                                    "Incorrect number of bindings"):
+            self.cu.executemany(sql, columns=[[1]])
+        with self.assertRaisesRegex(sqlite.ProgrammingError, "named parameter"):
+            self.cu.executemany("insert into test(id) values (:id)",
+                                columns=[[1]])
+        with self.assertRaises(OverflowError):
+            self.cu.executemany(sql, columns=[array.array("Q", [2**63]), [None]])
+        with self.assertRaises(sqlite.IntegrityError):
+            self.cu.executemany(sql, columns=[[100, 100], ["a", "b"]])
+
+    def test_execute_many_columns_adapters(self):
+        class Point:
+            def __conform__(self, protocol):
+                return "point"
+        self.cu.executemany("insert into test(id, name) values (?, ?)",
+                            columns=[[10], [Point()]])
+        self.cu.execute("select name from test where id = 10")
+        self.assertEqual(self.cu.fetchone(), ("point",))
+
     def test_fetch_iter(self):
         # Optional DB-API extension.
         self.cu.execute("delete from test")
@@ -1535,6 +1632,7 @@ def test_check_connection_thread(self):
             lambda: self.con.setlimit(sqlite.SQLITE_LIMIT_LENGTH, -1),
             lambda: self.con.getlimit(sqlite.SQLITE_LIMIT_LENGTH),
             lambda: self.con.blobopen("test", "b", 1),
+            lambda: self.con.statement_cache_info(),
         ]
         if hasattr(sqlite.Connection, "serialize"):
             fns.append(lambda: self.con.serialize())
@@ -1740,6 +1838,9 @@ def progress():
     def test_closed_call(self):
         self.check(self.con)
 
+    def test_closed_statement_cache_info(self):
+        self.check(self.con.statement_cache_info)
+
 
 class ClosedCurTests(MemoryDatabaseMixin, unittest.TestCase):
     def test_closed(self):
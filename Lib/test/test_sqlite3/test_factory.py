@@ -261,6 +261,61 @@ class FakeCursor(str):
         self.assertRaises(TypeError, sqlite.Row, FakeCursor(), ())
 
 
+class BuiltinRowFactoryTests(MemoryDatabaseMixin, unittest.TestCase):
+
+    def test_dict_row(self):
+        self.con.row_factory = sqlite.dict_row
+        rows = self.con.execute("select 1 as a, 'x' as b union select 2, null"
+                                " order by a").fetchall()
+        self.assertEqual(rows, [{"a": 1, "b": "x"}, {"a": 2, "b": None}])
+        # The column names are updated for each query.
+        row = self.con.execute("select 3 as c").fetchone()
+        self.assertEqual(row, {"c": 3})
+        self.assertEqual(repr(sqlite.dict_row), "sqlite3.dict_row")
+
+    def test_class_row(self):
+        from collections import namedtuple
+        Point = namedtuple("Point", "x y")
+        self.con.row_factory = sqlite.class_row(Point)
+        row = self.con.execute("select 2 as y, 1 as x").fetchone()
+        self.assertEqual(row, Point(1, 2))
+        with self.assertRaises(TypeError):
+            self.con.execute("select 1 as z").fetchone()
+        self.assertEqual(repr(sqlite.class_row(Point)),
+                         f"sqlite3.class_row({Point!r})")
+        self.assertRaises(TypeError, sqlite.class_row, 42)
+        self.assertRaises(TypeError, sqlite.class_row)
+
+    def test_typed_row(self):
+        self.con.row_factory = sqlite.typed_row(str, float, None)
+        row = self.con.execute("select 1, 2, 3").fetchone()
+        self.assertEqual(row, ("1", 2.0, 3))
+        self.assertIs(type(row[1]), float)
+        row = self.con.execute("select null, 2.5, 'x'").fetchone()
+        self.assertEqual(row, (None, 2.5, "x"))
+        with self.assertRaises(ValueError):
+            self.con.execute("select 1").fetchone()
+        self.con.row_factory = sqlite.typed_row(int)
+        with self.assertRaises(ValueError):
+            self.con.execute("select 'x'").fetchone()
+        self.assertEqual(repr(sqlite.typed_row(int, None)),
+                         "sqlite3.typed_row(<class 'int'>, None)")
+        self.assertRaises(TypeError, sqlite.typed_row, 42)
+
+    def test_call(self):
+        cur = self.con.execute("select 1 as a, 2 as b")
+        self.assertEqual(sqlite.dict_row(cur, (1, 2)), {"a": 1, "b": 2})
+        self.assertEqual(sqlite.typed_row(str, None)(None, (1, 2)), ("1", 2))
+        self.assertRaises(TypeError, sqlite.dict_row, None, (1, 2))
+        self.assertRaises(TypeError, sqlite.dict_row, cur, [1, 2])
+        self.assertRaises(TypeError, sqlite.dict_row, cur)
+        self.assertRaises(TypeError, sqlite.dict_row, cur, (1, 2), x=1)
+        self.assertRaises(ValueError, sqlite.dict_row, cur, (1,))
+        cur = self.con.cursor()
+        self.assertRaises(sqlite.ProgrammingError, sqlite.dict_row, cur, ())
+        self.assertRaises(TypeError, type(sqlite.dict_row))
+
+
 class TextFactoryTests(MemoryDatabaseMixin, unittest.TestCase):
 
     def test_unicode(self):
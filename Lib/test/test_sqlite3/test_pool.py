@@ -0,0 +1,130 @@
+import sqlite3 as sqlite
+import threading
+import unittest
+
+from test.support import os_helper, threading_helper
+
+
+class ConnectionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        self.pool = sqlite.ConnectionPool(os_helper.TESTFN)
+        self.addCleanup(self.pool.close)
+
+    def test_reuse(self):
+        with self.pool.connection() as cx:
+            cx.execute("create table t(x)")
+            cx.commit()
+        with self.pool.connection() as cx2:
+            self.assertIs(cx2, cx)
+            self.assertEqual(cx2.execute("select count(*) from t").fetchone(),
+                             (0,))
+
+    def test_statement_cache_reused(self):
+        for i in range(3):
+            with self.pool.connection() as cx:
+                cx.execute("select 1")
+        info = cx.statement_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+
+    def test_nested(self):
+        with self.pool.connection() as cx:
+            with self.pool.connection() as cx2:
+                self.assertIs(cx2, cx)
+            self.assertEqual(self.pool._idle, [])
+        self.assertEqual(self.pool._idle, [cx])
+
+    @threading_helper.requires_working_threading()
+    def test_threads(self):
+        results = []
+        def target():
+            with self.pool.connection() as cx:
+                results.append(cx)
+                cx.execute("select 1")
+        with self.pool.connection() as cx:
+            t = threading.Thread(target=target)
+            t.start()
+            t.join()
+        self.assertIsNot(results[0], cx)
+        self.assertEqual(self.pool._size, 2)
+
+    @threading_helper.requires_working_threading()
+    def test_max_connections(self):
+        pool = sqlite.ConnectionPool(os_helper.TESTFN, max_connections=1)
+        self.addCleanup(pool.close)
+        checked_out = threading.Event()
+        results = []
+        def target():
+            checked_out.set()
+            with pool.connection() as cx:
+                results.append(cx)
+        with pool.connection() as cx:
+            t = threading.Thread(target=target)
+            t.start()
+            checked_out.wait()
+            t.join(0.1)
+            self.assertTrue(t.is_alive())
+            self.assertEqual(results, [])
+        t.join()
+        self.assertEqual(results, [cx])
+
+    def test_pragmas(self):
+        pool = sqlite.ConnectionPool(os_helper.TESTFN, pragmas={
+            "journal_mode": "wal", "foreign_keys": True, "cache_size": -1000,
+        })
+        self.addCleanup(pool.close)
+        with pool.connection() as cx:
+            self.assertEqual(cx.execute("pragma journal_mode").fetchone(),
+                             ("wal",))
+            self.assertEqual(cx.execute("pragma foreign_keys").fetchone(),
+                             (1,))
+            self.assertEqual(cx.execute("pragma cache_size").fetchone(),
+                             (-1000,))
+
+    def test_connect_arguments(self):
+        pool = sqlite.ConnectionPool(os_helper.TESTFN, autocommit=True,
+                                     factory=sqlite.Connection)
+        self.addCleanup(pool.close)
+        with pool.connection() as cx:
+            self.assertIs(cx.autocommit, True)
+        with self.assertRaises(TypeError):
+            sqlite.ConnectionPool(os_helper.TESTFN, check_same_thread=True)
+        with self.assertRaises(ValueError):
+            sqlite.ConnectionPool(os_helper.TESTFN, max_connections=0)
+
+    def test_rollback_on_release(self):
+        with self.pool.connection() as cx:
+            cx.execute("create table t(x)")
+            cx.commit()
+            cx.execute("insert into t values (1)")
+            self.assertTrue(cx.in_transaction)
+        self.assertFalse(cx.in_transaction)
+        with self.pool.connection() as cx:
+            self.assertEqual(cx.execute("select count(*) from t").fetchone(),
+                             (0,))
+
+    def test_closed_connection_discarded(self):
+        with self.pool.connection() as cx:
+            cx.close()
+        self.assertEqual(self.pool._size, 0)
+        with self.pool.connection() as cx2:
+            self.assertIsNot(cx2, cx)
+
+    def test_close(self):
+        with self.pool as pool:
+            with pool.connection() as idle:
+                pass
+            with pool.connection() as cx:
+                pool.close()
+                self.assertEqual(cx.execute("select 1").fetchone(), (1,))
+            self.assertRaises(sqlite.ProgrammingError, idle.execute, "select 1")
+            self.assertRaises(sqlite.ProgrammingError, cx.execute, "select 1")
+            with self.assertRaises(sqlite.ProgrammingError):
+                with pool.connection():
+                    pass
+        self.assertEqual(pool._size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
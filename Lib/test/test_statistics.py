@@ -3322,6 +3322,247 @@ def tearDown(self):
         sys.modules['statistics'] = statistics
 
 
+class TestStreaming:
+
+    def test_running_stats(self):
+        RunningStats = self.module.RunningStats
+        data = [random.uniform(-100.0, 1000.0) for i in range(500)]
+        stats = RunningStats(data[:200])
+        stats.update(data[200:499])
+        stats.add(data[499])
+        self.assertEqual(stats.count, len(data))
+        self.assertAlmostEqual(stats.mean, statistics.fmean(data))
+        self.assertAlmostEqual(stats.variance, statistics.variance(data))
+        self.assertAlmostEqual(stats.pvariance, statistics.pvariance(data))
+        self.assertAlmostEqual(stats.stdev, statistics.stdev(data))
+        self.assertAlmostEqual(stats.pstdev, statistics.pstdev(data))
+        self.assertEqual(stats.min, min(data))
+        self.assertEqual(stats.max, max(data))
+        self.assertEqual(repr(stats), '<RunningStats count=500>')
+
+        stats = RunningStats([Fraction(1, 2), Decimal('2.5'), True])
+        self.assertEqual(stats.mean, 4.0 / 3.0)
+        self.assertIsInstance(stats.min, float)
+
+    def test_running_stats_stability(self):
+        # The naive sum of squares formula loses all precision here.
+        stats = self.module.RunningStats([1e9 + 4, 1e9 + 7, 1e9 + 13,
+                                          1e9 + 16])
+        self.assertEqual(stats.mean, 1e9 + 10)
+        self.assertEqual(stats.variance, 30.0)
+
+    def test_running_stats_empty(self):
+        StatisticsError = self.module.StatisticsError
+        stats = self.module.RunningStats()
+        self.assertEqual(stats.count, 0)
+        for attr in ('mean', 'variance', 'pvariance', 'stdev', 'pstdev',
+                     'min', 'max'):
+            with self.subTest(attr=attr):
+                with self.assertRaises(StatisticsError):
+                    getattr(stats, attr)
+        stats.add(5)
+        self.assertEqual(stats.pvariance, 0.0)
+        self.assertEqual(stats.mean, 5.0)
+        with self.assertRaises(StatisticsError):
+            stats.variance
+        with self.assertRaises(TypeError):
+            self.module.RunningStats(data=[1, 2])
+
+    def test_running_stats_merge(self):
+        RunningStats = self.module.RunningStats
+        data = [random.gauss(50.0, 10.0) for i in range(300)]
+        parts = [RunningStats(data[i:i+100]) for i in range(0, 300, 100)]
+        total = RunningStats()
+        for part in parts:
+            total.merge(part)
+        total.merge(RunningStats())
+        expected = RunningStats(data)
+        self.assertEqual(total.count, 300)
+        self.assertAlmostEqual(total.mean, expected.mean)
+        self.assertAlmostEqual(total.variance, expected.variance)
+        self.assertEqual(total.min, expected.min)
+        self.assertEqual(total.max, expected.max)
+
+        stats = RunningStats([1, 2, 3])
+        stats.merge(stats)
+        self.assertEqual(stats.count, 6)
+        self.assertEqual(stats.mean, 2.0)
+        self.assertEqual(stats.pvariance, 2.0 / 3.0)
+        with self.assertRaises(TypeError):
+            stats.merge(self.module.RunningCovariance())
+
+    def test_running_covariance(self):
+        RunningCovariance = self.module.RunningCovariance
+        x = [random.uniform(0.0, 10.0) for i in range(200)]
+        y = [2.0 * xi + random.gauss(0.0, 1.0) for xi in x]
+        acc = RunningCovariance(x[:50], y[:50])
+        acc.update(x[50:199], y[50:199])
+        acc.add(x[199], y[199])
+        self.assertEqual(acc.count, 200)
+        self.assertAlmostEqual(acc.covariance, statistics.covariance(x, y))
+        self.assertAlmostEqual(acc.correlation, statistics.correlation(x, y))
+        self.assertEqual(repr(acc), '<RunningCovariance count=200>')
+
+        left = RunningCovariance(x[:120], y[:120])
+        left.merge(RunningCovariance(x[120:], y[120:]))
+        self.assertAlmostEqual(left.covariance, acc.covariance)
+        self.assertAlmostEqual(left.correlation, acc.correlation)
+
+    def test_running_covariance_errors(self):
+        RunningCovariance = self.module.RunningCovariance
+        StatisticsError = self.module.StatisticsError
+        acc = RunningCovariance([1], [2])
+        with self.assertRaises(StatisticsError):
+            acc.covariance
+        with self.assertRaises(StatisticsError):
+            acc.correlation
+        acc = RunningCovariance([1, 2, 3], [5, 5, 5])
+        self.assertEqual(acc.covariance, 0.0)
+        with self.assertRaises(StatisticsError):
+            acc.correlation
+        with self.assertRaises(ValueError):
+            RunningCovariance([1, 2, 3], [1, 2])
+        with self.assertRaises(TypeError):
+            acc.merge(self.module.RunningStats())
+
+    def test_quantile_sketch_small(self):
+        # Every data point gets its own centroid, so the results are exact.
+        QuantileSketch = self.module.QuantileSketch
+        data = [random.randrange(1000) for i in range(50)]
+        sketch = QuantileSketch(data)
+        self.assertEqual(sketch.count, 50)
+        self.assertEqual(sketch.min, min(data))
+        self.assertEqual(sketch.max, max(data))
+        self.assertEqual(sketch.compression, 100)
+        for n in (2, 4, 10, 13):
+            with self.subTest(n=n):
+                expected = statistics.quantiles(data, n=n, method='inclusive')
+                for got, want in zip(sketch.quantiles(n=n), expected,
+                                     strict=True):
+                    self.assertAlmostEqual(got, want)
+        self.assertEqual(sketch.quantile(0.0), min(data))
+        self.assertEqual(sketch.quantile(1.0), max(data))
+        self.assertEqual(QuantileSketch([7]).quantile(0.3), 7.0)
+        self.assertEqual(sketch.quantiles(n=1), [])
+
+    def test_quantile_sketch_accuracy(self):
+        QuantileSketch = self.module.QuantileSketch
+        data = [random.gauss(0.0, 1.0) for i in range(20_000)]
+        sketch = QuantileSketch(data)
+        ordered = sorted(data)
+        for p in (0.001, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999):
+            with self.subTest(p=p):
+                got = sketch.quantile(p)
+                # Compare the ranks, which is what the sketch bounds.
+                rank = bisect.bisect_left(ordered, got) / len(data)
+                self.assertLess(abs(rank - p), 0.01)
+        self.assertLess(len(sketch.__getstate__()[1]), 200)
+
+    def test_quantile_sketch_merge(self):
+        QuantileSketch = self.module.QuantileSketch
+        data = [random.expovariate(1.0) for i in range(6000)]
+        total = QuantileSketch(compression=50)
+        for i in range(0, 6000, 1000):
+            total.merge(QuantileSketch(data[i:i+1000], compression=50))
+        total.merge(QuantileSketch())
+        self.assertEqual(total.count, 6000)
+        self.assertEqual(total.min, min(data))
+        self.assertEqual(total.max, max(data))
+        ordered = sorted(data)
+        for p in (0.05, 0.5, 0.95):
+            rank = bisect.bisect_left(ordered, total.quantile(p)) / 6000
+            self.assertLess(abs(rank - p), 0.02)
+
+        sketch = QuantileSketch([1, 2, 3])
+        sketch.merge(sketch)
+        self.assertEqual(sketch.count, 6)
+        self.assertEqual(sketch.quantiles(), [1.25, 2.0, 2.75])
+        with self.assertRaises(TypeError):
+            sketch.merge(self.module.RunningStats())
+
+    def test_quantile_sketch_errors(self):
+        QuantileSketch = self.module.QuantileSketch
+        StatisticsError = self.module.StatisticsError
+        sketch = QuantileSketch()
+        self.assertEqual(sketch.count, 0)
+        for attr in ('min', 'max'):
+            with self.assertRaises(StatisticsError):
+                getattr(sketch, attr)
+        with self.assertRaises(StatisticsError):
+            sketch.quantile(0.5)
+        for x in (math.inf, -math.inf, math.nan):
+            with self.assertRaises(ValueError):
+                sketch.add(x)
+        self.assertEqual(sketch.count, 0)
+        sketch.add(1)
+        for p in (-0.1, 1.1, math.nan):
+            with self.assertRaises(ValueError):
+                sketch.quantile(p)
+        with self.assertRaises(StatisticsError):
+            sketch.quantiles(n=0)
+        with self.assertRaises(ValueError):
+            QuantileSketch(compression=0)
+        with self.assertRaises(TypeError):
+            QuantileSketch(compression=1.5)
+        self.assertEqual(repr(QuantileSketch(compression=20)),
+                         '<QuantileSketch count=0 compression=20>')
+
+    def test_pickle(self):
+        module = self.module
+        data = [random.random() for i in range(2000)]
+        objects = [
+            module.RunningStats(data),
+            module.RunningCovariance(data, reversed(data)),
+            module.QuantileSketch(data, compression=30),
+        ]
+        for obj in objects:
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(type=type(obj).__name__, proto=proto):
+                    copy = pickle.loads(pickle.dumps(obj, proto))
+                    self.assertIs(type(copy), type(obj))
+                    self.assertEqual(copy.__getstate__(), obj.__getstate__())
+        sketch = pickle.loads(pickle.dumps(objects[2]))
+        self.assertEqual(sketch.quantiles(n=10), objects[2].quantiles(n=10))
+        sketch.add(0.5)
+        self.assertEqual(sketch.count, 2001)
+
+
+class TestStreamingPython(unittest.TestCase, TestStreaming):
+    module = py_statistics
+    def setUp(self):
+        sys.modules['statistics'] = self.module
+
+    def tearDown(self):
+        sys.modules['statistics'] = statistics
+
+
+@unittest.skipUnless(c_statistics, 'requires _statistics')
+class TestStreamingC(unittest.TestCase, TestStreaming):
+    module = c_statistics
+    def setUp(self):
+        sys.modules['statistics'] = self.module
+
+    def tearDown(self):
+        sys.modules['statistics'] = statistics
+
+    def test_same_results(self):
+        data = [random.lognormvariate(0.0, 1.0) for i in range(5000)]
+        for name in ('RunningStats', 'QuantileSketch'):
+            with self.subTest(name):
+                c_obj = getattr(c_statistics, name)(data)
+                py_obj = getattr(py_statistics, name)(data)
+                self.assertEqual(c_obj.__getstate__(), py_obj.__getstate__())
+        c_sketch = c_statistics.QuantileSketch(data)
+        py_sketch = py_statistics.QuantileSketch(data)
+        self.assertEqual(c_sketch.quantiles(n=100), py_sketch.quantiles(n=100))
+
+    def test_module(self):
+        for name in ('RunningStats', 'RunningCovariance', 'QuantileSketch'):
+            self.assertEqual(getattr(c_statistics, name).__module__,
+                             'statistics')
+        self.assertIs(c_statistics.StatisticsError.__base__, ValueError)
+
+
 # === Run tests ===
 
 def load_tests(loader, tests, ignore):
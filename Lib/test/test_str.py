@@ -594,6 +594,14 @@ def test_replace(self):
                                     left + delim * 2 + right,
                                     'replace', delim * 2, repl)
 
+    def test_replace_many_subclass(self):
+        # the value of a str subclass is inserted as is, not its __str__()
+        class S(str):
+            def __str__(self):
+                return 'X'
+        self.assertEqual('a-b'.replace_many({'a': S('c'), '-': S('')}), 'cb')
+        self.assertEqual('a-b'.replace_many({S('a'): 'c'}), 'c-b')
+
     @support.cpython_only
     def test_replace_id(self):
         pattern = 'abc'
@@ -1870,6 +1878,26 @@ def test_utf8_decode_valid_sequences(self):
         for seq, res in sequences:
             self.assertEqual(seq.decode('utf-8'), res)
 
+    def test_utf8_ascii_runs(self):
+        # Runs of ASCII characters are processed in blocks, check that a
+        # non-ASCII character is found at any position and alignment, and
+        # whatever the kind of the string.
+        for prefix in ('', '\xe9', '\u20ac', '\U0001f600'):
+            p = len(prefix.encode('utf-8'))
+            for size in (15, 16, 17, 32, 33, 65):
+                for i in range(size):
+                    for c in ('\x80', '\u0800', '\U00010000'):
+                        u = prefix + 'a' * i + c + 'b' * (size - i)
+                        b = u.encode('utf-8')
+                        self.assertEqual(b, b''.join(ch.encode('utf-8')
+                                                     for ch in u))
+                        self.assertEqual(b.decode('utf-8'), u)
+                        self.assertIs(b[p:p + i].isascii(), True)
+                        self.assertIs(b[p:p + i + 1].isascii(), False)
+                        with self.assertRaises(UnicodeDecodeError) as cm:
+                            b[:p + i + 1].decode('utf-8')
+                        self.assertEqual(cm.exception.start, p + i)
+
 
     def test_utf8_decode_invalid_sequences(self):
         # continuation bytes in a sequence of 2, 3, or 4 bytes
@@ -891,6 +891,55 @@ def test_sys_getwindowsversion_no_instantiation(self):
     def test_clear_type_cache(self):
         sys._clear_type_cache()
 
+    def test_get_runtime_stats(self):
+        stats = sys._get_runtime_stats()
+        self.assertEqual(set(stats), {"specialization", "optimizer"})
+        self.assertEqual(set(stats["optimizer"]), {
+            "optimizer_attempts", "executors_created",
+            "executors_invalidated", "jit_compilations",
+            "jit_total_memory_size", "jit_code_size",
+            "jit_freed_memory_size",
+        })
+        for value in stats["optimizer"].values():
+            self.assertIsInstance(value, int)
+            self.assertGreaterEqual(value, 0)
+        for name, family in stats["specialization"].items():
+            self.assertIsInstance(name, str)
+            self.assertEqual(set(family), {"success", "failure", "failure_kinds"})
+            self.assertIsInstance(family["failure_kinds"], tuple)
+
+    @test.support.requires_specialization_ft
+    def test_get_runtime_stats_specialization(self):
+        class C:
+            def __init__(self):
+                self.x = 1
+
+        def f(objs):
+            total = 0
+            for obj in objs:
+                total += obj.x
+            return total
+
+        f = test.support.reset_code(f)
+        sys._clear_runtime_stats()
+        f([C() for _ in range(100)])
+        stats = sys._get_runtime_stats()["specialization"]
+        self.assertIn("LOAD_ATTR", stats)
+        self.assertGreater(stats["LOAD_ATTR"]["success"], 0)
+
+    @test.support.cpython_only
+    def test_warmup_profile(self):
+        # Both functions are unavailable without the tier 2 optimizer
+        try:
+            profile = sys._get_warmup_profile()
+        except NotImplementedError:
+            with self.assertRaises(NotImplementedError):
+                sys._set_warmup_profile(None)
+        else:
+            sys._set_warmup_profile(profile)
+            self.assertEqual(sys._get_warmup_profile() is None,
+                             profile is None)
+
     @force_not_colorized
     @support.requires_subprocess()
     def test_ioencoding(self):
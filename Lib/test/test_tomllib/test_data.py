@@ -2,12 +2,18 @@
 # SPDX-FileCopyrightText: 2021 Taneli Hukkinen
 # Licensed to PSF under a Contributor Agreement.
 
+from decimal import Decimal
 import json
 from pathlib import Path
 import unittest
 
 from . import burntsushi, tomllib
 
+try:
+    import _tomllib
+except ImportError:
+    _tomllib = None
+
 
 class MissingFile:
     def __init__(self, path: Path):
@@ -62,3 +68,75 @@ def test_valid(self):
                 actual = burntsushi.convert(actual)
                 expected = burntsushi.normalize(expected)
                 self.assertEqual(actual, expected)
+
+
+@unittest.skipIf(_tomllib is None, "requires _tomllib")
+class TestCAccelerator(unittest.TestCase):
+    """Check that the C parser agrees with the pure Python parser."""
+
+    def check(self, toml_str, **kwargs):
+        py_loads = tomllib._parser._py_loads
+        try:
+            expected = py_loads(toml_str, **kwargs)
+        except Exception as e:
+            with self.assertRaises(type(e)) as cm:
+                _tomllib.loads(toml_str, **kwargs)
+            self.assertEqual(str(cm.exception), str(e))
+            self.assertEqual(getattr(cm.exception, "pos", None),
+                             getattr(e, "pos", None))
+            self.assertIs(type(cm.exception.__cause__), type(e.__cause__))
+        else:
+            actual = _tomllib.loads(toml_str, **kwargs)
+            self.assertEqual(repr(actual), repr(expected))
+
+    def test_loads_is_accelerated(self):
+        self.assertIs(tomllib.loads, _tomllib.loads)
+
+    def test_data_files(self):
+        for path in VALID_FILES + INVALID_FILES:
+            with self.subTest(msg=path.stem):
+                try:
+                    toml_str = path.read_bytes().decode()
+                except UnicodeDecodeError:
+                    continue
+                self.check(toml_str)
+                self.check(toml_str, parse_float=Decimal)
+
+    def test_errors(self):
+        for toml_str in (
+            r'a = "\x"',
+            "a = 2021-02-30",
+            "a = 2021-02-28T25:00:00",
+            "a = 07:32:00.1234567",
+            "a = '''x\x01'''",
+            "a = [1 2]",
+            'x = 1\r\ny = "a\r\nb"',
+            "a = {b = 1, b = 2}",
+            "[[a]]\n[a.b]\nc=1\n[a]",
+            "a.b = 1\n[a.b]",
+            "a = 0x",
+            "a = 0b102",
+            "a = +nan",
+            "a = -infinity",
+            r'a = "\U00110000"',
+            r'a = """\  x"""',
+            "# comment \x7f",
+        ):
+            with self.subTest(toml_str=toml_str):
+                self.check(toml_str)
+
+    def test_parse_float(self):
+        self.check("a = 1.5", parse_float=lambda s: {})
+        self.check("a = 1.5", parse_float=lambda s: 1 / 0)
+        self.check("a = [1.5, nan]", parse_float=str)
+
+    def test_non_str(self):
+        for obj in (b"a = 1", bytearray(), None):
+            with self.subTest(obj=obj):
+                self.check(obj)
+
+        class Str(str):
+            def replace(self, old, new):
+                return "b = 2"
+
+        self.check(Str("a = 1"))
@@ -5,6 +5,7 @@
 import urllib.error
 import http.client
 import email.message
+import inspect
 import io
 import unittest
 from test import support
@@ -810,7 +811,8 @@ def test_never_quote(self):
 
     def test_default_safe(self):
         # Test '/' is default value for 'safe' parameter
-        self.assertEqual(urllib.parse.quote.__defaults__[0], '/')
+        sig = inspect.signature(urllib.parse.quote)
+        self.assertEqual(sig.parameters['safe'].default, '/')
 
     def test_safe(self):
         # Test setting 'safe' parameter does what it should do
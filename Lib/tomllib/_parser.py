@@ -751,3 +751,11 @@ def safe_parse_float(float_str: str) -> Any:
         return float_value
 
     return safe_parse_float
+
+
+_py_loads = loads
+
+try:
+    from _tomllib import loads
+except ImportError:
+    pass
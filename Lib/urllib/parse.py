@@ -1285,3 +1285,20 @@ def _splitvalue(attr):
     """splitvalue('attr=value') --> 'attr', 'value'."""
     attr, delim, value = attr.partition('=')
     return attr, (value if delim else None)
+
+
+_py_urlsplit = urlsplit.__wrapped__
+_py_urlunsplit = urlunsplit
+_py_quote = quote
+_py_quote_plus = quote_plus
+_py_unquote = unquote
+_py_parse_qsl = parse_qsl
+_py_urlencode = urlencode
+
+try:
+    from _urlparse import (urlsplit as _c_urlsplit, urlunsplit, quote,
+                           quote_plus, unquote, parse_qsl, urlencode)
+except ImportError:
+    pass
+else:
+    urlsplit = functools.lru_cache(typed=True)(_c_urlsplit)
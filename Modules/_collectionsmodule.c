@@ -14,6 +14,8 @@ typedef struct {
     PyTypeObject *dequeiter_type;
     PyTypeObject *dequereviter_type;
     PyTypeObject *tuplegetter_type;
+    PyTypeObject *sortedlist_type;
+    PyTypeObject *sortedlistiter_type;
 } collections_state;
 
 static inline collections_state *
@@ -46,10 +48,12 @@ find_module_state_by_def(PyTypeObject *type)
 module _collections
 class _tuplegetter "_tuplegetterobject *" "clinic_state()->tuplegetter_type"
 class _collections.deque "dequeobject *" "clinic_state()->deque_type"
+class _collections.SortedList "sortedlistobject *" "clinic_state()->sortedlist_type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=a033cc2a8476b3f1]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=23a76bb5e617a428]*/
 
 typedef struct dequeobject dequeobject;
+typedef struct sortedlistobject sortedlistobject;
 
 /* We can safely assume type to be the defining class,
  * since tuplegetter is not a base type */
@@ -60,8 +64,11 @@ typedef struct dequeobject dequeobject;
 /*[python input]
 class dequeobject_converter(self_converter):
     type = "dequeobject *"
+
+class sortedlistobject_converter(self_converter):
+    type = "sortedlistobject *"
 [python start generated code]*/
-/*[python end generated code: output=da39a3ee5e6b4b0d input=b6ae4a3ff852be2f]*/
+/*[python end generated code: output=da39a3ee5e6b4b0d input=4e18a7c824e374c1]*/
 
 /* collections module implementation of a deque() datatype
    Written and maintained by Raymond D. Hettinger <python@rcn.com>
@@ -2779,6 +2786,1970 @@ static PyType_Spec tuplegetter_spec = {
 };
 
 
+/*********************** SortedList **************************/
+
+/* A SortedList keeps its items in a list of sorted sublists.  Each sublist
+ * holds at most 2*SORTEDLIST_LOAD items and, unless it is the only one, at
+ * least SORTEDLIST_LOAD/2 items.  Insertions and deletions only move the
+ * pointers of a single sublist, which stays in cache, and the list of
+ * sublists is short enough for a bisection over the greatest key of each
+ * sublist (the "maxes") to be cheap.  Sublists are split in two when they
+ * grow too large and merged with a neighbour when they become too small.
+ *
+ * When a key function is given, the keys are stored in a list of sublists
+ * parallel to the sublists of items, so the key function is called only
+ * once per item.  Without a key function, the items are their own keys.
+ *
+ * Positional access uses a Fenwick tree over the lengths of the sublists,
+ * which insertions and deletions update in O(log n).  It is rebuilt lazily
+ * when sublists are split or merged.
+ *
+ * Comparisons and key functions can run arbitrary code which can mutate
+ * the SortedList.  Every mutation increments sl->state, and the code
+ * calling them checks it and raises RuntimeError instead of using stale
+ * positions.
+ */
+
+#define SORTEDLIST_LOAD 1000
+
+struct sortedlistobject {
+    PyObject_VAR_HEAD
+    PyObject *lists;            /* list of the sorted sublists of items */
+    PyObject *keys;             /* sublists of keys parallel to lists, or
+                                   NULL if there is no key function */
+    PyObject *maxes;            /* greatest key of each sublist */
+    PyObject *key;              /* key function, or NULL */
+    Py_ssize_t *index;          /* Fenwick tree of the sublist lengths */
+    Py_ssize_t index_size;      /* number of sublists in index, or -1 if
+                                   index must be rebuilt */
+    size_t state;               /* incremented by every mutation */
+    PyObject *weakreflist;
+};
+
+#define sortedlistobject_CAST(op)   ((sortedlistobject *)(op))
+
+#define SORTEDLIST_KEYS(sl) ((sl)->keys != NULL ? (sl)->keys : (sl)->lists)
+#define SORTEDLIST_NLISTS(sl) PyList_GET_SIZE((sl)->lists)
+#define SUBLIST(lists, pos) PyList_GET_ITEM((lists), (pos))
+
+static PyObject *sortedlist_iter_new(sortedlistobject *sl, Py_ssize_t start,
+                                     Py_ssize_t count, int reverse);
+
+static PyObject *
+sortedlist_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    sortedlistobject *sl = (sortedlistobject *)type->tp_alloc(type, 0);
+    if (sl == NULL) {
+        return NULL;
+    }
+    sl->index_size = -1;
+    sl->lists = PyList_New(0);
+    sl->maxes = PyList_New(0);
+    if (sl->lists == NULL || sl->maxes == NULL) {
+        Py_DECREF(sl);
+        return NULL;
+    }
+    return (PyObject *)sl;
+}
+
+static void
+sortedlist_mutated(void)
+{
+    PyErr_SetString(PyExc_RuntimeError,
+                    "SortedList mutated by a comparison or key function");
+}
+
+/* Return a new reference to the key of value. */
+static PyObject *
+sortedlist_getkey(sortedlistobject *sl, PyObject *value)
+{
+    PyObject *keyfunc, *key;
+    size_t state = sl->state;
+
+    if (sl->key == NULL) {
+        return Py_NewRef(value);
+    }
+    keyfunc = Py_NewRef(sl->key);
+    key = PyObject_CallOneArg(keyfunc, value);
+    Py_DECREF(keyfunc);
+    if (key != NULL && sl->state != state) {
+        Py_DECREF(key);
+        sortedlist_mutated();
+        return NULL;
+    }
+    return key;
+}
+
+static int
+sortedlist_compare(sortedlistobject *sl, PyObject *v, PyObject *w, int op)
+{
+    size_t state = sl->state;
+    int cmp;
+
+    Py_INCREF(v);
+    Py_INCREF(w);
+    cmp = PyObject_RichCompareBool(v, w, op);
+    Py_DECREF(v);
+    Py_DECREF(w);
+    if (cmp >= 0 && sl->state != state) {
+        sortedlist_mutated();
+        return -1;
+    }
+    return cmp;
+}
+
+/* Return the index where key would be inserted in the sorted list keys,
+   before (right == 0) or after (right == 1) the keys equal to it. */
+static Py_ssize_t
+sortedlist_bisect(sortedlistobject *sl, PyObject *keys, PyObject *key,
+                  int right)
+{
+    Py_ssize_t lo = 0, hi = PyList_GET_SIZE(keys);
+
+    while (lo < hi) {
+        Py_ssize_t mid = lo + (hi - lo) / 2;
+        PyObject *item = PyList_GET_ITEM(keys, mid);
+        int cmp;
+        if (right) {
+            cmp = sortedlist_compare(sl, key, item, Py_LT);
+            if (cmp < 0) {
+                return -1;
+            }
+            if (cmp) {
+                hi = mid;
+            }
+            else {
+                lo = mid + 1;
+            }
+        }
+        else {
+            cmp = sortedlist_compare(sl, item, key, Py_LT);
+            if (cmp < 0) {
+                return -1;
+            }
+            if (cmp) {
+                lo = mid + 1;
+            }
+            else {
+                hi = mid;
+            }
+        }
+    }
+    return lo;
+}
+
+/* Find the sublist pos and the index idx in it where key would be inserted.
+   idx is the length of the last sublist if key goes after all the items. */
+static int
+sortedlist_locate(sortedlistobject *sl, PyObject *key, int right,
+                  Py_ssize_t *ppos, Py_ssize_t *pidx)
+{
+    Py_ssize_t nlists = SORTEDLIST_NLISTS(sl), pos, idx;
+
+    if (nlists == 0) {
+        *ppos = 0;
+        *pidx = 0;
+        return 0;
+    }
+    pos = sortedlist_bisect(sl, sl->maxes, key, right);
+    if (pos < 0) {
+        return -1;
+    }
+    if (pos == nlists) {
+        pos--;
+        idx = PyList_GET_SIZE(SUBLIST(sl->lists, pos));
+    }
+    else {
+        idx = sortedlist_bisect(sl, SUBLIST(SORTEDLIST_KEYS(sl), pos),
+                                key, right);
+        if (idx < 0) {
+            return -1;
+        }
+    }
+    *ppos = pos;
+    *pidx = idx;
+    return 0;
+}
+
+static int
+sortedlist_build_index(sortedlistobject *sl)
+{
+    Py_ssize_t n = SORTEDLIST_NLISTS(sl), i, j;
+    Py_ssize_t *index;
+
+    if (sl->index_size >= 0) {
+        return 0;
+    }
+    index = PyMem_Resize(sl->index, Py_ssize_t, n + 1);
+    if (index == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    sl->index = index;
+    index[0] = 0;
+    for (i = 1; i <= n; i++) {
+        index[i] = PyList_GET_SIZE(SUBLIST(sl->lists, i - 1));
+    }
+    for (i = 1; i <= n; i++) {
+        j = i + (i & -i);
+        if (j <= n) {
+            index[j] += index[i];
+        }
+    }
+    sl->index_size = n;
+    return 0;
+}
+
+static void
+sortedlist_update_index(sortedlistobject *sl, Py_ssize_t pos,
+                        Py_ssize_t delta)
+{
+    Py_ssize_t i;
+    for (i = pos + 1; i <= sl->index_size; i += i & -i) {
+        sl->index[i] += delta;
+    }
+}
+
+/* Return the offset in the SortedList of the item idx of sublist pos. */
+static Py_ssize_t
+sortedlist_offset(sortedlistobject *sl, Py_ssize_t pos, Py_ssize_t idx)
+{
+    Py_ssize_t i, offset = idx;
+
+    if (pos == 0) {
+        return idx;
+    }
+    if (pos == SORTEDLIST_NLISTS(sl) - 1) {
+        return Py_SIZE(sl) - PyList_GET_SIZE(SUBLIST(sl->lists, pos)) + idx;
+    }
+    if (sortedlist_build_index(sl) < 0) {
+        return -1;
+    }
+    for (i = pos; i > 0; i -= i & -i) {
+        offset += sl->index[i];
+    }
+    return offset;
+}
+
+/* Find the sublist pos and the index idx in it of the item at offset. */
+static int
+sortedlist_position(sortedlistobject *sl, Py_ssize_t offset,
+                    Py_ssize_t *ppos, Py_ssize_t *pidx)
+{
+    Py_ssize_t n = SORTEDLIST_NLISTS(sl), pos, bit, last;
+
+    assert(0 <= offset && offset < Py_SIZE(sl));
+    if (offset < PyList_GET_SIZE(SUBLIST(sl->lists, 0))) {
+        *ppos = 0;
+        *pidx = offset;
+        return 0;
+    }
+    last = Py_SIZE(sl) - PyList_GET_SIZE(SUBLIST(sl->lists, n - 1));
+    if (offset >= last) {
+        *ppos = n - 1;
+        *pidx = offset - last;
+        return 0;
+    }
+    if (sortedlist_build_index(sl) < 0) {
+        return -1;
+    }
+    for (bit = 1; bit <= n / 2; bit <<= 1)
+        ;
+    pos = 0;
+    for (; bit > 0; bit >>= 1) {
+        if (pos + bit <= n && sl->index[pos + bit] <= offset) {
+            pos += bit;
+            offset -= sl->index[pos];
+        }
+    }
+    *ppos = pos;
+    *pidx = offset;
+    return 0;
+}
+
+/* Split sublist pos in two if it is too large. */
+static int
+sortedlist_expand(sortedlistobject *sl, Py_ssize_t pos)
+{
+    PyObject *sub = SUBLIST(sl->lists, pos);
+    PyObject *ksub = SUBLIST(SORTEDLIST_KEYS(sl), pos);
+    PyObject *half, *khalf = NULL;
+    Py_ssize_t n = PyList_GET_SIZE(sub);
+
+    if (n <= 2 * SORTEDLIST_LOAD) {
+        return 0;
+    }
+    half = PyList_GetSlice(sub, SORTEDLIST_LOAD, n);
+    if (half == NULL) {
+        return -1;
+    }
+    if (PyList_Insert(sl->lists, pos + 1, half) < 0) {
+        goto error;
+    }
+    if (sl->keys != NULL) {
+        khalf = PyList_GetSlice(ksub, SORTEDLIST_LOAD, n);
+        if (khalf == NULL || PyList_Insert(sl->keys, pos + 1, khalf) < 0) {
+            (void)PyList_SetSlice(sl->lists, pos + 1, pos + 2, NULL);
+            goto error;
+        }
+    }
+    if (PyList_Insert(sl->maxes, pos,
+                      PyList_GET_ITEM(ksub, SORTEDLIST_LOAD - 1)) < 0)
+    {
+        (void)PyList_SetSlice(sl->lists, pos + 1, pos + 2, NULL);
+        if (sl->keys != NULL) {
+            (void)PyList_SetSlice(sl->keys, pos + 1, pos + 2, NULL);
+        }
+        goto error;
+    }
+    (void)PyList_SetSlice(sub, SORTEDLIST_LOAD, n, NULL);
+    if (sl->keys != NULL) {
+        (void)PyList_SetSlice(ksub, SORTEDLIST_LOAD, n, NULL);
+    }
+    Py_DECREF(half);
+    Py_XDECREF(khalf);
+    sl->index_size = -1;
+    return 0;
+
+error:
+    Py_DECREF(half);
+    Py_XDECREF(khalf);
+    return -1;
+}
+
+/* Insert value with the given key at index idx of sublist pos. */
+static int
+sortedlist_insert(sortedlistobject *sl, Py_ssize_t pos, Py_ssize_t idx,
+                  PyObject *value, PyObject *key)
+{
+    if (SORTEDLIST_NLISTS(sl) == 0) {
+        PyObject *sub = PyList_New(1);
+        if (sub == NULL) {
+            return -1;
+        }
+        PyList_SET_ITEM(sub, 0, Py_NewRef(value));
+        if (PyList_Append(sl->lists, sub) < 0) {
+            Py_DECREF(sub);
+            return -1;
+        }
+        Py_DECREF(sub);
+        if (sl->keys != NULL) {
+            sub = PyList_New(1);
+            if (sub == NULL) {
+                goto error;
+            }
+            PyList_SET_ITEM(sub, 0, Py_NewRef(key));
+            if (PyList_Append(sl->keys, sub) < 0) {
+                Py_DECREF(sub);
+                goto error;
+            }
+            Py_DECREF(sub);
+        }
+        if (PyList_Append(sl->maxes, key) < 0) {
+            if (sl->keys != NULL) {
+                (void)PyList_SetSlice(sl->keys, 0, 1, NULL);
+            }
+            goto error;
+        }
+        sl->index_size = -1;
+    }
+    else {
+        PyObject *sub = SUBLIST(sl->lists, pos);
+        Py_ssize_t n = PyList_GET_SIZE(sub);
+        if (PyList_Insert(sub, idx, value) < 0) {
+            return -1;
+        }
+        if (sl->keys != NULL &&
+            PyList_Insert(SUBLIST(sl->keys, pos), idx, key) < 0)
+        {
+            (void)PyList_SetSlice(sub, idx, idx + 1, NULL);
+            return -1;
+        }
+        if (idx == n) {
+            (void)PyList_SetItem(sl->maxes, pos, Py_NewRef(key));
+        }
+        sortedlist_update_index(sl, pos, 1);
+    }
+    Py_SET_SIZE(sl, Py_SIZE(sl) + 1);
+    sl->state++;
+    return sortedlist_expand(sl, pos);
+
+error:
+    (void)PyList_SetSlice(sl->lists, 0, 1, NULL);
+    return -1;
+}
+
+/* Remove the item idx of sublist pos.  The references to the item and to
+   its key (NULL without a key function) are moved to *pitem and *pkey,
+   so that the caller releases them once the SortedList is consistent. */
+static int
+sortedlist_delete(sortedlistobject *sl, Py_ssize_t pos, Py_ssize_t idx,
+                  PyObject **pitem, PyObject **pkey)
+{
+    PyObject *lists = sl->lists, *keys = SORTEDLIST_KEYS(sl);
+    PyObject *sub = SUBLIST(lists, pos), *ksub = SUBLIST(keys, pos);
+    Py_ssize_t nlists = PyList_GET_SIZE(lists), n;
+
+    *pitem = Py_NewRef(PyList_GET_ITEM(sub, idx));
+    *pkey = sl->keys != NULL ? Py_NewRef(PyList_GET_ITEM(ksub, idx)) : NULL;
+    (void)PyList_SetSlice(sub, idx, idx + 1, NULL);
+    if (sl->keys != NULL) {
+        (void)PyList_SetSlice(ksub, idx, idx + 1, NULL);
+    }
+    Py_SET_SIZE(sl, Py_SIZE(sl) - 1);
+    sl->state++;
+    sortedlist_update_index(sl, pos, -1);
+
+    n = PyList_GET_SIZE(sub);
+    if (n > 0 && idx == n) {
+        (void)PyList_SetItem(sl->maxes, pos,
+                             Py_NewRef(PyList_GET_ITEM(ksub, n - 1)));
+    }
+    if (n > SORTEDLIST_LOAD / 2) {
+        return 0;
+    }
+    if (nlists == 1) {
+        if (n == 0) {
+            (void)PyList_SetSlice(lists, 0, 1, NULL);
+            if (sl->keys != NULL) {
+                (void)PyList_SetSlice(sl->keys, 0, 1, NULL);
+            }
+            (void)PyList_SetSlice(sl->maxes, 0, 1, NULL);
+            sl->index_size = -1;
+        }
+        return 0;
+    }
+
+    /* Merge the sublist with its predecessor, or with its successor if it
+       is the first one. */
+    if (pos == 0) {
+        pos = 1;
+    }
+    sub = SUBLIST(lists, pos);
+    n = PyList_GET_SIZE(SUBLIST(lists, pos - 1));
+    if (PyList_SetSlice(SUBLIST(lists, pos - 1),
+                        PY_SSIZE_T_MAX, PY_SSIZE_T_MAX, sub) < 0)
+    {
+        return -1;
+    }
+    if (sl->keys != NULL &&
+        PyList_SetSlice(SUBLIST(sl->keys, pos - 1), PY_SSIZE_T_MAX,
+                        PY_SSIZE_T_MAX, SUBLIST(sl->keys, pos)) < 0)
+    {
+        (void)PyList_SetSlice(SUBLIST(lists, pos - 1),
+                              n, PY_SSIZE_T_MAX, NULL);
+        return -1;
+    }
+    if (PyList_GET_SIZE(sub) > 0) {
+        (void)PyList_SetItem(sl->maxes, pos - 1,
+                             Py_NewRef(PyList_GET_ITEM(sl->maxes, pos)));
+    }
+    (void)PyList_SetSlice(lists, pos, pos + 1, NULL);
+    if (sl->keys != NULL) {
+        (void)PyList_SetSlice(sl->keys, pos, pos + 1, NULL);
+    }
+    (void)PyList_SetSlice(sl->maxes, pos, pos + 1, NULL);
+    sl->index_size = -1;
+    return sortedlist_expand(sl, pos - 1);
+}
+
+/* Compare the item idx of sublist pos with value, whose key is key.  Return
+   2 if they are equal, 1 if they are not but their keys are, 0 if the key
+   of the item is greater, and -1 on error. */
+static int
+sortedlist_match(sortedlistobject *sl, Py_ssize_t pos, Py_ssize_t idx,
+                 PyObject *value, PyObject *key)
+{
+    PyObject *item = PyList_GET_ITEM(SUBLIST(sl->lists, pos), idx);
+    PyObject *itemkey = PyList_GET_ITEM(SUBLIST(SORTEDLIST_KEYS(sl), pos),
+                                        idx);
+    int cmp = sortedlist_compare(sl, key, itemkey, Py_LT);
+    if (cmp != 0) {
+        return cmp < 0 ? -1 : 0;
+    }
+    if (sl->keys == NULL) {
+        return 2;
+    }
+    cmp = sortedlist_compare(sl, item, value, Py_EQ);
+    if (cmp < 0) {
+        return -1;
+    }
+    return cmp ? 2 : 1;
+}
+
+/* Find the first item equal to value, whose key is key, starting from the
+   position (*ppos, *pidx), which must not be after it.  Return 1 and set
+   the position to the item if it is found, 0 if it is not, and -1 on
+   error. */
+static int
+sortedlist_find(sortedlistobject *sl, PyObject *value, PyObject *key,
+                Py_ssize_t *ppos, Py_ssize_t *pidx)
+{
+    Py_ssize_t pos = *ppos, idx = *pidx;
+
+    if (Py_SIZE(sl) == 0) {
+        return 0;
+    }
+    for (;;) {
+        int res;
+        if (idx == PyList_GET_SIZE(SUBLIST(sl->lists, pos))) {
+            if (++pos == SORTEDLIST_NLISTS(sl)) {
+                return 0;
+            }
+            idx = 0;
+        }
+        res = sortedlist_match(sl, pos, idx, value, key);
+        if (res < 0) {
+            return -1;
+        }
+        if (res == 0) {
+            return 0;
+        }
+        if (res == 2) {
+            *ppos = pos;
+            *pidx = idx;
+            return 1;
+        }
+        idx++;
+    }
+}
+
+/* Return a new list of copies of the sublists of lists. */
+static PyObject *
+sortedlist_copy_sublists(PyObject *lists)
+{
+    Py_ssize_t i, n = PyList_GET_SIZE(lists);
+    PyObject *copy = PyList_New(n);
+    if (copy == NULL) {
+        return NULL;
+    }
+    for (i = 0; i < n; i++) {
+        PyObject *sub = PyList_GetSlice(SUBLIST(lists, i), 0, PY_SSIZE_T_MAX);
+        if (sub == NULL) {
+            Py_DECREF(copy);
+            return NULL;
+        }
+        PyList_SET_ITEM(copy, i, sub);
+    }
+    return copy;
+}
+
+/* Return a new list of the items. */
+static PyObject *
+sortedlist_to_list(sortedlistobject *sl)
+{
+    Py_ssize_t pos, idx, i = 0;
+    PyObject *result = PyList_New(Py_SIZE(sl));
+    if (result == NULL) {
+        return NULL;
+    }
+    for (pos = 0; pos < SORTEDLIST_NLISTS(sl); pos++) {
+        PyObject *sub = SUBLIST(sl->lists, pos);
+        for (idx = 0; idx < PyList_GET_SIZE(sub); idx++) {
+            PyList_SET_ITEM(result, i++, Py_NewRef(PyList_GET_ITEM(sub, idx)));
+        }
+    }
+    assert(i == Py_SIZE(sl));
+    return result;
+}
+
+/* Remove all the items and set the key function to key (which can be
+   NULL).  The old items are released once the SortedList is empty. */
+static int
+sortedlist_reset(sortedlistobject *sl, PyObject *key)
+{
+    PyObject *lists, *keys = NULL, *maxes, *oldkey;
+
+    lists = PyList_New(0);
+    maxes = PyList_New(0);
+    if (key != NULL) {
+        keys = PyList_New(0);
+    }
+    if (lists == NULL || maxes == NULL || (key != NULL && keys == NULL)) {
+        Py_XDECREF(lists);
+        Py_XDECREF(maxes);
+        Py_XDECREF(keys);
+        return -1;
+    }
+    oldkey = sl->key;
+    sl->key = Py_XNewRef(key);
+    Py_SETREF(sl->lists, lists);
+    Py_XSETREF(sl->keys, keys);
+    Py_SETREF(sl->maxes, maxes);
+    Py_XDECREF(oldkey);
+    Py_SET_SIZE(sl, 0);
+    sl->index_size = -1;
+    sl->state++;
+    return 0;
+}
+
+/* Replace the items by those of values, which becomes sorted. */
+static int
+sortedlist_rebuild(sortedlistobject *sl, PyObject *values)
+{
+    PyObject *keyfunc = NULL, *keys, *lists = NULL, *klists = NULL;
+    PyObject *maxes = NULL;
+    Py_ssize_t i, n;
+    size_t state = sl->state;
+
+    if (sl->key == NULL) {
+        if (PyList_Sort(values) < 0) {
+            return -1;
+        }
+        keys = Py_NewRef(values);
+    }
+    else {
+        PyObject *args[2], *kwnames, *res;
+
+        keyfunc = Py_NewRef(sl->key);
+        kwnames = PyTuple_Pack(1, &_Py_ID(key));
+        if (kwnames == NULL) {
+            goto error;
+        }
+        args[0] = values;
+        args[1] = keyfunc;
+        res = PyObject_VectorcallMethod(&_Py_ID(sort), args, 1, kwnames);
+        Py_DECREF(kwnames);
+        if (res == NULL) {
+            goto error;
+        }
+        Py_DECREF(res);
+        n = PyList_GET_SIZE(values);
+        keys = PyList_New(n);
+        if (keys == NULL) {
+            goto error;
+        }
+        for (i = 0; i < n; i++) {
+            PyObject *key = PyObject_CallOneArg(keyfunc,
+                                                PyList_GET_ITEM(values, i));
+            if (key == NULL) {
+                Py_DECREF(keys);
+                goto error;
+            }
+            PyList_SET_ITEM(keys, i, key);
+        }
+    }
+    if (sl->state != state) {
+        sortedlist_mutated();
+        goto error_keys;
+    }
+
+    n = PyList_GET_SIZE(values);
+    lists = PyList_New(0);
+    maxes = PyList_New(0);
+    if (lists == NULL || maxes == NULL) {
+        goto error_keys;
+    }
+    if (sl->key != NULL) {
+        klists = PyList_New(0);
+        if (klists == NULL) {
+            goto error_keys;
+        }
+    }
+    for (i = 0; i < n; i += SORTEDLIST_LOAD) {
+        Py_ssize_t end = Py_MIN(i + SORTEDLIST_LOAD, n);
+        PyObject *sub = PyList_GetSlice(values, i, end);
+        if (sub == NULL || PyList_Append(lists, sub) < 0) {
+            Py_XDECREF(sub);
+            goto error_keys;
+        }
+        Py_DECREF(sub);
+        if (klists != NULL) {
+            sub = PyList_GetSlice(keys, i, end);
+            if (sub == NULL || PyList_Append(klists, sub) < 0) {
+                Py_XDECREF(sub);
+                goto error_keys;
+            }
+            Py_DECREF(sub);
+        }
+        if (PyList_Append(maxes, PyList_GET_ITEM(keys, end - 1)) < 0) {
+            goto error_keys;
+        }
+    }
+
+    /* The old items are still referenced by values. */
+    Py_SETREF(sl->lists, lists);
+    Py_XSETREF(sl->keys, klists);
+    Py_SETREF(sl->maxes, maxes);
+    Py_SET_SIZE(sl, n);
+    sl->index_size = -1;
+    sl->state++;
+    Py_DECREF(keys);
+    Py_XDECREF(keyfunc);
+    return 0;
+
+error_keys:
+    Py_DECREF(keys);
+    Py_XDECREF(lists);
+    Py_XDECREF(klists);
+    Py_XDECREF(maxes);
+error:
+    Py_XDECREF(keyfunc);
+    return -1;
+}
+
+static int
+sortedlist_add_lock_held(sortedlistobject *sl, PyObject *value)
+{
+    Py_ssize_t pos, idx;
+    int res;
+    PyObject *key = sortedlist_getkey(sl, value);
+    if (key == NULL) {
+        return -1;
+    }
+    res = sortedlist_locate(sl, key, 1, &pos, &idx);
+    if (res == 0) {
+        res = sortedlist_insert(sl, pos, idx, value, key);
+    }
+    Py_DECREF(key);
+    return res;
+}
+
+static int
+sortedlist_update_lock_held(sortedlistobject *sl, PyObject *iterable)
+{
+    PyObject *values;
+    Py_ssize_t i, n;
+    int res = 0;
+
+    if ((PyObject *)sl == iterable) {
+        values = sortedlist_to_list(sl);
+    }
+    else {
+        values = PySequence_List(iterable);
+    }
+    if (values == NULL) {
+        return -1;
+    }
+    n = PyList_GET_SIZE(values);
+    if (n == 0) {
+        /* nothing to do */
+    }
+    else if (n >= Py_SIZE(sl) / 4) {
+        /* Sorting everything at once is faster than inserting many values
+           one at a time. */
+        for (i = 0; i < SORTEDLIST_NLISTS(sl); i++) {
+            if (PyList_SetSlice(values, PY_SSIZE_T_MAX, PY_SSIZE_T_MAX,
+                                SUBLIST(sl->lists, i)) < 0)
+            {
+                Py_DECREF(values);
+                return -1;
+            }
+        }
+        res = sortedlist_rebuild(sl, values);
+    }
+    else {
+        for (i = 0; i < n; i++) {
+            res = sortedlist_add_lock_held(sl, PyList_GET_ITEM(values, i));
+            if (res < 0) {
+                break;
+            }
+        }
+    }
+    Py_DECREF(values);
+    return res;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.__init__ as sortedlist_init
+
+    self: sortedlistobject
+    iterable: object(c_default="NULL") = ()
+    key: object = None
+
+A list which keeps its items sorted.
+
+Items are sorted in ascending order of key(item), or of the items
+themselves if key is None.  Insertion, deletion, positional access and
+bisection take O(log n) time.
+[clinic start generated code]*/
+
+static int
+sortedlist_init_impl(sortedlistobject *self, PyObject *iterable,
+                     PyObject *key)
+/*[clinic end generated code: output=08490e655c48466f input=c96b49b17569fece]*/
+{
+    if (key == Py_None) {
+        key = NULL;
+    }
+    else if (!PyCallable_Check(key)) {
+        PyErr_Format(PyExc_TypeError,
+                     "key must be callable or None, not %T", key);
+        return -1;
+    }
+    if (sortedlist_reset(self, key) < 0) {
+        return -1;
+    }
+    if (iterable != NULL) {
+        return sortedlist_update_lock_held(self, iterable);
+    }
+    return 0;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.add as sortedlist_add
+
+    self: sortedlistobject
+    value: object
+    /
+
+Add value, after the items which are equal to it.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_add_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=ffd96e7466eb6100 input=bf7cc0b611cd2077]*/
+{
+    if (sortedlist_add_lock_held(self, value) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.update as sortedlist_update
+
+    self: sortedlistobject
+    iterable: object
+    /
+
+Add the values of iterable.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_update_impl(sortedlistobject *self, PyObject *iterable)
+/*[clinic end generated code: output=770ec8595fc76697 input=0f8980de164ffe3e]*/
+{
+    if (sortedlist_update_lock_held(self, iterable) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/* Remove the first item equal to value.  Return 1 if it was found, 0 if
+   not, and -1 on error. */
+static int
+sortedlist_discard_lock_held(sortedlistobject *sl, PyObject *value)
+{
+    Py_ssize_t pos, idx;
+    PyObject *key, *item, *itemkey;
+    int res;
+
+    if (Py_SIZE(sl) == 0) {
+        return 0;
+    }
+    key = sortedlist_getkey(sl, value);
+    if (key == NULL) {
+        return -1;
+    }
+    res = sortedlist_locate(sl, key, 0, &pos, &idx);
+    if (res == 0) {
+        res = sortedlist_find(sl, value, key, &pos, &idx);
+    }
+    Py_DECREF(key);
+    if (res <= 0) {
+        return res;
+    }
+    if (sortedlist_delete(sl, pos, idx, &item, &itemkey) < 0) {
+        res = -1;
+    }
+    Py_DECREF(item);
+    Py_XDECREF(itemkey);
+    return res;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.discard as sortedlist_discard
+
+    self: sortedlistobject
+    value: object
+    /
+
+Remove the first item equal to value if it is present.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_discard_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=c8bd10e8f495fc7d input=b15b4ad95cbdfef6]*/
+{
+    if (sortedlist_discard_lock_held(self, value) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.remove as sortedlist_remove
+
+    self: sortedlistobject
+    value: object
+    /
+
+Remove the first item equal to value.
+
+Raise ValueError if it is not present.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_remove_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=ba82c1161cc2d5c4 input=d394559c73e323c5]*/
+{
+    int res = sortedlist_discard_lock_held(self, value);
+    if (res < 0) {
+        return NULL;
+    }
+    if (res == 0) {
+        PyErr_Format(PyExc_ValueError, "%R not in SortedList", value);
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.pop as sortedlist_pop
+
+    self: sortedlistobject
+    index: Py_ssize_t = -1
+    /
+
+Remove and return the item at index (default last).
+
+Raise IndexError if the list is empty or index is out of range.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_pop_impl(sortedlistobject *self, Py_ssize_t index)
+/*[clinic end generated code: output=955d4810c78aa1f5 input=ff8c5a385370ef6f]*/
+{
+    Py_ssize_t pos, idx;
+    PyObject *item, *key;
+    int res;
+
+    if (Py_SIZE(self) == 0) {
+        PyErr_SetString(PyExc_IndexError, "pop from empty SortedList");
+        return NULL;
+    }
+    if (index < 0) {
+        index += Py_SIZE(self);
+    }
+    if (index < 0 || index >= Py_SIZE(self)) {
+        PyErr_SetString(PyExc_IndexError, "pop index out of range");
+        return NULL;
+    }
+    if (sortedlist_position(self, index, &pos, &idx) < 0) {
+        return NULL;
+    }
+    res = sortedlist_delete(self, pos, idx, &item, &key);
+    Py_XDECREF(key);
+    if (res < 0) {
+        Py_DECREF(item);
+        return NULL;
+    }
+    return item;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.clear as sortedlist_clear
+
+    self: sortedlistobject
+
+Remove all items.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_clear_impl(sortedlistobject *self)
+/*[clinic end generated code: output=9b66ecc43da56ca8 input=918917dcacfbcf4e]*/
+{
+    if (sortedlist_reset(self, self->key) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.copy as sortedlist_copy
+
+    self: sortedlistobject
+
+Return a shallow copy.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_copy_impl(sortedlistobject *self)
+/*[clinic end generated code: output=aacdca77ac81989e input=1ea823bef56d8ea5]*/
+{
+    collections_state *state = find_module_state_by_def(Py_TYPE(self));
+    sortedlistobject *copy;
+
+    if (!Py_IS_TYPE(self, state->sortedlist_type)) {
+        PyObject *result, *aslist = sortedlist_to_list(self);
+        if (aslist == NULL) {
+            return NULL;
+        }
+        result = PyObject_CallFunctionObjArgs(
+            (PyObject *)Py_TYPE(self), aslist,
+            self->key != NULL ? self->key : Py_None, NULL);
+        Py_DECREF(aslist);
+        return result;
+    }
+    copy = (sortedlistobject *)sortedlist_new(Py_TYPE(self), NULL, NULL);
+    if (copy == NULL) {
+        return NULL;
+    }
+    copy->key = Py_XNewRef(self->key);
+    Py_SETREF(copy->lists, sortedlist_copy_sublists(self->lists));
+    if (copy->lists == NULL) {
+        goto error;
+    }
+    if (self->keys != NULL) {
+        copy->keys = sortedlist_copy_sublists(self->keys);
+        if (copy->keys == NULL) {
+            goto error;
+        }
+    }
+    Py_SETREF(copy->maxes, PyList_GetSlice(self->maxes, 0, PY_SSIZE_T_MAX));
+    if (copy->maxes == NULL) {
+        goto error;
+    }
+    Py_SET_SIZE(copy, Py_SIZE(self));
+    return (PyObject *)copy;
+
+error:
+    Py_DECREF(copy);
+    return NULL;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.bisect_left as sortedlist_bisect_left
+
+    self: sortedlistobject
+    value: object
+    /
+
+Return the index where value would be inserted before equal items.
+
+This is also the number of items less than value (its rank).
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_bisect_left_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=0246e33e31ba78e9 input=5e4b85253e0c3d4b]*/
+{
+    Py_ssize_t pos, idx, offset;
+    PyObject *key;
+    int res;
+
+    key = sortedlist_getkey(self, value);
+    if (key == NULL) {
+        return NULL;
+    }
+    res = sortedlist_locate(self, key, 0, &pos, &idx);
+    Py_DECREF(key);
+    if (res < 0) {
+        return NULL;
+    }
+    offset = sortedlist_offset(self, pos, idx);
+    if (offset < 0) {
+        return NULL;
+    }
+    return PyLong_FromSsize_t(offset);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.bisect_right as sortedlist_bisect_right
+
+    self: sortedlistobject
+    value: object
+    /
+
+Return the index where value would be inserted after equal items.
+
+This is also the number of items less than or equal to value.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_bisect_right_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=c88a5ccaf8b15423 input=12952b155ee36ae3]*/
+{
+    Py_ssize_t pos, idx, offset;
+    PyObject *key;
+    int res;
+
+    key = sortedlist_getkey(self, value);
+    if (key == NULL) {
+        return NULL;
+    }
+    res = sortedlist_locate(self, key, 1, &pos, &idx);
+    Py_DECREF(key);
+    if (res < 0) {
+        return NULL;
+    }
+    offset = sortedlist_offset(self, pos, idx);
+    if (offset < 0) {
+        return NULL;
+    }
+    return PyLong_FromSsize_t(offset);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.index as sortedlist_index
+
+    self: sortedlistobject
+    value: object
+    start: slice_index(accept={int}) = 0
+    stop: slice_index(accept={int}, c_default="PY_SSIZE_T_MAX") = sys.maxsize
+    /
+
+Return first index of value.
+
+Raise ValueError if the value is not present.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_index_impl(sortedlistobject *self, PyObject *value,
+                      Py_ssize_t start, Py_ssize_t stop)
+/*[clinic end generated code: output=a895777f523533df input=e681e99ec0687486]*/
+{
+    Py_ssize_t pos, idx, offset = 0, len = Py_SIZE(self);
+    PyObject *key;
+    int res;
+
+    if (start < 0) {
+        start = Py_MAX(start + len, 0);
+    }
+    if (stop < 0) {
+        stop = Py_MAX(stop + len, 0);
+    }
+    key = sortedlist_getkey(self, value);
+    if (key == NULL) {
+        return NULL;
+    }
+    len = Py_SIZE(self);
+    res = sortedlist_locate(self, key, 0, &pos, &idx);
+    if (res < 0) {
+        goto done;
+    }
+    offset = sortedlist_offset(self, pos, idx);
+    if (offset < 0) {
+        res = -1;
+        goto done;
+    }
+    if (offset < start) {
+        if (start >= len) {
+            res = 0;
+            goto done;
+        }
+        if (sortedlist_position(self, start, &pos, &idx) < 0) {
+            res = -1;
+            goto done;
+        }
+    }
+    res = sortedlist_find(self, value, key, &pos, &idx);
+    if (res > 0) {
+        offset = sortedlist_offset(self, pos, idx);
+        if (offset < 0) {
+            res = -1;
+        }
+        else if (offset >= stop) {
+            res = 0;
+        }
+    }
+
+done:
+    Py_DECREF(key);
+    if (res < 0) {
+        return NULL;
+    }
+    if (res == 0) {
+        PyErr_Format(PyExc_ValueError, "%R is not in SortedList", value);
+        return NULL;
+    }
+    return PyLong_FromSsize_t(offset);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.count as sortedlist_count
+
+    self: sortedlistobject
+    value: object
+    /
+
+Return number of occurrences of value.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_count_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=3a130b083f3d68d7 input=4d78b60b7b173e35]*/
+{
+    Py_ssize_t pos, idx, count = 0;
+    PyObject *key;
+
+    if (Py_SIZE(self) == 0) {
+        return PyLong_FromLong(0);
+    }
+    key = sortedlist_getkey(self, value);
+    if (key == NULL) {
+        return NULL;
+    }
+    if (sortedlist_locate(self, key, 0, &pos, &idx) < 0) {
+        goto error;
+    }
+    for (;;) {
+        int res;
+        if (idx == PyList_GET_SIZE(SUBLIST(self->lists, pos))) {
+            if (++pos == SORTEDLIST_NLISTS(self)) {
+                break;
+            }
+            idx = 0;
+        }
+        res = sortedlist_match(self, pos, idx, value, key);
+        if (res < 0) {
+            goto error;
+        }
+        if (res == 0) {
+            break;
+        }
+        count += (res == 2);
+        idx++;
+    }
+    Py_DECREF(key);
+    return PyLong_FromSsize_t(count);
+
+error:
+    Py_DECREF(key);
+    return NULL;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.irange as sortedlist_irange
+
+    self: sortedlistobject
+    minimum: object = None
+    maximum: object = None
+    inclusive: object(c_default="NULL") = (True, True)
+    reverse: bool = False
+
+Return an iterator over the items between minimum and maximum.
+
+A bound of None means that the range is not bounded on that side.  The
+two booleans of inclusive tell whether items equal to minimum and to
+maximum are included.  Items are produced in descending order if reverse
+is true.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_irange_impl(sortedlistobject *self, PyObject *minimum,
+                       PyObject *maximum, PyObject *inclusive, int reverse)
+/*[clinic end generated code: output=0b2af160f64e6b94 input=635bdc2c17d064e3]*/
+{
+    int include_min = 1, include_max = 1;
+    PyObject *minkey = NULL, *maxkey = NULL, *result = NULL;
+    Py_ssize_t pos, idx, start = 0, stop;
+
+    if (inclusive != NULL) {
+        if (!PyTuple_Check(inclusive) || PyTuple_GET_SIZE(inclusive) != 2) {
+            PyErr_SetString(PyExc_TypeError,
+                            "inclusive must be a tuple of two booleans");
+            return NULL;
+        }
+        include_min = PyObject_IsTrue(PyTuple_GET_ITEM(inclusive, 0));
+        if (include_min < 0) {
+            return NULL;
+        }
+        include_max = PyObject_IsTrue(PyTuple_GET_ITEM(inclusive, 1));
+        if (include_max < 0) {
+            return NULL;
+        }
+    }
+    if (minimum != Py_None) {
+        minkey = sortedlist_getkey(self, minimum);
+        if (minkey == NULL) {
+            goto done;
+        }
+    }
+    if (maximum != Py_None) {
+        maxkey = sortedlist_getkey(self, maximum);
+        if (maxkey == NULL) {
+            goto done;
+        }
+    }
+    if (minkey != NULL) {
+        if (sortedlist_locate(self, minkey, !include_min, &pos, &idx) < 0) {
+            goto done;
+        }
+        start = sortedlist_offset(self, pos, idx);
+        if (start < 0) {
+            goto done;
+        }
+    }
+    stop = Py_SIZE(self);
+    if (maxkey != NULL) {
+        if (sortedlist_locate(self, maxkey, include_max, &pos, &idx) < 0) {
+            goto done;
+        }
+        stop = sortedlist_offset(self, pos, idx);
+        if (stop < 0) {
+            goto done;
+        }
+    }
+    result = sortedlist_iter_new(self, start, Py_MAX(stop - start, 0),
+                                 reverse);
+
+done:
+    Py_XDECREF(minkey);
+    Py_XDECREF(maxkey);
+    return result;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.__reversed__ as sortedlist___reversed__
+
+    self: sortedlistobject
+
+Return a reverse iterator over the SortedList.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist___reversed___impl(sortedlistobject *self)
+/*[clinic end generated code: output=ddd9346585193c8c input=4e680093ec26cfa6]*/
+{
+    return sortedlist_iter_new(self, 0, Py_SIZE(self), 1);
+}
+
+/*[clinic input]
+_collections.SortedList.__reduce__ as sortedlist___reduce__
+
+    self: sortedlistobject
+
+Return state information for pickling.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist___reduce___impl(sortedlistobject *self)
+/*[clinic end generated code: output=c757ecb38221c425 input=baffe1cfa8f5a9b6]*/
+{
+    PyObject *state, *aslist, *key;
+
+    state = _PyObject_GetState((PyObject *)self);
+    if (state == NULL) {
+        return NULL;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    aslist = sortedlist_to_list(self);
+    key = Py_XNewRef(self->key);
+    Py_END_CRITICAL_SECTION();
+    if (aslist == NULL) {
+        Py_DECREF(state);
+        Py_XDECREF(key);
+        return NULL;
+    }
+    if (key == NULL) {
+        return Py_BuildValue("O(N)N", Py_TYPE(self), aslist, state);
+    }
+    return Py_BuildValue("O(NN)N", Py_TYPE(self), aslist, key, state);
+}
+
+static PyObject *
+sortedlist_get_key(PyObject *self, void *Py_UNUSED(closure))
+{
+    sortedlistobject *sl = sortedlistobject_CAST(self);
+    PyObject *key;
+    Py_BEGIN_CRITICAL_SECTION(sl);
+    key = sl->key != NULL ? Py_NewRef(sl->key) : Py_None;
+    Py_END_CRITICAL_SECTION();
+    return key;
+}
+
+static Py_ssize_t
+sortedlist_len(PyObject *self)
+{
+    PyVarObject *sl = _PyVarObject_CAST(self);
+    return FT_ATOMIC_LOAD_SSIZE(sl->ob_size);
+}
+
+static int
+sortedlist_contains_lock_held(sortedlistobject *sl, PyObject *value)
+{
+    Py_ssize_t pos, idx;
+    PyObject *key;
+    int res;
+
+    if (Py_SIZE(sl) == 0) {
+        return 0;
+    }
+    key = sortedlist_getkey(sl, value);
+    if (key == NULL) {
+        return -1;
+    }
+    res = sortedlist_locate(sl, key, 0, &pos, &idx);
+    if (res == 0) {
+        res = sortedlist_find(sl, value, key, &pos, &idx);
+    }
+    Py_DECREF(key);
+    return res;
+}
+
+static int
+sortedlist_contains(PyObject *self, PyObject *value)
+{
+    int result;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    result = sortedlist_contains_lock_held(sortedlistobject_CAST(self), value);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static PyObject *
+sortedlist_item_lock_held(sortedlistobject *sl, Py_ssize_t i)
+{
+    Py_ssize_t pos, idx;
+
+    if (i < 0 || i >= Py_SIZE(sl)) {
+        PyErr_SetString(PyExc_IndexError, "SortedList index out of range");
+        return NULL;
+    }
+    if (sortedlist_position(sl, i, &pos, &idx) < 0) {
+        return NULL;
+    }
+    return Py_NewRef(PyList_GET_ITEM(SUBLIST(sl->lists, pos), idx));
+}
+
+static PyObject *
+sortedlist_item(PyObject *self, Py_ssize_t i)
+{
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    result = sortedlist_item_lock_held(sortedlistobject_CAST(self), i);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static PyObject *
+sortedlist_subscript_lock_held(sortedlistobject *sl, PyObject *item)
+{
+    Py_ssize_t start, stop, step, slicelength, i, pos, idx;
+    PyObject *result;
+
+    if (PyIndex_Check(item)) {
+        i = PyNumber_AsSsize_t(item, PyExc_IndexError);
+        if (i == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (i < 0) {
+            i += Py_SIZE(sl);
+        }
+        return sortedlist_item_lock_held(sl, i);
+    }
+    if (!PySlice_Check(item)) {
+        PyErr_Format(PyExc_TypeError,
+                     "SortedList indices must be integers or slices, not %T",
+                     item);
+        return NULL;
+    }
+    if (PySlice_Unpack(item, &start, &stop, &step) < 0) {
+        return NULL;
+    }
+    slicelength = PySlice_AdjustIndices(Py_SIZE(sl), &start, &stop, step);
+    result = PyList_New(slicelength);
+    if (result == NULL || slicelength == 0) {
+        return result;
+    }
+    if (sortedlist_position(sl, start, &pos, &idx) < 0) {
+        goto error;
+    }
+    for (i = 0; ; i++) {
+        PyObject *sub = SUBLIST(sl->lists, pos);
+        PyList_SET_ITEM(result, i, Py_NewRef(PyList_GET_ITEM(sub, idx)));
+        if (i + 1 == slicelength) {
+            break;
+        }
+        if (step == 1) {
+            if (++idx == PyList_GET_SIZE(sub)) {
+                pos++;
+                idx = 0;
+            }
+        }
+        else if (sortedlist_position(sl, start + (i + 1) * step,
+                                     &pos, &idx) < 0)
+        {
+            goto error;
+        }
+    }
+    return result;
+
+error:
+    Py_DECREF(result);
+    return NULL;
+}
+
+static PyObject *
+sortedlist_subscript(PyObject *self, PyObject *item)
+{
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    result = sortedlist_subscript_lock_held(sortedlistobject_CAST(self), item);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static int
+sortedlist_del_subscript_lock_held(sortedlistobject *sl, PyObject *item)
+{
+    Py_ssize_t start, stop, step, slicelength, i, pos, idx, ngarbage = 0;
+    PyObject **garbage;
+    int res = 0;
+
+    if (PyIndex_Check(item)) {
+        PyObject *value, *key;
+        i = PyNumber_AsSsize_t(item, PyExc_IndexError);
+        if (i == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+        if (i < 0) {
+            i += Py_SIZE(sl);
+        }
+        if (i < 0 || i >= Py_SIZE(sl)) {
+            PyErr_SetString(PyExc_IndexError,
+                            "SortedList assignment index out of range");
+            return -1;
+        }
+        if (sortedlist_position(sl, i, &pos, &idx) < 0) {
+            return -1;
+        }
+        res = sortedlist_delete(sl, pos, idx, &value, &key);
+        Py_DECREF(value);
+        Py_XDECREF(key);
+        return res;
+    }
+    if (!PySlice_Check(item)) {
+        PyErr_Format(PyExc_TypeError,
+                     "SortedList indices must be integers or slices, not %T",
+                     item);
+        return -1;
+    }
+    if (PySlice_Unpack(item, &start, &stop, &step) < 0) {
+        return -1;
+    }
+    slicelength = PySlice_AdjustIndices(Py_SIZE(sl), &start, &stop, step);
+    if (slicelength == 0) {
+        return 0;
+    }
+    if (slicelength == Py_SIZE(sl)) {
+        return sortedlist_reset(sl, sl->key);
+    }
+    /* Delete the items from the last one, so that the offsets of those
+       which remain to be deleted do not change. */
+    if (step > 0) {
+        start += (slicelength - 1) * step;
+        step = -step;
+    }
+    garbage = PyMem_New(PyObject *, 2 * slicelength);
+    if (garbage == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (i = 0; i < slicelength; i++) {
+        if (sortedlist_position(sl, start + i * step, &pos, &idx) < 0) {
+            res = -1;
+            break;
+        }
+        res = sortedlist_delete(sl, pos, idx, &garbage[ngarbage],
+                                &garbage[ngarbage + 1]);
+        ngarbage += 2;
+        if (res < 0) {
+            break;
+        }
+    }
+    for (i = 0; i < ngarbage; i++) {
+        Py_XDECREF(garbage[i]);
+    }
+    PyMem_Free(garbage);
+    return res;
+}
+
+static int
+sortedlist_ass_subscript(PyObject *self, PyObject *item, PyObject *value)
+{
+    int result;
+    if (value != NULL) {
+        PyErr_SetString(PyExc_TypeError,
+                        "SortedList does not support item assignment");
+        return -1;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    result = sortedlist_del_subscript_lock_held(sortedlistobject_CAST(self),
+                                                item);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static PyObject *
+sortedlist_iter(PyObject *self)
+{
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    result = sortedlist_iter_new(sortedlistobject_CAST(self), 0,
+                                 Py_SIZE(self), 0);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static PyObject *
+sortedlist_repr(PyObject *self)
+{
+    sortedlistobject *sl = sortedlistobject_CAST(self);
+    PyObject *aslist, *key, *result;
+    int i;
+
+    i = Py_ReprEnter(self);
+    if (i != 0) {
+        if (i < 0) {
+            return NULL;
+        }
+        return PyUnicode_FromFormat("%s(...)", _PyType_Name(Py_TYPE(self)));
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    aslist = sortedlist_to_list(sl);
+    key = Py_XNewRef(sl->key);
+    Py_END_CRITICAL_SECTION();
+    if (aslist == NULL) {
+        Py_XDECREF(key);
+        Py_ReprLeave(self);
+        return NULL;
+    }
+    if (key != NULL) {
+        result = PyUnicode_FromFormat("%s(%R, key=%R)",
+                                      _PyType_Name(Py_TYPE(self)),
+                                      aslist, key);
+    }
+    else {
+        result = PyUnicode_FromFormat("%s(%R)",
+                                      _PyType_Name(Py_TYPE(self)), aslist);
+    }
+    Py_ReprLeave(self);
+    Py_DECREF(aslist);
+    Py_XDECREF(key);
+    return result;
+}
+
+static PyObject *
+sortedlist_richcompare(PyObject *v, PyObject *w, int op)
+{
+    PyObject *vlist, *wlist, *result;
+
+    collections_state *state = find_module_state_by_def(Py_TYPE(v));
+    if (!PyObject_TypeCheck(v, state->sortedlist_type) ||
+        !PyObject_TypeCheck(w, state->sortedlist_type)) {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    Py_BEGIN_CRITICAL_SECTION(v);
+    vlist = sortedlist_to_list(sortedlistobject_CAST(v));
+    Py_END_CRITICAL_SECTION();
+    if (vlist == NULL) {
+        return NULL;
+    }
+    Py_BEGIN_CRITICAL_SECTION(w);
+    wlist = sortedlist_to_list(sortedlistobject_CAST(w));
+    Py_END_CRITICAL_SECTION();
+    if (wlist == NULL) {
+        Py_DECREF(vlist);
+        return NULL;
+    }
+    result = PyObject_RichCompare(vlist, wlist, op);
+    Py_DECREF(vlist);
+    Py_DECREF(wlist);
+    return result;
+}
+
+static int
+sortedlist_traverse(PyObject *self, visitproc visit, void *arg)
+{
+    sortedlistobject *sl = sortedlistobject_CAST(self);
+    Py_VISIT(Py_TYPE(sl));
+    Py_VISIT(sl->lists);
+    Py_VISIT(sl->keys);
+    Py_VISIT(sl->maxes);
+    Py_VISIT(sl->key);
+    return 0;
+}
+
+static int
+sortedlist_tp_clear(PyObject *self)
+{
+    sortedlistobject *sl = sortedlistobject_CAST(self);
+    Py_SET_SIZE(sl, 0);
+    sl->index_size = -1;
+    sl->state++;
+    if (sl->lists != NULL) {
+        (void)PyList_Clear(sl->lists);
+    }
+    if (sl->keys != NULL) {
+        (void)PyList_Clear(sl->keys);
+    }
+    if (sl->maxes != NULL) {
+        (void)PyList_Clear(sl->maxes);
+    }
+    Py_CLEAR(sl->key);
+    return 0;
+}
+
+static void
+sortedlist_dealloc(PyObject *self)
+{
+    sortedlistobject *sl = sortedlistobject_CAST(self);
+    PyTypeObject *tp = Py_TYPE(sl);
+
+    PyObject_GC_UnTrack(sl);
+    if (sl->weakreflist != NULL) {
+        PyObject_ClearWeakRefs(self);
+    }
+    Py_XDECREF(sl->lists);
+    Py_XDECREF(sl->keys);
+    Py_XDECREF(sl->maxes);
+    Py_XDECREF(sl->key);
+    PyMem_Free(sl->index);
+    tp->tp_free(sl);
+    Py_DECREF(tp);
+}
+
+static PyMethodDef sortedlist_methods[] = {
+    SORTEDLIST_ADD_METHODDEF
+    SORTEDLIST_UPDATE_METHODDEF
+    SORTEDLIST_DISCARD_METHODDEF
+    SORTEDLIST_REMOVE_METHODDEF
+    SORTEDLIST_POP_METHODDEF
+    SORTEDLIST_CLEAR_METHODDEF
+    SORTEDLIST_COPY_METHODDEF
+    {"__copy__", (PyCFunction)sortedlist_copy, METH_NOARGS,
+     sortedlist_copy__doc__},
+    SORTEDLIST_BISECT_LEFT_METHODDEF
+    SORTEDLIST_BISECT_RIGHT_METHODDEF
+    SORTEDLIST_INDEX_METHODDEF
+    SORTEDLIST_COUNT_METHODDEF
+    SORTEDLIST_IRANGE_METHODDEF
+    SORTEDLIST___REVERSED___METHODDEF
+    SORTEDLIST___REDUCE___METHODDEF
+    {"__class_getitem__", Py_GenericAlias,
+        METH_O|METH_CLASS, PyDoc_STR("See PEP 585")},
+    {NULL, NULL}    /* sentinel */
+};
+
+static PyGetSetDef sortedlist_getset[] = {
+    {"key", sortedlist_get_key, NULL,
+     PyDoc_STR("The key function, or None.")},
+    {0}
+};
+
+static PyMemberDef sortedlist_members[] = {
+    {"__weaklistoffset__", Py_T_PYSSIZET,
+     offsetof(sortedlistobject, weakreflist), Py_READONLY},
+    {NULL},
+};
+
+static PyType_Slot sortedlist_slots[] = {
+    {Py_tp_dealloc, sortedlist_dealloc},
+    {Py_tp_repr, sortedlist_repr},
+    {Py_tp_hash, PyObject_HashNotImplemented},
+    {Py_tp_doc, (void *)sortedlist_init__doc__},
+    {Py_tp_traverse, sortedlist_traverse},
+    {Py_tp_clear, sortedlist_tp_clear},
+    {Py_tp_richcompare, sortedlist_richcompare},
+    {Py_tp_iter, sortedlist_iter},
+    {Py_tp_getset, sortedlist_getset},
+    {Py_tp_init, sortedlist_init},
+    {Py_tp_new, sortedlist_new},
+    {Py_tp_free, PyObject_GC_Del},
+    {Py_tp_methods, sortedlist_methods},
+    {Py_tp_members, sortedlist_members},
+
+    // Sequence protocol
+    {Py_sq_length, sortedlist_len},
+    {Py_sq_item, sortedlist_item},
+    {Py_sq_contains, sortedlist_contains},
+
+    // Mapping protocol
+    {Py_mp_length, sortedlist_len},
+    {Py_mp_subscript, sortedlist_subscript},
+    {Py_mp_ass_subscript, sortedlist_ass_subscript},
+    {0, NULL},
+};
+
+static PyType_Spec sortedlist_spec = {
+    .name = "collections.SortedList",
+    .basicsize = sizeof(sortedlistobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE |
+              Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_SEQUENCE |
+              Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = sortedlist_slots,
+};
+
+/*********************** SortedList Iterator **************************/
+
+typedef struct {
+    PyObject_HEAD
+    sortedlistobject *sl;
+    Py_ssize_t pos;         /* sublist of the next item */
+    Py_ssize_t idx;         /* index of the next item in its sublist */
+    Py_ssize_t counter;     /* number of items remaining for iteration */
+    int reverse;
+    size_t state;           /* state when the iterator is created */
+} sortedlistiterobject;
+
+#define sortedlistiterobject_CAST(op)   ((sortedlistiterobject *)(op))
+
+/* Return an iterator over the count items starting at offset start, or
+   ending at offset start + count - 1 if reverse is true. */
+static PyObject *
+sortedlist_iter_new(sortedlistobject *sl, Py_ssize_t start, Py_ssize_t count,
+                    int reverse)
+{
+    sortedlistiterobject *it;
+    Py_ssize_t pos = 0, idx = 0;
+
+    if (count > 0 &&
+        sortedlist_position(sl, reverse ? start + count - 1 : start,
+                            &pos, &idx) < 0)
+    {
+        return NULL;
+    }
+    collections_state *state = find_module_state_by_def(Py_TYPE(sl));
+    it = PyObject_GC_New(sortedlistiterobject, state->sortedlistiter_type);
+    if (it == NULL) {
+        return NULL;
+    }
+    it->sl = (sortedlistobject *)Py_NewRef(sl);
+    it->pos = pos;
+    it->idx = idx;
+    it->counter = count;
+    it->reverse = reverse;
+    it->state = sl->state;
+    PyObject_GC_Track(it);
+    return (PyObject *)it;
+}
+
+static int
+sortedlistiter_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    sortedlistiterobject *it = sortedlistiterobject_CAST(op);
+    Py_VISIT(Py_TYPE(it));
+    Py_VISIT(it->sl);
+    return 0;
+}
+
+static int
+sortedlistiter_clear(PyObject *op)
+{
+    sortedlistiterobject *it = sortedlistiterobject_CAST(op);
+    Py_CLEAR(it->sl);
+    return 0;
+}
+
+static void
+sortedlistiter_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)sortedlistiter_clear(op);
+    PyObject_GC_Del(op);
+    Py_DECREF(tp);
+}
+
+static PyObject *
+sortedlistiter_next_lock_held(sortedlistiterobject *it, sortedlistobject *sl)
+{
+    PyObject *sub, *item;
+
+    if (it->counter == 0) {
+        return NULL;
+    }
+    if (sl->state != it->state) {
+        it->counter = 0;
+        PyErr_SetString(PyExc_RuntimeError,
+                        "SortedList mutated during iteration");
+        return NULL;
+    }
+    sub = SUBLIST(sl->lists, it->pos);
+    item = PyList_GET_ITEM(sub, it->idx);
+    it->counter--;
+    if (it->counter > 0) {
+        if (!it->reverse) {
+            if (++it->idx == PyList_GET_SIZE(sub)) {
+                it->pos++;
+                it->idx = 0;
+            }
+        }
+        else if (it->idx == 0) {
+            it->pos--;
+            it->idx = PyList_GET_SIZE(SUBLIST(sl->lists, it->pos)) - 1;
+        }
+        else {
+            it->idx--;
+        }
+    }
+    return Py_NewRef(item);
+}
+
+static PyObject *
+sortedlistiter_next(PyObject *op)
+{
+    PyObject *result;
+    sortedlistiterobject *it = sortedlistiterobject_CAST(op);
+    // It's safe to access it->sl without holding the per-object lock for
+    // it here; it->sl is only assigned during construction of it.
+    sortedlistobject *sl = it->sl;
+
+    Py_BEGIN_CRITICAL_SECTION2(it, sl);
+    result = sortedlistiter_next_lock_held(it, sl);
+    Py_END_CRITICAL_SECTION2();
+    return result;
+}
+
+static PyObject *
+sortedlistiter_len(PyObject *op, PyObject *Py_UNUSED(dummy))
+{
+    sortedlistiterobject *it = sortedlistiterobject_CAST(op);
+    Py_ssize_t len = FT_ATOMIC_LOAD_SSIZE(it->counter);
+    return PyLong_FromSsize_t(len);
+}
+
+static PyMethodDef sortedlistiter_methods[] = {
+    {"__length_hint__", sortedlistiter_len, METH_NOARGS, length_hint_doc},
+    {NULL, NULL}    /* sentinel */
+};
+
+static PyType_Slot sortedlistiter_slots[] = {
+    {Py_tp_dealloc, sortedlistiter_dealloc},
+    {Py_tp_getattro, PyObject_GenericGetAttr},
+    {Py_tp_traverse, sortedlistiter_traverse},
+    {Py_tp_clear, sortedlistiter_clear},
+    {Py_tp_iter, PyObject_SelfIter},
+    {Py_tp_iternext, sortedlistiter_next},
+    {Py_tp_methods, sortedlistiter_methods},
+    {0, NULL},
+};
+
+static PyType_Spec sortedlistiter_spec = {
+    .name = "collections._sortedlist_iterator",
+    .basicsize = sizeof(sortedlistiterobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION),
+    .slots = sortedlistiter_slots,
+};
+
 /* module level code ********************************************************/
 
 static int
@@ -2790,6 +4761,8 @@ collections_traverse(PyObject *mod, visitproc visit, void *arg)
     Py_VISIT(state->dequeiter_type);
     Py_VISIT(state->dequereviter_type);
     Py_VISIT(state->tuplegetter_type);
+    Py_VISIT(state->sortedlist_type);
+    Py_VISIT(state->sortedlistiter_type);
     return 0;
 }
 
@@ -2802,6 +4775,8 @@ collections_clear(PyObject *mod)
     Py_CLEAR(state->dequeiter_type);
     Py_CLEAR(state->dequereviter_type);
     Py_CLEAR(state->tuplegetter_type);
+    Py_CLEAR(state->sortedlist_type);
+    Py_CLEAR(state->sortedlistiter_type);
     return 0;
 }
 
@@ -2815,6 +4790,7 @@ PyDoc_STRVAR(collections_doc,
 "High performance data structures.\n\
 - deque:        ordered collection accessible from endpoints only\n\
 - defaultdict:  dict subclass with a default value factory\n\
+- SortedList:   list which keeps its items sorted\n\
 ");
 
 static struct PyMethodDef collections_methods[] = {
@@ -2841,6 +4817,8 @@ collections_exec(PyObject *module) {
     ADD_TYPE(module, &dequeiter_spec, state->dequeiter_type, NULL);
     ADD_TYPE(module, &dequereviter_spec, state->dequereviter_type, NULL);
     ADD_TYPE(module, &tuplegetter_spec, state->tuplegetter_type, NULL);
+    ADD_TYPE(module, &sortedlist_spec, state->sortedlist_type, NULL);
+    ADD_TYPE(module, &sortedlistiter_spec, state->sortedlistiter_type, NULL);
 
     if (PyModule_AddType(module, &PyODict_Type) < 0) {
         return -1;
@@ -0,0 +1,1142 @@
+/* C implementation of copy.copy() and copy.deepcopy().
+
+   The algorithms are those of Lib/copy.py, with fast paths for the common
+   containers and instances.  The memo of deepcopy() is kept in an identity
+   hash table, and only converted to the dict of the Python implementation
+   when Python code gets to see it, for example when calling a __deepcopy__()
+   method.
+*/
+
+#ifndef Py_BUILD_CORE_BUILTIN
+#  define Py_BUILD_CORE_MODULE 1
+#endif
+
+#include "Python.h"
+#include "pycore_critical_section.h"  // Py_BEGIN_CRITICAL_SECTION()
+#include "pycore_hashtable.h"         // _Py_hashtable_t
+#include "pycore_runtime.h"           // _Py_ID()
+
+/*[clinic input]
+module _copy
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=b34c1b75f49dbfff]*/
+
+typedef struct {
+    /* copy.Error */
+    PyObject *error;
+    /* copy._deepcopy_dispatch, {type: deepcopier} */
+    PyObject *deepcopy_dispatch;
+    /* copyreg.dispatch_table, {type: reducer} */
+    PyObject *dispatch_table;
+    /* copyreg.__newobj__ */
+    PyObject *newobj;
+} copy_state;
+
+static inline copy_state *
+get_copy_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (copy_state *)state;
+}
+
+#include "clinic/_copymodule.c.h"
+
+
+/* The memo of deepcopy().
+
+   It maps the objects already copied to their copies.  As long as only C
+   code uses it, it is an identity hash table holding references to both,
+   which keeps the originals alive.  When Python code needs it, it is
+   converted to a dict mapping id(original) to copy, with a list of the
+   originals under the key id(memo), like copy._keep_alive() does. */
+
+typedef struct {
+    _Py_hashtable_t *table;
+    /* Borrowed if given by the caller of deepcopy() */
+    PyObject *dict;
+    int owns_dict;
+} copy_memo;
+
+static void
+memo_decref(void *obj)
+{
+    Py_DECREF((PyObject *)obj);
+}
+
+static int
+memo_init(copy_memo *memo, PyObject *dict)
+{
+    memo->table = NULL;
+    memo->dict = NULL;
+    memo->owns_dict = 0;
+    if (dict != Py_None) {
+        memo->dict = dict;
+        return 0;
+    }
+    memo->table = _Py_hashtable_new_full(_Py_hashtable_hash_ptr,
+                                         _Py_hashtable_compare_direct,
+                                         memo_decref, memo_decref, NULL);
+    if (memo->table == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    return 0;
+}
+
+static void
+memo_fini(copy_memo *memo)
+{
+    if (memo->table != NULL) {
+        _Py_hashtable_destroy(memo->table);
+        memo->table = NULL;
+    }
+    if (memo->owns_dict) {
+        Py_CLEAR(memo->dict);
+    }
+}
+
+/* Return 1 and set *copy to a new reference if x was already copied,
+   return 0 if it was not, and -1 on error. */
+static int
+memo_get(copy_memo *memo, PyObject *x, PyObject **copy)
+{
+    if (memo->table != NULL) {
+        PyObject *y = _Py_hashtable_get(memo->table, x);
+        if (y == NULL) {
+            *copy = NULL;
+            return 0;
+        }
+        *copy = Py_NewRef(y);
+        return 1;
+    }
+    PyObject *key = PyLong_FromVoidPtr(x);
+    if (key == NULL) {
+        *copy = NULL;
+        return -1;
+    }
+    int res;
+    if (PyDict_CheckExact(memo->dict)) {
+        res = PyDict_GetItemRef(memo->dict, key, copy);
+    }
+    else {
+        res = PyMapping_GetOptionalItem(memo->dict, key, copy);
+    }
+    Py_DECREF(key);
+    return res;
+}
+
+static int
+memo_set(copy_memo *memo, PyObject *x, PyObject *y)
+{
+    if (memo->table != NULL) {
+        _Py_hashtable_entry_t *entry = _Py_hashtable_get_entry(memo->table, x);
+        if (entry != NULL) {
+            PyObject *old = entry->value;
+            entry->value = Py_NewRef(y);
+            Py_DECREF(old);
+            return 0;
+        }
+        if (_Py_hashtable_set(memo->table, Py_NewRef(x), Py_NewRef(y)) < 0) {
+            Py_DECREF(x);
+            Py_DECREF(y);
+            PyErr_NoMemory();
+            return -1;
+        }
+        return 0;
+    }
+    PyObject *key = PyLong_FromVoidPtr(x);
+    if (key == NULL) {
+        return -1;
+    }
+    int res = PyObject_SetItem(memo->dict, key, y);
+    Py_DECREF(key);
+    return res;
+}
+
+/* Keep x alive as long as the memo, see copy._keep_alive(). */
+static int
+memo_keep_alive(copy_memo *memo, PyObject *x)
+{
+    if (memo->table != NULL) {
+        /* The table holds a reference to x */
+        return 0;
+    }
+    PyObject *key = PyLong_FromVoidPtr(memo->dict);
+    if (key == NULL) {
+        return -1;
+    }
+    PyObject *list;
+    int res = PyMapping_GetOptionalItem(memo->dict, key, &list);
+    if (res == 0) {
+        list = PyList_New(0);
+        if (list != NULL) {
+            res = PyObject_SetItem(memo->dict, key, list);
+        }
+        else {
+            res = -1;
+        }
+    }
+    Py_DECREF(key);
+    if (res < 0) {
+        Py_XDECREF(list);
+        return -1;
+    }
+    if (PyList_CheckExact(list)) {
+        res = PyList_Append(list, x);
+    }
+    else {
+        PyObject *r = PyObject_CallMethodOneArg(list, &_Py_ID(append), x);
+        res = r == NULL ? -1 : 0;
+        Py_XDECREF(r);
+    }
+    Py_DECREF(list);
+    return res;
+}
+
+typedef struct {
+    PyObject *dict;
+    PyObject *keep_alive;
+} memo_convert_data;
+
+static int
+memo_convert_entry(_Py_hashtable_t *Py_UNUSED(table),
+                   const void *x, const void *y, void *user_data)
+{
+    memo_convert_data *data = (memo_convert_data *)user_data;
+    PyObject *key = PyLong_FromVoidPtr((void *)x);
+    if (key == NULL) {
+        return -1;
+    }
+    int res = PyDict_SetItem(data->dict, key, (PyObject *)y);
+    Py_DECREF(key);
+    if (res < 0) {
+        return -1;
+    }
+    return PyList_Append(data->keep_alive, (PyObject *)x);
+}
+
+/* Return the memo as Python code sees it (a borrowed reference), converting
+   the hash table to a dict if needed. */
+static PyObject *
+memo_as_dict(copy_memo *memo)
+{
+    if (memo->table == NULL) {
+        return memo->dict;
+    }
+    memo_convert_data data;
+    data.dict = PyDict_New();
+    if (data.dict == NULL) {
+        return NULL;
+    }
+    data.keep_alive = PyList_New(0);
+    if (data.keep_alive == NULL) {
+        Py_DECREF(data.dict);
+        return NULL;
+    }
+    if (_Py_hashtable_foreach(memo->table, memo_convert_entry, &data) < 0) {
+        goto error;
+    }
+    if (PyList_GET_SIZE(data.keep_alive)) {
+        PyObject *key = PyLong_FromVoidPtr(data.dict);
+        if (key == NULL) {
+            goto error;
+        }
+        int res = PyDict_SetItem(data.dict, key, data.keep_alive);
+        Py_DECREF(key);
+        if (res < 0) {
+            goto error;
+        }
+    }
+    Py_DECREF(data.keep_alive);
+    _Py_hashtable_destroy(memo->table);
+    memo->table = NULL;
+    memo->dict = data.dict;
+    memo->owns_dict = 1;
+    return memo->dict;
+
+error:
+    Py_DECREF(data.dict);
+    Py_DECREF(data.keep_alive);
+    return NULL;
+}
+
+
+/* Helpers shared by copy() and deepcopy() */
+
+static PyObject *deepcopy_object(copy_state *, PyObject *, copy_memo *);
+
+/* Return x.__reduce_ex__(4), or what takes its place. */
+static PyObject *
+copy_reduce(copy_state *state, PyObject *x, int deep)
+{
+    PyObject *reductor;
+    PyObject *rv;
+    if (PyDict_GetItemRef(state->dispatch_table, (PyObject *)Py_TYPE(x),
+                          &reductor) < 0) {
+        return NULL;
+    }
+    if (reductor != NULL) {
+        int use = 1;
+        if (deep) {
+            use = PyObject_IsTrue(reductor);
+            if (use < 0) {
+                Py_DECREF(reductor);
+                return NULL;
+            }
+        }
+        if (use) {
+            rv = PyObject_CallOneArg(reductor, x);
+            Py_DECREF(reductor);
+            return rv;
+        }
+        Py_DECREF(reductor);
+    }
+    if (PyObject_GetOptionalAttr(x, &_Py_ID(__reduce_ex__), &reductor) < 0) {
+        return NULL;
+    }
+    if (reductor != NULL) {
+        PyObject *proto = PyLong_FromLong(4);
+        if (proto == NULL) {
+            Py_DECREF(reductor);
+            return NULL;
+        }
+        rv = PyObject_CallOneArg(reductor, proto);
+        Py_DECREF(proto);
+        Py_DECREF(reductor);
+        return rv;
+    }
+    if (PyObject_GetOptionalAttr(x, &_Py_ID(__reduce__), &reductor) < 0) {
+        return NULL;
+    }
+    if (reductor != NULL) {
+        int use = PyObject_IsTrue(reductor);
+        if (use > 0) {
+            rv = PyObject_CallNoArgs(reductor);
+            Py_DECREF(reductor);
+            return rv;
+        }
+        Py_DECREF(reductor);
+        if (use < 0) {
+            return NULL;
+        }
+    }
+    PyErr_Format(state->error, "un%scopyable object of type %S",
+                 deep ? "(deep)" : "(shallow)", Py_TYPE(x));
+    return NULL;
+}
+
+/* Unpack a key-value pair like "key, value = item" */
+static int
+unpack_pair(PyObject *item, PyObject **key, PyObject **value)
+{
+    PyObject *pair;
+    if (PyTuple_CheckExact(item)) {
+        pair = Py_NewRef(item);
+    }
+    else {
+        pair = PySequence_Tuple(item);
+        if (pair == NULL) {
+            return -1;
+        }
+    }
+    if (PyTuple_GET_SIZE(pair) != 2) {
+        if (PyTuple_GET_SIZE(pair) < 2) {
+            PyErr_Format(PyExc_ValueError,
+                         "not enough values to unpack (expected 2, got %zd)",
+                         PyTuple_GET_SIZE(pair));
+        }
+        else {
+            PyErr_SetString(PyExc_ValueError,
+                            "too many values to unpack (expected 2)");
+        }
+        Py_DECREF(pair);
+        return -1;
+    }
+    *key = Py_NewRef(PyTuple_GET_ITEM(pair, 0));
+    *value = Py_NewRef(PyTuple_GET_ITEM(pair, 1));
+    Py_DECREF(pair);
+    return 0;
+}
+
+/* Apply the state of a reduce value, see copy._reconstruct() */
+static int
+reconstruct_state(PyObject *y, PyObject *state)
+{
+    PyObject *setstate, *slotstate = NULL;
+    int res = -1;
+
+    if (PyObject_GetOptionalAttr(y, &_Py_ID(__setstate__), &setstate) < 0) {
+        return -1;
+    }
+    if (setstate != NULL) {
+        PyObject *r = PyObject_CallOneArg(setstate, state);
+        Py_DECREF(setstate);
+        if (r == NULL) {
+            return -1;
+        }
+        Py_DECREF(r);
+        return 0;
+    }
+
+    Py_INCREF(state);
+    if (PyTuple_Check(state) && PyTuple_GET_SIZE(state) == 2) {
+        PyObject *tmp = state;
+        state = Py_NewRef(PyTuple_GET_ITEM(tmp, 0));
+        slotstate = Py_NewRef(PyTuple_GET_ITEM(tmp, 1));
+        Py_DECREF(tmp);
+    }
+    if (state != Py_None) {
+        PyObject *dict = PyObject_GetAttr(y, &_Py_ID(__dict__));
+        if (dict == NULL) {
+            goto done;
+        }
+        if (PyDict_CheckExact(dict) && PyDict_CheckExact(state)) {
+            res = PyDict_Update(dict, state);
+        }
+        else {
+            PyObject *r = PyObject_CallMethodOneArg(dict, &_Py_ID(update),
+                                                    state);
+            res = r == NULL ? -1 : 0;
+            Py_XDECREF(r);
+        }
+        Py_DECREF(dict);
+        if (res < 0) {
+            goto done;
+        }
+    }
+    res = 0;
+    if (slotstate != NULL && slotstate != Py_None) {
+        PyObject *items, *it, *item;
+        if (PyDict_CheckExact(slotstate)) {
+            items = PyDict_Items(slotstate);
+        }
+        else {
+            items = PyObject_CallMethodNoArgs(slotstate, &_Py_ID(items));
+        }
+        if (items == NULL) {
+            res = -1;
+            goto done;
+        }
+        it = PyObject_GetIter(items);
+        Py_DECREF(items);
+        if (it == NULL) {
+            res = -1;
+            goto done;
+        }
+        while ((item = PyIter_Next(it)) != NULL) {
+            PyObject *key, *value;
+            res = unpack_pair(item, &key, &value);
+            Py_DECREF(item);
+            if (res == 0) {
+                res = PyObject_SetAttr(y, key, value);
+                Py_DECREF(key);
+                Py_DECREF(value);
+            }
+            if (res < 0) {
+                break;
+            }
+        }
+        Py_DECREF(it);
+        if (res == 0 && PyErr_Occurred()) {
+            res = -1;
+        }
+    }
+
+done:
+    Py_DECREF(state);
+    Py_XDECREF(slotstate);
+    return res;
+}
+
+/* Create a copy of x from its reduce value rv, see copy._reconstruct().
+   memo is NULL for a shallow copy. */
+static PyObject *
+reconstruct(copy_state *st, PyObject *x, copy_memo *memo, PyObject *rv)
+{
+    PyObject *func, *args, *state, *listiter, *dictiter;
+    PyObject *y = NULL, *it = NULL, *item;
+    Py_ssize_t n;
+
+    if (PyTuple_Check(rv)) {
+        rv = Py_NewRef(rv);
+    }
+    else {
+        rv = PySequence_Tuple(rv);
+        if (rv == NULL) {
+            return NULL;
+        }
+    }
+    n = PyTuple_GET_SIZE(rv);
+    if (n < 2 || n > 5) {
+        PyErr_Format(PyExc_TypeError,
+                     "reduce value must have 2 to 5 items, not %zd", n);
+        goto error;
+    }
+    func = PyTuple_GET_ITEM(rv, 0);
+    state = n > 2 ? PyTuple_GET_ITEM(rv, 2) : Py_None;
+    listiter = n > 3 ? PyTuple_GET_ITEM(rv, 3) : Py_None;
+    dictiter = n > 4 ? PyTuple_GET_ITEM(rv, 4) : Py_None;
+
+    args = PyTuple_GET_ITEM(rv, 1);
+    int deep_args = 0;
+    if (memo != NULL) {
+        deep_args = PyObject_IsTrue(args);
+        if (deep_args < 0) {
+            goto error;
+        }
+    }
+    if (deep_args) {
+        PyObject *list = PySequence_List(args);
+        if (list == NULL) {
+            goto error;
+        }
+        for (Py_ssize_t i = 0; i < PyList_GET_SIZE(list); i++) {
+            PyObject *copy = deepcopy_object(st, PyList_GET_ITEM(list, i),
+                                             memo);
+            if (copy == NULL) {
+                Py_DECREF(list);
+                goto error;
+            }
+            Py_SETREF(PyList_GET_ITEM(list, i), copy);
+        }
+        args = PyList_AsTuple(list);
+        Py_DECREF(list);
+    }
+    else {
+        args = PySequence_Tuple(args);
+    }
+    if (args == NULL) {
+        goto error;
+    }
+    if (func == st->newobj && PyTuple_GET_SIZE(args) > 0) {
+        /* copyreg.__newobj__(cls, *args) is cls.__new__(cls, *args) */
+        PyObject *new = PyObject_GetAttr(PyTuple_GET_ITEM(args, 0),
+                                         &_Py_ID(__new__));
+        if (new != NULL) {
+            y = PyObject_Call(new, args, NULL);
+            Py_DECREF(new);
+        }
+    }
+    else {
+        y = PyObject_Call(func, args, NULL);
+    }
+    Py_DECREF(args);
+    if (y == NULL) {
+        goto error;
+    }
+    if (memo != NULL && memo_set(memo, x, y) < 0) {
+        goto error;
+    }
+
+    if (state != Py_None) {
+        int res;
+        if (memo != NULL) {
+            state = deepcopy_object(st, state, memo);
+            if (state == NULL) {
+                goto error;
+            }
+        }
+        else {
+            Py_INCREF(state);
+        }
+        res = reconstruct_state(y, state);
+        Py_DECREF(state);
+        if (res < 0) {
+            goto error;
+        }
+    }
+
+    if (listiter != Py_None) {
+        it = PyObject_GetIter(listiter);
+        if (it == NULL) {
+            goto error;
+        }
+        while ((item = PyIter_Next(it)) != NULL) {
+            int res;
+            if (memo != NULL) {
+                Py_SETREF(item, deepcopy_object(st, item, memo));
+                if (item == NULL) {
+                    goto error;
+                }
+            }
+            if (PyList_CheckExact(y)) {
+                res = PyList_Append(y, item);
+            }
+            else {
+                PyObject *r = PyObject_CallMethodOneArg(y, &_Py_ID(append),
+                                                        item);
+                res = r == NULL ? -1 : 0;
+                Py_XDECREF(r);
+            }
+            Py_DECREF(item);
+            if (res < 0) {
+                goto error;
+            }
+        }
+        if (PyErr_Occurred()) {
+            goto error;
+        }
+        Py_CLEAR(it);
+    }
+
+    if (dictiter != Py_None) {
+        it = PyObject_GetIter(dictiter);
+        if (it == NULL) {
+            goto error;
+        }
+        while ((item = PyIter_Next(it)) != NULL) {
+            PyObject *key, *value;
+            int res = unpack_pair(item, &key, &value);
+            Py_DECREF(item);
+            if (res < 0) {
+                goto error;
+            }
+            if (memo != NULL) {
+                Py_SETREF(key, deepcopy_object(st, key, memo));
+                if (key == NULL) {
+                    Py_DECREF(value);
+                    goto error;
+                }
+                Py_SETREF(value, deepcopy_object(st, value, memo));
+                if (value == NULL) {
+                    Py_DECREF(key);
+                    goto error;
+                }
+            }
+            res = PyObject_SetItem(y, key, value);
+            Py_DECREF(key);
+            Py_DECREF(value);
+            if (res < 0) {
+                goto error;
+            }
+        }
+        if (PyErr_Occurred()) {
+            goto error;
+        }
+        Py_CLEAR(it);
+    }
+
+    Py_DECREF(rv);
+    return y;
+
+error:
+    Py_XDECREF(it);
+    Py_XDECREF(y);
+    Py_DECREF(rv);
+    return NULL;
+}
+
+
+/* copy() */
+
+static int
+is_copy_atomic(PyTypeObject *cls)
+{
+    return (cls == &PyUnicode_Type || cls == &PyLong_Type ||
+            cls == &PyFloat_Type || cls == &PyTuple_Type ||
+            cls == &PyBool_Type || cls == Py_TYPE(Py_None) ||
+            cls == &PyBytes_Type || cls == &PyFrozenSet_Type ||
+            cls == &PyComplex_Type || cls == &PyType_Type ||
+            cls == &PyFunction_Type || cls == &PyCFunction_Type ||
+            cls == &PyRange_Type || cls == &PySlice_Type ||
+            cls == &PyProperty_Type || cls == &PyCode_Type ||
+            cls == &_PyWeakref_RefType || cls == &PySuper_Type ||
+            cls == &PyEllipsis_Type || cls == Py_TYPE(Py_NotImplemented));
+}
+
+/*[clinic input]
+_copy.copy
+
+    x: object
+
+Shallow copy operation on arbitrary Python objects.
+
+See the documentation of the copy module for more info.
+[clinic start generated code]*/
+
+static PyObject *
+_copy_copy_impl(PyObject *module, PyObject *x)
+/*[clinic end generated code: output=127044c4b15d8244 input=57ec391d54e5dd2a]*/
+{
+    copy_state *st = get_copy_state(module);
+    PyTypeObject *cls = Py_TYPE(x);
+    PyObject *copier, *rv, *y;
+
+    if (is_copy_atomic(cls)) {
+        return Py_NewRef(x);
+    }
+    if (cls == &PyList_Type) {
+        return PyList_GetSlice(x, 0, PY_SSIZE_T_MAX);
+    }
+    if (cls == &PyDict_Type) {
+        return PyDict_Copy(x);
+    }
+    if (cls == &PySet_Type) {
+        return PySet_New(x);
+    }
+    if (cls == &PyByteArray_Type) {
+        return PyObject_CallMethodNoArgs(x, &_Py_ID(copy));
+    }
+    if (PyType_IsSubtype(cls, &PyType_Type)) {
+        /* treat it as a regular class */
+        return Py_NewRef(x);
+    }
+
+    if (PyObject_GetOptionalAttr((PyObject *)cls, &_Py_ID(__copy__),
+                                 &copier) < 0) {
+        return NULL;
+    }
+    if (copier != NULL) {
+        y = PyObject_CallOneArg(copier, x);
+        Py_DECREF(copier);
+        return y;
+    }
+
+    rv = copy_reduce(st, x, 0);
+    if (rv == NULL) {
+        return NULL;
+    }
+    if (PyUnicode_Check(rv)) {
+        Py_DECREF(rv);
+        return Py_NewRef(x);
+    }
+    y = reconstruct(st, x, NULL, rv);
+    Py_DECREF(rv);
+    return y;
+}
+
+
+/* deepcopy() */
+
+static int
+is_deepcopy_atomic(PyTypeObject *cls)
+{
+    return (cls == &PyUnicode_Type || cls == &PyLong_Type ||
+            cls == &PyFloat_Type || cls == &PyBool_Type ||
+            cls == Py_TYPE(Py_None) || cls == &PyBytes_Type ||
+            cls == &PyComplex_Type || cls == &PyType_Type ||
+            cls == &PyFunction_Type || cls == &PyCFunction_Type ||
+            cls == &PyRange_Type || cls == &PyProperty_Type ||
+            cls == &PyCode_Type || cls == &_PyWeakref_RefType ||
+            cls == &PyEllipsis_Type || cls == Py_TYPE(Py_NotImplemented));
+}
+
+static PyObject *
+deepcopy_list(copy_state *st, PyObject *x, copy_memo *memo)
+{
+    PyObject *y = PyList_New(0);
+    if (y == NULL) {
+        return NULL;
+    }
+    if (memo_set(memo, x, y) < 0) {
+        goto error;
+    }
+    /* Like "for a in x", tolerate the list changing while it is copied */
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(x); i++) {
+        PyObject *item = PyList_GetItemRef(x, i);
+        if (item == NULL) {
+            goto error;
+        }
+        PyObject *copy = deepcopy_object(st, item, memo);
+        Py_DECREF(item);
+        if (copy == NULL) {
+            goto error;
+        }
+        int res = PyList_Append(y, copy);
+        Py_DECREF(copy);
+        if (res < 0) {
+            goto error;
+        }
+    }
+    return y;
+
+error:
+    Py_DECREF(y);
+    return NULL;
+}
+
+static PyObject *
+deepcopy_tuple(copy_state *st, PyObject *x, copy_memo *memo)
+{
+    Py_ssize_t n = PyTuple_GET_SIZE(x);
+    int changed = 0;
+    PyObject *y = PyTuple_New(n);
+    if (y == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *item = PyTuple_GET_ITEM(x, i);
+        PyObject *copy = deepcopy_object(st, item, memo);
+        if (copy == NULL) {
+            Py_DECREF(y);
+            return NULL;
+        }
+        changed |= copy != item;
+        PyTuple_SET_ITEM(y, i, copy);
+    }
+    /* We're not going to put the tuple in the memo, but it's still
+       important we check for it, in case the tuple contains recursive
+       mutable structures. */
+    PyObject *copy;
+    int res = memo_get(memo, x, &copy);
+    if (res != 0) {
+        Py_DECREF(y);
+        return res < 0 ? NULL : copy;
+    }
+    if (!changed) {
+        Py_DECREF(y);
+        return Py_NewRef(x);
+    }
+    return y;
+}
+
+static int
+deepcopy_dict_items_lock_held(copy_state *st, PyObject *x, PyObject *y,
+                              copy_memo *memo)
+{
+    Py_ssize_t size = PyDict_GET_SIZE(x);
+    Py_ssize_t pos = 0;
+    PyObject *key, *value;
+    while (PyDict_Next(x, &pos, &key, &value)) {
+        Py_INCREF(key);
+        Py_INCREF(value);
+        PyObject *key_copy = deepcopy_object(st, key, memo);
+        PyObject *value_copy = NULL;
+        if (key_copy != NULL) {
+            value_copy = deepcopy_object(st, value, memo);
+        }
+        Py_DECREF(key);
+        Py_DECREF(value);
+        if (value_copy == NULL) {
+            Py_XDECREF(key_copy);
+            return -1;
+        }
+        int res = PyDict_SetItem(y, key_copy, value_copy);
+        Py_DECREF(key_copy);
+        Py_DECREF(value_copy);
+        if (res < 0) {
+            return -1;
+        }
+        if (PyDict_GET_SIZE(x) != size) {
+            PyErr_SetString(PyExc_RuntimeError,
+                            "dictionary changed size during iteration");
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static PyObject *
+deepcopy_dict(copy_state *st, PyObject *x, copy_memo *memo)
+{
+    int res;
+    PyObject *y = PyDict_New();
+    if (y == NULL) {
+        return NULL;
+    }
+    if (memo_set(memo, x, y) < 0) {
+        Py_DECREF(y);
+        return NULL;
+    }
+    Py_BEGIN_CRITICAL_SECTION(x);
+    res = deepcopy_dict_items_lock_held(st, x, y, memo);
+    Py_END_CRITICAL_SECTION();
+    if (res < 0) {
+        Py_DECREF(y);
+        return NULL;
+    }
+    return y;
+}
+
+/* Copy a set or a frozenset.  This does what reconstructing it from
+   __reduce_ex__() would do. */
+static PyObject *
+deepcopy_set(copy_state *st, PyObject *x, copy_memo *memo)
+{
+    PyObject *items = PySequence_List(x);
+    if (items == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(items); i++) {
+        PyObject *copy = deepcopy_object(st, PyList_GET_ITEM(items, i), memo);
+        if (copy == NULL) {
+            Py_DECREF(items);
+            return NULL;
+        }
+        Py_SETREF(PyList_GET_ITEM(items, i), copy);
+    }
+    PyObject *y;
+    if (PyFrozenSet_CheckExact(x)) {
+        y = PyFrozenSet_New(items);
+    }
+    else {
+        y = PySet_New(items);
+    }
+    Py_DECREF(items);
+    return y;
+}
+
+static PyObject *
+deepcopy_method(copy_state *st, PyObject *x, copy_memo *memo)
+{
+    PyObject *self = deepcopy_object(st, PyMethod_GET_SELF(x), memo);
+    if (self == NULL) {
+        return NULL;
+    }
+    PyObject *y = PyMethod_New(PyMethod_GET_FUNCTION(x), self);
+    Py_DECREF(self);
+    return y;
+}
+
+/* The part of copy.deepcopy() not handled by a fast path */
+static PyObject *
+deepcopy_generic(copy_state *st, PyObject *x, copy_memo *memo)
+{
+    PyTypeObject *cls = Py_TYPE(x);
+    PyObject *copier, *rv, *y, *memo_dict;
+
+    if (PyDict_GetItemRef(st->deepcopy_dispatch, (PyObject *)cls,
+                          &copier) < 0) {
+        return NULL;
+    }
+    if (copier != NULL) {
+        memo_dict = memo_as_dict(memo);
+        if (memo_dict == NULL) {
+            Py_DECREF(copier);
+            return NULL;
+        }
+        PyObject *args[2] = {x, memo_dict};
+        y = PyObject_Vectorcall(copier, args, 2, NULL);
+        Py_DECREF(copier);
+        return y;
+    }
+    if (PyType_IsSubtype(cls, &PyType_Type)) {
+        /* atomic copy */
+        return Py_NewRef(x);
+    }
+
+    if (PyObject_GetOptionalAttr(x, &_Py_ID(__deepcopy__), &copier) < 0) {
+        return NULL;
+    }
+    if (copier != NULL) {
+        memo_dict = memo_as_dict(memo);
+        if (memo_dict == NULL) {
+            Py_DECREF(copier);
+            return NULL;
+        }
+        y = PyObject_CallOneArg(copier, memo_dict);
+        Py_DECREF(copier);
+        return y;
+    }
+
+    rv = copy_reduce(st, x, 1);
+    if (rv == NULL) {
+        return NULL;
+    }
+    if (PyUnicode_Check(rv)) {
+        Py_DECREF(rv);
+        return Py_NewRef(x);
+    }
+    y = reconstruct(st, x, memo, rv);
+    Py_DECREF(rv);
+    return y;
+}
+
+static PyObject *
+deepcopy_object(copy_state *st, PyObject *x, copy_memo *memo)
+{
+    PyTypeObject *cls = Py_TYPE(x);
+    PyObject *y;
+
+    if (is_deepcopy_atomic(cls)) {
+        return Py_NewRef(x);
+    }
+    int res = memo_get(memo, x, &y);
+    if (res != 0) {
+        return res < 0 ? NULL : y;
+    }
+
+    if (Py_EnterRecursiveCall(" while deep-copying an object")) {
+        return NULL;
+    }
+    if (cls == &PyDict_Type) {
+        y = deepcopy_dict(st, x, memo);
+    }
+    else if (cls == &PyList_Type) {
+        y = deepcopy_list(st, x, memo);
+    }
+    else if (cls == &PyTuple_Type) {
+        y = deepcopy_tuple(st, x, memo);
+    }
+    else if (cls == &PyMethod_Type) {
+        y = deepcopy_method(st, x, memo);
+    }
+    else if (cls == &PySet_Type || cls == &PyFrozenSet_Type) {
+        /* Sets have no fast path in the Python implementation, so respect
+           a reducer registered for them. */
+        res = PyDict_Contains(st->dispatch_table, (PyObject *)cls);
+        if (res < 0) {
+            y = NULL;
+        }
+        else if (res) {
+            y = deepcopy_generic(st, x, memo);
+        }
+        else {
+            y = deepcopy_set(st, x, memo);
+        }
+    }
+    else {
+        y = deepcopy_generic(st, x, memo);
+    }
+    Py_LeaveRecursiveCall();
+    if (y == NULL) {
+        return NULL;
+    }
+
+    /* If is its own copy, don't memoize. */
+    if (y != x) {
+        if (memo_set(memo, x, y) < 0 || memo_keep_alive(memo, x) < 0) {
+            Py_DECREF(y);
+            return NULL;
+        }
+    }
+    return y;
+}
+
+/*[clinic input]
+_copy.deepcopy
+
+    x: object
+    memo: object = None
+
+Deep copy operation on arbitrary Python objects.
+
+See the documentation of the copy module for more info.
+[clinic start generated code]*/
+
+static PyObject *
+_copy_deepcopy_impl(PyObject *module, PyObject *x, PyObject *memo)
+/*[clinic end generated code: output=825a9c8dd4bfc002 input=6a5332fc6d9d0d0c]*/
+{
+    copy_state *st = get_copy_state(module);
+    copy_memo m;
+    PyObject *y;
+
+    if (is_deepcopy_atomic(Py_TYPE(x))) {
+        return Py_NewRef(x);
+    }
+    if (memo_init(&m, memo) < 0) {
+        return NULL;
+    }
+    y = deepcopy_object(st, x, &m);
+    memo_fini(&m);
+    return y;
+}
+
+
+static PyMethodDef copy_methods[] = {
+    _COPY_COPY_METHODDEF
+    _COPY_DEEPCOPY_METHODDEF
+    {NULL, NULL}
+};
+
+static int
+copy_exec(PyObject *module)
+{
+    copy_state *st = get_copy_state(module);
+    PyObject *copyreg, *copy;
+
+    copyreg = PyImport_ImportModule("copyreg");
+    if (copyreg == NULL) {
+        return -1;
+    }
+    st->dispatch_table = PyObject_GetAttrString(copyreg, "dispatch_table");
+    st->newobj = PyObject_GetAttrString(copyreg, "__newobj__");
+    Py_DECREF(copyreg);
+    if (st->dispatch_table == NULL || st->newobj == NULL) {
+        return -1;
+    }
+    if (!PyDict_CheckExact(st->dispatch_table)) {
+        PyErr_Format(PyExc_RuntimeError,
+                     "copyreg.dispatch_table should be a dict, not %.200s",
+                     Py_TYPE(st->dispatch_table)->tp_name);
+        return -1;
+    }
+
+    /* The copy module imports this one after it defined these. */
+    copy = PyImport_ImportModule("copy");
+    if (copy == NULL) {
+        return -1;
+    }
+    st->error = PyObject_GetAttrString(copy, "Error");
+    st->deepcopy_dispatch = PyObject_GetAttrString(copy,
+                                                   "_deepcopy_dispatch");
+    Py_DECREF(copy);
+    if (st->error == NULL || st->deepcopy_dispatch == NULL) {
+        return -1;
+    }
+    if (!PyDict_CheckExact(st->deepcopy_dispatch)) {
+        PyErr_Format(PyExc_RuntimeError,
+                     "copy._deepcopy_dispatch should be a dict, not %.200s",
+                     Py_TYPE(st->deepcopy_dispatch)->tp_name);
+        return -1;
+    }
+    return 0;
+}
+
+static int
+copy_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    copy_state *st = get_copy_state(module);
+    Py_VISIT(st->error);
+    Py_VISIT(st->deepcopy_dispatch);
+    Py_VISIT(st->dispatch_table);
+    Py_VISIT(st->newobj);
+    return 0;
+}
+
+static int
+copy_clear(PyObject *module)
+{
+    copy_state *st = get_copy_state(module);
+    Py_CLEAR(st->error);
+    Py_CLEAR(st->deepcopy_dispatch);
+    Py_CLEAR(st->dispatch_table);
+    Py_CLEAR(st->newobj);
+    return 0;
+}
+
+static void
+copy_free(void *module)
+{
+    (void)copy_clear((PyObject *)module);
+}
+
+static PyModuleDef_Slot copy_slots[] = {
+    {Py_mod_exec, copy_exec},
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+    {0, NULL}
+};
+
+PyDoc_STRVAR(copy_module_doc,
+"C implementation of the copy module.");
+
+static struct PyModuleDef _copymodule = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_copy",
+    .m_doc = copy_module_doc,
+    .m_size = sizeof(copy_state),
+    .m_methods = copy_methods,
+    .m_slots = copy_slots,
+    .m_traverse = copy_traverse,
+    .m_clear = copy_clear,
+    .m_free = copy_free,
+};
+
+PyMODINIT_FUNC
+PyInit__copy(void)
+{
+    return PyModuleDef_Init(&_copymodule);
+}
@@ -21,10 +21,10 @@ module instead.
 
 /*[clinic input]
 module _csv
+class _csv.Reader "ReaderObj *" "clinic_state()->reader_type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=385118b71aa43706]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=076b6691199a1b2e]*/
 
-#include "clinic/_csv.c.h"
 #define NOT_SET ((Py_UCS4)-1)
 #define EOL ((Py_UCS4)-2)
 
@@ -96,6 +96,21 @@ typedef struct {
     const char *name;
 } StyleDesc;
 
+/* Encoding of the input lines of a reader. */
+typedef enum {
+    INPUT_STR, INPUT_UTF8, INPUT_LATIN1, INPUT_ASCII
+} InputEncoding;
+
+/* How a reader converts the fields of a column. */
+typedef enum {
+    CONVERT_DEFAULT,            /* as configured by the dialect */
+    CONVERT_STR,
+    CONVERT_INT,
+    CONVERT_FLOAT,
+    CONVERT_NONE_IF_EMPTY,      /* None if the field is empty, else str */
+    CONVERT_CALL                /* call the converter with the str */
+} ConverterKind;
+
 static const StyleDesc quote_styles[] = {
     { QUOTE_MINIMAL,    "QUOTE_MINIMAL" },
     { QUOTE_ALL,        "QUOTE_ALL" },
@@ -134,6 +149,11 @@ typedef struct {
     Py_ssize_t field_len;       /* length of current field */
     bool unquoted_field;        /* true if no quotes around the current field */
     unsigned long line_num;     /* Source-file line number */
+
+    InputEncoding encoding;     /* INPUT_STR unless reading bytes */
+    PyObject *converters;       /* converters as set by the user, or NULL */
+    PyObject *converter_funcs;  /* tuple of the converter for each column */
+    unsigned char *converter_kinds; /* ConverterKind for each column */
 } ReaderObj;
 
 typedef struct {
@@ -155,6 +175,8 @@ typedef struct {
 #define _ReaderObj_CAST(op)     ((ReaderObj *)(op))
 #define _WriterObj_CAST(op)     ((WriterObj *)(op))
 
+#include "clinic/_csv.c.h"
+
 /*
  * DIALECT class
  */
@@ -659,21 +681,193 @@ _call_dialect(_csvstate *module_state, PyObject *dialect_inst, PyObject *kwargs)
 /*
  * READER
  */
+
+/* Return the current field as a str. */
+static PyObject *
+field_to_str(ReaderObj *self)
+{
+    Py_ssize_t i = self->field_len;
+    if (self->encoding == INPUT_UTF8 || self->encoding == INPUT_ASCII) {
+        /* The field holds bytes.  Decode them unless they are all ASCII. */
+        for (i = 0; i < self->field_len && self->field[i] < 128; i++) {
+        }
+    }
+    if (i == self->field_len) {
+        /* The field holds code points (bytes are Latin-1 code points). */
+        return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                         (void *) self->field, self->field_len);
+    }
+    char *buf = PyMem_Malloc(self->field_len);
+    if (buf == NULL) {
+        return PyErr_NoMemory();
+    }
+    for (i = 0; i < self->field_len; i++) {
+        buf[i] = (char)self->field[i];
+    }
+    PyObject *field;
+    if (self->encoding == INPUT_UTF8) {
+        field = PyUnicode_DecodeUTF8(buf, self->field_len, NULL);
+    }
+    else {
+        field = PyUnicode_DecodeASCII(buf, self->field_len, NULL);
+    }
+    PyMem_Free(buf);
+    return field;
+}
+
+static inline int
+is_ascii_digit(Py_UCS4 c)
+{
+    return '0' <= c && c <= '9';
+}
+
+/* int(field) for a short decimal integer, without creating a str.
+   Return NULL without an exception set for other fields. */
+static PyObject *
+field_to_int_fast(ReaderObj *self)
+{
+    const Py_UCS4 *p = self->field, *end = p + self->field_len;
+    bool negative = false;
+    if (p < end && (*p == '+' || *p == '-')) {
+        negative = (*p == '-');
+        p++;
+    }
+    if (p == end || end - p > 18) {
+        return NULL;
+    }
+    long long value = 0;
+    for (; p < end; p++) {
+        if (!is_ascii_digit(*p)) {
+            return NULL;
+        }
+        value = value * 10 + (*p - '0');
+    }
+    return PyLong_FromLongLong(negative ? -value : value);
+}
+
+/* float(field) for a field of the form [+-]digits[.digits][e[+-]digits],
+   without creating a str.  Return NULL without an exception set for other
+   fields. */
+static PyObject *
+field_to_float_fast(ReaderObj *self)
+{
+    char buf[64];
+    const Py_UCS4 *f = self->field;
+    Py_ssize_t len = self->field_len, i = 0, ndigits = 0;
+    if (len == 0 || len >= (Py_ssize_t)sizeof(buf)) {
+        return NULL;
+    }
+    if (f[i] == '+' || f[i] == '-') {
+        i++;
+    }
+    for (; i < len && is_ascii_digit(f[i]); i++) {
+        ndigits++;
+    }
+    if (i < len && f[i] == '.') {
+        for (i++; i < len && is_ascii_digit(f[i]); i++) {
+            ndigits++;
+        }
+    }
+    if (ndigits == 0) {
+        return NULL;
+    }
+    if (i < len && (f[i] == 'e' || f[i] == 'E')) {
+        i++;
+        if (i < len && (f[i] == '+' || f[i] == '-')) {
+            i++;
+        }
+        Py_ssize_t exp_start = i;
+        for (; i < len && is_ascii_digit(f[i]); i++) {
+        }
+        if (i == exp_start) {
+            return NULL;
+        }
+    }
+    if (i != len) {
+        return NULL;
+    }
+    for (i = 0; i < len; i++) {
+        buf[i] = (char)f[i];
+    }
+    buf[len] = '\0';
+    double x = PyOS_string_to_double(buf, NULL, NULL);
+    if (x == -1.0 && PyErr_Occurred()) {
+        return NULL;
+    }
+    return PyFloat_FromDouble(x);
+}
+
+/* Convert the current field with the converter of the given column. */
+static PyObject *
+convert_field(ReaderObj *self, Py_ssize_t column)
+{
+    ConverterKind kind = self->converter_kinds[column];
+    PyObject *field, *result = NULL;
+
+    switch (kind) {
+    case CONVERT_NONE_IF_EMPTY:
+        if (self->field_len == 0) {
+            return Py_NewRef(Py_None);
+        }
+        _Py_FALLTHROUGH;
+    case CONVERT_STR:
+        return field_to_str(self);
+    case CONVERT_INT:
+        result = field_to_int_fast(self);
+        break;
+    case CONVERT_FLOAT:
+        result = field_to_float_fast(self);
+        break;
+    default:
+        break;
+    }
+    if (result != NULL || PyErr_Occurred()) {
+        return result;
+    }
+
+    field = field_to_str(self);
+    if (field == NULL) {
+        return NULL;
+    }
+    if (kind == CONVERT_INT) {
+        result = PyLong_FromUnicodeObject(field, 10);
+    }
+    else if (kind == CONVERT_FLOAT) {
+        result = PyFloat_FromString(field);
+    }
+    else {
+        PyObject *func = PyTuple_GET_ITEM(self->converter_funcs, column);
+        result = PyObject_CallOneArg(func, field);
+    }
+    Py_DECREF(field);
+    return result;
+}
+
 static int
 parse_save_field(ReaderObj *self)
 {
     int quoting = self->dialect->quoting;
+    Py_ssize_t column = PyList_GET_SIZE(self->fields);
     PyObject *field;
 
-    if (self->unquoted_field &&
+    if (self->converter_kinds != NULL &&
+        column < PyTuple_GET_SIZE(self->converter_funcs) &&
+        self->converter_kinds[column] != CONVERT_DEFAULT)
+    {
+        field = convert_field(self, column);
+        if (field == NULL) {
+            return -1;
+        }
+        self->field_len = 0;
+    }
+    else if (self->unquoted_field &&
         self->field_len == 0 &&
         (quoting == QUOTE_NOTNULL || quoting == QUOTE_STRINGS))
     {
         field = Py_NewRef(Py_None);
     }
     else {
-        field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
-                                        (void *) self->field, self->field_len);
+        field = field_to_str(self);
         if (field == NULL) {
             return -1;
         }
@@ -926,11 +1120,11 @@ parse_reset(ReaderObj *self)
     return 0;
 }
 
+/* Parse the next record.  Return NULL without an exception set at the end
+   of the input. */
 static PyObject *
-Reader_iternext(PyObject *op)
+parse_record(ReaderObj *self, _csvstate *module_state)
 {
-    ReaderObj *self = _ReaderObj_CAST(op);
-
     PyObject *fields = NULL;
     Py_UCS4 c;
     Py_ssize_t pos, linelen;
@@ -938,12 +1132,6 @@ Reader_iternext(PyObject *op)
     const void *data;
     PyObject *lineobj;
 
-    _csvstate *module_state = _csv_state_from_type(Py_TYPE(self),
-                                                   "Reader.__next__");
-    if (module_state == NULL) {
-        return NULL;
-    }
-
     if (parse_reset(self) < 0)
         return NULL;
     do {
@@ -960,21 +1148,40 @@ Reader_iternext(PyObject *op)
             }
             return NULL;
         }
-        if (!PyUnicode_Check(lineobj)) {
-            PyErr_Format(module_state->error_obj,
-                         "iterator should return strings, "
-                         "not %.200s "
-                         "(the file should be opened in text mode)",
-                         Py_TYPE(lineobj)->tp_name
-                );
-            Py_DECREF(lineobj);
-            return NULL;
+        if (self->encoding == INPUT_STR) {
+            if (!PyUnicode_Check(lineobj)) {
+                PyErr_Format(module_state->error_obj,
+                             "iterator should return strings, "
+                             "not %.200s "
+                             "(the file should be opened in text mode)",
+                             Py_TYPE(lineobj)->tp_name
+                    );
+                Py_DECREF(lineobj);
+                return NULL;
+            }
+            kind = PyUnicode_KIND(lineobj);
+            data = PyUnicode_DATA(lineobj);
+            linelen = PyUnicode_GET_LENGTH(lineobj);
+        }
+        else {
+            if (!PyBytes_Check(lineobj)) {
+                PyErr_Format(module_state->error_obj,
+                             "iterator should return bytes, "
+                             "not %.200s "
+                             "(the file should be opened in binary mode)",
+                             Py_TYPE(lineobj)->tp_name
+                    );
+                Py_DECREF(lineobj);
+                return NULL;
+            }
+            /* Parse the bytes as Latin-1; the dialect characters are ASCII
+               and the fields are decoded when they are saved. */
+            kind = PyUnicode_1BYTE_KIND;
+            data = PyBytes_AS_STRING(lineobj);
+            linelen = PyBytes_GET_SIZE(lineobj);
         }
         ++self->line_num;
-        kind = PyUnicode_KIND(lineobj);
-        data = PyUnicode_DATA(lineobj);
         pos = 0;
-        linelen = PyUnicode_GET_LENGTH(lineobj);
         while (linelen--) {
             c = PyUnicode_READ(kind, data, pos);
             if (parse_process_char(self, module_state, c) < 0) {
@@ -994,6 +1201,297 @@ Reader_iternext(PyObject *op)
     return fields;
 }
 
+static PyObject *
+Reader_iternext(PyObject *op)
+{
+    ReaderObj *self = _ReaderObj_CAST(op);
+    _csvstate *module_state = _csv_state_from_type(Py_TYPE(self),
+                                                   "Reader.__next__");
+    if (module_state == NULL) {
+        return NULL;
+    }
+    return parse_record(self, module_state);
+}
+
+/*[clinic input]
+_csv.Reader.readcolumns
+
+    size: Py_ssize_t = -1
+    /
+
+Read rows and return their fields grouped by column.
+
+Read at most size rows, or all remaining rows if size is negative, and
+return a list with a list of fields for each column.  Empty rows are
+skipped; all other rows must have the same number of fields.
+[clinic start generated code]*/
+
+static PyObject *
+_csv_Reader_readcolumns_impl(ReaderObj *self, Py_ssize_t size)
+/*[clinic end generated code: output=e942b676e1e06e1e input=f44ae2b72f4bf4d8]*/
+{
+    _csvstate *module_state = _csv_state_from_type(Py_TYPE(self),
+                                                   "Reader.readcolumns");
+    if (module_state == NULL) {
+        return NULL;
+    }
+    PyObject *columns = PyList_New(0);
+    if (columns == NULL) {
+        return NULL;
+    }
+    Py_ssize_t ncolumns = 0;
+    for (Py_ssize_t nrows = 0; size < 0 || nrows < size; nrows++) {
+        PyObject *fields;
+        do {
+            fields = parse_record(self, module_state);
+            if (fields == NULL) {
+                if (PyErr_Occurred()) {
+                    goto error;
+                }
+                return columns;
+            }
+            if (PyList_GET_SIZE(fields) == 0) {
+                Py_CLEAR(fields);
+            }
+        } while (fields == NULL);
+
+        Py_ssize_t nfields = PyList_GET_SIZE(fields);
+        if (nrows == 0) {
+            ncolumns = nfields;
+            for (Py_ssize_t i = 0; i < ncolumns; i++) {
+                PyObject *column = PyList_New(0);
+                if (column == NULL || PyList_Append(columns, column) < 0) {
+                    Py_XDECREF(column);
+                    Py_DECREF(fields);
+                    goto error;
+                }
+                Py_DECREF(column);
+            }
+        }
+        else if (nfields != ncolumns) {
+            PyErr_Format(module_state->error_obj,
+                         "expected %zd fields, saw %zd (line %lu)",
+                         ncolumns, nfields, self->line_num);
+            Py_DECREF(fields);
+            goto error;
+        }
+        for (Py_ssize_t i = 0; i < ncolumns; i++) {
+            if (PyList_Append(PyList_GET_ITEM(columns, i),
+                              PyList_GET_ITEM(fields, i)) < 0)
+            {
+                Py_DECREF(fields);
+                goto error;
+            }
+        }
+        Py_DECREF(fields);
+    }
+    return columns;
+
+error:
+    Py_DECREF(columns);
+    return NULL;
+}
+
+/*[clinic input]
+_csv.Reader._next_dict
+
+    fieldnames: object
+    restkey: object
+    restval: object
+    /
+
+Return the next non-empty row as a dict, as csv.DictReader does.
+[clinic start generated code]*/
+
+static PyObject *
+_csv_Reader__next_dict_impl(ReaderObj *self, PyObject *fieldnames,
+                            PyObject *restkey, PyObject *restval)
+/*[clinic end generated code: output=5cdd768d34804a3f input=3f546ada3cbe9420]*/
+{
+    _csvstate *module_state = _csv_state_from_type(Py_TYPE(self),
+                                                   "Reader._next_dict");
+    if (module_state == NULL) {
+        return NULL;
+    }
+    PyObject *row;
+    do {
+        row = parse_record(self, module_state);
+        if (row == NULL) {
+            if (!PyErr_Occurred()) {
+                PyErr_SetNone(PyExc_StopIteration);
+            }
+            return NULL;
+        }
+        if (PyList_GET_SIZE(row) == 0) {
+            Py_CLEAR(row);
+        }
+    } while (row == NULL);
+
+    PyObject *d = NULL;
+    PyObject *names = PySequence_Fast(fieldnames, "fieldnames must be a sequence");
+    if (names == NULL) {
+        goto done;
+    }
+    d = PyDict_New();
+    if (d == NULL) {
+        goto done;
+    }
+    Py_ssize_t lf = PySequence_Fast_GET_SIZE(names);
+    Py_ssize_t lr = PyList_GET_SIZE(row);
+    PyObject **keys = PySequence_Fast_ITEMS(names);
+    for (Py_ssize_t i = 0; i < lf; i++) {
+        PyObject *value = i < lr ? PyList_GET_ITEM(row, i) : restval;
+        if (PyDict_SetItem(d, keys[i], value) < 0) {
+            Py_CLEAR(d);
+            goto done;
+        }
+    }
+    if (lf < lr) {
+        PyObject *rest = PyList_GetSlice(row, lf, lr);
+        if (rest == NULL || PyDict_SetItem(d, restkey, rest) < 0) {
+            Py_CLEAR(d);
+        }
+        Py_XDECREF(rest);
+    }
+
+done:
+    Py_XDECREF(names);
+    Py_DECREF(row);
+    return d;
+}
+
+static int
+converter_kind(PyObject *converter)
+{
+    if (converter == Py_None) {
+        return CONVERT_NONE_IF_EMPTY;
+    }
+    if (converter == (PyObject *)&PyUnicode_Type) {
+        return CONVERT_STR;
+    }
+    if (converter == (PyObject *)&PyLong_Type) {
+        return CONVERT_INT;
+    }
+    if (converter == (PyObject *)&PyFloat_Type) {
+        return CONVERT_FLOAT;
+    }
+    if (PyCallable_Check(converter)) {
+        return CONVERT_CALL;
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "converter must be callable or None, not %.200s",
+                 Py_TYPE(converter)->tp_name);
+    return -1;
+}
+
+/* Set the converters from a sequence of converters or a dict mapping
+   column indices to converters. */
+static int
+reader_set_converters(ReaderObj *self, PyObject *converters)
+{
+    PyObject *funcs = NULL;
+    unsigned char *kinds = NULL;
+    Py_ssize_t n = 0;
+
+    if (converters == Py_None) {
+        goto done;
+    }
+    if (PyDict_Check(converters)) {
+        PyObject *key, *value;
+        Py_ssize_t pos = 0;
+        while (PyDict_Next(converters, &pos, &key, &value)) {
+            if (!PyLong_Check(key)) {
+                PyErr_Format(PyExc_TypeError,
+                             "converters keys must be column indices, "
+                             "not %.200s", Py_TYPE(key)->tp_name);
+                return -1;
+            }
+            Py_ssize_t column = PyLong_AsSsize_t(key);
+            if (column == -1 && PyErr_Occurred()) {
+                return -1;
+            }
+            if (column < 0) {
+                PyErr_SetString(PyExc_ValueError,
+                                "converters keys must not be negative");
+                return -1;
+            }
+            n = Py_MAX(n, column + 1);
+        }
+        funcs = PyTuple_New(n);
+        kinds = PyMem_Malloc(Py_MAX(n, 1));
+        if (funcs == NULL || kinds == NULL) {
+            goto error;
+        }
+        for (Py_ssize_t i = 0; i < n; i++) {
+            PyTuple_SET_ITEM(funcs, i, Py_NewRef(Py_None));
+            kinds[i] = CONVERT_DEFAULT;
+        }
+        pos = 0;
+        while (PyDict_Next(converters, &pos, &key, &value)) {
+            Py_ssize_t column = PyLong_AsSsize_t(key);
+            int kind = converter_kind(value);
+            if (kind < 0) {
+                goto error;
+            }
+            kinds[column] = (unsigned char)kind;
+            PyTuple_SetItem(funcs, column, Py_NewRef(value));
+        }
+    }
+    else {
+        funcs = PySequence_Tuple(converters);
+        if (funcs == NULL) {
+            if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+                PyErr_Format(PyExc_TypeError,
+                             "converters must be a sequence or a dict, "
+                             "not %.200s", Py_TYPE(converters)->tp_name);
+            }
+            return -1;
+        }
+        n = PyTuple_GET_SIZE(funcs);
+        kinds = PyMem_Malloc(Py_MAX(n, 1));
+        if (kinds == NULL) {
+            goto error;
+        }
+        for (Py_ssize_t i = 0; i < n; i++) {
+            int kind = converter_kind(PyTuple_GET_ITEM(funcs, i));
+            if (kind < 0) {
+                goto error;
+            }
+            kinds[i] = (unsigned char)kind;
+        }
+    }
+
+done:
+    Py_XSETREF(self->converters,
+               converters == Py_None ? NULL : Py_NewRef(converters));
+    Py_XSETREF(self->converter_funcs, funcs);
+    PyMem_Free(self->converter_kinds);
+    self->converter_kinds = kinds;
+    return 0;
+
+error:
+    if (kinds == NULL && !PyErr_Occurred()) {
+        PyErr_NoMemory();
+    }
+    Py_XDECREF(funcs);
+    PyMem_Free(kinds);
+    return -1;
+}
+
+static PyObject *
+Reader_get_converters(PyObject *op, void *Py_UNUSED(ignored))
+{
+    ReaderObj *self = _ReaderObj_CAST(op);
+    return Py_NewRef(self->converters ? self->converters : Py_None);
+}
+
+static int
+Reader_set_converters(PyObject *op, PyObject *value, void *Py_UNUSED(ignored))
+{
+    ReaderObj *self = _ReaderObj_CAST(op);
+    return reader_set_converters(self, value ? value : Py_None);
+}
+
 static void
 Reader_dealloc(PyObject *op)
 {
@@ -1005,6 +1503,10 @@ Reader_dealloc(PyObject *op)
         PyMem_Free(self->field);
         self->field = NULL;
     }
+    if (self->converter_kinds != NULL) {
+        PyMem_Free(self->converter_kinds);
+        self->converter_kinds = NULL;
+    }
     PyObject_GC_Del(self);
     Py_DECREF(tp);
 }
@@ -1016,6 +1518,8 @@ Reader_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(self->dialect);
     Py_VISIT(self->input_iter);
     Py_VISIT(self->fields);
+    Py_VISIT(self->converters);
+    Py_VISIT(self->converter_funcs);
     Py_VISIT(Py_TYPE(self));
     return 0;
 }
@@ -1027,6 +1531,8 @@ Reader_clear(PyObject *op)
     Py_CLEAR(self->dialect);
     Py_CLEAR(self->input_iter);
     Py_CLEAR(self->fields);
+    Py_CLEAR(self->converters);
+    Py_CLEAR(self->converter_funcs);
     return 0;
 }
 
@@ -1038,6 +1544,8 @@ PyDoc_STRVAR(Reader_Type_doc,
 );
 
 static struct PyMethodDef Reader_methods[] = {
+    _CSV_READER_READCOLUMNS_METHODDEF
+    _CSV_READER__NEXT_DICT_METHODDEF
     { NULL, NULL }
 };
 #define R_OFF(x) offsetof(ReaderObj, x)
@@ -1050,6 +1558,10 @@ static struct PyMemberDef Reader_memberlist[] = {
 
 #undef R_OFF
 
+static PyGetSetDef Reader_getsetlist[] = {
+    { "converters", Reader_get_converters, Reader_set_converters },
+    { NULL },
+};
 
 static PyType_Slot Reader_Type_slots[] = {
     {Py_tp_doc, (char*)Reader_Type_doc},
@@ -1058,6 +1570,7 @@ static PyType_Slot Reader_Type_slots[] = {
     {Py_tp_iternext, Reader_iternext},
     {Py_tp_methods, Reader_methods},
     {Py_tp_members, Reader_memberlist},
+    {Py_tp_getset, Reader_getsetlist},
     {Py_tp_clear, Reader_clear},
     {Py_tp_dealloc, Reader_dealloc},
     {0, NULL}
@@ -1072,10 +1585,68 @@ PyType_Spec Reader_Type_spec = {
 };
 
 
+/* Set the encoding of bytes input lines. */
+static int
+reader_set_encoding(ReaderObj *self, PyObject *encoding)
+{
+    if (!PyUnicode_Check(encoding)) {
+        PyErr_Format(PyExc_TypeError,
+                     "encoding must be a string, not %.200s",
+                     Py_TYPE(encoding)->tp_name);
+        return -1;
+    }
+    PyObject *lookup = PyImport_ImportModuleAttrString("codecs", "lookup");
+    if (lookup == NULL) {
+        return -1;
+    }
+    PyObject *info = PyObject_CallOneArg(lookup, encoding);
+    Py_DECREF(lookup);
+    if (info == NULL) {
+        return -1;
+    }
+    PyObject *name = PyObject_GetAttrString(info, "name");
+    Py_DECREF(info);
+    if (name == NULL) {
+        return -1;
+    }
+    /* The parser works on bytes, which is only correct if the encoding
+       never uses ASCII bytes for other characters. */
+    if (PyUnicode_Check(name) && PyUnicode_EqualToUTF8(name, "utf-8")) {
+        self->encoding = INPUT_UTF8;
+    }
+    else if (PyUnicode_Check(name) && PyUnicode_EqualToUTF8(name, "iso8859-1")) {
+        self->encoding = INPUT_LATIN1;
+    }
+    else if (PyUnicode_Check(name) && PyUnicode_EqualToUTF8(name, "ascii")) {
+        self->encoding = INPUT_ASCII;
+    }
+    else {
+        PyErr_Format(PyExc_ValueError,
+                     "encoding must be UTF-8, Latin-1 or ASCII, not %R",
+                     encoding);
+        Py_DECREF(name);
+        return -1;
+    }
+    Py_DECREF(name);
+
+    DialectObj *dialect = self->dialect;
+    if (dialect->delimiter >= 128 ||
+        (dialect->quotechar != NOT_SET && dialect->quotechar >= 128) ||
+        (dialect->escapechar != NOT_SET && dialect->escapechar >= 128))
+    {
+        PyErr_SetString(PyExc_ValueError,
+                        "delimiter, quotechar and escapechar must be ASCII "
+                        "characters when reading bytes");
+        return -1;
+    }
+    return 0;
+}
+
 static PyObject *
 csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
 {
     PyObject * iterator, * dialect = NULL;
+    PyObject *encoding = NULL, *converters = NULL;
     _csvstate *module_state = get_csv_state(module);
     ReaderObj * self = PyObject_GC_New(
         ReaderObj,
@@ -1090,6 +1661,10 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     self->field = NULL;
     self->field_size = 0;
     self->line_num = 0;
+    self->encoding = INPUT_STR;
+    self->converters = NULL;
+    self->converter_funcs = NULL;
+    self->converter_kinds = NULL;
 
     if (parse_reset(self) < 0) {
         Py_DECREF(self);
@@ -1105,15 +1680,42 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
         Py_DECREF(self);
         return NULL;
     }
+    /* The reader options are not formatting parameters of the dialect. */
+    if (keyword_args != NULL) {
+        keyword_args = PyDict_Copy(keyword_args);
+        if (keyword_args == NULL ||
+            PyDict_PopString(keyword_args, "encoding", &encoding) < 0 ||
+            PyDict_PopString(keyword_args, "converters", &converters) < 0)
+        {
+            goto error;
+        }
+    }
     self->dialect = (DialectObj *)_call_dialect(module_state, dialect,
                                                 keyword_args);
     if (self->dialect == NULL) {
-        Py_DECREF(self);
-        return NULL;
+        goto error;
+    }
+    if (encoding != NULL && encoding != Py_None &&
+        reader_set_encoding(self, encoding) < 0)
+    {
+        goto error;
+    }
+    if (converters != NULL && reader_set_converters(self, converters) < 0) {
+        goto error;
     }
+    Py_XDECREF(keyword_args);
+    Py_XDECREF(encoding);
+    Py_XDECREF(converters);
 
     PyObject_GC_Track(self);
     return (PyObject *)self;
+
+error:
+    Py_XDECREF(keyword_args);
+    Py_XDECREF(encoding);
+    Py_XDECREF(converters);
+    Py_DECREF(self);
+    return NULL;
 }
 
 /*
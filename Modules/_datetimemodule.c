@@ -37,6 +37,7 @@ static PyTypeObject PyDateTime_TimeZoneType;
 typedef struct {
     /* Module heap types. */
     PyTypeObject *isocalendar_date_type;
+    PyTypeObject *compiled_format_type;
 
     /* Conversion factors. */
     PyObject *us_per_ms;       // 1_000
@@ -335,8 +336,9 @@ class datetime.datetime "PyDateTime_DateTime *" "get_datetime_state()->datetime_
 class datetime.date "PyDateTime_Date *" "get_datetime_state()->date_type"
 class datetime.time "PyDateTime_Time *" "get_datetime_state()->time_type"
 class datetime.IsoCalendarDate "PyDateTime_IsoCalendarDate *" "get_datetime_state()->isocalendar_date_type"
+class datetime.CompiledFormat "PyObject *" "get_datetime_state()->compiled_format_type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=c8f3d834a860d50a]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=87c0df4b5d7728a3]*/
 
 #include "clinic/_datetimemodule.c.h"
 
@@ -1460,6 +1462,522 @@ new_timezone(PyObject *offset, PyObject *name)
     return create_timezone(offset, name);
 }
 
+/* ---------------------------------------------------------------------------
+ * strptime() fast path.
+ *
+ * Formats made only of %Y, %y, %m, %d, %j, %H, %M, %S, %f, %z, %% and ASCII
+ * text are matched here, with the same backtracking semantics as the
+ * regular expression built by _strptime.TimeRE.  Everything else
+ * (locale-dependent directives, non-ASCII data, data that does not match
+ * or does not make a valid result) is left to _strptime, which also
+ * produces the error messages.
+ */
+
+#define STRPTIME_MAX_ITEMS 64
+#define STRPTIME_MAX_STEPS 10000
+
+/* Item kinds.  Directives use their letter as the kind. */
+#define STRPTIME_LITERAL 0
+#define STRPTIME_SPACE 1
+
+typedef struct {
+    unsigned char kind;
+    unsigned char ch;           /* lowercased literal character */
+} strptime_item;
+
+typedef struct {
+    int nitems;
+    strptime_item items[STRPTIME_MAX_ITEMS];
+} strptime_format;
+
+typedef struct {
+    const Py_UCS1 *data;
+    Py_ssize_t length;
+    Py_ssize_t end;
+    int steps;
+    /* Start and end of the text matched by each item. */
+    Py_ssize_t spans[STRPTIME_MAX_ITEMS][2];
+} strptime_match;
+
+typedef struct {
+    int year, month, day;
+    int hour, minute, second, microsecond;
+    int has_offset;
+    int offset, offset_microseconds;
+} strptime_result;
+
+static const char strptime_directives[] = "dfHjmMSyYz";
+
+/* The alternatives of the regular expressions of the numeric directives in
+ * _strptime.TimeRE, in the same order.  Each alternative is a sequence of
+ * character ranges given as pairs of bounds.
+ */
+static const char * const strptime_d_alts[] = {
+    "3301", "1209", "0019", "19", "  19", NULL};
+static const char * const strptime_H_alts[] = {"2203", "0109", "09", NULL};
+static const char * const strptime_j_alts[] = {
+    "336606", "330509", "120909", "001909", "000019", "1909", "0019", "19",
+    NULL};
+static const char * const strptime_m_alts[] = {"1102", "0019", "19", NULL};
+static const char * const strptime_M_alts[] = {"0509", "09", NULL};
+static const char * const strptime_S_alts[] = {"6601", "0509", "09", NULL};
+static const char * const strptime_y_alts[] = {"0909", NULL};
+static const char * const strptime_Y_alts[] = {"09090909", NULL};
+
+/* Compile format into *fmt.  Return 1 on success, or 0 if the format must
+ * be handled by _strptime.
+ */
+static int
+strptime_compile(PyObject *format, strptime_format *fmt)
+{
+    if (!PyUnicode_IS_ASCII(format)) {
+        return 0;
+    }
+    const Py_UCS1 *s = PyUnicode_1BYTE_DATA(format);
+    Py_ssize_t length = PyUnicode_GET_LENGTH(format);
+    char seen[128] = {0};
+    int n = 0;
+
+    for (Py_ssize_t i = 0; i < length; i++) {
+        Py_UCS1 c = s[i];
+        if (Py_UNICODE_ISSPACE(c)) {
+            /* A run of whitespace becomes a single \s+. */
+            if (n > 0 && fmt->items[n - 1].kind == STRPTIME_SPACE) {
+                continue;
+            }
+            if (n == STRPTIME_MAX_ITEMS) {
+                return 0;
+            }
+            fmt->items[n++].kind = STRPTIME_SPACE;
+            continue;
+        }
+        if (n == STRPTIME_MAX_ITEMS) {
+            return 0;
+        }
+        if (c == '%') {
+            if (++i == length) {
+                return 0;
+            }
+            c = s[i];
+            if (c != '%') {
+                if (c == '\0' || strchr(strptime_directives, c) == NULL) {
+                    return 0;
+                }
+                if (seen[c]) {
+                    /* A redefined group is an error in _strptime. */
+                    return 0;
+                }
+                seen[c] = 1;
+                fmt->items[n++].kind = c;
+                continue;
+            }
+        }
+        fmt->items[n].kind = STRPTIME_LITERAL;
+        fmt->items[n++].ch = Py_TOLOWER(c);
+    }
+    /* _strptime warns about a day of month without a year. */
+    if (seen['d'] && !seen['Y'] && !seen['y']) {
+        return 0;
+    }
+    fmt->nitems = n;
+    return 1;
+}
+
+static const char * const *
+strptime_alternatives(int directive)
+{
+    switch (directive) {
+        case 'd': return strptime_d_alts;
+        case 'H': return strptime_H_alts;
+        case 'j': return strptime_j_alts;
+        case 'm': return strptime_m_alts;
+        case 'M': return strptime_M_alts;
+        case 'S': return strptime_S_alts;
+        case 'y': return strptime_y_alts;
+        case 'Y': return strptime_Y_alts;
+    }
+    Py_UNREACHABLE();
+}
+
+#define STRPTIME_CHAR(m, pos) ((pos) < (m)->length ? (m)->data[pos] : 0)
+#define STRPTIME_DIGIT(m, pos) Py_ISDIGIT(STRPTIME_CHAR(m, pos))
+
+/* Store in ends the possible ends of a %z match starting at pos, in the
+ * order in which the regular expression tries them.  Return their number.
+ */
+static int
+strptime_z_ends(strptime_match *m, Py_ssize_t pos, Py_ssize_t *ends)
+{
+    int n = 0;
+    Py_UCS1 c = STRPTIME_CHAR(m, pos);
+
+    if (c == 'Z') {
+        ends[n++] = pos + 1;
+        return n;
+    }
+    if ((c != '+' && c != '-') ||
+        !STRPTIME_DIGIT(m, pos + 1) || !STRPTIME_DIGIT(m, pos + 2))
+    {
+        return 0;
+    }
+    pos += 3;
+    for (int colon = 1; colon >= 0; colon--) {
+        Py_ssize_t p = pos;
+        if (colon) {
+            if (STRPTIME_CHAR(m, p) != ':') {
+                continue;
+            }
+            p++;
+        }
+        c = STRPTIME_CHAR(m, p);
+        if (c < '0' || c > '5' || !STRPTIME_DIGIT(m, p + 1)) {
+            continue;
+        }
+        p += 2;
+        for (int colon2 = 1; colon2 >= 0; colon2--) {
+            Py_ssize_t q = p;
+            if (colon2) {
+                if (STRPTIME_CHAR(m, q) != ':') {
+                    continue;
+                }
+                q++;
+            }
+            c = STRPTIME_CHAR(m, q);
+            if (c < '0' || c > '5' || !STRPTIME_DIGIT(m, q + 1)) {
+                continue;
+            }
+            q += 2;
+            if (STRPTIME_CHAR(m, q) == '.') {
+                int digits = 0;
+                while (digits < 6 && STRPTIME_DIGIT(m, q + 1 + digits)) {
+                    digits++;
+                }
+                for (; digits > 0; digits--) {
+                    ends[n++] = q + 1 + digits;
+                }
+            }
+            ends[n++] = q;
+        }
+        ends[n++] = p;
+    }
+    return n;
+}
+
+/* Match the items of fmt starting at index i against the data starting at
+ * pos.  Return 1 on the first match found, 0 if there is none, or -1 if
+ * the step budget is exhausted.
+ */
+static int
+strptime_match_items(const strptime_format *fmt, strptime_match *m,
+                     int i, Py_ssize_t pos)
+{
+    /* %z has at most 2 * (2 * (6 + 1) + 1) possible ends. */
+    Py_ssize_t ends[32];
+    int nends = 0;
+    int rc;
+
+    if (i == fmt->nitems) {
+        m->end = pos;
+        return 1;
+    }
+    if (++m->steps > STRPTIME_MAX_STEPS) {
+        return -1;
+    }
+
+    const strptime_item *item = &fmt->items[i];
+    switch (item->kind) {
+        case STRPTIME_LITERAL:
+            if (pos < m->length && Py_TOLOWER(m->data[pos]) == item->ch) {
+                ends[nends++] = pos + 1;
+            }
+            break;
+        case STRPTIME_SPACE: {
+            Py_ssize_t end = pos;
+            while (end < m->length && Py_UNICODE_ISSPACE(m->data[end])) {
+                end++;
+            }
+            for (; end > pos; end--) {
+                rc = strptime_match_items(fmt, m, i + 1, end);
+                if (rc != 0) {
+                    return rc;
+                }
+            }
+            return 0;
+        }
+        case 'f': {
+            int digits = 0;
+            while (digits < 6 && STRPTIME_DIGIT(m, pos + digits)) {
+                digits++;
+            }
+            for (; digits > 0; digits--) {
+                ends[nends++] = pos + digits;
+            }
+            break;
+        }
+        case 'z':
+            nends = strptime_z_ends(m, pos, ends);
+            break;
+        default:
+            for (const char * const *alt = strptime_alternatives(item->kind);
+                 *alt != NULL; alt++)
+            {
+                const char *range = *alt;
+                Py_ssize_t end = pos;
+                for (; *range; range += 2, end++) {
+                    Py_UCS1 c = STRPTIME_CHAR(m, end);
+                    if (c < (Py_UCS1)range[0] || c > (Py_UCS1)range[1]) {
+                        break;
+                    }
+                }
+                if (*range == '\0') {
+                    ends[nends++] = end;
+                }
+            }
+            break;
+    }
+
+    for (int k = 0; k < nends; k++) {
+        m->spans[i][0] = pos;
+        m->spans[i][1] = ends[k];
+        rc = strptime_match_items(fmt, m, i + 1, ends[k]);
+        if (rc != 0) {
+            return rc;
+        }
+    }
+    return 0;
+}
+
+static int
+strptime_digits_value(const Py_UCS1 *s, Py_ssize_t start, Py_ssize_t end)
+{
+    int value = 0;
+    for (Py_ssize_t i = start; i < end; i++) {
+        if (Py_ISDIGIT(s[i])) {
+            value = value * 10 + (s[i] - '0');
+        }
+    }
+    return value;
+}
+
+/* Convert the text matched by %z the way _strptime does.  Return 0 if it
+ * must be left to _strptime.
+ */
+static int
+strptime_parse_offset(const Py_UCS1 *s, Py_ssize_t length,
+                      strptime_result *res)
+{
+    Py_UCS1 buf[16];
+    Py_ssize_t n = 0;
+
+    res->has_offset = 1;
+    if (s[0] == 'Z') {
+        res->offset = res->offset_microseconds = 0;
+        return 1;
+    }
+    if (s[3] == ':') {
+        if (length > 6 && s[6] != ':') {
+            /* "Inconsistent use of :" */
+            return 0;
+        }
+        for (Py_ssize_t i = 0; i < length; i++) {
+            if (s[i] != ':') {
+                buf[n++] = s[i];
+            }
+        }
+    }
+    else {
+        if (length > 5 && s[5] == ':') {
+            return 0;
+        }
+        memcpy(buf, s, length);
+        n = length;
+    }
+
+    int offset = strptime_digits_value(buf, 1, 3) * 3600 +
+                 strptime_digits_value(buf, 3, 5) * 60;
+    int fraction = 0;
+    if (n > 5) {
+        offset += strptime_digits_value(buf, 5, 7);
+    }
+    if (n > 8) {
+        fraction = strptime_digits_value(buf, 8, n);
+        for (Py_ssize_t i = n - 8; i < 6; i++) {
+            fraction *= 10;
+        }
+    }
+    if (buf[0] == '-') {
+        offset = -offset;
+        fraction = -fraction;
+    }
+    res->offset = offset;
+    res->offset_microseconds = fraction;
+    return 1;
+}
+
+/* Parse string with fmt.  Return 1 on success, or 0 if the string must be
+ * parsed by _strptime.  The date is validated; the time and the offset are
+ * not.
+ */
+static int
+strptime_parse(const strptime_format *fmt, PyObject *string,
+               strptime_result *res)
+{
+    strptime_match m;
+    int julian = 0;
+
+    if (!PyUnicode_IS_ASCII(string)) {
+        return 0;
+    }
+    m.data = PyUnicode_1BYTE_DATA(string);
+    m.length = PyUnicode_GET_LENGTH(string);
+    m.steps = 0;
+    if (strptime_match_items(fmt, &m, 0, 0) != 1 || m.end != m.length) {
+        return 0;
+    }
+
+    *res = (strptime_result){.year = 1900, .month = 1, .day = 1};
+    for (int i = 0; i < fmt->nitems; i++) {
+        int kind = fmt->items[i].kind;
+        if (kind == STRPTIME_LITERAL || kind == STRPTIME_SPACE) {
+            continue;
+        }
+        Py_ssize_t start = m.spans[i][0];
+        Py_ssize_t end = m.spans[i][1];
+        int value = strptime_digits_value(m.data, start, end);
+        switch (kind) {
+            case 'Y': res->year = value; break;
+            case 'y':
+                res->year = value + (value <= 68 ? 2000 : 1900);
+                break;
+            case 'm': res->month = value; break;
+            case 'd': res->day = value; break;
+            case 'j': julian = value; break;
+            case 'H': res->hour = value; break;
+            case 'M': res->minute = value; break;
+            case 'S': res->second = value; break;
+            case 'f':
+                for (Py_ssize_t k = end - start; k < 6; k++) {
+                    value *= 10;
+                }
+                res->microsecond = value;
+                break;
+            case 'z':
+                if (!strptime_parse_offset(m.data + start, end - start, res)) {
+                    return 0;
+                }
+                break;
+        }
+    }
+    if (res->year < MINYEAR) {
+        return 0;
+    }
+    if (julian) {
+        /* The day of the year wins over the month and the day. */
+        int ordinal = ymd_to_ord(res->year, 1, 1) + julian - 1;
+        if (ordinal > MAXORDINAL) {
+            return 0;
+        }
+        ord_to_ymd(ordinal, &res->year, &res->month, &res->day);
+    }
+    else if (res->day > days_in_month(res->year, res->month)) {
+        return 0;
+    }
+    return 1;
+}
+
+/* Build an instance of type (date, time or datetime) from string parsed
+ * with fmt.  Return 1 and set *result on success, 0 if _strptime must be
+ * used, or -1 with an exception set on failure.
+ */
+static int
+strptime_build(const strptime_format *fmt, PyObject *string,
+               PyTypeObject *type, PyObject **result)
+{
+    strptime_result res;
+
+    if (!strptime_parse(fmt, string, &res)) {
+        return 0;
+    }
+    if (type == DATE_TYPE(NO_STATE)) {
+        *result = new_date(res.year, res.month, res.day);
+        return *result == NULL ? -1 : 1;
+    }
+    if (res.second > 59) {
+        return 0;
+    }
+
+    PyObject *tzinfo = Py_None;
+    if (res.has_offset) {
+        int offset = res.offset < 0 ? -res.offset : res.offset;
+        if (offset >= 24 * 3600) {
+            return 0;
+        }
+        PyObject *delta = new_delta(0, res.offset, res.offset_microseconds, 1);
+        if (delta == NULL) {
+            return -1;
+        }
+        tzinfo = new_timezone(delta, NULL);
+        Py_DECREF(delta);
+        if (tzinfo == NULL) {
+            return -1;
+        }
+    }
+    else {
+        Py_INCREF(tzinfo);
+    }
+
+    if (type == TIME_TYPE(NO_STATE)) {
+        *result = new_time(res.hour, res.minute, res.second,
+                           res.microsecond, tzinfo, 0);
+    }
+    else {
+        assert(type == DATETIME_TYPE(NO_STATE));
+        *result = new_datetime(res.year, res.month, res.day, res.hour,
+                               res.minute, res.second, res.microsecond,
+                               tzinfo, 0);
+    }
+    Py_DECREF(tzinfo);
+    return *result == NULL ? -1 : 1;
+}
+
+/* Parse string with format into an instance of type, calling
+ * _strptime.<func>(type, string, format) when the fast path does not apply.
+ */
+static PyObject *
+strptime_call(PyObject *cls, PyObject *string, PyObject *format,
+              PyObject *func)
+{
+    PyObject *module = PyImport_Import(&_Py_ID(_strptime));
+    if (module == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyObject_CallMethodObjArgs(module, func, cls,
+                                                  string, format, NULL);
+    Py_DECREF(module);
+    return result;
+}
+
+static PyObject *
+strptime_impl(PyObject *cls, PyObject *string, PyObject *format,
+              PyObject *func)
+{
+    if (cls == (PyObject *)DATE_TYPE(NO_STATE) ||
+        cls == (PyObject *)TIME_TYPE(NO_STATE) ||
+        cls == (PyObject *)DATETIME_TYPE(NO_STATE))
+    {
+        strptime_format fmt;
+        PyObject *result;
+        if (strptime_compile(format, &fmt)) {
+            int rc = strptime_build(&fmt, string, (PyTypeObject *)cls,
+                                    &result);
+            if (rc != 0) {
+                return rc < 0 ? NULL : result;
+            }
+        }
+    }
+    return strptime_call(cls, string, format, func);
+}
+
 /* ---------------------------------------------------------------------------
  * tzinfo helpers.
  */
@@ -3427,21 +3945,14 @@ date_fromisocalendar(PyObject *cls, PyObject *args, PyObject *kw)
 static PyObject *
 date_strptime(PyObject *cls, PyObject *args)
 {
-    PyObject *string, *format, *result;
+    PyObject *string, *format;
 
     if (!PyArg_ParseTuple(args, "UU:strptime", &string, &format)) {
         return NULL;
     }
 
-    PyObject *module = PyImport_Import(&_Py_ID(_strptime));
-    if (module == NULL) {
-        return NULL;
-    }
-    result = PyObject_CallMethodObjArgs(module,
-                                        &_Py_ID(_strptime_datetime_date), cls,
-                                        string, format, NULL);
-    Py_DECREF(module);
-    return result;
+    return strptime_impl(cls, string, format,
+                         &_Py_ID(_strptime_datetime_date));
 }
 
 
@@ -4663,21 +5174,14 @@ time_new(PyTypeObject *type, PyObject *args, PyObject *kw)
 static PyObject *
 time_strptime(PyObject *cls, PyObject *args)
 {
-    PyObject *string, *format, *result;
+    PyObject *string, *format;
 
     if (!PyArg_ParseTuple(args, "UU:strptime", &string, &format)) {
         return NULL;
     }
 
-    PyObject *module = PyImport_Import(&_Py_ID(_strptime));
-    if (module == NULL) {
-        return NULL;
-    }
-    result = PyObject_CallMethodObjArgs(module,
-                                        &_Py_ID(_strptime_datetime_time), cls,
-                                        string, format, NULL);
-    Py_DECREF(module);
-    return result;
+    return strptime_impl(cls, string, format,
+                         &_Py_ID(_strptime_datetime_time));
 }
 
 /*
@@ -5653,20 +6157,13 @@ datetime_utcfromtimestamp(PyObject *cls, PyObject *args)
 static PyObject *
 datetime_strptime(PyObject *cls, PyObject *args)
 {
-    PyObject *string, *format, *result;
+    PyObject *string, *format;
 
     if (!PyArg_ParseTuple(args, "UU:strptime", &string, &format))
         return NULL;
 
-    PyObject *module = PyImport_Import(&_Py_ID(_strptime));
-    if (module == NULL) {
-        return NULL;
-    }
-    result = PyObject_CallMethodObjArgs(module,
-                                        &_Py_ID(_strptime_datetime_datetime),
-                                        cls, string, format, NULL);
-    Py_DECREF(module);
-    return result;
+    return strptime_impl(cls, string, format,
+                         &_Py_ID(_strptime_datetime_datetime));
 }
 
 /* Return new datetime from date/datetime and time arguments. */
@@ -7143,6 +7640,158 @@ static PyTypeObject PyDateTime_DateTimeType = {
     0,                                          /* tp_free */
 };
 
+/* ---------------------------------------------------------------------------
+ * Compiled strptime() formats.
+ */
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *format;
+    /* 0 if every call is delegated to _strptime */
+    int compiled;
+    strptime_format fmt;
+} PyDateTime_CompiledFormat;
+
+#define PyCompiledFormat_CAST(op) ((PyDateTime_CompiledFormat *)(op))
+
+static PyObject *
+compiled_format_parse(PyObject *op, PyObject *string, PyTypeObject *type,
+                      PyObject *func)
+{
+    PyDateTime_CompiledFormat *self = PyCompiledFormat_CAST(op);
+    if (self->compiled) {
+        PyObject *result;
+        int rc = strptime_build(&self->fmt, string, type, &result);
+        if (rc != 0) {
+            return rc < 0 ? NULL : result;
+        }
+    }
+    return strptime_call((PyObject *)type, string, self->format, func);
+}
+
+/*[clinic input]
+datetime.CompiledFormat.parse_datetime
+
+    string: unicode
+    /
+
+Return a datetime parsed from string.
+
+Equivalent to datetime.strptime(string, self.format).
+[clinic start generated code]*/
+
+static PyObject *
+datetime_CompiledFormat_parse_datetime_impl(PyObject *self, PyObject *string)
+/*[clinic end generated code: output=8a19da834c770684 input=f10418ff27b98feb]*/
+{
+    return compiled_format_parse(self, string, DATETIME_TYPE(NO_STATE),
+                                 &_Py_ID(_strptime_datetime_datetime));
+}
+
+/*[clinic input]
+datetime.CompiledFormat.parse_date
+
+    string: unicode
+    /
+
+Return a date parsed from string.
+
+Equivalent to date.strptime(string, self.format).
+[clinic start generated code]*/
+
+static PyObject *
+datetime_CompiledFormat_parse_date_impl(PyObject *self, PyObject *string)
+/*[clinic end generated code: output=faf3987db574d1c8 input=1bdf65c21386604b]*/
+{
+    return compiled_format_parse(self, string, DATE_TYPE(NO_STATE),
+                                 &_Py_ID(_strptime_datetime_date));
+}
+
+/*[clinic input]
+datetime.CompiledFormat.parse_time
+
+    string: unicode
+    /
+
+Return a time parsed from string.
+
+Equivalent to time.strptime(string, self.format).
+[clinic start generated code]*/
+
+static PyObject *
+datetime_CompiledFormat_parse_time_impl(PyObject *self, PyObject *string)
+/*[clinic end generated code: output=629fb61cbc4970c2 input=cedf4b9022aeb143]*/
+{
+    return compiled_format_parse(self, string, TIME_TYPE(NO_STATE),
+                                 &_Py_ID(_strptime_datetime_time));
+}
+
+static PyObject *
+compiled_format_reduce(PyObject *op, PyObject *Py_UNUSED(dummy))
+{
+    PyObject *module = PyType_GetModule(Py_TYPE(op));
+    if (module == NULL) {
+        return NULL;
+    }
+    PyObject *func = PyObject_GetAttrString(module, "compile_format");
+    if (func == NULL) {
+        return NULL;
+    }
+    return Py_BuildValue("N(O)", func, PyCompiledFormat_CAST(op)->format);
+}
+
+static PyObject *
+compiled_format_repr(PyObject *op)
+{
+    return PyUnicode_FromFormat("datetime.compile_format(%R)",
+                                PyCompiledFormat_CAST(op)->format);
+}
+
+static void
+compiled_format_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    Py_DECREF(PyCompiledFormat_CAST(op)->format);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+static PyMethodDef compiled_format_methods[] = {
+    DATETIME_COMPILEDFORMAT_PARSE_DATETIME_METHODDEF
+    DATETIME_COMPILEDFORMAT_PARSE_DATE_METHODDEF
+    DATETIME_COMPILEDFORMAT_PARSE_TIME_METHODDEF
+    {"__reduce__", compiled_format_reduce, METH_NOARGS,
+     PyDoc_STR("__reduce__() -> (compile_format, (format,))")},
+    {NULL, NULL},
+};
+
+static PyMemberDef compiled_format_members[] = {
+    {"format", Py_T_OBJECT_EX, offsetof(PyDateTime_CompiledFormat, format),
+     Py_READONLY, PyDoc_STR("The format string.")},
+    {NULL}
+};
+
+PyDoc_STRVAR(compiled_format_doc,
+"A strptime() format string compiled by compile_format().");
+
+static PyType_Slot compiled_format_slots[] = {
+    {Py_tp_repr, compiled_format_repr},
+    {Py_tp_doc, (void *)compiled_format_doc},
+    {Py_tp_methods, compiled_format_methods},
+    {Py_tp_members, compiled_format_members},
+    {Py_tp_dealloc, compiled_format_dealloc},
+    {0, NULL},
+};
+
+static PyType_Spec compiled_format_spec = {
+    .name = "datetime.CompiledFormat",
+    .basicsize = sizeof(PyDateTime_CompiledFormat),
+    .flags = (Py_TPFLAGS_DEFAULT |
+              Py_TPFLAGS_IMMUTABLETYPE |
+              Py_TPFLAGS_DISALLOW_INSTANTIATION),
+    .slots = compiled_format_slots,
+};
+
 /* ---------------------------------------------------------------------------
  * datetime C-API.
  */
@@ -7226,6 +7875,7 @@ init_state(datetime_state *st, PyObject *module, PyObject *old_module)
     } while (0)
 
     ADD_TYPE(isocalendar_date_type, &isocal_spec, &PyTuple_Type);
+    ADD_TYPE(compiled_format_type, &compiled_format_spec, NULL);
 #undef ADD_TYPE
 
     if (old_module != NULL) {
@@ -7233,6 +7883,7 @@ init_state(datetime_state *st, PyObject *module, PyObject *old_module)
         datetime_state *st_old = get_module_state(old_module);
         *st = (datetime_state){
             .isocalendar_date_type = st->isocalendar_date_type,
+            .compiled_format_type = st->compiled_format_type,
             .us_per_ms = Py_NewRef(st_old->us_per_ms),
             .us_per_second = Py_NewRef(st_old->us_per_second),
             .us_per_minute = Py_NewRef(st_old->us_per_minute),
@@ -7293,6 +7944,7 @@ traverse_state(datetime_state *st, visitproc visit, void *arg)
 {
     /* heap types */
     Py_VISIT(st->isocalendar_date_type);
+    Py_VISIT(st->compiled_format_type);
 
     return 0;
 }
@@ -7301,6 +7953,7 @@ static int
 clear_state(datetime_state *st)
 {
     Py_CLEAR(st->isocalendar_date_type);
+    Py_CLEAR(st->compiled_format_type);
     Py_CLEAR(st->us_per_ms);
     Py_CLEAR(st->us_per_second);
     Py_CLEAR(st->us_per_minute);
@@ -7343,7 +7996,37 @@ init_static_types(PyInterpreterState *interp, int reloading)
  * Module methods and initialization.
  */
 
+/*[clinic input]
+datetime.compile_format
+
+    format: unicode
+    /
+
+Compile a strptime() format string for repeated parsing.
+
+The returned object has parse_datetime(), parse_date() and parse_time()
+methods, equivalent to datetime.strptime(), date.strptime() and
+time.strptime() with this format.
+[clinic start generated code]*/
+
+static PyObject *
+datetime_compile_format_impl(PyObject *module, PyObject *format)
+/*[clinic end generated code: output=4b812c7558478391 input=002be16f62852cbf]*/
+{
+    datetime_state *st = get_module_state(module);
+    PyTypeObject *type = st->compiled_format_type;
+    PyDateTime_CompiledFormat *self =
+        (PyDateTime_CompiledFormat *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->format = Py_NewRef(format);
+    self->compiled = strptime_compile(format, &self->fmt);
+    return (PyObject *)self;
+}
+
 static PyMethodDef module_methods[] = {
+    DATETIME_COMPILE_FORMAT_METHODDEF
     {NULL, NULL}
 };
 
@@ -7453,6 +8136,21 @@ _datetime_exec(PyObject *module)
         goto error;
     }
 
+    /* Like the types, compile_format() is found in the datetime module when
+     * it is pickled. */
+    PyObject *func = PyObject_GetAttrString(module, "compile_format");
+    if (func == NULL) {
+        goto error;
+    }
+    PyObject *name = PyUnicode_InternFromString("datetime");
+    if (name == NULL || PyObject_SetAttr(func, &_Py_ID(__module__), name) < 0) {
+        Py_XDECREF(name);
+        Py_DECREF(func);
+        goto error;
+    }
+    Py_DECREF(name);
+    Py_DECREF(func);
+
     /* At last, set up and add the encapsulated C API */
     PyDateTime_CAPI *capi = get_datetime_capi();
     if (capi == NULL) {
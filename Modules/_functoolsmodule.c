@@ -5,6 +5,7 @@
 #include "pycore_moduleobject.h"  // _PyModule_GetState()
 #include "pycore_object.h"        // _PyObject_GC_TRACK
 #include "pycore_pystate.h"       // _PyThreadState_GET()
+#include "pycore_time.h"          // _PyTime_FromSecondsObject()
 #include "pycore_tuple.h"         // _PyTuple_ITEMS()
 
 
@@ -1047,6 +1048,10 @@ _functools_reduce_impl(PyObject *module, PyObject *func, PyObject *seq,
        from being called more than once.  In the C version, the "known hash"
        variants of dictionary calls as used to the same effect.
 
+   5)  A sharded cache is a set of independent caches, each with its own
+       lock in the free-threaded build.  The key and its hash are computed
+       once, and then passed to the lookup function of the selected shard.
+
 */
 
 struct lru_list_elem;
@@ -1057,6 +1062,9 @@ typedef struct lru_list_elem {
     struct lru_list_elem *prev, *next;  /* borrowed links */
     Py_hash_t hash;
     PyObject *key, *result;
+    /* only used by extended_lru_cache_lookup() */
+    PyTime_t expires;
+    Py_ssize_t weight;
 } lru_list_elem;
 
 #define lru_list_elem_CAST(op)  ((lru_list_elem *)(op))
@@ -1087,16 +1095,30 @@ static PyType_Spec lru_list_elem_type_spec = {
 
 
 typedef PyObject *(*lru_cache_ternaryfunc)(struct lru_cache_object *, PyObject *, PyObject *);
+/* Look up a key with a known hash, calling the user function on a miss.
+   Steals the reference to the key. */
+typedef PyObject *(*lru_cache_lookupfunc)(struct lru_cache_object *,
+                                          PyObject *, Py_hash_t,
+                                          PyObject *, PyObject *);
 
 typedef struct lru_cache_object {
     lru_list_elem root;  /* includes PyObject_HEAD */
     lru_cache_ternaryfunc wrapper;
+    lru_cache_lookupfunc lookup;  /* NULL for an uncached wrapper */
     int typed;
     PyObject *cache;
     Py_ssize_t hits;
     PyObject *func;
     Py_ssize_t maxsize;
     Py_ssize_t misses;
+    /* options of the extended wrapper, 0 or NULL when not set */
+    PyTime_t ttl;
+    PyObject *weight;
+    PyObject *on_evict;
+    /* total weight of the links of the extended wrapper */
+    Py_ssize_t currsize;
+    /* tuple of lru_cache_objects of a sharded cache, or NULL */
+    PyObject *shards;
     /* the kwd_mark is used delimit args and keywords in the cache keys */
     PyObject *kwd_mark;
     PyTypeObject *lru_list_elem_type;
@@ -1181,9 +1203,8 @@ uncached_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwd
 }
 
 static PyObject *
-infinite_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+cached_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
 {
-    PyObject *result;
     Py_hash_t hash;
     PyObject *key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
     if (!key)
@@ -1193,6 +1214,14 @@ infinite_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwd
         Py_DECREF(key);
         return NULL;
     }
+    return self->lookup(self, key, hash, args, kwds);
+}
+
+static PyObject *
+infinite_lru_cache_lookup(lru_cache_object *self, PyObject *key,
+                          Py_hash_t hash, PyObject *args, PyObject *kwds)
+{
+    PyObject *result;
     result = _PyDict_GetItem_KnownHash(self->cache, key, hash);
     if (result) {
         Py_INCREF(result);
@@ -1250,7 +1279,7 @@ lru_cache_prepend_link(lru_cache_object *self, lru_list_elem *link)
 
 /* General note on reentrancy:
 
-   There are four dictionary calls in the bounded_lru_cache_wrapper():
+   There are four dictionary calls in the bounded_lru_cache_lookup():
    1) The initial check for a cache match.  2) The post user-function
    check for a cache match.  3) The deletion of the oldest entry.
    4) The addition of the newest entry.
@@ -1280,20 +1309,12 @@ lru_cache_prepend_link(lru_cache_object *self, lru_list_elem *link)
  */
 
 static PyObject *
-bounded_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+bounded_lru_cache_lookup(lru_cache_object *self, PyObject *key,
+                         Py_hash_t hash, PyObject *args, PyObject *kwds)
 {
     lru_list_elem *link;
-    PyObject *key, *result, *testresult;
-    Py_hash_t hash;
+    PyObject *result, *testresult;
 
-    key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
-    if (!key)
-        return NULL;
-    hash = PyObject_Hash(key);
-    if (hash == -1) {
-        Py_DECREF(key);
-        return NULL;
-    }
     link  = (lru_list_elem *)_PyDict_GetItem_KnownHash(self->cache, key, hash);
     if (link != NULL) {
         lru_cache_extract_link(link);
@@ -1445,21 +1466,317 @@ bounded_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds
     return result;
 }
 
+/* The extended wrapper is used when any of the ttl, weight and on_evict
+   options is given.  Unlike bounded_lru_cache_lookup(), it allocates a new
+   link for every entry.  Each link records its weight (1 without a weight
+   function) and its expiry time.  The maxsize limits the total weight of
+   the links, and is -1 for an unbounded cache.
+
+   Expired links are removed when they are looked up, and when they reach
+   the least recently used end of the list while another link is added.
+
+   Evicted links are chained through their next field.  They are released,
+   and their results passed to on_evict, only after the cache is back in a
+   consistent state, since both can run arbitrary code. */
+
+static int
+lru_cache_now(lru_cache_object *self, PyTime_t *now)
+{
+    if (self->ttl == 0) {
+        *now = 0;
+        return 0;
+    }
+    return PyTime_Monotonic(now);
+}
+
+static int
+lru_cache_evict_link(lru_cache_object *self, lru_list_elem *link,
+                     lru_list_elem ***evicted_tail)
+{
+    PyObject *popresult;
+    int res;
+
+    /* The key comparisons can run arbitrary code, which may remove the
+       link from the cache (cache_clear() or cache_invalidate()). */
+    Py_INCREF(link);
+    res = _PyDict_Pop_KnownHash((PyDictObject *)self->cache, link->key,
+                                link->hash, &popresult);
+    if (res <= 0) {
+        /* If the key was not found, the code which removed it from the
+           dict also removed the link from the linked list. */
+        assert(popresult == NULL);
+        Py_DECREF(link);
+        return res;
+    }
+    /* Every link in the cache dict is also in the linked list, which owns
+       another reference, so this cannot release the link. */
+    Py_DECREF(popresult);
+    Py_DECREF(link);
+    lru_cache_extract_link(link);
+    self->currsize -= link->weight;
+    link->next = NULL;
+    **evicted_tail = link;
+    *evicted_tail = &link->next;
+    return 0;
+}
+
+/* Release the evicted links.  If notify is true, pass their results to
+   on_evict.  Its errors are reported as unraisable: the evictions are
+   done, and the result of the call being cached must not be lost. */
+static void
+lru_cache_release_links(lru_cache_object *self, lru_list_elem *link,
+                        int notify)
+{
+    PyObject *on_evict = notify ? Py_XNewRef(self->on_evict) : NULL;
+    while (link != NULL) {
+        lru_list_elem *next = link->next;
+        if (on_evict != NULL) {
+            PyObject *ret = PyObject_CallOneArg(on_evict, link->result);
+            if (ret == NULL) {
+                PyErr_FormatUnraisable("Exception ignored in on_evict "
+                                       "callback of %R", self->func);
+            }
+            else {
+                Py_DECREF(ret);
+            }
+        }
+        Py_DECREF(link);
+        link = next;
+    }
+    Py_XDECREF(on_evict);
+}
+
+static PyObject *
+extended_lru_cache_lookup(lru_cache_object *self, PyObject *key,
+                          Py_hash_t hash, PyObject *args, PyObject *kwds)
+{
+    lru_list_elem *link, *evicted = NULL, **evicted_tail = &evicted;
+    PyObject *result = NULL, *testresult;
+    Py_ssize_t weight = 1;
+    PyTime_t now;
+
+    link = (lru_list_elem *)_PyDict_GetItem_KnownHash(self->cache, key, hash);
+    if (link != NULL) {
+        if (lru_cache_now(self, &now) < 0) {
+            goto error;
+        }
+        if (self->ttl == 0 || now < link->expires) {
+            lru_cache_extract_link(link);
+            lru_cache_append_link(self, link);
+            result = Py_NewRef(link->result);
+            self->hits++;
+            Py_DECREF(key);
+            return result;
+        }
+        if (lru_cache_evict_link(self, link, &evicted_tail) < 0) {
+            goto error;
+        }
+        lru_cache_release_links(self, evicted, 1);
+        evicted = NULL;
+        evicted_tail = &evicted;
+    }
+    else if (PyErr_Occurred()) {
+        goto error;
+    }
+    self->misses++;
+    result = PyObject_Call(self->func, args, kwds);
+    if (result == NULL) {
+        goto error;
+    }
+    if (self->weight != NULL) {
+        PyObject *weight_obj = PyObject_CallOneArg(self->weight, result);
+        if (weight_obj == NULL) {
+            goto error;
+        }
+        weight = PyNumber_AsSsize_t(weight_obj, PyExc_OverflowError);
+        Py_DECREF(weight_obj);
+        if (weight == -1 && PyErr_Occurred()) {
+            goto error;
+        }
+        if (weight < 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "weight function returned a negative value");
+            goto error;
+        }
+    }
+    testresult = _PyDict_GetItem_KnownHash(self->cache, key, hash);
+    if (testresult != NULL) {
+        /* The same key was added to the cache during the user function
+           call.  Keep that entry. */
+        Py_DECREF(key);
+        return result;
+    }
+    if (PyErr_Occurred()) {
+        goto error;
+    }
+    if (self->maxsize >= 0 && weight > self->maxsize) {
+        /* The result does not fit in the cache at all.  Rather than
+           evicting everything, do not cache it. */
+        Py_DECREF(key);
+        return result;
+    }
+    if (lru_cache_now(self, &now) < 0) {
+        goto error;
+    }
+    /* Make room for the new link, removing expired links on the way. */
+    while (self->root.next != &self->root) {
+        link = self->root.next;
+        if (!(self->maxsize >= 0 && self->currsize > self->maxsize - weight)
+            && !(self->ttl != 0 && link->expires <= now))
+        {
+            break;
+        }
+        if (lru_cache_evict_link(self, link, &evicted_tail) < 0) {
+            goto error;
+        }
+    }
+    link = (lru_list_elem *)PyObject_New(lru_list_elem,
+                                         self->lru_list_elem_type);
+    if (link == NULL) {
+        goto error;
+    }
+    link->hash = hash;
+    link->key = key;
+    link->result = Py_NewRef(result);
+    link->weight = weight;
+    if (self->ttl == 0) {
+        link->expires = 0;
+    }
+    else if (now > PyTime_MAX - self->ttl) {
+        link->expires = PyTime_MAX;
+    }
+    else {
+        link->expires = now + self->ttl;
+    }
+    if (_PyDict_SetItem_KnownHash(self->cache, key, (PyObject *)link,
+                                  hash) < 0) {
+        /* The link owns the key now. */
+        Py_DECREF(link);
+        Py_DECREF(result);
+        lru_cache_release_links(self, evicted, 0);
+        return NULL;
+    }
+    lru_cache_append_link(self, link);
+    self->currsize += weight;
+    lru_cache_release_links(self, evicted, 1);
+    return result;
+
+error:
+    Py_DECREF(key);
+    Py_XDECREF(result);
+    lru_cache_release_links(self, evicted, 0);
+    return NULL;
+}
+
+/* A sharded cache dispatches every call to one of its shards, based on the
+   hash of the key.  The shards are locked separately, so that threads of
+   the free-threaded build calling the cached function with different
+   arguments rarely contend for a lock. */
+
+static lru_cache_object *
+lru_cache_get_shard(lru_cache_object *self, Py_hash_t hash)
+{
+    Py_ssize_t n = PyTuple_GET_SIZE(self->shards);
+    return (lru_cache_object *)PyTuple_GET_ITEM(self->shards,
+                                                (size_t)hash % (size_t)n);
+}
+
+static PyObject *
+sharded_lru_cache_wrapper(lru_cache_object *self, PyObject *args,
+                          PyObject *kwds)
+{
+    PyObject *result;
+    Py_hash_t hash;
+    PyObject *key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
+    if (!key)
+        return NULL;
+    hash = PyObject_Hash(key);
+    if (hash == -1) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    lru_cache_object *shard = lru_cache_get_shard(self, hash);
+    Py_BEGIN_CRITICAL_SECTION(shard);
+    result = shard->lookup(shard, key, hash, args, kwds);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static lru_cache_object *
+lru_cache_create(PyTypeObject *type, _functools_state *state,
+                 PyObject *func, Py_ssize_t maxsize, int typed,
+                 PyObject *cache_info_type, PyTime_t ttl,
+                 PyObject *weight, PyObject *on_evict)
+{
+    PyObject *cachedict;
+    lru_cache_object *obj;
+    lru_cache_ternaryfunc wrapper = cached_lru_cache_wrapper;
+    lru_cache_lookupfunc lookup;
+
+    /* select the caching function */
+    if (maxsize == 0) {
+        wrapper = uncached_lru_cache_wrapper;
+        lookup = NULL;
+    }
+    else if (ttl != 0 || weight != NULL || on_evict != NULL) {
+        lookup = extended_lru_cache_lookup;
+    }
+    else if (maxsize < 0) {
+        lookup = infinite_lru_cache_lookup;
+    }
+    else {
+        lookup = bounded_lru_cache_lookup;
+    }
+
+    if (!(cachedict = PyDict_New()))
+        return NULL;
+
+    obj = (lru_cache_object *)type->tp_alloc(type, 0);
+    if (obj == NULL) {
+        Py_DECREF(cachedict);
+        return NULL;
+    }
+
+    obj->root.prev = &obj->root;
+    obj->root.next = &obj->root;
+    obj->wrapper = wrapper;
+    obj->lookup = lookup;
+    obj->typed = typed;
+    obj->cache = cachedict;
+    obj->func = Py_NewRef(func);
+    obj->misses = obj->hits = 0;
+    obj->maxsize = maxsize;
+    obj->ttl = ttl;
+    obj->weight = Py_XNewRef(weight);
+    obj->on_evict = Py_XNewRef(on_evict);
+    obj->currsize = 0;
+    obj->shards = NULL;
+    obj->kwd_mark = Py_NewRef(state->kwd_mark);
+    obj->lru_list_elem_type = (PyTypeObject*)Py_NewRef(state->lru_list_elem_type);
+    obj->cache_info_type = Py_NewRef(cache_info_type);
+    obj->dict = NULL;
+    obj->weakreflist = NULL;
+    return obj;
+}
+
 static PyObject *
 lru_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
 {
-    PyObject *func, *maxsize_O, *cache_info_type, *cachedict;
+    PyObject *func, *maxsize_O, *cache_info_type;
+    PyObject *ttl_O = Py_None, *weight = Py_None, *on_evict = Py_None;
     int typed;
     lru_cache_object *obj;
-    Py_ssize_t maxsize;
-    PyObject *(*wrapper)(lru_cache_object *, PyObject *, PyObject *);
+    Py_ssize_t maxsize, nshards = 1;
+    PyTime_t ttl = 0;
     _functools_state *state;
     static char *keywords[] = {"user_function", "maxsize", "typed",
-                               "cache_info_type", NULL};
+                               "cache_info_type", "ttl", "weight",
+                               "on_evict", "shards", NULL};
 
-    if (!PyArg_ParseTupleAndKeywords(args, kw, "OOpO:lru_cache", keywords,
-                                     &func, &maxsize_O, &typed,
-                                     &cache_info_type)) {
+    if (!PyArg_ParseTupleAndKeywords(args, kw, "OOpO|$OOOn:lru_cache",
+                                     keywords, &func, &maxsize_O, &typed,
+                                     &cache_info_type, &ttl_O, &weight,
+                                     &on_evict, &nshards)) {
         return NULL;
     }
 
@@ -1474,9 +1791,7 @@ lru_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
         return NULL;
     }
 
-    /* select the caching function, and make/inc maxsize_O */
     if (maxsize_O == Py_None) {
-        wrapper = infinite_lru_cache_wrapper;
         /* use this only to initialize lru_cache_object attribute maxsize */
         maxsize = -1;
     } else if (PyIndex_Check(maxsize_O)) {
@@ -1486,37 +1801,72 @@ lru_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
         if (maxsize < 0) {
             maxsize = 0;
         }
-        if (maxsize == 0)
-            wrapper = uncached_lru_cache_wrapper;
-        else
-            wrapper = bounded_lru_cache_wrapper;
     } else {
         PyErr_SetString(PyExc_TypeError, "maxsize should be integer or None");
         return NULL;
     }
 
-    if (!(cachedict = PyDict_New()))
+    if (ttl_O != Py_None) {
+        if (_PyTime_FromSecondsObject(&ttl, ttl_O, _PyTime_ROUND_CEILING) < 0) {
+            return NULL;
+        }
+        if (ttl <= 0) {
+            PyErr_SetString(PyExc_ValueError, "ttl must be positive");
+            return NULL;
+        }
+    }
+    if (weight == Py_None) {
+        weight = NULL;
+    }
+    else if (!PyCallable_Check(weight)) {
+        PyErr_SetString(PyExc_TypeError, "weight must be callable or None");
         return NULL;
-
-    obj = (lru_cache_object *)type->tp_alloc(type, 0);
-    if (obj == NULL) {
-        Py_DECREF(cachedict);
+    }
+    if (on_evict == Py_None) {
+        on_evict = NULL;
+    }
+    else if (!PyCallable_Check(on_evict)) {
+        PyErr_SetString(PyExc_TypeError, "on_evict must be callable or None");
+        return NULL;
+    }
+    if (nshards < 1) {
+        PyErr_SetString(PyExc_ValueError, "shards must be at least 1");
         return NULL;
     }
+    if (maxsize > 0 && nshards > maxsize) {
+        nshards = maxsize;
+    }
 
-    obj->root.prev = &obj->root;
-    obj->root.next = &obj->root;
-    obj->wrapper = wrapper;
-    obj->typed = typed;
-    obj->cache = cachedict;
-    obj->func = Py_NewRef(func);
-    obj->misses = obj->hits = 0;
-    obj->maxsize = maxsize;
-    obj->kwd_mark = Py_NewRef(state->kwd_mark);
-    obj->lru_list_elem_type = (PyTypeObject*)Py_NewRef(state->lru_list_elem_type);
-    obj->cache_info_type = Py_NewRef(cache_info_type);
-    obj->dict = NULL;
-    obj->weakreflist = NULL;
+    obj = lru_cache_create(type, state, func, maxsize, typed,
+                           cache_info_type, ttl, weight, on_evict);
+    if (obj == NULL || nshards == 1 || maxsize == 0) {
+        return (PyObject *)obj;
+    }
+
+    /* Split maxsize between the shards. */
+    PyObject *shards = PyTuple_New(nshards);
+    if (shards == NULL) {
+        Py_DECREF(obj);
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < nshards; i++) {
+        Py_ssize_t shard_maxsize = -1;
+        if (maxsize > 0) {
+            shard_maxsize = maxsize / nshards + (i < maxsize % nshards);
+        }
+        PyObject *shard = (PyObject *)lru_cache_create(
+            type, state, func, shard_maxsize, typed, cache_info_type,
+            ttl, weight, on_evict);
+        if (shard == NULL) {
+            Py_DECREF(shards);
+            Py_DECREF(obj);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(shards, i, shard);
+    }
+    obj->wrapper = sharded_lru_cache_wrapper;
+    obj->lookup = NULL;
+    obj->shards = shards;
     return (PyObject *)obj;
 }
 
@@ -1551,6 +1901,9 @@ lru_cache_tp_clear(PyObject *op)
     Py_CLEAR(self->kwd_mark);
     Py_CLEAR(self->lru_list_elem_type);
     Py_CLEAR(self->cache_info_type);
+    Py_CLEAR(self->weight);
+    Py_CLEAR(self->on_evict);
+    Py_CLEAR(self->shards);
     Py_CLEAR(self->dict);
     lru_cache_clear_list(list);
     return 0;
@@ -1577,6 +1930,10 @@ lru_cache_call(PyObject *op, PyObject *args, PyObject *kwds)
 {
     lru_cache_object *self = lru_cache_object_CAST(op);
     PyObject *result;
+    if (self->shards != NULL) {
+        /* The shards have their own locks. */
+        return self->wrapper(self, args, kwds);
+    }
     Py_BEGIN_CRITICAL_SECTION(self);
     result = self->wrapper(self, args, kwds);
     Py_END_CRITICAL_SECTION();
@@ -1592,6 +1949,20 @@ lru_cache_descr_get(PyObject *self, PyObject *obj, PyObject *type)
     return PyMethod_New(self, obj);
 }
 
+static void
+lru_cache_add_stats(lru_cache_object *self, Py_ssize_t *hits,
+                    Py_ssize_t *misses, Py_ssize_t *currsize)
+{
+    *hits += self->hits;
+    *misses += self->misses;
+    if (self->lookup == extended_lru_cache_lookup) {
+        *currsize += self->currsize;
+    }
+    else {
+        *currsize += PyDict_GET_SIZE(self->cache);
+    }
+}
+
 /*[clinic input]
 @critical_section
 _functools._lru_cache_wrapper.cache_info
@@ -1604,14 +1975,35 @@ _functools__lru_cache_wrapper_cache_info_impl(PyObject *self)
 /*[clinic end generated code: output=cc796a0b06dbd717 input=00e1acb31aa21ecc]*/
 {
     lru_cache_object *_self = (lru_cache_object *) self;
+    Py_ssize_t hits = 0, misses = 0, currsize = 0;
+    if (_self->shards != NULL) {
+        for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(_self->shards); i++) {
+            lru_cache_object *shard =
+                (lru_cache_object *)PyTuple_GET_ITEM(_self->shards, i);
+            Py_BEGIN_CRITICAL_SECTION(shard);
+            lru_cache_add_stats(shard, &hits, &misses, &currsize);
+            Py_END_CRITICAL_SECTION();
+        }
+    }
+    else {
+        lru_cache_add_stats(_self, &hits, &misses, &currsize);
+    }
     if (_self->maxsize == -1) {
         return PyObject_CallFunction(_self->cache_info_type, "nnOn",
-                                     _self->hits, _self->misses, Py_None,
-                                     PyDict_GET_SIZE(_self->cache));
+                                     hits, misses, Py_None, currsize);
     }
     return PyObject_CallFunction(_self->cache_info_type, "nnnn",
-                                 _self->hits, _self->misses, _self->maxsize,
-                                 PyDict_GET_SIZE(_self->cache));
+                                 hits, misses, _self->maxsize, currsize);
+}
+
+static void
+lru_cache_clear(lru_cache_object *self)
+{
+    lru_list_elem *list = lru_cache_unlink_list(self);
+    self->hits = self->misses = 0;
+    self->currsize = 0;
+    PyDict_Clear(self->cache);
+    lru_cache_clear_list(list);
 }
 
 /*[clinic input]
@@ -1626,13 +2018,85 @@ _functools__lru_cache_wrapper_cache_clear_impl(PyObject *self)
 /*[clinic end generated code: output=58423b35efc3e381 input=dfa33acbecf8b4b2]*/
 {
     lru_cache_object *_self = (lru_cache_object *) self;
-    lru_list_elem *list = lru_cache_unlink_list(_self);
-    _self->hits = _self->misses = 0;
-    PyDict_Clear(_self->cache);
-    lru_cache_clear_list(list);
+    if (_self->shards != NULL) {
+        for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(_self->shards); i++) {
+            lru_cache_object *shard =
+                (lru_cache_object *)PyTuple_GET_ITEM(_self->shards, i);
+            Py_BEGIN_CRITICAL_SECTION(shard);
+            lru_cache_clear(shard);
+            Py_END_CRITICAL_SECTION();
+        }
+    }
+    else {
+        lru_cache_clear(_self);
+    }
     Py_RETURN_NONE;
 }
 
+/* Remove the entry for a key.  Return 1 if it was found, 0 if not, and -1
+   on error. */
+static int
+lru_cache_invalidate_key(lru_cache_object *self, PyObject *key,
+                         Py_hash_t hash)
+{
+    PyObject *popresult;
+    if (self->lookup == NULL) {
+        return 0;
+    }
+    int res = _PyDict_Pop_KnownHash((PyDictObject *)self->cache, key, hash,
+                                    &popresult);
+    if (res <= 0) {
+        return res;
+    }
+    if (self->lookup != infinite_lru_cache_lookup) {
+        lru_list_elem *link = (lru_list_elem *)popresult;
+        lru_cache_extract_link(link);
+        if (self->lookup == extended_lru_cache_lookup) {
+            self->currsize -= link->weight;
+        }
+        /* Release the reference owned by the linked list. */
+        Py_DECREF(link);
+    }
+    Py_DECREF(popresult);
+    return 1;
+}
+
+static PyObject *
+lru_cache_invalidate(PyObject *op, PyObject *args, PyObject *kwds)
+{
+    lru_cache_object *self = lru_cache_object_CAST(op);
+    int res;
+    Py_hash_t hash;
+    PyObject *key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
+    if (!key)
+        return NULL;
+    hash = PyObject_Hash(key);
+    if (hash == -1) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    lru_cache_object *target = self;
+    if (self->shards != NULL) {
+        target = lru_cache_get_shard(self, hash);
+    }
+    Py_BEGIN_CRITICAL_SECTION(target);
+    res = lru_cache_invalidate_key(target, key, hash);
+    Py_END_CRITICAL_SECTION();
+    Py_DECREF(key);
+    if (res < 0) {
+        return NULL;
+    }
+    return PyBool_FromLong(res);
+}
+
+PyDoc_STRVAR(lru_cache_invalidate_doc,
+"cache_invalidate($self, /, *args, **kwargs)\n\
+--\n\
+\n\
+Remove the cached result for the given arguments.\n\
+\n\
+Return True if there was a cached result, else False.");
+
 static PyObject *
 lru_cache_reduce(PyObject *self, PyObject *Py_UNUSED(dummy))
 {
@@ -1669,6 +2133,9 @@ lru_cache_tp_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(self->kwd_mark);
     Py_VISIT(self->lru_list_elem_type);
     Py_VISIT(self->cache_info_type);
+    Py_VISIT(self->weight);
+    Py_VISIT(self->on_evict);
+    Py_VISIT(self->shards);
     Py_VISIT(self->dict);
     return 0;
 }
@@ -1687,12 +2154,24 @@ typed:    False     cache f(3) and f(3.0) as identical calls\n\
           True      cache f(3) and f(3.0) as distinct calls\n\
 \n\
 cache_info_type:    namedtuple class with the fields:\n\
-                        hits misses currsize maxsize\n"
+                        hits misses currsize maxsize\n\
+\n\
+ttl:      None      results do not expire\n\
+          t         discard results older than t seconds\n\
+\n\
+weight:   None      maxsize is the number of results\n\
+          f         maxsize is the total of f(result) of the results\n\
+\n\
+on_evict: None      or a function called with each evicted result\n\
+\n\
+shards:   n         split the cache in n independently locked parts\n"
 );
 
 static PyMethodDef lru_cache_methods[] = {
     _FUNCTOOLS__LRU_CACHE_WRAPPER_CACHE_INFO_METHODDEF
     _FUNCTOOLS__LRU_CACHE_WRAPPER_CACHE_CLEAR_METHODDEF
+    {"cache_invalidate", _PyCFunction_CAST(lru_cache_invalidate),
+     METH_VARARGS | METH_KEYWORDS, lru_cache_invalidate_doc},
     {"__reduce__", lru_cache_reduce, METH_NOARGS},
     {"__copy__", lru_cache_copy, METH_VARARGS},
     {"__deepcopy__", lru_cache_deepcopy, METH_VARARGS},
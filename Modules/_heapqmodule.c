@@ -11,15 +11,46 @@ annotated by François Pinard, and converted to C by Raymond Hettinger.
 #endif
 
 #include "Python.h"
+#include "pycore_critical_section.h" // Py_BEGIN_CRITICAL_SECTION()
 #include "pycore_list.h"          // _PyList_ITEMS()
+#include "pycore_pyatomic_ft_wrappers.h" // FT_ATOMIC_LOAD_SSIZE_RELAXED()
 
+typedef struct {
+    PyTypeObject *merge_type;
+    PyTypeObject *indexedheap_type;
+    PyTypeObject *handle_type;
+} heapq_state;
+
+static struct PyModuleDef _heapqmodule;
+
+static inline heapq_state *
+get_heapq_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (heapq_state *)state;
+}
+
+static inline heapq_state *
+find_heapq_state_by_type(PyTypeObject *type)
+{
+    PyObject *module = PyType_GetModuleByDef(type, &_heapqmodule);
+    assert(module != NULL);
+    return get_heapq_state(module);
+}
+
+typedef struct indexedheapobject indexedheapobject;
+
+#define clinic_state() (find_heapq_state_by_type(type))
 #include "clinic/_heapqmodule.c.h"
+#undef clinic_state
 
 
 /*[clinic input]
 module _heapq
+class _heapq.IndexedHeap "indexedheapobject *" "clinic_state()->indexedheap_type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=d7cca0a2e4c0ceb3]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=22f4d0cdc9917f84]*/
 
 static int
 siftdown(PyListObject *heap, Py_ssize_t startpos, Py_ssize_t pos)
@@ -531,6 +562,1099 @@ _heapq__heapify_max_impl(PyObject *module, PyObject *heap)
     return heapify_internal(heap, siftup_max);
 }
 
+/* Heaps of entries
+   ----------------
+
+   merge(), nsmallest() and nlargest() keep their candidates in a private
+   array of entries, each holding a value, its key and its position in the
+   input, which breaks ties so that the results are stable.  Comparing
+   entries never runs the key function again, and no tuple is allocated to
+   decorate the values. */
+
+typedef struct {
+    PyObject *key;      /* the value itself if there is no key function */
+    PyObject *value;
+    PyObject *it;       /* input iterator (merge() only) */
+    Py_ssize_t order;
+} heapentry;
+
+/* Return 1 if entry a comes before entry b in the output, 0 if it comes
+   after, and -1 on error.  Only the < operator is used on the keys. */
+static int
+entry_before(heapentry *a, heapentry *b, int reverse)
+{
+    PyObject *x = reverse ? b->key : a->key;
+    PyObject *y = reverse ? a->key : b->key;
+    int cmp;
+
+    cmp = PyObject_RichCompareBool(x, y, Py_LT);
+    if (cmp != 0) {
+        return cmp;
+    }
+    cmp = PyObject_RichCompareBool(y, x, Py_LT);
+    if (cmp != 0) {
+        return cmp < 0 ? -1 : 0;
+    }
+    return a->order < b->order;
+}
+
+/* Move the entry at pos towards the leaves until the heap invariant is
+   restored.  The root of the heap is the entry which comes first in the
+   output, or the one which comes last if invert is true.  On error, the
+   array still holds every entry exactly once. */
+static int
+entries_siftup(heapentry *heap, Py_ssize_t n, Py_ssize_t pos,
+               int reverse, int invert)
+{
+    heapentry item = heap[pos];
+    Py_ssize_t childpos;
+    int cmp;
+
+    while ((childpos = 2 * pos + 1) < n) {
+        if (childpos + 1 < n) {
+            cmp = invert ? entry_before(&heap[childpos], &heap[childpos + 1],
+                                        reverse)
+                         : entry_before(&heap[childpos + 1], &heap[childpos],
+                                        reverse);
+            if (cmp < 0) {
+                goto error;
+            }
+            childpos += cmp;
+        }
+        cmp = invert ? entry_before(&item, &heap[childpos], reverse)
+                     : entry_before(&heap[childpos], &item, reverse);
+        if (cmp < 0) {
+            goto error;
+        }
+        if (cmp == 0) {
+            break;
+        }
+        heap[pos] = heap[childpos];
+        pos = childpos;
+    }
+    heap[pos] = item;
+    return 0;
+
+error:
+    heap[pos] = item;
+    return -1;
+}
+
+static int
+entries_heapify(heapentry *heap, Py_ssize_t n, int reverse, int invert)
+{
+    for (Py_ssize_t i = (n >> 1) - 1; i >= 0; i--) {
+        if (entries_siftup(heap, n, i, reverse, invert) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static void
+entry_clear(heapentry *entry)
+{
+    Py_CLEAR(entry->key);
+    Py_CLEAR(entry->value);
+    Py_CLEAR(entry->it);
+}
+
+static PyObject *
+entry_key(PyObject *keyfunc, PyObject *value)
+{
+    if (keyfunc == Py_None) {
+        return Py_NewRef(value);
+    }
+    return PyObject_CallOneArg(keyfunc, value);
+}
+
+/* Common code of nsmallest() and nlargest().  A heap whose root is the
+   worst of the n best entries seen so far lets every other element be
+   rejected with a single comparison. */
+static PyObject *
+nselect(Py_ssize_t n, PyObject *iterable, PyObject *keyfunc, int largest)
+{
+    PyObject *it, *value, *key, *result = NULL;
+    heapentry *heap = NULL, *newheap;
+    Py_ssize_t size = 0, allocated = 0, order = 0;
+    int cmp;
+
+    it = PyObject_GetIter(iterable);
+    if (it == NULL) {
+        return NULL;
+    }
+    if (n <= 0) {
+        Py_DECREF(it);
+        return PyList_New(0);
+    }
+
+    while ((value = PyIter_Next(it)) != NULL) {
+        key = entry_key(keyfunc, value);
+        if (key == NULL) {
+            Py_DECREF(value);
+            goto done;
+        }
+        if (size < n) {
+            if (size == allocated) {
+                allocated = allocated < n / 2 ? Py_MAX(allocated * 2, 8) : n;
+                newheap = PyMem_Resize(heap, heapentry, allocated);
+                if (newheap == NULL) {
+                    PyErr_NoMemory();
+                    Py_DECREF(key);
+                    Py_DECREF(value);
+                    goto done;
+                }
+                heap = newheap;
+            }
+            heap[size] = (heapentry){key, value, NULL, order++};
+            if (++size == n && entries_heapify(heap, size, largest, 1) < 0) {
+                goto done;
+            }
+            continue;
+        }
+        /* Only an element strictly better than the worst one kept can
+           replace it, since it comes after it in the input. */
+        cmp = largest ? PyObject_RichCompareBool(heap[0].key, key, Py_LT)
+                      : PyObject_RichCompareBool(key, heap[0].key, Py_LT);
+        if (cmp <= 0) {
+            Py_DECREF(key);
+            Py_DECREF(value);
+            if (cmp < 0) {
+                goto done;
+            }
+            order++;
+            continue;
+        }
+        heapentry old = heap[0];
+        heap[0] = (heapentry){key, value, NULL, order++};
+        entry_clear(&old);
+        if (entries_siftup(heap, size, 0, largest, 1) < 0) {
+            goto done;
+        }
+    }
+    if (PyErr_Occurred()) {
+        goto done;
+    }
+    if (size < n && entries_heapify(heap, size, largest, 1) < 0) {
+        goto done;
+    }
+
+    /* Pop the worst remaining entry to fill the result from its end. */
+    result = PyList_New(size);
+    if (result == NULL) {
+        goto done;
+    }
+    while (size > 0) {
+        heapentry last = heap[0];
+        size--;
+        heap[0] = heap[size];
+        PyList_SET_ITEM(result, size, last.value);
+        Py_DECREF(last.key);
+        if (size > 1 && entries_siftup(heap, size, 0, largest, 1) < 0) {
+            Py_CLEAR(result);
+            goto done;
+        }
+    }
+
+done:
+    for (Py_ssize_t i = 0; i < size; i++) {
+        entry_clear(&heap[i]);
+    }
+    PyMem_Free(heap);
+    Py_DECREF(it);
+    return result;
+}
+
+/*[clinic input]
+_heapq.nsmallest
+
+    n: Py_ssize_t
+    iterable: object
+    key: object = None
+
+Find the n smallest elements in a dataset.
+
+Equivalent to:  sorted(iterable, key=key)[:n]
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_nsmallest_impl(PyObject *module, Py_ssize_t n, PyObject *iterable,
+                      PyObject *key)
+/*[clinic end generated code: output=a43c6d51186a5ea7 input=c9d80167a4295534]*/
+{
+    return nselect(n, iterable, key, 0);
+}
+
+/*[clinic input]
+_heapq.nlargest
+
+    n: Py_ssize_t
+    iterable: object
+    key: object = None
+
+Find the n largest elements in a dataset.
+
+Equivalent to:  sorted(iterable, key=key, reverse=True)[:n]
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_nlargest_impl(PyObject *module, Py_ssize_t n, PyObject *iterable,
+                     PyObject *key)
+/*[clinic end generated code: output=763bd85fcb1fcf16 input=d135a522326fe1fe]*/
+{
+    return nselect(n, iterable, key, 1);
+}
+
+/* merge object **************************************************************/
+
+typedef struct {
+    PyObject_HEAD
+    heapentry *heap;
+    Py_ssize_t size;
+    PyObject *iterators;    /* tuple of the inputs until the first next() */
+    PyObject *keyfunc;
+    int reverse;
+    int pending;            /* the input of heap[0] must be advanced first */
+    int running;
+} mergeobject;
+
+#define mergeobject_CAST(op)    ((mergeobject *)(op))
+
+PyDoc_STRVAR(merge_doc,
+"merge(*iterables, key=None, reverse=False)\n\
+--\n\
+\n\
+Merge multiple sorted inputs into a single sorted output.\n\
+\n\
+Similar to sorted(itertools.chain(*iterables)) but returns an iterator,\n\
+does not pull the data into memory all at once, and assumes that each of\n\
+the input streams is already sorted (smallest to largest).\n\
+\n\
+>>> list(merge([1,3,5,7], [0,2,4,8], [5,10,15,20], [], [25]))\n\
+[0, 1, 2, 3, 4, 5, 5, 7, 8, 10, 15, 20, 25]\n\
+\n\
+If *key* is not None, applies a key function to each element to determine\n\
+its sort order.\n\
+\n\
+>>> list(merge(['dog', 'horse'], ['cat', 'fish', 'kangaroo'], key=len))\n\
+['dog', 'cat', 'fish', 'horse', 'kangaroo']");
+
+static PyObject *
+merge_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"key", "reverse", NULL};
+    PyObject *keyfunc = Py_None, *iterators, *empty;
+    mergeobject *mo;
+    Py_ssize_t n;
+    int reverse = 0;
+
+    if (kwds != NULL) {
+        empty = PyTuple_New(0);
+        if (empty == NULL) {
+            return NULL;
+        }
+        if (!PyArg_ParseTupleAndKeywords(empty, kwds, "|$Op:merge", kwlist,
+                                         &keyfunc, &reverse))
+        {
+            Py_DECREF(empty);
+            return NULL;
+        }
+        Py_DECREF(empty);
+    }
+
+    n = PyTuple_GET_SIZE(args);
+    iterators = PyTuple_New(n);
+    if (iterators == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *it = PyObject_GetIter(PyTuple_GET_ITEM(args, i));
+        if (it == NULL) {
+            Py_DECREF(iterators);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(iterators, i, it);
+    }
+
+    mo = (mergeobject *)type->tp_alloc(type, 0);
+    if (mo == NULL) {
+        Py_DECREF(iterators);
+        return NULL;
+    }
+    if (n > 0) {
+        mo->heap = PyMem_New(heapentry, n);
+        if (mo->heap == NULL) {
+            Py_DECREF(mo);
+            Py_DECREF(iterators);
+            return PyErr_NoMemory();
+        }
+    }
+    mo->iterators = iterators;
+    mo->keyfunc = Py_NewRef(keyfunc);
+    mo->reverse = reverse;
+    return (PyObject *)mo;
+}
+
+/* Release the inputs once they are exhausted or after an error, like a
+   generator which has finished. */
+static void
+merge_finish(mergeobject *mo)
+{
+    heapentry *heap = mo->heap;
+    Py_ssize_t size = mo->size;
+
+    mo->heap = NULL;
+    mo->size = 0;
+    mo->pending = 0;
+    Py_CLEAR(mo->iterators);
+    for (Py_ssize_t i = 0; i < size; i++) {
+        entry_clear(&heap[i]);
+    }
+    PyMem_Free(heap);
+}
+
+static int
+merge_start(mergeobject *mo)
+{
+    PyObject *iterators = mo->iterators;
+    PyObject *value, *key;
+
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(iterators); i++) {
+        PyObject *it = PyTuple_GET_ITEM(iterators, i);
+        value = PyIter_Next(it);
+        if (value == NULL) {
+            if (PyErr_Occurred()) {
+                return -1;
+            }
+            continue;
+        }
+        key = entry_key(mo->keyfunc, value);
+        if (key == NULL) {
+            Py_DECREF(value);
+            return -1;
+        }
+        mo->heap[mo->size++] = (heapentry){key, value, Py_NewRef(it), i};
+    }
+    Py_CLEAR(mo->iterators);
+    return entries_heapify(mo->heap, mo->size, mo->reverse, 0);
+}
+
+/* Replace the value of heap[0], which was returned by the previous call,
+   by the next value of its input. */
+static int
+merge_advance(mergeobject *mo)
+{
+    heapentry *heap = mo->heap;
+    heapentry old = heap[0];
+    PyObject *value, *key;
+    int res;
+
+    value = PyIter_Next(old.it);
+    if (value == NULL) {
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+        mo->size--;
+        heap[0] = heap[mo->size];
+        res = entries_siftup(heap, mo->size, 0, mo->reverse, 0);
+        entry_clear(&old);
+        return res;
+    }
+    key = entry_key(mo->keyfunc, value);
+    if (key == NULL) {
+        Py_DECREF(value);
+        return -1;
+    }
+    heap[0].key = key;
+    heap[0].value = value;
+    res = entries_siftup(heap, mo->size, 0, mo->reverse, 0);
+    Py_DECREF(old.key);
+    Py_DECREF(old.value);
+    return res;
+}
+
+static PyObject *
+merge_next_lock_held(mergeobject *mo)
+{
+    int res = 0;
+
+    if (mo->iterators != NULL) {
+        res = merge_start(mo);
+    }
+    else if (mo->pending) {
+        res = merge_advance(mo);
+    }
+    if (res < 0 || mo->size == 0) {
+        merge_finish(mo);
+        return NULL;
+    }
+    mo->pending = 1;
+    return Py_NewRef(mo->heap[0].value);
+}
+
+static PyObject *
+merge_next(PyObject *op)
+{
+    mergeobject *mo = mergeobject_CAST(op);
+    PyObject *result;
+
+    Py_BEGIN_CRITICAL_SECTION(op);
+    if (mo->running) {
+        PyErr_SetString(PyExc_ValueError, "merge() already executing");
+        result = NULL;
+    }
+    else {
+        mo->running = 1;
+        result = merge_next_lock_held(mo);
+        mo->running = 0;
+    }
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static int
+merge_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    mergeobject *mo = mergeobject_CAST(op);
+    Py_VISIT(Py_TYPE(mo));
+    Py_VISIT(mo->iterators);
+    Py_VISIT(mo->keyfunc);
+    for (Py_ssize_t i = 0; i < mo->size; i++) {
+        Py_VISIT(mo->heap[i].key);
+        Py_VISIT(mo->heap[i].value);
+        Py_VISIT(mo->heap[i].it);
+    }
+    return 0;
+}
+
+static int
+merge_clear(PyObject *op)
+{
+    mergeobject *mo = mergeobject_CAST(op);
+    merge_finish(mo);
+    Py_CLEAR(mo->keyfunc);
+    return 0;
+}
+
+static void
+merge_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)merge_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+static PyType_Slot merge_slots[] = {
+    {Py_tp_dealloc, merge_dealloc},
+    {Py_tp_getattro, PyObject_GenericGetAttr},
+    {Py_tp_doc, (void *)merge_doc},
+    {Py_tp_traverse, merge_traverse},
+    {Py_tp_clear, merge_clear},
+    {Py_tp_iter, PyObject_SelfIter},
+    {Py_tp_iternext, merge_next},
+    {Py_tp_new, merge_new},
+    {Py_tp_free, PyObject_GC_Del},
+    {0, NULL},
+};
+
+static PyType_Spec merge_spec = {
+    .name = "_heapq.merge",
+    .basicsize = sizeof(mergeobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = merge_slots,
+};
+
+/* IndexedHeap object ********************************************************/
+
+/* An IndexedHeap keeps its entries in an array of handles, and every handle
+   records its position in that array, so that an entry can be moved,
+   updated or removed in O(log n) time without searching for it.  A handle
+   belongs to the heap whose array holds it at its recorded position; it
+   is -1 once the entry was popped or removed. */
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *priority;
+    PyObject *value;
+    uint64_t order;         /* breaks ties between equal priorities */
+    Py_ssize_t pos;
+} handleobject;
+
+struct indexedheapobject {
+    PyObject_HEAD
+    handleobject **heap;
+    Py_ssize_t size;
+    Py_ssize_t allocated;
+    uint64_t count;         /* number of entries pushed so far */
+    size_t state;           /* incremented by every change */
+};
+
+#define handleobject_CAST(op)       ((handleobject *)(op))
+#define indexedheapobject_CAST(op)  ((indexedheapobject *)(op))
+
+/* Return 1 if a must be closer to the root than b, 0 if not, and -1 on
+   error.  Comparing the priorities can run arbitrary code, which must not
+   change the heap. */
+static int
+indexedheap_lt(indexedheapobject *self, handleobject *a, handleobject *b)
+{
+    size_t state = self->state;
+    int tie = a->order < b->order;
+    PyObject *x = Py_NewRef(a->priority);
+    PyObject *y = Py_NewRef(b->priority);
+    int cmp;
+
+    cmp = PyObject_RichCompareBool(x, y, Py_LT);
+    if (cmp == 0) {
+        cmp = PyObject_RichCompareBool(y, x, Py_LT);
+        if (cmp == 0) {
+            cmp = tie;
+        }
+        else if (cmp > 0) {
+            cmp = 0;
+        }
+    }
+    Py_DECREF(x);
+    Py_DECREF(y);
+    if (cmp >= 0 && self->state != state) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "IndexedHeap changed during a comparison");
+        return -1;
+    }
+    return cmp;
+}
+
+static inline void
+indexedheap_swap(indexedheapobject *self, Py_ssize_t i, Py_ssize_t j)
+{
+    handleobject *a = self->heap[i], *b = self->heap[j];
+    self->heap[i] = b;
+    b->pos = i;
+    self->heap[j] = a;
+    a->pos = j;
+}
+
+/* Move the entry at pos towards the root. */
+static int
+indexedheap_siftdown(indexedheapobject *self, Py_ssize_t pos)
+{
+    while (pos > 0) {
+        Py_ssize_t parentpos = (pos - 1) >> 1;
+        int cmp = indexedheap_lt(self, self->heap[pos],
+                                 self->heap[parentpos]);
+        if (cmp < 0) {
+            return -1;
+        }
+        if (cmp == 0) {
+            break;
+        }
+        indexedheap_swap(self, pos, parentpos);
+        pos = parentpos;
+    }
+    return 0;
+}
+
+/* Move the entry at pos towards the leaves. */
+static int
+indexedheap_siftup(indexedheapobject *self, Py_ssize_t pos)
+{
+    Py_ssize_t childpos;
+    int cmp;
+
+    while ((childpos = 2 * pos + 1) < self->size) {
+        if (childpos + 1 < self->size) {
+            cmp = indexedheap_lt(self, self->heap[childpos + 1],
+                                 self->heap[childpos]);
+            if (cmp < 0) {
+                return -1;
+            }
+            childpos += cmp;
+        }
+        cmp = indexedheap_lt(self, self->heap[childpos], self->heap[pos]);
+        if (cmp < 0) {
+            return -1;
+        }
+        if (cmp == 0) {
+            break;
+        }
+        indexedheap_swap(self, pos, childpos);
+        pos = childpos;
+    }
+    return 0;
+}
+
+/* Restore the heap invariant after the entry at pos has changed. */
+static int
+indexedheap_fix(indexedheapobject *self, Py_ssize_t pos)
+{
+    if (pos > 0) {
+        int cmp = indexedheap_lt(self, self->heap[pos],
+                                 self->heap[(pos - 1) >> 1]);
+        if (cmp < 0) {
+            return -1;
+        }
+        if (cmp) {
+            return indexedheap_siftdown(self, pos);
+        }
+    }
+    return indexedheap_siftup(self, pos);
+}
+
+/* Return the entry at pos as a (priority, value) tuple and remove it.  The
+   handle is only released once the heap is consistent again. */
+static PyObject *
+indexedheap_delete(indexedheapobject *self, Py_ssize_t pos)
+{
+    handleobject *handle = self->heap[pos];
+    PyObject *result;
+    int res = 0;
+
+    result = PyTuple_Pack(2, handle->priority, handle->value);
+    if (result == NULL) {
+        return NULL;
+    }
+    self->state++;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(self->size, self->size - 1);
+    handle->pos = -1;
+    if (pos < self->size) {
+        self->heap[pos] = self->heap[self->size];
+        self->heap[pos]->pos = pos;
+        res = indexedheap_fix(self, pos);
+    }
+    Py_DECREF(handle);
+    if (res < 0) {
+        Py_DECREF(result);
+        return NULL;
+    }
+    return result;
+}
+
+static int
+indexedheap_owns(indexedheapobject *self, PyObject *op)
+{
+    heapq_state *state = find_heapq_state_by_type(Py_TYPE(self));
+    Py_ssize_t pos;
+
+    if (!Py_IS_TYPE(op, state->handle_type)) {
+        return 0;
+    }
+    pos = handleobject_CAST(op)->pos;
+    return pos >= 0 && pos < self->size &&
+           self->heap[pos] == handleobject_CAST(op);
+}
+
+static PyObject *
+indexedheap_check_handle(indexedheapobject *self, PyObject *handle)
+{
+    if (!indexedheap_owns(self, handle)) {
+        PyErr_SetString(PyExc_ValueError, "handle not in heap");
+        return NULL;
+    }
+    return handle;
+}
+
+static void
+indexedheap_release(handleobject **heap, Py_ssize_t size)
+{
+    for (Py_ssize_t i = 0; i < size; i++) {
+        heap[i]->pos = -1;
+    }
+    for (Py_ssize_t i = 0; i < size; i++) {
+        Py_DECREF(heap[i]);
+    }
+    PyMem_Free(heap);
+}
+
+static int
+indexedheap_tp_clear(PyObject *op)
+{
+    indexedheapobject *self = indexedheapobject_CAST(op);
+    handleobject **heap = self->heap;
+    Py_ssize_t size = self->size;
+
+    self->heap = NULL;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(self->size, 0);
+    self->allocated = 0;
+    self->state++;
+    if (heap != NULL) {
+        indexedheap_release(heap, size);
+    }
+    return 0;
+}
+
+/*[clinic input]
+@classmethod
+_heapq.IndexedHeap.__new__ as indexedheap_new
+
+Priority queue whose entries can be updated and removed.
+
+push() returns a handle to the new entry, which can be passed to update(),
+decrease_key() and remove().  Entries with equal priorities are popped in
+the order they were pushed.
+[clinic start generated code]*/
+
+static PyObject *
+indexedheap_new_impl(PyTypeObject *type)
+/*[clinic end generated code: output=9517808fcfa084aa input=59505bc8ffd66dfa]*/
+{
+    return type->tp_alloc(type, 0);
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.push
+
+    priority: object
+    value: object = None
+    /
+
+Add an entry and return its handle.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_push_impl(indexedheapobject *self, PyObject *priority,
+                             PyObject *value)
+/*[clinic end generated code: output=afad069e156e8fe0 input=e1424653eb4a15ea]*/
+{
+    heapq_state *state = find_heapq_state_by_type(Py_TYPE(self));
+    handleobject *handle;
+
+    if (self->size == self->allocated) {
+        Py_ssize_t allocated = self->allocated ? self->allocated * 2 : 8;
+        handleobject **heap = PyMem_Resize(self->heap, handleobject *,
+                                           allocated);
+        if (heap == NULL) {
+            return PyErr_NoMemory();
+        }
+        self->heap = heap;
+        self->allocated = allocated;
+    }
+    handle = PyObject_GC_New(handleobject, state->handle_type);
+    if (handle == NULL) {
+        return NULL;
+    }
+    handle->priority = Py_NewRef(priority);
+    handle->value = Py_NewRef(value);
+    handle->order = self->count++;
+    handle->pos = self->size;
+    PyObject_GC_Track(handle);
+
+    self->state++;
+    self->heap[self->size] = handle;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(self->size, self->size + 1);
+    if (indexedheap_siftdown(self, handle->pos) < 0) {
+        return NULL;
+    }
+    return Py_NewRef(handle);
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.pop
+
+Remove and return the (priority, value) pair with the lowest priority.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_pop_impl(indexedheapobject *self)
+/*[clinic end generated code: output=31b324b9574aed67 input=0a70664dfcdc3513]*/
+{
+    if (self->size == 0) {
+        PyErr_SetString(PyExc_IndexError, "pop from an empty heap");
+        return NULL;
+    }
+    return indexedheap_delete(self, 0);
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.peek
+
+Return the (priority, value) pair with the lowest priority.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_peek_impl(indexedheapobject *self)
+/*[clinic end generated code: output=8c427b24020f8892 input=f8222aebb3159146]*/
+{
+    if (self->size == 0) {
+        PyErr_SetString(PyExc_IndexError, "peek from an empty heap");
+        return NULL;
+    }
+    return PyTuple_Pack(2, self->heap[0]->priority, self->heap[0]->value);
+}
+
+/*[clinic input]
+@critical_section self handle
+_heapq.IndexedHeap.update
+
+    handle: object
+    priority: object
+    /
+
+Change the priority of the entry of handle.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_update_impl(indexedheapobject *self, PyObject *handle,
+                               PyObject *priority)
+/*[clinic end generated code: output=7009c805594e4864 input=6bae189f750387c2]*/
+{
+    PyObject *old;
+    int res;
+
+    if (indexedheap_check_handle(self, handle) == NULL) {
+        return NULL;
+    }
+    self->state++;
+    old = handleobject_CAST(handle)->priority;
+    handleobject_CAST(handle)->priority = Py_NewRef(priority);
+    res = indexedheap_fix(self, handleobject_CAST(handle)->pos);
+    Py_DECREF(old);
+    if (res < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section self handle
+_heapq.IndexedHeap.decrease_key
+
+    handle: object
+    priority: object
+    /
+
+Lower the priority of the entry of handle.
+
+Raise ValueError if priority is greater than the current priority.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_decrease_key_impl(indexedheapobject *self,
+                                     PyObject *handle, PyObject *priority)
+/*[clinic end generated code: output=49486f79afb61fbd input=a326d7c911729913]*/
+{
+    PyObject *current;
+    size_t state = self->state;
+    int cmp;
+
+    if (indexedheap_check_handle(self, handle) == NULL) {
+        return NULL;
+    }
+    current = Py_NewRef(handleobject_CAST(handle)->priority);
+    cmp = PyObject_RichCompareBool(current, priority, Py_LT);
+    Py_DECREF(current);
+    if (cmp < 0) {
+        return NULL;
+    }
+    if (cmp) {
+        PyErr_SetString(PyExc_ValueError,
+                        "new priority is greater than the current priority");
+        return NULL;
+    }
+    if (self->state != state) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "IndexedHeap changed during a comparison");
+        return NULL;
+    }
+    return _heapq_IndexedHeap_update_impl(self, handle, priority);
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.remove
+
+    handle: object
+    /
+
+Remove the entry of handle and return its (priority, value) pair.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_remove_impl(indexedheapobject *self, PyObject *handle)
+/*[clinic end generated code: output=0e42bbcb747368e5 input=2c31e9441ee01382]*/
+{
+    if (indexedheap_check_handle(self, handle) == NULL) {
+        return NULL;
+    }
+    return indexedheap_delete(self, handleobject_CAST(handle)->pos);
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.clear
+
+Remove all entries.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_clear_impl(indexedheapobject *self)
+/*[clinic end generated code: output=81cdf8812fb334eb input=d1e7bc8184069b3c]*/
+{
+    (void)indexedheap_tp_clear((PyObject *)self);
+    Py_RETURN_NONE;
+}
+
+static Py_ssize_t
+indexedheap_length(PyObject *op)
+{
+    indexedheapobject *self = indexedheapobject_CAST(op);
+    return FT_ATOMIC_LOAD_SSIZE_RELAXED(self->size);
+}
+
+static int
+indexedheap_contains(PyObject *op, PyObject *handle)
+{
+    int res;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    res = indexedheap_owns(indexedheapobject_CAST(op), handle);
+    Py_END_CRITICAL_SECTION();
+    return res;
+}
+
+static int
+indexedheap_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    indexedheapobject *self = indexedheapobject_CAST(op);
+    Py_VISIT(Py_TYPE(self));
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        Py_VISIT(self->heap[i]);
+    }
+    return 0;
+}
+
+static void
+indexedheap_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)indexedheap_tp_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+static PyMethodDef indexedheap_methods[] = {
+    _HEAPQ_INDEXEDHEAP_PUSH_METHODDEF
+    _HEAPQ_INDEXEDHEAP_POP_METHODDEF
+    _HEAPQ_INDEXEDHEAP_PEEK_METHODDEF
+    _HEAPQ_INDEXEDHEAP_UPDATE_METHODDEF
+    _HEAPQ_INDEXEDHEAP_DECREASE_KEY_METHODDEF
+    _HEAPQ_INDEXEDHEAP_REMOVE_METHODDEF
+    _HEAPQ_INDEXEDHEAP_CLEAR_METHODDEF
+    {NULL, NULL}
+};
+
+static PyType_Slot indexedheap_slots[] = {
+    {Py_tp_dealloc, indexedheap_dealloc},
+    {Py_tp_doc, (void *)indexedheap_new__doc__},
+    {Py_tp_methods, indexedheap_methods},
+    {Py_tp_traverse, indexedheap_traverse},
+    {Py_tp_clear, indexedheap_tp_clear},
+    {Py_tp_new, indexedheap_new},
+    {Py_sq_length, indexedheap_length},
+    {Py_sq_contains, indexedheap_contains},
+    {0, NULL},
+};
+
+static PyType_Spec indexedheap_spec = {
+    .name = "_heapq.IndexedHeap",
+    .basicsize = sizeof(indexedheapobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_BASETYPE | Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = indexedheap_slots,
+};
+
+/* IndexedHeap handles */
+
+static PyObject *
+handle_get_priority(PyObject *op, void *Py_UNUSED(closure))
+{
+    PyObject *priority;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    priority = Py_NewRef(handleobject_CAST(op)->priority);
+    Py_END_CRITICAL_SECTION();
+    return priority;
+}
+
+static PyObject *
+handle_get_value(PyObject *op, void *Py_UNUSED(closure))
+{
+    return Py_NewRef(handleobject_CAST(op)->value);
+}
+
+static PyGetSetDef handle_getset[] = {
+    {"priority", handle_get_priority, NULL,
+     PyDoc_STR("Current priority of the entry.")},
+    {"value", handle_get_value, NULL,
+     PyDoc_STR("Value of the entry.")},
+    {NULL}
+};
+
+static PyObject *
+handle_repr(PyObject *op)
+{
+    handleobject *handle = handleobject_CAST(op);
+    PyObject *priority = handle_get_priority(op, NULL);
+    PyObject *result;
+
+    result = PyUnicode_FromFormat("<%s object at %p, priority=%R>",
+                                  _PyType_Name(Py_TYPE(handle)), handle,
+                                  priority);
+    Py_DECREF(priority);
+    return result;
+}
+
+static int
+handle_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    handleobject *handle = handleobject_CAST(op);
+    Py_VISIT(Py_TYPE(handle));
+    Py_VISIT(handle->priority);
+    Py_VISIT(handle->value);
+    return 0;
+}
+
+static int
+handle_clear(PyObject *op)
+{
+    handleobject *handle = handleobject_CAST(op);
+    Py_CLEAR(handle->priority);
+    Py_CLEAR(handle->value);
+    return 0;
+}
+
+static void
+handle_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)handle_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+static PyType_Slot handle_slots[] = {
+    {Py_tp_dealloc, handle_dealloc},
+    {Py_tp_repr, handle_repr},
+    {Py_tp_doc, (void *)PyDoc_STR("Handle of an entry of an IndexedHeap.")},
+    {Py_tp_getset, handle_getset},
+    {Py_tp_traverse, handle_traverse},
+    {Py_tp_clear, handle_clear},
+    {0, NULL},
+};
+
+static PyType_Spec handle_spec = {
+    .name = "_heapq.IndexedHeapHandle",
+    .basicsize = sizeof(handleobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_DISALLOW_INSTANTIATION | Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = handle_slots,
+};
+
 static PyMethodDef heapq_methods[] = {
     _HEAPQ_HEAPPUSH_METHODDEF
     _HEAPQ_HEAPPUSHPOP_METHODDEF
@@ -540,6 +1664,8 @@ static PyMethodDef heapq_methods[] = {
     _HEAPQ__HEAPPOP_MAX_METHODDEF
     _HEAPQ__HEAPIFY_MAX_METHODDEF
     _HEAPQ__HEAPREPLACE_MAX_METHODDEF
+    _HEAPQ_NSMALLEST_METHODDEF
+    _HEAPQ_NLARGEST_METHODDEF
     {NULL, NULL}           /* sentinel */
 };
 
@@ -672,12 +1798,63 @@ From all times, sorting has always been a Great Art! :-)\n");
 static int
 heapq_exec(PyObject *m)
 {
+    heapq_state *state = get_heapq_state(m);
+
+#define ADD_TYPE(module, type, spec)                                     \
+do {                                                                     \
+    type = (PyTypeObject *)PyType_FromModuleAndSpec(module, spec, NULL); \
+    if (type == NULL) {                                                  \
+        return -1;                                                       \
+    }                                                                    \
+    if (PyModule_AddType(module, type) < 0) {                            \
+        return -1;                                                       \
+    }                                                                    \
+} while (0)
+
+    ADD_TYPE(m, state->merge_type, &merge_spec);
+    ADD_TYPE(m, state->indexedheap_type, &indexedheap_spec);
+
+#undef ADD_TYPE
+
+    /* Handles are only created by IndexedHeap.push() */
+    state->handle_type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        m, &handle_spec, NULL);
+    if (state->handle_type == NULL) {
+        return -1;
+    }
+
     if (PyModule_Add(m, "__about__", PyUnicode_FromString(__about__)) < 0) {
         return -1;
     }
     return 0;
 }
 
+static int
+heapq_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    heapq_state *state = get_heapq_state(module);
+    Py_VISIT(state->merge_type);
+    Py_VISIT(state->indexedheap_type);
+    Py_VISIT(state->handle_type);
+    return 0;
+}
+
+static int
+heapq_clear(PyObject *module)
+{
+    heapq_state *state = get_heapq_state(module);
+    Py_CLEAR(state->merge_type);
+    Py_CLEAR(state->indexedheap_type);
+    Py_CLEAR(state->handle_type);
+    return 0;
+}
+
+static void
+heapq_free(void *module)
+{
+    (void)heapq_clear((PyObject *)module);
+}
+
 static struct PyModuleDef_Slot heapq_slots[] = {
     {Py_mod_exec, heapq_exec},
     {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
@@ -687,14 +1864,14 @@ static struct PyModuleDef_Slot heapq_slots[] = {
 
 static struct PyModuleDef _heapqmodule = {
     PyModuleDef_HEAD_INIT,
-    "_heapq",
-    module_doc,
-    0,
-    heapq_methods,
-    heapq_slots,
-    NULL,
-    NULL,
-    NULL
+    .m_name = "_heapq",
+    .m_doc = module_doc,
+    .m_size = sizeof(heapq_state),
+    .m_methods = heapq_methods,
+    .m_slots = heapq_slots,
+    .m_traverse = heapq_traverse,
+    .m_clear = heapq_clear,
+    .m_free = heapq_free,
 };
 
 PyMODINIT_FUNC
@@ -574,9 +574,11 @@ iomodule_traverse(PyObject *mod, visitproc visit, void *arg) {
     Py_VISIT(state->PyBufferedRandom_Type);
     Py_VISIT(state->PyBufferedReader_Type);
     Py_VISIT(state->PyBufferedWriter_Type);
+    Py_VISIT(state->PyBytesBuilder_Type);
     Py_VISIT(state->PyBytesIOBuffer_Type);
     Py_VISIT(state->PyBytesIO_Type);
     Py_VISIT(state->PyFileIO_Type);
+    Py_VISIT(state->PyStringBuilder_Type);
     Py_VISIT(state->PyStringIO_Type);
     Py_VISIT(state->PyTextIOBase_Type);
     Py_VISIT(state->PyTextIOWrapper_Type);
@@ -600,9 +602,11 @@ iomodule_clear(PyObject *mod) {
     Py_CLEAR(state->PyBufferedRandom_Type);
     Py_CLEAR(state->PyBufferedReader_Type);
     Py_CLEAR(state->PyBufferedWriter_Type);
+    Py_CLEAR(state->PyBytesBuilder_Type);
     Py_CLEAR(state->PyBytesIOBuffer_Type);
     Py_CLEAR(state->PyBytesIO_Type);
     Py_CLEAR(state->PyFileIO_Type);
+    Py_CLEAR(state->PyStringBuilder_Type);
     Py_CLEAR(state->PyStringIO_Type);
     Py_CLEAR(state->PyTextIOBase_Type);
     Py_CLEAR(state->PyTextIOWrapper_Type);
@@ -710,6 +714,10 @@ iomodule_exec(PyObject *m)
     ADD_TYPE(m, state->PyTextIOWrapper_Type, &textiowrapper_spec,
              state->PyTextIOBase_Type);
 
+    // Builders
+    ADD_TYPE(m, state->PyStringBuilder_Type, &stringbuilder_spec, NULL);
+    ADD_TYPE(m, state->PyBytesBuilder_Type, &bytesbuilder_spec, NULL);
+
 #undef ADD_TYPE
     return 0;
 }
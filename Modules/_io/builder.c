@@ -0,0 +1,350 @@
+#include "Python.h"
+#include "pycore_bytesobject.h"   // _PyBytesWriter
+#include "pycore_critical_section.h" // Py_BEGIN_CRITICAL_SECTION()
+#include "pycore_unicodeobject.h" // _PyUnicodeWriter_WriteFormat()
+#include "_iomodule.h"
+
+/* StringBuilder and BytesBuilder accumulate a string in an overallocated
+   buffer, and build() resizes that buffer to the final str or bytes object
+   without copying it. */
+
+/*[clinic input]
+module _io
+class _io.StringBuilder "stringbuilder *" "clinic_state()->PyStringBuilder_Type"
+class _io.BytesBuilder "bytesbuilder *" "clinic_state()->PyBytesBuilder_Type"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=2977b1669a663057]*/
+
+typedef struct {
+    PyObject_HEAD
+    /* NULL when nothing was written since the last build() */
+    PyUnicodeWriter *writer;
+} stringbuilder;
+
+typedef struct {
+    PyObject_HEAD
+    /* Current position in the buffer of the writer, NULL when nothing was
+       written since the last build() */
+    char *str;
+    Py_ssize_t size;
+    _PyBytesWriter writer;
+} bytesbuilder;
+
+#define stringbuilder_CAST(op)  ((stringbuilder *)(op))
+#define bytesbuilder_CAST(op)   ((bytesbuilder *)(op))
+
+#define clinic_state() (find_io_state_by_def(type))
+#include "clinic/builder.c.h"
+#undef clinic_state
+
+/* StringBuilder */
+
+/*[clinic input]
+@classmethod
+_io.StringBuilder.__new__ as stringbuilder_new
+
+Build a str by appending strings to it.
+
+This is faster than joining a list of strings or writing to a StringIO.
+[clinic start generated code]*/
+
+static PyObject *
+stringbuilder_new_impl(PyTypeObject *type)
+/*[clinic end generated code: output=e3feb9632492b0a2 input=4d357abc794b1735]*/
+{
+    return type->tp_alloc(type, 0);
+}
+
+static int
+stringbuilder_ensure_writer(stringbuilder *self)
+{
+    if (self->writer == NULL) {
+        self->writer = PyUnicodeWriter_Create(0);
+        if (self->writer == NULL) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/*[clinic input]
+@critical_section
+_io.StringBuilder.write
+
+    s: unicode
+    /
+
+Append a string.
+[clinic start generated code]*/
+
+static PyObject *
+_io_StringBuilder_write_impl(stringbuilder *self, PyObject *s)
+/*[clinic end generated code: output=2ab6768cf83711a4 input=f095d60c4bd8d034]*/
+{
+    if (stringbuilder_ensure_writer(self) < 0) {
+        return NULL;
+    }
+    /* not PyUnicodeWriter_WriteStr(), which calls str() on subclasses */
+    if (PyUnicodeWriter_WriteSubstring(self->writer, s, 0,
+                                       PyUnicode_GET_LENGTH(s)) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+stringbuilder_write_format_lock_held(stringbuilder *self, PyObject *args,
+                                     PyObject *kwargs)
+{
+    PyObject *format, *fargs;
+    int res;
+
+    if (PyTuple_GET_SIZE(args) < 1) {
+        PyErr_SetString(PyExc_TypeError,
+                        "write_format() missing required argument 'format'");
+        return NULL;
+    }
+    format = PyTuple_GET_ITEM(args, 0);
+    if (!PyUnicode_Check(format)) {
+        PyErr_Format(PyExc_TypeError,
+                     "write_format() argument 'format' must be str, not %T",
+                     format);
+        return NULL;
+    }
+    if (stringbuilder_ensure_writer(self) < 0) {
+        return NULL;
+    }
+    fargs = PyTuple_GetSlice(args, 1, PyTuple_GET_SIZE(args));
+    if (fargs == NULL) {
+        return NULL;
+    }
+    res = _PyUnicodeWriter_WriteFormat((_PyUnicodeWriter *)self->writer,
+                                       format, fargs, kwargs);
+    Py_DECREF(fargs);
+    if (res < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+stringbuilder_write_format(PyObject *op, PyObject *args, PyObject *kwargs)
+{
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    result = stringbuilder_write_format_lock_held(stringbuilder_CAST(op),
+                                                  args, kwargs);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+PyDoc_STRVAR(stringbuilder_write_format_doc,
+"write_format($self, format, /, *args, **kwargs)\n"
+"--\n"
+"\n"
+"Append format.format(*args, **kwargs).\n"
+"\n"
+"The result is formatted directly into the builder.");
+
+/*[clinic input]
+@critical_section
+_io.StringBuilder.build
+
+Return the built string and empty the builder.
+[clinic start generated code]*/
+
+static PyObject *
+_io_StringBuilder_build_impl(stringbuilder *self)
+/*[clinic end generated code: output=d0683141018a5fef input=c5519d861c62d684]*/
+{
+    PyUnicodeWriter *writer = self->writer;
+    if (writer == NULL) {
+        return Py_GetConstant(Py_CONSTANT_EMPTY_STR);
+    }
+    self->writer = NULL;
+    return PyUnicodeWriter_Finish(writer);
+}
+
+static Py_ssize_t
+stringbuilder_length(PyObject *op)
+{
+    stringbuilder *self = stringbuilder_CAST(op);
+    Py_ssize_t length = 0;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    if (self->writer != NULL) {
+        length = ((_PyUnicodeWriter *)self->writer)->pos;
+    }
+    Py_END_CRITICAL_SECTION();
+    return length;
+}
+
+static void
+stringbuilder_dealloc(PyObject *op)
+{
+    stringbuilder *self = stringbuilder_CAST(op);
+    PyTypeObject *tp = Py_TYPE(self);
+    if (self->writer != NULL) {
+        PyUnicodeWriter_Discard(self->writer);
+    }
+    tp->tp_free(self);
+    Py_DECREF(tp);
+}
+
+static PyMethodDef stringbuilder_methods[] = {
+    _IO_STRINGBUILDER_WRITE_METHODDEF
+    {"write_format", _PyCFunction_CAST(stringbuilder_write_format),
+     METH_VARARGS | METH_KEYWORDS, stringbuilder_write_format_doc},
+    _IO_STRINGBUILDER_BUILD_METHODDEF
+    {"__reduce__", _PyIOBase_cannot_pickle, METH_NOARGS},
+    {"__reduce_ex__", _PyIOBase_cannot_pickle, METH_O},
+    {NULL, NULL}
+};
+
+static PyType_Slot stringbuilder_slots[] = {
+    {Py_tp_dealloc, stringbuilder_dealloc},
+    {Py_tp_doc, (void *)stringbuilder_new__doc__},
+    {Py_tp_methods, stringbuilder_methods},
+    {Py_tp_new, stringbuilder_new},
+    {Py_sq_length, stringbuilder_length},
+    {0, NULL},
+};
+
+PyType_Spec stringbuilder_spec = {
+    .name = "_io.StringBuilder",
+    .basicsize = sizeof(stringbuilder),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = stringbuilder_slots,
+};
+
+/* BytesBuilder */
+
+static void
+bytesbuilder_reset(bytesbuilder *self)
+{
+    _PyBytesWriter_Init(&self->writer);
+    self->writer.overallocate = 1;
+    self->str = NULL;
+    self->size = 0;
+}
+
+/*[clinic input]
+@classmethod
+_io.BytesBuilder.__new__ as bytesbuilder_new
+
+Build a bytes object by appending bytes-like objects to it.
+
+This is faster than joining a list of bytes or writing to a BytesIO.
+[clinic start generated code]*/
+
+static PyObject *
+bytesbuilder_new_impl(PyTypeObject *type)
+/*[clinic end generated code: output=fd4c25350a51a6ce input=dcedecd949311439]*/
+{
+    bytesbuilder *self = (bytesbuilder *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    bytesbuilder_reset(self);
+    return (PyObject *)self;
+}
+
+/*[clinic input]
+@critical_section
+_io.BytesBuilder.write
+
+    b: Py_buffer
+    /
+
+Append a bytes-like object.
+[clinic start generated code]*/
+
+static PyObject *
+_io_BytesBuilder_write_impl(bytesbuilder *self, Py_buffer *b)
+/*[clinic end generated code: output=8bb082404a307526 input=902a4c4628a2c85a]*/
+{
+    char *str = self->str;
+    if (str == NULL) {
+        str = _PyBytesWriter_Alloc(&self->writer, b->len);
+        if (str == NULL) {
+            return NULL;
+        }
+        memcpy(str, b->buf, b->len);
+        str += b->len;
+    }
+    else {
+        str = _PyBytesWriter_WriteBytes(&self->writer, str, b->buf, b->len);
+        if (str == NULL) {
+            return NULL;
+        }
+    }
+    self->str = str;
+    self->size += b->len;
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_io.BytesBuilder.build
+
+Return the built bytes object and empty the builder.
+[clinic start generated code]*/
+
+static PyObject *
+_io_BytesBuilder_build_impl(bytesbuilder *self)
+/*[clinic end generated code: output=b944df23e0740e26 input=88aabf049a520712]*/
+{
+    PyObject *result;
+    if (self->str == NULL) {
+        return Py_GetConstant(Py_CONSTANT_EMPTY_BYTES);
+    }
+    result = _PyBytesWriter_Finish(&self->writer, self->str);
+    bytesbuilder_reset(self);
+    return result;
+}
+
+static Py_ssize_t
+bytesbuilder_length(PyObject *op)
+{
+    bytesbuilder *self = bytesbuilder_CAST(op);
+    Py_ssize_t size;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    size = self->size;
+    Py_END_CRITICAL_SECTION();
+    return size;
+}
+
+static void
+bytesbuilder_dealloc(PyObject *op)
+{
+    bytesbuilder *self = bytesbuilder_CAST(op);
+    PyTypeObject *tp = Py_TYPE(self);
+    if (self->str != NULL) {
+        _PyBytesWriter_Dealloc(&self->writer);
+    }
+    tp->tp_free(self);
+    Py_DECREF(tp);
+}
+
+static PyMethodDef bytesbuilder_methods[] = {
+    _IO_BYTESBUILDER_WRITE_METHODDEF
+    _IO_BYTESBUILDER_BUILD_METHODDEF
+    {"__reduce__", _PyIOBase_cannot_pickle, METH_NOARGS},
+    {"__reduce_ex__", _PyIOBase_cannot_pickle, METH_O},
+    {NULL, NULL}
+};
+
+static PyType_Slot bytesbuilder_slots[] = {
+    {Py_tp_dealloc, bytesbuilder_dealloc},
+    {Py_tp_doc, (void *)bytesbuilder_new__doc__},
+    {Py_tp_methods, bytesbuilder_methods},
+    {Py_tp_new, bytesbuilder_new},
+    {Py_sq_length, bytesbuilder_length},
+    {0, NULL},
+};
+
+PyType_Spec bytesbuilder_spec = {
+    .name = "_io.BytesBuilder",
+    .basicsize = sizeof(bytesbuilder),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = bytesbuilder_slots,
+};
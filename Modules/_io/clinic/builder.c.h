@@ -0,0 +1,182 @@
+/*[clinic input]
+preserve
+[clinic start generated code]*/
+
+#include "pycore_critical_section.h"// Py_BEGIN_CRITICAL_SECTION()
+#include "pycore_modsupport.h"    // _PyArg_NoKeywords()
+
+PyDoc_STRVAR(stringbuilder_new__doc__,
+"StringBuilder()\n"
+"--\n"
+"\n"
+"Build a str by appending strings to it.\n"
+"\n"
+"This is faster than joining a list of strings or writing to a StringIO.");
+
+static PyObject *
+stringbuilder_new_impl(PyTypeObject *type);
+
+static PyObject *
+stringbuilder_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    PyTypeObject *base_tp = clinic_state()->PyStringBuilder_Type;
+
+    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
+        !_PyArg_NoPositional("StringBuilder", args)) {
+        goto exit;
+    }
+    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
+        !_PyArg_NoKeywords("StringBuilder", kwargs)) {
+        goto exit;
+    }
+    return_value = stringbuilder_new_impl(type);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_io_StringBuilder_write__doc__,
+"write($self, s, /)\n"
+"--\n"
+"\n"
+"Append a string.");
+
+#define _IO_STRINGBUILDER_WRITE_METHODDEF    \
+    {"write", (PyCFunction)_io_StringBuilder_write, METH_O, _io_StringBuilder_write__doc__},
+
+static PyObject *
+_io_StringBuilder_write_impl(stringbuilder *self, PyObject *s);
+
+static PyObject *
+_io_StringBuilder_write(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *s;
+
+    if (!PyUnicode_Check(arg)) {
+        _PyArg_BadArgument("write", "argument", "str", arg);
+        goto exit;
+    }
+    s = arg;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _io_StringBuilder_write_impl((stringbuilder *)self, s);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_io_StringBuilder_build__doc__,
+"build($self, /)\n"
+"--\n"
+"\n"
+"Return the built string and empty the builder.");
+
+#define _IO_STRINGBUILDER_BUILD_METHODDEF    \
+    {"build", (PyCFunction)_io_StringBuilder_build, METH_NOARGS, _io_StringBuilder_build__doc__},
+
+static PyObject *
+_io_StringBuilder_build_impl(stringbuilder *self);
+
+static PyObject *
+_io_StringBuilder_build(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _io_StringBuilder_build_impl((stringbuilder *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(bytesbuilder_new__doc__,
+"BytesBuilder()\n"
+"--\n"
+"\n"
+"Build a bytes object by appending bytes-like objects to it.\n"
+"\n"
+"This is faster than joining a list of bytes or writing to a BytesIO.");
+
+static PyObject *
+bytesbuilder_new_impl(PyTypeObject *type);
+
+static PyObject *
+bytesbuilder_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    PyTypeObject *base_tp = clinic_state()->PyBytesBuilder_Type;
+
+    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
+        !_PyArg_NoPositional("BytesBuilder", args)) {
+        goto exit;
+    }
+    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
+        !_PyArg_NoKeywords("BytesBuilder", kwargs)) {
+        goto exit;
+    }
+    return_value = bytesbuilder_new_impl(type);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_io_BytesBuilder_write__doc__,
+"write($self, b, /)\n"
+"--\n"
+"\n"
+"Append a bytes-like object.");
+
+#define _IO_BYTESBUILDER_WRITE_METHODDEF    \
+    {"write", (PyCFunction)_io_BytesBuilder_write, METH_O, _io_BytesBuilder_write__doc__},
+
+static PyObject *
+_io_BytesBuilder_write_impl(bytesbuilder *self, Py_buffer *b);
+
+static PyObject *
+_io_BytesBuilder_write(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    Py_buffer b = {NULL, NULL};
+
+    if (PyObject_GetBuffer(arg, &b, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _io_BytesBuilder_write_impl((bytesbuilder *)self, &b);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    /* Cleanup for b */
+    if (b.obj) {
+       PyBuffer_Release(&b);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_io_BytesBuilder_build__doc__,
+"build($self, /)\n"
+"--\n"
+"\n"
+"Return the built bytes object and empty the builder.");
+
+#define _IO_BYTESBUILDER_BUILD_METHODDEF    \
+    {"build", (PyCFunction)_io_BytesBuilder_build, METH_NOARGS, _io_BytesBuilder_build__doc__},
+
+static PyObject *
+_io_BytesBuilder_build_impl(bytesbuilder *self);
+
+static PyObject *
+_io_BytesBuilder_build(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _io_BytesBuilder_build_impl((bytesbuilder *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+/*[clinic end generated code: output=e9fa2357f5147d9a input=a9049054013a1b77]*/
@@ -1170,26 +1170,59 @@ exit:
 }
 
 PyDoc_STRVAR(pysqlite_connection_executemany__doc__,
-"executemany($self, sql, parameters, /)\n"
+"executemany($self, sql, parameters=None, /, *, columns=None)\n"
 "--\n"
 "\n"
 "Repeatedly executes an SQL statement.");
 
 #define PYSQLITE_CONNECTION_EXECUTEMANY_METHODDEF    \
-    {"executemany", _PyCFunction_CAST(pysqlite_connection_executemany), METH_FASTCALL, pysqlite_connection_executemany__doc__},
+    {"executemany", _PyCFunction_CAST(pysqlite_connection_executemany), METH_FASTCALL|METH_KEYWORDS, pysqlite_connection_executemany__doc__},
 
 static PyObject *
 pysqlite_connection_executemany_impl(pysqlite_Connection *self,
-                                     PyObject *sql, PyObject *parameters);
+                                     PyObject *sql, PyObject *parameters,
+                                     PyObject *columns);
 
 static PyObject *
-pysqlite_connection_executemany(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+pysqlite_connection_executemany(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(columns), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"", "", "columns", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "executemany",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     PyObject *sql;
-    PyObject *parameters;
+    PyObject *parameters = Py_None;
+    PyObject *columns = Py_None;
 
-    if (!_PyArg_CheckPositional("executemany", nargs, 2, 2)) {
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 2, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
         goto exit;
     }
     if (!PyUnicode_Check(args[0])) {
@@ -1197,8 +1230,18 @@ pysqlite_connection_executemany(PyObject *self, PyObject *const *args, Py_ssize_
         goto exit;
     }
     sql = args[0];
+    if (nargs < 2) {
+        goto skip_optional_posonly;
+    }
+    noptargs--;
     parameters = args[1];
-    return_value = pysqlite_connection_executemany_impl((pysqlite_Connection *)self, sql, parameters);
+skip_optional_posonly:
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    columns = args[2];
+skip_optional_kwonly:
+    return_value = pysqlite_connection_executemany_impl((pysqlite_Connection *)self, sql, parameters, columns);
 
 exit:
     return return_value;
@@ -1823,6 +1866,28 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(statement_cache_info__doc__,
+"statement_cache_info($self, /)\n"
+"--\n"
+"\n"
+"Report the statistics of the prepared statement cache.\n"
+"\n"
+"Return a named tuple with the number of hits, misses and evictions of the\n"
+"cache, its maximum size (the cached_statements argument of connect()) and\n"
+"the number of statements currently in it.");
+
+#define STATEMENT_CACHE_INFO_METHODDEF    \
+    {"statement_cache_info", (PyCFunction)statement_cache_info, METH_NOARGS, statement_cache_info__doc__},
+
+static PyObject *
+statement_cache_info_impl(pysqlite_Connection *self);
+
+static PyObject *
+statement_cache_info(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return statement_cache_info_impl((pysqlite_Connection *)self);
+}
+
 PyDoc_STRVAR(setconfig__doc__,
 "setconfig($self, op, enable=True, /)\n"
 "--\n"
@@ -1921,4 +1986,4 @@ exit:
 #ifndef DESERIALIZE_METHODDEF
     #define DESERIALIZE_METHODDEF
 #endif /* !defined(DESERIALIZE_METHODDEF) */
-/*[clinic end generated code: output=2f325c2444b4bb47 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=9735d337a97dcc82 input=a9049054013a1b77]*/
@@ -78,26 +78,63 @@ exit:
 }
 
 PyDoc_STRVAR(pysqlite_cursor_executemany__doc__,
-"executemany($self, sql, seq_of_parameters, /)\n"
+"executemany($self, sql, seq_of_parameters=None, /, *, columns=None)\n"
 "--\n"
 "\n"
-"Repeatedly executes an SQL statement.");
+"Repeatedly executes an SQL statement.\n"
+"\n"
+"The parameters are either given by rows as seq_of_parameters, or by\n"
+"columns as a sequence of columns, which are sequences or buffers of\n"
+"numbers.");
 
 #define PYSQLITE_CURSOR_EXECUTEMANY_METHODDEF    \
-    {"executemany", _PyCFunction_CAST(pysqlite_cursor_executemany), METH_FASTCALL, pysqlite_cursor_executemany__doc__},
+    {"executemany", _PyCFunction_CAST(pysqlite_cursor_executemany), METH_FASTCALL|METH_KEYWORDS, pysqlite_cursor_executemany__doc__},
 
 static PyObject *
 pysqlite_cursor_executemany_impl(pysqlite_Cursor *self, PyObject *sql,
-                                 PyObject *seq_of_parameters);
+                                 PyObject *seq_of_parameters,
+                                 PyObject *columns);
 
 static PyObject *
-pysqlite_cursor_executemany(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+pysqlite_cursor_executemany(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(columns), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"", "", "columns", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "executemany",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     PyObject *sql;
-    PyObject *seq_of_parameters;
+    PyObject *seq_of_parameters = Py_None;
+    PyObject *columns = Py_None;
 
-    if (!_PyArg_CheckPositional("executemany", nargs, 2, 2)) {
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 2, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
         goto exit;
     }
     if (!PyUnicode_Check(args[0])) {
@@ -105,8 +142,18 @@ pysqlite_cursor_executemany(PyObject *self, PyObject *const *args, Py_ssize_t na
         goto exit;
     }
     sql = args[0];
+    if (nargs < 2) {
+        goto skip_optional_posonly;
+    }
+    noptargs--;
     seq_of_parameters = args[1];
-    return_value = pysqlite_cursor_executemany_impl((pysqlite_Cursor *)self, sql, seq_of_parameters);
+skip_optional_posonly:
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    columns = args[2];
+skip_optional_kwonly:
+    return_value = pysqlite_cursor_executemany_impl((pysqlite_Cursor *)self, sql, seq_of_parameters, columns);
 
 exit:
     return return_value;
@@ -329,4 +376,4 @@ pysqlite_cursor_close(PyObject *self, PyObject *Py_UNUSED(ignored))
 {
     return pysqlite_cursor_close_impl((pysqlite_Cursor *)self);
 }
-/*[clinic end generated code: output=d05c7cbbc8bcab26 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=d74e4c6c3859fb95 input=a9049054013a1b77]*/
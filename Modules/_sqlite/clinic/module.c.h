@@ -7,6 +7,7 @@ preserve
 #  include "pycore_runtime.h"     // _Py_ID()
 #endif
 #include "pycore_modsupport.h"    // _PyArg_UnpackKeywords()
+#include "pycore_tuple.h"         // _PyTuple_FromArray()
 
 PyDoc_STRVAR(pysqlite_complete_statement__doc__,
 "complete_statement($module, /, statement)\n"
@@ -211,4 +212,50 @@ skip_optional:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=17c4e031680a5168 input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(pysqlite_class_row__doc__,
+"class_row($module, cls, /)\n"
+"--\n"
+"\n"
+"Return a row factory which creates the rows by calling cls.\n"
+"\n"
+"The values of the columns are passed as keyword arguments named after the\n"
+"columns.");
+
+#define PYSQLITE_CLASS_ROW_METHODDEF    \
+    {"class_row", (PyCFunction)pysqlite_class_row, METH_O, pysqlite_class_row__doc__},
+
+PyDoc_STRVAR(pysqlite_typed_row__doc__,
+"typed_row($module, /, *types)\n"
+"--\n"
+"\n"
+"Return a row factory which converts the columns to the given types.\n"
+"\n"
+"Each value, unless it is None or already of the given type, is converted\n"
+"by calling the type of its column.  A None type leaves the column as is.");
+
+#define PYSQLITE_TYPED_ROW_METHODDEF    \
+    {"typed_row", _PyCFunction_CAST(pysqlite_typed_row), METH_FASTCALL, pysqlite_typed_row__doc__},
+
+static PyObject *
+pysqlite_typed_row_impl(PyObject *module, PyObject *types);
+
+static PyObject *
+pysqlite_typed_row(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *types = NULL;
+
+    types = _PyTuple_FromArray(args, nargs);
+    if (types == NULL) {
+        goto exit;
+    }
+    return_value = pysqlite_typed_row_impl(module, types);
+
+exit:
+    /* Cleanup for types */
+    Py_XDECREF(types);
+
+    return return_value;
+}
+/*[clinic end generated code: output=68fff17b9d1e078f input=a9049054013a1b77]*/
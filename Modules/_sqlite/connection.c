@@ -149,26 +149,52 @@ static void free_callback_context(callback_context *ctx);
 static void set_callback_context(callback_context **ctx_pp,
                                  callback_context *ctx);
 static int connection_close(pysqlite_Connection *self);
-PyObject *_pysqlite_query_execute(pysqlite_Cursor *, int, PyObject *, PyObject *);
+PyObject *_pysqlite_query_execute(pysqlite_Cursor *, int, PyObject *, PyObject *,
+                                  PyObject *);
+PyObject *_pysqlite_cursor_executemany(pysqlite_Cursor *, PyObject *,
+                                       PyObject *, PyObject *);
+
+static PyObject *
+statement_cache_evicted(PyObject *op, PyObject *Py_UNUSED(statement))
+{
+    pysqlite_Connection *self = _pysqlite_Connection_CAST(op);
+    // Connections used with check_same_thread=False may evict statements
+    // from several threads.
+    Py_BEGIN_CRITICAL_SECTION(self);
+    self->statement_cache_evictions++;
+    Py_END_CRITICAL_SECTION();
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef statement_cache_evicted_def = {
+    "statement_cache_evicted", statement_cache_evicted, METH_O,
+};
 
 static PyObject *
 new_statement_cache(pysqlite_Connection *self, pysqlite_state *state,
                     int maxsize)
 {
-    PyObject *args[] = { NULL, PyLong_FromLong(maxsize), };
-    if (args[1] == NULL) {
-        return NULL;
-    }
-    PyObject *lru_cache = state->lru_cache;
+    // lru_cache(maxsize, on_evict=statement_cache_evicted)
+    PyObject *args[] = {
+        NULL,
+        PyLong_FromLong(maxsize),
+        PyCFunction_New(&statement_cache_evicted_def, (PyObject *)self),
+    };
+    PyObject *kwnames = Py_BuildValue("(s)", "on_evict");
+    PyObject *inner = NULL;
     size_t nargsf = 1 | PY_VECTORCALL_ARGUMENTS_OFFSET;
-    PyObject *inner = PyObject_Vectorcall(lru_cache, args + 1, nargsf, NULL);
-    Py_DECREF(args[1]);
+    if (args[1] != NULL && args[2] != NULL && kwnames != NULL) {
+        inner = PyObject_Vectorcall(state->lru_cache, args + 1, nargsf,
+                                    kwnames);
+    }
+    Py_XDECREF(args[1]);
+    Py_XDECREF(args[2]);
+    Py_XDECREF(kwnames);
     if (inner == NULL) {
         return NULL;
     }
 
     args[1] = (PyObject *)self;  // Borrowed ref.
-    nargsf = 1 | PY_VECTORCALL_ARGUMENTS_OFFSET;
     PyObject *res = PyObject_Vectorcall(inner, args + 1, nargsf, NULL);
     Py_DECREF(inner);
     return res;
@@ -280,6 +306,7 @@ pysqlite_connection_init_impl(pysqlite_Connection *self, PyObject *database,
     }
 
     // Create LRU statement cache; returns a new reference.
+    self->statement_cache_evictions = 0;
     PyObject *statement_cache = new_statement_cache(self, state, cache_size);
     if (statement_cache == NULL) {
         goto error;
@@ -1855,7 +1882,8 @@ pysqlite_connection_execute_impl(pysqlite_Connection *self, PyObject *sql,
         goto error;
     }
 
-    result = _pysqlite_query_execute((pysqlite_Cursor *)cursor, 0, sql, parameters);
+    result = _pysqlite_query_execute((pysqlite_Cursor *)cursor, 0, sql, parameters,
+                                     NULL);
     if (!result) {
         Py_CLEAR(cursor);
     }
@@ -1870,16 +1898,19 @@ pysqlite_connection_execute_impl(pysqlite_Connection *self, PyObject *sql,
 _sqlite3.Connection.executemany as pysqlite_connection_executemany
 
     sql: unicode
-    parameters: object
+    parameters: object = None
     /
+    *
+    columns: object = None
 
 Repeatedly executes an SQL statement.
 [clinic start generated code]*/
 
 static PyObject *
 pysqlite_connection_executemany_impl(pysqlite_Connection *self,
-                                     PyObject *sql, PyObject *parameters)
-/*[clinic end generated code: output=776cd2fd20bfe71f input=495be76551d525db]*/
+                                     PyObject *sql, PyObject *parameters,
+                                     PyObject *columns)
+/*[clinic end generated code: output=d8f1551fd2d18a93 input=d5048553fd7d41fb]*/
 {
     PyObject* result = 0;
 
@@ -1888,7 +1919,8 @@ pysqlite_connection_executemany_impl(pysqlite_Connection *self,
         goto error;
     }
 
-    result = _pysqlite_query_execute((pysqlite_Cursor *)cursor, 1, sql, parameters);
+    result = _pysqlite_cursor_executemany((pysqlite_Cursor *)cursor, sql,
+                                          parameters, columns);
     if (!result) {
         Py_CLEAR(cursor);
     }
@@ -2453,6 +2485,60 @@ getlimit_impl(pysqlite_Connection *self, int category)
     return setlimit_impl(self, category, -1);
 }
 
+/*[clinic input]
+_sqlite3.Connection.statement_cache_info as statement_cache_info
+
+Report the statistics of the prepared statement cache.
+
+Return a named tuple with the number of hits, misses and evictions of the
+cache, its maximum size (the cached_statements argument of connect()) and
+the number of statements currently in it.
+[clinic start generated code]*/
+
+static PyObject *
+statement_cache_info_impl(pysqlite_Connection *self)
+/*[clinic end generated code: output=9b00ef0c11652caf input=33ba768901c6c989]*/
+{
+    if (!pysqlite_check_thread(self) || !pysqlite_check_connection(self)) {
+        return NULL;
+    }
+
+    // CacheInfo(hits, misses, maxsize, currsize) of the lru_cache
+    PyObject *cache_info = PyObject_CallMethod(self->statement_cache,
+                                               "cache_info", NULL);
+    if (cache_info == NULL) {
+        return NULL;
+    }
+    if (!PyTuple_Check(cache_info) || PyTuple_GET_SIZE(cache_info) != 4) {
+        PyErr_SetString(PyExc_SystemError, "unexpected cache_info() result");
+        Py_DECREF(cache_info);
+        return NULL;
+    }
+    PyObject *evictions;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    evictions = PyLong_FromSsize_t(self->statement_cache_evictions);
+    Py_END_CRITICAL_SECTION();
+    if (evictions == NULL) {
+        Py_DECREF(cache_info);
+        return NULL;
+    }
+
+    pysqlite_state *state = self->state;
+    PyObject *info = PyStructSequence_New(state->StatementCacheInfoType);
+    if (info == NULL) {
+        Py_DECREF(cache_info);
+        Py_DECREF(evictions);
+        return NULL;
+    }
+    PyStructSequence_SetItem(info, 0, Py_NewRef(PyTuple_GET_ITEM(cache_info, 0)));
+    PyStructSequence_SetItem(info, 1, Py_NewRef(PyTuple_GET_ITEM(cache_info, 1)));
+    PyStructSequence_SetItem(info, 2, evictions);
+    PyStructSequence_SetItem(info, 3, Py_NewRef(PyTuple_GET_ITEM(cache_info, 2)));
+    PyStructSequence_SetItem(info, 4, Py_NewRef(PyTuple_GET_ITEM(cache_info, 3)));
+    Py_DECREF(cache_info);
+    return info;
+}
+
 static inline bool
 is_int_config(const int op)
 {
@@ -2655,6 +2741,7 @@ static PyMethodDef connection_methods[] = {
     BLOBOPEN_METHODDEF
     SETCONFIG_METHODDEF
     GETCONFIG_METHODDEF
+    STATEMENT_CACHE_INFO_METHODDEF
     {NULL, NULL}
 };
 
@@ -2697,6 +2784,22 @@ static PyType_Spec connection_spec = {
     .slots = connection_slots,
 };
 
+static PyStructSequence_Field statement_cache_info_fields[] = {
+    {"hits", "number of statements found in the cache"},
+    {"misses", "number of statements not found in the cache"},
+    {"evictions", "number of statements removed from the cache"},
+    {"maxsize", "maximum number of statements in the cache"},
+    {"currsize", "number of statements in the cache"},
+    {NULL}
+};
+
+static PyStructSequence_Desc statement_cache_info_desc = {
+    .name = MODULE_NAME ".StatementCacheInfo",
+    .doc = "Statistics of the prepared statement cache of a connection.",
+    .fields = statement_cache_info_fields,
+    .n_in_sequence = 5,
+};
+
 int
 pysqlite_connection_setup_types(PyObject *module)
 {
@@ -2706,5 +2809,11 @@ pysqlite_connection_setup_types(PyObject *module)
     }
     pysqlite_state *state = pysqlite_get_state(module);
     state->ConnectionType = (PyTypeObject *)type;
+
+    type = (PyObject *)PyStructSequence_NewType(&statement_cache_info_desc);
+    if (type == NULL) {
+        return -1;
+    }
+    state->StatementCacheInfoType = (PyTypeObject *)type;
     return 0;
 }
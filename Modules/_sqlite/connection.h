@@ -69,6 +69,10 @@ typedef struct
 
     PyObject *statement_cache;
 
+    /* Number of statements evicted from the statement cache, counted by
+     * its on_evict callback.  The other statistics come from the cache. */
+    Py_ssize_t statement_cache_evictions;
+
     /* Lists of weak references to cursors and blobs used within this connection */
     PyObject *cursors;
     PyObject *blobs;
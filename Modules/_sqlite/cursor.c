@@ -637,15 +637,62 @@ need_adapt(pysqlite_state *state, PyObject *obj)
     }
 }
 
+/* Adapt and bind a parameter; steals the reference to parameter. */
+static int
+bind_adapted_param(pysqlite_state *state, pysqlite_Statement *self, int pos,
+                   PyObject *parameter)
+{
+    PyObject *adapted;
+    if (!need_adapt(state, parameter)) {
+        adapted = parameter;
+    } else {
+        PyObject *protocol = (PyObject *)state->PrepareProtocolType;
+        adapted = pysqlite_microprotocols_adapt(state, parameter, protocol,
+                                                parameter);
+        Py_DECREF(parameter);
+        if (!adapted) {
+            return -1;
+        }
+    }
+
+    int rc = bind_param(state, self, pos, adapted);
+    Py_DECREF(adapted);
+
+    if (rc != SQLITE_OK) {
+        PyObject *exc = PyErr_GetRaisedException();
+        sqlite3 *db = sqlite3_db_handle(self->st);
+        set_error_from_db(state, db);
+        _PyErr_ChainExceptions1(exc);
+        return -1;
+    }
+    return 0;
+}
+
+static int
+check_nameless_parameters(pysqlite_state *state, pysqlite_Statement *self,
+                          int num_params)
+{
+    for (int i = 0; i < num_params; i++) {
+        const char *name = sqlite3_bind_parameter_name(self->st, i+1);
+        if (name != NULL && name[0] != '?') {
+            PyErr_Format(state->ProgrammingError,
+                    "Binding %d ('%s') is a named parameter, but you "
+                    "supplied a sequence which requires nameless (qmark) "
+                    "placeholders.",
+                    i+1, name);
+            return -1;
+        }
+    }
+    return 0;
+}
+
 static void
 bind_parameters(pysqlite_state *state, pysqlite_Statement *self,
                 PyObject *parameters)
 {
     PyObject* current_param;
-    PyObject* adapted;
     const char* binding_name;
     int i;
-    int rc;
     int num_params_needed;
     Py_ssize_t num_params;
 
@@ -672,17 +719,10 @@ bind_parameters(pysqlite_state *state, pysqlite_Statement *self,
                          num_params_needed, num_params);
             return;
         }
+        if (check_nameless_parameters(state, self, (int)num_params) < 0) {
+            return;
+        }
         for (i = 0; i < num_params; i++) {
-            const char *name = sqlite3_bind_parameter_name(self->st, i+1);
-            if (name != NULL && name[0] != '?') {
-                PyErr_Format(state->ProgrammingError,
-                        "Binding %d ('%s') is a named parameter, but you "
-                        "supplied a sequence which requires nameless (qmark) "
-                        "placeholders.",
-                        i+1, name);
-                return;
-            }
-
             if (PyTuple_CheckExact(parameters)) {
                 PyObject *item = PyTuple_GET_ITEM(parameters, i);
                 current_param = Py_NewRef(item);
@@ -695,28 +735,7 @@ bind_parameters(pysqlite_state *state, pysqlite_Statement *self,
             if (!current_param) {
                 return;
             }
-
-            if (!need_adapt(state, current_param)) {
-                adapted = current_param;
-            } else {
-                PyObject *protocol = (PyObject *)state->PrepareProtocolType;
-                adapted = pysqlite_microprotocols_adapt(state, current_param,
-                                                        protocol,
-                                                        current_param);
-                Py_DECREF(current_param);
-                if (!adapted) {
-                    return;
-                }
-            }
-
-            rc = bind_param(state, self, i + 1, adapted);
-            Py_DECREF(adapted);
-
-            if (rc != SQLITE_OK) {
-                PyObject *exc = PyErr_GetRaisedException();
-                sqlite3 *db = sqlite3_db_handle(self->st);
-                set_error_from_db(state, db);
-                _PyErr_ChainExceptions1(exc);
+            if (bind_adapted_param(state, self, i + 1, current_param) < 0) {
                 return;
             }
         }
@@ -744,47 +763,302 @@ bind_parameters(pysqlite_state *state, pysqlite_Statement *self,
                 }
                 return;
             }
+            if (bind_adapted_param(state, self, i, current_param) < 0) {
+                return;
+            }
+        }
+    } else {
+        PyErr_SetString(state->ProgrammingError,
+                        "parameters are of unsupported type");
+    }
+}
 
-            if (!need_adapt(state, current_param)) {
-                adapted = current_param;
+/* Step a statement whose parameters are bound, and update the cursor.
+ * Return -1 with an exception set on error. */
+static int
+step_bound_statement(pysqlite_Cursor *self, pysqlite_state *state)
+{
+    int rc = stmt_step(self->statement->st);
+    if (rc != SQLITE_DONE && rc != SQLITE_ROW) {
+        if (PyErr_Occurred()) {
+            /* there was an error that occurred in a user-defined callback */
+            if (state->enable_callback_tracebacks) {
+                PyErr_Print();
             } else {
-                PyObject *protocol = (PyObject *)state->PrepareProtocolType;
-                adapted = pysqlite_microprotocols_adapt(state, current_param,
-                                                        protocol,
-                                                        current_param);
-                Py_DECREF(current_param);
-                if (!adapted) {
-                    return;
-                }
+                PyErr_Clear();
             }
+        }
+        set_error_from_db(state, self->connection->db);
+        return -1;
+    }
 
-            rc = bind_param(state, self, i, adapted);
-            Py_DECREF(adapted);
+    if (pysqlite_build_row_cast_map(self) != 0) {
+        _PyErr_FormatFromCause(state->OperationalError,
+                               "Error while building row_cast_map");
+        return -1;
+    }
 
-            if (rc != SQLITE_OK) {
-                PyObject *exc = PyErr_GetRaisedException();
-                sqlite3 *db = sqlite3_db_handle(self->st);
-                set_error_from_db(state, db);
-                _PyErr_ChainExceptions1(exc);
-                return;
-           }
+    assert(rc == SQLITE_ROW || rc == SQLITE_DONE);
+    int numcols;
+    Py_BEGIN_ALLOW_THREADS
+    numcols = sqlite3_column_count(self->statement->st);
+    Py_END_ALLOW_THREADS
+    if (self->description == Py_None && numcols > 0) {
+        Py_SETREF(self->description, PyTuple_New(numcols));
+        if (!self->description) {
+            return -1;
+        }
+        for (int i = 0; i < numcols; i++) {
+            const char *colname;
+            colname = sqlite3_column_name(self->statement->st, i);
+            if (colname == NULL) {
+                PyErr_NoMemory();
+                return -1;
+            }
+            PyObject *column_name = _pysqlite_build_column_name(self, colname);
+            if (column_name == NULL) {
+                return -1;
+            }
+            PyObject *descriptor = PyTuple_Pack(7, column_name,
+                                                Py_None, Py_None, Py_None,
+                                                Py_None, Py_None, Py_None);
+            Py_DECREF(column_name);
+            if (descriptor == NULL) {
+                return -1;
+            }
+            PyTuple_SET_ITEM(self->description, i, descriptor);
         }
-    } else {
-        PyErr_SetString(state->ProgrammingError,
-                        "parameters are of unsupported type");
     }
+
+    if (rc == SQLITE_DONE) {
+        if (self->statement->is_dml) {
+            self->rowcount += (long)sqlite3_changes(self->connection->db);
+        }
+        stmt_reset(self->statement);
+    }
+    return 0;
+}
+
+/* A column of parameters passed to executemany(columns=...): either a
+ * list or a tuple of objects, or a one-dimensional buffer of numbers which
+ * are bound without creating Python objects. */
+typedef struct {
+    PyObject *values;
+    Py_buffer view;
+    char format;
+} param_column;
+
+static int
+bind_buffer_item(pysqlite_Statement *self, int pos, param_column *column,
+                 Py_ssize_t index)
+{
+    const char *p = (const char *)column->view.buf
+                    + index * column->view.strides[0];
+    int rc;
+
+#define BIND_SIGNED(FORMAT, TYPE)                                 \
+    case FORMAT: {                                                \
+        TYPE value;                                               \
+        memcpy(&value, p, sizeof(value));                         \
+        rc = sqlite3_bind_int64(self->st, pos, (sqlite_int64)value); \
+        break;                                                    \
+    }
+#define BIND_UNSIGNED(FORMAT, TYPE)                               \
+    case FORMAT: {                                                \
+        TYPE value;                                               \
+        memcpy(&value, p, sizeof(value));                         \
+        if ((unsigned long long)value > (unsigned long long)INT64_MAX) { \
+            PyErr_SetString(PyExc_OverflowError,                  \
+                "Python int too large to convert to SQLite INTEGER"); \
+            return -1;                                            \
+        }                                                         \
+        rc = sqlite3_bind_int64(self->st, pos, (sqlite_int64)value); \
+        break;                                                    \
+    }
+#define BIND_DOUBLE(FORMAT, TYPE)                                 \
+    case FORMAT: {                                                \
+        TYPE value;                                               \
+        memcpy(&value, p, sizeof(value));                         \
+        rc = sqlite3_bind_double(self->st, pos, (double)value);   \
+        break;                                                    \
+    }
+
+    switch (column->format) {
+        BIND_SIGNED('?', _Bool)
+        BIND_SIGNED('b', signed char)
+        BIND_SIGNED('B', unsigned char)
+        BIND_SIGNED('h', short)
+        BIND_SIGNED('H', unsigned short)
+        BIND_SIGNED('i', int)
+        BIND_SIGNED('I', unsigned int)
+        BIND_SIGNED('l', long)
+        BIND_SIGNED('q', long long)
+        BIND_SIGNED('n', Py_ssize_t)
+        BIND_UNSIGNED('L', unsigned long)
+        BIND_UNSIGNED('Q', unsigned long long)
+        BIND_UNSIGNED('N', size_t)
+        BIND_DOUBLE('f', float)
+        BIND_DOUBLE('d', double)
+        default:
+            Py_UNREACHABLE();
+    }
+#undef BIND_SIGNED
+#undef BIND_UNSIGNED
+#undef BIND_DOUBLE
+
+    return rc;
+}
+
+static int
+init_param_column(param_column *column, PyObject *obj, Py_ssize_t *len)
+{
+    if (PyUnicode_Check(obj) || PyBytes_Check(obj) || PyByteArray_Check(obj)) {
+        PyErr_Format(PyExc_TypeError,
+                     "columns must be sequences or buffers of numbers, "
+                     "not %T", obj);
+        return -1;
+    }
+    if (!PyList_Check(obj) && !PyTuple_Check(obj)
+        && PyObject_CheckBuffer(obj))
+    {
+        if (PyObject_GetBuffer(obj, &column->view, PyBUF_RECORDS_RO) < 0) {
+            return -1;
+        }
+        const char *format = column->view.format;
+        if (format[0] == '@') {
+            format++;
+        }
+        if (column->view.ndim != 1 || format[0] == '\0' || format[1] != '\0'
+            || strchr("?bBhHiIlLqQnNfd", format[0]) == NULL)
+        {
+            PyErr_Format(PyExc_TypeError,
+                         "unsupported buffer format '%s' for a column",
+                         column->view.format);
+            PyBuffer_Release(&column->view);
+            return -1;
+        }
+        column->format = format[0];
+        *len = column->view.shape[0];
+        return 0;
+    }
+    column->values = PySequence_Fast(obj, "columns must be sequences or "
+                                          "buffers of numbers");
+    if (column->values == NULL) {
+        return -1;
+    }
+    *len = PySequence_Fast_GET_SIZE(column->values);
+    return 0;
+}
+
+static int
+execute_columns(pysqlite_Cursor *self, pysqlite_state *state,
+                PyObject *columns)
+{
+    pysqlite_Statement *stmt = self->statement;
+    PyObject *seq = PySequence_Fast(columns, "columns must be a sequence");
+    if (seq == NULL) {
+        return -1;
+    }
+    int res = -1;
+    Py_ssize_t ncols = PySequence_Fast_GET_SIZE(seq);
+    Py_ssize_t nrows = 0;
+    param_column *cols = PyMem_Calloc(ncols ? ncols : 1, sizeof(*cols));
+    if (cols == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    int num_params_needed;
+    Py_BEGIN_ALLOW_THREADS
+    num_params_needed = sqlite3_bind_parameter_count(stmt->st);
+    Py_END_ALLOW_THREADS
+    if (ncols != num_params_needed) {
+        PyErr_Format(state->ProgrammingError,
+                     "Incorrect number of bindings supplied. The current "
+                     "statement uses %d, and there are %zd supplied.",
+                     num_params_needed, ncols);
+        goto done;
+    }
+    if (check_nameless_parameters(state, stmt, num_params_needed) < 0) {
+        goto done;
+    }
+
+    for (Py_ssize_t i = 0; i < ncols; i++) {
+        Py_ssize_t len;
+        if (init_param_column(&cols[i], PySequence_Fast_GET_ITEM(seq, i),
+                              &len) < 0)
+        {
+            goto done;
+        }
+        if (i == 0) {
+            nrows = len;
+        }
+        else if (len != nrows) {
+            PyErr_Format(state->ProgrammingError,
+                         "columns have different lengths: %zd and %zd",
+                         nrows, len);
+            goto done;
+        }
+    }
+
+    for (Py_ssize_t row = 0; row < nrows; row++) {
+        for (int col = 0; col < ncols; col++) {
+            param_column *column = &cols[col];
+            if (column->values == NULL) {
+                int rc = bind_buffer_item(stmt, col + 1, column, row);
+                if (rc != SQLITE_OK) {
+                    if (rc != -1) {
+                        set_error_from_db(state, self->connection->db);
+                    }
+                    goto done;
+                }
+                continue;
+            }
+            PyObject *value;
+            if (PyList_Check(column->values)) {
+                value = PyList_GetItemRef(column->values, row);
+                if (value == NULL) {
+                    PyErr_SetString(state->ProgrammingError,
+                                    "column changed size during iteration");
+                    goto done;
+                }
+            }
+            else {
+                value = Py_NewRef(PyTuple_GET_ITEM(column->values, row));
+            }
+            if (bind_adapted_param(state, stmt, col + 1, value) < 0) {
+                goto done;
+            }
+        }
+        if (step_bound_statement(self, state) < 0) {
+            goto done;
+        }
+    }
+    res = 0;
+
+done:
+    if (cols != NULL) {
+        for (Py_ssize_t j = 0; j < ncols; j++) {
+            if (cols[j].values != NULL) {
+                Py_DECREF(cols[j].values);
+            }
+            else if (cols[j].view.obj != NULL) {
+                PyBuffer_Release(&cols[j].view);
+            }
+        }
+        PyMem_Free(cols);
+    }
+    Py_DECREF(seq);
+    return res;
 }
 
 PyObject *
-_pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject* operation, PyObject* second_argument)
+_pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject* operation,
+                        PyObject* second_argument, PyObject *columns)
 {
     PyObject* parameters_list = NULL;
     PyObject* parameters_iter = NULL;
     PyObject* parameters = NULL;
-    int i;
-    int rc;
-    int numcols;
-    PyObject* column_name;
 
     if (!check_cursor(self)) {
         goto error;
@@ -792,7 +1066,10 @@ _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject* operation
 
     self->locked = 1;
 
-    if (multiple) {
+    if (columns != NULL) {
+        assert(multiple && second_argument == NULL);
+    }
+    else if (multiple) {
         if (PyIter_Check(second_argument)) {
             /* iterator */
             parameters_iter = Py_NewRef(second_argument);
@@ -875,75 +1152,28 @@ _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject* operation
     }
 
     assert(!sqlite3_stmt_busy(self->statement->st));
-    while (1) {
-        parameters = PyIter_Next(parameters_iter);
-        if (!parameters) {
-            break;
-        }
-
-        bind_parameters(state, self->statement, parameters);
-        if (PyErr_Occurred()) {
+    if (columns != NULL) {
+        if (execute_columns(self, state, columns) < 0) {
             goto error;
         }
-
-        rc = stmt_step(self->statement->st);
-        if (rc != SQLITE_DONE && rc != SQLITE_ROW) {
-            if (PyErr_Occurred()) {
-                /* there was an error that occurred in a user-defined callback */
-                if (state->enable_callback_tracebacks) {
-                    PyErr_Print();
-                } else {
-                    PyErr_Clear();
-                }
+    }
+    else {
+        while (1) {
+            parameters = PyIter_Next(parameters_iter);
+            if (!parameters) {
+                break;
             }
-            set_error_from_db(state, self->connection->db);
-            goto error;
-        }
 
-        if (pysqlite_build_row_cast_map(self) != 0) {
-            _PyErr_FormatFromCause(state->OperationalError,
-                                   "Error while building row_cast_map");
-            goto error;
-        }
-
-        assert(rc == SQLITE_ROW || rc == SQLITE_DONE);
-        Py_BEGIN_ALLOW_THREADS
-        numcols = sqlite3_column_count(self->statement->st);
-        Py_END_ALLOW_THREADS
-        if (self->description == Py_None && numcols > 0) {
-            Py_SETREF(self->description, PyTuple_New(numcols));
-            if (!self->description) {
+            bind_parameters(state, self->statement, parameters);
+            if (PyErr_Occurred()) {
                 goto error;
             }
-            for (i = 0; i < numcols; i++) {
-                const char *colname;
-                colname = sqlite3_column_name(self->statement->st, i);
-                if (colname == NULL) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
-                column_name = _pysqlite_build_column_name(self, colname);
-                if (column_name == NULL) {
-                    goto error;
-                }
-                PyObject *descriptor = PyTuple_Pack(7, column_name,
-                                                    Py_None, Py_None, Py_None,
-                                                    Py_None, Py_None, Py_None);
-                Py_DECREF(column_name);
-                if (descriptor == NULL) {
-                    goto error;
-                }
-                PyTuple_SET_ITEM(self->description, i, descriptor);
-            }
-        }
 
-        if (rc == SQLITE_DONE) {
-            if (self->statement->is_dml) {
-                self->rowcount += (long)sqlite3_changes(self->connection->db);
+            if (step_bound_statement(self, state) < 0) {
+                goto error;
             }
-            stmt_reset(self->statement);
+            Py_CLEAR(parameters);
         }
-        Py_XDECREF(parameters);
     }
 
     if (!multiple) {
@@ -993,25 +1223,53 @@ pysqlite_cursor_execute_impl(pysqlite_Cursor *self, PyObject *sql,
                              PyObject *parameters)
 /*[clinic end generated code: output=d81b4655c7c0bbad input=a8e0200a11627f94]*/
 {
-    return _pysqlite_query_execute(self, 0, sql, parameters);
+    return _pysqlite_query_execute(self, 0, sql, parameters, NULL);
+}
+
+PyObject *
+_pysqlite_cursor_executemany(pysqlite_Cursor *self, PyObject *sql,
+                             PyObject *seq_of_parameters, PyObject *columns)
+{
+    if (columns == Py_None) {
+        if (seq_of_parameters == Py_None) {
+            PyErr_SetString(PyExc_TypeError,
+                            "executemany() requires parameters or columns");
+            return NULL;
+        }
+        return _pysqlite_query_execute(self, 1, sql, seq_of_parameters, NULL);
+    }
+    if (seq_of_parameters != Py_None) {
+        PyErr_SetString(PyExc_TypeError,
+                        "executemany() takes parameters or columns, not both");
+        return NULL;
+    }
+    return _pysqlite_query_execute(self, 1, sql, NULL, columns);
 }
 
 /*[clinic input]
 _sqlite3.Cursor.executemany as pysqlite_cursor_executemany
 
     sql: unicode
-    seq_of_parameters: object
+    seq_of_parameters: object = None
     /
+    *
+    columns: object = None
 
 Repeatedly executes an SQL statement.
+
+The parameters are either given by rows as seq_of_parameters, or by
+columns as a sequence of columns, which are sequences or buffers of
+numbers.
 [clinic start generated code]*/
 
 static PyObject *
 pysqlite_cursor_executemany_impl(pysqlite_Cursor *self, PyObject *sql,
-                                 PyObject *seq_of_parameters)
-/*[clinic end generated code: output=2c65a3c4733fb5d8 input=0d0a52e5eb7ccd35]*/
+                                 PyObject *seq_of_parameters,
+                                 PyObject *columns)
+/*[clinic end generated code: output=7149e482c53fb330 input=0aa3f614e37bcdb5]*/
 {
-    return _pysqlite_query_execute(self, 1, sql, seq_of_parameters);
+    return _pysqlite_cursor_executemany(self, sql, seq_of_parameters,
+                                        columns);
 }
 
 /*[clinic input]
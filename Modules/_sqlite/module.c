@@ -217,6 +217,57 @@ pysqlite_adapt_impl(PyObject *module, PyObject *obj, PyObject *proto,
     return pysqlite_microprotocols_adapt(state, obj, proto, alt);
 }
 
+/*[clinic input]
+_sqlite3.class_row as pysqlite_class_row
+
+    cls: object
+    /
+
+Return a row factory which creates the rows by calling cls.
+
+The values of the columns are passed as keyword arguments named after the
+columns.
+[clinic start generated code]*/
+
+static PyObject *
+pysqlite_class_row(PyObject *module, PyObject *cls)
+/*[clinic end generated code: output=0e3267a2b55e6b33 input=d3045d753aeedab8]*/
+{
+    if (!PyCallable_Check(cls)) {
+        PyErr_Format(PyExc_TypeError, "expected a callable, got %T", cls);
+        return NULL;
+    }
+    pysqlite_state *state = pysqlite_get_state(module);
+    return pysqlite_row_factory_new(state, ROW_FACTORY_CLASS, cls);
+}
+
+/*[clinic input]
+_sqlite3.typed_row as pysqlite_typed_row
+
+    *types: tuple
+
+Return a row factory which converts the columns to the given types.
+
+Each value, unless it is None or already of the given type, is converted
+by calling the type of its column.  A None type leaves the column as is.
+[clinic start generated code]*/
+
+static PyObject *
+pysqlite_typed_row_impl(PyObject *module, PyObject *types)
+/*[clinic end generated code: output=33bca1703233338f input=5c1bd4ace4e0596d]*/
+{
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(types); i++) {
+        PyObject *type = PyTuple_GET_ITEM(types, i);
+        if (type != Py_None && !PyCallable_Check(type)) {
+            PyErr_Format(PyExc_TypeError,
+                         "expected a callable or None, got %T", type);
+            return NULL;
+        }
+    }
+    pysqlite_state *state = pysqlite_get_state(module);
+    return pysqlite_row_factory_new(state, ROW_FACTORY_TYPED, types);
+}
+
 static int converters_init(PyObject* module)
 {
     pysqlite_state *state = pysqlite_get_state(module);
@@ -241,11 +292,13 @@ load_functools_lru_cache(PyObject *module)
 
 static PyMethodDef module_methods[] = {
     PYSQLITE_ADAPT_METHODDEF
+    PYSQLITE_CLASS_ROW_METHODDEF
     PYSQLITE_COMPLETE_STATEMENT_METHODDEF
     {"connect", _PyCFunction_CAST(pysqlite_connect), METH_FASTCALL|METH_KEYWORDS, pysqlite_connect__doc__},
     PYSQLITE_ENABLE_CALLBACK_TRACE_METHODDEF
     PYSQLITE_REGISTER_ADAPTER_METHODDEF
     PYSQLITE_REGISTER_CONVERTER_METHODDEF
+    PYSQLITE_TYPED_ROW_METHODDEF
     {NULL, NULL}
 };
 
@@ -561,7 +614,9 @@ module_traverse(PyObject *module, visitproc visit, void *arg)
     Py_VISIT(state->CursorType);
     Py_VISIT(state->PrepareProtocolType);
     Py_VISIT(state->RowType);
+    Py_VISIT(state->RowFactoryType);
     Py_VISIT(state->StatementType);
+    Py_VISIT(state->StatementCacheInfoType);
 
     // Misc
     Py_VISIT(state->converters);
@@ -594,7 +649,9 @@ module_clear(PyObject *module)
     Py_CLEAR(state->CursorType);
     Py_CLEAR(state->PrepareProtocolType);
     Py_CLEAR(state->RowType);
+    Py_CLEAR(state->RowFactoryType);
     Py_CLEAR(state->StatementType);
+    Py_CLEAR(state->StatementCacheInfoType);
 
     // Misc
     Py_CLEAR(state->converters);
@@ -742,6 +799,13 @@ module_exec(PyObject *module)
         goto error;
     }
 
+    if (PyModule_Add(module, "dict_row",
+                     pysqlite_row_factory_new(state, ROW_FACTORY_DICT,
+                                              NULL)) < 0)
+    {
+        goto error;
+    }
+
     return 0;
 
 error:
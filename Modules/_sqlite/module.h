@@ -59,7 +59,9 @@ typedef struct {
     PyTypeObject *CursorType;
     PyTypeObject *PrepareProtocolType;
     PyTypeObject *RowType;
+    PyTypeObject *RowFactoryType;
     PyTypeObject *StatementType;
+    PyTypeObject *StatementCacheInfoType;
 
     /* Pointers to interned strings */
     PyObject *str___adapt__;
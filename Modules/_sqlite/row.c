@@ -28,6 +28,8 @@
 #include "row.h"
 #include "cursor.h"
 
+#include "pycore_tuple.h"         // _PyTuple_ITEMS()
+
 #define clinic_state() (pysqlite_get_state_by_type(type))
 #include "clinic/row.c.h"
 #undef clinic_state
@@ -286,6 +288,287 @@ static PyType_Spec row_spec = {
     .slots = row_slots,
 };
 
+/*
+ * Built-in row factories: dict_row, class_row(cls) and typed_row(*types).
+ * They are called with the cursor and the row tuple like any row factory,
+ * but through vectorcall and without running Python code, except for the
+ * class and the converters which are called.
+ */
+
+#define _pysqlite_RowFactory_CAST(op)  ((pysqlite_RowFactory *)(op))
+
+static int
+row_factory_clear(PyObject *op)
+{
+    pysqlite_RowFactory *self = _pysqlite_RowFactory_CAST(op);
+    Py_CLEAR(self->target);
+    Py_CLEAR(self->description);
+    Py_CLEAR(self->names);
+    return 0;
+}
+
+static int
+row_factory_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    pysqlite_RowFactory *self = _pysqlite_RowFactory_CAST(op);
+    Py_VISIT(Py_TYPE(self));
+    Py_VISIT(self->target);
+    Py_VISIT(self->description);
+    Py_VISIT(self->names);
+    return 0;
+}
+
+static void
+row_factory_dealloc(PyObject *self)
+{
+    PyTypeObject *tp = Py_TYPE(self);
+    PyObject_GC_UnTrack(self);
+    (void)tp->tp_clear(self);
+    tp->tp_free(self);
+    Py_DECREF(tp);
+}
+
+/* Return a new reference to the tuple of the column names of cursor. */
+static PyObject *
+get_column_names(pysqlite_RowFactory *self, PyObject *cursor)
+{
+    pysqlite_state *state = pysqlite_get_state_by_type(Py_TYPE(self));
+    if (!PyObject_TypeCheck(cursor, state->CursorType)) {
+        PyErr_Format(PyExc_TypeError,
+                     "row factory expected a cursor, got %T", cursor);
+        return NULL;
+    }
+    PyObject *description = ((pysqlite_Cursor *)cursor)->description;
+    if (!PyTuple_Check(description)) {
+        PyErr_SetString(state->ProgrammingError,
+                        "the cursor has no result columns");
+        return NULL;
+    }
+
+    PyObject *names = NULL;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    if (self->description == description) {
+        names = Py_NewRef(self->names);
+    }
+    else {
+        Py_ssize_t n = PyTuple_GET_SIZE(description);
+        names = PyTuple_New(n);
+        if (names != NULL) {
+            for (Py_ssize_t i = 0; i < n; i++) {
+                PyObject *column = PyTuple_GET_ITEM(description, i);
+                PyTuple_SET_ITEM(names, i,
+                                 Py_NewRef(PyTuple_GET_ITEM(column, 0)));
+            }
+            Py_XSETREF(self->description, Py_NewRef(description));
+            Py_XSETREF(self->names, Py_NewRef(names));
+        }
+    }
+    Py_END_CRITICAL_SECTION();
+    return names;
+}
+
+static PyObject *
+build_dict_row(PyObject *names, PyObject *row)
+{
+    PyObject *dict = PyDict_New();
+    if (dict == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(row); i++) {
+        if (PyDict_SetItem(dict, PyTuple_GET_ITEM(names, i),
+                           PyTuple_GET_ITEM(row, i)) < 0)
+        {
+            Py_DECREF(dict);
+            return NULL;
+        }
+    }
+    return dict;
+}
+
+static PyObject *
+build_typed_row(PyObject *types, PyObject *row)
+{
+    // The row is returned as is if no value needs to be converted.
+    PyObject *result = NULL;
+    Py_ssize_t n = PyTuple_GET_SIZE(row);
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *value = PyTuple_GET_ITEM(row, i);
+        PyObject *type = PyTuple_GET_ITEM(types, i);
+        if (result == NULL) {
+            if (value == Py_None || type == Py_None
+                || (PyObject *)Py_TYPE(value) == type)
+            {
+                continue;
+            }
+            result = PyTuple_New(n);
+            if (result == NULL) {
+                return NULL;
+            }
+            for (Py_ssize_t j = 0; j < i; j++) {
+                PyTuple_SET_ITEM(result, j,
+                                 Py_NewRef(PyTuple_GET_ITEM(row, j)));
+            }
+        }
+        PyObject *converted;
+        if (value == Py_None || type == Py_None
+            || (PyObject *)Py_TYPE(value) == type)
+        {
+            converted = Py_NewRef(value);
+        }
+        else {
+            converted = PyObject_CallOneArg(type, value);
+            if (converted == NULL) {
+                Py_DECREF(result);
+                return NULL;
+            }
+        }
+        PyTuple_SET_ITEM(result, i, converted);
+    }
+    return result != NULL ? result : Py_NewRef(row);
+}
+
+static PyObject *
+row_factory_vectorcall(PyObject *op, PyObject *const *args, size_t nargsf,
+                       PyObject *kwnames)
+{
+    pysqlite_RowFactory *self = _pysqlite_RowFactory_CAST(op);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    if (kwnames != NULL && PyTuple_GET_SIZE(kwnames) > 0) {
+        PyErr_SetString(PyExc_TypeError,
+                        "row factory takes no keyword arguments");
+        return NULL;
+    }
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError,
+                     "row factory expected 2 arguments, got %zd", nargs);
+        return NULL;
+    }
+    PyObject *cursor = args[0];
+    PyObject *row = args[1];
+    if (!PyTuple_Check(row)) {
+        PyErr_Format(PyExc_TypeError,
+                     "row factory expected a tuple, got %T", row);
+        return NULL;
+    }
+
+    if (self->kind == ROW_FACTORY_TYPED) {
+        if (PyTuple_GET_SIZE(row) != PyTuple_GET_SIZE(self->target)) {
+            PyErr_Format(PyExc_ValueError,
+                         "typed_row() got %zd types for %zd columns",
+                         PyTuple_GET_SIZE(self->target),
+                         PyTuple_GET_SIZE(row));
+            return NULL;
+        }
+        return build_typed_row(self->target, row);
+    }
+
+    PyObject *names = get_column_names(self, cursor);
+    if (names == NULL) {
+        return NULL;
+    }
+    PyObject *result = NULL;
+    if (PyTuple_GET_SIZE(names) != PyTuple_GET_SIZE(row)) {
+        PyErr_Format(PyExc_ValueError,
+                     "row has %zd values for %zd columns",
+                     PyTuple_GET_SIZE(row), PyTuple_GET_SIZE(names));
+    }
+    else if (self->kind == ROW_FACTORY_DICT) {
+        result = build_dict_row(names, row);
+    }
+    else {
+        assert(self->kind == ROW_FACTORY_CLASS);
+        result = PyObject_Vectorcall(self->target, _PyTuple_ITEMS(row), 0,
+                                     names);
+    }
+    Py_DECREF(names);
+    return result;
+}
+
+static PyObject *
+row_factory_repr(PyObject *op)
+{
+    pysqlite_RowFactory *self = _pysqlite_RowFactory_CAST(op);
+    switch (self->kind) {
+        case ROW_FACTORY_DICT:
+            return PyUnicode_FromString(MODULE_NAME ".dict_row");
+        case ROW_FACTORY_CLASS:
+            return PyUnicode_FromFormat(MODULE_NAME ".class_row(%R)",
+                                        self->target);
+        default:
+            assert(self->kind == ROW_FACTORY_TYPED);
+            break;
+    }
+
+    PyUnicodeWriter *writer = PyUnicodeWriter_Create(0);
+    if (writer == NULL) {
+        return NULL;
+    }
+    if (PyUnicodeWriter_WriteUTF8(writer, MODULE_NAME ".typed_row(", -1) < 0) {
+        goto error;
+    }
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(self->target); i++) {
+        if (i > 0 && PyUnicodeWriter_WriteUTF8(writer, ", ", 2) < 0) {
+            goto error;
+        }
+        if (PyUnicodeWriter_WriteRepr(writer,
+                                      PyTuple_GET_ITEM(self->target, i)) < 0)
+        {
+            goto error;
+        }
+    }
+    if (PyUnicodeWriter_WriteChar(writer, ')') < 0) {
+        goto error;
+    }
+    return PyUnicodeWriter_Finish(writer);
+
+error:
+    PyUnicodeWriter_Discard(writer);
+    return NULL;
+}
+
+static struct PyMemberDef row_factory_members[] = {
+    {"__vectorcalloffset__", Py_T_PYSSIZET,
+     offsetof(pysqlite_RowFactory, vectorcall), Py_READONLY},
+    {NULL}
+};
+
+static PyType_Slot row_factory_slots[] = {
+    {Py_tp_dealloc, row_factory_dealloc},
+    {Py_tp_repr, row_factory_repr},
+    {Py_tp_call, PyVectorcall_Call},
+    {Py_tp_members, row_factory_members},
+    {Py_tp_traverse, row_factory_traverse},
+    {Py_tp_clear, row_factory_clear},
+    {0, NULL},
+};
+
+static PyType_Spec row_factory_spec = {
+    .name = MODULE_NAME ".RowFactory",
+    .basicsize = sizeof(pysqlite_RowFactory),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION |
+              Py_TPFLAGS_HAVE_VECTORCALL),
+    .slots = row_factory_slots,
+};
+
+PyObject *
+pysqlite_row_factory_new(pysqlite_state *state, enum row_factory_kind kind,
+                         PyObject *target)
+{
+    PyTypeObject *type = state->RowFactoryType;
+    pysqlite_RowFactory *self = PyObject_GC_New(pysqlite_RowFactory, type);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->kind = kind;
+    self->target = Py_XNewRef(target);
+    self->description = NULL;
+    self->names = NULL;
+    self->vectorcall = row_factory_vectorcall;
+    PyObject_GC_Track(self);
+    return (PyObject *)self;
+}
+
 int
 pysqlite_row_setup_types(PyObject *module)
 {
@@ -295,5 +578,11 @@ pysqlite_row_setup_types(PyObject *module)
     }
     pysqlite_state *state = pysqlite_get_state(module);
     state->RowType = (PyTypeObject *)type;
+
+    type = PyType_FromModuleAndSpec(module, &row_factory_spec, NULL);
+    if (type == NULL) {
+        return -1;
+    }
+    state->RowFactoryType = (PyTypeObject *)type;
     return 0;
 }
@@ -25,6 +25,8 @@
 #define PYSQLITE_ROW_H
 #include "Python.h"
 
+#include "module.h"
+
 typedef struct _Row
 {
     PyObject_HEAD
@@ -32,6 +34,27 @@ typedef struct _Row
     PyObject* description;
 } pysqlite_Row;
 
+enum row_factory_kind {
+    ROW_FACTORY_DICT,
+    ROW_FACTORY_CLASS,
+    ROW_FACTORY_TYPED,
+};
+
+typedef struct {
+    PyObject_HEAD
+    enum row_factory_kind kind;
+    /* The class for ROW_FACTORY_CLASS, the tuple of types for
+     * ROW_FACTORY_TYPED, NULL for ROW_FACTORY_DICT */
+    PyObject *target;
+    /* The last cursor description, and the tuple of its column names */
+    PyObject *description;
+    PyObject *names;
+    vectorcallfunc vectorcall;
+} pysqlite_RowFactory;
+
 int pysqlite_row_setup_types(PyObject *module);
+PyObject *pysqlite_row_factory_new(pysqlite_state *state,
+                                   enum row_factory_kind kind,
+                                   PyObject *target);
 
 #endif
@@ -454,6 +454,126 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_sre_SRE_Pattern__match_set__doc__,
+"_match_set($self, /, string, pos=0, endpos=sys.maxsize, search=True,\n"
+"           match_all=False)\n"
+"--\n"
+"\n"
+"Match all the patterns of a pattern set in a single pass.\n"
+"\n"
+"Return a dict mapping the index of each pattern which matched to the\n"
+"span of its leftmost match.  Used by re.PatternSet.");
+
+#define _SRE_SRE_PATTERN__MATCH_SET_METHODDEF    \
+    {"_match_set", _PyCFunction_CAST(_sre_SRE_Pattern__match_set), METH_FASTCALL|METH_KEYWORDS, _sre_SRE_Pattern__match_set__doc__},
+
+static PyObject *
+_sre_SRE_Pattern__match_set_impl(PatternObject *self, PyObject *string,
+                                 Py_ssize_t pos, Py_ssize_t endpos,
+                                 int search, int match_all);
+
+static PyObject *
+_sre_SRE_Pattern__match_set(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 5
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(string), &_Py_ID(pos), &_Py_ID(endpos), &_Py_ID(search), &_Py_ID(match_all), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"string", "pos", "endpos", "search", "match_all", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "_match_set",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[5];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *string;
+    Py_ssize_t pos = 0;
+    Py_ssize_t endpos = PY_SSIZE_T_MAX;
+    int search = 1;
+    int match_all = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 5, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    string = args[0];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        {
+            Py_ssize_t ival = -1;
+            PyObject *iobj = _PyNumber_Index(args[1]);
+            if (iobj != NULL) {
+                ival = PyLong_AsSsize_t(iobj);
+                Py_DECREF(iobj);
+            }
+            if (ival == -1 && PyErr_Occurred()) {
+                goto exit;
+            }
+            pos = ival;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[2]) {
+        {
+            Py_ssize_t ival = -1;
+            PyObject *iobj = _PyNumber_Index(args[2]);
+            if (iobj != NULL) {
+                ival = PyLong_AsSsize_t(iobj);
+                Py_DECREF(iobj);
+            }
+            if (ival == -1 && PyErr_Occurred()) {
+                goto exit;
+            }
+            endpos = ival;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[3]) {
+        search = PyObject_IsTrue(args[3]);
+        if (search < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    match_all = PyObject_IsTrue(args[4]);
+    if (match_all < 0) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = _sre_SRE_Pattern__match_set_impl((PatternObject *)self, string, pos, endpos, search, match_all);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(_sre_SRE_Pattern_findall__doc__,
 "findall($self, /, string, pos=0, endpos=sys.maxsize)\n"
 "--\n"
@@ -1568,4 +1688,4 @@ _sre_SRE_Scanner_search(PyObject *self, PyTypeObject *cls, PyObject *const *args
 #ifndef _SRE_SRE_PATTERN__FAIL_AFTER_METHODDEF
     #define _SRE_SRE_PATTERN__FAIL_AFTER_METHODDEF
 #endif /* !defined(_SRE_SRE_PATTERN__FAIL_AFTER_METHODDEF) */
-/*[clinic end generated code: output=bbf42e1de3bdd3ae input=a9049054013a1b77]*/
+/*[clinic end generated code: output=eb53e735ab06c943 input=a9049054013a1b77]*/
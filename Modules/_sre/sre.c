@@ -268,6 +268,25 @@ data_stack_grow(SRE_STATE* state, Py_ssize_t size)
     return 0;
 }
 
+/* grow the work stack of the linear-time engine (see SRE(linear_add)).
+   It is allocated separately from the data stack, as it is only known to
+   be large enough once it has been filled. */
+static int
+linear_stack_grow(Py_ssize_t** stack, Py_ssize_t* size)
+{
+    Py_ssize_t newsize;
+    Py_ssize_t* newstack;
+    if (*size > PY_SSIZE_T_MAX / (Py_ssize_t)(2 * sizeof(Py_ssize_t)))
+        return SRE_ERROR_MEMORY;
+    newsize = 2 * *size;
+    newstack = PyMem_Realloc(*stack, newsize * sizeof(Py_ssize_t));
+    if (!newstack)
+        return SRE_ERROR_MEMORY;
+    *stack = newstack;
+    *size = newsize;
+    return 0;
+}
+
 /* memory pool functions for SRE_REPEAT, this can avoid memory
    leak when SRE(match) function terminates abruptly.
    state->repeat_pool_used is a doubly-linked list, so that we
@@ -349,6 +368,14 @@ repeat_pool_clear(SRE_STATE *state)
 
 /* generate 8-bit version */
 
+#define FASTSEARCH sre_ucs1_fastsearch
+#define STRINGLIB(F) sre_ucs1_##F
+#define STRINGLIB_CHAR Py_UCS1
+#define STRINGLIB_SIZEOF_CHAR 1
+#define STRINGLIB_FAST_MEMCHR memchr
+#include "../../Objects/stringlib/fastsearch.h"
+#include "../../Objects/stringlib/undef.h"
+
 #define SRE_CHAR Py_UCS1
 #define SIZEOF_SRE_CHAR 1
 #define SRE(F) sre_ucs1_##F
@@ -356,6 +383,17 @@ repeat_pool_clear(SRE_STATE *state)
 
 /* generate 16-bit unicode version */
 
+#define FASTSEARCH sre_ucs2_fastsearch
+#define STRINGLIB(F) sre_ucs2_##F
+#define STRINGLIB_CHAR Py_UCS2
+#define STRINGLIB_SIZEOF_CHAR 2
+#if SIZEOF_WCHAR_T == 2
+#define STRINGLIB_FAST_MEMCHR(s, c, n) \
+    (Py_UCS2 *)wmemchr((const wchar_t *)(s), c, n)
+#endif
+#include "../../Objects/stringlib/fastsearch.h"
+#include "../../Objects/stringlib/undef.h"
+
 #define SRE_CHAR Py_UCS2
 #define SIZEOF_SRE_CHAR 2
 #define SRE(F) sre_ucs2_##F
@@ -363,6 +401,17 @@ repeat_pool_clear(SRE_STATE *state)
 
 /* generate 32-bit unicode version */
 
+#define FASTSEARCH sre_ucs4_fastsearch
+#define STRINGLIB(F) sre_ucs4_##F
+#define STRINGLIB_CHAR Py_UCS4
+#define STRINGLIB_SIZEOF_CHAR 4
+#if SIZEOF_WCHAR_T == 4
+#define STRINGLIB_FAST_MEMCHR(s, c, n) \
+    (Py_UCS4 *)wmemchr((const wchar_t *)(s), c, n)
+#endif
+#include "../../Objects/stringlib/fastsearch.h"
+#include "../../Objects/stringlib/undef.h"
+
 #define SRE_CHAR Py_UCS4
 #define SIZEOF_SRE_CHAR 4
 #define SRE(F) sre_ucs4_##F
@@ -745,9 +794,34 @@ pattern_dealloc(PyObject *self)
     Py_DECREF(tp);
 }
 
+LOCAL(Py_ssize_t)
+sre_linear(SRE_STATE* state, SRE_CODE* pattern, int search)
+{
+    if (state->charsize == 1)
+        return sre_ucs1_linear(state, pattern, search);
+    if (state->charsize == 2)
+        return sre_ucs2_linear(state, pattern, search);
+    assert(state->charsize == 4);
+    return sre_ucs4_linear(state, pattern, search);
+}
+
+LOCAL(Py_ssize_t)
+sre_linear_set(SRE_STATE* state, SRE_CODE* pattern, int search,
+               Py_ssize_t* spans)
+{
+    if (state->charsize == 1)
+        return sre_ucs1_linear_set(state, pattern, search, spans);
+    if (state->charsize == 2)
+        return sre_ucs2_linear_set(state, pattern, search, spans);
+    assert(state->charsize == 4);
+    return sre_ucs4_linear_set(state, pattern, search, spans);
+}
+
 LOCAL(Py_ssize_t)
 sre_match(SRE_STATE* state, SRE_CODE* pattern)
 {
+    if (pattern[0] == SRE_OP_LINEAR)
+        return sre_linear(state, pattern, 0);
     if (state->charsize == 1)
         return sre_ucs1_match(state, pattern, 1);
     if (state->charsize == 2)
@@ -759,6 +833,8 @@ sre_match(SRE_STATE* state, SRE_CODE* pattern)
 LOCAL(Py_ssize_t)
 sre_search(SRE_STATE* state, SRE_CODE* pattern)
 {
+    if (pattern[0] == SRE_OP_LINEAR)
+        return sre_linear(state, pattern, 1);
     if (state->charsize == 1)
         return sre_ucs1_search(state, pattern);
     if (state->charsize == 2)
@@ -901,6 +977,99 @@ _sre_SRE_Pattern_search_impl(PatternObject *self, PyTypeObject *cls,
     return match;
 }
 
+/*[clinic input]
+_sre.SRE_Pattern._match_set
+
+    string: object
+    pos: Py_ssize_t = 0
+    endpos: Py_ssize_t(c_default="PY_SSIZE_T_MAX") = sys.maxsize
+    search: bool = True
+    match_all: bool = False
+
+Match all the patterns of a pattern set in a single pass.
+
+Return a dict mapping the index of each pattern which matched to the
+span of its leftmost match.  Used by re.PatternSet.
+[clinic start generated code]*/
+
+static PyObject *
+_sre_SRE_Pattern__match_set_impl(PatternObject *self, PyObject *string,
+                                 Py_ssize_t pos, Py_ssize_t endpos,
+                                 int search, int match_all)
+/*[clinic end generated code: output=b32150967ac94018 input=d0f055a57963719a]*/
+{
+    SRE_CODE *code = PatternObject_GetCode(self);
+    SRE_STATE state;
+    Py_ssize_t status, count, i;
+    Py_ssize_t *spans;
+    PyObject *result;
+
+    if (self->codesize < 6 || code[0] != SRE_OP_LINEAR ||
+        code[5] != SRE_OP_SET) {
+        PyErr_SetString(PyExc_ValueError, "not a pattern set");
+        return NULL;
+    }
+    count = code[6];
+
+    if (!state_init(&state, self, string, pos, endpos))
+        return NULL;
+    state.match_all = match_all;
+
+    spans = PyMem_New(Py_ssize_t, 2 * count + 1);
+    if (spans == NULL) {
+        state_fini(&state);
+        return PyErr_NoMemory();
+    }
+
+    status = sre_linear_set(&state, code, search, spans);
+
+    if (PyErr_Occurred()) {
+        goto error;
+    }
+    if (status < 0) {
+        pattern_error(status);
+        goto error;
+    }
+
+    result = PyDict_New();
+    if (result == NULL) {
+        goto error;
+    }
+    for (i = 0; i < count; i++) {
+        PyObject *key, *value;
+        int rc;
+
+        if (spans[2*i] < 0)
+            continue;
+        key = PyLong_FromSsize_t(i);
+        if (key == NULL) {
+            Py_DECREF(result);
+            goto error;
+        }
+        value = Py_BuildValue("(nn)", spans[2*i], spans[2*i+1]);
+        if (value == NULL) {
+            Py_DECREF(key);
+            Py_DECREF(result);
+            goto error;
+        }
+        rc = PyDict_SetItem(result, key, value);
+        Py_DECREF(key);
+        Py_DECREF(value);
+        if (rc < 0) {
+            Py_DECREF(result);
+            goto error;
+        }
+    }
+    PyMem_Free(spans);
+    state_fini(&state);
+    return result;
+
+error:
+    PyMem_Free(spans);
+    state_fini(&state);
+    return NULL;
+}
+
 /*[clinic input]
 _sre.SRE_Pattern.findall
 
@@ -1527,6 +1696,7 @@ pattern_repr(PyObject *self)
         {"re.VERBOSE", SRE_FLAG_VERBOSE},
         {"re.DEBUG", SRE_FLAG_DEBUG},
         {"re.ASCII", SRE_FLAG_ASCII},
+        {"re.LINEAR", SRE_FLAG_LINEAR},
     };
 
     PatternObject *obj = _PatternObject_CAST(self);
@@ -2011,19 +2181,53 @@ _validate_inner(SRE_CODE *code, SRE_CODE *end, Py_ssize_t groups)
                 /* A minimal info field is
                    <INFO> <1=skip> <2=flags> <3=min> <4=max>;
                    If SRE_INFO_PREFIX or SRE_INFO_CHARSET is in the flags,
-                   more follows. */
+                   more follows.  If SRE_INFO_REQUIRED is in the flags,
+                   the field ends with the required literal. */
                 SRE_CODE flags, i;
-                SRE_CODE *newcode;
+                SRE_CODE *newcode, *blockend;
                 GET_SKIP;
-                newcode = code+skip-1;
+                newcode = blockend = code+skip-1;
                 GET_ARG; flags = arg;
                 GET_ARG;
                 GET_ARG;
                 /* Check that only valid flags are present */
                 if ((flags & ~(SRE_INFO_PREFIX |
                                SRE_INFO_LITERAL |
-                               SRE_INFO_CHARSET)) != 0)
+                               SRE_INFO_CHARSET |
+                               SRE_INFO_REQUIRED)) != 0)
                     FAIL;
+                /* Validate the required literal:
+                   <length> <min> <max> <literal> <has set> <set> <size> */
+                if (flags & SRE_INFO_REQUIRED) {
+                    SRE_CODE size, length;
+                    if (newcode <= code)
+                        FAIL;
+                    size = newcode[-1];
+                    if (size < 6 || size > (uintptr_t)(newcode - code))
+                        FAIL;
+                    newcode -= size;
+                    length = newcode[0];
+                    if (length < 1 || length > SRE_REQUIRED_MAX ||
+                        size < length + 5 || newcode[1] > newcode[2])
+                        FAIL;
+                    if (newcode[3+length] == 0) {
+                        if (size != length + 5)
+                            FAIL;
+                    }
+                    else if (newcode[3+length] == 1) {
+                        if (_validate_charset(newcode + 4 + length,
+                                              blockend - 2))
+                            FAIL;
+                        if (size < length + 6 ||
+                            blockend[-2] != SRE_OP_FAILURE)
+                            FAIL;
+                    }
+                    else
+                        FAIL;
+                    /* LITERAL means that there is nothing else to match */
+                    if (flags & SRE_INFO_LITERAL)
+                        FAIL;
+                }
                 /* PREFIX and CHARSET are mutually exclusive */
                 if ((flags & SRE_INFO_PREFIX) &&
                     (flags & SRE_INFO_CHARSET))
@@ -2063,6 +2267,7 @@ _validate_inner(SRE_CODE *code, SRE_CODE *end, Py_ssize_t groups)
                   VTRACE(("code=%p, newcode=%p\n", code, newcode));
                     FAIL;
                 }
+                code = blockend;
             }
             break;
 
@@ -2247,10 +2452,161 @@ _validate_outer(SRE_CODE *code, SRE_CODE *end, Py_ssize_t groups)
     return _validate_inner(code, end-1, groups);
 }
 
+/* Validate a program for the linear-time engine.  Besides checking the
+   individual instructions, make sure that all jumps land on an instruction,
+   and that the header matches what the engine will allocate. */
+static int
+_validate_linear(SRE_CODE *code, SRE_CODE *end, Py_ssize_t groups)
+{
+    Py_ssize_t codesize = end - code;
+    Py_ssize_t i, next, threads = 0;
+    char *starts;
+    int result = -1;
+
+    if (groups < 0 || (size_t)groups > SRE_MAXGROUPS ||
+        codesize < 6 || end[-1] != SRE_OP_SUCCESS ||
+        code[1] != (SRE_CODE)codesize || code[2] != (SRE_CODE)groups ||
+        code[3] > (SRE_CODE)codesize)
+        FAIL;
+
+    starts = PyMem_Calloc(codesize, 1);
+    if (starts == NULL)
+        FAIL;
+
+    /* first pass: check the instructions and record where they start */
+    for (i = 5; i < codesize; i = next) {
+        starts[i] = 1;
+        switch (code[i]) {
+        case SRE_OP_SPLIT:
+            next = i + 4;
+            break;
+        case SRE_OP_LOOP_END:
+            next = i + 3;
+            break;
+        case SRE_OP_GOTO:
+        case SRE_OP_LOOP_BEGIN:
+        case SRE_OP_MARK:
+        case SRE_OP_AT:
+            next = i + 2;
+            break;
+        case SRE_OP_FAILURE:
+            next = i + 1;
+            break;
+        case SRE_OP_SET:
+            /* <SET> <count> <start>...: only at the start of the
+               program of a pattern set */
+            if (i != 5 || groups != 0 || i + 1 >= codesize ||
+                code[i+1] > (SRE_CODE)(codesize - i - 2))
+                goto done;
+            next = i + 2 + code[i+1];
+            break;
+        case SRE_OP_SUCCESS:
+        case SRE_OP_ANY:
+        case SRE_OP_ANY_ALL:
+            threads++;
+            next = i + 1;
+            break;
+        case SRE_OP_IN:
+        case SRE_OP_IN_IGNORE:
+        case SRE_OP_IN_UNI_IGNORE:
+        case SRE_OP_IN_LOC_IGNORE:
+            threads++;
+            if (i + 1 >= codesize || code[i+1] < 2 ||
+                code[i+1] > (SRE_CODE)(codesize - i - 1))
+                goto done;
+            next = i + 1 + code[i+1];
+            break;
+        case SRE_OP_LITERAL:
+        case SRE_OP_NOT_LITERAL:
+        case SRE_OP_LITERAL_IGNORE:
+        case SRE_OP_NOT_LITERAL_IGNORE:
+        case SRE_OP_LITERAL_UNI_IGNORE:
+        case SRE_OP_NOT_LITERAL_UNI_IGNORE:
+        case SRE_OP_LITERAL_LOC_IGNORE:
+        case SRE_OP_NOT_LITERAL_LOC_IGNORE:
+            threads++;
+            next = i + 2;
+            break;
+        default:
+            goto done;
+        }
+        if (next > codesize)
+            goto done;
+        switch (code[i]) {
+        case SRE_OP_MARK:
+            if (code[i+1] >= 2 * (size_t)groups)
+                goto done;
+            break;
+        case SRE_OP_LOOP_BEGIN:
+        case SRE_OP_LOOP_END:
+            if (code[i+1] >= code[3])
+                goto done;
+            break;
+        case SRE_OP_SPLIT:
+            if (code[i+3] > code[3])
+                goto done;
+            break;
+        case SRE_OP_GOTO:
+        case SRE_OP_SET:
+            break;
+        default:
+            /* single instructions have the same format as for the
+               backtracking engine */
+            if (_validate_inner(code + i, code + next, groups))
+                goto done;
+            break;
+        }
+    }
+    if (threads != (Py_ssize_t)code[4])
+        goto done;
+
+    /* second pass: check the jump targets */
+    for (i = 5; i < codesize; i++) {
+        if (!starts[i])
+            continue;
+        switch (code[i]) {
+        case SRE_OP_SPLIT:
+            if (code[i+1] >= (SRE_CODE)codesize || !starts[code[i+1]] ||
+                code[i+2] >= (SRE_CODE)codesize || !starts[code[i+2]])
+                goto done;
+            break;
+        case SRE_OP_GOTO:
+            if (code[i+1] >= (SRE_CODE)codesize || !starts[code[i+1]])
+                goto done;
+            break;
+        case SRE_OP_SET:
+            for (next = 0; next < (Py_ssize_t)code[i+1]; next++) {
+                SRE_CODE target = code[i+2+next];
+                if (target >= (SRE_CODE)codesize || !starts[target])
+                    goto done;
+            }
+            break;
+        case SRE_OP_LOOP_END:
+            if (code[i+2] >= (SRE_CODE)codesize || !starts[code[i+2]])
+                goto done;
+            break;
+        }
+    }
+    result = 0;
+
+done:
+    PyMem_Free(starts);
+    if (result)
+        FAIL;
+    return 0;
+}
+
 static int
 _validate(PatternObject *self)
 {
-    if (_validate_outer(self->code, self->code+self->codesize, self->groups))
+    int result;
+    if (self->codesize > 0 && self->code[0] == SRE_OP_LINEAR)
+        result = _validate_linear(self->code, self->code+self->codesize,
+                                  self->groups);
+    else
+        result = _validate_outer(self->code, self->code+self->codesize,
+                                 self->groups);
+    if (result)
     {
         PyErr_SetString(PyExc_RuntimeError, "invalid SRE code");
         return 0;
@@ -3164,6 +3520,7 @@ static PyMethodDef pattern_methods[] = {
     _SRE_SRE_PATTERN_MATCH_METHODDEF
     _SRE_SRE_PATTERN_FULLMATCH_METHODDEF
     _SRE_SRE_PATTERN_SEARCH_METHODDEF
+    _SRE_SRE_PATTERN__MATCH_SET_METHODDEF
     _SRE_SRE_PATTERN_SUB_METHODDEF
     _SRE_SRE_PATTERN_SUBN_METHODDEF
     _SRE_SRE_PATTERN_FINDALL_METHODDEF
@@ -24,6 +24,10 @@
 # define SRE_MAXGROUPS ((SRE_CODE)PY_SSIZE_T_MAX / SIZEOF_VOID_P / 2)
 #endif
 
+/* the longest required literal in an info block (see _MAXREQUIRED in
+   Lib/re/_compiler.py) */
+#define SRE_REQUIRED_MAX 64
+
 typedef struct {
     PyObject_VAR_HEAD
     Py_ssize_t groups; /* must be first! */
@@ -11,7 +11,7 @@
  * See the sre.c file for information on usage and redistribution.
  */
 
-#define SRE_MAGIC 20230612
+#define SRE_MAGIC 20261021
 #define SRE_OP_FAILURE 0
 #define SRE_OP_SUCCESS 1
 #define SRE_OP_ANY 2
@@ -55,6 +55,12 @@
 #define SRE_OP_LITERAL_UNI_IGNORE 40
 #define SRE_OP_NOT_LITERAL_UNI_IGNORE 41
 #define SRE_OP_RANGE_UNI_IGNORE 42
+#define SRE_OP_LINEAR 43
+#define SRE_OP_SPLIT 44
+#define SRE_OP_GOTO 45
+#define SRE_OP_LOOP_BEGIN 46
+#define SRE_OP_LOOP_END 47
+#define SRE_OP_SET 48
 #define SRE_AT_BEGINNING 0
 #define SRE_AT_BEGINNING_LINE 1
 #define SRE_AT_BEGINNING_STRING 2
@@ -93,6 +99,8 @@
 #define SRE_FLAG_VERBOSE 64
 #define SRE_FLAG_DEBUG 128
 #define SRE_FLAG_ASCII 256
+#define SRE_FLAG_LINEAR 512
 #define SRE_INFO_PREFIX 1
 #define SRE_INFO_LITERAL 2
 #define SRE_INFO_CHARSET 4
+#define SRE_INFO_REQUIRED 8
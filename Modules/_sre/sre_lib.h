@@ -1604,6 +1604,12 @@ SRE(match)(SRE_STATE* state, const SRE_CODE* pattern, int toplevel)
         default:
 #endif
         // Also any unused opcodes:
+        TARGET(SRE_OP_LINEAR):
+        TARGET(SRE_OP_SPLIT):
+        TARGET(SRE_OP_GOTO):
+        TARGET(SRE_OP_LOOP_BEGIN):
+        TARGET(SRE_OP_LOOP_END):
+        TARGET(SRE_OP_SET):
         TARGET(SRE_OP_RANGE_UNI_IGNORE):
         TARGET(SRE_OP_SUBPATTERN):
         TARGET(SRE_OP_RANGE):
@@ -1688,6 +1694,78 @@ SRE(match)(SRE_STATE* state, const SRE_CODE* pattern, int toplevel)
 #define RESET_CAPTURE_GROUP() \
     do { state->lastmark = state->lastindex = -1; } while (0)
 
+LOCAL(Py_ssize_t)
+SRE(find_literal)(const SRE_CHAR* s, Py_ssize_t n,
+                  const SRE_CHAR* p, Py_ssize_t m)
+{
+    /* return the index of the first occurrence of p in s, or -1 */
+    if (n < m)
+        return -1;
+    return SRE(fastsearch)(s, n, p, m, -1, FAST_SEARCH);
+}
+
+LOCAL(Py_ssize_t)
+SRE(search_required)(SRE_STATE* state, SRE_CODE* pattern,
+                     SRE_CODE* charset, SRE_CODE* required)
+{
+    /* search for a pattern which contains a literal string, but does not
+       start with it.  only the positions from which the literal can be
+       reached are tried: not further from it than the maximal offset,
+       and not before a character which cannot occur before it */
+    /* <length> <min offset> <max offset> <literal> <has set> <set> */
+    SRE_CHAR* ptr = (SRE_CHAR *)state->start;
+    SRE_CHAR* end = (SRE_CHAR *)state->end;
+    Py_ssize_t length = required[0];
+    Py_ssize_t minoff = required[1];
+    Py_ssize_t maxoff = PY_SSIZE_T_MAX;
+    SRE_CODE* set = required[3 + length] ? required + 4 + length : NULL;
+    SRE_CHAR literal[SRE_REQUIRED_MAX];
+    Py_ssize_t i, status;
+
+    if (required[2] < SRE_MAXREPEAT)
+        maxoff = required[2];
+    for (i = 0; i < length; i++) {
+        literal[i] = (SRE_CHAR) required[3 + i];
+#if SIZEOF_SRE_CHAR < 4
+        if ((SRE_CODE) literal[i] != required[3 + i])
+            return 0; /* literal can't match: doesn't fit in char width */
+#endif
+    }
+
+    state->must_advance = 0;
+    while (end - ptr >= minoff + length) {
+        /* find the first occurrence of the literal which a match
+           starting at ptr can contain */
+        SRE_CHAR* from = ptr + minoff;
+        SRE_CHAR* last;
+        i = SRE(find_literal)(from, end - from, literal, length);
+        if (i < 0)
+            return 0;
+        TRACE(("|%p|%p|SEARCH REQUIRED\n", pattern, from + i));
+        last = from + i - minoff;
+        if (from + i - ptr > maxoff)
+            ptr = from + i - maxoff;
+        if (set) {
+            SRE_CHAR* p = from + i;
+            while (p > ptr && SRE(charset)(state, set, p[-1]))
+                p--;
+            ptr = p;
+        }
+        /* positions before ptr could only reach a later occurrence,
+           so they cannot match at all */
+        for (; ptr <= last; ptr++) {
+            if (charset && !SRE(charset)(state, charset, *ptr))
+                continue;
+            state->start = state->ptr = ptr;
+            status = SRE(match)(state, pattern, 0);
+            if (status != 0)
+                return status;
+            RESET_CAPTURE_GROUP();
+        }
+    }
+    return 0;
+}
+
 LOCAL(Py_ssize_t)
 SRE(search)(SRE_STATE* state, SRE_CODE* pattern)
 {
@@ -1699,6 +1777,7 @@ SRE(search)(SRE_STATE* state, SRE_CODE* pattern)
     SRE_CODE* prefix = NULL;
     SRE_CODE* charset = NULL;
     SRE_CODE* overlap = NULL;
+    SRE_CODE* required = NULL;
     int flags = 0;
     INIT_TRACE(state);
 
@@ -1736,6 +1815,11 @@ SRE(search)(SRE_STATE* state, SRE_CODE* pattern)
             /* <charset> */
             charset = pattern + 5;
 
+        if (flags & SRE_INFO_REQUIRED)
+            /* pattern contains a known literal */
+            /* <required literal> <size> */
+            required = pattern + 1 + pattern[1] - pattern[pattern[1]];
+
         pattern += 1 + pattern[1];
     }
 
@@ -1822,6 +1906,11 @@ SRE(search)(SRE_STATE* state, SRE_CODE* pattern)
         return 0;
     }
 
+    if (required && !(pattern[0] == SRE_OP_AT &&
+                      (pattern[1] == SRE_AT_BEGINNING ||
+                       pattern[1] == SRE_AT_BEGINNING_STRING)))
+        return SRE(search_required)(state, pattern, charset, required);
+
     if (charset) {
         /* pattern starts with a character from a known set */
         end = (SRE_CHAR *)state->end;
@@ -1866,6 +1955,476 @@ SRE(search)(SRE_STATE* state, SRE_CODE* pattern)
     return status;
 }
 
+/* Linear-time engine, used for patterns compiled with the LINEAR flag.
+
+   The program (see _code_linear() in Lib/re/_compiler.py) is simulated
+   as a Pike VM: all threads are advanced in lockstep, one character at a
+   time, and at most one thread is kept per instruction.  Threads are
+   ordered by priority, so that the result is the same leftmost match that
+   the backtracking engine would find.  The running time is bounded by
+   O(len(string) * len(program)) and no recursion is involved.
+
+   Each thread carries a vector of "slots":
+     0: start of the match
+     1: last closed group (lastindex)
+     2 .. 2+2*groups-1: group marks
+     2+2*groups ..: loop registers (position at which the current
+                    iteration of a loop started)
+   Positions are stored as offsets from state->beginning, -1 if unset. */
+
+LOCAL(int)
+SRE(linear_char)(SRE_STATE* state, const SRE_CODE* pattern, SRE_CHAR ch)
+{
+    /* check if a character matches a single character instruction */
+
+    switch (pattern[0]) {
+
+    case SRE_OP_LITERAL:
+        return (SRE_CODE) ch == pattern[1];
+    case SRE_OP_NOT_LITERAL:
+        return (SRE_CODE) ch != pattern[1];
+    case SRE_OP_LITERAL_IGNORE:
+        return (SRE_CODE) sre_lower_ascii(ch) == pattern[1];
+    case SRE_OP_NOT_LITERAL_IGNORE:
+        return (SRE_CODE) sre_lower_ascii(ch) != pattern[1];
+    case SRE_OP_LITERAL_UNI_IGNORE:
+        return (SRE_CODE) sre_lower_unicode(ch) == pattern[1];
+    case SRE_OP_NOT_LITERAL_UNI_IGNORE:
+        return (SRE_CODE) sre_lower_unicode(ch) != pattern[1];
+    case SRE_OP_LITERAL_LOC_IGNORE:
+        return char_loc_ignore(pattern[1], ch);
+    case SRE_OP_NOT_LITERAL_LOC_IGNORE:
+        return !char_loc_ignore(pattern[1], ch);
+    case SRE_OP_ANY:
+        return !SRE_IS_LINEBREAK(ch);
+    case SRE_OP_ANY_ALL:
+        return 1;
+    case SRE_OP_IN:
+        return SRE(charset)(state, pattern + 2, ch);
+    case SRE_OP_IN_IGNORE:
+        return SRE(charset)(state, pattern + 2,
+                            (SRE_CODE) sre_lower_ascii(ch));
+    case SRE_OP_IN_UNI_IGNORE:
+        return SRE(charset)(state, pattern + 2,
+                            (SRE_CODE) sre_lower_unicode(ch));
+    case SRE_OP_IN_LOC_IGNORE:
+        return SRE(charset_loc_ignore)(state, pattern + 2, ch);
+    }
+    return 0;
+}
+
+LOCAL(Py_ssize_t)
+SRE(linear_add)(SRE_STATE* state, const SRE_CODE* pattern,
+                Py_ssize_t pc, Py_ssize_t pos, Py_ssize_t* slots,
+                Py_ssize_t* visited, Py_ssize_t** stack,
+                Py_ssize_t* stacksize, Py_ssize_t* list_pc,
+                Py_ssize_t* list_slots, Py_ssize_t count)
+{
+    /* add the thread at pc and all threads reachable from it without
+       consuming a character to the list; returns the new thread count.
+       The stack holds either program counters, or (value, -slot-1)
+       pairs used to restore the slots once a branch has been explored.
+       Its depth is not bounded by the size of the program (a SPLIT can be
+       reached again from a nested loop), so it grows as needed; returns
+       SRE_ERROR_MEMORY if it cannot.
+
+       The instructions which hold a thread are visited at most once per
+       position, and SPLIT at most once per position and depth; this is
+       enough to bound the work, as every loop goes through a SPLIT.  The
+       other instructions have a single successor and are visited again
+       on each path. */
+
+    const SRE_CHAR* ptr = (const SRE_CHAR *)state->beginning + pos;
+    Py_ssize_t groups = pattern[2];
+    Py_ssize_t nslots = 2 + 2 * groups + pattern[3];
+    Py_ssize_t codesize = pattern[1];
+    Py_ssize_t sp = 0;
+    Py_ssize_t slot, i;
+
+#define LINEAR_PUSH(value) \
+    do { \
+        if (sp == *stacksize && linear_stack_grow(stack, stacksize) < 0) \
+            return SRE_ERROR_MEMORY; \
+        (*stack)[sp++] = (value); \
+    } while (0)
+
+    LINEAR_PUSH(pc);
+    while (sp > 0) {
+        pc = (*stack)[--sp];
+        if (pc < 0) {
+            slot = -pc - 1;
+            slots[slot] = (*stack)[--sp];
+            continue;
+        }
+        switch (pattern[pc]) {
+
+        case SRE_OP_GOTO:
+            /* <GOTO> <target> */
+            LINEAR_PUSH(pattern[pc+1]);
+            break;
+
+        case SRE_OP_SPLIT:
+            /* <SPLIT> <first> <second> <depth> */
+            /* what can be reached from here only depends on which of
+               the enclosing repeats started their current iteration at
+               this position (as it decides whether LOOP_END leaves the
+               repeat).  If one did, so did all the inner ones, so the
+               outermost is enough to tell. */
+            for (i = 0; i < (Py_ssize_t)pattern[pc+3]; i++) {
+                if (slots[2 + 2 * groups + i] == pos)
+                    break;
+            }
+            i = pc + i * codesize;
+            if (visited[i] == pos)
+                break;
+            visited[i] = pos;
+            LINEAR_PUSH(pattern[pc+2]);
+            LINEAR_PUSH(pattern[pc+1]);
+            break;
+
+        case SRE_OP_MARK:
+            /* <MARK> <gid> */
+            slot = 2 + pattern[pc+1];
+            LINEAR_PUSH(slots[slot]);
+            LINEAR_PUSH(-slot - 1);
+            if (pattern[pc+1] & 1) {
+                LINEAR_PUSH(slots[1]);
+                LINEAR_PUSH(-1 - 1);
+                slots[1] = pattern[pc+1] / 2 + 1;
+            }
+            slots[slot] = pos;
+            LINEAR_PUSH(pc + 2);
+            break;
+
+        case SRE_OP_LOOP_BEGIN:
+            /* <LOOP_BEGIN> <reg> */
+            slot = 2 + 2 * groups + pattern[pc+1];
+            LINEAR_PUSH(slots[slot]);
+            LINEAR_PUSH(-slot - 1);
+            slots[slot] = pos;
+            LINEAR_PUSH(pc + 2);
+            break;
+
+        case SRE_OP_LOOP_END:
+            /* <LOOP_END> <reg> <exit> */
+            /* leave the loop if this iteration matched the empty string,
+               as the backtracking engine does */
+            slot = 2 + 2 * groups + pattern[pc+1];
+            LINEAR_PUSH((slots[slot] == pos) ? pattern[pc+2] : pc + 3);
+            break;
+
+        case SRE_OP_AT:
+            /* <AT> <code> */
+            if (SRE(at)(state, ptr, pattern[pc+1]))
+                LINEAR_PUSH(pc + 2);
+            break;
+
+        case SRE_OP_FAILURE:
+            break;
+
+        default:
+            /* single character instruction or SUCCESS */
+            if (visited[pc] == pos)
+                break;
+            visited[pc] = pos;
+            list_pc[count] = pc;
+            memcpy(list_slots + count * nslots, slots,
+                   nslots * sizeof(Py_ssize_t));
+            count++;
+            break;
+        }
+    }
+#undef LINEAR_PUSH
+    return count;
+}
+
+/* check if the pattern matches at state->start (search == 0) or at any
+   position from state->start on (search != 0).  returns <0 for error, 0
+   for failure, and 1 for success */
+LOCAL(Py_ssize_t)
+SRE(linear)(SRE_STATE* state, const SRE_CODE* pattern, int search)
+{
+    /* <LINEAR> <1=codesize> <2=groups> <3=registers> <4=threads> ... */
+    const SRE_CHAR* beginning = (const SRE_CHAR *)state->beginning;
+    Py_ssize_t start = (const SRE_CHAR *)state->start - beginning;
+    Py_ssize_t end = (const SRE_CHAR *)state->end - beginning;
+    Py_ssize_t codesize = pattern[1];
+    Py_ssize_t groups = pattern[2];
+    Py_ssize_t nslots = 2 + 2 * groups + pattern[3];
+    Py_ssize_t nthreads = pattern[4];
+    Py_ssize_t *visited, *stack, *slots, *found;
+    Py_ssize_t *cur_pc, *cur_slots, *next_pc, *next_slots, *tmp;
+    Py_ssize_t nvisited, stacksize, count, next_count, pos, i;
+    Py_ssize_t match_end = -1;
+    unsigned int sigcount = state->sigcount;
+    int status;
+
+    if (pattern[5] == SRE_OP_SET)
+        /* pattern sets are matched by SRE(linear_set) */
+        return SRE_ERROR_ILLEGAL;
+
+    /* allocate everything at once from the data stack */
+    assert(state->data_stack_base == 0);
+    nvisited = codesize * (pattern[3] + 1);
+    status = data_stack_grow(state, sizeof(Py_ssize_t) *
+                             (nvisited + (2 + 2 * nthreads) * nslots +
+                              2 * nthreads));
+    if (status < 0)
+        return status;
+    visited = (Py_ssize_t *)state->data_stack;
+    slots = visited + nvisited;
+    found = slots + nslots;
+    cur_pc = found + nslots;
+    next_pc = cur_pc + nthreads;
+    cur_slots = next_pc + nthreads;
+    next_slots = cur_slots + nthreads * nslots;
+
+    stacksize = 5 * codesize + 1;
+    stack = PyMem_New(Py_ssize_t, stacksize);
+    if (!stack)
+        return SRE_ERROR_MEMORY;
+
+    for (i = 0; i < nvisited; i++)
+        visited[i] = -1;
+
+    count = 0;
+    for (pos = start; ; pos++) {
+        if (match_end < 0 && (search || pos == start)) {
+            /* start a new thread, with the lowest priority */
+            slots[0] = pos;
+            for (i = 1; i < nslots; i++)
+                slots[i] = -1;
+            count = SRE(linear_add)(state, pattern, 5, pos, slots,
+                                    visited, &stack, &stacksize, cur_pc,
+                                    cur_slots, count);
+            if (count < 0) {
+                status = (int)count;
+                goto exit;
+            }
+        }
+        if (count == 0 && (match_end >= 0 || !search))
+            break;
+
+        next_count = 0;
+        for (i = 0; i < count; i++) {
+            const SRE_CODE* code = pattern + cur_pc[i];
+            Py_ssize_t* thread = cur_slots + i * nslots;
+            Py_ssize_t next;
+
+            if (code[0] == SRE_OP_SUCCESS) {
+                if ((state->match_all && pos != end) ||
+                    (state->must_advance && pos == start))
+                    continue;
+                memcpy(found, thread, nslots * sizeof(Py_ssize_t));
+                match_end = pos;
+                /* drop all threads with a lower priority */
+                break;
+            }
+            if (pos >= end || !SRE(linear_char)(state, code, beginning[pos]))
+                continue;
+            switch (code[0]) {
+            case SRE_OP_IN:
+            case SRE_OP_IN_IGNORE:
+            case SRE_OP_IN_UNI_IGNORE:
+            case SRE_OP_IN_LOC_IGNORE:
+                next = cur_pc[i] + 1 + code[1];
+                break;
+            case SRE_OP_ANY:
+            case SRE_OP_ANY_ALL:
+                next = cur_pc[i] + 1;
+                break;
+            default:
+                next = cur_pc[i] + 2;
+                break;
+            }
+            memcpy(slots, thread, nslots * sizeof(Py_ssize_t));
+            next_count = SRE(linear_add)(state, pattern, next, pos + 1, slots,
+                                         visited, &stack, &stacksize, next_pc,
+                                         next_slots, next_count);
+            if (next_count < 0) {
+                status = (int)next_count;
+                goto exit;
+            }
+        }
+
+        tmp = cur_pc; cur_pc = next_pc; next_pc = tmp;
+        tmp = cur_slots; cur_slots = next_slots; next_slots = tmp;
+        count = next_count;
+
+        if (pos >= end)
+            break;
+        if ((0 == (++sigcount & 0xfff)) && PyErr_CheckSignals()) {
+            status = SRE_ERROR_INTERRUPTED;
+            goto exit;
+        }
+    }
+
+    status = 0;
+    if (match_end < 0)
+        goto exit;
+
+    state->start = beginning + found[0];
+    state->ptr = beginning + match_end;
+    state->lastindex = found[1];
+    for (i = 0; i < 2 * groups; i++)
+        state->mark[i] = (found[2+i] < 0) ? NULL : beginning + found[2+i];
+    state->lastmark = (int)(2 * groups - 1);
+    status = 1;
+
+exit:
+    state->sigcount = sigcount;
+    PyMem_Free(stack);
+    return status;
+}
+
+/* match all the patterns of a pattern set (a program starting with
+   <SET> <count> <start>...) in a single pass, at state->start (search
+   == 0) or at any position from state->start on (search != 0).  spans
+   receives the start and end of the leftmost match of each pattern, or
+   -1 if it does not match.  returns <0 for error, or the number of
+   patterns which matched */
+LOCAL(Py_ssize_t)
+SRE(linear_set)(SRE_STATE* state, const SRE_CODE* pattern, int search,
+                Py_ssize_t* spans)
+{
+    /* <LINEAR> <1=codesize> <2=groups> <3=registers> <4=threads>
+       <SET> <6=count> <7=start>... */
+    const SRE_CHAR* beginning = (const SRE_CHAR *)state->beginning;
+    Py_ssize_t start = (const SRE_CHAR *)state->start - beginning;
+    Py_ssize_t end = (const SRE_CHAR *)state->end - beginning;
+    Py_ssize_t codesize = pattern[1];
+    Py_ssize_t nslots = 2 + pattern[3];
+    Py_ssize_t nthreads = pattern[4];
+    Py_ssize_t npatterns = pattern[6];
+    Py_ssize_t *visited, *stack, *slots, *cut;
+    Py_ssize_t *cur_pc, *cur_slots, *next_pc, *next_slots, *tmp;
+    Py_ssize_t nvisited, stacksize, count, next_count, pos, i, k;
+    Py_ssize_t nfound = 0;
+    unsigned int sigcount = state->sigcount;
+    int status;
+
+    assert(pattern[0] == SRE_OP_LINEAR && pattern[5] == SRE_OP_SET);
+    assert(pattern[2] == 0);
+
+    /* the threads have no group marks, slot 1 holds the index of the
+       pattern they belong to */
+    assert(state->data_stack_base == 0);
+    nvisited = codesize * (pattern[3] + 1);
+    status = data_stack_grow(state, sizeof(Py_ssize_t) *
+                             (nvisited + npatterns +
+                              (1 + 2 * nthreads) * nslots + 2 * nthreads));
+    if (status < 0)
+        return status;
+    visited = (Py_ssize_t *)state->data_stack;
+    cut = visited + nvisited;
+    slots = cut + npatterns;
+    cur_pc = slots + nslots;
+    next_pc = cur_pc + nthreads;
+    cur_slots = next_pc + nthreads;
+    next_slots = cur_slots + nthreads * nslots;
+
+    stacksize = 5 * codesize + 1;
+    stack = PyMem_New(Py_ssize_t, stacksize);
+    if (!stack)
+        return SRE_ERROR_MEMORY;
+
+    for (i = 0; i < nvisited; i++)
+        visited[i] = -1;
+    for (k = 0; k < npatterns; k++) {
+        cut[k] = -1;
+        spans[2*k] = spans[2*k+1] = -1;
+    }
+
+    count = 0;
+    for (pos = start; ; pos++) {
+        if (search || pos == start) {
+            /* start a new thread for each pattern which has not matched
+               yet, with the lowest priority */
+            for (k = 0; k < npatterns; k++) {
+                if (spans[2*k] >= 0)
+                    continue;
+                slots[0] = pos;
+                slots[1] = k;
+                for (i = 2; i < nslots; i++)
+                    slots[i] = -1;
+                count = SRE(linear_add)(state, pattern, pattern[7+k], pos,
+                                        slots, visited, &stack, &stacksize,
+                                        cur_pc, cur_slots, count);
+                if (count < 0) {
+                    nfound = count;
+                    goto exit;
+                }
+            }
+        }
+        if (count == 0 && (nfound == npatterns || !search))
+            break;
+
+        next_count = 0;
+        for (i = 0; i < count; i++) {
+            const SRE_CODE* code = pattern + cur_pc[i];
+            Py_ssize_t* thread = cur_slots + i * nslots;
+            Py_ssize_t next;
+
+            k = thread[1];
+            if (cut[k] == pos)
+                continue;
+            if (code[0] == SRE_OP_SUCCESS) {
+                if (state->match_all && pos != end)
+                    continue;
+                if (spans[2*k] < 0)
+                    nfound++;
+                spans[2*k] = thread[0];
+                spans[2*k+1] = pos;
+                /* drop the threads of this pattern with a lower
+                   priority */
+                cut[k] = pos;
+                continue;
+            }
+            if (pos >= end || !SRE(linear_char)(state, code, beginning[pos]))
+                continue;
+            switch (code[0]) {
+            case SRE_OP_IN:
+            case SRE_OP_IN_IGNORE:
+            case SRE_OP_IN_UNI_IGNORE:
+            case SRE_OP_IN_LOC_IGNORE:
+                next = cur_pc[i] + 1 + code[1];
+                break;
+            case SRE_OP_ANY:
+            case SRE_OP_ANY_ALL:
+                next = cur_pc[i] + 1;
+                break;
+            default:
+                next = cur_pc[i] + 2;
+                break;
+            }
+            memcpy(slots, thread, nslots * sizeof(Py_ssize_t));
+            next_count = SRE(linear_add)(state, pattern, next, pos + 1, slots,
+                                         visited, &stack, &stacksize, next_pc,
+                                         next_slots, next_count);
+            if (next_count < 0) {
+                nfound = next_count;
+                goto exit;
+            }
+        }
+
+        tmp = cur_pc; cur_pc = next_pc; next_pc = tmp;
+        tmp = cur_slots; cur_slots = next_slots; next_slots = tmp;
+        count = next_count;
+
+        if (pos >= end)
+            break;
+        if ((0 == (++sigcount & 0xfff)) && PyErr_CheckSignals()) {
+            nfound = SRE_ERROR_INTERRUPTED;
+            goto exit;
+        }
+    }
+
+exit:
+    state->sigcount = sigcount;
+    PyMem_Free(stack);
+    return nfound;
+}
+
 #undef SRE_CHAR
 #undef SIZEOF_SRE_CHAR
 #undef SRE
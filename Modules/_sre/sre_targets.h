@@ -11,7 +11,7 @@
  * See the sre.c file for information on usage and redistribution.
  */
 
-static void *sre_targets[43] = {
+static void *sre_targets[49] = {
     &&TARGET_SRE_OP_FAILURE,
     &&TARGET_SRE_OP_SUCCESS,
     &&TARGET_SRE_OP_ANY,
@@ -55,4 +55,10 @@ static void *sre_targets[43] = {
     &&TARGET_SRE_OP_LITERAL_UNI_IGNORE,
     &&TARGET_SRE_OP_NOT_LITERAL_UNI_IGNORE,
     &&TARGET_SRE_OP_RANGE_UNI_IGNORE,
+    &&TARGET_SRE_OP_LINEAR,
+    &&TARGET_SRE_OP_SPLIT,
+    &&TARGET_SRE_OP_GOTO,
+    &&TARGET_SRE_OP_LOOP_BEGIN,
+    &&TARGET_SRE_OP_LOOP_END,
+    &&TARGET_SRE_OP_SET,
 };
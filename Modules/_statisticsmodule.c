@@ -7,13 +7,91 @@
 #endif
 
 #include "Python.h"
+
+#include <stdlib.h>               // qsort()
+#include <string.h>               // memcpy()
+
+/* Critical sections are only needed, and only available, in the
+   free-threaded build, which does not use the limited C API. */
+#ifndef Py_BEGIN_CRITICAL_SECTION
+#  define Py_BEGIN_CRITICAL_SECTION(op) {
+#  define Py_END_CRITICAL_SECTION() }
+#  define Py_BEGIN_CRITICAL_SECTION2(a, b) {
+#  define Py_END_CRITICAL_SECTION2() }
+#endif
+
+typedef struct {
+    PyObject *StatisticsError;
+    PyTypeObject *RunningStats_type;
+    PyTypeObject *RunningCovariance_type;
+    PyTypeObject *QuantileSketch_type;
+} statistics_state;
+
+static struct PyModuleDef statisticsmodule;
+
+static inline statistics_state *
+get_statistics_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (statistics_state *)state;
+}
+
+static inline statistics_state *
+find_statistics_state_by_type(PyTypeObject *type)
+{
+    PyObject *module = PyType_GetModuleByDef(type, &statisticsmodule);
+    assert(module != NULL);
+    return get_statistics_state(module);
+}
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t n;
+    double mean;
+    double m2;          /* sum of squared differences from the mean */
+    double min;
+    double max;
+} runningstatsobject;
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t n;
+    double mean_x;
+    double mean_y;
+    double m2x;
+    double m2y;
+    double cxy;         /* sum of products of differences from the means */
+} runningcovobject;
+
+typedef struct {
+    double mean;
+    double weight;
+} centroid;
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t compression;
+    Py_ssize_t capacity;
+    /* The first nmerged centroids are sorted and merged, followed by
+       nunmerged centroids added since the last compression. */
+    centroid *centroids;
+    Py_ssize_t nmerged;
+    Py_ssize_t nunmerged;
+    long long total;
+    double min;
+    double max;
+} quantilesketchobject;
+
 #include "clinic/_statisticsmodule.c.h"
 
 /*[clinic input]
 module _statistics
-
+class _statistics.RunningStats "runningstatsobject *" "clinic_state()->RunningStats_type"
+class _statistics.RunningCovariance "runningcovobject *" "clinic_state()->RunningCovariance_type"
+class _statistics.QuantileSketch "quantilesketchobject *" "clinic_state()->QuantileSketch_type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=864a6f59b76123b2]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=262410f94cbdec7f]*/
 
 /*
  * There is no closed-form solution to the inverse CDF for the normal
@@ -126,6 +204,1380 @@ _statistics__normal_dist_inv_cdf_impl(PyObject *module, double p, double mu,
 }
 
 
+/* Streaming statistics.  See the pure Python versions in Lib/statistics.py,
+   which these must match exactly. */
+
+static void
+statistics_error(PyObject *self, const char *message)
+{
+    statistics_state *state = find_statistics_state_by_type(Py_TYPE(self));
+    PyErr_SetString(state->StatisticsError, message);
+}
+
+static PyObject *
+streaming_repr(PyObject *self, long long count)
+{
+    PyObject *name = PyType_GetName(Py_TYPE(self));
+    if (name == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyUnicode_FromFormat("<%U count=%lld>", name, count);
+    Py_DECREF(name);
+    return result;
+}
+
+static void
+streaming_dealloc(PyObject *self)
+{
+    PyTypeObject *tp = Py_TYPE(self);
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+    tp_free(self);
+    Py_DECREF(tp);
+}
+
+static PyObject *
+streaming_alloc(PyTypeObject *type)
+{
+    allocfunc tp_alloc = (allocfunc)PyType_GetSlot(type, Py_tp_alloc);
+    return tp_alloc(type, 0);
+}
+
+/* RunningStats */
+
+static void
+runningstats_add(runningstatsobject *self, double x)
+{
+    Py_ssize_t n = self->n + 1;
+    double delta = x - self->mean;
+    self->mean += delta / (double)n;
+    self->m2 += delta * (x - self->mean);
+    self->n = n;
+    if (n == 1) {
+        self->min = self->max = x;
+    }
+    else {
+        if (x < self->min) {
+            self->min = x;
+        }
+        if (x > self->max) {
+            self->max = x;
+        }
+    }
+}
+
+static int
+runningstats_update(runningstatsobject *self, PyObject *data)
+{
+    PyObject *it, *item;
+    double x;
+
+    it = PyObject_GetIter(data);
+    if (it == NULL) {
+        return -1;
+    }
+    while ((item = PyIter_Next(it)) != NULL) {
+        x = PyFloat_AsDouble(item);
+        Py_DECREF(item);
+        if (x == -1.0 && PyErr_Occurred()) {
+            Py_DECREF(it);
+            return -1;
+        }
+        runningstats_add(self, x);
+    }
+    Py_DECREF(it);
+    return PyErr_Occurred() ? -1 : 0;
+}
+
+PyDoc_STRVAR(runningstats_doc,
+"RunningStats(data=(), /)\n"
+"--\n"
+"\n"
+"Count, mean, variance, minimum and maximum of a stream of numbers.\n"
+"\n"
+"The data points are not stored.  The mean and variance are updated with\n"
+"Welford's algorithm, which is numerically stable.");
+
+static PyObject *
+runningstats_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *data = NULL;
+
+    if (kwargs != NULL && PyDict_Size(kwargs) != 0) {
+        PyErr_SetString(PyExc_TypeError,
+                        "RunningStats() takes no keyword arguments");
+        return NULL;
+    }
+    if (!PyArg_UnpackTuple(args, "RunningStats", 0, 1, &data)) {
+        return NULL;
+    }
+    runningstatsobject *self = (runningstatsobject *)streaming_alloc(type);
+    if (self == NULL) {
+        return NULL;
+    }
+    if (data != NULL && runningstats_update(self, data) < 0) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+/*[clinic input]
+_statistics.RunningStats.add
+
+    x: double
+    /
+
+Add the data point x.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningStats_add_impl(runningstatsobject *self, double x)
+/*[clinic end generated code: output=7333285f3a0d6db9 input=65b2509fa3d0194d]*/
+{
+    Py_BEGIN_CRITICAL_SECTION(self);
+    runningstats_add(self, x);
+    Py_END_CRITICAL_SECTION();
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_statistics.RunningStats.update
+
+    data: object
+    /
+
+Add the data points from the iterable data.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningStats_update_impl(runningstatsobject *self,
+                                     PyObject *data)
+/*[clinic end generated code: output=70aeaaba41547b71 input=56c32afda310bb63]*/
+{
+    int rc;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    rc = runningstats_update(self, data);
+    Py_END_CRITICAL_SECTION();
+    if (rc < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_statistics.RunningStats.merge
+
+    other: object
+    /
+
+Add the data points accumulated by another RunningStats.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningStats_merge_impl(runningstatsobject *self,
+                                    PyObject *other)
+/*[clinic end generated code: output=69c85ee3ea53e99d input=35acd041094de5aa]*/
+{
+    PyTypeObject *tp = Py_TYPE((PyObject *)self);
+    statistics_state *state = find_statistics_state_by_type(tp);
+    if (!PyObject_TypeCheck(other, state->RunningStats_type)) {
+        PyErr_Format(PyExc_TypeError,
+                     "merge() argument must be RunningStats, not %T", other);
+        return NULL;
+    }
+    runningstatsobject *b = (runningstatsobject *)other;
+    Py_BEGIN_CRITICAL_SECTION2(self, other);
+    Py_ssize_t na = self->n, nb = b->n;
+    if (nb == 0) {
+        /* Nothing to add */
+    }
+    else if (na == 0) {
+        self->n = b->n;
+        self->mean = b->mean;
+        self->m2 = b->m2;
+        self->min = b->min;
+        self->max = b->max;
+    }
+    else {
+        double n = (double)na + (double)nb;
+        double delta = b->mean - self->mean;
+        self->mean += delta * (double)nb / n;
+        self->m2 += b->m2 + delta * delta * (double)na * (double)nb / n;
+        self->n = na + nb;
+        if (b->min < self->min) {
+            self->min = b->min;
+        }
+        if (b->max > self->max) {
+            self->max = b->max;
+        }
+    }
+    Py_END_CRITICAL_SECTION2();
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_statistics.RunningStats.__getstate__
+
+Return the state of the accumulator, for pickling.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningStats___getstate___impl(runningstatsobject *self)
+/*[clinic end generated code: output=a0bafc5677145494 input=cab5aa1b342db42d]*/
+{
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    result = Py_BuildValue("(ndddd)", self->n, self->mean, self->m2,
+                           self->min, self->max);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+/*[clinic input]
+_statistics.RunningStats.__setstate__
+
+    state: object
+    /
+
+Restore the state of the accumulator, for unpickling.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningStats___setstate___impl(runningstatsobject *self,
+                                           PyObject *state)
+/*[clinic end generated code: output=1c0ba703138b6836 input=437ec321664db404]*/
+{
+    Py_ssize_t n;
+    double mean, m2, min, max;
+    if (!PyArg_ParseTuple(state, "ndddd;invalid RunningStats state",
+                          &n, &mean, &m2, &min, &max))
+    {
+        return NULL;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    self->n = n;
+    self->mean = mean;
+    self->m2 = m2;
+    self->min = min;
+    self->max = max;
+    Py_END_CRITICAL_SECTION();
+    Py_RETURN_NONE;
+}
+
+/* RunningCovariance */
+
+static void
+runningcov_add(runningcovobject *self, double x, double y)
+{
+    Py_ssize_t n = self->n + 1;
+    double dx = x - self->mean_x;
+    double dy = y - self->mean_y;
+    self->mean_x += dx / (double)n;
+    self->mean_y += dy / (double)n;
+    self->m2x += dx * (x - self->mean_x);
+    self->m2y += dy * (y - self->mean_y);
+    self->cxy += dx * (y - self->mean_y);
+    self->n = n;
+}
+
+static int
+runningcov_update(runningcovobject *self, PyObject *x, PyObject *y)
+{
+    PyObject *it_x, *it_y = NULL, *item_x = NULL, *item_y = NULL;
+    double vx, vy;
+
+    it_x = PyObject_GetIter(x);
+    if (it_x == NULL) {
+        return -1;
+    }
+    it_y = PyObject_GetIter(y);
+    if (it_y == NULL) {
+        goto error;
+    }
+    for (;;) {
+        item_x = PyIter_Next(it_x);
+        if (item_x == NULL && PyErr_Occurred()) {
+            goto error;
+        }
+        item_y = PyIter_Next(it_y);
+        if (item_y == NULL && PyErr_Occurred()) {
+            goto error;
+        }
+        if (item_x == NULL || item_y == NULL) {
+            if (item_x != NULL || item_y != NULL) {
+                PyErr_SetString(PyExc_ValueError,
+                                "update() arguments have different lengths");
+                goto error;
+            }
+            break;
+        }
+        vx = PyFloat_AsDouble(item_x);
+        if (vx == -1.0 && PyErr_Occurred()) {
+            goto error;
+        }
+        vy = PyFloat_AsDouble(item_y);
+        if (vy == -1.0 && PyErr_Occurred()) {
+            goto error;
+        }
+        Py_CLEAR(item_x);
+        Py_CLEAR(item_y);
+        runningcov_add(self, vx, vy);
+    }
+    Py_DECREF(it_x);
+    Py_DECREF(it_y);
+    return 0;
+
+  error:
+    Py_XDECREF(item_x);
+    Py_XDECREF(item_y);
+    Py_DECREF(it_x);
+    Py_XDECREF(it_y);
+    return -1;
+}
+
+PyDoc_STRVAR(runningcov_doc,
+"RunningCovariance(x=(), y=(), /)\n"
+"--\n"
+"\n"
+"Covariance and correlation of a stream of pairs of numbers.\n"
+"\n"
+"The data points are not stored.");
+
+static PyObject *
+runningcov_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *x = NULL, *y = NULL;
+
+    if (kwargs != NULL && PyDict_Size(kwargs) != 0) {
+        PyErr_SetString(PyExc_TypeError,
+                        "RunningCovariance() takes no keyword arguments");
+        return NULL;
+    }
+    if (!PyArg_UnpackTuple(args, "RunningCovariance", 0, 2, &x, &y)) {
+        return NULL;
+    }
+    runningcovobject *self = (runningcovobject *)streaming_alloc(type);
+    if (self == NULL) {
+        return NULL;
+    }
+    if (x != NULL) {
+        int rc;
+        if (y == NULL) {
+            /* Fails unless x is empty, like the Python version */
+            y = PyTuple_New(0);
+            if (y == NULL) {
+                Py_DECREF(self);
+                return NULL;
+            }
+            rc = runningcov_update(self, x, y);
+            Py_DECREF(y);
+        }
+        else {
+            rc = runningcov_update(self, x, y);
+        }
+        if (rc < 0) {
+            Py_DECREF(self);
+            return NULL;
+        }
+    }
+    return (PyObject *)self;
+}
+
+/*[clinic input]
+_statistics.RunningCovariance.add
+
+    x: double
+    y: double
+    /
+
+Add the pair of data points x and y.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningCovariance_add_impl(runningcovobject *self, double x,
+                                       double y)
+/*[clinic end generated code: output=f82f911298d0dd70 input=aafb2d09d090dbb8]*/
+{
+    Py_BEGIN_CRITICAL_SECTION(self);
+    runningcov_add(self, x, y);
+    Py_END_CRITICAL_SECTION();
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_statistics.RunningCovariance.update
+
+    x: object
+    y: object
+    /
+
+Add the pairs of data points from the iterables x and y.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningCovariance_update_impl(runningcovobject *self,
+                                          PyObject *x, PyObject *y)
+/*[clinic end generated code: output=7ae28b2ebe39d3ca input=a92fb6eb2fe2aeda]*/
+{
+    int rc;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    rc = runningcov_update(self, x, y);
+    Py_END_CRITICAL_SECTION();
+    if (rc < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_statistics.RunningCovariance.merge
+
+    other: object
+    /
+
+Add the data points accumulated by another RunningCovariance.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningCovariance_merge_impl(runningcovobject *self,
+                                         PyObject *other)
+/*[clinic end generated code: output=8295ba1ac7b88a5e input=4cbfee01d4bf3e4b]*/
+{
+    PyTypeObject *tp = Py_TYPE((PyObject *)self);
+    statistics_state *state = find_statistics_state_by_type(tp);
+    if (!PyObject_TypeCheck(other, state->RunningCovariance_type)) {
+        PyErr_Format(PyExc_TypeError,
+                     "merge() argument must be RunningCovariance, not %T",
+                     other);
+        return NULL;
+    }
+    runningcovobject *b = (runningcovobject *)other;
+    Py_BEGIN_CRITICAL_SECTION2(self, other);
+    Py_ssize_t na = self->n, nb = b->n;
+    if (nb == 0) {
+        /* Nothing to add */
+    }
+    else if (na == 0) {
+        self->n = b->n;
+        self->mean_x = b->mean_x;
+        self->mean_y = b->mean_y;
+        self->m2x = b->m2x;
+        self->m2y = b->m2y;
+        self->cxy = b->cxy;
+    }
+    else {
+        double n = (double)na + (double)nb;
+        double dx = b->mean_x - self->mean_x;
+        double dy = b->mean_y - self->mean_y;
+        self->mean_x += dx * (double)nb / n;
+        self->mean_y += dy * (double)nb / n;
+        self->m2x += b->m2x + dx * dx * (double)na * (double)nb / n;
+        self->m2y += b->m2y + dy * dy * (double)na * (double)nb / n;
+        self->cxy += b->cxy + dx * dy * (double)na * (double)nb / n;
+        self->n = na + nb;
+    }
+    Py_END_CRITICAL_SECTION2();
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_statistics.RunningCovariance.__getstate__
+
+Return the state of the accumulator, for pickling.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningCovariance___getstate___impl(runningcovobject *self)
+/*[clinic end generated code: output=fe311ad7ec0d4c24 input=3a21c5cd181df827]*/
+{
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    result = Py_BuildValue("(nddddd)", self->n, self->mean_x, self->mean_y,
+                           self->m2x, self->m2y, self->cxy);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+/*[clinic input]
+_statistics.RunningCovariance.__setstate__
+
+    state: object
+    /
+
+Restore the state of the accumulator, for unpickling.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_RunningCovariance___setstate___impl(runningcovobject *self,
+                                                PyObject *state)
+/*[clinic end generated code: output=368a5642bcb8f601 input=103f2bbf62f0965e]*/
+{
+    Py_ssize_t n;
+    double mean_x, mean_y, m2x, m2y, cxy;
+    if (!PyArg_ParseTuple(state, "nddddd;invalid RunningCovariance state",
+                          &n, &mean_x, &mean_y, &m2x, &m2y, &cxy))
+    {
+        return NULL;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    self->n = n;
+    self->mean_x = mean_x;
+    self->mean_y = mean_y;
+    self->m2x = m2x;
+    self->m2y = m2y;
+    self->cxy = cxy;
+    Py_END_CRITICAL_SECTION();
+    Py_RETURN_NONE;
+}
+
+/* QuantileSketch: a merging t-digest.
+ *
+ * Dunning, T. (2019).  The t-digest: Efficient estimates of distributions.
+ * https://arxiv.org/abs/1902.04023
+ */
+
+static int
+centroid_compare(const void *a, const void *b)
+{
+    const centroid *x = a, *y = b;
+    if (x->mean != y->mean) {
+        return x->mean < y->mean ? -1 : 1;
+    }
+    if (x->weight != y->weight) {
+        return x->weight < y->weight ? -1 : 1;
+    }
+    return 0;
+}
+
+/* Largest cumulative fraction q2 such that k(q2) - k(q) <= 1, for the
+   scale function k(q) = compression / tau * asin(2*q - 1). */
+static double
+tdigest_limit(double q, double scale)
+{
+    double x = (scale * asin(2.0 * q - 1.0) + 1.0) / scale;
+    if (x >= Py_MATH_PI / 2.0) {
+        return 1.0;
+    }
+    return (sin(x) + 1.0) / 2.0;
+}
+
+static void
+sketch_compress(quantilesketchobject *self)
+{
+    centroid *c = self->centroids;
+    Py_ssize_t n = self->nmerged + self->nunmerged, k = 0;
+    double total, scale, mean, weight, before, limit;
+
+    if (self->nunmerged == 0) {
+        return;
+    }
+    qsort(c, n, sizeof(centroid), centroid_compare);
+    total = (double)self->total;
+    scale = (double)self->compression / (double)Py_MATH_TAU;
+    mean = c[0].mean;
+    weight = c[0].weight;
+    before = 0.0;
+    limit = tdigest_limit(before / total, scale);
+    for (Py_ssize_t i = 1; i < n; i++) {
+        double x = c[i].mean, w = c[i].weight;
+        if ((before + weight + w) / total <= limit) {
+            weight += w;
+            mean += (x - mean) * w / weight;
+        }
+        else {
+            /* k < i, so this does not overwrite unread centroids */
+            c[k].mean = mean;
+            c[k].weight = weight;
+            k++;
+            before += weight;
+            limit = tdigest_limit(before / total, scale);
+            mean = x;
+            weight = w;
+        }
+    }
+    c[k].mean = mean;
+    c[k].weight = weight;
+    self->nmerged = k + 1;
+    self->nunmerged = 0;
+}
+
+static void
+sketch_add_centroid(quantilesketchobject *self, double mean, double weight)
+{
+    Py_ssize_t i = self->nmerged + self->nunmerged;
+    assert(i < self->capacity);
+    self->centroids[i].mean = mean;
+    self->centroids[i].weight = weight;
+    self->nunmerged++;
+    if (i + 1 >= self->capacity) {
+        sketch_compress(self);
+    }
+}
+
+static int
+sketch_add(quantilesketchobject *self, double x)
+{
+    if (!isfinite(x)) {
+        PyErr_SetString(PyExc_ValueError, "data points must be finite");
+        return -1;
+    }
+    if (self->total == 0) {
+        self->min = self->max = x;
+    }
+    else {
+        if (x < self->min) {
+            self->min = x;
+        }
+        if (x > self->max) {
+            self->max = x;
+        }
+    }
+    self->total++;
+    sketch_add_centroid(self, x, 1.0);
+    return 0;
+}
+
+static int
+sketch_update(quantilesketchobject *self, PyObject *data)
+{
+    PyObject *it, *item;
+    double x;
+
+    it = PyObject_GetIter(data);
+    if (it == NULL) {
+        return -1;
+    }
+    while ((item = PyIter_Next(it)) != NULL) {
+        x = PyFloat_AsDouble(item);
+        Py_DECREF(item);
+        if ((x == -1.0 && PyErr_Occurred()) || sketch_add(self, x) < 0) {
+            Py_DECREF(it);
+            return -1;
+        }
+    }
+    Py_DECREF(it);
+    return PyErr_Occurred() ? -1 : 0;
+}
+
+static int
+sketch_set_compression(quantilesketchobject *self, Py_ssize_t compression)
+{
+    centroid *centroids;
+
+    if (compression < 1) {
+        PyErr_SetString(PyExc_ValueError, "compression must be at least 1");
+        return -1;
+    }
+    if (compression > (PY_SSIZE_T_MAX - 10) / 6) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    centroids = PyMem_New(centroid, 6 * compression + 10);
+    if (centroids == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    PyMem_Free(self->centroids);
+    self->centroids = centroids;
+    self->compression = compression;
+    self->capacity = 6 * compression + 10;
+    self->nmerged = self->nunmerged = 0;
+    self->total = 0;
+    self->min = self->max = 0.0;
+    return 0;
+}
+
+/* The estimated value of rank t, self being compressed */
+static double
+sketch_quantile(quantilesketchobject *self, double p)
+{
+    double t = p * (double)(self->total - 1);
+    double before = 0.0, prev_rank = 0.0, prev_value = self->min, rank;
+
+    for (Py_ssize_t i = 0; i < self->nmerged; i++) {
+        double mean = self->centroids[i].mean;
+        double weight = self->centroids[i].weight;
+        rank = before + (weight - 1.0) / 2.0;
+        if (t <= rank) {
+            if (rank == prev_rank) {
+                return mean;
+            }
+            return (prev_value + (mean - prev_value)
+                    * (t - prev_rank) / (rank - prev_rank));
+        }
+        before += weight;
+        prev_rank = rank;
+        prev_value = mean;
+    }
+    rank = (double)self->total - 1.0;
+    if (rank == prev_rank) {
+        return prev_value;
+    }
+    return (prev_value + (self->max - prev_value)
+            * (t - prev_rank) / (rank - prev_rank));
+}
+
+PyDoc_STRVAR(quantilesketch_doc,
+"QuantileSketch(data=(), /, *, compression=100)\n"
+"--\n"
+"\n"
+"Approximate quantiles of a stream of numbers.\n"
+"\n"
+"This is a merging t-digest: the data points are summarized by a bounded\n"
+"number of weighted centroids, which are smaller near both ends of the\n"
+"distribution, so that extreme quantiles are estimated accurately.\n"
+"Larger values of compression use more memory and give more accurate\n"
+"results.");
+
+static PyObject *
+quantilesketch_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"", "compression", NULL};
+    PyObject *data = NULL;
+    Py_ssize_t compression = 100;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|O$n:QuantileSketch",
+                                     kwlist, &data, &compression))
+    {
+        return NULL;
+    }
+    quantilesketchobject *self = (quantilesketchobject *)streaming_alloc(type);
+    if (self == NULL) {
+        return NULL;
+    }
+    if (sketch_set_compression(self, compression) < 0 ||
+        (data != NULL && sketch_update(self, data) < 0))
+    {
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+/*[clinic input]
+_statistics.QuantileSketch.add
+
+    x: double
+    /
+
+Add the data point x.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_QuantileSketch_add_impl(quantilesketchobject *self, double x)
+/*[clinic end generated code: output=85292d0726f8daf3 input=5b3ea73a3a0b085e]*/
+{
+    int rc;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    rc = sketch_add(self, x);
+    Py_END_CRITICAL_SECTION();
+    if (rc < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_statistics.QuantileSketch.update
+
+    data: object
+    /
+
+Add the data points from the iterable data.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_QuantileSketch_update_impl(quantilesketchobject *self,
+                                       PyObject *data)
+/*[clinic end generated code: output=1025e0a7033aea96 input=498eba784f67e5db]*/
+{
+    int rc;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    rc = sketch_update(self, data);
+    Py_END_CRITICAL_SECTION();
+    if (rc < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_statistics.QuantileSketch.merge
+
+    other: object
+    /
+
+Add the data points summarized by another QuantileSketch.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_QuantileSketch_merge_impl(quantilesketchobject *self,
+                                      PyObject *other)
+/*[clinic end generated code: output=14e80c3d80c023d6 input=4f8839dfc5aeef1a]*/
+{
+    PyTypeObject *tp = Py_TYPE((PyObject *)self);
+    statistics_state *state = find_statistics_state_by_type(tp);
+    if (!PyObject_TypeCheck(other, state->QuantileSketch_type)) {
+        PyErr_Format(PyExc_TypeError,
+                     "merge() argument must be QuantileSketch, not %T", other);
+        return NULL;
+    }
+    quantilesketchobject *b = (quantilesketchobject *)other;
+    centroid *copy = NULL;
+    Py_ssize_t n = 0;
+    int rc = 0;
+
+    Py_BEGIN_CRITICAL_SECTION2(self, other);
+    if (b->total != 0) {
+        sketch_compress(b);
+        /* Copy the centroids of other, which may be self */
+        n = b->nmerged;
+        copy = PyMem_New(centroid, n);
+        if (copy == NULL) {
+            PyErr_NoMemory();
+            rc = -1;
+        }
+        else {
+            memcpy(copy, b->centroids, n * sizeof(centroid));
+            if (self->total == 0) {
+                self->min = b->min;
+                self->max = b->max;
+            }
+            else {
+                if (b->min < self->min) {
+                    self->min = b->min;
+                }
+                if (b->max > self->max) {
+                    self->max = b->max;
+                }
+            }
+            self->total += b->total;
+            for (Py_ssize_t i = 0; i < n; i++) {
+                sketch_add_centroid(self, copy[i].mean, copy[i].weight);
+            }
+            PyMem_Free(copy);
+        }
+    }
+    Py_END_CRITICAL_SECTION2();
+    if (rc < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_statistics.QuantileSketch.quantile
+
+    p: double
+    /
+
+Estimate the value below which a fraction p of the data falls.
+
+The estimate is linearly interpolated between the centroids, with 0.0
+giving the minimum and 1.0 the maximum.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_QuantileSketch_quantile_impl(quantilesketchobject *self,
+                                         double p)
+/*[clinic end generated code: output=66e9f292677bc032 input=2885f1e56e160e1c]*/
+{
+    double result = 0.0;
+    int empty;
+    if (!(0.0 <= p && p <= 1.0)) {
+        PyErr_SetString(PyExc_ValueError,
+                        "p must be in the range 0.0 <= p <= 1.0");
+        return NULL;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    empty = self->total == 0;
+    if (!empty) {
+        sketch_compress(self);
+        result = sketch_quantile(self, p);
+    }
+    Py_END_CRITICAL_SECTION();
+    if (empty) {
+        statistics_error((PyObject *)self,
+                         "quantile requires at least one data point");
+        return NULL;
+    }
+    return PyFloat_FromDouble(result);
+}
+
+/*[clinic input]
+_statistics.QuantileSketch.quantiles
+
+    n: Py_ssize_t = 4
+
+Divide into n continuous intervals with equal probability.
+
+Returns a list of (n - 1) estimated cut points separating the
+intervals, like quantiles(data, n=n, method='inclusive').
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_QuantileSketch_quantiles_impl(quantilesketchobject *self,
+                                          Py_ssize_t n)
+/*[clinic end generated code: output=fbf37a6c4d646a9a input=baeb7adabaa25a09]*/
+{
+    PyObject *result = NULL;
+    if (n < 1) {
+        statistics_error((PyObject *)self, "n must be at least 1");
+        return NULL;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    if (self->total == 0) {
+        statistics_error((PyObject *)self,
+                         "quantile requires at least one data point");
+    }
+    else {
+        sketch_compress(self);
+        result = PyList_New(n - 1);
+        for (Py_ssize_t i = 1; result != NULL && i < n; i++) {
+            PyObject *q = PyFloat_FromDouble(
+                sketch_quantile(self, (double)i / (double)n));
+            if (q == NULL) {
+                Py_CLEAR(result);
+                break;
+            }
+            PyList_SetItem(result, i - 1, q);
+        }
+    }
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+/*[clinic input]
+_statistics.QuantileSketch.__getstate__
+
+Return the state of the sketch, for pickling.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_QuantileSketch___getstate___impl(quantilesketchobject *self)
+/*[clinic end generated code: output=2beed2065cf74a03 input=f4661f8f37488bf4]*/
+{
+    PyObject *means = NULL, *weights = NULL, *result = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    sketch_compress(self);
+    means = PyList_New(self->nmerged);
+    weights = PyList_New(self->nmerged);
+    if (means == NULL || weights == NULL) {
+        goto done;
+    }
+    for (Py_ssize_t i = 0; i < self->nmerged; i++) {
+        PyObject *mean = PyFloat_FromDouble(self->centroids[i].mean);
+        if (mean == NULL) {
+            goto done;
+        }
+        PyList_SetItem(means, i, mean);
+        PyObject *weight = PyFloat_FromDouble(self->centroids[i].weight);
+        if (weight == NULL) {
+            goto done;
+        }
+        PyList_SetItem(weights, i, weight);
+    }
+    result = Py_BuildValue("(nOOLdd)", self->compression, means, weights,
+                           self->total, self->min, self->max);
+  done:
+    Py_END_CRITICAL_SECTION();
+    Py_XDECREF(means);
+    Py_XDECREF(weights);
+    return result;
+}
+
+/*[clinic input]
+_statistics.QuantileSketch.__setstate__
+
+    state: object
+    /
+
+Restore the state of the sketch, for unpickling.
+[clinic start generated code]*/
+
+static PyObject *
+_statistics_QuantileSketch___setstate___impl(quantilesketchobject *self,
+                                             PyObject *state)
+/*[clinic end generated code: output=4dcb036c858883cd input=db55aaea1e660123]*/
+{
+    Py_ssize_t compression, n;
+    PyObject *means, *weights;
+    long long total;
+    double min, max;
+    centroid *centroids = NULL;
+    int rc = -1;
+
+    if (!PyArg_ParseTuple(state, "nOOLdd;invalid QuantileSketch state",
+                          &compression, &means, &weights, &total,
+                          &min, &max))
+    {
+        return NULL;
+    }
+    means = PySequence_Tuple(means);
+    if (means == NULL) {
+        return NULL;
+    }
+    weights = PySequence_Tuple(weights);
+    if (weights == NULL) {
+        Py_DECREF(means);
+        return NULL;
+    }
+    n = PyTuple_Size(means);
+    if (n != PyTuple_Size(weights) || compression < 1 ||
+        compression > (PY_SSIZE_T_MAX - 10) / 6 ||
+        n > 6 * compression + 10 || total < 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid QuantileSketch state");
+        goto done;
+    }
+    centroids = PyMem_New(centroid, 6 * compression + 10);
+    if (centroids == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        centroids[i].mean = PyFloat_AsDouble(PyTuple_GetItem(means, i));
+        if (centroids[i].mean == -1.0 && PyErr_Occurred()) {
+            goto done;
+        }
+        centroids[i].weight = PyFloat_AsDouble(PyTuple_GetItem(weights, i));
+        if (centroids[i].weight == -1.0 && PyErr_Occurred()) {
+            goto done;
+        }
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    PyMem_Free(self->centroids);
+    self->centroids = centroids;
+    self->compression = compression;
+    self->capacity = 6 * compression + 10;
+    self->nmerged = n;
+    self->nunmerged = 0;
+    self->total = total;
+    self->min = min;
+    self->max = max;
+    Py_END_CRITICAL_SECTION();
+    centroids = NULL;
+    rc = 0;
+
+  done:
+    PyMem_Free(centroids);
+    Py_DECREF(means);
+    Py_DECREF(weights);
+    if (rc < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
+#define STREAMING_GETTER(type, name, expr, check, message) \
+    static PyObject * \
+    type##_get_##name(PyObject *op, void *Py_UNUSED(closure)) \
+    { \
+        type##object *self = (type##object *)op; \
+        double value = 0.0; \
+        int ok; \
+        Py_BEGIN_CRITICAL_SECTION(op); \
+        ok = (check); \
+        if (ok) { \
+            value = (expr); \
+        } \
+        Py_END_CRITICAL_SECTION(); \
+        if (!ok) { \
+            statistics_error(op, message); \
+            return NULL; \
+        } \
+        return PyFloat_FromDouble(value); \
+    }
+
+STREAMING_GETTER(runningstats, mean, self->mean, self->n > 0,
+                 "mean requires at least one data point")
+STREAMING_GETTER(runningstats, variance, self->m2 / (double)(self->n - 1),
+                 self->n > 1, "variance requires at least two data points")
+STREAMING_GETTER(runningstats, pvariance, self->m2 / (double)self->n,
+                 self->n > 0, "pvariance requires at least one data point")
+STREAMING_GETTER(runningstats, stdev, sqrt(self->m2 / (double)(self->n - 1)),
+                 self->n > 1, "variance requires at least two data points")
+STREAMING_GETTER(runningstats, pstdev, sqrt(self->m2 / (double)self->n),
+                 self->n > 0, "pvariance requires at least one data point")
+STREAMING_GETTER(runningstats, min, self->min, self->n > 0,
+                 "min requires at least one data point")
+STREAMING_GETTER(runningstats, max, self->max, self->n > 0,
+                 "max requires at least one data point")
+STREAMING_GETTER(runningcov, covariance, self->cxy / (double)(self->n - 1),
+                 self->n > 1, "covariance requires at least two data points")
+STREAMING_GETTER(quantilesketch, min, self->min, self->total > 0,
+                 "min requires at least one data point")
+STREAMING_GETTER(quantilesketch, max, self->max, self->total > 0,
+                 "max requires at least one data point")
+
+#undef STREAMING_GETTER
+
+static PyObject *
+runningcov_get_correlation(PyObject *op, void *Py_UNUSED(closure))
+{
+    runningcovobject *self = (runningcovobject *)op;
+    Py_ssize_t n;
+    double m2x, m2y, cxy;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    n = self->n;
+    m2x = self->m2x;
+    m2y = self->m2y;
+    cxy = self->cxy;
+    Py_END_CRITICAL_SECTION();
+    if (n < 2) {
+        statistics_error((PyObject *)self,
+                         "correlation requires at least two data points");
+        return NULL;
+    }
+    if (m2x == 0.0 || m2y == 0.0) {
+        statistics_error((PyObject *)self,
+                         "at least one of the inputs is constant");
+        return NULL;
+    }
+    return PyFloat_FromDouble(cxy / (sqrt(m2x) * sqrt(m2y)));
+}
+
+static PyObject *
+runningstats_get_count(PyObject *op, void *Py_UNUSED(closure))
+{
+    runningstatsobject *self = (runningstatsobject *)op;
+    Py_ssize_t n;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    n = self->n;
+    Py_END_CRITICAL_SECTION();
+    return PyLong_FromSsize_t(n);
+}
+
+static PyObject *
+runningcov_get_count(PyObject *op, void *Py_UNUSED(closure))
+{
+    runningcovobject *self = (runningcovobject *)op;
+    Py_ssize_t n;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    n = self->n;
+    Py_END_CRITICAL_SECTION();
+    return PyLong_FromSsize_t(n);
+}
+
+static PyObject *
+quantilesketch_get_count(PyObject *op, void *Py_UNUSED(closure))
+{
+    quantilesketchobject *self = (quantilesketchobject *)op;
+    long long total;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    total = self->total;
+    Py_END_CRITICAL_SECTION();
+    return PyLong_FromLongLong(total);
+}
+
+static PyObject *
+quantilesketch_get_compression(PyObject *op, void *Py_UNUSED(closure))
+{
+    quantilesketchobject *self = (quantilesketchobject *)op;
+    Py_ssize_t compression;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    compression = self->compression;
+    Py_END_CRITICAL_SECTION();
+    return PyLong_FromSsize_t(compression);
+}
+
+static PyObject *
+runningstats_repr(PyObject *op)
+{
+    runningstatsobject *self = (runningstatsobject *)op;
+    Py_ssize_t n;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    n = self->n;
+    Py_END_CRITICAL_SECTION();
+    return streaming_repr(op, n);
+}
+
+static PyObject *
+runningcov_repr(PyObject *op)
+{
+    runningcovobject *self = (runningcovobject *)op;
+    Py_ssize_t n;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    n = self->n;
+    Py_END_CRITICAL_SECTION();
+    return streaming_repr(op, n);
+}
+
+static PyObject *
+quantilesketch_repr(PyObject *op)
+{
+    quantilesketchobject *self = (quantilesketchobject *)op;
+    long long total;
+    Py_ssize_t compression;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    total = self->total;
+    compression = self->compression;
+    Py_END_CRITICAL_SECTION();
+    PyObject *name = PyType_GetName(Py_TYPE(op));
+    if (name == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyUnicode_FromFormat("<%U count=%lld compression=%zd>",
+                                            name, total, compression);
+    Py_DECREF(name);
+    return result;
+}
+
+static void
+quantilesketch_dealloc(PyObject *op)
+{
+    quantilesketchobject *self = (quantilesketchobject *)op;
+    PyMem_Free(self->centroids);
+    streaming_dealloc(op);
+}
+
+/* Pickle with protocols 0 and 1 as well, which do not use __getstate__()
+   for objects without a __dict__. */
+static PyObject *
+streaming_reduce(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *state = PyObject_CallMethod(self, "__getstate__", NULL);
+    if (state == NULL) {
+        return NULL;
+    }
+    return Py_BuildValue("(O()N)", (PyObject *)Py_TYPE(self), state);
+}
+
+#define STREAMING_REDUCE_METHODDEF \
+    {"__reduce__", streaming_reduce, METH_NOARGS, \
+     PyDoc_STR("Return state information for pickling.")},
+
+static PyMethodDef runningstats_methods[] = {
+    _STATISTICS_RUNNINGSTATS_ADD_METHODDEF
+    _STATISTICS_RUNNINGSTATS_UPDATE_METHODDEF
+    _STATISTICS_RUNNINGSTATS_MERGE_METHODDEF
+    _STATISTICS_RUNNINGSTATS___GETSTATE___METHODDEF
+    _STATISTICS_RUNNINGSTATS___SETSTATE___METHODDEF
+    STREAMING_REDUCE_METHODDEF
+    {NULL, NULL}
+};
+
+static PyGetSetDef runningstats_getset[] = {
+    {"count", runningstats_get_count, NULL,
+     PyDoc_STR("Number of data points.")},
+    {"mean", runningstats_get_mean, NULL,
+     PyDoc_STR("Arithmetic mean of the data points.")},
+    {"variance", runningstats_get_variance, NULL,
+     PyDoc_STR("Sample variance of the data points.")},
+    {"pvariance", runningstats_get_pvariance, NULL,
+     PyDoc_STR("Population variance of the data points.")},
+    {"stdev", runningstats_get_stdev, NULL,
+     PyDoc_STR("Sample standard deviation of the data points.")},
+    {"pstdev", runningstats_get_pstdev, NULL,
+     PyDoc_STR("Population standard deviation of the data points.")},
+    {"min", runningstats_get_min, NULL,
+     PyDoc_STR("Smallest data point.")},
+    {"max", runningstats_get_max, NULL,
+     PyDoc_STR("Largest data point.")},
+    {NULL}
+};
+
+static PyType_Slot runningstats_slots[] = {
+    {Py_tp_dealloc, streaming_dealloc},
+    {Py_tp_repr, runningstats_repr},
+    {Py_tp_doc, (void *)runningstats_doc},
+    {Py_tp_methods, runningstats_methods},
+    {Py_tp_getset, runningstats_getset},
+    {Py_tp_new, runningstats_new},
+    {0, NULL}
+};
+
+static PyType_Spec runningstats_spec = {
+    .name = "statistics.RunningStats",
+    .basicsize = sizeof(runningstatsobject),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE |
+             Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = runningstats_slots,
+};
+
+static PyMethodDef runningcov_methods[] = {
+    _STATISTICS_RUNNINGCOVARIANCE_ADD_METHODDEF
+    _STATISTICS_RUNNINGCOVARIANCE_UPDATE_METHODDEF
+    _STATISTICS_RUNNINGCOVARIANCE_MERGE_METHODDEF
+    _STATISTICS_RUNNINGCOVARIANCE___GETSTATE___METHODDEF
+    _STATISTICS_RUNNINGCOVARIANCE___SETSTATE___METHODDEF
+    STREAMING_REDUCE_METHODDEF
+    {NULL, NULL}
+};
+
+static PyGetSetDef runningcov_getset[] = {
+    {"count", runningcov_get_count, NULL,
+     PyDoc_STR("Number of pairs of data points.")},
+    {"covariance", runningcov_get_covariance, NULL,
+     PyDoc_STR("Sample covariance of the two inputs.")},
+    {"correlation", runningcov_get_correlation, NULL,
+     PyDoc_STR("Pearson's correlation coefficient of the two inputs.")},
+    {NULL}
+};
+
+static PyType_Slot runningcov_slots[] = {
+    {Py_tp_dealloc, streaming_dealloc},
+    {Py_tp_repr, runningcov_repr},
+    {Py_tp_doc, (void *)runningcov_doc},
+    {Py_tp_methods, runningcov_methods},
+    {Py_tp_getset, runningcov_getset},
+    {Py_tp_new, runningcov_new},
+    {0, NULL}
+};
+
+static PyType_Spec runningcov_spec = {
+    .name = "statistics.RunningCovariance",
+    .basicsize = sizeof(runningcovobject),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE |
+             Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = runningcov_slots,
+};
+
+static PyMethodDef quantilesketch_methods[] = {
+    _STATISTICS_QUANTILESKETCH_ADD_METHODDEF
+    _STATISTICS_QUANTILESKETCH_UPDATE_METHODDEF
+    _STATISTICS_QUANTILESKETCH_MERGE_METHODDEF
+    _STATISTICS_QUANTILESKETCH_QUANTILE_METHODDEF
+    _STATISTICS_QUANTILESKETCH_QUANTILES_METHODDEF
+    _STATISTICS_QUANTILESKETCH___GETSTATE___METHODDEF
+    _STATISTICS_QUANTILESKETCH___SETSTATE___METHODDEF
+    STREAMING_REDUCE_METHODDEF
+    {NULL, NULL}
+};
+
+static PyGetSetDef quantilesketch_getset[] = {
+    {"compression", quantilesketch_get_compression, NULL,
+     PyDoc_STR("The compression parameter.")},
+    {"count", quantilesketch_get_count, NULL,
+     PyDoc_STR("Number of data points.")},
+    {"min", quantilesketch_get_min, NULL,
+     PyDoc_STR("Smallest data point.")},
+    {"max", quantilesketch_get_max, NULL,
+     PyDoc_STR("Largest data point.")},
+    {NULL}
+};
+
+static PyType_Slot quantilesketch_slots[] = {
+    {Py_tp_dealloc, quantilesketch_dealloc},
+    {Py_tp_repr, quantilesketch_repr},
+    {Py_tp_doc, (void *)quantilesketch_doc},
+    {Py_tp_methods, quantilesketch_methods},
+    {Py_tp_getset, quantilesketch_getset},
+    {Py_tp_new, quantilesketch_new},
+    {0, NULL}
+};
+
+static PyType_Spec quantilesketch_spec = {
+    .name = "statistics.QuantileSketch",
+    .basicsize = sizeof(quantilesketchobject),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE |
+             Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = quantilesketch_slots,
+};
+
+
 static PyMethodDef statistics_methods[] = {
     _STATISTICS__NORMAL_DIST_INV_CDF_METHODDEF
     {NULL, NULL, 0, NULL}
@@ -134,7 +1586,65 @@ static PyMethodDef statistics_methods[] = {
 PyDoc_STRVAR(statistics_doc,
 "Accelerators for the statistics module.\n");
 
+static int
+statistics_exec(PyObject *module)
+{
+    statistics_state *state = get_statistics_state(module);
+
+#define ADD_TYPE(TYPE, SPEC)                                                \
+    do {                                                                    \
+        TYPE = (PyTypeObject *)PyType_FromModuleAndSpec(module, SPEC, NULL); \
+        if (TYPE == NULL) {                                                 \
+            return -1;                                                      \
+        }                                                                   \
+        if (PyModule_AddType(module, TYPE) < 0) {                           \
+            return -1;                                                      \
+        }                                                                   \
+    } while (0)
+
+    state->StatisticsError = PyErr_NewException("statistics.StatisticsError",
+                                                PyExc_ValueError, NULL);
+    if (PyModule_AddObjectRef(module, "StatisticsError",
+                              state->StatisticsError) < 0) {
+        return -1;
+    }
+    ADD_TYPE(state->RunningStats_type, &runningstats_spec);
+    ADD_TYPE(state->RunningCovariance_type, &runningcov_spec);
+    ADD_TYPE(state->QuantileSketch_type, &quantilesketch_spec);
+#undef ADD_TYPE
+    return 0;
+}
+
+static int
+statistics_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    statistics_state *state = get_statistics_state(module);
+    Py_VISIT(state->StatisticsError);
+    Py_VISIT(state->RunningStats_type);
+    Py_VISIT(state->RunningCovariance_type);
+    Py_VISIT(state->QuantileSketch_type);
+    return 0;
+}
+
+static int
+statistics_clear(PyObject *module)
+{
+    statistics_state *state = get_statistics_state(module);
+    Py_CLEAR(state->StatisticsError);
+    Py_CLEAR(state->RunningStats_type);
+    Py_CLEAR(state->RunningCovariance_type);
+    Py_CLEAR(state->QuantileSketch_type);
+    return 0;
+}
+
+static void
+statistics_free(void *module)
+{
+    (void)statistics_clear((PyObject *)module);
+}
+
 static struct PyModuleDef_Slot _statisticsmodule_slots[] = {
+    {Py_mod_exec, statistics_exec},
     {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
     {Py_mod_gil, Py_MOD_GIL_NOT_USED},
     {0, NULL}
@@ -144,12 +1654,12 @@ static struct PyModuleDef statisticsmodule = {
         PyModuleDef_HEAD_INIT,
         "_statistics",
         statistics_doc,
-        0,
+        sizeof(statistics_state),
         statistics_methods,
         _statisticsmodule_slots,
-        NULL,
-        NULL,
-        NULL
+        statistics_traverse,
+        statistics_clear,
+        statistics_free
 };
 
 PyMODINIT_FUNC
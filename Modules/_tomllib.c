@@ -0,0 +1,1827 @@
+/* C implementation of the tomllib parser.
+
+   loads() follows Lib/tomllib/_parser.py and Lib/tomllib/_re.py closely:
+   the same rules are checked in the same order, so that documents are
+   accepted or rejected identically, with the same TOMLDecodeError message
+   and position.  Arguments other than an exact str are passed to the pure
+   Python version, kept in tomllib._parser under the name _py_loads.
+*/
+
+#ifndef Py_BUILD_CORE_BUILTIN
+#  define Py_BUILD_CORE_MODULE 1
+#endif
+
+#include "Python.h"
+#include "pycore_ceval.h"         // _Py_EnterRecursiveCall()
+#include "pycore_long.h"          // _PyLong_DigitValue
+
+/*[clinic input]
+module _tomllib
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=ae07b5354b21dfdd]*/
+
+typedef struct {
+    /* tomllib._parser */
+    PyObject *parser;
+    /* tomllib._parser.TOMLDecodeError */
+    PyObject *decode_error;
+    /* tomllib._re.cached_tz */
+    PyObject *cached_tz;
+    /* datetime.date, datetime.time, datetime.datetime and
+       datetime.timezone.utc */
+    PyObject *date_type;
+    PyObject *time_type;
+    PyObject *datetime_type;
+    PyObject *utc;
+} tomllib_state;
+
+static inline tomllib_state *
+get_tomllib_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (tomllib_state *)state;
+}
+
+#include "clinic/_tomllib.c.h"
+
+
+/* Returned by char_at() past the end of the document. */
+#define END_OF_DOC ((Py_UCS4)-1)
+
+/* Flags.FROZEN and Flags.EXPLICIT_NEST */
+#define FLAG_FROZEN         0
+#define FLAG_EXPLICIT_NEST  1
+
+typedef struct {
+    tomllib_state *st;
+    /* The document, with "\r\n" replaced by "\n". */
+    PyObject *src;
+    int kind;
+    const void *data;
+    Py_ssize_t len;
+    /* NULL if parse_float is float. */
+    PyObject *parse_float;
+} Parser;
+
+static inline Py_UCS4
+char_at(Parser *p, Py_ssize_t pos)
+{
+    return pos < p->len ? PyUnicode_READ(p->kind, p->data, pos) : END_OF_DOC;
+}
+
+/* src.startswith(s, pos) for an ASCII string s. */
+static int
+startswith(Parser *p, Py_ssize_t pos, const char *s)
+{
+    for (; *s != '\0'; s++, pos++) {
+        if (char_at(p, pos) != (Py_UCS4)(unsigned char)*s) {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+static inline int
+is_ascii_digit(Py_UCS4 c)
+{
+    return '0' <= c && c <= '9';
+}
+
+static inline int
+is_hex_digit(Py_UCS4 c)
+{
+    return c < 128 && Py_ISXDIGIT(c);
+}
+
+static inline int
+is_bare_key_char(Py_UCS4 c)
+{
+    return c < 128 && (Py_ISALNUM(c) || c == '-' || c == '_');
+}
+
+/* ILLEGAL_BASIC_STR_CHARS and the other ILLEGAL_*_CHARS sets.  The
+   multiline sets also allow a newline. */
+static inline int
+is_illegal_char(Py_UCS4 c, int multiline)
+{
+    if (c == '\t' || (multiline && c == '\n')) {
+        return 0;
+    }
+    return c < 32 || c == 127;
+}
+
+/* skip_chars(src, pos, TOML_WS) */
+static inline Py_ssize_t
+skip_ws(Parser *p, Py_ssize_t pos)
+{
+    Py_UCS4 c;
+    while ((c = char_at(p, pos)) == ' ' || c == '\t') {
+        pos++;
+    }
+    return pos;
+}
+
+/* skip_chars(src, pos, TOML_WS_AND_NEWLINE) */
+static inline Py_ssize_t
+skip_ws_and_newlines(Parser *p, Py_ssize_t pos)
+{
+    Py_UCS4 c;
+    while ((c = char_at(p, pos)) == ' ' || c == '\t' || c == '\n') {
+        pos++;
+    }
+    return pos;
+}
+
+
+/* Errors */
+
+static void
+set_error(Parser *p, Py_ssize_t pos, const char *format, ...)
+{
+    va_list vargs;
+    va_start(vargs, format);
+    PyObject *msg = PyUnicode_FromFormatV(format, vargs);
+    va_end(vargs);
+    if (msg == NULL) {
+        return;
+    }
+    PyObject *exc = PyObject_CallFunction(p->st->decode_error, "OOn",
+                                          msg, p->src, pos);
+    Py_DECREF(msg);
+    if (exc == NULL) {
+        return;
+    }
+    PyErr_SetObject((PyObject *)Py_TYPE(exc), exc);
+    Py_DECREF(exc);
+}
+
+/* Set an error whose message includes the repr() of the character at pos,
+   as in f"Illegal character {char!r}". */
+static void
+set_char_error(Parser *p, Py_ssize_t pos, const char *format)
+{
+    PyObject *ch = PyUnicode_FromOrdinal(char_at(p, pos));
+    if (ch == NULL) {
+        return;
+    }
+    set_error(p, pos, format, ch);
+    Py_DECREF(ch);
+}
+
+/* raise TOMLDecodeError(msg, src, pos) from <the current exception> */
+static void
+set_error_from_cause(Parser *p, Py_ssize_t pos, const char *msg)
+{
+    PyObject *cause = PyErr_GetRaisedException();
+    set_error(p, pos, "%s", msg);
+    PyObject *exc = PyErr_GetRaisedException();
+    if (exc != NULL && cause != NULL) {
+        PyException_SetCause(exc, Py_NewRef(cause));
+        PyException_SetContext(exc, Py_NewRef(cause));
+    }
+    Py_XDECREF(cause);
+    PyErr_SetRaisedException(exc);
+}
+
+
+/* Flags
+
+   The Python version keeps a tree of dicts of the form
+   {"flags": set(), "recursive_flags": set(), "nested": {}}.  Here every
+   node is a two item list [bits, nested] where bits is an int with
+   1 << flag set for the flags and 1 << (flag + 2) for the recursive flags.
+*/
+
+typedef struct {
+    PyObject *root;         /* dict: key part -> node */
+    PyObject *pending;      /* list of keys to mark as EXPLICIT_NEST */
+} Flags;
+
+#define FLAG_BIT(flag, recursive)  (1L << ((flag) + ((recursive) ? 2 : 0)))
+
+static int
+flags_init(Flags *flags)
+{
+    flags->root = PyDict_New();
+    flags->pending = PyList_New(0);
+    if (flags->root == NULL || flags->pending == NULL) {
+        return -1;
+    }
+    return 0;
+}
+
+static void
+flags_fini(Flags *flags)
+{
+    Py_CLEAR(flags->root);
+    Py_CLEAR(flags->pending);
+}
+
+static inline long
+node_bits(PyObject *node)
+{
+    return PyLong_AsLong(PyList_GET_ITEM(node, 0));
+}
+
+static inline PyObject *
+node_nested(PyObject *node)
+{
+    return PyList_GET_ITEM(node, 1);
+}
+
+/* Return a borrowed reference to the node for k in cont, creating it if
+   needed. */
+static PyObject *
+flags_child(PyObject *cont, PyObject *k)
+{
+    PyObject *node = PyDict_GetItemWithError(cont, k);
+    if (node != NULL || PyErr_Occurred()) {
+        return node;
+    }
+    PyObject *bits = PyLong_FromLong(0);
+    PyObject *nested = PyDict_New();
+    if (bits == NULL || nested == NULL) {
+        Py_XDECREF(bits);
+        Py_XDECREF(nested);
+        return NULL;
+    }
+    node = PyList_New(2);
+    if (node == NULL) {
+        Py_DECREF(bits);
+        Py_DECREF(nested);
+        return NULL;
+    }
+    PyList_SET_ITEM(node, 0, bits);
+    PyList_SET_ITEM(node, 1, nested);
+    int rc = PyDict_SetItem(cont, k, node);
+    Py_DECREF(node);
+    return rc < 0 ? NULL : node;
+}
+
+/* Flags.set(key, flag, recursive=recursive) */
+static int
+flags_set(Flags *flags, PyObject *key, int flag, int recursive)
+{
+    PyObject *cont = flags->root;
+    PyObject *node = NULL;
+    Py_ssize_t n = PyTuple_GET_SIZE(key);
+    for (Py_ssize_t i = 0; i < n; i++) {
+        node = flags_child(cont, PyTuple_GET_ITEM(key, i));
+        if (node == NULL) {
+            return -1;
+        }
+        cont = node_nested(node);
+    }
+    assert(node != NULL);
+    PyObject *bits = PyLong_FromLong(node_bits(node) |
+                                     FLAG_BIT(flag, recursive));
+    if (bits == NULL) {
+        return -1;
+    }
+    PyList_SetItem(node, 0, bits);
+    return 0;
+}
+
+/* Flags.is_(key, flag) */
+static int
+flags_is(Flags *flags, PyObject *key, int flag)
+{
+    Py_ssize_t n = PyTuple_GET_SIZE(key);
+    if (n == 0) {
+        return 0;
+    }
+    PyObject *cont = flags->root;
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *node = PyDict_GetItemWithError(cont, PyTuple_GET_ITEM(key, i));
+        if (node == NULL) {
+            return PyErr_Occurred() ? -1 : 0;
+        }
+        long bits = node_bits(node);
+        if (i == n - 1) {
+            return (bits & (FLAG_BIT(flag, 0) | FLAG_BIT(flag, 1))) != 0;
+        }
+        if (bits & FLAG_BIT(flag, 1)) {
+            return 1;
+        }
+        cont = node_nested(node);
+    }
+    Py_UNREACHABLE();
+}
+
+/* Flags.unset_all(key) */
+static int
+flags_unset_all(Flags *flags, PyObject *key)
+{
+    Py_ssize_t n = PyTuple_GET_SIZE(key);
+    PyObject *cont = flags->root;
+    for (Py_ssize_t i = 0; i < n - 1; i++) {
+        PyObject *node = PyDict_GetItemWithError(cont, PyTuple_GET_ITEM(key, i));
+        if (node == NULL) {
+            return PyErr_Occurred() ? -1 : 0;
+        }
+        cont = node_nested(node);
+    }
+    return PyDict_Pop(cont, PyTuple_GET_ITEM(key, n - 1), NULL) < 0 ? -1 : 0;
+}
+
+/* Flags.finalize_pending() */
+static int
+flags_finalize_pending(Flags *flags)
+{
+    Py_ssize_t n = PyList_GET_SIZE(flags->pending);
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *key = PyList_GET_ITEM(flags->pending, i);
+        if (flags_set(flags, key, FLAG_EXPLICIT_NEST, 0) < 0) {
+            return -1;
+        }
+    }
+    return PyList_SetSlice(flags->pending, 0, n, NULL);
+}
+
+
+/* NestedDict */
+
+/* NestedDict.get_or_create_nest(key).  Return 0 and set *result to
+   a borrowed reference on success, return 1 where the Python version
+   raises KeyError, and return -1 with an exception set on failure. */
+static int
+get_or_create_nest(PyObject *root, PyObject *key, int access_lists,
+                   PyObject **result)
+{
+    PyObject *cont = root;
+    Py_ssize_t n = PyTuple_GET_SIZE(key);
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *k = PyTuple_GET_ITEM(key, i);
+        PyObject *next = PyDict_GetItemWithError(cont, k);
+        if (next == NULL) {
+            if (PyErr_Occurred()) {
+                return -1;
+            }
+            next = PyDict_New();
+            if (next == NULL) {
+                return -1;
+            }
+            int rc = PyDict_SetItem(cont, k, next);
+            Py_DECREF(next);
+            if (rc < 0) {
+                return -1;
+            }
+        }
+        cont = next;
+        if (access_lists && PyList_Check(cont)) {
+            Py_ssize_t size = PyList_GET_SIZE(cont);
+            if (size == 0) {
+                PyErr_SetString(PyExc_IndexError, "list index out of range");
+                return -1;
+            }
+            cont = PyList_GET_ITEM(cont, size - 1);
+        }
+        if (!PyDict_Check(cont)) {
+            return 1;
+        }
+    }
+    *result = cont;
+    return 0;
+}
+
+/* NestedDict.append_nest_to_list(key) */
+static int
+append_nest_to_list(PyObject *root, PyObject *key)
+{
+    Py_ssize_t n = PyTuple_GET_SIZE(key);
+    PyObject *parent_key = PyTuple_GetSlice(key, 0, n - 1);
+    if (parent_key == NULL) {
+        return -1;
+    }
+    PyObject *cont;
+    int rc = get_or_create_nest(root, parent_key, 1, &cont);
+    Py_DECREF(parent_key);
+    if (rc != 0) {
+        return rc;
+    }
+    PyObject *last_key = PyTuple_GET_ITEM(key, n - 1);
+    PyObject *list = PyDict_GetItemWithError(cont, last_key);
+    if (list == NULL && PyErr_Occurred()) {
+        return -1;
+    }
+    if (list != NULL && !PyList_Check(list)) {
+        return 1;
+    }
+    PyObject *item = PyDict_New();
+    if (item == NULL) {
+        return -1;
+    }
+    if (list != NULL) {
+        rc = PyList_Append(list, item);
+        Py_DECREF(item);
+        return rc;
+    }
+    list = PyList_New(1);
+    if (list == NULL) {
+        Py_DECREF(item);
+        return -1;
+    }
+    PyList_SET_ITEM(list, 0, item);
+    rc = PyDict_SetItem(cont, last_key, list);
+    Py_DECREF(list);
+    return rc;
+}
+
+/* header + key[:n] */
+static PyObject *
+concat_key(PyObject *header, PyObject *key, Py_ssize_t n)
+{
+    Py_ssize_t hlen = PyTuple_GET_SIZE(header);
+    PyObject *result = PyTuple_New(hlen + n);
+    if (result == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < hlen; i++) {
+        PyTuple_SET_ITEM(result, i, Py_NewRef(PyTuple_GET_ITEM(header, i)));
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyTuple_SET_ITEM(result, hlen + i, Py_NewRef(PyTuple_GET_ITEM(key, i)));
+    }
+    return result;
+}
+
+
+/* Skipping */
+
+/* skip_until(src, pos, expect, error_on=..., error_on_eof=...) where
+   error_on is ILLEGAL_*_STR_CHARS (multiline is true for the sets which
+   allow a newline). */
+static Py_ssize_t
+skip_until(Parser *p, Py_ssize_t pos, const char *expect, int multiline,
+           int error_on_eof)
+{
+    Py_UCS4 first = (unsigned char)expect[0];
+    Py_ssize_t illegal = -1;
+    Py_ssize_t new_pos = pos;
+    for (; new_pos < p->len; new_pos++) {
+        Py_UCS4 c = PyUnicode_READ(p->kind, p->data, new_pos);
+        if (c == first && startswith(p, new_pos, expect)) {
+            break;
+        }
+        if (illegal < 0 && is_illegal_char(c, multiline)) {
+            illegal = new_pos;
+        }
+    }
+    if (new_pos >= p->len) {
+        new_pos = p->len;
+        if (error_on_eof) {
+            PyObject *s = PyUnicode_FromString(expect);
+            if (s != NULL) {
+                set_error(p, new_pos, "Expected %R", s);
+                Py_DECREF(s);
+            }
+            return -1;
+        }
+    }
+    if (illegal >= 0) {
+        set_char_error(p, illegal, "Found invalid character %R");
+        return -1;
+    }
+    return new_pos;
+}
+
+static Py_ssize_t
+skip_comment(Parser *p, Py_ssize_t pos)
+{
+    if (char_at(p, pos) == '#') {
+        return skip_until(p, pos + 1, "\n", 0, 0);
+    }
+    return pos;
+}
+
+static Py_ssize_t
+skip_comments_and_array_ws(Parser *p, Py_ssize_t pos)
+{
+    while (1) {
+        Py_ssize_t pos_before_skip = pos;
+        pos = skip_ws_and_newlines(p, pos);
+        pos = skip_comment(p, pos);
+        if (pos < 0 || pos == pos_before_skip) {
+            return pos;
+        }
+    }
+}
+
+
+/* Strings */
+
+static int
+is_unicode_scalar_value(Py_UCS4 codepoint)
+{
+    return codepoint <= 55295 || (57344 <= codepoint && codepoint <= 1114111);
+}
+
+static Py_ssize_t
+parse_hex_char(Parser *p, Py_ssize_t pos, int hex_len,
+               PyUnicodeWriter *writer)
+{
+    Py_UCS4 value = 0;
+    for (int i = 0; i < hex_len; i++) {
+        Py_UCS4 c = char_at(p, pos + i);
+        if (!is_hex_digit(c)) {
+            set_error(p, pos, "Invalid hex value");
+            return -1;
+        }
+        value = value * 16 + (Py_UCS4)_PyLong_DigitValue[c];
+    }
+    pos += hex_len;
+    if (!is_unicode_scalar_value(value)) {
+        set_error(p, pos, "Escaped character is not a Unicode scalar value");
+        return -1;
+    }
+    if (PyUnicodeWriter_WriteChar(writer, value) < 0) {
+        return -1;
+    }
+    return pos;
+}
+
+/* parse_basic_str_escape(src, pos, multiline=multiline).  The escaped
+   character is written to writer. */
+static Py_ssize_t
+parse_basic_str_escape(Parser *p, Py_ssize_t pos, int multiline,
+                       PyUnicodeWriter *writer)
+{
+    Py_UCS4 c = char_at(p, pos + 1);
+    pos += 2;
+    if (multiline && (c == ' ' || c == '\t' || c == '\n')) {
+        /* Skip whitespace until next non-whitespace character or end of
+           the doc.  Error if non-whitespace is found before newline. */
+        if (c != '\n') {
+            pos = skip_ws(p, pos);
+            c = char_at(p, pos);
+            if (c == END_OF_DOC) {
+                return pos;
+            }
+            if (c != '\n') {
+                set_error(p, pos, "Unescaped '\\' in a string");
+                return -1;
+            }
+            pos++;
+        }
+        return skip_ws_and_newlines(p, pos);
+    }
+    Py_UCS4 replacement;
+    switch (c) {
+        case 'u':
+            return parse_hex_char(p, pos, 4, writer);
+        case 'U':
+            return parse_hex_char(p, pos, 8, writer);
+        case 'b': replacement = '\b'; break;
+        case 't': replacement = '\t'; break;
+        case 'n': replacement = '\n'; break;
+        case 'f': replacement = '\f'; break;
+        case 'r': replacement = '\r'; break;
+        case '"': replacement = '"'; break;
+        case '\\': replacement = '\\'; break;
+        default:
+            set_error(p, pos, "Unescaped '\\' in a string");
+            return -1;
+    }
+    if (PyUnicodeWriter_WriteChar(writer, replacement) < 0) {
+        return -1;
+    }
+    return pos;
+}
+
+/* parse_basic_str(src, pos, multiline=multiline) */
+static Py_ssize_t
+parse_basic_str(Parser *p, Py_ssize_t pos, int multiline, PyObject **result)
+{
+    /* Only created once an escape sequence is found. */
+    PyUnicodeWriter *writer = NULL;
+    Py_ssize_t start_pos = pos;
+    while (1) {
+        Py_UCS4 c = char_at(p, pos);
+        if (c == END_OF_DOC) {
+            set_error(p, pos, "Unterminated string");
+            goto error;
+        }
+        if (c == '"') {
+            Py_ssize_t end_pos;
+            if (!multiline) {
+                end_pos = pos + 1;
+            }
+            else if (startswith(p, pos, "\"\"\"")) {
+                end_pos = pos + 3;
+            }
+            else {
+                pos++;
+                continue;
+            }
+            if (writer == NULL) {
+                *result = PyUnicode_Substring(p->src, start_pos, pos);
+                return *result == NULL ? -1 : end_pos;
+            }
+            if (PyUnicodeWriter_WriteSubstring(writer, p->src,
+                                               start_pos, pos) < 0)
+            {
+                goto error;
+            }
+            *result = PyUnicodeWriter_Finish(writer);
+            return *result == NULL ? -1 : end_pos;
+        }
+        if (c == '\\') {
+            if (writer == NULL) {
+                writer = PyUnicodeWriter_Create(0);
+                if (writer == NULL) {
+                    return -1;
+                }
+            }
+            if (PyUnicodeWriter_WriteSubstring(writer, p->src,
+                                               start_pos, pos) < 0)
+            {
+                goto error;
+            }
+            pos = parse_basic_str_escape(p, pos, multiline, writer);
+            if (pos < 0) {
+                goto error;
+            }
+            start_pos = pos;
+            continue;
+        }
+        if (is_illegal_char(c, multiline)) {
+            set_char_error(p, pos, "Illegal character %R");
+            goto error;
+        }
+        pos++;
+    }
+
+error:
+    if (writer != NULL) {
+        PyUnicodeWriter_Discard(writer);
+    }
+    return -1;
+}
+
+static Py_ssize_t
+parse_literal_str(Parser *p, Py_ssize_t pos, PyObject **result)
+{
+    pos += 1;  /* Skip starting apostrophe */
+    Py_ssize_t start_pos = pos;
+    pos = skip_until(p, pos, "'", 0, 1);
+    if (pos < 0) {
+        return -1;
+    }
+    *result = PyUnicode_Substring(p->src, start_pos, pos);
+    return *result == NULL ? -1 : pos + 1;  /* Skip ending apostrophe */
+}
+
+static Py_ssize_t
+parse_multiline_str(Parser *p, Py_ssize_t pos, int literal, PyObject **result)
+{
+    pos += 3;
+    if (char_at(p, pos) == '\n') {
+        pos++;
+    }
+
+    Py_UCS4 delim;
+    PyObject *str;
+    if (literal) {
+        delim = '\'';
+        Py_ssize_t end_pos = skip_until(p, pos, "'''", 1, 1);
+        if (end_pos < 0) {
+            return -1;
+        }
+        str = PyUnicode_Substring(p->src, pos, end_pos);
+        if (str == NULL) {
+            return -1;
+        }
+        pos = end_pos + 3;
+    }
+    else {
+        delim = '"';
+        pos = parse_basic_str(p, pos, 1, &str);
+        if (pos < 0) {
+            return -1;
+        }
+    }
+
+    /* Add at maximum two extra apostrophes/quotes if the end sequence
+       is 4 or 5 chars long instead of just 3. */
+    int extra = 0;
+    while (extra < 2 && char_at(p, pos) == delim) {
+        extra++;
+        pos++;
+    }
+    if (extra == 0) {
+        *result = str;
+        return pos;
+    }
+    PyObject *tail = PyUnicode_FromOrdinal(delim);
+    if (tail != NULL && extra == 2) {
+        Py_SETREF(tail, PyUnicode_Concat(tail, tail));
+    }
+    if (tail == NULL) {
+        Py_DECREF(str);
+        return -1;
+    }
+    *result = PyUnicode_Concat(str, tail);
+    Py_DECREF(str);
+    Py_DECREF(tail);
+    return *result == NULL ? -1 : pos;
+}
+
+
+/* Keys */
+
+static Py_ssize_t
+parse_key_part(Parser *p, Py_ssize_t pos, PyObject **result)
+{
+    Py_UCS4 c = char_at(p, pos);
+    if (is_bare_key_char(c)) {
+        Py_ssize_t start_pos = pos;
+        do {
+            pos++;
+        } while (is_bare_key_char(char_at(p, pos)));
+        *result = PyUnicode_Substring(p->src, start_pos, pos);
+        return *result == NULL ? -1 : pos;
+    }
+    if (c == '\'') {
+        return parse_literal_str(p, pos, result);
+    }
+    if (c == '"') {
+        return parse_basic_str(p, pos + 1, 0, result);
+    }
+    set_error(p, pos, "Invalid initial character for a key part");
+    return -1;
+}
+
+static Py_ssize_t
+parse_key(Parser *p, Py_ssize_t pos, PyObject **key)
+{
+    PyObject *parts = PyList_New(0);
+    if (parts == NULL) {
+        return -1;
+    }
+    while (1) {
+        PyObject *part;
+        pos = parse_key_part(p, pos, &part);
+        if (pos < 0) {
+            goto error;
+        }
+        int rc = PyList_Append(parts, part);
+        Py_DECREF(part);
+        if (rc < 0) {
+            goto error;
+        }
+        pos = skip_ws(p, pos);
+        if (char_at(p, pos) != '.') {
+            break;
+        }
+        pos = skip_ws(p, pos + 1);
+    }
+    *key = PyList_AsTuple(parts);
+    Py_DECREF(parts);
+    return *key == NULL ? -1 : pos;
+
+error:
+    Py_DECREF(parts);
+    return -1;
+}
+
+
+/* Values */
+
+static Py_ssize_t parse_value(Parser *p, Py_ssize_t pos, PyObject **result);
+
+static Py_ssize_t
+parse_key_value_pair(Parser *p, Py_ssize_t pos, PyObject **key,
+                     PyObject **value)
+{
+    pos = parse_key(p, pos, key);
+    if (pos < 0) {
+        return -1;
+    }
+    if (char_at(p, pos) != '=') {
+        set_error(p, pos, "Expected '=' after a key in a key/value pair");
+        goto error;
+    }
+    pos = skip_ws(p, pos + 1);
+    pos = parse_value(p, pos, value);
+    if (pos < 0) {
+        goto error;
+    }
+    return pos;
+
+error:
+    Py_CLEAR(*key);
+    return -1;
+}
+
+static Py_ssize_t
+parse_array(Parser *p, Py_ssize_t pos, PyObject **result)
+{
+    PyObject *array = PyList_New(0);
+    if (array == NULL) {
+        return -1;
+    }
+    pos = skip_comments_and_array_ws(p, pos + 1);
+    if (pos < 0) {
+        goto error;
+    }
+    if (char_at(p, pos) == ']') {
+        goto done;
+    }
+    while (1) {
+        PyObject *value;
+        pos = parse_value(p, pos, &value);
+        if (pos < 0) {
+            goto error;
+        }
+        int rc = PyList_Append(array, value);
+        Py_DECREF(value);
+        if (rc < 0) {
+            goto error;
+        }
+        pos = skip_comments_and_array_ws(p, pos);
+        if (pos < 0) {
+            goto error;
+        }
+        Py_UCS4 c = char_at(p, pos);
+        if (c == ']') {
+            goto done;
+        }
+        if (c != ',') {
+            set_error(p, pos, "Unclosed array");
+            goto error;
+        }
+        pos = skip_comments_and_array_ws(p, pos + 1);
+        if (pos < 0) {
+            goto error;
+        }
+        if (char_at(p, pos) == ']') {
+            goto done;
+        }
+    }
+
+done:
+    *result = array;
+    return pos + 1;
+
+error:
+    Py_DECREF(array);
+    return -1;
+}
+
+static Py_ssize_t
+parse_inline_table(Parser *p, Py_ssize_t pos, PyObject **result)
+{
+    PyObject *key = NULL, *value = NULL;
+    Flags flags;
+    PyObject *table = PyDict_New();
+    if (table == NULL || flags_init(&flags) < 0) {
+        goto error;
+    }
+
+    pos = skip_ws(p, pos + 1);
+    if (char_at(p, pos) == '}') {
+        goto done;
+    }
+    while (1) {
+        pos = parse_key_value_pair(p, pos, &key, &value);
+        if (pos < 0) {
+            goto error;
+        }
+        int rc = flags_is(&flags, key, FLAG_FROZEN);
+        if (rc < 0) {
+            goto error;
+        }
+        if (rc) {
+            set_error(p, pos, "Cannot mutate immutable namespace %R", key);
+            goto error;
+        }
+        Py_ssize_t n = PyTuple_GET_SIZE(key);
+        PyObject *key_parent = PyTuple_GetSlice(key, 0, n - 1);
+        if (key_parent == NULL) {
+            goto error;
+        }
+        PyObject *nest;
+        rc = get_or_create_nest(table, key_parent, 0, &nest);
+        Py_DECREF(key_parent);
+        if (rc < 0) {
+            goto error;
+        }
+        if (rc) {
+            set_error(p, pos, "Cannot overwrite a value");
+            goto error;
+        }
+        PyObject *key_stem = PyTuple_GET_ITEM(key, n - 1);
+        rc = PyDict_Contains(nest, key_stem);
+        if (rc < 0) {
+            goto error;
+        }
+        if (rc) {
+            set_error(p, pos, "Duplicate inline table key %R", key_stem);
+            goto error;
+        }
+        if (PyDict_SetItem(nest, key_stem, value) < 0) {
+            goto error;
+        }
+        pos = skip_ws(p, pos);
+        Py_UCS4 c = char_at(p, pos);
+        if (c == '}') {
+            goto done;
+        }
+        if (c != ',') {
+            set_error(p, pos, "Unclosed inline table");
+            goto error;
+        }
+        if ((PyDict_Check(value) || PyList_Check(value)) &&
+            flags_set(&flags, key, FLAG_FROZEN, 1) < 0)
+        {
+            goto error;
+        }
+        Py_CLEAR(key);
+        Py_CLEAR(value);
+        pos = skip_ws(p, pos + 1);
+    }
+
+done:
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    flags_fini(&flags);
+    *result = table;
+    return pos + 1;
+
+error:
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    flags_fini(&flags);
+    Py_XDECREF(table);
+    return -1;
+}
+
+/* Call parse_float on src[start:end]. */
+static PyObject *
+call_parse_float(Parser *p, Py_ssize_t start, Py_ssize_t end)
+{
+    PyObject *s = PyUnicode_Substring(p->src, start, end);
+    if (s == NULL) {
+        return NULL;
+    }
+    PyObject *result;
+    if (p->parse_float == NULL) {
+        result = PyFloat_FromString(s);
+    }
+    else {
+        result = PyObject_CallOneArg(p->parse_float, s);
+        if (result != NULL && (PyDict_Check(result) || PyList_Check(result))) {
+            PyErr_SetString(PyExc_ValueError,
+                            "parse_float must not return dicts or lists");
+            Py_CLEAR(result);
+        }
+    }
+    Py_DECREF(s);
+    return result;
+}
+
+/* Parse n ASCII digits at pos. */
+static int
+digits_value(Parser *p, Py_ssize_t pos, Py_ssize_t n)
+{
+    int value = 0;
+    for (Py_ssize_t i = 0; i < n; i++) {
+        value = value * 10 + (int)(char_at(p, pos + i) - '0');
+    }
+    return value;
+}
+
+/* ([01][0-9]|2[0-3]) */
+static int
+match_hour(Parser *p, Py_ssize_t pos)
+{
+    Py_UCS4 c0 = char_at(p, pos), c1 = char_at(p, pos + 1);
+    return ((c0 == '0' || c0 == '1') && is_ascii_digit(c1)) ||
+           (c0 == '2' && '0' <= c1 && c1 <= '3');
+}
+
+/* [0-5][0-9] */
+static int
+match_minute(Parser *p, Py_ssize_t pos)
+{
+    Py_UCS4 c0 = char_at(p, pos);
+    return '0' <= c0 && c0 <= '5' && is_ascii_digit(char_at(p, pos + 1));
+}
+
+typedef struct {
+    int hour, minute, second, micros;
+} time_match;
+
+/* Match _TIME_RE_STR at pos.  Return the end position of the match or -1
+   if there is no match. */
+static Py_ssize_t
+match_time(Parser *p, Py_ssize_t pos, time_match *m)
+{
+    if (!match_hour(p, pos) || char_at(p, pos + 2) != ':' ||
+        !match_minute(p, pos + 3) || char_at(p, pos + 5) != ':' ||
+        !match_minute(p, pos + 6))
+    {
+        return -1;
+    }
+    m->hour = digits_value(p, pos, 2);
+    m->minute = digits_value(p, pos + 3, 2);
+    m->second = digits_value(p, pos + 6, 2);
+    m->micros = 0;
+    pos += 8;
+    if (char_at(p, pos) == '.' && is_ascii_digit(char_at(p, pos + 1))) {
+        /* Only the first six digits are used. */
+        int ndigits = 0;
+        pos++;
+        while (is_ascii_digit(char_at(p, pos))) {
+            if (ndigits < 6) {
+                m->micros = m->micros * 10 + (int)(char_at(p, pos) - '0');
+                ndigits++;
+            }
+            pos++;
+        }
+        for (; ndigits < 6; ndigits++) {
+            m->micros *= 10;
+        }
+    }
+    return pos;
+}
+
+/* Match RE_DATETIME at pos and convert it like match_to_datetime().
+   Return 0 if there is no match. */
+static Py_ssize_t
+parse_datetime(Parser *p, Py_ssize_t pos, PyObject **result)
+{
+    tomllib_state *st = p->st;
+    for (int i = 0; i < 4; i++) {
+        if (!is_ascii_digit(char_at(p, pos + i))) {
+            return 0;
+        }
+    }
+    Py_UCS4 m0 = char_at(p, pos + 5), m1 = char_at(p, pos + 6);
+    Py_UCS4 d0 = char_at(p, pos + 8), d1 = char_at(p, pos + 9);
+    if (char_at(p, pos + 4) != '-' ||
+        !((m0 == '0' && '1' <= m1 && m1 <= '9') ||
+          (m0 == '1' && '0' <= m1 && m1 <= '2')) ||
+        char_at(p, pos + 7) != '-' ||
+        !((d0 == '0' && '1' <= d1 && d1 <= '9') ||
+          ((d0 == '1' || d0 == '2') && is_ascii_digit(d1)) ||
+          (d0 == '3' && (d1 == '0' || d1 == '1'))))
+    {
+        return 0;
+    }
+    int year = digits_value(p, pos, 4);
+    int month = digits_value(p, pos + 5, 2);
+    int day = digits_value(p, pos + 8, 2);
+    Py_ssize_t end = pos + 10;
+
+    time_match t;
+    Py_UCS4 sep = char_at(p, end);
+    Py_ssize_t time_end = -1;
+    if (sep == 'T' || sep == 't' || sep == ' ') {
+        time_end = match_time(p, end + 1, &t);
+    }
+    if (time_end < 0) {
+        *result = PyObject_CallFunction(st->date_type, "iii",
+                                        year, month, day);
+    }
+    else {
+        PyObject *tz;
+        end = time_end;
+        Py_UCS4 c = char_at(p, end);
+        if ((c == '+' || c == '-') && match_hour(p, end + 1) &&
+            char_at(p, end + 3) == ':' && match_minute(p, end + 4))
+        {
+            PyObject *hour_str = PyUnicode_Substring(p->src, end + 1, end + 3);
+            PyObject *minute_str = PyUnicode_Substring(p->src, end + 4, end + 6);
+            PyObject *sign_str = PyUnicode_Substring(p->src, end, end + 1);
+            if (hour_str == NULL || minute_str == NULL || sign_str == NULL) {
+                tz = NULL;
+            }
+            else {
+                tz = PyObject_CallFunctionObjArgs(st->cached_tz, hour_str,
+                                                  minute_str, sign_str, NULL);
+            }
+            Py_XDECREF(hour_str);
+            Py_XDECREF(minute_str);
+            Py_XDECREF(sign_str);
+            if (tz == NULL) {
+                goto error;
+            }
+            end += 6;
+        }
+        else if (c == 'Z' || c == 'z') {
+            tz = Py_NewRef(st->utc);
+            end++;
+        }
+        else {
+            tz = Py_NewRef(Py_None);
+        }
+        *result = PyObject_CallFunction(st->datetime_type, "iiiiiiiO",
+                                        year, month, day, t.hour, t.minute,
+                                        t.second, t.micros, tz);
+        Py_DECREF(tz);
+    }
+    if (*result != NULL) {
+        return end;
+    }
+
+error:
+    if (PyErr_ExceptionMatches(PyExc_ValueError)) {
+        set_error_from_cause(p, pos, "Invalid date or datetime");
+    }
+    return -1;
+}
+
+/* Match RE_LOCALTIME at pos and convert it like match_to_localtime().
+   Return 0 if there is no match. */
+static Py_ssize_t
+parse_localtime(Parser *p, Py_ssize_t pos, PyObject **result)
+{
+    time_match t;
+    Py_ssize_t end = match_time(p, pos, &t);
+    if (end < 0) {
+        return 0;
+    }
+    *result = PyObject_CallFunction(p->st->time_type, "iiii",
+                                    t.hour, t.minute, t.second, t.micros);
+    return *result == NULL ? -1 : end;
+}
+
+/* Match [0-9](?:_?[0-9])* (or the same with another digit class) at pos.
+   Return the end of the match, or pos if there is no match. */
+static Py_ssize_t
+match_digits(Parser *p, Py_ssize_t pos, int (*is_digit)(Py_UCS4))
+{
+    if (!is_digit(char_at(p, pos))) {
+        return pos;
+    }
+    pos++;
+    while (1) {
+        Py_UCS4 c = char_at(p, pos);
+        if (is_digit(c)) {
+            pos++;
+        }
+        else if (c == '_' && is_digit(char_at(p, pos + 1))) {
+            pos += 2;
+        }
+        else {
+            return pos;
+        }
+    }
+}
+
+static int
+is_dec_digit(Py_UCS4 c)
+{
+    return is_ascii_digit(c);
+}
+
+static int
+is_bin_digit(Py_UCS4 c)
+{
+    return c == '0' || c == '1';
+}
+
+static int
+is_oct_digit(Py_UCS4 c)
+{
+    return '0' <= c && c <= '7';
+}
+
+static int
+is_hex_digit_func(Py_UCS4 c)
+{
+    return is_hex_digit(c);
+}
+
+/* Match RE_NUMBER at pos and convert it like match_to_number().
+   Return 0 if there is no match. */
+static Py_ssize_t
+parse_number(Parser *p, Py_ssize_t pos, PyObject **result)
+{
+    Py_ssize_t end = -1;
+    if (char_at(p, pos) == '0') {
+        int (*is_digit)(Py_UCS4) = NULL;
+        switch (char_at(p, pos + 1)) {
+            case 'x': is_digit = is_hex_digit_func; break;
+            case 'b': is_digit = is_bin_digit; break;
+            case 'o': is_digit = is_oct_digit; break;
+        }
+        if (is_digit != NULL) {
+            Py_ssize_t digits_end = match_digits(p, pos + 2, is_digit);
+            if (digits_end > pos + 2) {
+                end = digits_end;
+            }
+        }
+    }
+
+    int is_float = 0;
+    if (end < 0) {
+        /* dec, integer part */
+        end = pos;
+        Py_UCS4 c = char_at(p, end);
+        if (c == '+' || c == '-') {
+            c = char_at(p, ++end);
+        }
+        if (c == '0') {
+            end++;
+        }
+        else if ('1' <= c && c <= '9') {
+            end = match_digits(p, end, is_dec_digit);
+        }
+        else {
+            return 0;
+        }
+        /* optional fractional part */
+        if (char_at(p, end) == '.') {
+            Py_ssize_t frac_end = match_digits(p, end + 1, is_dec_digit);
+            if (frac_end > end + 1) {
+                end = frac_end;
+                is_float = 1;
+            }
+        }
+        /* optional exponent part */
+        c = char_at(p, end);
+        if (c == 'e' || c == 'E') {
+            Py_ssize_t exp_start = end + 1;
+            c = char_at(p, exp_start);
+            if (c == '+' || c == '-') {
+                exp_start++;
+            }
+            Py_ssize_t exp_end = match_digits(p, exp_start, is_dec_digit);
+            if (exp_end > exp_start) {
+                end = exp_end;
+                is_float = 1;
+            }
+        }
+    }
+
+    if (is_float) {
+        *result = call_parse_float(p, pos, end);
+        return *result == NULL ? -1 : end;
+    }
+
+    /* Fast path for short decimal integers without underscores. */
+    if (end - pos < 18) {
+        Py_ssize_t i = pos;
+        int negative = 0;
+        Py_UCS4 c = char_at(p, i);
+        if (c == '+' || c == '-') {
+            negative = c == '-';
+            i++;
+        }
+        if (char_at(p, i) != '0' || i + 1 == end) {
+            long long value = 0;
+            for (; i < end; i++) {
+                c = char_at(p, i);
+                if (!is_ascii_digit(c)) {
+                    break;
+                }
+                value = value * 10 + (c - '0');
+            }
+            if (i == end) {
+                *result = PyLong_FromLongLong(negative ? -value : value);
+                return *result == NULL ? -1 : end;
+            }
+        }
+    }
+    PyObject *s = PyUnicode_Substring(p->src, pos, end);
+    if (s == NULL) {
+        return -1;
+    }
+    *result = PyLong_FromUnicodeObject(s, 0);
+    Py_DECREF(s);
+    return *result == NULL ? -1 : end;
+}
+
+static Py_ssize_t
+parse_value(Parser *p, Py_ssize_t pos, PyObject **result)
+{
+    Py_UCS4 c = char_at(p, pos);
+    Py_ssize_t end;
+
+    /* Basic strings */
+    if (c == '"') {
+        if (startswith(p, pos, "\"\"\"")) {
+            return parse_multiline_str(p, pos, 0, result);
+        }
+        return parse_basic_str(p, pos + 1, 0, result);
+    }
+
+    /* Literal strings */
+    if (c == '\'') {
+        if (startswith(p, pos, "'''")) {
+            return parse_multiline_str(p, pos, 1, result);
+        }
+        return parse_literal_str(p, pos, result);
+    }
+
+    /* Booleans */
+    if (c == 't' && startswith(p, pos, "true")) {
+        *result = Py_NewRef(Py_True);
+        return pos + 4;
+    }
+    if (c == 'f' && startswith(p, pos, "false")) {
+        *result = Py_NewRef(Py_False);
+        return pos + 5;
+    }
+
+    /* Arrays */
+    if (c == '[') {
+        if (_Py_EnterRecursiveCall(" while parsing a TOML array")) {
+            return -1;
+        }
+        end = parse_array(p, pos, result);
+        _Py_LeaveRecursiveCall();
+        return end;
+    }
+
+    /* Inline tables */
+    if (c == '{') {
+        if (_Py_EnterRecursiveCall(" while parsing a TOML inline table")) {
+            return -1;
+        }
+        end = parse_inline_table(p, pos, result);
+        _Py_LeaveRecursiveCall();
+        return end;
+    }
+
+    /* Dates and times */
+    if (is_ascii_digit(c)) {
+        end = parse_datetime(p, pos, result);
+        if (end != 0) {
+            return end;
+        }
+        end = parse_localtime(p, pos, result);
+        if (end != 0) {
+            return end;
+        }
+    }
+
+    /* Integers and "normal" floats */
+    end = parse_number(p, pos, result);
+    if (end != 0) {
+        return end;
+    }
+
+    /* Special floats */
+    if (startswith(p, pos, "inf") || startswith(p, pos, "nan")) {
+        end = pos + 3;
+    }
+    else if ((c == '+' || c == '-') &&
+             (startswith(p, pos + 1, "inf") || startswith(p, pos + 1, "nan")))
+    {
+        end = pos + 4;
+    }
+    else {
+        set_error(p, pos, "Invalid value");
+        return -1;
+    }
+    *result = call_parse_float(p, pos, end);
+    return *result == NULL ? -1 : end;
+}
+
+
+/* Rules */
+
+typedef struct {
+    PyObject *data;     /* the parsed document */
+    Flags flags;
+} Output;
+
+static Py_ssize_t
+create_dict_rule(Parser *p, Py_ssize_t pos, Output *out, PyObject **header)
+{
+    PyObject *key;
+    pos = skip_ws(p, pos + 1);
+    pos = parse_key(p, pos, &key);
+    if (pos < 0) {
+        return -1;
+    }
+    int rc = flags_is(&out->flags, key, FLAG_EXPLICIT_NEST);
+    if (rc == 0) {
+        rc = flags_is(&out->flags, key, FLAG_FROZEN);
+    }
+    if (rc < 0) {
+        goto error;
+    }
+    if (rc) {
+        set_error(p, pos, "Cannot declare %R twice", key);
+        goto error;
+    }
+    if (flags_set(&out->flags, key, FLAG_EXPLICIT_NEST, 0) < 0) {
+        goto error;
+    }
+    PyObject *nest;
+    rc = get_or_create_nest(out->data, key, 1, &nest);
+    if (rc < 0) {
+        goto error;
+    }
+    if (rc) {
+        set_error(p, pos, "Cannot overwrite a value");
+        goto error;
+    }
+    if (char_at(p, pos) != ']') {
+        set_error(p, pos, "Expected ']' at the end of a table declaration");
+        goto error;
+    }
+    Py_SETREF(*header, key);
+    return pos + 1;
+
+error:
+    Py_DECREF(key);
+    return -1;
+}
+
+static Py_ssize_t
+create_list_rule(Parser *p, Py_ssize_t pos, Output *out, PyObject **header)
+{
+    PyObject *key;
+    pos = skip_ws(p, pos + 2);
+    pos = parse_key(p, pos, &key);
+    if (pos < 0) {
+        return -1;
+    }
+    int rc = flags_is(&out->flags, key, FLAG_FROZEN);
+    if (rc < 0) {
+        goto error;
+    }
+    if (rc) {
+        set_error(p, pos, "Cannot mutate immutable namespace %R", key);
+        goto error;
+    }
+    /* Free the namespace now that it points to another empty list item...
+       ...but this key precisely is still prohibited from table
+       declaration. */
+    if (flags_unset_all(&out->flags, key) < 0 ||
+        flags_set(&out->flags, key, FLAG_EXPLICIT_NEST, 0) < 0)
+    {
+        goto error;
+    }
+    rc = append_nest_to_list(out->data, key);
+    if (rc < 0) {
+        goto error;
+    }
+    if (rc) {
+        set_error(p, pos, "Cannot overwrite a value");
+        goto error;
+    }
+    if (!startswith(p, pos, "]]")) {
+        set_error(p, pos, "Expected ']]' at the end of an array declaration");
+        goto error;
+    }
+    Py_SETREF(*header, key);
+    return pos + 2;
+
+error:
+    Py_DECREF(key);
+    return -1;
+}
+
+static Py_ssize_t
+key_value_rule(Parser *p, Py_ssize_t pos, Output *out, PyObject *header)
+{
+    PyObject *key, *value, *abs_key_parent = NULL, *abs_key = NULL;
+    pos = parse_key_value_pair(p, pos, &key, &value);
+    if (pos < 0) {
+        return -1;
+    }
+    Py_ssize_t n = PyTuple_GET_SIZE(key);
+    PyObject *key_stem = PyTuple_GET_ITEM(key, n - 1);
+
+    for (Py_ssize_t i = 1; i < n; i++) {
+        PyObject *cont_key = concat_key(header, key, i);
+        if (cont_key == NULL) {
+            goto error;
+        }
+        /* Check that dotted key syntax does not redefine an existing
+           table */
+        int rc = flags_is(&out->flags, cont_key, FLAG_EXPLICIT_NEST);
+        if (rc > 0) {
+            set_error(p, pos, "Cannot redefine namespace %R", cont_key);
+        }
+        /* Containers in the relative path can't be opened with the table
+           syntax or dotted key/value syntax in following table sections. */
+        if (rc != 0 || PyList_Append(out->flags.pending, cont_key) < 0) {
+            Py_DECREF(cont_key);
+            goto error;
+        }
+        Py_DECREF(cont_key);
+    }
+
+    abs_key_parent = concat_key(header, key, n - 1);
+    if (abs_key_parent == NULL) {
+        goto error;
+    }
+    int rc = flags_is(&out->flags, abs_key_parent, FLAG_FROZEN);
+    if (rc < 0) {
+        goto error;
+    }
+    if (rc) {
+        set_error(p, pos, "Cannot mutate immutable namespace %R",
+                  abs_key_parent);
+        goto error;
+    }
+    PyObject *nest;
+    rc = get_or_create_nest(out->data, abs_key_parent, 1, &nest);
+    if (rc < 0) {
+        goto error;
+    }
+    if (rc == 0) {
+        rc = PyDict_Contains(nest, key_stem);
+        if (rc < 0) {
+            goto error;
+        }
+    }
+    if (rc) {
+        set_error(p, pos, "Cannot overwrite a value");
+        goto error;
+    }
+    /* Mark inline table and array namespaces recursively immutable */
+    if (PyDict_Check(value) || PyList_Check(value)) {
+        abs_key = concat_key(header, key, n);
+        if (abs_key == NULL ||
+            flags_set(&out->flags, abs_key, FLAG_FROZEN, 1) < 0)
+        {
+            goto error;
+        }
+    }
+    if (PyDict_SetItem(nest, key_stem, value) < 0) {
+        goto error;
+    }
+    Py_DECREF(key);
+    Py_DECREF(value);
+    Py_DECREF(abs_key_parent);
+    Py_XDECREF(abs_key);
+    return pos;
+
+error:
+    Py_DECREF(key);
+    Py_DECREF(value);
+    Py_XDECREF(abs_key_parent);
+    Py_XDECREF(abs_key);
+    return -1;
+}
+
+static PyObject *
+parse_document(Parser *p)
+{
+    Py_ssize_t pos = 0;
+    Output out;
+    PyObject *header = PyTuple_New(0);
+    out.data = PyDict_New();
+    if (header == NULL || out.data == NULL || flags_init(&out.flags) < 0) {
+        goto error;
+    }
+
+    /* Parse one statement at a time (typically means one line in TOML
+       source) */
+    while (1) {
+        /* 1. Skip line leading whitespace */
+        pos = skip_ws(p, pos);
+
+        /* 2. Parse rules.  Skip trailing whitespace when applicable. */
+        Py_UCS4 c = char_at(p, pos);
+        if (c == END_OF_DOC) {
+            break;
+        }
+        if (c == '\n') {
+            pos++;
+            continue;
+        }
+        if (is_bare_key_char(c) || c == '"' || c == '\'') {
+            pos = key_value_rule(p, pos, &out, header);
+            if (pos < 0) {
+                goto error;
+            }
+            pos = skip_ws(p, pos);
+        }
+        else if (c == '[') {
+            if (flags_finalize_pending(&out.flags) < 0) {
+                goto error;
+            }
+            if (char_at(p, pos + 1) == '[') {
+                pos = create_list_rule(p, pos, &out, &header);
+            }
+            else {
+                pos = create_dict_rule(p, pos, &out, &header);
+            }
+            if (pos < 0) {
+                goto error;
+            }
+            pos = skip_ws(p, pos);
+        }
+        else if (c != '#') {
+            set_error(p, pos, "Invalid statement");
+            goto error;
+        }
+
+        /* 3. Skip comment */
+        pos = skip_comment(p, pos);
+        if (pos < 0) {
+            goto error;
+        }
+
+        /* 4. Expect end of line or end of file */
+        c = char_at(p, pos);
+        if (c == END_OF_DOC) {
+            break;
+        }
+        if (c != '\n') {
+            set_error(p, pos,
+                      "Expected newline or end of document after a statement");
+            goto error;
+        }
+        pos++;
+    }
+
+    Py_DECREF(header);
+    flags_fini(&out.flags);
+    return out.data;
+
+error:
+    Py_XDECREF(header);
+    Py_XDECREF(out.data);
+    flags_fini(&out.flags);
+    return NULL;
+}
+
+/*[clinic input]
+_tomllib.loads
+
+    s: object
+    /
+    *
+    parse_float: object(c_default="NULL") = float
+
+Parse TOML from a string.
+[clinic start generated code]*/
+
+static PyObject *
+_tomllib_loads_impl(PyObject *module, PyObject *s, PyObject *parse_float)
+/*[clinic end generated code: output=1ba49427f273c3c0 input=f6ee37e69a457879]*/
+{
+    tomllib_state *st = get_tomllib_state(module);
+    if (!PyUnicode_CheckExact(s)) {
+        /* Let the Python version deal with the replace() method of
+           other types. */
+        PyObject *func = PyObject_GetAttrString(st->parser, "_py_loads");
+        if (func == NULL) {
+            return NULL;
+        }
+        PyObject *args[2] = {s, parse_float};
+        PyObject *kwnames = NULL;
+        if (parse_float != NULL) {
+            kwnames = Py_BuildValue("(s)", "parse_float");
+            if (kwnames == NULL) {
+                Py_DECREF(func);
+                return NULL;
+            }
+        }
+        PyObject *result = PyObject_Vectorcall(func, args, 1, kwnames);
+        Py_DECREF(func);
+        Py_XDECREF(kwnames);
+        return result;
+    }
+
+    /* The spec allows converting "\r\n" to "\n", even in string literals.
+       Let's do so to simplify parsing. */
+    PyObject *src;
+    if (PyUnicode_FindChar(s, '\r', 0, PyUnicode_GET_LENGTH(s), 1) == -1) {
+        src = Py_NewRef(s);
+    }
+    else {
+        PyObject *crlf = PyUnicode_FromString("\r\n");
+        PyObject *lf = PyUnicode_FromString("\n");
+        src = (crlf && lf) ? PyUnicode_Replace(s, crlf, lf, -1) : NULL;
+        Py_XDECREF(crlf);
+        Py_XDECREF(lf);
+        if (src == NULL) {
+            return NULL;
+        }
+    }
+
+    Parser p = {
+        .st = st,
+        .src = src,
+        .kind = PyUnicode_KIND(src),
+        .data = PyUnicode_DATA(src),
+        .len = PyUnicode_GET_LENGTH(src),
+        .parse_float = (parse_float == NULL ||
+                        parse_float == (PyObject *)&PyFloat_Type)
+                       ? NULL : parse_float,
+    };
+    PyObject *result = parse_document(&p);
+    Py_DECREF(src);
+    return result;
+}
+
+
+static PyMethodDef tomllib_methods[] = {
+    _TOMLLIB_LOADS_METHODDEF
+    {NULL, NULL}
+};
+
+static int
+tomllib_exec(PyObject *module)
+{
+    tomllib_state *st = get_tomllib_state(module);
+
+    /* tomllib._parser imports this module after it defined everything. */
+    st->parser = PyImport_ImportModule("tomllib._parser");
+    if (st->parser == NULL) {
+        return -1;
+    }
+    st->decode_error = PyObject_GetAttrString(st->parser, "TOMLDecodeError");
+    if (st->decode_error == NULL) {
+        return -1;
+    }
+    st->cached_tz = PyImport_ImportModuleAttrString("tomllib._re",
+                                                    "cached_tz");
+    if (st->cached_tz == NULL) {
+        return -1;
+    }
+    PyObject *datetime = PyImport_ImportModule("datetime");
+    if (datetime == NULL) {
+        return -1;
+    }
+    st->date_type = PyObject_GetAttrString(datetime, "date");
+    st->time_type = PyObject_GetAttrString(datetime, "time");
+    st->datetime_type = PyObject_GetAttrString(datetime, "datetime");
+    PyObject *timezone = PyObject_GetAttrString(datetime, "timezone");
+    Py_DECREF(datetime);
+    if (timezone == NULL) {
+        return -1;
+    }
+    st->utc = PyObject_GetAttrString(timezone, "utc");
+    Py_DECREF(timezone);
+    if (st->date_type == NULL || st->time_type == NULL ||
+        st->datetime_type == NULL || st->utc == NULL)
+    {
+        return -1;
+    }
+    return 0;
+}
+
+static int
+tomllib_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    tomllib_state *st = get_tomllib_state(module);
+    Py_VISIT(st->parser);
+    Py_VISIT(st->decode_error);
+    Py_VISIT(st->cached_tz);
+    Py_VISIT(st->date_type);
+    Py_VISIT(st->time_type);
+    Py_VISIT(st->datetime_type);
+    Py_VISIT(st->utc);
+    return 0;
+}
+
+static int
+tomllib_clear(PyObject *module)
+{
+    tomllib_state *st = get_tomllib_state(module);
+    Py_CLEAR(st->parser);
+    Py_CLEAR(st->decode_error);
+    Py_CLEAR(st->cached_tz);
+    Py_CLEAR(st->date_type);
+    Py_CLEAR(st->time_type);
+    Py_CLEAR(st->datetime_type);
+    Py_CLEAR(st->utc);
+    return 0;
+}
+
+static void
+tomllib_free(void *module)
+{
+    (void)tomllib_clear((PyObject *)module);
+}
+
+static PyModuleDef_Slot tomllib_slots[] = {
+    {Py_mod_exec, tomllib_exec},
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+    {0, NULL}
+};
+
+PyDoc_STRVAR(tomllib_module_doc,
+"C implementation of the tomllib parser.");
+
+static struct PyModuleDef _tomllibmodule = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_tomllib",
+    .m_doc = tomllib_module_doc,
+    .m_size = sizeof(tomllib_state),
+    .m_methods = tomllib_methods,
+    .m_slots = tomllib_slots,
+    .m_traverse = tomllib_traverse,
+    .m_clear = tomllib_clear,
+    .m_free = tomllib_free,
+};
+
+PyMODINIT_FUNC
+PyInit__tomllib(void)
+{
+    return PyModuleDef_Init(&_tomllibmodule);
+}
@@ -0,0 +1,1547 @@
+/* C accelerator for urllib.parse.
+
+   urlsplit(), urlunsplit(), quote(), quote_plus(), unquote(), parse_qsl()
+   and urlencode() follow Lib/urllib/parse.py.  They handle the usual str
+   and bytes arguments in C.  For arguments of any other type they call the
+   pure Python version, kept in urllib.parse under the name _py_<name>, so
+   that the results and the errors stay the same.
+*/
+
+#ifndef Py_BUILD_CORE_BUILTIN
+#  define Py_BUILD_CORE_MODULE 1
+#endif
+
+#include "Python.h"
+#include "pycore_long.h"          // _PyLong_GetOne()
+#include "pycore_pyerrors.h"      // _PyErr_FormatFromCause()
+#include "pycore_tuple.h"         // _PyTuple_RESET_HASH_CACHE()
+
+/*[clinic input]
+module _urlparse
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=98a5c4168b11cdbe]*/
+
+typedef struct {
+    /* urllib.parse */
+    PyObject *parse;
+    /* urllib.parse.SplitResult and urllib.parse.SplitResultBytes */
+    PyTypeObject *split_result;
+    PyTypeObject *split_result_bytes;
+} urlparse_state;
+
+static inline urlparse_state *
+get_urlparse_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (urlparse_state *)state;
+}
+
+#include "clinic/_urlparse.c.h"
+
+
+/* Call urllib.parse.<name>. */
+static PyObject *
+call_python(urlparse_state *st, const char *name,
+            PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    PyObject *func = PyObject_GetAttrString(st->parse, name);
+    if (func == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyObject_Vectorcall(func, args, nargsf, kwnames);
+    Py_DECREF(func);
+    return result;
+}
+
+static inline int
+is_bytes_like(PyObject *obj)
+{
+    return PyBytes_Check(obj) || PyByteArray_Check(obj);
+}
+
+static inline const char *
+bytes_like_data(PyObject *obj)
+{
+    return PyBytes_Check(obj) ? PyBytes_AS_STRING(obj)
+                              : PyByteArray_AS_STRING(obj);
+}
+
+static inline Py_ssize_t
+bytes_like_size(PyObject *obj)
+{
+    return PyBytes_Check(obj) ? PyBytes_GET_SIZE(obj)
+                              : PyByteArray_GET_SIZE(obj);
+}
+
+/* Write the characters of a str.  Unlike PyUnicodeWriter_WriteStr(), do
+   not call str() on a subclass, which may return something else. */
+static inline int
+write_str(PyUnicodeWriter *writer, PyObject *str)
+{
+    return PyUnicodeWriter_WriteSubstring(writer, str, 0,
+                                          PyUnicode_GET_LENGTH(str));
+}
+
+/* x.decode('ascii', 'strict') */
+static PyObject *
+decode_ascii(PyObject *obj)
+{
+    return PyUnicode_DecodeASCII(bytes_like_data(obj), bytes_like_size(obj),
+                                 "strict");
+}
+
+
+/* URL splitting */
+
+static inline int
+is_unsafe_url_char(Py_UCS4 ch)
+{
+    return ch == '\t' || ch == '\r' || ch == '\n';
+}
+
+static inline int
+is_scheme_char(Py_UCS4 ch)
+{
+    return ch < 128 && (Py_ISALNUM(ch) || ch == '+' || ch == '-' || ch == '.');
+}
+
+/* Strip the C0 control and space characters from the start (and the end if
+   rstrip is true) of s, and remove the tab and newline characters. */
+static PyObject *
+clean_url(PyObject *s, int rstrip)
+{
+    int kind = PyUnicode_KIND(s);
+    const void *data = PyUnicode_DATA(s);
+    Py_ssize_t start = 0, end = PyUnicode_GET_LENGTH(s);
+    Py_ssize_t unsafe = 0;
+
+    while (start < end && PyUnicode_READ(kind, data, start) <= ' ') {
+        start++;
+    }
+    while (rstrip && end > start && PyUnicode_READ(kind, data, end - 1) <= ' ') {
+        end--;
+    }
+    for (Py_ssize_t i = start; i < end; i++) {
+        unsafe += is_unsafe_url_char(PyUnicode_READ(kind, data, i));
+    }
+    if (unsafe == 0) {
+        return PyUnicode_Substring(s, start, end);
+    }
+
+    PyUnicodeWriter *writer = PyUnicodeWriter_Create(end - start - unsafe);
+    if (writer == NULL) {
+        return NULL;
+    }
+    Py_ssize_t run = start;
+    for (Py_ssize_t i = start; i < end; i++) {
+        if (is_unsafe_url_char(PyUnicode_READ(kind, data, i))) {
+            if (PyUnicodeWriter_WriteSubstring(writer, s, run, i) < 0) {
+                goto error;
+            }
+            run = i + 1;
+        }
+    }
+    if (PyUnicodeWriter_WriteSubstring(writer, s, run, end) < 0) {
+        goto error;
+    }
+    return PyUnicodeWriter_Finish(writer);
+
+error:
+    PyUnicodeWriter_Discard(writer);
+    return NULL;
+}
+
+static int
+contains_char(PyObject *s, Py_UCS4 ch)
+{
+    return PyUnicode_FindChar(s, ch, 0, PyUnicode_GET_LENGTH(s), 1) >= 0;
+}
+
+/* Call urllib.parse.<name>(netloc) for the checks that are rarely needed. */
+static int
+check_netloc(urlparse_state *st, const char *name, PyObject *netloc)
+{
+    PyObject *res = call_python(st, name, &netloc, 1, NULL);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+    return 0;
+}
+
+/* urllib.parse._urlsplit() for str arguments.  Store the scheme, netloc,
+   path, query and fragment in parts; empty components are "". */
+static int
+split_url(urlparse_state *st, PyObject *url, PyObject *scheme,
+          int allow_fragments, PyObject *parts[5])
+{
+    PyObject *netloc = NULL, *query = NULL, *fragment = NULL, *tmp;
+    Py_ssize_t length, i;
+
+    url = clean_url(url, 0);
+    if (url == NULL) {
+        return -1;
+    }
+    scheme = clean_url(scheme, 1);
+    if (scheme == NULL) {
+        goto error;
+    }
+
+    length = PyUnicode_GET_LENGTH(url);
+    i = PyUnicode_FindChar(url, ':', 0, length, 1);
+    if (i > 0 && Py_ISALPHA(PyUnicode_READ_CHAR(url, 0)) &&
+        PyUnicode_READ_CHAR(url, 0) < 128)
+    {
+        Py_ssize_t j;
+        for (j = 0; j < i; j++) {
+            if (!is_scheme_char(PyUnicode_READ_CHAR(url, j))) {
+                break;
+            }
+        }
+        if (j == i) {
+            /* The scheme characters are ASCII. */
+            tmp = PyUnicode_New(i, 127);
+            if (tmp == NULL) {
+                goto error;
+            }
+            for (j = 0; j < i; j++) {
+                PyUnicode_1BYTE_DATA(tmp)[j] =
+                    Py_TOLOWER(PyUnicode_READ_CHAR(url, j));
+            }
+            Py_SETREF(scheme, tmp);
+            tmp = PyUnicode_Substring(url, i + 1, length);
+            if (tmp == NULL) {
+                goto error;
+            }
+            Py_SETREF(url, tmp);
+            length = PyUnicode_GET_LENGTH(url);
+        }
+    }
+
+    if (length >= 2 && PyUnicode_READ_CHAR(url, 0) == '/' &&
+        PyUnicode_READ_CHAR(url, 1) == '/')
+    {
+        Py_ssize_t delim = length;
+        const char *delims = "/?#";
+        for (; *delims; delims++) {
+            Py_ssize_t k = PyUnicode_FindChar(url, *delims, 2, delim, 1);
+            if (k >= 0) {
+                delim = k;
+            }
+        }
+        netloc = PyUnicode_Substring(url, 2, delim);
+        if (netloc == NULL) {
+            goto error;
+        }
+        tmp = PyUnicode_Substring(url, delim, length);
+        if (tmp == NULL) {
+            goto error;
+        }
+        Py_SETREF(url, tmp);
+        length = PyUnicode_GET_LENGTH(url);
+
+        int open_br = contains_char(netloc, '[');
+        int close_br = contains_char(netloc, ']');
+        if (open_br != close_br) {
+            PyErr_SetString(PyExc_ValueError, "Invalid IPv6 URL");
+            goto error;
+        }
+        if (open_br &&
+            check_netloc(st, "_check_bracketed_netloc", netloc) < 0)
+        {
+            goto error;
+        }
+    }
+
+    if (allow_fragments) {
+        i = PyUnicode_FindChar(url, '#', 0, length, 1);
+        if (i >= 0) {
+            fragment = PyUnicode_Substring(url, i + 1, length);
+            if (fragment == NULL) {
+                goto error;
+            }
+            tmp = PyUnicode_Substring(url, 0, i);
+            if (tmp == NULL) {
+                goto error;
+            }
+            Py_SETREF(url, tmp);
+            length = i;
+        }
+    }
+    i = PyUnicode_FindChar(url, '?', 0, length, 1);
+    if (i >= 0) {
+        query = PyUnicode_Substring(url, i + 1, length);
+        if (query == NULL) {
+            goto error;
+        }
+        tmp = PyUnicode_Substring(url, 0, i);
+        if (tmp == NULL) {
+            goto error;
+        }
+        Py_SETREF(url, tmp);
+    }
+
+    if (netloc != NULL && PyUnicode_GET_LENGTH(netloc) &&
+        !PyUnicode_IS_ASCII(netloc) &&
+        check_netloc(st, "_checknetloc", netloc) < 0)
+    {
+        goto error;
+    }
+
+    parts[0] = scheme;
+    parts[1] = netloc ? netloc : Py_GetConstant(Py_CONSTANT_EMPTY_STR);
+    parts[2] = url;
+    parts[3] = query ? query : Py_GetConstant(Py_CONSTANT_EMPTY_STR);
+    parts[4] = fragment ? fragment : Py_GetConstant(Py_CONSTANT_EMPTY_STR);
+    return 0;
+
+error:
+    Py_DECREF(url);
+    Py_XDECREF(scheme);
+    Py_XDECREF(netloc);
+    Py_XDECREF(query);
+    Py_XDECREF(fragment);
+    return -1;
+}
+
+/* Create an instance of the namedtuple type from n new references. */
+static PyObject *
+make_result(PyTypeObject *type, PyObject **items, Py_ssize_t n)
+{
+    PyObject *result = type->tp_alloc(type, n);
+    if (result == NULL) {
+        for (Py_ssize_t i = 0; i < n; i++) {
+            Py_DECREF(items[i]);
+        }
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyTuple_SET_ITEM(result, i, items[i]);
+    }
+    _PyTuple_RESET_HASH_CACHE(result);
+    return result;
+}
+
+/*[clinic input]
+_urlparse.urlsplit
+
+    url: object
+    scheme: object(c_default="&_Py_STR(empty)") = ''
+    allow_fragments: bool = True
+
+Parse a URL into 5 components.
+
+The components are <scheme>://<netloc>/<path>?<query>#<fragment>.
+
+The result is a named 5-tuple with fields corresponding to the
+above. It is either a SplitResult or SplitResultBytes object,
+depending on the type of the url parameter.
+
+The username, password, hostname, and port sub-components of netloc
+can also be accessed as attributes of the returned object.
+
+The scheme argument provides the default value of the scheme
+component when no scheme is found in url.
+
+If allow_fragments is False, no attempt is made to separate the
+fragment component from the previous component, which can be either
+path or query.
+
+Note that % escapes are not expanded.
+[clinic start generated code]*/
+
+static PyObject *
+_urlparse_urlsplit_impl(PyObject *module, PyObject *url, PyObject *scheme,
+                        int allow_fragments)
+/*[clinic end generated code: output=526328de69f9b6c6 input=b236a396bb808fa6]*/
+{
+    urlparse_state *st = get_urlparse_state(module);
+    PyObject *parts[5];
+    int encode;
+
+    if (PyUnicode_Check(url) && PyUnicode_Check(scheme)) {
+        url = Py_NewRef(url);
+        scheme = Py_NewRef(scheme);
+        encode = 0;
+    }
+    else if (is_bytes_like(url) &&
+             (is_bytes_like(scheme) ||
+              (PyUnicode_Check(scheme) && PyUnicode_GET_LENGTH(scheme) == 0)))
+    {
+        url = decode_ascii(url);
+        if (url == NULL) {
+            return NULL;
+        }
+        scheme = (PyUnicode_Check(scheme)
+                  ? Py_GetConstant(Py_CONSTANT_EMPTY_STR)
+                  : decode_ascii(scheme));
+        if (scheme == NULL) {
+            Py_DECREF(url);
+            return NULL;
+        }
+        encode = 1;
+    }
+    else {
+        PyObject *args[3] = {url, scheme, allow_fragments ? Py_True : Py_False};
+        return call_python(st, "_py_urlsplit", args, 3, NULL);
+    }
+
+    int rc = split_url(st, url, scheme, allow_fragments, parts);
+    Py_DECREF(url);
+    Py_DECREF(scheme);
+    if (rc < 0) {
+        return NULL;
+    }
+    if (!encode) {
+        return make_result(st->split_result, parts, 5);
+    }
+    for (int i = 0; i < 5; i++) {
+        PyObject *b = PyUnicode_AsASCIIString(parts[i]);
+        Py_SETREF(parts[i], b);
+        if (b == NULL) {
+            for (int j = 0; j < 5; j++) {
+                Py_XDECREF(parts[j]);
+            }
+            return NULL;
+        }
+    }
+    return make_result(st->split_result_bytes, parts, 5);
+}
+
+/*[clinic input]
+_urlparse.urlunsplit
+
+    components: object
+    /
+
+Combine the elements of a tuple as returned by urlsplit() into a URL.
+
+The data argument can be any five-item iterable.  This may result in a
+slightly different, but equivalent URL, if the URL that was parsed
+originally had unnecessary delimiters (for example, a ? with an empty
+query; the RFC states that these are equivalent).
+[clinic start generated code]*/
+
+static PyObject *
+_urlparse_urlunsplit(PyObject *module, PyObject *components)
+/*[clinic end generated code: output=e777b44500dd6133 input=0d5c815e199441eb]*/
+{
+    urlparse_state *st = get_urlparse_state(module);
+    PyObject *items[5];
+    PyObject *result = NULL;
+    int has_netloc;
+
+    if (!(PyTuple_Check(components) || PyList_Check(components)) ||
+        PySequence_Fast_GET_SIZE(components) != 5)
+    {
+        goto fallback;
+    }
+    for (int i = 0; i < 5; i++) {
+        if (!PyUnicode_Check(PySequence_Fast_GET_ITEM(components, i))) {
+            goto fallback;
+        }
+    }
+    for (int i = 0; i < 5; i++) {
+        items[i] = Py_NewRef(PySequence_Fast_GET_ITEM(components, i));
+    }
+    PyObject *scheme = items[0], *netloc = items[1], *url = items[2];
+    PyObject *query = items[3], *fragment = items[4];
+    Py_ssize_t url_len = PyUnicode_GET_LENGTH(url);
+
+    has_netloc = PyUnicode_GET_LENGTH(netloc) > 0;
+    if (!has_netloc && PyUnicode_GET_LENGTH(scheme) &&
+        (url_len == 0 || PyUnicode_READ_CHAR(url, 0) == '/'))
+    {
+        PyObject *uses_netloc = PyObject_GetAttrString(st->parse,
+                                                       "uses_netloc");
+        if (uses_netloc == NULL) {
+            goto done;
+        }
+        has_netloc = PySequence_Contains(uses_netloc, scheme);
+        Py_DECREF(uses_netloc);
+        if (has_netloc < 0) {
+            goto done;
+        }
+    }
+
+    PyUnicodeWriter *writer = PyUnicodeWriter_Create(0);
+    if (writer == NULL) {
+        goto done;
+    }
+    if (PyUnicode_GET_LENGTH(scheme) &&
+        (write_str(writer, scheme) < 0 ||
+         PyUnicodeWriter_WriteChar(writer, ':') < 0))
+    {
+        goto writer_error;
+    }
+    if (has_netloc) {
+        if (PyUnicodeWriter_WriteUTF8(writer, "//", 2) < 0 ||
+            write_str(writer, netloc) < 0)
+        {
+            goto writer_error;
+        }
+        if (url_len && PyUnicode_READ_CHAR(url, 0) != '/' &&
+            PyUnicodeWriter_WriteChar(writer, '/') < 0)
+        {
+            goto writer_error;
+        }
+    }
+    else if (url_len >= 2 && PyUnicode_READ_CHAR(url, 0) == '/' &&
+             PyUnicode_READ_CHAR(url, 1) == '/' &&
+             PyUnicodeWriter_WriteUTF8(writer, "//", 2) < 0)
+    {
+        goto writer_error;
+    }
+    if (write_str(writer, url) < 0) {
+        goto writer_error;
+    }
+    if (PyUnicode_GET_LENGTH(query) &&
+        (PyUnicodeWriter_WriteChar(writer, '?') < 0 ||
+         write_str(writer, query) < 0))
+    {
+        goto writer_error;
+    }
+    if (PyUnicode_GET_LENGTH(fragment) &&
+        (PyUnicodeWriter_WriteChar(writer, '#') < 0 ||
+         write_str(writer, fragment) < 0))
+    {
+        goto writer_error;
+    }
+    result = PyUnicodeWriter_Finish(writer);
+    goto done;
+
+writer_error:
+    PyUnicodeWriter_Discard(writer);
+done:
+    for (int i = 0; i < 5; i++) {
+        Py_DECREF(items[i]);
+    }
+    return result;
+
+fallback:
+    return call_python(st, "_py_urlunsplit", &components, 1, NULL);
+}
+
+
+/* Quoting */
+
+static const char hexdigits[] = "0123456789ABCDEF";
+
+/* Fill table with the bytes which are not quoted: the always safe ones and
+   the ASCII characters of safe.  Return 0 if safe is neither str nor
+   bytes-like, and the Python implementation must be used. */
+static int
+make_safe_table(PyObject *safe, char table[128])
+{
+    for (int c = 0; c < 128; c++) {
+        table[c] = (Py_ISALNUM(c) || c == '_' || c == '.' || c == '-' ||
+                    c == '~');
+    }
+    if (PyUnicode_Check(safe)) {
+        int kind = PyUnicode_KIND(safe);
+        const void *data = PyUnicode_DATA(safe);
+        for (Py_ssize_t i = 0; i < PyUnicode_GET_LENGTH(safe); i++) {
+            Py_UCS4 c = PyUnicode_READ(kind, data, i);
+            if (c < 128) {
+                table[c] = 1;
+            }
+        }
+        return 1;
+    }
+    if (is_bytes_like(safe)) {
+        const unsigned char *data = (const unsigned char *)bytes_like_data(safe);
+        for (Py_ssize_t i = 0; i < bytes_like_size(safe); i++) {
+            if (data[i] < 128) {
+                table[data[i]] = 1;
+            }
+        }
+        return 1;
+    }
+    return 0;
+}
+
+/* quote_from_bytes(); with plus true, spaces are replaced with '+' as
+   quote_plus() does. */
+static PyObject *
+quote_bytes(const unsigned char *s, Py_ssize_t size, const char table[128],
+            int plus)
+{
+    Py_ssize_t length = 0;
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        unsigned char c = s[i];
+        if ((plus && c == ' ') || (c < 128 && table[c])) {
+            length++;
+        }
+        else {
+            if (length > PY_SSIZE_T_MAX - 3) {
+                return PyErr_NoMemory();
+            }
+            length += 3;
+        }
+    }
+
+    PyObject *result = PyUnicode_New(length, 127);
+    if (result == NULL) {
+        return NULL;
+    }
+    Py_UCS1 *p = PyUnicode_1BYTE_DATA(result);
+    for (Py_ssize_t i = 0; i < size; i++) {
+        unsigned char c = s[i];
+        if (plus && c == ' ') {
+            *p++ = '+';
+        }
+        else if (c < 128 && table[c]) {
+            *p++ = c;
+        }
+        else {
+            *p++ = '%';
+            *p++ = hexdigits[c >> 4];
+            *p++ = hexdigits[c & 15];
+        }
+    }
+    return result;
+}
+
+/* quote() for str and bytes-like strings, with the safe table already
+   built.  encoding and errors are either None or str. */
+static PyObject *
+quote_object(PyObject *string, const char table[128],
+             PyObject *encoding, PyObject *errors, int plus)
+{
+    if (!PyUnicode_Check(string)) {
+        assert(is_bytes_like(string));
+        if (encoding != Py_None) {
+            PyErr_SetString(PyExc_TypeError,
+                            "quote() doesn't support 'encoding' for bytes");
+            return NULL;
+        }
+        if (errors != Py_None) {
+            PyErr_SetString(PyExc_TypeError,
+                            "quote() doesn't support 'errors' for bytes");
+            return NULL;
+        }
+        return quote_bytes((const unsigned char *)bytes_like_data(string),
+                           bytes_like_size(string), table, plus);
+    }
+
+    if (PyUnicode_GET_LENGTH(string) == 0) {
+        return Py_NewRef(string);
+    }
+    /* Like quote_plus(), only replace the encoded spaces if the string
+       contains a space. */
+    plus = plus && contains_char(string, ' ');
+    if (encoding == Py_None && PyUnicode_IS_ASCII(string)) {
+        return quote_bytes(PyUnicode_1BYTE_DATA(string),
+                           PyUnicode_GET_LENGTH(string), table, plus);
+    }
+
+    const char *enc = "utf-8", *err = "strict";
+    if (encoding != Py_None && (enc = PyUnicode_AsUTF8(encoding)) == NULL) {
+        return NULL;
+    }
+    if (errors != Py_None && (err = PyUnicode_AsUTF8(errors)) == NULL) {
+        return NULL;
+    }
+    PyObject *encoded = PyUnicode_AsEncodedString(string, enc, err);
+    if (encoded == NULL) {
+        return NULL;
+    }
+    PyObject *result = quote_bytes(
+        (const unsigned char *)PyBytes_AS_STRING(encoded),
+        PyBytes_GET_SIZE(encoded), table, plus);
+    Py_DECREF(encoded);
+    return result;
+}
+
+static inline int
+is_str_or_none(PyObject *obj)
+{
+    return obj == Py_None || PyUnicode_Check(obj);
+}
+
+static PyObject *
+quote_common(PyObject *module, PyObject *string, PyObject *safe,
+             PyObject *encoding, PyObject *errors, int plus)
+{
+    char table[128];
+
+    if ((PyUnicode_Check(string) || is_bytes_like(string)) &&
+        is_str_or_none(encoding) && is_str_or_none(errors) &&
+        make_safe_table(safe, table))
+    {
+        return quote_object(string, table, encoding, errors, plus);
+    }
+    PyObject *args[4] = {string, safe, encoding, errors};
+    return call_python(get_urlparse_state(module),
+                       plus ? "_py_quote_plus" : "_py_quote", args, 4, NULL);
+}
+
+/*[clinic input]
+_urlparse.quote
+
+    string: object
+    safe: object(c_default="_Py_LATIN1_CHR('/')") = '/'
+    encoding: object = None
+    errors: object = None
+
+quote('abc def') -> 'abc%20def'
+
+Each part of a URL, e.g. the path info, the query, etc., has a
+different set of reserved characters that must be quoted. The
+quote function offers a cautious (not minimal) way to quote a
+string for most of these parts.
+
+RFC 3986 Uniform Resource Identifier (URI): Generic Syntax lists
+the following (un)reserved characters.
+
+unreserved    = ALPHA / DIGIT / "-" / "." / "_" / "~"
+reserved      = gen-delims / sub-delims
+gen-delims    = ":" / "/" / "?" / "#" / "[" / "]" / "@"
+sub-delims    = "!" / "$" / "&" / "'" / "(" / ")"
+              / "*" / "+" / "," / ";" / "="
+
+Each of the reserved characters is reserved in some component of a URL,
+but not necessarily in all of them.
+
+The quote function %-escapes all characters that are neither in the
+unreserved chars ("always safe") nor the additional chars set via the
+safe arg.
+
+The default for the safe arg is '/'. The character is reserved, but in
+typical usage the quote function is being called on a path where the
+existing slash characters are to be preserved.
+
+Python 3.7 updates from using RFC 2396 to RFC 3986 to quote URL strings.
+Now, "~" is included in the set of unreserved characters.
+
+string and safe may be either str or bytes objects. encoding and errors
+must not be specified if string is a bytes object.
+
+The optional encoding and errors parameters specify how to deal with
+non-ASCII characters, as accepted by the str.encode method.
+By default, encoding='utf-8' (characters are encoded with UTF-8), and
+errors='strict' (unsupported characters raise a UnicodeEncodeError).
+[clinic start generated code]*/
+
+static PyObject *
+_urlparse_quote_impl(PyObject *module, PyObject *string, PyObject *safe,
+                     PyObject *encoding, PyObject *errors)
+/*[clinic end generated code: output=944f9b49aa41cb7c input=d82dd272fceff325]*/
+{
+    return quote_common(module, string, safe, encoding, errors, 0);
+}
+
+/*[clinic input]
+_urlparse.quote_plus
+
+    string: object
+    safe: object(c_default="&_Py_STR(empty)") = ''
+    encoding: object = None
+    errors: object = None
+
+Like quote(), but also replace ' ' with '+'.
+
+This is required for quoting HTML form values. Plus signs in the
+original string are escaped unless they are included in safe. It also
+does not have safe default to '/'.
+[clinic start generated code]*/
+
+static PyObject *
+_urlparse_quote_plus_impl(PyObject *module, PyObject *string, PyObject *safe,
+                          PyObject *encoding, PyObject *errors)
+/*[clinic end generated code: output=53de3d43872208df input=5bba0a30bb03285a]*/
+{
+    return quote_common(module, string, safe, encoding, errors, 1);
+}
+
+
+/* Unquoting */
+
+static inline int
+hex_value(Py_UCS4 c)
+{
+    if (c >= '0' && c <= '9') {
+        return c - '0';
+    }
+    if (c >= 'a' && c <= 'f') {
+        return c - 'a' + 10;
+    }
+    if (c >= 'A' && c <= 'F') {
+        return c - 'A' + 10;
+    }
+    return -1;
+}
+
+/* Replace the %xx escapes in the ASCII characters start to end of the
+   string data with the bytes they stand for, and decode the result. */
+static PyObject *
+unquote_ascii(int kind, const void *data, Py_ssize_t start, Py_ssize_t end,
+              const char *encoding, const char *errors)
+{
+    PyObject *result;
+    char stack_buffer[256];
+    char *buffer = stack_buffer;
+    Py_ssize_t size = 0;
+
+    if (end - start > (Py_ssize_t)sizeof(stack_buffer)) {
+        buffer = PyMem_Malloc(end - start);
+        if (buffer == NULL) {
+            return PyErr_NoMemory();
+        }
+    }
+    for (Py_ssize_t i = start; i < end; i++) {
+        Py_UCS4 c = PyUnicode_READ(kind, data, i);
+        if (c == '%' && i + 2 < end) {
+            int hi = hex_value(PyUnicode_READ(kind, data, i + 1));
+            int lo = hex_value(PyUnicode_READ(kind, data, i + 2));
+            if (hi >= 0 && lo >= 0) {
+                buffer[size++] = (char)(hi * 16 + lo);
+                i += 2;
+                continue;
+            }
+        }
+        buffer[size++] = (char)c;
+    }
+    result = PyUnicode_Decode(buffer, size, encoding, errors);
+    if (buffer != stack_buffer) {
+        PyMem_Free(buffer);
+    }
+    return result;
+}
+
+/* unquote() for a str.  Each run of ASCII characters is unquoted and
+   decoded separately; the other characters are kept as they are. */
+static PyObject *
+unquote_str(PyObject *string, const char *encoding, const char *errors)
+{
+    Py_ssize_t length = PyUnicode_GET_LENGTH(string);
+    int kind = PyUnicode_KIND(string);
+    const void *data = PyUnicode_DATA(string);
+
+    if (PyUnicode_FindChar(string, '%', 0, length, 1) < 0) {
+        return Py_NewRef(string);
+    }
+    if (PyUnicode_IS_ASCII(string)) {
+        return unquote_ascii(kind, data, 0, length, encoding, errors);
+    }
+
+    /* Undecoded ASCII is the same in UTF-8. */
+    int utf8 = strcmp(encoding, "utf-8") == 0;
+    PyUnicodeWriter *writer = PyUnicodeWriter_Create(length);
+    if (writer == NULL) {
+        return NULL;
+    }
+    Py_ssize_t i = 0;
+    while (i < length) {
+        Py_ssize_t start = i;
+        while (i < length && PyUnicode_READ(kind, data, i) >= 128) {
+            i++;
+        }
+        if (PyUnicodeWriter_WriteSubstring(writer, string, start, i) < 0) {
+            goto error;
+        }
+        if (i == length) {
+            break;
+        }
+        start = i;
+        int has_escape = 0;
+        while (i < length && PyUnicode_READ(kind, data, i) < 128) {
+            has_escape |= PyUnicode_READ(kind, data, i) == '%';
+            i++;
+        }
+        if (utf8 && !has_escape) {
+            if (PyUnicodeWriter_WriteSubstring(writer, string, start, i) < 0) {
+                goto error;
+            }
+            continue;
+        }
+        PyObject *part = unquote_ascii(kind, data, start, i, encoding, errors);
+        if (part == NULL) {
+            goto error;
+        }
+        int rc = write_str(writer, part);
+        Py_DECREF(part);
+        if (rc < 0) {
+            goto error;
+        }
+    }
+    return PyUnicodeWriter_Finish(writer);
+
+error:
+    PyUnicodeWriter_Discard(writer);
+    return NULL;
+}
+
+/* unquote() and unquote_plus() for a str; encoding and errors are None or
+   str. */
+static PyObject *
+unquote_object(PyObject *string, PyObject *encoding, PyObject *errors,
+               int plus)
+{
+    const char *enc = "utf-8", *err = "replace";
+    PyObject *result;
+
+    if (encoding != Py_None && (enc = PyUnicode_AsUTF8(encoding)) == NULL) {
+        return NULL;
+    }
+    if (errors != Py_None && (err = PyUnicode_AsUTF8(errors)) == NULL) {
+        return NULL;
+    }
+    if (!plus || !contains_char(string, '+')) {
+        return unquote_str(string, enc, err);
+    }
+
+    PyObject *plus_str = PyUnicode_FromOrdinal('+');
+    PyObject *space = PyUnicode_FromOrdinal(' ');
+    if (plus_str == NULL || space == NULL) {
+        Py_XDECREF(plus_str);
+        Py_XDECREF(space);
+        return NULL;
+    }
+    string = PyUnicode_Replace(string, plus_str, space, -1);
+    Py_DECREF(plus_str);
+    Py_DECREF(space);
+    if (string == NULL) {
+        return NULL;
+    }
+    result = unquote_str(string, enc, err);
+    Py_DECREF(string);
+    return result;
+}
+
+/*[clinic input]
+_urlparse.unquote
+
+    string: object
+    encoding: object(c_default="&_Py_STR(utf_8)") = 'utf-8'
+    errors: object(c_default="&_Py_ID(replace)") = 'replace'
+
+Replace %xx escapes by their single-character equivalent.
+
+The optional encoding and errors parameters specify how to decode
+percent-encoded sequences into Unicode characters, as accepted by the
+bytes.decode() method.
+By default, percent-encoded sequences are decoded with UTF-8, and invalid
+sequences are replaced by a placeholder character.
+
+unquote('abc%20def') -> 'abc def'.
+[clinic start generated code]*/
+
+static PyObject *
+_urlparse_unquote_impl(PyObject *module, PyObject *string,
+                       PyObject *encoding, PyObject *errors)
+/*[clinic end generated code: output=f8bf055d88e2c6c9 input=a5cfa09abb23e9e4]*/
+{
+    if (PyUnicode_Check(string) &&
+        is_str_or_none(encoding) && is_str_or_none(errors))
+    {
+        return unquote_object(string, encoding, errors, 0);
+    }
+    if (PyBytes_Check(string) &&
+        PyUnicode_Check(encoding) && PyUnicode_Check(errors))
+    {
+        const char *enc = PyUnicode_AsUTF8(encoding);
+        const char *err = PyUnicode_AsUTF8(errors);
+        if (enc == NULL || err == NULL) {
+            return NULL;
+        }
+        return unquote_ascii(PyUnicode_1BYTE_KIND, PyBytes_AS_STRING(string),
+                             0, PyBytes_GET_SIZE(string), enc, err);
+    }
+    PyObject *args[3] = {string, encoding, errors};
+    return call_python(get_urlparse_state(module), "_py_unquote",
+                       args, 3, NULL);
+}
+
+
+/* Query strings */
+
+/*[clinic input]
+_urlparse.parse_qsl
+
+    qs: object
+    keep_blank_values: object = False
+    strict_parsing: object = False
+    encoding: object(c_default="&_Py_STR(utf_8)") = 'utf-8'
+    errors: object(c_default="&_Py_ID(replace)") = 'replace'
+    max_num_fields: object = None
+    separator: object(c_default="_Py_LATIN1_CHR('&')") = '&'
+    *
+    _stacklevel: object(c_default="_PyLong_GetOne()") = 1
+
+Parse a query given as a string argument.
+
+qs: percent-encoded query string to be parsed
+
+keep_blank_values: flag indicating whether blank values in
+    percent-encoded queries should be treated as blank strings.
+    A true value indicates that blanks should be retained as blank
+    strings.  The default false value indicates that blank values
+    are to be ignored and treated as if they were  not included.
+
+strict_parsing: flag indicating what to do with parsing errors. If
+    false (the default), errors are silently ignored. If true,
+    errors raise a ValueError exception.
+
+encoding and errors: specify how to decode percent-encoded sequences
+    into Unicode characters, as accepted by the bytes.decode() method.
+
+max_num_fields: int. If set, then throws a ValueError
+    if there are more than n fields read by parse_qsl().
+
+separator: str. The symbol to use for separating the query arguments.
+    Defaults to &.
+
+Returns a list, as G-d intended.
+[clinic start generated code]*/
+
+static PyObject *
+_urlparse_parse_qsl_impl(PyObject *module, PyObject *qs,
+                         PyObject *keep_blank_values,
+                         PyObject *strict_parsing, PyObject *encoding,
+                         PyObject *errors, PyObject *max_num_fields,
+                         PyObject *separator, PyObject *_stacklevel)
+/*[clinic end generated code: output=0e2dc18f26e80234 input=3c617de6ea0783c9]*/
+{
+    PyObject *fields = NULL, *result = NULL;
+    int keep_blank, strict;
+
+    if (!PyUnicode_Check(qs) || !PyUnicode_Check(separator) ||
+        PyUnicode_GET_LENGTH(separator) == 0 ||
+        !is_str_or_none(encoding) || !is_str_or_none(errors))
+    {
+        PyObject *args[8] = {qs, keep_blank_values, strict_parsing, encoding,
+                             errors, max_num_fields, separator, _stacklevel};
+        PyObject *kwnames = Py_BuildValue("(s)", "_stacklevel");
+        if (kwnames == NULL) {
+            return NULL;
+        }
+        result = call_python(get_urlparse_state(module), "_py_parse_qsl",
+                             args, 7, kwnames);
+        Py_DECREF(kwnames);
+        return result;
+    }
+
+    if (PyUnicode_GET_LENGTH(qs) == 0) {
+        return PyList_New(0);
+    }
+    if (max_num_fields != Py_None) {
+        Py_ssize_t count = PyUnicode_Count(qs, separator, 0, PY_SSIZE_T_MAX);
+        if (count < 0) {
+            return NULL;
+        }
+        PyObject *num_fields = PyLong_FromSsize_t(count + 1);
+        if (num_fields == NULL) {
+            return NULL;
+        }
+        int exceeded = PyObject_RichCompareBool(max_num_fields, num_fields,
+                                                Py_LT);
+        Py_DECREF(num_fields);
+        if (exceeded < 0) {
+            return NULL;
+        }
+        if (exceeded) {
+            PyErr_SetString(PyExc_ValueError, "Max number of fields exceeded");
+            return NULL;
+        }
+    }
+    keep_blank = PyObject_IsTrue(keep_blank_values);
+    if (keep_blank < 0) {
+        return NULL;
+    }
+    strict = PyObject_IsTrue(strict_parsing);
+    if (strict < 0) {
+        return NULL;
+    }
+
+    fields = PyUnicode_Split(qs, separator, -1);
+    if (fields == NULL) {
+        return NULL;
+    }
+    result = PyList_New(0);
+    if (result == NULL) {
+        goto error;
+    }
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(fields); i++) {
+        PyObject *field = PyList_GET_ITEM(fields, i);
+        Py_ssize_t length = PyUnicode_GET_LENGTH(field);
+        if (length == 0 && !strict) {
+            continue;
+        }
+        Py_ssize_t eq = PyUnicode_FindChar(field, '=', 0, length, 1);
+        if (eq < 0 && strict) {
+            PyErr_Format(PyExc_ValueError, "bad query field: %R", field);
+            goto error;
+        }
+        Py_ssize_t name_end = eq < 0 ? length : eq;
+        Py_ssize_t value_start = eq < 0 ? length : eq + 1;
+        if (value_start == length && !keep_blank) {
+            continue;
+        }
+
+        PyObject *name = PyUnicode_Substring(field, 0, name_end);
+        if (name == NULL) {
+            goto error;
+        }
+        Py_SETREF(name, unquote_object(name, encoding, errors, 1));
+        if (name == NULL) {
+            goto error;
+        }
+        PyObject *value = PyUnicode_Substring(field, value_start, length);
+        if (value == NULL) {
+            Py_DECREF(name);
+            goto error;
+        }
+        Py_SETREF(value, unquote_object(value, encoding, errors, 1));
+        if (value == NULL) {
+            Py_DECREF(name);
+            goto error;
+        }
+        PyObject *pair = PyTuple_Pack(2, name, value);
+        Py_DECREF(name);
+        Py_DECREF(value);
+        if (pair == NULL) {
+            goto error;
+        }
+        int rc = PyList_Append(result, pair);
+        Py_DECREF(pair);
+        if (rc < 0) {
+            goto error;
+        }
+    }
+    Py_DECREF(fields);
+    return result;
+
+error:
+    Py_XDECREF(fields);
+    Py_XDECREF(result);
+    return NULL;
+}
+
+typedef struct {
+    const char *table;
+    PyObject *encoding;
+    PyObject *errors;
+    int plus;
+} quote_args;
+
+/* Write quote_via(obj) for bytes, or quote_via(str(obj)) otherwise.
+   A str is passed as is if keep_str is true. */
+static int
+write_quoted(PyUnicodeWriter *writer, PyObject *obj, const quote_args *qa,
+             int keep_str)
+{
+    PyObject *s, *quoted;
+
+    if (PyBytes_Check(obj)) {
+        quoted = quote_object(obj, qa->table, Py_None, Py_None, qa->plus);
+    }
+    else if (keep_str && PyUnicode_Check(obj)) {
+        quoted = quote_object(obj, qa->table, qa->encoding, qa->errors,
+                              qa->plus);
+    }
+    else {
+        s = PyObject_Str(obj);
+        if (s == NULL) {
+            return -1;
+        }
+        quoted = quote_object(s, qa->table, qa->encoding, qa->errors,
+                              qa->plus);
+        Py_DECREF(s);
+    }
+    if (quoted == NULL) {
+        return -1;
+    }
+    int rc = write_str(writer, quoted);
+    Py_DECREF(quoted);
+    return rc;
+}
+
+/* Write "&k=v", without the "&" for the first pair. */
+static int
+write_pair(PyUnicodeWriter *writer, int *first, PyObject *k, PyObject *v,
+           const quote_args *qa, int keep_str)
+{
+    if (!*first && PyUnicodeWriter_WriteChar(writer, '&') < 0) {
+        return -1;
+    }
+    *first = 0;
+    if (write_quoted(writer, k, qa, 0) < 0 ||
+        PyUnicodeWriter_WriteChar(writer, '=') < 0 ||
+        write_quoted(writer, v, qa, keep_str) < 0)
+    {
+        return -1;
+    }
+    return 0;
+}
+
+/* k, v = item */
+static int
+unpack_pair(PyObject *item, PyObject **k, PyObject **v)
+{
+    if (PyTuple_CheckExact(item) && PyTuple_GET_SIZE(item) == 2) {
+        *k = Py_NewRef(PyTuple_GET_ITEM(item, 0));
+        *v = Py_NewRef(PyTuple_GET_ITEM(item, 1));
+        return 0;
+    }
+    if (Py_TYPE(item)->tp_iter == NULL && !PySequence_Check(item)) {
+        PyErr_Format(PyExc_TypeError, "cannot unpack non-iterable %.200s object",
+                     Py_TYPE(item)->tp_name);
+        return -1;
+    }
+    PyObject *it = PyObject_GetIter(item);
+    if (it == NULL) {
+        return -1;
+    }
+    PyObject *values[3] = {NULL, NULL, NULL};
+    int n = 0;
+    for (; n < 3; n++) {
+        values[n] = PyIter_Next(it);
+        if (values[n] == NULL) {
+            break;
+        }
+    }
+    Py_DECREF(it);
+    if (PyErr_Occurred()) {
+        goto error;
+    }
+    if (n < 2) {
+        PyErr_Format(PyExc_ValueError,
+                     "not enough values to unpack (expected 2, got %d)", n);
+        goto error;
+    }
+    if (n > 2) {
+        if (PyList_CheckExact(item) || PyTuple_CheckExact(item) ||
+            PyDict_CheckExact(item))
+        {
+            PyErr_Format(PyExc_ValueError,
+                         "too many values to unpack (expected 2, got %zd)",
+                         PyObject_Size(item));
+        }
+        else {
+            PyErr_SetString(PyExc_ValueError,
+                            "too many values to unpack (expected 2)");
+        }
+        goto error;
+    }
+    *k = values[0];
+    *v = values[1];
+    return 0;
+
+error:
+    for (int i = 0; i < 3; i++) {
+        Py_XDECREF(values[i]);
+    }
+    return -1;
+}
+
+/* Return an iterator over the (key, value) pairs of query, the way
+   urlencode() checks it. */
+static PyObject *
+query_pairs(PyObject *query)
+{
+    PyObject *items, *first;
+
+    if (PyObject_GetOptionalAttr(query, &_Py_ID(items), &items) < 0) {
+        return NULL;
+    }
+    if (items != NULL) {
+        PyObject *pairs = PyObject_CallNoArgs(items);
+        Py_DECREF(items);
+        if (pairs == NULL) {
+            return NULL;
+        }
+        Py_SETREF(pairs, PyObject_GetIter(pairs));
+        return pairs;
+    }
+
+    Py_ssize_t size = PyObject_Size(query);
+    if (size < 0) {
+        goto check_error;
+    }
+    if (size) {
+        PyObject *zero = PyLong_FromLong(0);
+        if (zero == NULL) {
+            return NULL;
+        }
+        first = PyObject_GetItem(query, zero);
+        Py_DECREF(zero);
+        if (first == NULL) {
+            goto check_error;
+        }
+        int is_tuple = PyTuple_Check(first);
+        Py_DECREF(first);
+        if (!is_tuple) {
+            PyErr_SetNone(PyExc_TypeError);
+            goto check_error;
+        }
+    }
+    return PyObject_GetIter(query);
+
+check_error:
+    if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+        _PyErr_FormatFromCause(PyExc_TypeError,
+                               "not a valid non-string sequence "
+                               "or mapping object");
+    }
+    return NULL;
+}
+
+/*[clinic input]
+_urlparse.urlencode
+
+    query: object
+    doseq: object = False
+    safe: object(c_default="&_Py_STR(empty)") = ''
+    encoding: object = None
+    errors: object = None
+    quote_via: object(c_default="NULL") = quote_plus
+
+Encode a dict or sequence of two-element tuples into a URL query string.
+
+If any values in the query arg are sequences and doseq is true, each
+sequence element is converted to a separate parameter.
+
+If the query arg is a sequence of two-element tuples, the order of the
+parameters in the output will match the order of parameters in the
+input.
+
+The components of a query arg may each be either a string or a bytes type.
+
+The safe, encoding, and errors parameters are passed down to the function
+specified by quote_via (encoding and errors only if a component is a str).
+[clinic start generated code]*/
+
+static PyObject *
+_urlparse_urlencode_impl(PyObject *module, PyObject *query, PyObject *doseq,
+                         PyObject *safe, PyObject *encoding,
+                         PyObject *errors, PyObject *quote_via)
+/*[clinic end generated code: output=95ae028da7ca60a2 input=d091e207a24565f4]*/
+{
+    char table[128];
+    quote_args qa = {table, encoding, errors, 1};
+    PyObject *pairs, *item, *k = NULL, *v = NULL;
+    PyUnicodeWriter *writer;
+    int first = 1, seq;
+
+    if (quote_via != NULL) {
+        if (PyCFunction_Check(quote_via) &&
+            PyCFunction_GET_SELF(quote_via) == module &&
+            PyCFunction_GET_FUNCTION(quote_via) ==
+                _PyCFunction_CAST(_urlparse_quote))
+        {
+            qa.plus = 0;
+        }
+        else if (!(PyCFunction_Check(quote_via) &&
+                   PyCFunction_GET_SELF(quote_via) == module &&
+                   PyCFunction_GET_FUNCTION(quote_via) ==
+                       _PyCFunction_CAST(_urlparse_quote_plus)))
+        {
+            goto fallback;
+        }
+    }
+    if (!is_str_or_none(encoding) || !is_str_or_none(errors) ||
+        !make_safe_table(safe, table))
+    {
+        goto fallback;
+    }
+    seq = PyObject_IsTrue(doseq);
+    if (seq < 0) {
+        return NULL;
+    }
+
+    pairs = query_pairs(query);
+    if (pairs == NULL) {
+        return NULL;
+    }
+    writer = PyUnicodeWriter_Create(0);
+    if (writer == NULL) {
+        Py_DECREF(pairs);
+        return NULL;
+    }
+    while ((item = PyIter_Next(pairs)) != NULL) {
+        int rc = unpack_pair(item, &k, &v);
+        Py_DECREF(item);
+        if (rc < 0) {
+            goto error;
+        }
+        if (!seq || PyBytes_Check(v) || PyUnicode_Check(v)) {
+            if (write_pair(writer, &first, k, v, &qa, seq) < 0) {
+                goto error;
+            }
+        }
+        else if (PyObject_Size(v) < 0) {
+            /* not a sequence */
+            if (!PyErr_ExceptionMatches(PyExc_TypeError)) {
+                goto error;
+            }
+            PyErr_Clear();
+            if (write_pair(writer, &first, k, v, &qa, 0) < 0) {
+                goto error;
+            }
+        }
+        else {
+            PyObject *it = PyObject_GetIter(v), *elt;
+            if (it == NULL) {
+                goto error;
+            }
+            while ((elt = PyIter_Next(it)) != NULL) {
+                rc = write_pair(writer, &first, k, elt, &qa, 0);
+                Py_DECREF(elt);
+                if (rc < 0) {
+                    Py_DECREF(it);
+                    goto error;
+                }
+            }
+            Py_DECREF(it);
+            if (PyErr_Occurred()) {
+                goto error;
+            }
+        }
+        Py_CLEAR(k);
+        Py_CLEAR(v);
+    }
+    Py_DECREF(pairs);
+    if (PyErr_Occurred()) {
+        PyUnicodeWriter_Discard(writer);
+        return NULL;
+    }
+    return PyUnicodeWriter_Finish(writer);
+
+error:
+    Py_XDECREF(k);
+    Py_XDECREF(v);
+    Py_DECREF(pairs);
+    PyUnicodeWriter_Discard(writer);
+    return NULL;
+
+fallback:;
+    PyObject *args[6] = {query, doseq, safe, encoding, errors, quote_via};
+    return call_python(get_urlparse_state(module), "_py_urlencode",
+                       args, quote_via == NULL ? 5 : 6, NULL);
+}
+
+
+static PyMethodDef urlparse_methods[] = {
+    _URLPARSE_URLSPLIT_METHODDEF
+    _URLPARSE_URLUNSPLIT_METHODDEF
+    _URLPARSE_QUOTE_METHODDEF
+    _URLPARSE_QUOTE_PLUS_METHODDEF
+    _URLPARSE_UNQUOTE_METHODDEF
+    _URLPARSE_PARSE_QSL_METHODDEF
+    _URLPARSE_URLENCODE_METHODDEF
+    {NULL, NULL}
+};
+
+static int
+get_result_type(PyObject *parse, const char *name, PyTypeObject **result)
+{
+    PyObject *type = PyObject_GetAttrString(parse, name);
+    if (type == NULL) {
+        return -1;
+    }
+    if (!PyType_Check(type) ||
+        !PyType_IsSubtype((PyTypeObject *)type, &PyTuple_Type))
+    {
+        PyErr_Format(PyExc_RuntimeError,
+                     "urllib.parse.%s should be a tuple subclass, not %R",
+                     name, type);
+        Py_DECREF(type);
+        return -1;
+    }
+    *result = (PyTypeObject *)type;
+    return 0;
+}
+
+static int
+urlparse_exec(PyObject *module)
+{
+    urlparse_state *st = get_urlparse_state(module);
+
+    /* urllib.parse imports this module after it defined everything. */
+    st->parse = PyImport_ImportModule("urllib.parse");
+    if (st->parse == NULL) {
+        return -1;
+    }
+    if (get_result_type(st->parse, "SplitResult", &st->split_result) < 0 ||
+        get_result_type(st->parse, "SplitResultBytes",
+                        &st->split_result_bytes) < 0)
+    {
+        return -1;
+    }
+
+    /* The functions are used and pickled as urllib.parse functions. */
+    PyObject *name = PyObject_GetAttr(st->parse, &_Py_ID(__name__));
+    if (name == NULL) {
+        return -1;
+    }
+    for (PyMethodDef *def = urlparse_methods; def->ml_name != NULL; def++) {
+        PyObject *func = PyObject_GetAttrString(module, def->ml_name);
+        if (func == NULL ||
+            PyObject_SetAttr(func, &_Py_ID(__module__), name) < 0)
+        {
+            Py_XDECREF(func);
+            Py_DECREF(name);
+            return -1;
+        }
+        Py_DECREF(func);
+    }
+    Py_DECREF(name);
+    return 0;
+}
+
+static int
+urlparse_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    urlparse_state *st = get_urlparse_state(module);
+    Py_VISIT(st->parse);
+    Py_VISIT(st->split_result);
+    Py_VISIT(st->split_result_bytes);
+    return 0;
+}
+
+static int
+urlparse_clear(PyObject *module)
+{
+    urlparse_state *st = get_urlparse_state(module);
+    Py_CLEAR(st->parse);
+    Py_CLEAR(st->split_result);
+    Py_CLEAR(st->split_result_bytes);
+    return 0;
+}
+
+static void
+urlparse_free(void *module)
+{
+    (void)urlparse_clear((PyObject *)module);
+}
+
+static PyModuleDef_Slot urlparse_slots[] = {
+    {Py_mod_exec, urlparse_exec},
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+    {0, NULL}
+};
+
+PyDoc_STRVAR(urlparse_module_doc,
+"C implementation of parts of the urllib.parse module.");
+
+static struct PyModuleDef _urlparsemodule = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_urlparse",
+    .m_doc = urlparse_module_doc,
+    .m_size = sizeof(urlparse_state),
+    .m_methods = urlparse_methods,
+    .m_slots = urlparse_slots,
+    .m_traverse = urlparse_traverse,
+    .m_clear = urlparse_clear,
+    .m_free = urlparse_free,
+};
+
+PyMODINIT_FUNC
+PyInit__urlparse(void)
+{
+    return PyModuleDef_Init(&_urlparsemodule);
+}
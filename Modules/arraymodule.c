@@ -23,6 +23,7 @@ module array
 /*[clinic end generated code: output=da39a3ee5e6b4b0d input=7d1b8d7f5958fd83]*/
 
 struct arrayobject; /* Forward */
+struct arraynumops;
 static struct PyModuleDef arraymodule;
 
 /* All possible arraydescr values are defined in the vector "descriptors"
@@ -38,6 +39,7 @@ struct arraydescr {
     const char *formats;
     int is_integer_type;
     int is_signed;
+    const struct arraynumops *numops;  /* NULL for character types */
 };
 
 typedef struct arrayobject {
@@ -600,26 +602,399 @@ DEFINE_COMPAREITEMS(LL, unsigned long)
 DEFINE_COMPAREITEMS(q, long long)
 DEFINE_COMPAREITEMS(QQ, unsigned long long)
 
+/* Elementwise arithmetic, comparisons and reductions.
+ *
+ * Each numeric typecode gets a table of typed loops.  Integer arithmetic is
+ * done in the widest C type of the same signedness with explicit overflow
+ * checks, so that results which do not fit in the item type raise
+ * OverflowError instead of wrapping around.  Floating-point sums use the
+ * same compensated summation as the builtin sum().
+ */
+
+enum {
+    ARRAY_ADD,
+    ARRAY_SUB,
+    ARRAY_MUL,
+};
+
+struct arraynumops {
+    /* r[i] = a[i] <op> b[i * step]; return -1 on overflow */
+    int (*binop)(int op, const void *a, const void *b, Py_ssize_t step,
+                 void *r, Py_ssize_t length);
+    /* r[i] = a[i] <op> b[i * step], op being one of Py_LT ... Py_GE */
+    void (*compare)(int op, const void *a, const void *b, Py_ssize_t step,
+                    unsigned char *r, Py_ssize_t length);
+    /* r[i] = a[i] != 0 */
+    void (*truth)(const void *a, unsigned char *r, Py_ssize_t length);
+    /* Index of the first smallest (Py_LT) or largest (Py_GT) item */
+    Py_ssize_t (*argbest)(int op, const void *a, Py_ssize_t length);
+    PyObject * (*sum)(const void *a, Py_ssize_t length);
+    PyObject * (*dot)(const void *a, const void *b, Py_ssize_t length);
+    /* Convert items to indices; return -1 if an item does not fit,
+       NULL for floating-point types */
+    int (*toindex)(const void *a, Py_ssize_t *r, Py_ssize_t length);
+};
+
+/* Checked arithmetic on the widest C integer types.  Return 1 on overflow,
+   otherwise store the result in *r and return 0. */
+
+static inline int
+ll_add(long long a, long long b, long long *r)
+{
+    if (b > 0 ? a > LLONG_MAX - b : a < LLONG_MIN - b) {
+        return 1;
+    }
+    *r = a + b;
+    return 0;
+}
+
+static inline int
+ll_sub(long long a, long long b, long long *r)
+{
+    if (b < 0 ? a > LLONG_MAX + b : a < LLONG_MIN + b) {
+        return 1;
+    }
+    *r = a - b;
+    return 0;
+}
+
+static inline int
+ll_mul(long long a, long long b, long long *r)
+{
+    /* Fast path: the product of two values smaller than 2**31 in
+       absolute value always fits */
+    if (-INT_MAX <= a && a <= INT_MAX && -INT_MAX <= b && b <= INT_MAX) {
+        *r = a * b;
+        return 0;
+    }
+    if (a > 0) {
+        if (b > 0 ? a > LLONG_MAX / b : b < LLONG_MIN / a) {
+            return 1;
+        }
+    }
+    else if (a < 0) {
+        if (b > 0 ? a < LLONG_MIN / b : (b != 0 && b < LLONG_MAX / a)) {
+            return 1;
+        }
+    }
+    *r = a * b;
+    return 0;
+}
+
+static inline int
+ull_add(unsigned long long a, unsigned long long b, unsigned long long *r)
+{
+    if (a > ULLONG_MAX - b) {
+        return 1;
+    }
+    *r = a + b;
+    return 0;
+}
+
+static inline int
+ull_sub(unsigned long long a, unsigned long long b, unsigned long long *r)
+{
+    if (b > a) {
+        return 1;
+    }
+    *r = a - b;
+    return 0;
+}
+
+static inline int
+ull_mul(unsigned long long a, unsigned long long b, unsigned long long *r)
+{
+    if ((a > UINT_MAX || b > UINT_MAX) && a != 0 && b > ULLONG_MAX / a) {
+        return 1;
+    }
+    *r = a * b;
+    return 0;
+}
+
+static inline int
+ll_to_index(long long x, Py_ssize_t *r)
+{
+#if SIZEOF_LONG_LONG > SIZEOF_SIZE_T
+    if (x < PY_SSIZE_T_MIN || x > PY_SSIZE_T_MAX) {
+        return 1;
+    }
+#endif
+    *r = (Py_ssize_t)x;
+    return 0;
+}
+
+static inline int
+ull_to_index(unsigned long long x, Py_ssize_t *r)
+{
+    if (x > (unsigned long long)PY_SSIZE_T_MAX) {
+        return 1;
+    }
+    *r = (Py_ssize_t)x;
+    return 0;
+}
+
+#define ll_to_pylong PyLong_FromLongLong
+#define ull_to_pylong PyLong_FromUnsignedLongLong
+
+/* Add the Python int term to *total, which may be NULL.  Steal term. */
+static int
+array_add_pylong(PyObject **total, PyObject *term)
+{
+    if (term == NULL) {
+        return -1;
+    }
+    if (*total == NULL) {
+        *total = term;
+        return 0;
+    }
+    Py_SETREF(*total, PyNumber_Add(*total, term));
+    Py_DECREF(term);
+    return *total == NULL ? -1 : 0;
+}
+
+/* See the comment above builtin_sum() in Python/bltinmodule.c */
+
+typedef struct {
+    double hi;     /* high-order bits for a running sum */
+    double lo;     /* a running compensation for lost low-order bits */
+} CompensatedSum;
+
+static inline CompensatedSum
+cs_add(CompensatedSum total, double x)
+{
+    double t = total.hi + x;
+    if (fabs(total.hi) >= fabs(x)) {
+        total.lo += (total.hi - t) + x;
+    }
+    else {
+        total.lo += (x - t) + total.hi;
+    }
+    return (CompensatedSum) {t, total.lo};
+}
+
+static inline double
+cs_to_double(CompensatedSum total)
+{
+    if (total.lo && isfinite(total.lo)) {
+        return total.hi + total.lo;
+    }
+    return total.hi;
+}
+
+#define ARRAY_INT_BINOP_LOOP(type, wide, checked) \
+    for (Py_ssize_t i = 0; i < length; i++) { \
+        wide x; \
+        if (checked(a[i], b[i * step], &x) || (wide)(type)x != x) \
+            return -1; \
+        r[i] = (type)x; \
+    }
+
+#define ARRAY_FLOAT_BINOP_LOOP(type, oper) \
+    for (Py_ssize_t i = 0; i < length; i++) \
+        r[i] = (type)((double)a[i] oper (double)b[i * step]);
+
+#define ARRAY_COMPARE_LOOP(oper) \
+    for (Py_ssize_t i = 0; i < length; i++) \
+        r[i] = a[i] oper b[i * step];
+
+#define DEFINE_COMMON_NUMOPS(code, type) \
+    static void \
+    code##_compare(int op, const void *lhs, const void *rhs, Py_ssize_t step, \
+                   unsigned char *r, Py_ssize_t length) \
+    { \
+        const type *a = lhs, *b = rhs; \
+        switch (op) { \
+        case Py_LT: ARRAY_COMPARE_LOOP(<) break; \
+        case Py_LE: ARRAY_COMPARE_LOOP(<=) break; \
+        case Py_EQ: ARRAY_COMPARE_LOOP(==) break; \
+        case Py_NE: ARRAY_COMPARE_LOOP(!=) break; \
+        case Py_GT: ARRAY_COMPARE_LOOP(>) break; \
+        case Py_GE: ARRAY_COMPARE_LOOP(>=) break; \
+        } \
+    } \
+    \
+    static void \
+    code##_truth(const void *lhs, unsigned char *r, Py_ssize_t length) \
+    { \
+        const type *a = lhs; \
+        for (Py_ssize_t i = 0; i < length; i++) \
+            r[i] = a[i] != 0; \
+    } \
+    \
+    static Py_ssize_t \
+    code##_argbest(int op, const void *lhs, Py_ssize_t length) \
+    { \
+        const type *a = lhs; \
+        Py_ssize_t best = 0; \
+        if (op == Py_LT) { \
+            for (Py_ssize_t i = 1; i < length; i++) \
+                if (a[i] < a[best]) \
+                    best = i; \
+        } \
+        else { \
+            for (Py_ssize_t i = 1; i < length; i++) \
+                if (a[i] > a[best]) \
+                    best = i; \
+        } \
+        return best; \
+    }
+
+#define DEFINE_INT_NUMOPS(code, type, wide, wp) \
+    DEFINE_COMMON_NUMOPS(code, type) \
+    \
+    static int \
+    code##_binop(int op, const void *lhs, const void *rhs, Py_ssize_t step, \
+                 void *result, Py_ssize_t length) \
+    { \
+        const type *a = lhs, *b = rhs; \
+        type *r = result; \
+        switch (op) { \
+        case ARRAY_ADD: ARRAY_INT_BINOP_LOOP(type, wide, wp##_add) break; \
+        case ARRAY_SUB: ARRAY_INT_BINOP_LOOP(type, wide, wp##_sub) break; \
+        case ARRAY_MUL: ARRAY_INT_BINOP_LOOP(type, wide, wp##_mul) break; \
+        } \
+        return 0; \
+    } \
+    \
+    static PyObject * \
+    code##_sum(const void *lhs, Py_ssize_t length) \
+    { \
+        const type *a = lhs; \
+        PyObject *total = NULL; \
+        wide acc = 0; \
+        for (Py_ssize_t i = 0; i < length; i++) { \
+            if (wp##_add(acc, a[i], &acc)) { \
+                /* Flush the partial sum to a Python int */ \
+                if (array_add_pylong(&total, wp##_to_pylong(acc)) < 0) \
+                    return NULL; \
+                acc = a[i]; \
+            } \
+        } \
+        if (array_add_pylong(&total, wp##_to_pylong(acc)) < 0) \
+            return NULL; \
+        return total; \
+    } \
+    \
+    static PyObject * \
+    code##_dot(const void *lhs, const void *rhs, Py_ssize_t length) \
+    { \
+        const type *a = lhs, *b = rhs; \
+        PyObject *total = NULL; \
+        wide acc = 0; \
+        for (Py_ssize_t i = 0; i < length; i++) { \
+            wide x; \
+            if (wp##_mul(a[i], b[i], &x)) { \
+                PyObject *u = wp##_to_pylong(a[i]); \
+                PyObject *v = wp##_to_pylong(b[i]); \
+                PyObject *term = NULL; \
+                if (u != NULL && v != NULL) \
+                    term = PyNumber_Multiply(u, v); \
+                Py_XDECREF(u); \
+                Py_XDECREF(v); \
+                if (array_add_pylong(&total, term) < 0) \
+                    return NULL; \
+            } \
+            else if (wp##_add(acc, x, &acc)) { \
+                if (array_add_pylong(&total, wp##_to_pylong(acc)) < 0) \
+                    return NULL; \
+                acc = x; \
+            } \
+        } \
+        if (array_add_pylong(&total, wp##_to_pylong(acc)) < 0) \
+            return NULL; \
+        return total; \
+    } \
+    \
+    static int \
+    code##_toindex(const void *lhs, Py_ssize_t *r, Py_ssize_t length) \
+    { \
+        const type *a = lhs; \
+        for (Py_ssize_t i = 0; i < length; i++) \
+            if (wp##_to_index(a[i], &r[i])) \
+                return -1; \
+        return 0; \
+    } \
+    \
+    static const struct arraynumops code##_numops = { \
+        code##_binop, code##_compare, code##_truth, code##_argbest, \
+        code##_sum, code##_dot, code##_toindex, \
+    };
+
+#define DEFINE_FLOAT_NUMOPS(code, type) \
+    DEFINE_COMMON_NUMOPS(code, type) \
+    \
+    static int \
+    code##_binop(int op, const void *lhs, const void *rhs, Py_ssize_t step, \
+                 void *result, Py_ssize_t length) \
+    { \
+        const type *a = lhs, *b = rhs; \
+        type *r = result; \
+        switch (op) { \
+        case ARRAY_ADD: ARRAY_FLOAT_BINOP_LOOP(type, +) break; \
+        case ARRAY_SUB: ARRAY_FLOAT_BINOP_LOOP(type, -) break; \
+        case ARRAY_MUL: ARRAY_FLOAT_BINOP_LOOP(type, *) break; \
+        } \
+        return 0; \
+    } \
+    \
+    static PyObject * \
+    code##_sum(const void *lhs, Py_ssize_t length) \
+    { \
+        const type *a = lhs; \
+        CompensatedSum total = {0.0, 0.0}; \
+        for (Py_ssize_t i = 0; i < length; i++) \
+            total = cs_add(total, a[i]); \
+        return PyFloat_FromDouble(cs_to_double(total)); \
+    } \
+    \
+    static PyObject * \
+    code##_dot(const void *lhs, const void *rhs, Py_ssize_t length) \
+    { \
+        const type *a = lhs, *b = rhs; \
+        CompensatedSum total = {0.0, 0.0}; \
+        for (Py_ssize_t i = 0; i < length; i++) \
+            total = cs_add(total, (double)a[i] * (double)b[i]); \
+        return PyFloat_FromDouble(cs_to_double(total)); \
+    } \
+    \
+    static const struct arraynumops code##_numops = { \
+        code##_binop, code##_compare, code##_truth, code##_argbest, \
+        code##_sum, code##_dot, NULL, \
+    };
+
+DEFINE_INT_NUMOPS(b, signed char, long long, ll)
+DEFINE_INT_NUMOPS(BB, unsigned char, unsigned long long, ull)
+DEFINE_INT_NUMOPS(h, short, long long, ll)
+DEFINE_INT_NUMOPS(HH, unsigned short, unsigned long long, ull)
+DEFINE_INT_NUMOPS(i, int, long long, ll)
+DEFINE_INT_NUMOPS(II, unsigned int, unsigned long long, ull)
+DEFINE_INT_NUMOPS(l, long, long long, ll)
+DEFINE_INT_NUMOPS(LL, unsigned long, unsigned long long, ull)
+DEFINE_INT_NUMOPS(q, long long, long long, ll)
+DEFINE_INT_NUMOPS(QQ, unsigned long long, unsigned long long, ull)
+DEFINE_FLOAT_NUMOPS(f, float)
+DEFINE_FLOAT_NUMOPS(d, double)
+
 /* Description of types.
  *
  * Don't forget to update typecode_to_mformat_code() if you add a new
  * typecode.
  */
 static const struct arraydescr descriptors[] = {
-    {'b', 1, b_getitem, b_setitem, b_compareitems, "b", 1, 1},
-    {'B', 1, BB_getitem, BB_setitem, BB_compareitems, "B", 1, 0},
-    {'u', sizeof(wchar_t), u_getitem, u_setitem, u_compareitems, "u", 0, 0},
-    {'w', sizeof(Py_UCS4), w_getitem, w_setitem, w_compareitems, "w", 0, 0,},
-    {'h', sizeof(short), h_getitem, h_setitem, h_compareitems, "h", 1, 1},
-    {'H', sizeof(short), HH_getitem, HH_setitem, HH_compareitems, "H", 1, 0},
-    {'i', sizeof(int), i_getitem, i_setitem, i_compareitems, "i", 1, 1},
-    {'I', sizeof(int), II_getitem, II_setitem, II_compareitems, "I", 1, 0},
-    {'l', sizeof(long), l_getitem, l_setitem, l_compareitems, "l", 1, 1},
-    {'L', sizeof(long), LL_getitem, LL_setitem, LL_compareitems, "L", 1, 0},
-    {'q', sizeof(long long), q_getitem, q_setitem, q_compareitems, "q", 1, 1},
-    {'Q', sizeof(long long), QQ_getitem, QQ_setitem, QQ_compareitems, "Q", 1, 0},
-    {'f', sizeof(float), f_getitem, f_setitem, NULL, "f", 0, 0},
-    {'d', sizeof(double), d_getitem, d_setitem, NULL, "d", 0, 0},
+    {'b', 1, b_getitem, b_setitem, b_compareitems, "b", 1, 1, &b_numops},
+    {'B', 1, BB_getitem, BB_setitem, BB_compareitems, "B", 1, 0, &BB_numops},
+    {'u', sizeof(wchar_t), u_getitem, u_setitem, u_compareitems, "u", 0, 0, NULL},
+    {'w', sizeof(Py_UCS4), w_getitem, w_setitem, w_compareitems, "w", 0, 0, NULL},
+    {'h', sizeof(short), h_getitem, h_setitem, h_compareitems, "h", 1, 1, &h_numops},
+    {'H', sizeof(short), HH_getitem, HH_setitem, HH_compareitems, "H", 1, 0, &HH_numops},
+    {'i', sizeof(int), i_getitem, i_setitem, i_compareitems, "i", 1, 1, &i_numops},
+    {'I', sizeof(int), II_getitem, II_setitem, II_compareitems, "I", 1, 0, &II_numops},
+    {'l', sizeof(long), l_getitem, l_setitem, l_compareitems, "l", 1, 1, &l_numops},
+    {'L', sizeof(long), LL_getitem, LL_setitem, LL_compareitems, "L", 1, 0, &LL_numops},
+    {'q', sizeof(long long), q_getitem, q_setitem, q_compareitems, "q", 1, 1, &q_numops},
+    {'Q', sizeof(long long), QQ_getitem, QQ_setitem, QQ_compareitems, "Q", 1, 0, &QQ_numops},
+    {'f', sizeof(float), f_getitem, f_setitem, NULL, "f", 0, 0, &f_numops},
+    {'d', sizeof(double), d_getitem, d_setitem, NULL, "d", 0, 0, &d_numops},
     {'\0', 0, 0, 0, 0, 0, 0} /* Sentinel */
 };
 
@@ -1880,6 +2255,571 @@ array_array___sizeof___impl(arrayobject *self)
     return PyLong_FromSize_t(res);
 }
 
+/*********************** Elementwise operations ************************/
+
+static const struct arraynumops *
+array_get_numops(arrayobject *self)
+{
+    const struct arraynumops *numops = self->ob_descr->numops;
+    if (numops == NULL) {
+        PyErr_Format(PyExc_TypeError,
+                     "unsupported operation for array with typecode '%c'",
+                     self->ob_descr->typecode);
+    }
+    return numops;
+}
+
+/* Return the right operand of an elementwise operation as an array: other
+ * itself if it is an array with the same typecode and length as self (and
+ * set *step to 1), or a new one-item array holding other (and set *step to
+ * 0), so that the typed loops can read b[i * step].
+ */
+static arrayobject *
+array_operand(array_state *state, arrayobject *self, PyObject *other,
+              Py_ssize_t *step)
+{
+    arrayobject *b;
+
+    if (array_Check(other, state)) {
+        b = (arrayobject *)other;
+        if (b->ob_descr != self->ob_descr) {
+            PyErr_Format(PyExc_TypeError,
+                         "arrays must have the same typecode, not '%c' and '%c'",
+                         self->ob_descr->typecode, b->ob_descr->typecode);
+            return NULL;
+        }
+        if (Py_SIZE(b) != Py_SIZE(self)) {
+            PyErr_SetString(PyExc_ValueError,
+                            "arrays must have the same length");
+            return NULL;
+        }
+        *step = 1;
+        return (arrayobject *)Py_NewRef(b);
+    }
+    b = (arrayobject *)newarrayobject(state->ArrayType, 1, self->ob_descr);
+    if (b == NULL) {
+        return NULL;
+    }
+    if ((*self->ob_descr->setitem)(b, 0, other) < 0) {
+        Py_DECREF(b);
+        return NULL;
+    }
+    *step = 0;
+    return b;
+}
+
+static PyObject *
+array_binop(array_state *state, arrayobject *self, PyObject *other, int op,
+            int inplace)
+{
+    const struct arraynumops *numops = array_get_numops(self);
+    if (numops == NULL) {
+        return NULL;
+    }
+    Py_ssize_t step;
+    arrayobject *b = array_operand(state, self, other, &step);
+    if (b == NULL) {
+        return NULL;
+    }
+    /* Converting a scalar operand can run arbitrary code, so only read the
+       size now */
+    Py_ssize_t n = Py_SIZE(self);
+    arrayobject *res = NULL;
+    char *result;
+    if (!inplace) {
+        res = (arrayobject *)newarrayobject(state->ArrayType, n,
+                                            self->ob_descr);
+        if (res == NULL) {
+            Py_DECREF(b);
+            return NULL;
+        }
+        result = res->ob_item;
+    }
+    else if (self->ob_descr->is_integer_type) {
+        /* Compute into a temporary buffer, so that self is left unchanged
+           if the operation overflows */
+        result = PyMem_Malloc(n * self->ob_descr->itemsize);
+        if (result == NULL) {
+            Py_DECREF(b);
+            return PyErr_NoMemory();
+        }
+    }
+    else {
+        result = self->ob_item;
+    }
+    int rc = numops->binop(op, self->ob_item, b->ob_item, step, result, n);
+    Py_DECREF(b);
+    if (inplace && result != self->ob_item) {
+        if (rc == 0) {
+            memcpy(self->ob_item, result, n * self->ob_descr->itemsize);
+        }
+        PyMem_Free(result);
+    }
+    if (rc < 0) {
+        Py_XDECREF(res);
+        PyErr_SetString(PyExc_OverflowError,
+                        "result does not fit in an array item");
+        return NULL;
+    }
+    if (inplace) {
+        Py_RETURN_NONE;
+    }
+    return (PyObject *)res;
+}
+
+/*[clinic input]
+array.array.add
+
+    cls: defining_class
+    other: object
+    /
+
+Return a new array with other added to each item.
+
+other is either an array with the same typecode and length, whose items
+are added elementwise, or a single value valid for the array.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_add_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=e5539151b2db2983 input=d726ed48e4ccf518]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    return array_binop(state, self, other, ARRAY_ADD, 0);
+}
+
+/*[clinic input]
+array.array.sub = array.array.add
+
+Return a new array with other subtracted from each item.
+
+other is either an array with the same typecode and length, whose items
+are subtracted elementwise, or a single value valid for the array.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_sub_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=0941a55c38fb4376 input=12ca379623464c69]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    return array_binop(state, self, other, ARRAY_SUB, 0);
+}
+
+/*[clinic input]
+array.array.mul = array.array.add
+
+Return a new array with each item multiplied by other.
+
+other is either an array with the same typecode and length, whose items
+are multiplied elementwise, or a single value valid for the array.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_mul_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=1fcc2078325e2c93 input=a94a4717d92ece6d]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    return array_binop(state, self, other, ARRAY_MUL, 0);
+}
+
+/*[clinic input]
+array.array.iadd = array.array.add
+
+Add other to each item in place.
+
+Like add(), but modify the array.  If a result does not fit in the
+item type, OverflowError is raised and the array is left unchanged.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_iadd_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=743ab05d7f207394 input=b27530720a9ed1bf]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    return array_binop(state, self, other, ARRAY_ADD, 1);
+}
+
+/*[clinic input]
+array.array.isub = array.array.add
+
+Subtract other from each item in place.
+
+Like sub(), but modify the array.  If a result does not fit in the
+item type, OverflowError is raised and the array is left unchanged.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_isub_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=5f21178bd19e5815 input=d8d23861a9933527]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    return array_binop(state, self, other, ARRAY_SUB, 1);
+}
+
+/*[clinic input]
+array.array.imul = array.array.add
+
+Multiply each item by other in place.
+
+Like mul(), but modify the array.  If a result does not fit in the
+item type, OverflowError is raised and the array is left unchanged.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_imul_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=5cb7645f277bb3b5 input=2b78c5727c7fa3df]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    return array_binop(state, self, other, ARRAY_MUL, 1);
+}
+
+/*[clinic input]
+array.array.compare
+
+    cls: defining_class
+    op: str
+    other: object
+    /
+
+Compare each item with other.
+
+op is one of '<', '<=', '==', '!=', '>' or '>='.  other is either an
+array with the same typecode and length, or a single value valid for the
+array.  Return an array of typecode 'B' holding 1 where the comparison
+is true and 0 where it is false.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_compare_impl(arrayobject *self, PyTypeObject *cls,
+                         const char *op, PyObject *other)
+/*[clinic end generated code: output=ff04ce1c33d828c6 input=37da36677745b4f9]*/
+{
+    static const struct {
+        const char *name;
+        int op;
+    } ops[] = {
+        {"<", Py_LT}, {"<=", Py_LE}, {"==", Py_EQ},
+        {"!=", Py_NE}, {">", Py_GT}, {">=", Py_GE},
+    };
+    array_state *state = get_array_state_by_class(cls);
+    const struct arraynumops *numops = array_get_numops(self);
+    if (numops == NULL) {
+        return NULL;
+    }
+    int cmp = -1;
+    for (size_t i = 0; i < Py_ARRAY_LENGTH(ops); i++) {
+        if (strcmp(op, ops[i].name) == 0) {
+            cmp = ops[i].op;
+            break;
+        }
+    }
+    if (cmp < 0) {
+        PyErr_Format(PyExc_ValueError,
+                     "op must be one of '<', '<=', '==', '!=', '>' or '>=', "
+                     "not '%s'", op);
+        return NULL;
+    }
+    Py_ssize_t step;
+    arrayobject *b = array_operand(state, self, other, &step);
+    if (b == NULL) {
+        return NULL;
+    }
+    Py_ssize_t n = Py_SIZE(self);
+    arrayobject *res = (arrayobject *)newarrayobject(state->ArrayType, n,
+                                                     &descriptors[1]);
+    if (res != NULL) {
+        assert(res->ob_descr->typecode == 'B');
+        numops->compare(cmp, self->ob_item, b->ob_item, step,
+                        (unsigned char *)res->ob_item, n);
+    }
+    Py_DECREF(b);
+    return (PyObject *)res;
+}
+
+/*[clinic input]
+array.array.sum
+
+Return the sum of the items.
+
+The sum of an integer array is exact.  The sum of a floating-point array
+is computed with the same compensated summation as the builtin sum().
+[clinic start generated code]*/
+
+static PyObject *
+array_array_sum_impl(arrayobject *self)
+/*[clinic end generated code: output=1fea0a058435b932 input=e02863d11b9bba96]*/
+{
+    const struct arraynumops *numops = array_get_numops(self);
+    if (numops == NULL) {
+        return NULL;
+    }
+    return numops->sum(self->ob_item, Py_SIZE(self));
+}
+
+/*[clinic input]
+array.array.min
+
+Return the smallest item.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_min_impl(arrayobject *self)
+/*[clinic end generated code: output=f87ea946f2832bda input=db20c7ae794ef508]*/
+{
+    const struct arraynumops *numops = array_get_numops(self);
+    if (numops == NULL) {
+        return NULL;
+    }
+    if (Py_SIZE(self) == 0) {
+        PyErr_SetString(PyExc_ValueError, "min() arg is an empty array");
+        return NULL;
+    }
+    return getarrayitem((PyObject *)self,
+                        numops->argbest(Py_LT, self->ob_item, Py_SIZE(self)));
+}
+
+/*[clinic input]
+array.array.max
+
+Return the largest item.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_max_impl(arrayobject *self)
+/*[clinic end generated code: output=a7d50dfabda245cf input=0b121569fb566330]*/
+{
+    const struct arraynumops *numops = array_get_numops(self);
+    if (numops == NULL) {
+        return NULL;
+    }
+    if (Py_SIZE(self) == 0) {
+        PyErr_SetString(PyExc_ValueError, "max() arg is an empty array");
+        return NULL;
+    }
+    return getarrayitem((PyObject *)self,
+                        numops->argbest(Py_GT, self->ob_item, Py_SIZE(self)));
+}
+
+/*[clinic input]
+array.array.dot
+
+    cls: defining_class
+    other: object
+    /
+
+Return the sum of the products of the items of two arrays.
+
+other must be an array with the same typecode and length.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_dot_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=caed11dcd2abbb81 input=be0a82f85b374041]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    const struct arraynumops *numops = array_get_numops(self);
+    if (numops == NULL) {
+        return NULL;
+    }
+    if (!array_Check(other, state)) {
+        PyErr_Format(PyExc_TypeError,
+                     "dot() argument must be an array, not %T", other);
+        return NULL;
+    }
+    Py_ssize_t step;
+    arrayobject *b = array_operand(state, self, other, &step);
+    if (b == NULL) {
+        return NULL;
+    }
+    PyObject *res = numops->dot(self->ob_item, b->ob_item, Py_SIZE(self));
+    Py_DECREF(b);
+    return res;
+}
+
+/*[clinic input]
+array.array.take
+
+    cls: defining_class
+    indices: object
+    /
+
+Return a new array with the items at the given indices.
+
+indices is an integer array or an iterable of integers.  Negative
+indices count from the end of the array.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_take_impl(arrayobject *self, PyTypeObject *cls,
+                      PyObject *indices)
+/*[clinic end generated code: output=96fe8f9daeef8acf input=6a1f53f515a6a9f0]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    Py_ssize_t *idx, n, size, itemsize;
+
+    if (array_Check(indices, state)) {
+        arrayobject *ia = (arrayobject *)indices;
+        const struct arraynumops *numops = ia->ob_descr->numops;
+        if (numops == NULL || numops->toindex == NULL) {
+            PyErr_Format(PyExc_TypeError,
+                         "array indices must be integers, not typecode '%c'",
+                         ia->ob_descr->typecode);
+            return NULL;
+        }
+        n = Py_SIZE(ia);
+        idx = PyMem_New(Py_ssize_t, n);
+        if (idx == NULL) {
+            return PyErr_NoMemory();
+        }
+        if (numops->toindex(ia->ob_item, idx, n) < 0) {
+            PyMem_Free(idx);
+            PyErr_SetString(PyExc_IndexError, "array index out of range");
+            return NULL;
+        }
+    }
+    else {
+        PyObject *seq = PySequence_Tuple(indices);
+        if (seq == NULL) {
+            return NULL;
+        }
+        n = PyTuple_GET_SIZE(seq);
+        idx = PyMem_New(Py_ssize_t, n);
+        if (idx == NULL) {
+            Py_DECREF(seq);
+            return PyErr_NoMemory();
+        }
+        for (Py_ssize_t i = 0; i < n; i++) {
+            idx[i] = PyNumber_AsSsize_t(PyTuple_GET_ITEM(seq, i),
+                                        PyExc_IndexError);
+            if (idx[i] == -1 && PyErr_Occurred()) {
+                Py_DECREF(seq);
+                PyMem_Free(idx);
+                return NULL;
+            }
+        }
+        Py_DECREF(seq);
+    }
+
+    /* Check all the indices before allocating the result */
+    size = Py_SIZE(self);
+    for (Py_ssize_t i = 0; i < n; i++) {
+        if (idx[i] < 0) {
+            idx[i] += size;
+        }
+        if (idx[i] < 0 || idx[i] >= size) {
+            PyMem_Free(idx);
+            PyErr_SetString(PyExc_IndexError, "array index out of range");
+            return NULL;
+        }
+    }
+    arrayobject *res = (arrayobject *)newarrayobject(state->ArrayType, n,
+                                                     self->ob_descr);
+    if (res != NULL) {
+        itemsize = self->ob_descr->itemsize;
+        switch (itemsize) {
+#define TAKE_LOOP(size) \
+        case size: \
+            for (Py_ssize_t i = 0; i < n; i++) \
+                memcpy(res->ob_item + i * size, \
+                       self->ob_item + idx[i] * size, size); \
+            break;
+        TAKE_LOOP(1)
+        TAKE_LOOP(2)
+        TAKE_LOOP(4)
+        TAKE_LOOP(8)
+#undef TAKE_LOOP
+        default:
+            for (Py_ssize_t i = 0; i < n; i++) {
+                memcpy(res->ob_item + i * itemsize,
+                       self->ob_item + idx[i] * itemsize, itemsize);
+            }
+        }
+    }
+    PyMem_Free(idx);
+    return (PyObject *)res;
+}
+
+/*[clinic input]
+array.array.compress
+
+    cls: defining_class
+    mask: object
+    /
+
+Return a new array with the items for which mask is true.
+
+mask is an array or an iterable with the same length as the array.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_compress_impl(arrayobject *self, PyTypeObject *cls,
+                          PyObject *mask)
+/*[clinic end generated code: output=e2410a468e6a8766 input=c1273e8b5a268f33]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    unsigned char *flags;
+    Py_ssize_t n, count, itemsize;
+
+    if (array_Check(mask, state) &&
+        ((arrayobject *)mask)->ob_descr->numops != NULL)
+    {
+        arrayobject *ma = (arrayobject *)mask;
+        n = Py_SIZE(ma);
+        flags = PyMem_Malloc(n);
+        if (flags == NULL) {
+            return PyErr_NoMemory();
+        }
+        ma->ob_descr->numops->truth(ma->ob_item, flags, n);
+    }
+    else {
+        PyObject *seq = PySequence_Tuple(mask);
+        if (seq == NULL) {
+            return NULL;
+        }
+        n = PyTuple_GET_SIZE(seq);
+        flags = PyMem_Malloc(n);
+        if (flags == NULL) {
+            Py_DECREF(seq);
+            return PyErr_NoMemory();
+        }
+        for (Py_ssize_t i = 0; i < n; i++) {
+            int truth = PyObject_IsTrue(PyTuple_GET_ITEM(seq, i));
+            if (truth < 0) {
+                Py_DECREF(seq);
+                PyMem_Free(flags);
+                return NULL;
+            }
+            flags[i] = (unsigned char)truth;
+        }
+        Py_DECREF(seq);
+    }
+
+    if (n != Py_SIZE(self)) {
+        PyMem_Free(flags);
+        PyErr_SetString(PyExc_ValueError,
+                        "mask must have the same length as the array");
+        return NULL;
+    }
+    count = 0;
+    for (Py_ssize_t i = 0; i < n; i++) {
+        count += flags[i];
+    }
+    arrayobject *res = (arrayobject *)newarrayobject(state->ArrayType, count,
+                                                     self->ob_descr);
+    if (res != NULL) {
+        char *dst = res->ob_item;
+        itemsize = self->ob_descr->itemsize;
+        for (Py_ssize_t i = 0; i < n; i++) {
+            if (flags[i]) {
+                memcpy(dst, self->ob_item + i * itemsize, itemsize);
+                dst += itemsize;
+            }
+        }
+    }
+    PyMem_Free(flags);
+    return (PyObject *)res;
+}
+
 
 /*********************** Pickling support ************************/
 
@@ -2383,24 +3323,37 @@ static PyGetSetDef array_getsets [] = {
 };
 
 static PyMethodDef array_methods[] = {
+    ARRAY_ARRAY_ADD_METHODDEF
     ARRAY_ARRAY_APPEND_METHODDEF
     ARRAY_ARRAY_BUFFER_INFO_METHODDEF
     ARRAY_ARRAY_BYTESWAP_METHODDEF
     ARRAY_ARRAY_CLEAR_METHODDEF
+    ARRAY_ARRAY_COMPARE_METHODDEF
+    ARRAY_ARRAY_COMPRESS_METHODDEF
     ARRAY_ARRAY___COPY___METHODDEF
     ARRAY_ARRAY_COUNT_METHODDEF
     ARRAY_ARRAY___DEEPCOPY___METHODDEF
+    ARRAY_ARRAY_DOT_METHODDEF
     ARRAY_ARRAY_EXTEND_METHODDEF
     ARRAY_ARRAY_FROMFILE_METHODDEF
     ARRAY_ARRAY_FROMLIST_METHODDEF
     ARRAY_ARRAY_FROMBYTES_METHODDEF
     ARRAY_ARRAY_FROMUNICODE_METHODDEF
+    ARRAY_ARRAY_IADD_METHODDEF
+    ARRAY_ARRAY_IMUL_METHODDEF
     ARRAY_ARRAY_INDEX_METHODDEF
     ARRAY_ARRAY_INSERT_METHODDEF
+    ARRAY_ARRAY_ISUB_METHODDEF
+    ARRAY_ARRAY_MAX_METHODDEF
+    ARRAY_ARRAY_MIN_METHODDEF
+    ARRAY_ARRAY_MUL_METHODDEF
     ARRAY_ARRAY_POP_METHODDEF
     ARRAY_ARRAY___REDUCE_EX___METHODDEF
     ARRAY_ARRAY_REMOVE_METHODDEF
     ARRAY_ARRAY_REVERSE_METHODDEF
+    ARRAY_ARRAY_SUB_METHODDEF
+    ARRAY_ARRAY_SUM_METHODDEF
+    ARRAY_ARRAY_TAKE_METHODDEF
     ARRAY_ARRAY_TOFILE_METHODDEF
     ARRAY_ARRAY_TOLIST_METHODDEF
     ARRAY_ARRAY_TOBYTES_METHODDEF
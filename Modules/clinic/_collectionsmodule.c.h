@@ -632,4 +632,535 @@ tuplegetter_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=b9d4d647c221cb9f input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(sortedlist_init__doc__,
+"SortedList(iterable=(), key=None)\n"
+"--\n"
+"\n"
+"A list which keeps its items sorted.\n"
+"\n"
+"Items are sorted in ascending order of key(item), or of the items\n"
+"themselves if key is None.  Insertion, deletion, positional access and\n"
+"bisection take O(log n) time.");
+
+static int
+sortedlist_init_impl(sortedlistobject *self, PyObject *iterable,
+                     PyObject *key);
+
+static int
+sortedlist_init(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    int return_value = -1;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 2
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(iterable), &_Py_ID(key), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"iterable", "key", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "SortedList",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    PyObject *iterable = NULL;
+    PyObject *key = Py_None;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 2, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (fastargs[0]) {
+        iterable = fastargs[0];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    key = fastargs[1];
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_init_impl((sortedlistobject *)self, iterable, key);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_add__doc__,
+"add($self, value, /)\n"
+"--\n"
+"\n"
+"Add value, after the items which are equal to it.");
+
+#define SORTEDLIST_ADD_METHODDEF    \
+    {"add", (PyCFunction)sortedlist_add, METH_O, sortedlist_add__doc__},
+
+static PyObject *
+sortedlist_add_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_add(PyObject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_add_impl((sortedlistobject *)self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_update__doc__,
+"update($self, iterable, /)\n"
+"--\n"
+"\n"
+"Add the values of iterable.");
+
+#define SORTEDLIST_UPDATE_METHODDEF    \
+    {"update", (PyCFunction)sortedlist_update, METH_O, sortedlist_update__doc__},
+
+static PyObject *
+sortedlist_update_impl(sortedlistobject *self, PyObject *iterable);
+
+static PyObject *
+sortedlist_update(PyObject *self, PyObject *iterable)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_update_impl((sortedlistobject *)self, iterable);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_discard__doc__,
+"discard($self, value, /)\n"
+"--\n"
+"\n"
+"Remove the first item equal to value if it is present.");
+
+#define SORTEDLIST_DISCARD_METHODDEF    \
+    {"discard", (PyCFunction)sortedlist_discard, METH_O, sortedlist_discard__doc__},
+
+static PyObject *
+sortedlist_discard_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_discard(PyObject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_discard_impl((sortedlistobject *)self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_remove__doc__,
+"remove($self, value, /)\n"
+"--\n"
+"\n"
+"Remove the first item equal to value.\n"
+"\n"
+"Raise ValueError if it is not present.");
+
+#define SORTEDLIST_REMOVE_METHODDEF    \
+    {"remove", (PyCFunction)sortedlist_remove, METH_O, sortedlist_remove__doc__},
+
+static PyObject *
+sortedlist_remove_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_remove(PyObject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_remove_impl((sortedlistobject *)self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_pop__doc__,
+"pop($self, index=-1, /)\n"
+"--\n"
+"\n"
+"Remove and return the item at index (default last).\n"
+"\n"
+"Raise IndexError if the list is empty or index is out of range.");
+
+#define SORTEDLIST_POP_METHODDEF    \
+    {"pop", _PyCFunction_CAST(sortedlist_pop), METH_FASTCALL, sortedlist_pop__doc__},
+
+static PyObject *
+sortedlist_pop_impl(sortedlistobject *self, Py_ssize_t index);
+
+static PyObject *
+sortedlist_pop(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    Py_ssize_t index = -1;
+
+    if (!_PyArg_CheckPositional("pop", nargs, 0, 1)) {
+        goto exit;
+    }
+    if (nargs < 1) {
+        goto skip_optional;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[0]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        index = ival;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_pop_impl((sortedlistobject *)self, index);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_clear__doc__,
+"clear($self, /)\n"
+"--\n"
+"\n"
+"Remove all items.");
+
+#define SORTEDLIST_CLEAR_METHODDEF    \
+    {"clear", (PyCFunction)sortedlist_clear, METH_NOARGS, sortedlist_clear__doc__},
+
+static PyObject *
+sortedlist_clear_impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist_clear(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_clear_impl((sortedlistobject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_copy__doc__,
+"copy($self, /)\n"
+"--\n"
+"\n"
+"Return a shallow copy.");
+
+#define SORTEDLIST_COPY_METHODDEF    \
+    {"copy", (PyCFunction)sortedlist_copy, METH_NOARGS, sortedlist_copy__doc__},
+
+static PyObject *
+sortedlist_copy_impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist_copy(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_copy_impl((sortedlistobject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_bisect_left__doc__,
+"bisect_left($self, value, /)\n"
+"--\n"
+"\n"
+"Return the index where value would be inserted before equal items.\n"
+"\n"
+"This is also the number of items less than value (its rank).");
+
+#define SORTEDLIST_BISECT_LEFT_METHODDEF    \
+    {"bisect_left", (PyCFunction)sortedlist_bisect_left, METH_O, sortedlist_bisect_left__doc__},
+
+static PyObject *
+sortedlist_bisect_left_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_bisect_left(PyObject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_bisect_left_impl((sortedlistobject *)self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_bisect_right__doc__,
+"bisect_right($self, value, /)\n"
+"--\n"
+"\n"
+"Return the index where value would be inserted after equal items.\n"
+"\n"
+"This is also the number of items less than or equal to value.");
+
+#define SORTEDLIST_BISECT_RIGHT_METHODDEF    \
+    {"bisect_right", (PyCFunction)sortedlist_bisect_right, METH_O, sortedlist_bisect_right__doc__},
+
+static PyObject *
+sortedlist_bisect_right_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_bisect_right(PyObject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_bisect_right_impl((sortedlistobject *)self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_index__doc__,
+"index($self, value, start=0, stop=sys.maxsize, /)\n"
+"--\n"
+"\n"
+"Return first index of value.\n"
+"\n"
+"Raise ValueError if the value is not present.");
+
+#define SORTEDLIST_INDEX_METHODDEF    \
+    {"index", _PyCFunction_CAST(sortedlist_index), METH_FASTCALL, sortedlist_index__doc__},
+
+static PyObject *
+sortedlist_index_impl(sortedlistobject *self, PyObject *value,
+                      Py_ssize_t start, Py_ssize_t stop);
+
+static PyObject *
+sortedlist_index(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *value;
+    Py_ssize_t start = 0;
+    Py_ssize_t stop = PY_SSIZE_T_MAX;
+
+    if (!_PyArg_CheckPositional("index", nargs, 1, 3)) {
+        goto exit;
+    }
+    value = args[0];
+    if (nargs < 2) {
+        goto skip_optional;
+    }
+    if (!_PyEval_SliceIndexNotNone(args[1], &start)) {
+        goto exit;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    if (!_PyEval_SliceIndexNotNone(args[2], &stop)) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_index_impl((sortedlistobject *)self, value, start, stop);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_count__doc__,
+"count($self, value, /)\n"
+"--\n"
+"\n"
+"Return number of occurrences of value.");
+
+#define SORTEDLIST_COUNT_METHODDEF    \
+    {"count", (PyCFunction)sortedlist_count, METH_O, sortedlist_count__doc__},
+
+static PyObject *
+sortedlist_count_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_count(PyObject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_count_impl((sortedlistobject *)self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_irange__doc__,
+"irange($self, /, minimum=None, maximum=None, inclusive=(True, True),\n"
+"       reverse=False)\n"
+"--\n"
+"\n"
+"Return an iterator over the items between minimum and maximum.\n"
+"\n"
+"A bound of None means that the range is not bounded on that side.  The\n"
+"two booleans of inclusive tell whether items equal to minimum and to\n"
+"maximum are included.  Items are produced in descending order if reverse\n"
+"is true.");
+
+#define SORTEDLIST_IRANGE_METHODDEF    \
+    {"irange", _PyCFunction_CAST(sortedlist_irange), METH_FASTCALL|METH_KEYWORDS, sortedlist_irange__doc__},
+
+static PyObject *
+sortedlist_irange_impl(sortedlistobject *self, PyObject *minimum,
+                       PyObject *maximum, PyObject *inclusive, int reverse);
+
+static PyObject *
+sortedlist_irange(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(minimum), &_Py_ID(maximum), &_Py_ID(inclusive), &_Py_ID(reverse), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"minimum", "maximum", "inclusive", "reverse", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "irange",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *minimum = Py_None;
+    PyObject *maximum = Py_None;
+    PyObject *inclusive = NULL;
+    int reverse = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 4, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[0]) {
+        minimum = args[0];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[1]) {
+        maximum = args[1];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[2]) {
+        inclusive = args[2];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    reverse = PyObject_IsTrue(args[3]);
+    if (reverse < 0) {
+        goto exit;
+    }
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_irange_impl((sortedlistobject *)self, minimum, maximum, inclusive, reverse);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist___reversed____doc__,
+"__reversed__($self, /)\n"
+"--\n"
+"\n"
+"Return a reverse iterator over the SortedList.");
+
+#define SORTEDLIST___REVERSED___METHODDEF    \
+    {"__reversed__", (PyCFunction)sortedlist___reversed__, METH_NOARGS, sortedlist___reversed____doc__},
+
+static PyObject *
+sortedlist___reversed___impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist___reversed__(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist___reversed___impl((sortedlistobject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist___reduce____doc__,
+"__reduce__($self, /)\n"
+"--\n"
+"\n"
+"Return state information for pickling.");
+
+#define SORTEDLIST___REDUCE___METHODDEF    \
+    {"__reduce__", (PyCFunction)sortedlist___reduce__, METH_NOARGS, sortedlist___reduce____doc__},
+
+static PyObject *
+sortedlist___reduce___impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist___reduce__(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return sortedlist___reduce___impl((sortedlistobject *)self);
+}
+/*[clinic end generated code: output=c0e6d809c73de42c input=a9049054013a1b77]*/
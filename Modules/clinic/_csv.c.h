@@ -6,7 +6,88 @@ preserve
 #  include "pycore_gc.h"          // PyGC_Head
 #  include "pycore_runtime.h"     // _Py_ID()
 #endif
-#include "pycore_modsupport.h"    // _PyArg_UnpackKeywords()
+#include "pycore_abstract.h"      // _PyNumber_Index()
+#include "pycore_modsupport.h"    // _PyArg_CheckPositional()
+
+PyDoc_STRVAR(_csv_Reader_readcolumns__doc__,
+"readcolumns($self, size=-1, /)\n"
+"--\n"
+"\n"
+"Read rows and return their fields grouped by column.\n"
+"\n"
+"Read at most size rows, or all remaining rows if size is negative, and\n"
+"return a list with a list of fields for each column.  Empty rows are\n"
+"skipped; all other rows must have the same number of fields.");
+
+#define _CSV_READER_READCOLUMNS_METHODDEF    \
+    {"readcolumns", _PyCFunction_CAST(_csv_Reader_readcolumns), METH_FASTCALL, _csv_Reader_readcolumns__doc__},
+
+static PyObject *
+_csv_Reader_readcolumns_impl(ReaderObj *self, Py_ssize_t size);
+
+static PyObject *
+_csv_Reader_readcolumns(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    Py_ssize_t size = -1;
+
+    if (!_PyArg_CheckPositional("readcolumns", nargs, 0, 1)) {
+        goto exit;
+    }
+    if (nargs < 1) {
+        goto skip_optional;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[0]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        size = ival;
+    }
+skip_optional:
+    return_value = _csv_Reader_readcolumns_impl((ReaderObj *)self, size);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_csv_Reader__next_dict__doc__,
+"_next_dict($self, fieldnames, restkey, restval, /)\n"
+"--\n"
+"\n"
+"Return the next non-empty row as a dict, as csv.DictReader does.");
+
+#define _CSV_READER__NEXT_DICT_METHODDEF    \
+    {"_next_dict", _PyCFunction_CAST(_csv_Reader__next_dict), METH_FASTCALL, _csv_Reader__next_dict__doc__},
+
+static PyObject *
+_csv_Reader__next_dict_impl(ReaderObj *self, PyObject *fieldnames,
+                            PyObject *restkey, PyObject *restval);
+
+static PyObject *
+_csv_Reader__next_dict(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *fieldnames;
+    PyObject *restkey;
+    PyObject *restval;
+
+    if (!_PyArg_CheckPositional("_next_dict", nargs, 3, 3)) {
+        goto exit;
+    }
+    fieldnames = args[0];
+    restkey = args[1];
+    restval = args[2];
+    return_value = _csv_Reader__next_dict_impl((ReaderObj *)self, fieldnames, restkey, restval);
+
+exit:
+    return return_value;
+}
 
 PyDoc_STRVAR(_csv_list_dialects__doc__,
 "list_dialects($module, /)\n"
@@ -215,4 +296,4 @@ skip_optional_pos:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=1fb09d5e7667ad0d input=a9049054013a1b77]*/
+/*[clinic end generated code: output=7cb59b7adf59922d input=a9049054013a1b77]*/
@@ -524,4 +524,130 @@ skip_optional_kwonly:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=809640e747529c72 input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(datetime_CompiledFormat_parse_datetime__doc__,
+"parse_datetime($self, string, /)\n"
+"--\n"
+"\n"
+"Return a datetime parsed from string.\n"
+"\n"
+"Equivalent to datetime.strptime(string, self.format).");
+
+#define DATETIME_COMPILEDFORMAT_PARSE_DATETIME_METHODDEF    \
+    {"parse_datetime", (PyCFunction)datetime_CompiledFormat_parse_datetime, METH_O, datetime_CompiledFormat_parse_datetime__doc__},
+
+static PyObject *
+datetime_CompiledFormat_parse_datetime_impl(PyObject *self, PyObject *string);
+
+static PyObject *
+datetime_CompiledFormat_parse_datetime(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *string;
+
+    if (!PyUnicode_Check(arg)) {
+        _PyArg_BadArgument("parse_datetime", "argument", "str", arg);
+        goto exit;
+    }
+    string = arg;
+    return_value = datetime_CompiledFormat_parse_datetime_impl(self, string);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(datetime_CompiledFormat_parse_date__doc__,
+"parse_date($self, string, /)\n"
+"--\n"
+"\n"
+"Return a date parsed from string.\n"
+"\n"
+"Equivalent to date.strptime(string, self.format).");
+
+#define DATETIME_COMPILEDFORMAT_PARSE_DATE_METHODDEF    \
+    {"parse_date", (PyCFunction)datetime_CompiledFormat_parse_date, METH_O, datetime_CompiledFormat_parse_date__doc__},
+
+static PyObject *
+datetime_CompiledFormat_parse_date_impl(PyObject *self, PyObject *string);
+
+static PyObject *
+datetime_CompiledFormat_parse_date(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *string;
+
+    if (!PyUnicode_Check(arg)) {
+        _PyArg_BadArgument("parse_date", "argument", "str", arg);
+        goto exit;
+    }
+    string = arg;
+    return_value = datetime_CompiledFormat_parse_date_impl(self, string);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(datetime_CompiledFormat_parse_time__doc__,
+"parse_time($self, string, /)\n"
+"--\n"
+"\n"
+"Return a time parsed from string.\n"
+"\n"
+"Equivalent to time.strptime(string, self.format).");
+
+#define DATETIME_COMPILEDFORMAT_PARSE_TIME_METHODDEF    \
+    {"parse_time", (PyCFunction)datetime_CompiledFormat_parse_time, METH_O, datetime_CompiledFormat_parse_time__doc__},
+
+static PyObject *
+datetime_CompiledFormat_parse_time_impl(PyObject *self, PyObject *string);
+
+static PyObject *
+datetime_CompiledFormat_parse_time(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *string;
+
+    if (!PyUnicode_Check(arg)) {
+        _PyArg_BadArgument("parse_time", "argument", "str", arg);
+        goto exit;
+    }
+    string = arg;
+    return_value = datetime_CompiledFormat_parse_time_impl(self, string);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(datetime_compile_format__doc__,
+"compile_format($module, format, /)\n"
+"--\n"
+"\n"
+"Compile a strptime() format string for repeated parsing.\n"
+"\n"
+"The returned object has parse_datetime(), parse_date() and parse_time()\n"
+"methods, equivalent to datetime.strptime(), date.strptime() and\n"
+"time.strptime() with this format.");
+
+#define DATETIME_COMPILE_FORMAT_METHODDEF    \
+    {"compile_format", (PyCFunction)datetime_compile_format, METH_O, datetime_compile_format__doc__},
+
+static PyObject *
+datetime_compile_format_impl(PyObject *module, PyObject *format);
+
+static PyObject *
+datetime_compile_format(PyObject *module, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *format;
+
+    if (!PyUnicode_Check(arg)) {
+        _PyArg_BadArgument("compile_format", "argument", "str", arg);
+        goto exit;
+    }
+    format = arg;
+    return_value = datetime_compile_format_impl(module, format);
+
+exit:
+    return return_value;
+}
+/*[clinic end generated code: output=98aced724f5ae5c4 input=a9049054013a1b77]*/
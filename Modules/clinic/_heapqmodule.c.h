@@ -2,6 +2,12 @@
 preserve
 [clinic start generated code]*/
 
+#if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+#  include "pycore_gc.h"          // PyGC_Head
+#  include "pycore_runtime.h"     // _Py_ID()
+#endif
+#include "pycore_abstract.h"      // _PyNumber_Index()
+#include "pycore_critical_section.h"// Py_BEGIN_CRITICAL_SECTION()
 #include "pycore_modsupport.h"    // _PyArg_CheckPositional()
 
 PyDoc_STRVAR(_heapq_heappush__doc__,
@@ -267,4 +273,400 @@ _heapq__heapify_max(PyObject *module, PyObject *arg)
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=05f2afdf3bc54c9d input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_heapq_nsmallest__doc__,
+"nsmallest($module, /, n, iterable, key=None)\n"
+"--\n"
+"\n"
+"Find the n smallest elements in a dataset.\n"
+"\n"
+"Equivalent to:  sorted(iterable, key=key)[:n]");
+
+#define _HEAPQ_NSMALLEST_METHODDEF    \
+    {"nsmallest", _PyCFunction_CAST(_heapq_nsmallest), METH_FASTCALL|METH_KEYWORDS, _heapq_nsmallest__doc__},
+
+static PyObject *
+_heapq_nsmallest_impl(PyObject *module, Py_ssize_t n, PyObject *iterable,
+                      PyObject *key);
+
+static PyObject *
+_heapq_nsmallest(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { _Py_LATIN1_CHR('n'), &_Py_ID(iterable), &_Py_ID(key), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"n", "iterable", "key", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "nsmallest",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 2;
+    Py_ssize_t n;
+    PyObject *iterable;
+    PyObject *key = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 2, /*maxpos*/ 3, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[0]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        n = ival;
+    }
+    iterable = args[1];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    key = args[2];
+skip_optional_pos:
+    return_value = _heapq_nsmallest_impl(module, n, iterable, key);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_nlargest__doc__,
+"nlargest($module, /, n, iterable, key=None)\n"
+"--\n"
+"\n"
+"Find the n largest elements in a dataset.\n"
+"\n"
+"Equivalent to:  sorted(iterable, key=key, reverse=True)[:n]");
+
+#define _HEAPQ_NLARGEST_METHODDEF    \
+    {"nlargest", _PyCFunction_CAST(_heapq_nlargest), METH_FASTCALL|METH_KEYWORDS, _heapq_nlargest__doc__},
+
+static PyObject *
+_heapq_nlargest_impl(PyObject *module, Py_ssize_t n, PyObject *iterable,
+                     PyObject *key);
+
+static PyObject *
+_heapq_nlargest(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { _Py_LATIN1_CHR('n'), &_Py_ID(iterable), &_Py_ID(key), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"n", "iterable", "key", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "nlargest",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 2;
+    Py_ssize_t n;
+    PyObject *iterable;
+    PyObject *key = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 2, /*maxpos*/ 3, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[0]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        n = ival;
+    }
+    iterable = args[1];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    key = args[2];
+skip_optional_pos:
+    return_value = _heapq_nlargest_impl(module, n, iterable, key);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(indexedheap_new__doc__,
+"IndexedHeap()\n"
+"--\n"
+"\n"
+"Priority queue whose entries can be updated and removed.\n"
+"\n"
+"push() returns a handle to the new entry, which can be passed to update(),\n"
+"decrease_key() and remove().  Entries with equal priorities are popped in\n"
+"the order they were pushed.");
+
+static PyObject *
+indexedheap_new_impl(PyTypeObject *type);
+
+static PyObject *
+indexedheap_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    PyTypeObject *base_tp = clinic_state()->indexedheap_type;
+
+    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
+        !_PyArg_NoPositional("IndexedHeap", args)) {
+        goto exit;
+    }
+    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
+        !_PyArg_NoKeywords("IndexedHeap", kwargs)) {
+        goto exit;
+    }
+    return_value = indexedheap_new_impl(type);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_push__doc__,
+"push($self, priority, value=None, /)\n"
+"--\n"
+"\n"
+"Add an entry and return its handle.");
+
+#define _HEAPQ_INDEXEDHEAP_PUSH_METHODDEF    \
+    {"push", _PyCFunction_CAST(_heapq_IndexedHeap_push), METH_FASTCALL, _heapq_IndexedHeap_push__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_push_impl(indexedheapobject *self, PyObject *priority,
+                             PyObject *value);
+
+static PyObject *
+_heapq_IndexedHeap_push(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *priority;
+    PyObject *value = Py_None;
+
+    if (!_PyArg_CheckPositional("push", nargs, 1, 2)) {
+        goto exit;
+    }
+    priority = args[0];
+    if (nargs < 2) {
+        goto skip_optional;
+    }
+    value = args[1];
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_push_impl((indexedheapobject *)self, priority, value);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_pop__doc__,
+"pop($self, /)\n"
+"--\n"
+"\n"
+"Remove and return the (priority, value) pair with the lowest priority.");
+
+#define _HEAPQ_INDEXEDHEAP_POP_METHODDEF    \
+    {"pop", (PyCFunction)_heapq_IndexedHeap_pop, METH_NOARGS, _heapq_IndexedHeap_pop__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_pop_impl(indexedheapobject *self);
+
+static PyObject *
+_heapq_IndexedHeap_pop(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_pop_impl((indexedheapobject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_peek__doc__,
+"peek($self, /)\n"
+"--\n"
+"\n"
+"Return the (priority, value) pair with the lowest priority.");
+
+#define _HEAPQ_INDEXEDHEAP_PEEK_METHODDEF    \
+    {"peek", (PyCFunction)_heapq_IndexedHeap_peek, METH_NOARGS, _heapq_IndexedHeap_peek__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_peek_impl(indexedheapobject *self);
+
+static PyObject *
+_heapq_IndexedHeap_peek(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_peek_impl((indexedheapobject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_update__doc__,
+"update($self, handle, priority, /)\n"
+"--\n"
+"\n"
+"Change the priority of the entry of handle.");
+
+#define _HEAPQ_INDEXEDHEAP_UPDATE_METHODDEF    \
+    {"update", _PyCFunction_CAST(_heapq_IndexedHeap_update), METH_FASTCALL, _heapq_IndexedHeap_update__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_update_impl(indexedheapobject *self, PyObject *handle,
+                               PyObject *priority);
+
+static PyObject *
+_heapq_IndexedHeap_update(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *handle;
+    PyObject *priority;
+
+    if (!_PyArg_CheckPositional("update", nargs, 2, 2)) {
+        goto exit;
+    }
+    handle = args[0];
+    priority = args[1];
+    Py_BEGIN_CRITICAL_SECTION2(self, handle);
+    return_value = _heapq_IndexedHeap_update_impl((indexedheapobject *)self, handle, priority);
+    Py_END_CRITICAL_SECTION2();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_decrease_key__doc__,
+"decrease_key($self, handle, priority, /)\n"
+"--\n"
+"\n"
+"Lower the priority of the entry of handle.\n"
+"\n"
+"Raise ValueError if priority is greater than the current priority.");
+
+#define _HEAPQ_INDEXEDHEAP_DECREASE_KEY_METHODDEF    \
+    {"decrease_key", _PyCFunction_CAST(_heapq_IndexedHeap_decrease_key), METH_FASTCALL, _heapq_IndexedHeap_decrease_key__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_decrease_key_impl(indexedheapobject *self,
+                                     PyObject *handle, PyObject *priority);
+
+static PyObject *
+_heapq_IndexedHeap_decrease_key(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *handle;
+    PyObject *priority;
+
+    if (!_PyArg_CheckPositional("decrease_key", nargs, 2, 2)) {
+        goto exit;
+    }
+    handle = args[0];
+    priority = args[1];
+    Py_BEGIN_CRITICAL_SECTION2(self, handle);
+    return_value = _heapq_IndexedHeap_decrease_key_impl((indexedheapobject *)self, handle, priority);
+    Py_END_CRITICAL_SECTION2();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_remove__doc__,
+"remove($self, handle, /)\n"
+"--\n"
+"\n"
+"Remove the entry of handle and return its (priority, value) pair.");
+
+#define _HEAPQ_INDEXEDHEAP_REMOVE_METHODDEF    \
+    {"remove", (PyCFunction)_heapq_IndexedHeap_remove, METH_O, _heapq_IndexedHeap_remove__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_remove_impl(indexedheapobject *self, PyObject *handle);
+
+static PyObject *
+_heapq_IndexedHeap_remove(PyObject *self, PyObject *handle)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_remove_impl((indexedheapobject *)self, handle);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_clear__doc__,
+"clear($self, /)\n"
+"--\n"
+"\n"
+"Remove all entries.");
+
+#define _HEAPQ_INDEXEDHEAP_CLEAR_METHODDEF    \
+    {"clear", (PyCFunction)_heapq_IndexedHeap_clear, METH_NOARGS, _heapq_IndexedHeap_clear__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_clear_impl(indexedheapobject *self);
+
+static PyObject *
+_heapq_IndexedHeap_clear(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_clear_impl((indexedheapobject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+/*[clinic end generated code: output=92838e05610db422 input=a9049054013a1b77]*/
@@ -48,4 +48,432 @@ _statistics__normal_dist_inv_cdf(PyObject *module, PyObject *const *args, Py_ssi
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=0f0c849d51f16f1b input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_statistics_RunningStats_add__doc__,
+"add($self, x, /)\n"
+"--\n"
+"\n"
+"Add the data point x.");
+
+#define _STATISTICS_RUNNINGSTATS_ADD_METHODDEF    \
+    {"add", (PyCFunction)_statistics_RunningStats_add, METH_O, _statistics_RunningStats_add__doc__},
+
+static PyObject *
+_statistics_RunningStats_add_impl(runningstatsobject *self, double x);
+
+static PyObject *
+_statistics_RunningStats_add(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    double x;
+
+    x = PyFloat_AsDouble(arg);
+    if (x == -1.0 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = _statistics_RunningStats_add_impl((runningstatsobject *)self, x);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_RunningStats_update__doc__,
+"update($self, data, /)\n"
+"--\n"
+"\n"
+"Add the data points from the iterable data.");
+
+#define _STATISTICS_RUNNINGSTATS_UPDATE_METHODDEF    \
+    {"update", (PyCFunction)_statistics_RunningStats_update, METH_O, _statistics_RunningStats_update__doc__},
+
+static PyObject *
+_statistics_RunningStats_update_impl(runningstatsobject *self,
+                                     PyObject *data);
+
+static PyObject *
+_statistics_RunningStats_update(PyObject *self, PyObject *data)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _statistics_RunningStats_update_impl((runningstatsobject *)self, data);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_RunningStats_merge__doc__,
+"merge($self, other, /)\n"
+"--\n"
+"\n"
+"Add the data points accumulated by another RunningStats.");
+
+#define _STATISTICS_RUNNINGSTATS_MERGE_METHODDEF    \
+    {"merge", (PyCFunction)_statistics_RunningStats_merge, METH_O, _statistics_RunningStats_merge__doc__},
+
+static PyObject *
+_statistics_RunningStats_merge_impl(runningstatsobject *self,
+                                    PyObject *other);
+
+static PyObject *
+_statistics_RunningStats_merge(PyObject *self, PyObject *other)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _statistics_RunningStats_merge_impl((runningstatsobject *)self, other);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_RunningStats___getstate____doc__,
+"__getstate__($self, /)\n"
+"--\n"
+"\n"
+"Return the state of the accumulator, for pickling.");
+
+#define _STATISTICS_RUNNINGSTATS___GETSTATE___METHODDEF    \
+    {"__getstate__", (PyCFunction)_statistics_RunningStats___getstate__, METH_NOARGS, _statistics_RunningStats___getstate____doc__},
+
+static PyObject *
+_statistics_RunningStats___getstate___impl(runningstatsobject *self);
+
+static PyObject *
+_statistics_RunningStats___getstate__(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _statistics_RunningStats___getstate___impl((runningstatsobject *)self);
+}
+
+PyDoc_STRVAR(_statistics_RunningStats___setstate____doc__,
+"__setstate__($self, state, /)\n"
+"--\n"
+"\n"
+"Restore the state of the accumulator, for unpickling.");
+
+#define _STATISTICS_RUNNINGSTATS___SETSTATE___METHODDEF    \
+    {"__setstate__", (PyCFunction)_statistics_RunningStats___setstate__, METH_O, _statistics_RunningStats___setstate____doc__},
+
+static PyObject *
+_statistics_RunningStats___setstate___impl(runningstatsobject *self,
+                                           PyObject *state);
+
+static PyObject *
+_statistics_RunningStats___setstate__(PyObject *self, PyObject *state)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _statistics_RunningStats___setstate___impl((runningstatsobject *)self, state);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_RunningCovariance_add__doc__,
+"add($self, x, y, /)\n"
+"--\n"
+"\n"
+"Add the pair of data points x and y.");
+
+#define _STATISTICS_RUNNINGCOVARIANCE_ADD_METHODDEF    \
+    {"add", (PyCFunction)(void(*)(void))_statistics_RunningCovariance_add, METH_FASTCALL, _statistics_RunningCovariance_add__doc__},
+
+static PyObject *
+_statistics_RunningCovariance_add_impl(runningcovobject *self, double x,
+                                       double y);
+
+static PyObject *
+_statistics_RunningCovariance_add(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    double x;
+    double y;
+
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "add expected 2 arguments, got %zd", nargs);
+        goto exit;
+    }
+    x = PyFloat_AsDouble(args[0]);
+    if (x == -1.0 && PyErr_Occurred()) {
+        goto exit;
+    }
+    y = PyFloat_AsDouble(args[1]);
+    if (y == -1.0 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = _statistics_RunningCovariance_add_impl((runningcovobject *)self, x, y);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_RunningCovariance_update__doc__,
+"update($self, x, y, /)\n"
+"--\n"
+"\n"
+"Add the pairs of data points from the iterables x and y.");
+
+#define _STATISTICS_RUNNINGCOVARIANCE_UPDATE_METHODDEF    \
+    {"update", (PyCFunction)(void(*)(void))_statistics_RunningCovariance_update, METH_FASTCALL, _statistics_RunningCovariance_update__doc__},
+
+static PyObject *
+_statistics_RunningCovariance_update_impl(runningcovobject *self,
+                                          PyObject *x, PyObject *y);
+
+static PyObject *
+_statistics_RunningCovariance_update(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *x;
+    PyObject *y;
+
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "update expected 2 arguments, got %zd", nargs);
+        goto exit;
+    }
+    x = args[0];
+    y = args[1];
+    return_value = _statistics_RunningCovariance_update_impl((runningcovobject *)self, x, y);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_RunningCovariance_merge__doc__,
+"merge($self, other, /)\n"
+"--\n"
+"\n"
+"Add the data points accumulated by another RunningCovariance.");
+
+#define _STATISTICS_RUNNINGCOVARIANCE_MERGE_METHODDEF    \
+    {"merge", (PyCFunction)_statistics_RunningCovariance_merge, METH_O, _statistics_RunningCovariance_merge__doc__},
+
+static PyObject *
+_statistics_RunningCovariance_merge_impl(runningcovobject *self,
+                                         PyObject *other);
+
+static PyObject *
+_statistics_RunningCovariance_merge(PyObject *self, PyObject *other)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _statistics_RunningCovariance_merge_impl((runningcovobject *)self, other);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_RunningCovariance___getstate____doc__,
+"__getstate__($self, /)\n"
+"--\n"
+"\n"
+"Return the state of the accumulator, for pickling.");
+
+#define _STATISTICS_RUNNINGCOVARIANCE___GETSTATE___METHODDEF    \
+    {"__getstate__", (PyCFunction)_statistics_RunningCovariance___getstate__, METH_NOARGS, _statistics_RunningCovariance___getstate____doc__},
+
+static PyObject *
+_statistics_RunningCovariance___getstate___impl(runningcovobject *self);
+
+static PyObject *
+_statistics_RunningCovariance___getstate__(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _statistics_RunningCovariance___getstate___impl((runningcovobject *)self);
+}
+
+PyDoc_STRVAR(_statistics_RunningCovariance___setstate____doc__,
+"__setstate__($self, state, /)\n"
+"--\n"
+"\n"
+"Restore the state of the accumulator, for unpickling.");
+
+#define _STATISTICS_RUNNINGCOVARIANCE___SETSTATE___METHODDEF    \
+    {"__setstate__", (PyCFunction)_statistics_RunningCovariance___setstate__, METH_O, _statistics_RunningCovariance___setstate____doc__},
+
+static PyObject *
+_statistics_RunningCovariance___setstate___impl(runningcovobject *self,
+                                                PyObject *state);
+
+static PyObject *
+_statistics_RunningCovariance___setstate__(PyObject *self, PyObject *state)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _statistics_RunningCovariance___setstate___impl((runningcovobject *)self, state);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_QuantileSketch_add__doc__,
+"add($self, x, /)\n"
+"--\n"
+"\n"
+"Add the data point x.");
+
+#define _STATISTICS_QUANTILESKETCH_ADD_METHODDEF    \
+    {"add", (PyCFunction)_statistics_QuantileSketch_add, METH_O, _statistics_QuantileSketch_add__doc__},
+
+static PyObject *
+_statistics_QuantileSketch_add_impl(quantilesketchobject *self, double x);
+
+static PyObject *
+_statistics_QuantileSketch_add(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    double x;
+
+    x = PyFloat_AsDouble(arg);
+    if (x == -1.0 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = _statistics_QuantileSketch_add_impl((quantilesketchobject *)self, x);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_QuantileSketch_update__doc__,
+"update($self, data, /)\n"
+"--\n"
+"\n"
+"Add the data points from the iterable data.");
+
+#define _STATISTICS_QUANTILESKETCH_UPDATE_METHODDEF    \
+    {"update", (PyCFunction)_statistics_QuantileSketch_update, METH_O, _statistics_QuantileSketch_update__doc__},
+
+static PyObject *
+_statistics_QuantileSketch_update_impl(quantilesketchobject *self,
+                                       PyObject *data);
+
+static PyObject *
+_statistics_QuantileSketch_update(PyObject *self, PyObject *data)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _statistics_QuantileSketch_update_impl((quantilesketchobject *)self, data);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_QuantileSketch_merge__doc__,
+"merge($self, other, /)\n"
+"--\n"
+"\n"
+"Add the data points summarized by another QuantileSketch.");
+
+#define _STATISTICS_QUANTILESKETCH_MERGE_METHODDEF    \
+    {"merge", (PyCFunction)_statistics_QuantileSketch_merge, METH_O, _statistics_QuantileSketch_merge__doc__},
+
+static PyObject *
+_statistics_QuantileSketch_merge_impl(quantilesketchobject *self,
+                                      PyObject *other);
+
+static PyObject *
+_statistics_QuantileSketch_merge(PyObject *self, PyObject *other)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _statistics_QuantileSketch_merge_impl((quantilesketchobject *)self, other);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_QuantileSketch_quantile__doc__,
+"quantile($self, p, /)\n"
+"--\n"
+"\n"
+"Estimate the value below which a fraction p of the data falls.\n"
+"\n"
+"The estimate is linearly interpolated between the centroids, with 0.0\n"
+"giving the minimum and 1.0 the maximum.");
+
+#define _STATISTICS_QUANTILESKETCH_QUANTILE_METHODDEF    \
+    {"quantile", (PyCFunction)_statistics_QuantileSketch_quantile, METH_O, _statistics_QuantileSketch_quantile__doc__},
+
+static PyObject *
+_statistics_QuantileSketch_quantile_impl(quantilesketchobject *self,
+                                         double p);
+
+static PyObject *
+_statistics_QuantileSketch_quantile(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    double p;
+
+    p = PyFloat_AsDouble(arg);
+    if (p == -1.0 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = _statistics_QuantileSketch_quantile_impl((quantilesketchobject *)self, p);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_QuantileSketch_quantiles__doc__,
+"quantiles($self, /, n=4)\n"
+"--\n"
+"\n"
+"Divide into n continuous intervals with equal probability.\n"
+"\n"
+"Returns a list of (n - 1) estimated cut points separating the\n"
+"intervals, like quantiles(data, n=n, method=\'inclusive\').");
+
+#define _STATISTICS_QUANTILESKETCH_QUANTILES_METHODDEF    \
+    {"quantiles", (PyCFunction)(void(*)(void))_statistics_QuantileSketch_quantiles, METH_VARARGS|METH_KEYWORDS, _statistics_QuantileSketch_quantiles__doc__},
+
+static PyObject *
+_statistics_QuantileSketch_quantiles_impl(quantilesketchobject *self,
+                                          Py_ssize_t n);
+
+static PyObject *
+_statistics_QuantileSketch_quantiles(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    static char *_keywords[] = {"n", NULL};
+    Py_ssize_t n = 4;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|n:quantiles", _keywords,
+        &n))
+        goto exit;
+    return_value = _statistics_QuantileSketch_quantiles_impl((quantilesketchobject *)self, n);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_statistics_QuantileSketch___getstate____doc__,
+"__getstate__($self, /)\n"
+"--\n"
+"\n"
+"Return the state of the sketch, for pickling.");
+
+#define _STATISTICS_QUANTILESKETCH___GETSTATE___METHODDEF    \
+    {"__getstate__", (PyCFunction)_statistics_QuantileSketch___getstate__, METH_NOARGS, _statistics_QuantileSketch___getstate____doc__},
+
+static PyObject *
+_statistics_QuantileSketch___getstate___impl(quantilesketchobject *self);
+
+static PyObject *
+_statistics_QuantileSketch___getstate__(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _statistics_QuantileSketch___getstate___impl((quantilesketchobject *)self);
+}
+
+PyDoc_STRVAR(_statistics_QuantileSketch___setstate____doc__,
+"__setstate__($self, state, /)\n"
+"--\n"
+"\n"
+"Restore the state of the sketch, for unpickling.");
+
+#define _STATISTICS_QUANTILESKETCH___SETSTATE___METHODDEF    \
+    {"__setstate__", (PyCFunction)_statistics_QuantileSketch___setstate__, METH_O, _statistics_QuantileSketch___setstate____doc__},
+
+static PyObject *
+_statistics_QuantileSketch___setstate___impl(quantilesketchobject *self,
+                                             PyObject *state);
+
+static PyObject *
+_statistics_QuantileSketch___setstate__(PyObject *self, PyObject *state)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _statistics_QuantileSketch___setstate___impl((quantilesketchobject *)self, state);
+
+    return return_value;
+}
+/*[clinic end generated code: output=2bf9e4b4e826d305 input=a9049054013a1b77]*/
@@ -0,0 +1,75 @@
+/*[clinic input]
+preserve
+[clinic start generated code]*/
+
+#if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+#  include "pycore_gc.h"          // PyGC_Head
+#  include "pycore_runtime.h"     // _Py_ID()
+#endif
+#include "pycore_modsupport.h"    // _PyArg_UnpackKeywords()
+
+PyDoc_STRVAR(_tomllib_loads__doc__,
+"loads($module, s, /, *, parse_float=float)\n"
+"--\n"
+"\n"
+"Parse TOML from a string.");
+
+#define _TOMLLIB_LOADS_METHODDEF    \
+    {"loads", _PyCFunction_CAST(_tomllib_loads), METH_FASTCALL|METH_KEYWORDS, _tomllib_loads__doc__},
+
+static PyObject *
+_tomllib_loads_impl(PyObject *module, PyObject *s, PyObject *parse_float);
+
+static PyObject *
+_tomllib_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(parse_float), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"", "parse_float", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "loads",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *s;
+    PyObject *parse_float = NULL;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    s = args[0];
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    parse_float = args[1];
+skip_optional_kwonly:
+    return_value = _tomllib_loads_impl(module, s, parse_float);
+
+exit:
+    return return_value;
+}
+/*[clinic end generated code: output=ca35e7a9e60701b0 input=a9049054013a1b77]*/
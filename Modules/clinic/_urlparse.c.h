@@ -0,0 +1,647 @@
+/*[clinic input]
+preserve
+[clinic start generated code]*/
+
+#if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+#  include "pycore_gc.h"          // PyGC_Head
+#  include "pycore_runtime.h"     // _Py_ID()
+#endif
+#include "pycore_modsupport.h"    // _PyArg_UnpackKeywords()
+
+PyDoc_STRVAR(_urlparse_urlsplit__doc__,
+"urlsplit($module, /, url, scheme=\'\', allow_fragments=True)\n"
+"--\n"
+"\n"
+"Parse a URL into 5 components.\n"
+"\n"
+"The components are <scheme>://<netloc>/<path>?<query>#<fragment>.\n"
+"\n"
+"The result is a named 5-tuple with fields corresponding to the\n"
+"above. It is either a SplitResult or SplitResultBytes object,\n"
+"depending on the type of the url parameter.\n"
+"\n"
+"The username, password, hostname, and port sub-components of netloc\n"
+"can also be accessed as attributes of the returned object.\n"
+"\n"
+"The scheme argument provides the default value of the scheme\n"
+"component when no scheme is found in url.\n"
+"\n"
+"If allow_fragments is False, no attempt is made to separate the\n"
+"fragment component from the previous component, which can be either\n"
+"path or query.\n"
+"\n"
+"Note that % escapes are not expanded.");
+
+#define _URLPARSE_URLSPLIT_METHODDEF    \
+    {"urlsplit", _PyCFunction_CAST(_urlparse_urlsplit), METH_FASTCALL|METH_KEYWORDS, _urlparse_urlsplit__doc__},
+
+static PyObject *
+_urlparse_urlsplit_impl(PyObject *module, PyObject *url, PyObject *scheme,
+                        int allow_fragments);
+
+static PyObject *
+_urlparse_urlsplit(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(url), &_Py_ID(scheme), &_Py_ID(allow_fragments), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"url", "scheme", "allow_fragments", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "urlsplit",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *url;
+    PyObject *scheme = &_Py_STR(empty);
+    int allow_fragments = 1;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 3, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    url = args[0];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        scheme = args[1];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    allow_fragments = PyObject_IsTrue(args[2]);
+    if (allow_fragments < 0) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = _urlparse_urlsplit_impl(module, url, scheme, allow_fragments);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_urlparse_urlunsplit__doc__,
+"urlunsplit($module, components, /)\n"
+"--\n"
+"\n"
+"Combine the elements of a tuple as returned by urlsplit() into a URL.\n"
+"\n"
+"The data argument can be any five-item iterable.  This may result in a\n"
+"slightly different, but equivalent URL, if the URL that was parsed\n"
+"originally had unnecessary delimiters (for example, a ? with an empty\n"
+"query; the RFC states that these are equivalent).");
+
+#define _URLPARSE_URLUNSPLIT_METHODDEF    \
+    {"urlunsplit", (PyCFunction)_urlparse_urlunsplit, METH_O, _urlparse_urlunsplit__doc__},
+
+PyDoc_STRVAR(_urlparse_quote__doc__,
+"quote($module, /, string, safe=\'/\', encoding=None, errors=None)\n"
+"--\n"
+"\n"
+"quote(\'abc def\') -> \'abc%20def\'\n"
+"\n"
+"Each part of a URL, e.g. the path info, the query, etc., has a\n"
+"different set of reserved characters that must be quoted. The\n"
+"quote function offers a cautious (not minimal) way to quote a\n"
+"string for most of these parts.\n"
+"\n"
+"RFC 3986 Uniform Resource Identifier (URI): Generic Syntax lists\n"
+"the following (un)reserved characters.\n"
+"\n"
+"unreserved    = ALPHA / DIGIT / \"-\" / \".\" / \"_\" / \"~\"\n"
+"reserved      = gen-delims / sub-delims\n"
+"gen-delims    = \":\" / \"/\" / \"?\" / \"#\" / \"[\" / \"]\" / \"@\"\n"
+"sub-delims    = \"!\" / \"$\" / \"&\" / \"\'\" / \"(\" / \")\"\n"
+"              / \"*\" / \"+\" / \",\" / \";\" / \"=\"\n"
+"\n"
+"Each of the reserved characters is reserved in some component of a URL,\n"
+"but not necessarily in all of them.\n"
+"\n"
+"The quote function %-escapes all characters that are neither in the\n"
+"unreserved chars (\"always safe\") nor the additional chars set via the\n"
+"safe arg.\n"
+"\n"
+"The default for the safe arg is \'/\'. The character is reserved, but in\n"
+"typical usage the quote function is being called on a path where the\n"
+"existing slash characters are to be preserved.\n"
+"\n"
+"Python 3.7 updates from using RFC 2396 to RFC 3986 to quote URL strings.\n"
+"Now, \"~\" is included in the set of unreserved characters.\n"
+"\n"
+"string and safe may be either str or bytes objects. encoding and errors\n"
+"must not be specified if string is a bytes object.\n"
+"\n"
+"The optional encoding and errors parameters specify how to deal with\n"
+"non-ASCII characters, as accepted by the str.encode method.\n"
+"By default, encoding=\'utf-8\' (characters are encoded with UTF-8), and\n"
+"errors=\'strict\' (unsupported characters raise a UnicodeEncodeError).");
+
+#define _URLPARSE_QUOTE_METHODDEF    \
+    {"quote", _PyCFunction_CAST(_urlparse_quote), METH_FASTCALL|METH_KEYWORDS, _urlparse_quote__doc__},
+
+static PyObject *
+_urlparse_quote_impl(PyObject *module, PyObject *string, PyObject *safe,
+                     PyObject *encoding, PyObject *errors);
+
+static PyObject *
+_urlparse_quote(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(string), &_Py_ID(safe), &_Py_ID(encoding), &_Py_ID(errors), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"string", "safe", "encoding", "errors", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "quote",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *string;
+    PyObject *safe = _Py_LATIN1_CHR('/');
+    PyObject *encoding = Py_None;
+    PyObject *errors = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 4, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    string = args[0];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        safe = args[1];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[2]) {
+        encoding = args[2];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    errors = args[3];
+skip_optional_pos:
+    return_value = _urlparse_quote_impl(module, string, safe, encoding, errors);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_urlparse_quote_plus__doc__,
+"quote_plus($module, /, string, safe=\'\', encoding=None, errors=None)\n"
+"--\n"
+"\n"
+"Like quote(), but also replace \' \' with \'+\'.\n"
+"\n"
+"This is required for quoting HTML form values. Plus signs in the\n"
+"original string are escaped unless they are included in safe. It also\n"
+"does not have safe default to \'/\'.");
+
+#define _URLPARSE_QUOTE_PLUS_METHODDEF    \
+    {"quote_plus", _PyCFunction_CAST(_urlparse_quote_plus), METH_FASTCALL|METH_KEYWORDS, _urlparse_quote_plus__doc__},
+
+static PyObject *
+_urlparse_quote_plus_impl(PyObject *module, PyObject *string, PyObject *safe,
+                          PyObject *encoding, PyObject *errors);
+
+static PyObject *
+_urlparse_quote_plus(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(string), &_Py_ID(safe), &_Py_ID(encoding), &_Py_ID(errors), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"string", "safe", "encoding", "errors", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "quote_plus",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *string;
+    PyObject *safe = &_Py_STR(empty);
+    PyObject *encoding = Py_None;
+    PyObject *errors = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 4, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    string = args[0];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        safe = args[1];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[2]) {
+        encoding = args[2];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    errors = args[3];
+skip_optional_pos:
+    return_value = _urlparse_quote_plus_impl(module, string, safe, encoding, errors);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_urlparse_unquote__doc__,
+"unquote($module, /, string, encoding=\'utf-8\', errors=\'replace\')\n"
+"--\n"
+"\n"
+"Replace %xx escapes by their single-character equivalent.\n"
+"\n"
+"The optional encoding and errors parameters specify how to decode\n"
+"percent-encoded sequences into Unicode characters, as accepted by the\n"
+"bytes.decode() method.\n"
+"By default, percent-encoded sequences are decoded with UTF-8, and invalid\n"
+"sequences are replaced by a placeholder character.\n"
+"\n"
+"unquote(\'abc%20def\') -> \'abc def\'.");
+
+#define _URLPARSE_UNQUOTE_METHODDEF    \
+    {"unquote", _PyCFunction_CAST(_urlparse_unquote), METH_FASTCALL|METH_KEYWORDS, _urlparse_unquote__doc__},
+
+static PyObject *
+_urlparse_unquote_impl(PyObject *module, PyObject *string,
+                       PyObject *encoding, PyObject *errors);
+
+static PyObject *
+_urlparse_unquote(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(string), &_Py_ID(encoding), &_Py_ID(errors), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"string", "encoding", "errors", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "unquote",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *string;
+    PyObject *encoding = &_Py_STR(utf_8);
+    PyObject *errors = &_Py_ID(replace);
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 3, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    string = args[0];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        encoding = args[1];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    errors = args[2];
+skip_optional_pos:
+    return_value = _urlparse_unquote_impl(module, string, encoding, errors);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_urlparse_parse_qsl__doc__,
+"parse_qsl($module, /, qs, keep_blank_values=False,\n"
+"          strict_parsing=False, encoding=\'utf-8\', errors=\'replace\',\n"
+"          max_num_fields=None, separator=\'&\', *, _stacklevel=1)\n"
+"--\n"
+"\n"
+"Parse a query given as a string argument.\n"
+"\n"
+"qs: percent-encoded query string to be parsed\n"
+"\n"
+"keep_blank_values: flag indicating whether blank values in\n"
+"    percent-encoded queries should be treated as blank strings.\n"
+"    A true value indicates that blanks should be retained as blank\n"
+"    strings.  The default false value indicates that blank values\n"
+"    are to be ignored and treated as if they were  not included.\n"
+"\n"
+"strict_parsing: flag indicating what to do with parsing errors. If\n"
+"    false (the default), errors are silently ignored. If true,\n"
+"    errors raise a ValueError exception.\n"
+"\n"
+"encoding and errors: specify how to decode percent-encoded sequences\n"
+"    into Unicode characters, as accepted by the bytes.decode() method.\n"
+"\n"
+"max_num_fields: int. If set, then throws a ValueError\n"
+"    if there are more than n fields read by parse_qsl().\n"
+"\n"
+"separator: str. The symbol to use for separating the query arguments.\n"
+"    Defaults to &.\n"
+"\n"
+"Returns a list, as G-d intended.");
+
+#define _URLPARSE_PARSE_QSL_METHODDEF    \
+    {"parse_qsl", _PyCFunction_CAST(_urlparse_parse_qsl), METH_FASTCALL|METH_KEYWORDS, _urlparse_parse_qsl__doc__},
+
+static PyObject *
+_urlparse_parse_qsl_impl(PyObject *module, PyObject *qs,
+                         PyObject *keep_blank_values,
+                         PyObject *strict_parsing, PyObject *encoding,
+                         PyObject *errors, PyObject *max_num_fields,
+                         PyObject *separator, PyObject *_stacklevel);
+
+static PyObject *
+_urlparse_parse_qsl(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 8
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(qs), &_Py_ID(keep_blank_values), &_Py_ID(strict_parsing), &_Py_ID(encoding), &_Py_ID(errors), &_Py_ID(max_num_fields), &_Py_ID(separator), &_Py_ID(_stacklevel), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"qs", "keep_blank_values", "strict_parsing", "encoding", "errors", "max_num_fields", "separator", "_stacklevel", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "parse_qsl",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[8];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *qs;
+    PyObject *keep_blank_values = Py_False;
+    PyObject *strict_parsing = Py_False;
+    PyObject *encoding = &_Py_STR(utf_8);
+    PyObject *errors = &_Py_ID(replace);
+    PyObject *max_num_fields = Py_None;
+    PyObject *separator = _Py_LATIN1_CHR('&');
+    PyObject *_stacklevel = _PyLong_GetOne();
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 7, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    qs = args[0];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        keep_blank_values = args[1];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[2]) {
+        strict_parsing = args[2];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[3]) {
+        encoding = args[3];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[4]) {
+        errors = args[4];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[5]) {
+        max_num_fields = args[5];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[6]) {
+        separator = args[6];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+skip_optional_pos:
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    _stacklevel = args[7];
+skip_optional_kwonly:
+    return_value = _urlparse_parse_qsl_impl(module, qs, keep_blank_values, strict_parsing, encoding, errors, max_num_fields, separator, _stacklevel);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_urlparse_urlencode__doc__,
+"urlencode($module, /, query, doseq=False, safe=\'\', encoding=None,\n"
+"          errors=None, quote_via=quote_plus)\n"
+"--\n"
+"\n"
+"Encode a dict or sequence of two-element tuples into a URL query string.\n"
+"\n"
+"If any values in the query arg are sequences and doseq is true, each\n"
+"sequence element is converted to a separate parameter.\n"
+"\n"
+"If the query arg is a sequence of two-element tuples, the order of the\n"
+"parameters in the output will match the order of parameters in the\n"
+"input.\n"
+"\n"
+"The components of a query arg may each be either a string or a bytes type.\n"
+"\n"
+"The safe, encoding, and errors parameters are passed down to the function\n"
+"specified by quote_via (encoding and errors only if a component is a str).");
+
+#define _URLPARSE_URLENCODE_METHODDEF    \
+    {"urlencode", _PyCFunction_CAST(_urlparse_urlencode), METH_FASTCALL|METH_KEYWORDS, _urlparse_urlencode__doc__},
+
+static PyObject *
+_urlparse_urlencode_impl(PyObject *module, PyObject *query, PyObject *doseq,
+                         PyObject *safe, PyObject *encoding,
+                         PyObject *errors, PyObject *quote_via);
+
+static PyObject *
+_urlparse_urlencode(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 6
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(query), &_Py_ID(doseq), &_Py_ID(safe), &_Py_ID(encoding), &_Py_ID(errors), &_Py_ID(quote_via), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"query", "doseq", "safe", "encoding", "errors", "quote_via", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "urlencode",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[6];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *query;
+    PyObject *doseq = Py_False;
+    PyObject *safe = &_Py_STR(empty);
+    PyObject *encoding = Py_None;
+    PyObject *errors = Py_None;
+    PyObject *quote_via = NULL;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 6, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    query = args[0];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        doseq = args[1];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[2]) {
+        safe = args[2];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[3]) {
+        encoding = args[3];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[4]) {
+        errors = args[4];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    quote_via = args[5];
+skip_optional_pos:
+    return_value = _urlparse_urlencode_impl(module, query, doseq, safe, encoding, errors, quote_via);
+
+exit:
+    return return_value;
+}
+/*[clinic end generated code: output=1c3c0d0de827523e input=a9049054013a1b77]*/
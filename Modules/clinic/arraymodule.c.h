@@ -633,6 +633,550 @@ array_array___sizeof__(PyObject *self, PyObject *Py_UNUSED(ignored))
     return array_array___sizeof___impl((arrayobject *)self);
 }
 
+PyDoc_STRVAR(array_array_add__doc__,
+"add($self, other, /)\n"
+"--\n"
+"\n"
+"Return a new array with other added to each item.\n"
+"\n"
+"other is either an array with the same typecode and length, whose items\n"
+"are added elementwise, or a single value valid for the array.");
+
+#define ARRAY_ARRAY_ADD_METHODDEF    \
+    {"add", _PyCFunction_CAST(array_array_add), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_add__doc__},
+
+static PyObject *
+array_array_add_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_add(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "add",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *other;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    other = args[0];
+    return_value = array_array_add_impl((arrayobject *)self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_sub__doc__,
+"sub($self, other, /)\n"
+"--\n"
+"\n"
+"Return a new array with other subtracted from each item.\n"
+"\n"
+"other is either an array with the same typecode and length, whose items\n"
+"are subtracted elementwise, or a single value valid for the array.");
+
+#define ARRAY_ARRAY_SUB_METHODDEF    \
+    {"sub", _PyCFunction_CAST(array_array_sub), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_sub__doc__},
+
+static PyObject *
+array_array_sub_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_sub(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "sub",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *other;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    other = args[0];
+    return_value = array_array_sub_impl((arrayobject *)self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_mul__doc__,
+"mul($self, other, /)\n"
+"--\n"
+"\n"
+"Return a new array with each item multiplied by other.\n"
+"\n"
+"other is either an array with the same typecode and length, whose items\n"
+"are multiplied elementwise, or a single value valid for the array.");
+
+#define ARRAY_ARRAY_MUL_METHODDEF    \
+    {"mul", _PyCFunction_CAST(array_array_mul), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_mul__doc__},
+
+static PyObject *
+array_array_mul_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_mul(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "mul",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *other;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    other = args[0];
+    return_value = array_array_mul_impl((arrayobject *)self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_iadd__doc__,
+"iadd($self, other, /)\n"
+"--\n"
+"\n"
+"Add other to each item in place.\n"
+"\n"
+"Like add(), but modify the array.  If a result does not fit in the\n"
+"item type, OverflowError is raised and the array is left unchanged.");
+
+#define ARRAY_ARRAY_IADD_METHODDEF    \
+    {"iadd", _PyCFunction_CAST(array_array_iadd), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_iadd__doc__},
+
+static PyObject *
+array_array_iadd_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_iadd(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "iadd",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *other;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    other = args[0];
+    return_value = array_array_iadd_impl((arrayobject *)self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_isub__doc__,
+"isub($self, other, /)\n"
+"--\n"
+"\n"
+"Subtract other from each item in place.\n"
+"\n"
+"Like sub(), but modify the array.  If a result does not fit in the\n"
+"item type, OverflowError is raised and the array is left unchanged.");
+
+#define ARRAY_ARRAY_ISUB_METHODDEF    \
+    {"isub", _PyCFunction_CAST(array_array_isub), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_isub__doc__},
+
+static PyObject *
+array_array_isub_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_isub(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "isub",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *other;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    other = args[0];
+    return_value = array_array_isub_impl((arrayobject *)self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_imul__doc__,
+"imul($self, other, /)\n"
+"--\n"
+"\n"
+"Multiply each item by other in place.\n"
+"\n"
+"Like mul(), but modify the array.  If a result does not fit in the\n"
+"item type, OverflowError is raised and the array is left unchanged.");
+
+#define ARRAY_ARRAY_IMUL_METHODDEF    \
+    {"imul", _PyCFunction_CAST(array_array_imul), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_imul__doc__},
+
+static PyObject *
+array_array_imul_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_imul(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "imul",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *other;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    other = args[0];
+    return_value = array_array_imul_impl((arrayobject *)self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_compare__doc__,
+"compare($self, op, other, /)\n"
+"--\n"
+"\n"
+"Compare each item with other.\n"
+"\n"
+"op is one of \'<\', \'<=\', \'==\', \'!=\', \'>\' or \'>=\'.  other is either an\n"
+"array with the same typecode and length, or a single value valid for the\n"
+"array.  Return an array of typecode \'B\' holding 1 where the comparison\n"
+"is true and 0 where it is false.");
+
+#define ARRAY_ARRAY_COMPARE_METHODDEF    \
+    {"compare", _PyCFunction_CAST(array_array_compare), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_compare__doc__},
+
+static PyObject *
+array_array_compare_impl(arrayobject *self, PyTypeObject *cls,
+                         const char *op, PyObject *other);
+
+static PyObject *
+array_array_compare(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", "", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "compare",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    const char *op;
+    PyObject *other;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 2, /*maxpos*/ 2, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!PyUnicode_Check(args[0])) {
+        _PyArg_BadArgument("compare", "argument 1", "str", args[0]);
+        goto exit;
+    }
+    Py_ssize_t op_length;
+    op = PyUnicode_AsUTF8AndSize(args[0], &op_length);
+    if (op == NULL) {
+        goto exit;
+    }
+    if (strlen(op) != (size_t)op_length) {
+        PyErr_SetString(PyExc_ValueError, "embedded null character");
+        goto exit;
+    }
+    other = args[1];
+    return_value = array_array_compare_impl((arrayobject *)self, cls, op, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_sum__doc__,
+"sum($self, /)\n"
+"--\n"
+"\n"
+"Return the sum of the items.\n"
+"\n"
+"The sum of an integer array is exact.  The sum of a floating-point array\n"
+"is computed with the same compensated summation as the builtin sum().");
+
+#define ARRAY_ARRAY_SUM_METHODDEF    \
+    {"sum", (PyCFunction)array_array_sum, METH_NOARGS, array_array_sum__doc__},
+
+static PyObject *
+array_array_sum_impl(arrayobject *self);
+
+static PyObject *
+array_array_sum(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_sum_impl((arrayobject *)self);
+}
+
+PyDoc_STRVAR(array_array_min__doc__,
+"min($self, /)\n"
+"--\n"
+"\n"
+"Return the smallest item.");
+
+#define ARRAY_ARRAY_MIN_METHODDEF    \
+    {"min", (PyCFunction)array_array_min, METH_NOARGS, array_array_min__doc__},
+
+static PyObject *
+array_array_min_impl(arrayobject *self);
+
+static PyObject *
+array_array_min(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_min_impl((arrayobject *)self);
+}
+
+PyDoc_STRVAR(array_array_max__doc__,
+"max($self, /)\n"
+"--\n"
+"\n"
+"Return the largest item.");
+
+#define ARRAY_ARRAY_MAX_METHODDEF    \
+    {"max", (PyCFunction)array_array_max, METH_NOARGS, array_array_max__doc__},
+
+static PyObject *
+array_array_max_impl(arrayobject *self);
+
+static PyObject *
+array_array_max(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_max_impl((arrayobject *)self);
+}
+
+PyDoc_STRVAR(array_array_dot__doc__,
+"dot($self, other, /)\n"
+"--\n"
+"\n"
+"Return the sum of the products of the items of two arrays.\n"
+"\n"
+"other must be an array with the same typecode and length.");
+
+#define ARRAY_ARRAY_DOT_METHODDEF    \
+    {"dot", _PyCFunction_CAST(array_array_dot), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_dot__doc__},
+
+static PyObject *
+array_array_dot_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_dot(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "dot",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *other;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    other = args[0];
+    return_value = array_array_dot_impl((arrayobject *)self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_take__doc__,
+"take($self, indices, /)\n"
+"--\n"
+"\n"
+"Return a new array with the items at the given indices.\n"
+"\n"
+"indices is an integer array or an iterable of integers.  Negative\n"
+"indices count from the end of the array.");
+
+#define ARRAY_ARRAY_TAKE_METHODDEF    \
+    {"take", _PyCFunction_CAST(array_array_take), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_take__doc__},
+
+static PyObject *
+array_array_take_impl(arrayobject *self, PyTypeObject *cls,
+                      PyObject *indices);
+
+static PyObject *
+array_array_take(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "take",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *indices;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    indices = args[0];
+    return_value = array_array_take_impl((arrayobject *)self, cls, indices);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_compress__doc__,
+"compress($self, mask, /)\n"
+"--\n"
+"\n"
+"Return a new array with the items for which mask is true.\n"
+"\n"
+"mask is an array or an iterable with the same length as the array.");
+
+#define ARRAY_ARRAY_COMPRESS_METHODDEF    \
+    {"compress", _PyCFunction_CAST(array_array_compress), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_compress__doc__},
+
+static PyObject *
+array_array_compress_impl(arrayobject *self, PyTypeObject *cls,
+                          PyObject *mask);
+
+static PyObject *
+array_array_compress(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "compress",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *mask;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    mask = args[0];
+    return_value = array_array_compress_impl((arrayobject *)self, cls, mask);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(array__array_reconstructor__doc__,
 "_array_reconstructor($module, arraytype, typecode, mformat_code, items,\n"
 "                     /)\n"
@@ -773,4 +1317,4 @@ array_arrayiterator___setstate__(PyObject *self, PyObject *state)
 
     return return_value;
 }
-/*[clinic end generated code: output=dd49451ac1cc3f39 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=ee9c75a49567cef6 input=a9049054013a1b77]*/
@@ -1340,6 +1340,42 @@ _fsum_realloc(double **p_ptr, Py_ssize_t  n,
    Depends on IEEE 754 arithmetic guarantees and half-even rounding.
 */
 
+/* If obj exports a one-dimensional contiguous buffer of C floats or doubles,
+   get it into view and return 1.  Otherwise return 0. */
+static int
+get_float_buffer(PyObject *obj, Py_buffer *view)
+{
+    const char *format;
+
+    if (!PyObject_CheckBuffer(obj)) {
+        return 0;
+    }
+    if (PyObject_GetBuffer(obj, view, PyBUF_ND | PyBUF_FORMAT) < 0) {
+        /* Not contiguous: fall back to iterating */
+        PyErr_Clear();
+        return 0;
+    }
+    format = view->format;
+    if (format[0] == '@') {
+        format++;
+    }
+    if (view->ndim == 1 && (strcmp(format, "d") == 0 ||
+                            strcmp(format, "f") == 0)) {
+        return 1;
+    }
+    PyBuffer_Release(view);
+    return 0;
+}
+
+static inline double
+float_buffer_item(const Py_buffer *view, Py_ssize_t i)
+{
+    if (view->itemsize == sizeof(double)) {
+        return ((const double *)view->buf)[i];
+    }
+    return ((const float *)view->buf)[i];
+}
+
 /*[clinic input]
 math.fsum
 
@@ -1360,24 +1396,41 @@ math_fsum(PyObject *module, PyObject *seq)
     double x, y, t, ps[NUM_PARTIALS], *p = ps;
     double xsave, special_sum = 0.0, inf_sum = 0.0;
     double hi, yr, lo = 0.0;
+    Py_buffer view;
+    Py_ssize_t k = 0, count = 0;
 
-    iter = PyObject_GetIter(seq);
-    if (iter == NULL)
-        return NULL;
+    /* Read the values of a buffer of floats or doubles directly */
+    if (get_float_buffer(seq, &view)) {
+        iter = NULL;
+        count = view.len / view.itemsize;
+    }
+    else {
+        view.obj = NULL;
+        iter = PyObject_GetIter(seq);
+        if (iter == NULL)
+            return NULL;
+    }
 
     for(;;) {           /* for x in iterable */
         assert(0 <= n && n <= m);
         assert((m == NUM_PARTIALS && p == ps) ||
                (m >  NUM_PARTIALS && p != NULL));
 
-        item = PyIter_Next(iter);
-        if (item == NULL) {
-            if (PyErr_Occurred())
-                goto _fsum_error;
-            break;
+        if (iter == NULL) {
+            if (k == count)
+                break;
+            x = float_buffer_item(&view, k++);
+        }
+        else {
+            item = PyIter_Next(iter);
+            if (item == NULL) {
+                if (PyErr_Occurred())
+                    goto _fsum_error;
+                break;
+            }
+            ASSIGN_DOUBLE(x, item, error_with_item);
+            Py_DECREF(item);
         }
-        ASSIGN_DOUBLE(x, item, error_with_item);
-        Py_DECREF(item);
 
         xsave = x;
         for (i = j = 0; j < n; j++) {       /* for y in partials */
@@ -1459,7 +1512,10 @@ math_fsum(PyObject *module, PyObject *seq)
     sum = PyFloat_FromDouble(hi);
 
   _fsum_error:
-    Py_DECREF(iter);
+    if (iter == NULL)
+        PyBuffer_Release(&view);
+    else
+        Py_DECREF(iter);
     if (p != ps)
         PyMem_Free(p);
     return sum;
@@ -2720,6 +2776,51 @@ long_add_would_overflow(long a, long b)
     return (a > 0) ? (b > LONG_MAX - a) : (b < LONG_MIN - a);
 }
 
+/* Fast path for sumprod() of two buffers of floats or doubles.  Return 1
+   and set *result if it applies, 0 if the generic code must be used, and
+   -1 on error. */
+static int
+sumprod_float_buffers(PyObject *p, PyObject *q, PyObject **result)
+{
+    Py_buffer p_view, q_view;
+    Py_ssize_t i, n;
+    TripleLength total = tl_zero;
+    int rc = 0;
+
+    if (!get_float_buffer(p, &p_view)) {
+        return 0;
+    }
+    if (!get_float_buffer(q, &q_view)) {
+        PyBuffer_Release(&p_view);
+        return 0;
+    }
+    n = p_view.len / p_view.itemsize;
+    if (n != q_view.len / q_view.itemsize) {
+        PyErr_Format(PyExc_ValueError, "Inputs are not the same length");
+        rc = -1;
+        goto done;
+    }
+    if (n == 0) {
+        /* The generic code returns the int 0 */
+        goto done;
+    }
+    for (i = 0; i < n; i++) {
+        total = tl_fma(float_buffer_item(&p_view, i),
+                       float_buffer_item(&q_view, i), total);
+        if (!isfinite(total.hi)) {
+            /* Let the generic code deal with special values */
+            goto done;
+        }
+    }
+    *result = PyFloat_FromDouble(tl_to_d(total));
+    rc = *result == NULL ? -1 : 1;
+
+  done:
+    PyBuffer_Release(&p_view);
+    PyBuffer_Release(&q_view);
+    return rc;
+}
+
 /*[clinic input]
 math.sumprod
 
@@ -2750,6 +2851,13 @@ math_sumprod_impl(PyObject *module, PyObject *p, PyObject *q)
     long int_total = 0;
     TripleLength flt_total = tl_zero;
 
+    switch (sumprod_float_buffers(p, q, &total)) {
+    case -1:
+        return NULL;
+    case 1:
+        return total;
+    }
+
     p_it = PyObject_GetIter(p);
     if (p_it == NULL) {
         return NULL;
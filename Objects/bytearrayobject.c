@@ -1272,6 +1272,7 @@ bytearray_dealloc(PyObject *op)
 #include "stringlib/split.h"
 #include "stringlib/ctype.h"
 #include "stringlib/transmogrify.h"
+#include "stringlib/multireplace.h"
 
 
 /*[clinic input]
@@ -1712,6 +1713,27 @@ bytearray_replace_impl(PyByteArrayObject *self, Py_buffer *old,
                              (const char *)new->buf, new->len, count);
 }
 
+/*[clinic input]
+@critical_section
+bytearray.replace_many
+
+    mapping: object
+    /
+
+Return a copy with occurrences of the keys of mapping replaced by its values.
+
+The bytearray is scanned once from left to right.  Where several keys match,
+the one starting first is replaced, and of those starting at the same
+position the longest one.  Replacements are not scanned again.
+[clinic start generated code]*/
+
+static PyObject *
+bytearray_replace_many_impl(PyByteArrayObject *self, PyObject *mapping)
+/*[clinic end generated code: output=4504f66d91ee2e42 input=782a14d6e11720f5]*/
+{
+    return stringlib_replace_many((PyObject *)self, mapping);
+}
+
 /*[clinic input]
 @critical_section
 bytearray.split
@@ -2722,6 +2744,7 @@ static PyMethodDef bytearray_methods[] = {
     BYTEARRAY_POP_METHODDEF
     BYTEARRAY_REMOVE_METHODDEF
     BYTEARRAY_REPLACE_METHODDEF
+    BYTEARRAY_REPLACE_MANY_METHODDEF
     BYTEARRAY_REMOVEPREFIX_METHODDEF
     BYTEARRAY_REMOVESUFFIX_METHODDEF
     BYTEARRAY_RESIZE_METHODDEF
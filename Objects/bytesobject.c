@@ -1294,6 +1294,7 @@ PyBytes_AsStringAndSize(PyObject *obj,
 #include "stringlib/ctype.h"
 
 #include "stringlib/transmogrify.h"
+#include "stringlib/multireplace.h"
 
 #undef STRINGLIB_GET_EMPTY
 
@@ -2309,6 +2310,27 @@ bytes_replace_impl(PyBytesObject *self, Py_buffer *old, Py_buffer *new,
                              (const char *)new->buf, new->len, count);
 }
 
+
+/*[clinic input]
+bytes.replace_many
+
+    mapping: object
+    /
+
+Return a copy with occurrences of the keys of mapping replaced by its values.
+
+The string is scanned once from left to right.  Where several keys match,
+the one starting first is replaced, and of those starting at the same
+position the longest one.  Replacements are not scanned again.
+[clinic start generated code]*/
+
+static PyObject *
+bytes_replace_many_impl(PyBytesObject *self, PyObject *mapping)
+/*[clinic end generated code: output=e7d6e2f2aaf56381 input=b52e20d77f093321]*/
+{
+    return stringlib_replace_many((PyObject *)self, mapping);
+}
+
 /** End DALKE **/
 
 /*[clinic input]
@@ -2692,6 +2714,7 @@ bytes_methods[] = {
     BYTES_MAKETRANS_METHODDEF
     BYTES_PARTITION_METHODDEF
     BYTES_REPLACE_METHODDEF
+    BYTES_REPLACE_MANY_METHODDEF
     BYTES_REMOVEPREFIX_METHODDEF
     BYTES_REMOVESUFFIX_METHODDEF
     BYTES_RFIND_METHODDEF
@@ -823,6 +823,34 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(bytearray_replace_many__doc__,
+"replace_many($self, mapping, /)\n"
+"--\n"
+"\n"
+"Return a copy with occurrences of the keys of mapping replaced by its values.\n"
+"\n"
+"The bytearray is scanned once from left to right.  Where several keys match,\n"
+"the one starting first is replaced, and of those starting at the same\n"
+"position the longest one.  Replacements are not scanned again.");
+
+#define BYTEARRAY_REPLACE_MANY_METHODDEF    \
+    {"replace_many", (PyCFunction)bytearray_replace_many, METH_O, bytearray_replace_many__doc__},
+
+static PyObject *
+bytearray_replace_many_impl(PyByteArrayObject *self, PyObject *mapping);
+
+static PyObject *
+bytearray_replace_many(PyObject *self, PyObject *mapping)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = bytearray_replace_many_impl((PyByteArrayObject *)self, mapping);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
 PyDoc_STRVAR(bytearray_split__doc__,
 "split($self, /, sep=None, maxsplit=-1)\n"
 "--\n"
@@ -1796,4 +1824,4 @@ bytearray_sizeof(PyObject *self, PyObject *Py_UNUSED(ignored))
 {
     return bytearray_sizeof_impl((PyByteArrayObject *)self);
 }
-/*[clinic end generated code: output=be6d28193bc96a2c input=a9049054013a1b77]*/
+/*[clinic end generated code: output=01379128a105bacf input=a9049054013a1b77]*/
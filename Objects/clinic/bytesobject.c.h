@@ -856,6 +856,32 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(bytes_replace_many__doc__,
+"replace_many($self, mapping, /)\n"
+"--\n"
+"\n"
+"Return a copy with occurrences of the keys of mapping replaced by its values.\n"
+"\n"
+"The string is scanned once from left to right.  Where several keys match,\n"
+"the one starting first is replaced, and of those starting at the same\n"
+"position the longest one.  Replacements are not scanned again.");
+
+#define BYTES_REPLACE_MANY_METHODDEF    \
+    {"replace_many", (PyCFunction)bytes_replace_many, METH_O, bytes_replace_many__doc__},
+
+static PyObject *
+bytes_replace_many_impl(PyBytesObject *self, PyObject *mapping);
+
+static PyObject *
+bytes_replace_many(PyObject *self, PyObject *mapping)
+{
+    PyObject *return_value = NULL;
+
+    return_value = bytes_replace_many_impl((PyBytesObject *)self, mapping);
+
+    return return_value;
+}
+
 PyDoc_STRVAR(bytes_removeprefix__doc__,
 "removeprefix($self, prefix, /)\n"
 "--\n"
@@ -1411,4 +1437,4 @@ skip_optional_pos:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=08b9507244f73638 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=03efe97d50bf82f6 input=a9049054013a1b77]*/
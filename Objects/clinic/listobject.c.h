@@ -195,7 +195,7 @@ exit:
 }
 
 PyDoc_STRVAR(list_sort__doc__,
-"sort($self, /, *, key=None, reverse=False)\n"
+"sort($self, /, *, key=None, reverse=False, workers=1)\n"
 "--\n"
 "\n"
 "Sort the list in ascending order and return None.\n"
@@ -206,13 +206,17 @@ PyDoc_STRVAR(list_sort__doc__,
 "If a key function is given, apply it once to each list item and sort them,\n"
 "ascending or descending, according to their function values.\n"
 "\n"
-"The reverse flag can be set to sort in descending order.");
+"The reverse flag can be set to sort in descending order.\n"
+"\n"
+"If workers is greater than 1, up to that many threads can be used to sort a\n"
+"large list whose keys are all small ints, all floats or all Latin-1 strings.");
 
 #define LIST_SORT_METHODDEF    \
     {"sort", _PyCFunction_CAST(list_sort), METH_FASTCALL|METH_KEYWORDS, list_sort__doc__},
 
 static PyObject *
-list_sort_impl(PyListObject *self, PyObject *keyfunc, int reverse);
+list_sort_impl(PyListObject *self, PyObject *keyfunc, int reverse,
+               Py_ssize_t workers);
 
 static PyObject *
 list_sort(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
@@ -220,7 +224,7 @@ list_sort(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwn
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 2
+    #define NUM_KEYWORDS 3
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
@@ -229,7 +233,7 @@ list_sort(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwn
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
         .ob_hash = -1,
-        .ob_item = { &_Py_ID(key), &_Py_ID(reverse), },
+        .ob_item = { &_Py_ID(key), &_Py_ID(reverse), &_Py_ID(workers), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -238,17 +242,18 @@ list_sort(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwn
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"key", "reverse", NULL};
+    static const char * const _keywords[] = {"key", "reverse", "workers", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "sort",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[2];
+    PyObject *argsbuf[3];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
     PyObject *keyfunc = Py_None;
     int reverse = 0;
+    Py_ssize_t workers = 1;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
             /*minpos*/ 0, /*maxpos*/ 0, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
@@ -264,13 +269,30 @@ list_sort(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwn
             goto skip_optional_kwonly;
         }
     }
-    reverse = PyObject_IsTrue(args[1]);
-    if (reverse < 0) {
-        goto exit;
+    if (args[1]) {
+        reverse = PyObject_IsTrue(args[1]);
+        if (reverse < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[2]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        workers = ival;
     }
 skip_optional_kwonly:
     Py_BEGIN_CRITICAL_SECTION(self);
-    return_value = list_sort_impl((PyListObject *)self, keyfunc, reverse);
+    return_value = list_sort_impl((PyListObject *)self, keyfunc, reverse, workers);
     Py_END_CRITICAL_SECTION();
 
 exit:
@@ -468,4 +490,4 @@ list___reversed__(PyObject *self, PyObject *Py_UNUSED(ignored))
 {
     return list___reversed___impl((PyListObject *)self);
 }
-/*[clinic end generated code: output=ae13fc2b56dc27c2 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=246f67c6f564f978 input=a9049054013a1b77]*/
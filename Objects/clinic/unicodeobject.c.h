@@ -1002,6 +1002,19 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(unicode_replace_many__doc__,
+"replace_many($self, mapping, /)\n"
+"--\n"
+"\n"
+"Return a copy with occurrences of the keys of mapping replaced by its values.\n"
+"\n"
+"The string is scanned once from left to right.  Where several keys match,\n"
+"the one starting first is replaced, and of those starting at the same\n"
+"position the longest one.  Replacements are not scanned again.");
+
+#define UNICODE_REPLACE_MANY_METHODDEF    \
+    {"replace_many", (PyCFunction)unicode_replace_many, METH_O, unicode_replace_many__doc__},
+
 PyDoc_STRVAR(unicode_removeprefix__doc__,
 "removeprefix($self, prefix, /)\n"
 "--\n"
@@ -1908,4 +1921,4 @@ skip_optional_pos:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=238917fe66120bde input=a9049054013a1b77]*/
+/*[clinic end generated code: output=39d18c147849b954 input=a9049054013a1b77]*/
@@ -587,6 +587,9 @@ init_code(PyCodeObject *co, struct _PyCodeConstructor *con)
 #else
     _PyCode_Quicken(_PyCode_CODE(co), Py_SIZE(co), 1);
 #endif
+    if (interp->warmup_profile != NULL) {
+        _Py_WarmupProfile_Apply(interp, co);
+    }
     notify_code_watchers(PY_CODE_EVENT_CREATE, co);
     return 0;
 }
@@ -12,6 +12,7 @@
 #include "pycore_long.h"          // _PyLong_DigitCount
 #include "pycore_modsupport.h"    // _PyArg_NoKwnames()
 #include "pycore_object.h"        // _PyObject_GC_TRACK(), _PyDebugAllocatorStats()
+#include "pycore_pythread.h"      // PyThread_start_joinable_thread()
 #include "pycore_stackref.h"      // _Py_TryIncrefCompareStackRef()
 #include "pycore_tuple.h"         // _PyTuple_FromArray()
 #include "pycore_typeobject.h"    // _Py_TYPE_VERSION_LIST
@@ -1728,6 +1729,11 @@ struct s_MergeState {
      * of tuples. It may be set to safe_object_compare, but the idea is that hopefully
      * we can assume more, and use one of the special-case compares. */
     int (*tuple_elem_compare)(PyObject *, PyObject *, MergeState *);
+
+    /* True in the worker threads of a parallel sort, which run without a
+     * thread state: temp memory comes from the raw allocator, and the
+     * caller raises MemoryError if it can't be gotten. */
+    int in_worker;
 };
 
 /* binarysort is the best method for sorting small arrays: it does few
@@ -2189,6 +2195,7 @@ merge_init(MergeState *ms, Py_ssize_t list_size, int has_keyfunc,
     ms->min_gallop = MIN_GALLOP;
     ms->listlen = list_size;
     ms->basekeys = lo->keys;
+    ms->in_worker = 0;
 }
 
 /* Free all the temp memory owned by the MergeState.  This must be called
@@ -2200,7 +2207,10 @@ merge_freemem(MergeState *ms)
 {
     assert(ms != NULL);
     if (ms->a.keys != ms->temparray) {
-        PyMem_Free(ms->a.keys);
+        if (ms->in_worker)
+            PyMem_RawFree(ms->a.keys);
+        else
+            PyMem_Free(ms->a.keys);
         ms->a.keys = NULL;
     }
 }
@@ -2223,19 +2233,19 @@ merge_getmem(MergeState *ms, Py_ssize_t need)
      * we don't care what's in the block.
      */
     merge_freemem(ms);
-    if ((size_t)need > PY_SSIZE_T_MAX / sizeof(PyObject *) / multiplier) {
-        PyErr_NoMemory();
-        return -1;
-    }
-    ms->a.keys = (PyObject **)PyMem_Malloc(multiplier * need
-                                          * sizeof(PyObject *));
-    if (ms->a.keys != NULL) {
-        ms->alloced = need;
-        if (ms->a.values != NULL)
-            ms->a.values = &ms->a.keys[need];
-        return 0;
+    if ((size_t)need <= PY_SSIZE_T_MAX / sizeof(PyObject *) / multiplier) {
+        size_t size = multiplier * need * sizeof(PyObject *);
+        ms->a.keys = (PyObject **)(ms->in_worker ? PyMem_RawMalloc(size)
+                                                 : PyMem_Malloc(size));
+        if (ms->a.keys != NULL) {
+            ms->alloced = need;
+            if (ms->a.values != NULL)
+                ms->a.values = &ms->a.keys[need];
+            return 0;
+        }
     }
-    PyErr_NoMemory();
+    if (!ms->in_worker)
+        PyErr_NoMemory();
     return -1;
 }
 #define MERGE_GETMEM(MS, NEED) ((NEED) <= (MS)->alloced ? 0 :   \
@@ -2765,7 +2775,7 @@ unsafe_latin_compare(PyObject *v, PyObject *w, MergeState *ms)
            res < 0 :
            PyUnicode_GET_LENGTH(v) < PyUnicode_GET_LENGTH(w));
 
-    assert(res == PyObject_RichCompareBool(v, w, Py_LT));;
+    assert(ms->in_worker || res == PyObject_RichCompareBool(v, w, Py_LT));
     return res;
 }
 
@@ -2790,7 +2800,7 @@ unsafe_long_compare(PyObject *v, PyObject *w, MergeState *ms)
     w0 = _PyLong_CompactValue(wl);
 
     res = v0 < w0;
-    assert(res == PyObject_RichCompareBool(v, w, Py_LT));
+    assert(ms->in_worker || res == PyObject_RichCompareBool(v, w, Py_LT));
     return res;
 }
 
@@ -2805,7 +2815,7 @@ unsafe_float_compare(PyObject *v, PyObject *w, MergeState *ms)
     assert(Py_IS_TYPE(w, &PyFloat_Type));
 
     res = PyFloat_AS_DOUBLE(v) < PyFloat_AS_DOUBLE(w);
-    assert(res == PyObject_RichCompareBool(v, w, Py_LT));
+    assert(ms->in_worker || res == PyObject_RichCompareBool(v, w, Py_LT));
     return res;
 }
 
@@ -2851,6 +2861,193 @@ unsafe_tuple_compare(PyObject *v, PyObject *w, MergeState *ms)
         return PyObject_RichCompareBool(vt->ob_item[i], wt->ob_item[i], Py_LT);
 }
 
+/* Sort the nremaining elements of lo, with ms initialized for lo.
+ * Returns 0 on success, -1 on error.
+ */
+static int
+sort_slice(MergeState *ms, sortslice lo, Py_ssize_t nremaining)
+{
+    Py_ssize_t minrun;
+
+    assert(nremaining >= 2);
+    /* March over the array once, left to right, finding natural runs,
+     * and extending short natural runs to minrun elements.
+     */
+    minrun = merge_compute_minrun(nremaining);
+    do {
+        Py_ssize_t n;
+
+        /* Identify next run. */
+        n = count_run(ms, &lo, nremaining);
+        if (n < 0)
+            return -1;
+        /* If short, extend to min(minrun, nremaining). */
+        if (n < minrun) {
+            const Py_ssize_t force = nremaining <= minrun ?
+                              nremaining : minrun;
+            if (binarysort(ms, &lo, force, n) < 0)
+                return -1;
+            n = force;
+        }
+        /* Maybe merge pending runs. */
+        assert(ms->n == 0 || ms->pending[ms->n -1].base.keys +
+                             ms->pending[ms->n-1].len == lo.keys);
+        if (found_new_run(ms, n) < 0)
+            return -1;
+        /* Push new run on stack. */
+        assert(ms->n < MAX_MERGE_PENDING);
+        ms->pending[ms->n].base = lo;
+        ms->pending[ms->n].len = n;
+        ++ms->n;
+        /* Advance to find next run. */
+        sortslice_advance(&lo, n);
+        nremaining -= n;
+    } while (nremaining);
+
+    if (merge_force_collapse(ms) < 0)
+        return -1;
+    assert(ms->n == 1);
+    assert(ms->pending[0].len == ms->listlen);
+    return 0;
+}
+
+/* Parallel sort.
+ *
+ * When the keys are all ints fitting in a machine word, all floats, or all
+ * Latin-1 strings, comparing them runs no Python code and doesn't touch any
+ * reference count, so several threads can sort parts of the list without a
+ * thread state.  The list is cut into one slice per worker, the slices are
+ * sorted concurrently, then adjacent runs are merged pairwise, concurrently,
+ * until a single run remains.  Only adjacent runs are merged, so the sort
+ * stays stable.
+ */
+
+/* Don't bother starting a thread for less than this many elements. */
+#define PARALLEL_SORT_MIN_SLICE (1 << 15)
+#define PARALLEL_SORT_MAX_WORKERS 64
+
+typedef struct {
+    MergeState ms;
+    sortslice lo;
+    Py_ssize_t na;      /* length of the slice, or of the first run */
+    Py_ssize_t nb;      /* length of the second run, 0 to sort the slice */
+    int result;
+    int started;
+    PyThread_handle_t handle;
+} sorttask;
+
+static void
+sorttask_init(sorttask *task, MergeState *ms, sortslice lo,
+              Py_ssize_t na, Py_ssize_t nb)
+{
+    merge_init(&task->ms, na + nb, lo.values != NULL, &lo);
+    task->ms.in_worker = 1;
+    task->ms.key_compare = ms->key_compare;
+    task->lo = lo;
+    task->na = na;
+    task->nb = nb;
+    task->started = 0;
+}
+
+static void
+sorttask_run(void *arg)
+{
+    sorttask *task = (sorttask *)arg;
+    MergeState *ms = &task->ms;
+
+    if (task->nb == 0) {
+        task->result = sort_slice(ms, task->lo, task->na);
+    }
+    else {
+        ms->pending[0].base = task->lo;
+        ms->pending[0].len = task->na;
+        ms->pending[1].base = task->lo;
+        sortslice_advance(&ms->pending[1].base, task->na);
+        ms->pending[1].len = task->nb;
+        ms->n = 2;
+        task->result = (int)merge_at(ms, 0);
+    }
+    merge_freemem(ms);
+}
+
+/* Run the tasks concurrently, the first one in the calling thread, and
+ * return -1 if any of them failed.  A task whose thread can't be started
+ * runs in the calling thread.
+ */
+static int
+sorttasks_run(sorttask *tasks, Py_ssize_t ntasks)
+{
+    PyThread_ident_t ident;
+    int result = 0;
+
+    for (Py_ssize_t i = 1; i < ntasks; i++) {
+        tasks[i].started = (PyThread_start_joinable_thread(
+            sorttask_run, &tasks[i], &ident, &tasks[i].handle) == 0);
+    }
+    sorttask_run(&tasks[0]);
+    for (Py_ssize_t i = 1; i < ntasks; i++) {
+        if (tasks[i].started)
+            PyThread_join_thread(tasks[i].handle);
+        else
+            sorttask_run(&tasks[i]);
+    }
+    for (Py_ssize_t i = 0; i < ntasks; i++) {
+        if (tasks[i].result < 0)
+            result = -1;
+    }
+    return result;
+}
+
+/* Sort the n elements of lo with nworkers threads, using the compare
+ * function set in ms.  Returns 0 on success, -1 on error.  The workers can
+ * only fail to allocate memory.
+ */
+static int
+parallel_sort(MergeState *ms, sortslice lo, Py_ssize_t n, Py_ssize_t nworkers)
+{
+    Py_ssize_t runlen[PARALLEL_SORT_MAX_WORKERS];
+    Py_ssize_t nruns = nworkers;
+    sorttask *tasks;
+    sortslice s;
+    int result;
+
+    assert(2 <= nworkers && nworkers <= PARALLEL_SORT_MAX_WORKERS);
+    tasks = PyMem_New(sorttask, nworkers);
+    if (tasks == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    s = lo;
+    for (Py_ssize_t i = 0; i < nruns; i++) {
+        runlen[i] = n / nruns + (i < n % nruns);
+        sorttask_init(&tasks[i], ms, s, runlen[i], 0);
+        sortslice_advance(&s, runlen[i]);
+    }
+    result = sorttasks_run(tasks, nruns);
+
+    while (result == 0 && nruns > 1) {
+        Py_ssize_t ntasks = nruns / 2;
+        s = lo;
+        for (Py_ssize_t i = 0; i < ntasks; i++) {
+            sorttask_init(&tasks[i], ms, s, runlen[2*i], runlen[2*i+1]);
+            runlen[i] = runlen[2*i] + runlen[2*i+1];
+            sortslice_advance(&s, runlen[i]);
+        }
+        if (nruns & 1)
+            runlen[ntasks] = runlen[nruns - 1];
+        result = sorttasks_run(tasks, ntasks);
+        nruns = ntasks + (nruns & 1);
+    }
+    Py_END_ALLOW_THREADS
+
+    PyMem_Free(tasks);
+    if (result < 0)
+        PyErr_NoMemory();
+    return result;
+}
+
 /* An adaptive, stable, natural mergesort.  See listsort.txt.
  * Returns Py_None on success, NULL on error.  Even in case of error, the
  * list will be some permutation of its input state (nothing is lost or
@@ -2863,6 +3060,7 @@ list.sort
     *
     key as keyfunc: object = None
     reverse: bool = False
+    workers: Py_ssize_t = 1
 
 Sort the list in ascending order and return None.
 
@@ -2873,15 +3071,19 @@ If a key function is given, apply it once to each list item and sort them,
 ascending or descending, according to their function values.
 
 The reverse flag can be set to sort in descending order.
+
+If workers is greater than 1, up to that many threads can be used to sort a
+large list whose keys are all small ints, all floats or all Latin-1 strings.
 [clinic start generated code]*/
 
 static PyObject *
-list_sort_impl(PyListObject *self, PyObject *keyfunc, int reverse)
-/*[clinic end generated code: output=57b9f9c5e23fbe42 input=667bf25d0e3a3676]*/
+list_sort_impl(PyListObject *self, PyObject *keyfunc, int reverse,
+               Py_ssize_t workers)
+/*[clinic end generated code: output=a5ce3fcb7498b9fc input=f6a1819ce54514e5]*/
 {
     MergeState ms;
     Py_ssize_t nremaining;
-    Py_ssize_t minrun;
+    Py_ssize_t nworkers;
     sortslice lo;
     Py_ssize_t saved_ob_size, saved_allocated;
     PyObject **saved_ob_item;
@@ -2894,6 +3096,10 @@ list_sort_impl(PyListObject *self, PyObject *keyfunc, int reverse)
     assert(PyList_Check(self));
     if (keyfunc == Py_None)
         keyfunc = NULL;
+    if (workers < 1) {
+        PyErr_SetString(PyExc_ValueError, "workers must be at least 1");
+        return NULL;
+    }
 
     /* The list is temporarily made empty, so that mutations performed
      * by comparison functions can't affect the slice of memory we're
@@ -3051,48 +3257,22 @@ list_sort_impl(PyListObject *self, PyObject *keyfunc, int reverse)
         reverse_slice(&saved_ob_item[0], &saved_ob_item[saved_ob_size]);
     }
 
-    /* March over the array once, left to right, finding natural runs,
-     * and extending short natural runs to minrun elements.
-     */
-    minrun = merge_compute_minrun(nremaining);
-    do {
-        Py_ssize_t n;
-
-        /* Identify next run. */
-        n = count_run(&ms, &lo, nremaining);
-        if (n < 0)
+    nworkers = Py_MIN(workers, saved_ob_size / PARALLEL_SORT_MIN_SLICE);
+    nworkers = Py_MIN(nworkers, PARALLEL_SORT_MAX_WORKERS);
+    if (nworkers > 1 && (ms.key_compare == unsafe_long_compare ||
+                         ms.key_compare == unsafe_float_compare ||
+                         ms.key_compare == unsafe_latin_compare))
+    {
+        if (parallel_sort(&ms, lo, saved_ob_size, nworkers) < 0)
             goto fail;
-        /* If short, extend to min(minrun, nremaining). */
-        if (n < minrun) {
-            const Py_ssize_t force = nremaining <= minrun ?
-                              nremaining : minrun;
-            if (binarysort(&ms, &lo, force, n) < 0)
-                goto fail;
-            n = force;
-        }
-        /* Maybe merge pending runs. */
-        assert(ms.n == 0 || ms.pending[ms.n -1].base.keys +
-                            ms.pending[ms.n-1].len == lo.keys);
-        if (found_new_run(&ms, n) < 0)
+    }
+    else {
+        if (sort_slice(&ms, lo, nremaining) < 0)
             goto fail;
-        /* Push new run on stack. */
-        assert(ms.n < MAX_MERGE_PENDING);
-        ms.pending[ms.n].base = lo;
-        ms.pending[ms.n].len = n;
-        ++ms.n;
-        /* Advance to find next run. */
-        sortslice_advance(&lo, n);
-        nremaining -= n;
-    } while (nremaining);
-
-    if (merge_force_collapse(&ms) < 0)
-        goto fail;
-    assert(ms.n == 1);
-    assert(keys == NULL
-           ? ms.pending[0].base.keys == saved_ob_item
-           : ms.pending[0].base.keys == &keys[0]);
-    assert(ms.pending[0].len == saved_ob_size);
-    lo = ms.pending[0].base;
+        assert(keys == NULL
+               ? ms.pending[0].base.keys == saved_ob_item
+               : ms.pending[0].base.keys == &keys[0]);
+    }
 
 succeed:
     result = Py_None;
@@ -3150,7 +3330,7 @@ PyList_Sort(PyObject *v)
         return -1;
     }
     Py_BEGIN_CRITICAL_SECTION(v);
-    v = list_sort_impl((PyListObject *)v, NULL, 0);
+    v = list_sort_impl((PyListObject *)v, NULL, 0, 1);
     Py_END_CRITICAL_SECTION();
     if (v == NULL)
         return -1;
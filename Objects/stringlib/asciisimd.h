@@ -0,0 +1,244 @@
+/* stringlib: vectorized handling of runs of ASCII characters */
+
+/* The UTF-8 codec and the ASCII checks spend most of their time on runs of
+   ASCII characters.  The functions below process them 16 characters at a
+   time with SSE2 or NEON, which are always available on x86-64 and AArch64,
+   so no runtime detection is needed.  They all stop at the first block of
+   16 bytes (or characters) which contains a non-ASCII character, and leave
+   it and the remaining tail of less than a block to the scalar code of the
+   caller.
+
+   ASCII_SIMD is defined to 0 on other platforms, where the functions are
+   not available. */
+
+#ifndef STRINGLIB_ASCIISIMD_H
+#define STRINGLIB_ASCIISIMD_H
+
+#if defined(__SSE2__) || defined(_M_X64) || defined(_M_AMD64) \
+    || (defined(_M_IX86_FP) && _M_IX86_FP >= 2)
+#  include <emmintrin.h>
+#  define ASCII_SIMD_SSE2
+#  define ASCII_SIMD 1
+#elif (defined(__aarch64__) && defined(__ARM_NEON)) || defined(_M_ARM64)
+#  include <arm_neon.h>
+#  define ASCII_SIMD_NEON
+#  define ASCII_SIMD 1
+#else
+#  define ASCII_SIMD 0
+#endif
+
+#if ASCII_SIMD
+
+/* Return a pointer q into [p, end] such that all the bytes of [p, q) are
+   ASCII, and either *q is not ASCII or less than 16 bytes are left. */
+Py_LOCAL_INLINE(const unsigned char *)
+ascii_simd_skip(const unsigned char *p, const unsigned char *end)
+{
+    while (end - p >= 32) {
+#ifdef ASCII_SIMD_SSE2
+        __m128i a = _mm_loadu_si128((const __m128i *)p);
+        __m128i b = _mm_loadu_si128((const __m128i *)(p + 16));
+        if (_mm_movemask_epi8(_mm_or_si128(a, b))) {
+            break;
+        }
+#else
+        uint8x16_t v = vorrq_u8(vld1q_u8(p), vld1q_u8(p + 16));
+        if (vmaxvq_u8(v) & 0x80) {
+            break;
+        }
+#endif
+        p += 32;
+    }
+    while (end - p >= 16) {
+#ifdef ASCII_SIMD_SSE2
+        __m128i v = _mm_loadu_si128((const __m128i *)p);
+        if (_mm_movemask_epi8(v)) {
+            break;
+        }
+#else
+        if (vmaxvq_u8(vld1q_u8(p)) & 0x80) {
+            break;
+        }
+#endif
+        p += 16;
+    }
+    if (end - p >= 16) {
+        /* the block contains a non-ASCII byte */
+        while (!(*p & 0x80)) {
+            p++;
+        }
+    }
+    return p;
+}
+
+/* Copy blocks of 16 ASCII bytes from src to dest, widening them to 1, 2 or
+   4 bytes per character.  Return the number of characters copied. */
+
+Py_LOCAL_INLINE(Py_ssize_t)
+ascii_simd_widen1(const unsigned char *src, const unsigned char *end,
+                  Py_UCS1 *dest)
+{
+    const unsigned char *p = src;
+    while (end - p >= 16) {
+#ifdef ASCII_SIMD_SSE2
+        __m128i v = _mm_loadu_si128((const __m128i *)p);
+        if (_mm_movemask_epi8(v)) {
+            break;
+        }
+        _mm_storeu_si128((__m128i *)dest, v);
+#else
+        uint8x16_t v = vld1q_u8(p);
+        if (vmaxvq_u8(v) & 0x80) {
+            break;
+        }
+        vst1q_u8(dest, v);
+#endif
+        p += 16;
+        dest += 16;
+    }
+    return p - src;
+}
+
+Py_LOCAL_INLINE(Py_ssize_t)
+ascii_simd_widen2(const unsigned char *src, const unsigned char *end,
+                  Py_UCS2 *dest)
+{
+    const unsigned char *p = src;
+    while (end - p >= 16) {
+#ifdef ASCII_SIMD_SSE2
+        __m128i zero = _mm_setzero_si128();
+        __m128i v = _mm_loadu_si128((const __m128i *)p);
+        if (_mm_movemask_epi8(v)) {
+            break;
+        }
+        _mm_storeu_si128((__m128i *)dest, _mm_unpacklo_epi8(v, zero));
+        _mm_storeu_si128((__m128i *)(dest + 8), _mm_unpackhi_epi8(v, zero));
+#else
+        uint8x16_t v = vld1q_u8(p);
+        if (vmaxvq_u8(v) & 0x80) {
+            break;
+        }
+        vst1q_u16(dest, vmovl_u8(vget_low_u8(v)));
+        vst1q_u16(dest + 8, vmovl_u8(vget_high_u8(v)));
+#endif
+        p += 16;
+        dest += 16;
+    }
+    return p - src;
+}
+
+Py_LOCAL_INLINE(Py_ssize_t)
+ascii_simd_widen4(const unsigned char *src, const unsigned char *end,
+                  Py_UCS4 *dest)
+{
+    const unsigned char *p = src;
+    while (end - p >= 16) {
+#ifdef ASCII_SIMD_SSE2
+        __m128i zero = _mm_setzero_si128();
+        __m128i v = _mm_loadu_si128((const __m128i *)p);
+        __m128i lo, hi;
+        if (_mm_movemask_epi8(v)) {
+            break;
+        }
+        lo = _mm_unpacklo_epi8(v, zero);
+        hi = _mm_unpackhi_epi8(v, zero);
+        _mm_storeu_si128((__m128i *)dest, _mm_unpacklo_epi16(lo, zero));
+        _mm_storeu_si128((__m128i *)(dest + 4), _mm_unpackhi_epi16(lo, zero));
+        _mm_storeu_si128((__m128i *)(dest + 8), _mm_unpacklo_epi16(hi, zero));
+        _mm_storeu_si128((__m128i *)(dest + 12), _mm_unpackhi_epi16(hi, zero));
+#else
+        uint8x16_t v = vld1q_u8(p);
+        uint16x8_t lo, hi;
+        if (vmaxvq_u8(v) & 0x80) {
+            break;
+        }
+        lo = vmovl_u8(vget_low_u8(v));
+        hi = vmovl_u8(vget_high_u8(v));
+        vst1q_u32(dest, vmovl_u16(vget_low_u16(lo)));
+        vst1q_u32(dest + 4, vmovl_u16(vget_high_u16(lo)));
+        vst1q_u32(dest + 8, vmovl_u16(vget_low_u16(hi)));
+        vst1q_u32(dest + 12, vmovl_u16(vget_high_u16(hi)));
+#endif
+        p += 16;
+        dest += 16;
+    }
+    return p - src;
+}
+
+/* Copy blocks of 16 ASCII characters of 2 or 4 bytes from src to dest,
+   narrowing them to bytes.  Return the number of characters copied. */
+
+Py_LOCAL_INLINE(Py_ssize_t)
+ascii_simd_narrow2(const Py_UCS2 *src, const Py_UCS2 *end,
+                   unsigned char *dest)
+{
+    const Py_UCS2 *p = src;
+    while (end - p >= 16) {
+#ifdef ASCII_SIMD_SSE2
+        __m128i a = _mm_loadu_si128((const __m128i *)p);
+        __m128i b = _mm_loadu_si128((const __m128i *)(p + 8));
+        __m128i high = _mm_and_si128(_mm_or_si128(a, b),
+                                     _mm_set1_epi16((short)0xFF80));
+        if (_mm_movemask_epi8(_mm_cmpeq_epi8(high, _mm_setzero_si128()))
+            != 0xFFFF)
+        {
+            break;
+        }
+        _mm_storeu_si128((__m128i *)dest, _mm_packus_epi16(a, b));
+#else
+        uint16x8_t a = vld1q_u16(p);
+        uint16x8_t b = vld1q_u16(p + 8);
+        if (vmaxvq_u16(vorrq_u16(a, b)) >= 0x80) {
+            break;
+        }
+        vst1q_u8(dest, vcombine_u8(vmovn_u16(a), vmovn_u16(b)));
+#endif
+        p += 16;
+        dest += 16;
+    }
+    return p - src;
+}
+
+Py_LOCAL_INLINE(Py_ssize_t)
+ascii_simd_narrow4(const Py_UCS4 *src, const Py_UCS4 *end,
+                   unsigned char *dest)
+{
+    const Py_UCS4 *p = src;
+    while (end - p >= 16) {
+#ifdef ASCII_SIMD_SSE2
+        __m128i a = _mm_loadu_si128((const __m128i *)p);
+        __m128i b = _mm_loadu_si128((const __m128i *)(p + 4));
+        __m128i c = _mm_loadu_si128((const __m128i *)(p + 8));
+        __m128i d = _mm_loadu_si128((const __m128i *)(p + 12));
+        __m128i high = _mm_and_si128(
+            _mm_or_si128(_mm_or_si128(a, b), _mm_or_si128(c, d)),
+            _mm_set1_epi32((int)0xFFFFFF80));
+        if (_mm_movemask_epi8(_mm_cmpeq_epi8(high, _mm_setzero_si128()))
+            != 0xFFFF)
+        {
+            break;
+        }
+        _mm_storeu_si128((__m128i *)dest,
+                         _mm_packus_epi16(_mm_packs_epi32(a, b),
+                                          _mm_packs_epi32(c, d)));
+#else
+        uint32x4_t a = vld1q_u32(p);
+        uint32x4_t b = vld1q_u32(p + 4);
+        uint32x4_t c = vld1q_u32(p + 8);
+        uint32x4_t d = vld1q_u32(p + 12);
+        if (vmaxvq_u32(vorrq_u32(vorrq_u32(a, b), vorrq_u32(c, d))) >= 0x80) {
+            break;
+        }
+        vst1q_u8(dest, vcombine_u8(
+            vmovn_u16(vcombine_u16(vmovn_u32(a), vmovn_u32(b))),
+            vmovn_u16(vcombine_u16(vmovn_u32(c), vmovn_u32(d)))));
+#endif
+        p += 16;
+        dest += 16;
+    }
+    return p - src;
+}
+
+#endif /* ASCII_SIMD */
+
+#endif /* !STRINGLIB_ASCIISIMD_H */
@@ -5,6 +5,7 @@
 #endif
 
 #include "pycore_bitutils.h"      // _Py_bswap32()
+#include "asciisimd.h"
 
 /* Mask to quickly check whether a C 'size_t' contains a
    non-ASCII, UTF8-encoded char. */
@@ -19,6 +20,18 @@
 /* 10xxxxxx */
 #define IS_CONTINUATION_BYTE(ch) ((ch) >= 0x80 && (ch) < 0xC0)
 
+#if ASCII_SIMD
+# if STRINGLIB_SIZEOF_CHAR == 1
+#  define ASCII_SIMD_DECODE ascii_simd_widen1
+# elif STRINGLIB_SIZEOF_CHAR == 2
+#  define ASCII_SIMD_DECODE ascii_simd_widen2
+#  define ASCII_SIMD_ENCODE ascii_simd_narrow2
+# else
+#  define ASCII_SIMD_DECODE ascii_simd_widen4
+#  define ASCII_SIMD_ENCODE ascii_simd_narrow4
+# endif
+#endif
+
 Py_LOCAL_INLINE(Py_UCS4)
 STRINGLIB(utf8_decode)(const char **inptr, const char *end,
                        STRINGLIB_CHAR *dest,
@@ -39,6 +52,20 @@ STRINGLIB(utf8_decode)(const char **inptr, const char *end,
                First, check if we can do an aligned read, as most CPUs have
                a penalty for unaligned reads.
             */
+#ifdef ASCII_SIMD_DECODE
+            /* Vector loads have no such penalty, so copy whole blocks
+               whatever the alignment. */
+            if (end - s >= 16) {
+                Py_ssize_t n = ASCII_SIMD_DECODE((const unsigned char *)s,
+                                                 (const unsigned char *)end,
+                                                 p);
+                s += n;
+                p += n;
+                if (s == end)
+                    break;
+                ch = (unsigned char)*s;
+            }
+#endif
             if (_Py_IS_ALIGNED(s, ALIGNOF_SIZE_T)) {
                 /* Help register allocation */
                 const char *_s = s;
@@ -298,7 +325,24 @@ STRINGLIB(utf8_encoder)(_PyBytesWriter *writer,
         if (ch < 0x80) {
             /* Encode ASCII */
             *p++ = (char) ch;
-
+#ifdef ASCII_SIMD_ENCODE
+            if (size - i >= 16) {
+                Py_ssize_t n = ASCII_SIMD_ENCODE(data + i, data + size,
+                                                 (unsigned char *)p);
+                i += n;
+                p += n;
+            }
+#elif ASCII_SIMD
+            if (size - i >= 16) {
+                Py_ssize_t n = ascii_simd_skip(
+                    (const unsigned char *)data + i,
+                    (const unsigned char *)data + size) -
+                    ((const unsigned char *)data + i);
+                memcpy(p, data + i, n);
+                i += n;
+                p += n;
+            }
+#endif
         }
         else
 #if STRINGLIB_SIZEOF_CHAR > 1
@@ -469,6 +513,9 @@ STRINGLIB(utf8_encoder)(_PyBytesWriter *writer,
 #endif
 }
 
+#undef ASCII_SIMD_DECODE
+#undef ASCII_SIMD_ENCODE
+
 /* The pattern for constructing UCS2-repeated masks. */
 #if SIZEOF_LONG == 8
 # define UCS2_REPEAT_MASK 0x0001000100010001ul
@@ -17,12 +17,17 @@
 
 #if STRINGLIB_SIZEOF_CHAR == 1
 
+#include "asciisimd.h"
+
 Py_LOCAL_INLINE(Py_UCS4)
 STRINGLIB(find_max_char)(const STRINGLIB_CHAR *begin, const STRINGLIB_CHAR *end)
 {
     const unsigned char *p = (const unsigned char *) begin;
     const unsigned char *_end = (const unsigned char *)end;
 
+#if ASCII_SIMD
+    p = ascii_simd_skip(p, _end);
+#endif
     while (p < _end) {
         if (_Py_IS_ALIGNED(p, ALIGNOF_SIZE_T)) {
             /* Help register allocation */
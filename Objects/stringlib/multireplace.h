@@ -0,0 +1,494 @@
+/* stringlib: replace many substrings in a single pass */
+
+/* The keys are compiled into an Aho-Corasick automaton: a trie of the keys
+   in which every node also has a failure link to the node of its longest
+   proper suffix which is in the trie.  Scanning the string with it finds
+   at each position the longest key which ends there.
+
+   Matches are reported leftmost-longest: of the keys occurring at the
+   leftmost position, the longest one is replaced, and scanning resumes
+   after it.  A match is final once no key which is still partially
+   matched can start at or before it. */
+
+#ifndef STRINGLIB_MULTIREPLACE_H
+#define STRINGLIB_MULTIREPLACE_H
+
+typedef struct {
+    Py_ssize_t nnodes;
+    /* The children of a node are edge_char[edges[node]:edges[node+1]],
+       sorted, and the corresponding nodes in edge_next.  The root is
+       node 0. */
+    Py_ssize_t *edges;
+    Py_UCS4 *edge_char;
+    Py_ssize_t *edge_next;
+    Py_ssize_t *fail;
+    Py_ssize_t *depth;
+    /* The longest key which is a suffix of the node, or -1 */
+    Py_ssize_t *match;
+    Py_ssize_t *key_len;
+    /* The children of the root for the first 256 characters, 0 if none */
+    Py_ssize_t root[256];
+} multireplace_automaton;
+
+typedef struct {
+    /* (start, key) pairs */
+    Py_ssize_t *items;
+    Py_ssize_t count;
+    Py_ssize_t allocated;
+} multireplace_matches;
+
+Py_LOCAL_INLINE(void)
+multireplace_fini(multireplace_automaton *ac)
+{
+    PyMem_Free(ac->edges);
+    PyMem_Free(ac->edge_char);
+    PyMem_Free(ac->edge_next);
+    PyMem_Free(ac->fail);
+    PyMem_Free(ac->depth);
+    PyMem_Free(ac->match);
+    PyMem_Free(ac->key_len);
+}
+
+Py_LOCAL_INLINE(Py_ssize_t)
+multireplace_goto(const multireplace_automaton *ac, Py_ssize_t node,
+                  Py_UCS4 ch)
+{
+    /* return the child of node for ch, or -1 */
+    Py_ssize_t lo, hi, mid;
+
+    if (node == 0 && ch < 256) {
+        return ac->root[ch] ? ac->root[ch] : -1;
+    }
+    lo = ac->edges[node];
+    hi = ac->edges[node + 1];
+    while (lo < hi) {
+        mid = lo + (hi - lo) / 2;
+        if (ac->edge_char[mid] < ch) {
+            lo = mid + 1;
+        }
+        else {
+            hi = mid;
+        }
+    }
+    if (lo < ac->edges[node + 1] && ac->edge_char[lo] == ch) {
+        return ac->edge_next[lo];
+    }
+    return -1;
+}
+
+Py_LOCAL_INLINE(Py_ssize_t)
+multireplace_next(const multireplace_automaton *ac, Py_ssize_t node,
+                  Py_UCS4 ch)
+{
+    Py_ssize_t next;
+
+    for (;;) {
+        next = multireplace_goto(ac, node, ch);
+        if (next >= 0) {
+            return next;
+        }
+        if (node == 0) {
+            return 0;
+        }
+        node = ac->fail[node];
+    }
+}
+
+typedef struct {
+    Py_UCS4 ch;
+    Py_ssize_t node;
+} multireplace_edge;
+
+static int
+multireplace_compare_edges(const void *a, const void *b)
+{
+    Py_UCS4 x = ((const multireplace_edge *)a)->ch;
+    Py_UCS4 y = ((const multireplace_edge *)b)->ch;
+    return (x > y) - (x < y);
+}
+
+Py_LOCAL_INLINE(int)
+multireplace_build(multireplace_automaton *ac, Py_ssize_t count,
+                   Py_UCS4 *const *keys, const Py_ssize_t *lens)
+{
+    /* build the automaton for count non-empty keys; return -1 with an
+       exception set on failure */
+    Py_ssize_t i, k, node, child, nnodes, maxnodes = 1, head, tail;
+    Py_ssize_t *first_child = NULL, *next_sibling = NULL, *queue = NULL;
+    Py_UCS4 *node_char = NULL;
+    multireplace_edge *pairs = NULL;
+
+    memset(ac, 0, sizeof(*ac));
+    for (k = 0; k < count; k++) {
+        assert(lens[k] > 0);
+        if (maxnodes > PY_SSIZE_T_MAX / (Py_ssize_t)sizeof(Py_ssize_t) / 4
+                       - lens[k]) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        maxnodes += lens[k];
+    }
+
+    ac->edges = PyMem_New(Py_ssize_t, maxnodes + 1);
+    ac->edge_char = PyMem_New(Py_UCS4, maxnodes);
+    ac->edge_next = PyMem_New(Py_ssize_t, maxnodes);
+    ac->fail = PyMem_New(Py_ssize_t, maxnodes);
+    ac->depth = PyMem_New(Py_ssize_t, maxnodes);
+    ac->match = PyMem_New(Py_ssize_t, maxnodes);
+    ac->key_len = PyMem_New(Py_ssize_t, count ? count : 1);
+    first_child = PyMem_New(Py_ssize_t, maxnodes);
+    next_sibling = PyMem_New(Py_ssize_t, maxnodes);
+    node_char = PyMem_New(Py_UCS4, maxnodes);
+    queue = PyMem_New(Py_ssize_t, maxnodes);
+    pairs = PyMem_New(multireplace_edge, maxnodes);
+    if (ac->edges == NULL || ac->edge_char == NULL ||
+        ac->edge_next == NULL || ac->fail == NULL || ac->depth == NULL ||
+        ac->match == NULL || ac->key_len == NULL || first_child == NULL ||
+        next_sibling == NULL || node_char == NULL || queue == NULL ||
+        pairs == NULL)
+    {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    /* insert the keys in the trie, the children of a node are kept in a
+       linked list for now */
+    nnodes = 1;
+    first_child[0] = -1;
+    ac->depth[0] = 0;
+    ac->match[0] = -1;
+    for (k = 0; k < count; k++) {
+        ac->key_len[k] = lens[k];
+        node = 0;
+        for (i = 0; i < lens[k]; i++) {
+            Py_UCS4 ch = keys[k][i];
+            if (node == 0 && ch < 256) {
+                child = ac->root[ch] ? ac->root[ch] : -1;
+            }
+            else {
+                for (child = first_child[node]; child >= 0;
+                     child = next_sibling[child])
+                {
+                    if (node_char[child] == ch) {
+                        break;
+                    }
+                }
+            }
+            if (child < 0) {
+                child = nnodes++;
+                node_char[child] = ch;
+                first_child[child] = -1;
+                next_sibling[child] = first_child[node];
+                first_child[node] = child;
+                ac->depth[child] = i + 1;
+                ac->match[child] = -1;
+                if (node == 0 && ch < 256) {
+                    ac->root[ch] = child;
+                }
+            }
+            node = child;
+        }
+        ac->match[node] = k;
+    }
+    ac->nnodes = nnodes;
+
+    /* store the children of each node as a sorted array */
+    k = 0;
+    for (node = 0; node < nnodes; node++) {
+        Py_ssize_t n = 0;
+        ac->edges[node] = k;
+        for (child = first_child[node]; child >= 0;
+             child = next_sibling[child])
+        {
+            pairs[n].ch = node_char[child];
+            pairs[n].node = child;
+            n++;
+        }
+        qsort(pairs, n, sizeof(*pairs), multireplace_compare_edges);
+        for (i = 0; i < n; i++) {
+            ac->edge_char[k] = pairs[i].ch;
+            ac->edge_next[k] = pairs[i].node;
+            k++;
+        }
+    }
+    ac->edges[nnodes] = k;
+
+    /* compute the failure links in breadth-first order, so that the
+       failure link of a node is always known before its children */
+    head = tail = 0;
+    ac->fail[0] = 0;
+    queue[tail++] = 0;
+    while (head < tail) {
+        node = queue[head++];
+        for (i = ac->edges[node]; i < ac->edges[node + 1]; i++) {
+            Py_UCS4 ch = ac->edge_char[i];
+            Py_ssize_t f = ac->fail[node];
+            child = ac->edge_next[i];
+            if (node == 0) {
+                ac->fail[child] = 0;
+            }
+            else {
+                for (;;) {
+                    Py_ssize_t next = multireplace_goto(ac, f, ch);
+                    if (next >= 0) {
+                        ac->fail[child] = next;
+                        break;
+                    }
+                    if (f == 0) {
+                        ac->fail[child] = 0;
+                        break;
+                    }
+                    f = ac->fail[f];
+                }
+            }
+            if (ac->match[child] < 0) {
+                ac->match[child] = ac->match[ac->fail[child]];
+            }
+            queue[tail++] = child;
+        }
+    }
+
+    PyMem_Free(first_child);
+    PyMem_Free(next_sibling);
+    PyMem_Free(node_char);
+    PyMem_Free(queue);
+    PyMem_Free(pairs);
+    return 0;
+
+error:
+    PyMem_Free(first_child);
+    PyMem_Free(next_sibling);
+    PyMem_Free(node_char);
+    PyMem_Free(queue);
+    PyMem_Free(pairs);
+    multireplace_fini(ac);
+    return -1;
+}
+
+Py_LOCAL_INLINE(PyObject *)
+multireplace_items(PyObject *mapping)
+{
+    /* return the items of mapping as a list */
+    PyObject *items = PyMapping_Items(mapping);
+    if (items == NULL && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_TypeError,
+                     "replace_many() argument must be a mapping, not %T",
+                     mapping);
+    }
+    return items;
+}
+
+Py_LOCAL_INLINE(int)
+multireplace_add_match(multireplace_matches *matches, Py_ssize_t start,
+                       Py_ssize_t key)
+{
+    if (matches->count == matches->allocated) {
+        Py_ssize_t allocated = matches->allocated ? 2 * matches->allocated
+                                                  : 16;
+        Py_ssize_t *items = PyMem_Resize(matches->items, Py_ssize_t,
+                                         2 * allocated);
+        if (items == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        matches->items = items;
+        matches->allocated = allocated;
+    }
+    matches->items[2 * matches->count] = start;
+    matches->items[2 * matches->count + 1] = key;
+    matches->count++;
+    return 0;
+}
+
+#endif /* STRINGLIB_MULTIREPLACE_H */
+
+#if STRINGLIB_SIZEOF_CHAR == 1
+#  define MULTIREPLACE_ORD(ch) ((Py_UCS4)(unsigned char)(ch))
+#else
+#  define MULTIREPLACE_ORD(ch) ((Py_UCS4)(ch))
+#endif
+
+Py_LOCAL_INLINE(int)
+STRINGLIB(multireplace_find)(const multireplace_automaton *ac,
+                             const STRINGLIB_CHAR *s, Py_ssize_t n,
+                             multireplace_matches *matches)
+{
+    /* find all the non-overlapping leftmost-longest matches in s */
+    Py_ssize_t i = 0, j, node, key, start, best, best_start;
+
+    while (i < n) {
+        node = 0;
+        best = -1;
+        best_start = 0;
+        for (j = i; j < n; j++) {
+            Py_UCS4 ch = MULTIREPLACE_ORD(s[j]);
+            if (node == 0) {
+                /* skip the characters which do not start a key */
+                while (multireplace_goto(ac, 0, ch) < 0) {
+                    if (++j == n) {
+                        goto end;
+                    }
+                    ch = MULTIREPLACE_ORD(s[j]);
+                }
+            }
+            node = multireplace_next(ac, node, ch);
+            key = ac->match[node];
+            if (key >= 0) {
+                start = j + 1 - ac->key_len[key];
+                if (best < 0 || start <= best_start) {
+                    best = key;
+                    best_start = start;
+                }
+            }
+            if (best >= 0 && j + 1 - ac->depth[node] > best_start) {
+                /* no key which is still being matched starts at or
+                   before the best match */
+                break;
+            }
+        }
+    end:
+        if (best < 0) {
+            break;
+        }
+        if (multireplace_add_match(matches, best_start, best) < 0) {
+            return -1;
+        }
+        i = best_start + ac->key_len[best];
+    }
+    return 0;
+}
+
+#if !STRINGLIB_IS_UNICODE
+Py_LOCAL(PyObject *)
+STRINGLIB(replace_many)(PyObject *self, PyObject *mapping)
+{
+    /* replace_many() for bytes-like objects; the keys and values of the
+       mapping can be any bytes-like objects */
+    PyObject *items, *result = NULL;
+    Py_buffer *views = NULL;
+    Py_UCS4 **keys = NULL;
+    Py_ssize_t *lens = NULL;
+    Py_ssize_t count, nviews = 0, nkeys = 0, k, i, length, pos;
+    multireplace_automaton ac;
+    multireplace_matches matches = {NULL, 0, 0};
+    int built = 0;
+    const char *str;
+    char *out;
+
+    items = multireplace_items(mapping);
+    if (items == NULL) {
+        return NULL;
+    }
+    count = PyList_GET_SIZE(items);
+    views = PyMem_New(Py_buffer, 2 * count + 1);
+    keys = PyMem_New(Py_UCS4 *, count + 1);
+    lens = PyMem_New(Py_ssize_t, count + 1);
+    if (views == NULL || keys == NULL || lens == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (k = 0; k < count; k++) {
+        PyObject *item = PyList_GET_ITEM(items, k);
+        if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
+            PyErr_SetString(PyExc_TypeError,
+                            "mapping items must be key-value pairs");
+            goto done;
+        }
+        if (PyObject_GetBuffer(PyTuple_GET_ITEM(item, 0), &views[2 * k],
+                               PyBUF_SIMPLE) < 0) {
+            goto done;
+        }
+        nviews++;
+        if (PyObject_GetBuffer(PyTuple_GET_ITEM(item, 1), &views[2 * k + 1],
+                               PyBUF_SIMPLE) < 0) {
+            PyBuffer_Release(&views[2 * k]);
+            nviews--;
+            goto done;
+        }
+        nviews++;
+        lens[k] = views[2 * k].len;
+        if (lens[k] == 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "replace_many() keys must not be empty");
+            goto done;
+        }
+        keys[k] = PyMem_New(Py_UCS4, lens[k]);
+        if (keys[k] == NULL) {
+            PyErr_NoMemory();
+            goto done;
+        }
+        nkeys++;
+        for (i = 0; i < lens[k]; i++) {
+            keys[k][i] = ((unsigned char *)views[2 * k].buf)[i];
+        }
+    }
+
+    if (multireplace_build(&ac, count, keys, lens) < 0) {
+        goto done;
+    }
+    built = 1;
+
+    str = STRINGLIB_STR(self);
+    length = STRINGLIB_LEN(self);
+    if (STRINGLIB(multireplace_find)(&ac, str, length, &matches) < 0) {
+        goto done;
+    }
+    if (matches.count == 0) {
+#if !STRINGLIB_MUTABLE
+        if (STRINGLIB_CHECK_EXACT(self)) {
+            result = Py_NewRef(self);
+            goto done;
+        }
+#endif
+        result = STRINGLIB_NEW(str, length);
+        goto done;
+    }
+
+    for (i = 0; i < matches.count; i++) {
+        k = matches.items[2 * i + 1];
+        if (views[2 * k + 1].len - lens[k] > PY_SSIZE_T_MAX - length) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "replace bytes is too long");
+            goto done;
+        }
+        length += views[2 * k + 1].len - lens[k];
+    }
+    result = STRINGLIB_NEW(NULL, length);
+    if (result == NULL) {
+        goto done;
+    }
+    out = STRINGLIB_STR(result);
+    pos = 0;
+    for (i = 0; i < matches.count; i++) {
+        Py_ssize_t start = matches.items[2 * i];
+        k = matches.items[2 * i + 1];
+        memcpy(out, str + pos, start - pos);
+        out += start - pos;
+        memcpy(out, views[2 * k + 1].buf, views[2 * k + 1].len);
+        out += views[2 * k + 1].len;
+        pos = start + lens[k];
+    }
+    memcpy(out, str + pos, STRINGLIB_LEN(self) - pos);
+
+done:
+    if (built) {
+        multireplace_fini(&ac);
+    }
+    PyMem_Free(matches.items);
+    for (k = 0; k < nkeys; k++) {
+        PyMem_Free(keys[k]);
+    }
+    if (views != NULL) {
+        for (i = 0; i < nviews; i++) {
+            PyBuffer_Release(&views[i]);
+        }
+    }
+    PyMem_Free(views);
+    PyMem_Free(keys);
+    PyMem_Free(lens);
+    Py_DECREF(items);
+    return result;
+}
+#endif
+
+#undef MULTIREPLACE_ORD
@@ -932,6 +932,55 @@ build_string(SubString *input, PyObject *args, PyObject *kwargs,
     return _PyUnicodeWriter_Finish(&writer);
 }
 
+int
+_PyUnicodeWriter_WriteFormat(_PyUnicodeWriter *writer, PyObject *format,
+                             PyObject *args, PyObject *kwargs)
+{
+    SubString input;
+    AutoNumber auto_number;
+    Py_ssize_t pos = writer->pos;
+    Py_UCS4 maxchar = writer->maxchar;
+    int overallocate = writer->overallocate;
+    int result;
+
+    AutoNumber_Init(&auto_number);
+    SubString_init(&input, format, 0, PyUnicode_GET_LENGTH(format));
+    /* do_markup() disables the overallocation for the last write, but
+       the caller may write more */
+    result = do_markup(&input, args, kwargs, writer, 2, &auto_number);
+    writer->overallocate = overallocate;
+    if (result) {
+        return 0;
+    }
+
+    /* Remove the partial output.  If it widened the buffer (even within
+       the same kind, from ASCII to Latin-1), the remaining characters must
+       be copied to a new buffer of the right kind and maximum character. */
+    if (writer->maxchar == maxchar) {
+        writer->pos = pos;
+    }
+    else {
+        PyObject *exc = PyErr_GetRaisedException();
+        PyObject *str = _PyUnicodeWriter_Finish(writer);
+        PyObject *head = NULL;
+        if (str != NULL) {
+            head = PyUnicode_Substring(str, 0, pos);
+            Py_DECREF(str);
+        }
+        _PyUnicodeWriter_Init(writer);
+        writer->overallocate = overallocate;
+        if (head == NULL || _PyUnicodeWriter_WriteStr(writer, head) < 0) {
+            /* a memory error; the writer is empty */
+            Py_XDECREF(head);
+            Py_DECREF(exc);
+            return -1;
+        }
+        Py_DECREF(head);
+        PyErr_SetRaisedException(exc);
+    }
+    return -1;
+}
+
 /************************************************************************/
 /*********** main routine ***********************************************/
 /************************************************************************/
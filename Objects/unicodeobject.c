@@ -1060,6 +1060,7 @@ ensure_unicode(PyObject *obj)
 #include "stringlib/count.h"
 #include "stringlib/find.h"
 #include "stringlib/replace.h"
+#include "stringlib/multireplace.h"
 #include "stringlib/repr.h"
 #include "stringlib/find_max_char.h"
 #include "stringlib/undef.h"
@@ -1071,6 +1072,7 @@ ensure_unicode(PyObject *obj)
 #include "stringlib/count.h"
 #include "stringlib/find.h"
 #include "stringlib/replace.h"
+#include "stringlib/multireplace.h"
 #include "stringlib/repr.h"
 #include "stringlib/find_max_char.h"
 #include "stringlib/undef.h"
@@ -1082,6 +1084,7 @@ ensure_unicode(PyObject *obj)
 #include "stringlib/count.h"
 #include "stringlib/find.h"
 #include "stringlib/replace.h"
+#include "stringlib/multireplace.h"
 #include "stringlib/repr.h"
 #include "stringlib/find_max_char.h"
 #include "stringlib/undef.h"
@@ -5145,14 +5148,20 @@ find_first_nonascii(const unsigned char *start, const unsigned char *end)
 
     const unsigned char *p = start;
 
-    if (end - start >= SIZEOF_SIZE_T) {
+#if ASCII_SIMD
+    p = ascii_simd_skip(p, end);
+    if (end - p >= 16) {
+        return p - start;
+    }
+#endif
+    if (end - p >= SIZEOF_SIZE_T) {
         // Avoid unaligned read.
 #if PY_LITTLE_ENDIAN && HAVE_CTZ
         size_t u;
         memcpy(&u, p, sizeof(size_t));
         u &= ASCII_CHAR_MASK;
         if (u) {
-            return (ctz(u) - 7) / 8;
+            return p - start + (ctz(u) - 7) / 8;
         }
         p = _Py_ALIGN_DOWN(p + SIZEOF_SIZE_T, SIZEOF_SIZE_T);
 #else /* PY_LITTLE_ENDIAN && HAVE_CTZ */
@@ -5253,6 +5262,15 @@ utf8_count_codepoints(const unsigned char *s, const unsigned char *end)
 static Py_ssize_t
 ascii_decode(const char *start, const char *end, Py_UCS1 *dest)
 {
+#if ASCII_SIMD
+    /* Copy whole blocks whatever the alignment */
+    Py_ssize_t n = ascii_simd_widen1((const unsigned char *)start,
+                                     (const unsigned char *)end, dest);
+    Py_ssize_t pos = n + find_first_nonascii((const unsigned char*)start + n,
+                                             (const unsigned char*)end);
+    memcpy(dest + n, start + n, pos - n);
+    return pos;
+#else
 #if SIZEOF_SIZE_T <= SIZEOF_VOID_P
     if (_Py_IS_ALIGNED(start, ALIGNOF_SIZE_T)
         && _Py_IS_ALIGNED(dest, ALIGNOF_SIZE_T))
@@ -5281,6 +5299,7 @@ ascii_decode(const char *start, const char *end, Py_UCS1 *dest)
                                          (const unsigned char*)end);
     memcpy(dest, start, pos);
     return pos;
+#endif
 }
 
 static int
@@ -12876,6 +12895,135 @@ unicode_replace_impl(PyObject *self, PyObject *old, PyObject *new,
     return replace(self, old, new, count);
 }
 
+/*[clinic input]
+str.replace_many as unicode_replace_many
+
+    mapping: object
+    /
+
+Return a copy with occurrences of the keys of mapping replaced by its values.
+
+The string is scanned once from left to right.  Where several keys match,
+the one starting first is replaced, and of those starting at the same
+position the longest one.  Replacements are not scanned again.
+[clinic start generated code]*/
+
+static PyObject *
+unicode_replace_many(PyObject *self, PyObject *mapping)
+/*[clinic end generated code: output=0ffce5d2ffd095e3 input=084e60c056cbada9]*/
+{
+    PyObject *items, *result = NULL;
+    Py_UCS4 **keys = NULL;
+    Py_ssize_t *lens = NULL;
+    Py_ssize_t count, nkeys = 0, k, i, pos, length;
+    multireplace_automaton ac;
+    multireplace_matches matches = {NULL, 0, 0};
+    PyUnicodeWriter *writer;
+    int res;
+
+    items = multireplace_items(mapping);
+    if (items == NULL) {
+        return NULL;
+    }
+    count = PyList_GET_SIZE(items);
+    keys = PyMem_New(Py_UCS4 *, count + 1);
+    lens = PyMem_New(Py_ssize_t, count + 1);
+    if (keys == NULL || lens == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (k = 0; k < count; k++) {
+        PyObject *item = PyList_GET_ITEM(items, k);
+        PyObject *key, *value;
+        if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
+            PyErr_SetString(PyExc_TypeError,
+                            "mapping items must be key-value pairs");
+            goto done;
+        }
+        key = PyTuple_GET_ITEM(item, 0);
+        value = PyTuple_GET_ITEM(item, 1);
+        if (!PyUnicode_Check(key) || !PyUnicode_Check(value)) {
+            PyErr_Format(PyExc_TypeError,
+                         "replace_many() keys and values must be str, "
+                         "not %T and %T", key, value);
+            goto done;
+        }
+        lens[k] = PyUnicode_GET_LENGTH(key);
+        if (lens[k] == 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "replace_many() keys must not be empty");
+            goto done;
+        }
+        keys[k] = PyUnicode_AsUCS4Copy(key);
+        if (keys[k] == NULL) {
+            goto done;
+        }
+        nkeys++;
+    }
+
+    if (multireplace_build(&ac, count, keys, lens) < 0) {
+        goto done;
+    }
+    length = PyUnicode_GET_LENGTH(self);
+    switch (PyUnicode_KIND(self)) {
+    case PyUnicode_1BYTE_KIND:
+        res = ucs1lib_multireplace_find(&ac, PyUnicode_1BYTE_DATA(self),
+                                        length, &matches);
+        break;
+    case PyUnicode_2BYTE_KIND:
+        res = ucs2lib_multireplace_find(&ac, PyUnicode_2BYTE_DATA(self),
+                                        length, &matches);
+        break;
+    default:
+        assert(PyUnicode_KIND(self) == PyUnicode_4BYTE_KIND);
+        res = ucs4lib_multireplace_find(&ac, PyUnicode_4BYTE_DATA(self),
+                                        length, &matches);
+        break;
+    }
+    multireplace_fini(&ac);
+    if (res < 0) {
+        goto done;
+    }
+    if (matches.count == 0) {
+        result = unicode_result_unchanged(self);
+        goto done;
+    }
+
+    writer = PyUnicodeWriter_Create(length);
+    if (writer == NULL) {
+        goto done;
+    }
+    pos = 0;
+    for (i = 0; i < matches.count; i++) {
+        Py_ssize_t start = matches.items[2 * i];
+        PyObject *item = PyList_GET_ITEM(items, matches.items[2 * i + 1]);
+        PyObject *value = PyTuple_GET_ITEM(item, 1);
+        if (PyUnicodeWriter_WriteSubstring(writer, self, pos, start) < 0 ||
+            PyUnicodeWriter_WriteSubstring(writer, value, 0,
+                                           PyUnicode_GET_LENGTH(value)) < 0)
+        {
+            PyUnicodeWriter_Discard(writer);
+            goto done;
+        }
+        pos = start + lens[matches.items[2 * i + 1]];
+    }
+    if (PyUnicodeWriter_WriteSubstring(writer, self, pos, length) < 0) {
+        PyUnicodeWriter_Discard(writer);
+        goto done;
+    }
+    result = PyUnicodeWriter_Finish(writer);
+
+done:
+    PyMem_Free(matches.items);
+    for (k = 0; k < nkeys; k++) {
+        PyMem_Free(keys[k]);
+    }
+    PyMem_Free(keys);
+    PyMem_Free(lens);
+    Py_DECREF(items);
+    return result;
+}
+
 /*[clinic input]
 str.removeprefix as unicode_removeprefix
 
@@ -14273,6 +14421,7 @@ unicode_getnewargs(PyObject *v, PyObject *Py_UNUSED(ignored))
 static PyMethodDef unicode_methods[] = {
     UNICODE_ENCODE_METHODDEF
     UNICODE_REPLACE_METHODDEF
+    UNICODE_REPLACE_MANY_METHODDEF
     UNICODE_SPLIT_METHODDEF
     UNICODE_RSPLIT_METHODDEF
     UNICODE_JOIN_METHODDEF
@@ -19,8 +19,10 @@ extern PyObject* PyInit__operator(void);
 extern PyObject* PyInit__signal(void);
 extern PyObject* PyInit__statistics(void);
 extern PyObject* PyInit__sysconfig(void);
+extern PyObject* PyInit__tomllib(void);
 extern PyObject* PyInit__types(void);
 extern PyObject* PyInit__typing(void);
+extern PyObject* PyInit__urlparse(void);
 extern PyObject* PyInit_time(void);
 extern PyObject* PyInit__thread(void);
 
@@ -47,6 +49,7 @@ extern PyObject* PyInit__interpqueues(void);
 extern PyObject* PyInit__random(void);
 extern PyObject* PyInit_itertools(void);
 extern PyObject* PyInit__collections(void);
+extern PyObject* PyInit__copy(void);
 extern PyObject* PyInit__heapq(void);
 extern PyObject* PyInit__bisect(void);
 extern PyObject* PyInit__symtable(void);
@@ -108,8 +111,10 @@ struct _inittab _PyImport_Inittab[] = {
     {"time", PyInit_time},
     {"_thread", PyInit__thread},
     {"_tokenize", PyInit__tokenize},
+    {"_tomllib", PyInit__tomllib},
     {"_types", PyInit__types},
     {"_typing", PyInit__typing},
+    {"_urlparse", PyInit__urlparse},
     {"_statistics", PyInit__statistics},
 
     /* cryptographic hash functions */
@@ -137,6 +142,7 @@ struct _inittab _PyImport_Inittab[] = {
     {"_lsprof", PyInit__lsprof},
     {"itertools", PyInit_itertools},
     {"_collections", PyInit__collections},
+    {"_copy", PyInit__copy},
     {"_symtable", PyInit__symtable},
 #if defined(MS_WINDOWS_DESKTOP) || defined(MS_WINDOWS_GAMES)
     {"mmap", PyInit_mmap},
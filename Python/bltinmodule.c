@@ -2564,21 +2564,24 @@ sorted as builtin_sorted
     iterable as seq: object
     key as keyfunc: object = None
     reverse: object = False
+    workers: object = 1
 
 Return a new list containing all items from the iterable in ascending order.
 
 A custom key function can be supplied to customize the sort order, and the
-reverse flag can be set to request the result in descending order.
+reverse flag can be set to request the result in descending order.  See
+list.sort() for workers.
 [end disabled clinic input]*/
 
 PyDoc_STRVAR(builtin_sorted__doc__,
-"sorted($module, iterable, /, *, key=None, reverse=False)\n"
+"sorted($module, iterable, /, *, key=None, reverse=False, workers=1)\n"
 "--\n"
 "\n"
 "Return a new list containing all items from the iterable in ascending order.\n"
 "\n"
 "A custom key function can be supplied to customize the sort order, and the\n"
-"reverse flag can be set to request the result in descending order.");
+"reverse flag can be set to request the result in descending order.  See\n"
+"list.sort() for workers.");
 
 #define BUILTIN_SORTED_METHODDEF    \
     {"sorted", _PyCFunction_CAST(builtin_sorted), METH_FASTCALL | METH_KEYWORDS, builtin_sorted__doc__},
@@ -1304,6 +1304,86 @@ sys__clear_internal_caches(PyObject *module, PyObject *Py_UNUSED(ignored))
     return sys__clear_internal_caches_impl(module);
 }
 
+PyDoc_STRVAR(sys__get_runtime_stats__doc__,
+"_get_runtime_stats($module, /)\n"
+"--\n"
+"\n"
+"Return a dict of always-on specialization and optimizer statistics.\n"
+"\n"
+"The \"specialization\" key maps each specializable instruction to its\n"
+"number of successful and failed specialization attempts, and a tuple of\n"
+"failure counts indexed by failure kind.  The \"optimizer\" key holds counts\n"
+"of tier 2 optimizer attempts, executors created and invalidated, and the\n"
+"memory used by JIT-compiled code.\n"
+"\n"
+"The statistics are process-wide and approximate in the free-threaded build.");
+
+#define SYS__GET_RUNTIME_STATS_METHODDEF    \
+    {"_get_runtime_stats", (PyCFunction)sys__get_runtime_stats, METH_NOARGS, sys__get_runtime_stats__doc__},
+
+static PyObject *
+sys__get_runtime_stats_impl(PyObject *module);
+
+static PyObject *
+sys__get_runtime_stats(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return sys__get_runtime_stats_impl(module);
+}
+
+PyDoc_STRVAR(sys__clear_runtime_stats__doc__,
+"_clear_runtime_stats($module, /)\n"
+"--\n"
+"\n"
+"Reset the statistics returned by sys._get_runtime_stats().");
+
+#define SYS__CLEAR_RUNTIME_STATS_METHODDEF    \
+    {"_clear_runtime_stats", (PyCFunction)sys__clear_runtime_stats, METH_NOARGS, sys__clear_runtime_stats__doc__},
+
+static PyObject *
+sys__clear_runtime_stats_impl(PyObject *module);
+
+static PyObject *
+sys__clear_runtime_stats(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return sys__clear_runtime_stats_impl(module);
+}
+
+PyDoc_STRVAR(sys__get_warmup_profile__doc__,
+"_get_warmup_profile($module, /)\n"
+"--\n"
+"\n"
+"Return the warm-up profile of the tier 2 optimizer.\n"
+"\n"
+"The profile is a list of (filename, qualname, firstlineno, offset) tuples\n"
+"identifying the loops for which an executor was created.  Return None if\n"
+"no profile is active.");
+
+#define SYS__GET_WARMUP_PROFILE_METHODDEF    \
+    {"_get_warmup_profile", (PyCFunction)sys__get_warmup_profile, METH_NOARGS, sys__get_warmup_profile__doc__},
+
+static PyObject *
+sys__get_warmup_profile_impl(PyObject *module);
+
+static PyObject *
+sys__get_warmup_profile(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return sys__get_warmup_profile_impl(module);
+}
+
+PyDoc_STRVAR(sys__set_warmup_profile__doc__,
+"_set_warmup_profile($module, profile, /)\n"
+"--\n"
+"\n"
+"Replace the warm-up profile of the tier 2 optimizer.\n"
+"\n"
+"Loops of code objects created afterwards that are listed in the profile are\n"
+"optimized after a few iterations instead of waiting for their warm-up\n"
+"counters to expire, and new hot loops are added to the profile.  Pass None\n"
+"to deactivate the profile.");
+
+#define SYS__SET_WARMUP_PROFILE_METHODDEF    \
+    {"_set_warmup_profile", (PyCFunction)sys__set_warmup_profile, METH_O, sys__set_warmup_profile__doc__},
+
 PyDoc_STRVAR(sys_is_finalizing__doc__,
 "is_finalizing($module, /)\n"
 "--\n"
@@ -1864,4 +1944,4 @@ exit:
 #ifndef SYS_GETANDROIDAPILEVEL_METHODDEF
     #define SYS_GETANDROIDAPILEVEL_METHODDEF
 #endif /* !defined(SYS_GETANDROIDAPILEVEL_METHODDEF) */
-/*[clinic end generated code: output=1aca52cefbeb800f input=a9049054013a1b77]*/
+/*[clinic end generated code: output=c1ffa16674e8d343 input=a9049054013a1b77]*/
@@ -185,6 +185,7 @@ static const PyConfigSpec PYCONFIG_SPEC[] = {
     SPEC(use_system_logger, BOOL, READ_ONLY, NO_SYS),
 #endif
     SPEC(user_site_directory, BOOL, READ_ONLY, NO_SYS),  // sys.flags.no_user_site
+    SPEC(warmup_profile, WSTR_OPT, READ_ONLY, NO_SYS),
     SPEC(warn_default_encoding, BOOL, READ_ONLY, NO_SYS),
 
     // --- Init-only options -----------
@@ -444,6 +445,8 @@ static const char usage_envvars[] =
 "PYTHONUNBUFFERED: disable stdout/stderr buffering (-u)\n"
 "PYTHONUTF8      : control the UTF-8 mode (-X utf8)\n"
 "PYTHONVERBOSE   : trace import statements (-v)\n"
+"PYTHON_WARMUP_PROFILE: file to load the warm-up profile of the tier 2\n"
+"                  optimizer from at startup and to save it to at exit\n"
 "PYTHONWARNDEFAULTENCODING: enable opt-in EncodingWarning for 'encoding=None'\n"
 "                  (-X warn_default_encoding)\n"
 "PYTHONWARNINGS  : warning control (-W)\n"
@@ -989,6 +992,7 @@ PyConfig_Clear(PyConfig *config)
     CLEAR(config->run_module);
     CLEAR(config->run_filename);
     CLEAR(config->check_hash_pycs_mode);
+    CLEAR(config->warmup_profile);
 #ifdef Py_DEBUG
     CLEAR(config->run_presite);
 #endif
@@ -1881,6 +1885,15 @@ config_read_env_vars(PyConfig *config)
         }
     }
 
+    if (config->warmup_profile == NULL) {
+        status = CONFIG_GET_ENV_DUP(config, &config->warmup_profile,
+                                    L"PYTHON_WARMUP_PROFILE",
+                                    "PYTHON_WARMUP_PROFILE");
+        if (_PyStatus_EXCEPTION(status)) {
+            return status;
+        }
+    }
+
     if (config->pythonpath_env == NULL) {
         status = CONFIG_GET_ENV_DUP(config, &config->pythonpath_env,
                                     L"PYTHONPATH", "PYTHONPATH");
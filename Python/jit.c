@@ -96,6 +96,7 @@ jit_free(unsigned char *memory, size_t size)
         return -1;
     }
     OPT_STAT_ADD(jit_freed_memory_size, size);
+    RUNTIME_OPT_STAT_ADD(jit_freed_memory_size, size);
     return 0;
 }
 
@@ -536,6 +537,9 @@ _PyJIT_Compile(_PyExecutorObject *executor, const _PyUOpInstruction trace[], siz
     OPT_STAT_ADD(jit_data_size, data_size);
     OPT_STAT_ADD(jit_padding_size, padding);
     OPT_HIST(total_size, trace_total_memory_hist);
+    RUNTIME_OPT_STAT_INC(jit_compilations);
+    RUNTIME_OPT_STAT_ADD(jit_total_memory_size, total_size);
+    RUNTIME_OPT_STAT_ADD(jit_code_size, code_size);
     // Update the offsets of each instruction:
     for (size_t i = 0; i < length; i++) {
         state.instruction_starts[i] += (uintptr_t)memory;
@@ -14,10 +14,12 @@
 #include "pycore_opcode_utils.h"  // MAX_REAL_OPCODE
 #include "pycore_optimizer.h"     // _Py_uop_analyze_and_optimize()
 #include "pycore_pystate.h"       // _PyInterpreterState_GET()
+#include "pycore_setobject.h"     // _PySet_NextEntry()
 #include "pycore_tuple.h" // _PyTuple_FromArraySteal
 #include "pycore_unicodeobject.h" // _PyUnicode_FromASCII
 #include "pycore_uop_ids.h"
 #include "pycore_jit.h"
+#include "marshal.h"              // PyMarshal_ReadObjectFromFile()
 #include <stdbool.h>
 #include <stdint.h>
 #include <stddef.h>
@@ -106,6 +108,10 @@ uop_optimize(_PyInterpreterFrame *frame, _Py_CODEUNIT *instr,
              _PyExecutorObject **exec_ptr, int curr_stackentries,
              bool progress_needed);
 
+static void
+warmup_profile_record(PyInterpreterState *interp, PyCodeObject *code,
+                      int index);
+
 /* Returns 1 if optimized, 0 if not optimized, and -1 for an error.
  * If optimized, *executor_ptr contains a new reference to the executor
  */
@@ -145,6 +151,10 @@ _PyOptimizer_Optimize(
             return 0;
         }
         insert_executor(code, start, index, *executor_ptr);
+        PyInterpreterState *interp = _PyInterpreterState_GET();
+        if (interp->warmup_profile != NULL) {
+            warmup_profile_record(interp, code, (*executor_ptr)->vm_data.index);
+        }
     }
     else {
         (*executor_ptr)->vm_data.code = NULL;
@@ -1212,6 +1222,7 @@ uop_optimize(
     _Py_BloomFilter_Init(&dependencies);
     _PyUOpInstruction buffer[UOP_MAX_TRACE_LENGTH];
     OPT_STAT_INC(attempts);
+    RUNTIME_OPT_STAT_INC(optimizer_attempts);
     int length = translate_bytecode_to_trace(frame, instr, buffer, UOP_MAX_TRACE_LENGTH, &dependencies, progress_needed);
     if (length <= 0) {
         // Error or nothing translated
@@ -1250,6 +1261,7 @@ uop_optimize(
     if (executor == NULL) {
         return -1;
     }
+    RUNTIME_OPT_STAT_INC(executors_created);
     assert(length <= UOP_MAX_TRACE_LENGTH);
     *exec_ptr = executor;
     return 1;
@@ -1487,6 +1499,7 @@ _Py_Executors_InvalidateDependency(PyInterpreterState *interp, void *obj, int is
         executor_clear(exec);
         if (is_invalidation) {
             OPT_STAT_INC(executors_invalidated);
+            RUNTIME_OPT_STAT_INC(executors_invalidated);
         }
     }
     Py_DECREF(invalidate);
@@ -1514,6 +1527,7 @@ _Py_Executors_InvalidateAll(PyInterpreterState *interp, int is_invalidation)
         }
         if (is_invalidation) {
             OPT_STAT_INC(executors_invalidated);
+            RUNTIME_OPT_STAT_INC(executors_invalidated);
         }
     }
 }
@@ -1674,6 +1688,317 @@ _PyDumpExecutors(FILE *out)
     return 0;
 }
 
+
+/*****************************************
+ *        Warm-up profile
+ *****************************************/
+
+/* The warm-up profile records the loops for which an executor was created,
+ * so that another process running the same code can prime the warm-up
+ * counters of these loops and optimize them after a few iterations instead
+ * of JUMP_BACKWARD_INITIAL_VALUE iterations.
+ *
+ * interp->warmup_profile maps (co_filename, co_qualname, co_firstlineno)
+ * keys to sets of byte offsets.  It is NULL unless a profile was activated,
+ * in which case loops are both recorded and primed.  A profile is exported
+ * and imported as a list of (filename, qualname, firstlineno, offset)
+ * tuples, see sys._get_warmup_profile() and sys._set_warmup_profile().
+ * Entries that no longer match the code (for example after an edit) are
+ * ignored.
+ *
+ * If PyConfig.warmup_profile is set (PYTHON_WARMUP_PROFILE environment
+ * variable), the profile is loaded from that file at startup and saved back
+ * to it at exit.
+ */
+
+/* Number of iterations after which a loop found in the profile is
+ * optimized.  Leaves enough time for the loop body to be specialized. */
+#define WARMUP_PROFILE_INITIAL_VALUE 16
+
+static PyObject *
+warmup_profile_key(PyCodeObject *code)
+{
+    return Py_BuildValue("(OOi)", code->co_filename, code->co_qualname,
+                         code->co_firstlineno);
+}
+
+static int
+warmup_profile_add(PyObject *profile, PyObject *key, PyObject *offset)
+{
+    PyObject *offsets;
+    if (PyDict_GetItemRef(profile, key, &offsets) < 0) {
+        return -1;
+    }
+    if (offsets == NULL) {
+        offsets = PySet_New(NULL);
+        if (offsets == NULL) {
+            return -1;
+        }
+        if (PyDict_SetItem(profile, key, offsets) < 0) {
+            Py_DECREF(offsets);
+            return -1;
+        }
+    }
+    int res = PySet_Add(offsets, offset);
+    Py_DECREF(offsets);
+    return res;
+}
+
+static void
+warmup_profile_record(PyInterpreterState *interp, PyCodeObject *code,
+                      int index)
+{
+    PyObject *key = NULL, *offset = NULL;
+    PyObject *exc = PyErr_GetRaisedException();
+    key = warmup_profile_key(code);
+    if (key == NULL) {
+        goto done;
+    }
+    offset = PyLong_FromSsize_t(index * (Py_ssize_t)sizeof(_Py_CODEUNIT));
+    if (offset == NULL) {
+        goto done;
+    }
+    (void)warmup_profile_add(interp->warmup_profile, key, offset);
+done:
+    // The profile is only a hint: never fail because of it.
+    PyErr_Clear();
+    Py_XDECREF(key);
+    Py_XDECREF(offset);
+    PyErr_SetRaisedException(exc);
+}
+
+/* Prime the warm-up counters of the loops of a new code object that are
+ * listed in the warm-up profile. */
+void
+_Py_WarmupProfile_Apply(PyInterpreterState *interp, PyCodeObject *code)
+{
+    PyObject *offsets = NULL;
+    PyObject *exc = PyErr_GetRaisedException();
+    PyObject *key = warmup_profile_key(code);
+    if (key == NULL) {
+        goto done;
+    }
+    if (PyDict_GetItemRef(interp->warmup_profile, key, &offsets) <= 0) {
+        goto done;
+    }
+    _Py_CODEUNIT *instructions = _PyCode_CODE(code);
+    Py_ssize_t size = Py_SIZE(code);
+    Py_ssize_t pos = 0;
+    PyObject *item;
+    Py_hash_t hash;
+    while (_PySet_NextEntry(offsets, &pos, &item, &hash)) {
+        Py_ssize_t offset = PyLong_AsSsize_t(item);
+        if (offset < 0 || offset % sizeof(_Py_CODEUNIT)) {
+            PyErr_Clear();
+            continue;
+        }
+        Py_ssize_t i = offset / sizeof(_Py_CODEUNIT);
+        while (i < size && instructions[i].op.code == EXTENDED_ARG) {
+            i++;
+        }
+        if (i + 1 < size && instructions[i].op.code == JUMP_BACKWARD) {
+            instructions[i + 1].counter = make_backoff_counter(
+                WARMUP_PROFILE_INITIAL_VALUE, JUMP_BACKWARD_INITIAL_BACKOFF);
+        }
+    }
+done:
+    PyErr_Clear();
+    Py_XDECREF(key);
+    Py_XDECREF(offsets);
+    PyErr_SetRaisedException(exc);
+}
+
+PyObject *
+_Py_WarmupProfile_Get(PyInterpreterState *interp)
+{
+    if (interp->warmup_profile == NULL) {
+        Py_RETURN_NONE;
+    }
+    PyObject *res = PyList_New(0);
+    if (res == NULL) {
+        return NULL;
+    }
+    Py_ssize_t pos = 0;
+    PyObject *key, *offsets;
+    while (PyDict_Next(interp->warmup_profile, &pos, &key, &offsets)) {
+        Py_ssize_t setpos = 0;
+        PyObject *offset;
+        Py_hash_t hash;
+        while (_PySet_NextEntry(offsets, &setpos, &offset, &hash)) {
+            PyObject *entry = Py_BuildValue(
+                "(OOOO)", PyTuple_GET_ITEM(key, 0), PyTuple_GET_ITEM(key, 1),
+                PyTuple_GET_ITEM(key, 2), offset);
+            if (entry == NULL) {
+                Py_DECREF(res);
+                return NULL;
+            }
+            int err = PyList_Append(res, entry);
+            Py_DECREF(entry);
+            if (err < 0) {
+                Py_DECREF(res);
+                return NULL;
+            }
+        }
+    }
+    return res;
+}
+
+int
+_Py_WarmupProfile_Set(PyInterpreterState *interp, PyObject *entries)
+{
+    if (entries == Py_None) {
+        Py_CLEAR(interp->warmup_profile);
+        return 0;
+    }
+    PyObject *profile = PyDict_New();
+    if (profile == NULL) {
+        return -1;
+    }
+    PyObject *iter = PyObject_GetIter(entries);
+    if (iter == NULL) {
+        goto error;
+    }
+    PyObject *entry;
+    while ((entry = PyIter_Next(iter)) != NULL) {
+        if (!PyTuple_Check(entry) || PyTuple_GET_SIZE(entry) != 4
+            || !PyUnicode_Check(PyTuple_GET_ITEM(entry, 0))
+            || !PyUnicode_Check(PyTuple_GET_ITEM(entry, 1))
+            || !PyLong_Check(PyTuple_GET_ITEM(entry, 2))
+            || !PyLong_Check(PyTuple_GET_ITEM(entry, 3)))
+        {
+            PyErr_Format(PyExc_TypeError,
+                         "warm-up profile entries must be "
+                         "(filename, qualname, firstlineno, offset) tuples, "
+                         "not %R", entry);
+            Py_DECREF(entry);
+            Py_DECREF(iter);
+            goto error;
+        }
+        PyObject *key = PyTuple_GetSlice(entry, 0, 3);
+        int err = key == NULL ? -1 : warmup_profile_add(
+            profile, key, PyTuple_GET_ITEM(entry, 3));
+        Py_XDECREF(key);
+        Py_DECREF(entry);
+        if (err < 0) {
+            Py_DECREF(iter);
+            goto error;
+        }
+    }
+    Py_DECREF(iter);
+    if (PyErr_Occurred()) {
+        goto error;
+    }
+    Py_XSETREF(interp->warmup_profile, profile);
+    return 0;
+
+error:
+    Py_DECREF(profile);
+    return -1;
+}
+
+static PyObject *
+warmup_profile_path(PyInterpreterState *interp)
+{
+    const wchar_t *path = _PyInterpreterState_GetConfig(interp)->warmup_profile;
+    if (path == NULL || *path == L'\0') {
+        return NULL;
+    }
+    return PyUnicode_FromWideChar(path, -1);
+}
+
+void
+_Py_WarmupProfile_Load(PyInterpreterState *interp)
+{
+    PyObject *entries = NULL;
+    PyObject *path = warmup_profile_path(interp);
+    if (path == NULL) {
+        goto done;
+    }
+    FILE *fp = Py_fopen(path, "rb");
+    if (fp == NULL) {
+        if (!PyErr_ExceptionMatches(PyExc_FileNotFoundError)) {
+            goto done;
+        }
+        // No profile has been saved yet: start recording one
+        PyErr_Clear();
+        entries = PyList_New(0);
+    }
+    else {
+        entries = PyMarshal_ReadObjectFromFile(fp);
+        fclose(fp);
+    }
+    if (entries == NULL) {
+        goto done;
+    }
+    (void)_Py_WarmupProfile_Set(interp, entries);
+done:
+    if (PyErr_Occurred()) {
+        PyErr_FormatUnraisable("Exception ignored while loading "
+                               "the warm-up profile %R", path);
+    }
+    if (path != NULL && interp->warmup_profile == NULL) {
+        // Record a new profile, replacing the unreadable one at exit
+        interp->warmup_profile = PyDict_New();
+        PyErr_Clear();
+    }
+    Py_XDECREF(path);
+    Py_XDECREF(entries);
+}
+
+void
+_Py_WarmupProfile_Save(PyInterpreterState *interp)
+{
+    PyObject *entries = NULL, *os = NULL, *pid = NULL, *tmppath = NULL;
+    PyObject *res = NULL;
+    PyObject *path = warmup_profile_path(interp);
+    if (path == NULL) {
+        goto done;
+    }
+    if (interp->warmup_profile == NULL) {
+        goto done;
+    }
+    entries = _Py_WarmupProfile_Get(interp);
+    if (entries == NULL) {
+        goto done;
+    }
+    /* Several processes may share the same profile: write to a temporary
+       file and atomically replace the profile. */
+    os = PyImport_ImportModule("os");
+    if (os == NULL) {
+        goto done;
+    }
+    pid = PyObject_CallMethod(os, "getpid", NULL);
+    if (pid == NULL) {
+        goto done;
+    }
+    tmppath = PyUnicode_FromFormat("%U.%S.tmp", path, pid);
+    if (tmppath == NULL) {
+        goto done;
+    }
+    FILE *fp = Py_fopen(tmppath, "wb");
+    if (fp == NULL) {
+        goto done;
+    }
+    PyMarshal_WriteObjectToFile(entries, fp, Py_MARSHAL_VERSION);
+    int failed = ferror(fp);
+    if (fclose(fp) != 0 || failed) {
+        PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, tmppath);
+        goto done;
+    }
+    res = PyObject_CallMethod(os, "replace", "OO", tmppath, path);
+done:
+    if (PyErr_Occurred()) {
+        PyErr_FormatUnraisable("Exception ignored while saving "
+                               "the warm-up profile %R", path);
+    }
+    Py_XDECREF(path);
+    Py_XDECREF(entries);
+    Py_XDECREF(os);
+    Py_XDECREF(pid);
+    Py_XDECREF(tmppath);
+    Py_XDECREF(res);
+}
+
 #else
 
 int
@@ -1683,4 +2008,18 @@ _PyDumpExecutors(FILE *out)
     return -1;
 }
 
+PyObject *
+_Py_WarmupProfile_Get(PyInterpreterState *interp)
+{
+    PyErr_SetString(PyExc_NotImplementedError, "No JIT available");
+    return NULL;
+}
+
+int
+_Py_WarmupProfile_Set(PyInterpreterState *interp, PyObject *entries)
+{
+    PyErr_SetString(PyExc_NotImplementedError, "No JIT available");
+    return -1;
+}
+
 #endif /* _Py_TIER2 */
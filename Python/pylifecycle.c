@@ -1289,6 +1289,10 @@ init_interp_main(PyThreadState *tstate)
         Py_XDECREF(warnoptions);
 
         interp->runtime->initialized = 1;
+
+        // Load the profile before the site module and the application
+        // are imported, so that their code objects can be primed.
+        _Py_WarmupProfile_Load(interp);
     }
 
     if (config->site_import) {
@@ -2027,6 +2031,8 @@ _Py_Finalize(_PyRuntimeState *runtime)
 
     _PyAtExit_Call(tstate->interp);
 
+    _Py_WarmupProfile_Save(tstate->interp);
+
     assert(_PyThreadState_GET() == tstate);
 
     /* Copy the core config, PyInterpreterState_Delete() free
@@ -441,15 +441,168 @@ do { \
     if (_Py_stats) { \
         _Py_stats->opcode_stats[opcode].specialization.failure_kinds[kind]++; \
     } \
+    RUNTIME_SPEC_FAIL(opcode, kind); \
 } while (0)
 
 #endif  // Py_STATS
 
 
 #ifndef SPECIALIZATION_FAIL
-#  define SPECIALIZATION_FAIL(opcode, kind) ((void)0)
+#  define SPECIALIZATION_FAIL(opcode, kind) RUNTIME_SPEC_FAIL(opcode, kind)
 #endif
 
+/* Always-on statistics, see pycore_stats.h */
+
+_PyRuntimeStats _Py_runtime_stats;
+
+#ifdef Py_STATS
+static_assert(_Py_RUNTIME_STATS_FAILURE_KINDS == SPECIALIZATION_FAILURE_KINDS,
+              "failure kinds must match between the runtime and pystats");
+#endif
+
+#define ADD_STAT_TO_DICT(res, stats, field) \
+    do { \
+        PyObject *val = PyLong_FromUnsignedLongLong( \
+            FT_ATOMIC_LOAD_UINT64_RELAXED((stats)->field)); \
+        if (val == NULL) { \
+            goto error; \
+        } \
+        int err = PyDict_SetItemString(res, #field, val); \
+        Py_DECREF(val); \
+        if (err < 0) { \
+            goto error; \
+        } \
+    } while (0)
+
+static PyObject *
+runtime_spec_stats_to_dict(_PyRuntimeSpecializationStats *stats)
+{
+    PyObject *res = PyDict_New();
+    if (res == NULL) {
+        return NULL;
+    }
+    ADD_STAT_TO_DICT(res, stats, success);
+    ADD_STAT_TO_DICT(res, stats, failure);
+    PyObject *failure_kinds = PyTuple_New(_Py_RUNTIME_STATS_FAILURE_KINDS);
+    if (failure_kinds == NULL) {
+        goto error;
+    }
+    for (int i = 0; i < _Py_RUNTIME_STATS_FAILURE_KINDS; i++) {
+        PyObject *stat = PyLong_FromUnsignedLongLong(
+            FT_ATOMIC_LOAD_UINT64_RELAXED(stats->failure_kinds[i]));
+        if (stat == NULL) {
+            Py_DECREF(failure_kinds);
+            goto error;
+        }
+        PyTuple_SET_ITEM(failure_kinds, i, stat);
+    }
+    int err = PyDict_SetItemString(res, "failure_kinds", failure_kinds);
+    Py_DECREF(failure_kinds);
+    if (err < 0) {
+        goto error;
+    }
+    return res;
+
+error:
+    Py_DECREF(res);
+    return NULL;
+}
+
+static PyObject *
+runtime_opt_stats_to_dict(_PyRuntimeStats *stats)
+{
+    PyObject *res = PyDict_New();
+    if (res == NULL) {
+        return NULL;
+    }
+    ADD_STAT_TO_DICT(res, stats, optimizer_attempts);
+    ADD_STAT_TO_DICT(res, stats, executors_created);
+    ADD_STAT_TO_DICT(res, stats, executors_invalidated);
+    ADD_STAT_TO_DICT(res, stats, jit_compilations);
+    ADD_STAT_TO_DICT(res, stats, jit_total_memory_size);
+    ADD_STAT_TO_DICT(res, stats, jit_code_size);
+    ADD_STAT_TO_DICT(res, stats, jit_freed_memory_size);
+    return res;
+
+error:
+    Py_DECREF(res);
+    return NULL;
+}
+#undef ADD_STAT_TO_DICT
+
+/* Return a dictionary with two keys:
+ *
+ * "specialization": maps the name of each instruction family for which a
+ *     specialization was attempted to a dict of "success", "failure" and
+ *     "failure_kinds" counts.
+ * "optimizer": counters of the tier 2 optimizer and the JIT compiler.
+ */
+PyObject *
+_Py_GetRuntimeStats(void)
+{
+    _PyRuntimeStats *stats = &_Py_runtime_stats;
+    PyObject *spec = NULL, *opt = NULL;
+    PyObject *res = PyDict_New();
+    if (res == NULL) {
+        return NULL;
+    }
+    spec = PyDict_New();
+    if (spec == NULL) {
+        goto error;
+    }
+    for (int opcode = 0; opcode < 256; opcode++) {
+        _PyRuntimeSpecializationStats *s = &stats->specialization[opcode];
+        if (FT_ATOMIC_LOAD_UINT64_RELAXED(s->success) == 0 &&
+            FT_ATOMIC_LOAD_UINT64_RELAXED(s->failure) == 0)
+        {
+            continue;
+        }
+        const char *name = _PyOpcode_OpName[opcode];
+        if (name == NULL) {
+            continue;
+        }
+        PyObject *d = runtime_spec_stats_to_dict(s);
+        if (d == NULL) {
+            goto error;
+        }
+        int err = PyDict_SetItemString(spec, name, d);
+        Py_DECREF(d);
+        if (err < 0) {
+            goto error;
+        }
+    }
+    if (PyDict_SetItemString(res, "specialization", spec) < 0) {
+        goto error;
+    }
+    opt = runtime_opt_stats_to_dict(stats);
+    if (opt == NULL) {
+        goto error;
+    }
+    if (PyDict_SetItemString(res, "optimizer", opt) < 0) {
+        goto error;
+    }
+    Py_DECREF(spec);
+    Py_DECREF(opt);
+    return res;
+
+error:
+    Py_XDECREF(spec);
+    Py_XDECREF(opt);
+    Py_DECREF(res);
+    return NULL;
+}
+
+void
+_Py_ClearRuntimeStats(void)
+{
+    /* _PyRuntimeStats only contains uint64_t counters. */
+    uint64_t *counters = (uint64_t *)&_Py_runtime_stats;
+    size_t n = sizeof(_Py_runtime_stats) / sizeof(uint64_t);
+    for (size_t i = 0; i < n; i++) {
+        FT_ATOMIC_STORE_UINT64_RELAXED(counters[i], 0);
+    }
+}
+
 // Initialize warmup counters and optimize instructions. This cannot fail.
 void
 _PyCode_Quicken(_Py_CODEUNIT *instructions, Py_ssize_t size, int enable_counters)
@@ -735,11 +888,13 @@ specialize(_Py_CODEUNIT *instr, uint8_t specialized_opcode)
     assert(!PyErr_Occurred());
     if (!set_opcode(instr, specialized_opcode)) {
         STAT_INC(_PyOpcode_Deopt[specialized_opcode], failure);
+        RUNTIME_SPEC_INC(_PyOpcode_Deopt[specialized_opcode], failure);
         SPECIALIZATION_FAIL(_PyOpcode_Deopt[specialized_opcode],
                             SPEC_FAIL_OTHER);
         return;
     }
     STAT_INC(_PyOpcode_Deopt[specialized_opcode], success);
+    RUNTIME_SPEC_INC(_PyOpcode_Deopt[specialized_opcode], success);
     set_counter((_Py_BackoffCounter *)instr + 1, adaptive_counter_cooldown());
 }
 
@@ -750,6 +905,7 @@ unspecialize(_Py_CODEUNIT *instr)
     uint8_t opcode = FT_ATOMIC_LOAD_UINT8_RELAXED(instr->op.code);
     uint8_t generic_opcode = _PyOpcode_Deopt[opcode];
     STAT_INC(generic_opcode, failure);
+    RUNTIME_SPEC_INC(generic_opcode, failure);
     if (!set_opcode(instr, generic_opcode)) {
         SPECIALIZATION_FAIL(generic_opcode, SPEC_FAIL_OTHER);
         return;
@@ -1473,7 +1629,6 @@ _Py_Specialize_StoreAttr(_PyStackRef owner_st, _Py_CODEUNIT *instr, PyObject *na
     return;
 }
 
-#ifdef Py_STATS
 static int
 load_attr_fail_kind(DescriptorClassification kind)
 {
@@ -1508,7 +1663,6 @@ load_attr_fail_kind(DescriptorClassification kind)
     }
     Py_UNREACHABLE();
 }
-#endif   // Py_STATS
 
 static int
 specialize_class_load_attr(PyObject *owner, _Py_CODEUNIT *instr,
@@ -1576,12 +1730,10 @@ specialize_class_load_attr(PyObject *owner, _Py_CODEUNIT *instr,
             }
             Py_XDECREF(descr);
             return 0;
-#ifdef Py_STATS
         case ABSENT:
             SPECIALIZATION_FAIL(LOAD_ATTR, SPEC_FAIL_EXPECTED_ERROR);
             Py_XDECREF(descr);
             return -1;
-#endif
         default:
             SPECIALIZATION_FAIL(LOAD_ATTR, load_attr_fail_kind(kind));
             Py_XDECREF(descr);
@@ -1826,7 +1978,6 @@ function_get_version(PyObject *o, int opcode)
     return version;
 }
 
-#ifdef Py_STATS
 static int
 store_subscr_fail_kind(PyObject *container, PyObject *sub)
 {
@@ -1889,7 +2040,6 @@ store_subscr_fail_kind(PyObject *container, PyObject *sub)
     }
     return SPEC_FAIL_OTHER;
 }
-#endif
 
 Py_NO_INLINE void
 _Py_Specialize_StoreSubscr(_PyStackRef container_st, _PyStackRef sub_st, _Py_CODEUNIT *instr)
@@ -2242,7 +2392,6 @@ _Py_Specialize_CallKw(_PyStackRef callable_st, _Py_CODEUNIT *instr, int nargs)
     }
 }
 
-#ifdef Py_STATS
 static int
 binary_op_fail_kind(int oparg, PyObject *lhs, PyObject *rhs)
 {
@@ -2427,7 +2576,6 @@ binary_op_fail_kind(int oparg, PyObject *lhs, PyObject *rhs)
     }
     Py_UNREACHABLE();
 }
-#endif
 
 /** Binary Op Specialization Extensions */
 
@@ -2689,7 +2837,6 @@ _Py_Specialize_BinaryOp(_PyStackRef lhs_st, _PyStackRef rhs_st, _Py_CODEUNIT *in
 }
 
 
-#ifdef Py_STATS
 static int
 compare_op_fail_kind(PyObject *lhs, PyObject *rhs)
 {
@@ -2722,7 +2869,6 @@ compare_op_fail_kind(PyObject *lhs, PyObject *rhs)
     }
     return SPEC_FAIL_OTHER;
 }
-#endif   // Py_STATS
 
 Py_NO_INLINE void
 _Py_Specialize_CompareOp(_PyStackRef lhs_st, _PyStackRef rhs_st, _Py_CODEUNIT *instr,
@@ -2773,7 +2919,6 @@ _Py_Specialize_CompareOp(_PyStackRef lhs_st, _PyStackRef rhs_st, _Py_CODEUNIT *i
     specialize(instr, specialized_op);
 }
 
-#ifdef Py_STATS
 static int
 unpack_sequence_fail_kind(PyObject *seq)
 {
@@ -2785,7 +2930,6 @@ unpack_sequence_fail_kind(PyObject *seq)
     }
     return SPEC_FAIL_OTHER;
 }
-#endif   // Py_STATS
 
 Py_NO_INLINE void
 _Py_Specialize_UnpackSequence(_PyStackRef seq_st, _Py_CODEUNIT *instr, int oparg)
@@ -2821,7 +2965,6 @@ _Py_Specialize_UnpackSequence(_PyStackRef seq_st, _Py_CODEUNIT *instr, int oparg
     unspecialize(instr);
 }
 
-#ifdef Py_STATS
 int
  _PySpecialization_ClassifyIterator(PyObject *iter)
 {
@@ -2892,7 +3035,6 @@ int
     }
     return SPEC_FAIL_OTHER;
 }
-#endif   // Py_STATS
 
 Py_NO_INLINE void
 _Py_Specialize_ForIter(_PyStackRef iter, _Py_CODEUNIT *instr, int oparg)
@@ -2972,7 +3114,6 @@ _Py_Specialize_Send(_PyStackRef receiver_st, _Py_CODEUNIT *instr)
     unspecialize(instr);
 }
 
-#ifdef Py_STATS
 static int
 to_bool_fail_kind(PyObject *value)
 {
@@ -2999,7 +3140,6 @@ to_bool_fail_kind(PyObject *value)
     }
     return SPEC_FAIL_OTHER;
 }
-#endif  // Py_STATS
 
 static int
 check_type_always_true(PyTypeObject *ty)
@@ -3074,7 +3214,6 @@ _Py_Specialize_ToBool(_PyStackRef value_o, _Py_CODEUNIT *instr)
     specialize(instr, specialized_op);
 }
 
-#ifdef Py_STATS
 static int
 containsop_fail_kind(PyObject *value) {
     if (PyUnicode_CheckExact(value)) {
@@ -3091,7 +3230,6 @@ containsop_fail_kind(PyObject *value) {
     }
     return SPEC_FAIL_OTHER;
 }
-#endif
 
 Py_NO_INLINE void
 _Py_Specialize_ContainsOp(_PyStackRef value_st, _Py_CODEUNIT *instr)
@@ -26,6 +26,7 @@ static const char* _Py_stdlib_module_names[] = {
 "_compat_pickle",
 "_compression",
 "_contextvars",
+"_copy",
 "_csv",
 "_ctypes",
 "_curses",
@@ -94,9 +95,11 @@ static const char* _Py_stdlib_module_names[] = {
 "_threading_local",
 "_tkinter",
 "_tokenize",
+"_tomllib",
 "_tracemalloc",
 "_types",
 "_typing",
+"_urlparse",
 "_uuid",
 "_warnings",
 "_weakref",
@@ -2235,6 +2235,82 @@ sys__clear_internal_caches_impl(PyObject *module)
     Py_RETURN_NONE;
 }
 
+/*[clinic input]
+sys._get_runtime_stats
+
+Return a dict of always-on specialization and optimizer statistics.
+
+The "specialization" key maps each specializable instruction to its
+number of successful and failed specialization attempts, and a tuple of
+failure counts indexed by failure kind.  The "optimizer" key holds counts
+of tier 2 optimizer attempts, executors created and invalidated, and the
+memory used by JIT-compiled code.
+
+The statistics are process-wide and approximate in the free-threaded build.
+[clinic start generated code]*/
+
+static PyObject *
+sys__get_runtime_stats_impl(PyObject *module)
+/*[clinic end generated code: output=25a41346abc6ed96 input=32576d393f6d5f3e]*/
+{
+    return _Py_GetRuntimeStats();
+}
+
+/*[clinic input]
+sys._clear_runtime_stats
+
+Reset the statistics returned by sys._get_runtime_stats().
+[clinic start generated code]*/
+
+static PyObject *
+sys__clear_runtime_stats_impl(PyObject *module)
+/*[clinic end generated code: output=7e8f026f8911770e input=0ce049563295ebc3]*/
+{
+    _Py_ClearRuntimeStats();
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+sys._get_warmup_profile
+
+Return the warm-up profile of the tier 2 optimizer.
+
+The profile is a list of (filename, qualname, firstlineno, offset) tuples
+identifying the loops for which an executor was created.  Return None if
+no profile is active.
+[clinic start generated code]*/
+
+static PyObject *
+sys__get_warmup_profile_impl(PyObject *module)
+/*[clinic end generated code: output=8ffc482b0604f5b9 input=33f75d8aa9008e8b]*/
+{
+    return _Py_WarmupProfile_Get(_PyInterpreterState_GET());
+}
+
+/*[clinic input]
+sys._set_warmup_profile
+
+    profile: object
+    /
+
+Replace the warm-up profile of the tier 2 optimizer.
+
+Loops of code objects created afterwards that are listed in the profile are
+optimized after a few iterations instead of waiting for their warm-up
+counters to expire, and new hot loops are added to the profile.  Pass None
+to deactivate the profile.
+[clinic start generated code]*/
+
+static PyObject *
+sys__set_warmup_profile(PyObject *module, PyObject *profile)
+/*[clinic end generated code: output=5047131202bb1566 input=ece6b65f311771e0]*/
+{
+    if (_Py_WarmupProfile_Set(_PyInterpreterState_GET(), profile) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
 /* Note that, for now, we do not have a per-interpreter equivalent
   for sys.is_finalizing(). */
 
@@ -2757,6 +2833,10 @@ static PyMethodDef sys_methods[] = {
     {"breakpointhook", _PyCFunction_CAST(sys_breakpointhook),
      METH_FASTCALL | METH_KEYWORDS, breakpointhook_doc},
     SYS__CLEAR_INTERNAL_CACHES_METHODDEF
+    SYS__GET_RUNTIME_STATS_METHODDEF
+    SYS__CLEAR_RUNTIME_STATS_METHODDEF
+    SYS__GET_WARMUP_PROFILE_METHODDEF
+    SYS__SET_WARMUP_PROFILE_METHODDEF
     SYS__CLEAR_TYPE_CACHE_METHODDEF
     SYS__CURRENT_FRAMES_METHODDEF
     SYS__CURRENT_EXCEPTIONS_METHODDEF